@@ -0,0 +1,308 @@
+"""
+Runner process for background tasks.
+
+run_in_background and run_function_in_background spawn this module as
+``python -c <bootstrap> <package dir> <handoff file>``, where the bootstrap
+(``background_tasks.TASK_RUNNER_BOOTSTRAP``) puts the package directory first
+on sys.path and calls :func:`main` with the handoff file. The handoff file
+is a small JSON document naming the task and what to run; the runner reads
+and deletes it, runs the command or function with its output going to the
+task log, and records the task's status and exit code.
+
+Only the standard library is imported before the log header is written,
+so the first log line appears as soon as the interpreter has started.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, TextIO, Tuple
+
+# Seconds between flushes of buffered task output to the log file
+LOG_FLUSH_INTERVAL = 0.1
+
+
+@dataclass
+class TaskHandoff:
+    """What a runner process should run, passed from the spawning process."""
+
+    task_id: str
+    log_file: str
+    cwd: Optional[str] = None
+    command: Optional[str] = None
+    module_path: Optional[str] = None
+    function_name: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "task_id": self.task_id,
+            "log_file": self.log_file,
+            "cwd": self.cwd,
+            "command": self.command,
+            "module_path": self.module_path,
+            "function_name": self.function_name,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TaskHandoff":
+        """Create from dictionary."""
+        return cls(
+            task_id=data["task_id"],
+            log_file=data["log_file"],
+            cwd=data.get("cwd"),
+            command=data.get("command"),
+            module_path=data.get("module_path"),
+            function_name=data.get("function_name"),
+        )
+
+    def write(self, path: Path) -> None:
+        """Write the handoff file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+
+    @classmethod
+    def read(cls, path: Path) -> "TaskHandoff":
+        """Read a handoff file and delete it."""
+        handoff = cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        try:
+            path.unlink()
+        except OSError:  # Stale handoff files are harmless
+            pass
+        return handoff
+
+
+class LogWriter:
+    """
+    Buffered stdout/stderr replacement that writes task output to the log.
+
+    Output is flushed to disk when a write completes a line and at least
+    ``flush_interval`` seconds have passed since the last flush; anything
+    left over (trailing lines or a partial line) is flushed by a timer
+    thread at the same interval. Explicit flush() calls from the task
+    follow the same rule, so code that flushes after every print doesn't
+    turn into a write system call per line.
+    """
+
+    def __init__(self, log: TextIO, flush_interval: float = LOG_FLUSH_INTERVAL):
+        self.log = log
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._stopped = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the periodic flush timer."""
+        self._timer = threading.Thread(target=self._flush_periodically, name="log-flush", daemon=True)
+        self._timer.start()
+
+    def close(self) -> None:
+        """Stop the timer and flush everything written so far."""
+        self._stopped.set()
+        if self._timer is not None:
+            self._timer.join()
+            self._timer = None
+        with self._lock:
+            self._flush_locked()
+
+    def write(self, text: str) -> int:
+        """Buffer text, flushing at a line boundary if the flush interval has passed."""
+        with self._lock:
+            self.log.write(text)
+            self._dirty = True
+            if "\n" in text:
+                self._flush_if_due_locked()
+        return len(text)
+
+    def writelines(self, lines: List[str]) -> None:
+        """Write several strings."""
+        for line in lines:
+            self.write(line)
+
+    def flush(self) -> None:
+        """Flush if the flush interval has passed; otherwise leave it to the timer."""
+        with self._lock:
+            self._flush_if_due_locked()
+
+    def isatty(self) -> bool:
+        """Task output is never a terminal."""
+        return False
+
+    def _flush_if_due_locked(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._dirty:
+            self.log.flush()
+            self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            with self._lock:
+                self._flush_locked()
+
+
+def _write_header(log: TextIO, task_id: str, target: str) -> None:
+    """Write the log header and flush it straight away."""
+    log.write(f"=== Task {task_id} ===\n")
+    log.write(f"{target}\n")
+    log.write(f"Started: {datetime.now(timezone.utc).isoformat()}\n")
+    log.write(f"Working Directory: {os.getcwd()}\n")
+    log.write("=" * 50 + "\n\n")
+    log.flush()
+
+
+def _write_footer(log: TextIO, exit_code: int) -> None:
+    """Write the log footer."""
+    log.write("\n" + "=" * 50 + "\n")
+    log.write(f"Completed: {datetime.now(timezone.utc).isoformat()}\n")
+    log.write(f"Exit Code: {exit_code}\n")
+    log.flush()
+
+
+def _mark_running(task_id: str) -> None:
+    """Move the task to running status."""
+    from .task_state import get_task_by_id, update_task
+
+    task = get_task_by_id(task_id)
+    if task:
+        task.mark_running()
+        update_task(task)
+
+
+def _mark_finished(task_id: str, exit_code: int, error_message: Optional[str]) -> None:
+    """Move the task to completed or failed status."""
+    from .task_state import get_task_by_id, update_task
+
+    task = get_task_by_id(task_id)
+    if task:
+        if exit_code == 0:
+            task.mark_completed(exit_code)
+        else:
+            task.mark_failed(exit_code, error_message)
+        update_task(task)
+
+
+def run_command(command: str, log: TextIO) -> Tuple[int, Optional[str]]:
+    """
+    Run a shell command with its output going to the log.
+
+    Returns:
+        Tuple of (exit code, error message or None)
+    """
+    env = os.environ.copy()
+    env["PYTHONIOENCODING"] = "utf-8"
+    try:
+        result = subprocess.run(
+            command,
+            shell=True,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            env=env,
+        )
+    except Exception as e:
+        log.write(f"\n\n!!! Exception: {e}\n")
+        return 1, str(e)
+    return result.returncode, None
+
+
+def run_function(module_path: str, function_name: str, log: TextIO) -> Tuple[int, Optional[str]]:
+    """
+    Import and call a function with its stdout/stderr going to the log.
+
+    An int return value is used as the exit code, and sys.exit() calls
+    are turned into exit codes.
+
+    Returns:
+        Tuple of (exit code, error message or None)
+    """
+    import importlib
+
+    writer = LogWriter(log)
+    writer.start()
+    exit_code, error_message, details = 0, None, None
+    try:
+        func = getattr(importlib.import_module(module_path), function_name)
+        with redirect_stdout(writer), redirect_stderr(writer):
+            result = func()
+        if isinstance(result, int):
+            exit_code = result
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (1 if e.code else 0)
+    except Exception as e:
+        exit_code, error_message, details = 1, str(e), traceback.format_exc()
+    finally:
+        writer.close()
+
+    if details is not None:
+        log.write(f"\n\n!!! Exception: {error_message}\n")
+        log.write(details)
+    return exit_code, error_message
+
+
+def run_task(handoff: TaskHandoff) -> int:
+    """
+    Run a background task described by a handoff and record its outcome.
+
+    Returns:
+        The task's exit code
+    """
+    if handoff.function_name and handoff.cwd:
+        os.chdir(handoff.cwd)
+
+    log_file = Path(handoff.log_file)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(log_file, "w", encoding="utf-8") as log:
+        if handoff.function_name:
+            _write_header(log, handoff.task_id, f"Function: {handoff.module_path}.{handoff.function_name}")
+        else:
+            _write_header(log, handoff.task_id, f"Command: {handoff.command}")
+
+        _mark_running(handoff.task_id)
+
+        if handoff.function_name:
+            exit_code, error_message = run_function(handoff.module_path or "", handoff.function_name, log)
+        else:
+            exit_code, error_message = run_command(handoff.command or "", log)
+
+        _write_footer(log, exit_code)
+        _mark_finished(handoff.task_id, exit_code, error_message)
+
+    # Compress the finished log and keep the logs directory within its byte budget
+    from .task_logs import append_log_note, finalize_task_log
+
+    try:
+        finalize_task_log(log_file)
+    except Exception as e:
+        append_log_note(log_file, f"Could not finalize log: {e}")
+
+    return exit_code
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point: run the task described by the handoff file given as the only argument."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("Usage: python -c <bootstrap> <package dir> <handoff file>", file=sys.stderr)
+        return 2
+    return run_task(TaskHandoff.read(Path(args[0])))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,23 +5,47 @@ Provides functionality to run CLI commands in detached background processes
 with output logging and status tracking.
 """
 
+import codecs
+import itertools
+import os
 import subprocess
 import sys
+import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+from ._task_runner import TaskHandoff
+from .task_logs import cleanup_logs, is_compressed_log, open_log_binary, open_log_text, resolve_log_path
 from .task_state import (
     BackgroundTask,
     TaskStatus,
     add_task,
+    get_background_tasks_dir,
     get_logs_dir,
     get_task_by_id,
 )
 
+# Module run by the background runner processes
+TASK_RUNNER_MODULE = "agentic_devtools._task_runner"
+
+# Runner entry point, started with ``python -c <bootstrap> <package dir> <handoff file>``.
+# With ``-m`` the task's working directory would come first on sys.path, so a
+# checkout or worktree of the package there would be imported instead of this one.
+TASK_RUNNER_BOOTSTRAP = (
+    f"import sys; sys.path.insert(0, sys.argv[1]); from {TASK_RUNNER_MODULE} import main; sys.exit(main(sys.argv[2:]))"
+)
+
+# Directory (under the background tasks directory) for runner handoff files
+HANDOFF_DIR_NAME = "handoffs"
+
 # Log file format
 LOG_FILE_FORMAT = "{command}_{timestamp}.log"
 
+# Block size used when reading log files backwards from the end
+LOG_TAIL_BLOCK_SIZE = 64 * 1024
+
 
 def create_log_file_path(command: str) -> Path:
     """
@@ -45,171 +69,38 @@ def _get_python_executable() -> str:
     return sys.executable
 
 
-def _build_runner_script(
-    command: str,
-    task_id: str,
-    log_file: Path,
-    cwd: Optional[str] = None,
-) -> str:
+def get_handoff_path(task_id: str) -> Path:
     """
-    Build a Python script that runs the command and updates task state.
-
-    This script is executed in the background subprocess and handles:
-    - Redirecting output to log file
-    - Updating task status in state
-    - Capturing exit codes
-
-    Args:
-        command: The CLI command to run
-        task_id: The task ID for state updates
-        log_file: Path to write logs to
-        cwd: Working directory for the command
+    Get the path of the handoff file passed to a task's runner process.
 
     Returns:
-        Python script as a string
+        Path to scripts/temp/background-tasks/handoffs/{task_id}.json
     """
-    # Get the path to this package for imports
-    package_dir = Path(__file__).parent.parent
+    return get_background_tasks_dir() / HANDOFF_DIR_NAME / f"{task_id}.json"
 
-    script = f"""
-import json
-import os
-import subprocess
-import sys
-from datetime import datetime, timezone
-from pathlib import Path
-
-# Add package to path for imports
-sys.path.insert(0, {repr(str(package_dir))})
 
-from agentic_devtools.task_state import (
-    get_task_by_id,
-    update_task,
-    TaskStatus,
-)
-
-def main():
-    task_id = {repr(task_id)}
-    log_file = Path({repr(str(log_file))})
-    command = {repr(command)}
-    cwd = {repr(cwd)}
-
-    # Ensure log directory exists
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Open log file for writing
-    with open(log_file, "w", encoding="utf-8") as log:
-        # Write header
-        start_time = datetime.now(timezone.utc).isoformat()
-        log.write(f"=== Task {{task_id}} ===\\n")
-        log.write(f"Command: {{command}}\\n")
-        log.write(f"Started: {{start_time}}\\n")
-        log.write(f"Working Directory: {{cwd or os.getcwd()}}\\n")
-        log.write("=" * 50 + "\\n\\n")
-        log.flush()
-
-        # Update task to running status
-        task = get_task_by_id(task_id)
-        if task:
-            task.mark_running()
-            update_task(task)
-
-        # Run the command with UTF-8 encoding for child process stdout
-        env = os.environ.copy()
-        env["PYTHONIOENCODING"] = "utf-8"
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                stdout=log,
-                stderr=subprocess.STDOUT,
-                cwd=cwd,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                env=env,
-            )
-            exit_code = result.returncode
-            error_message = None
-        except Exception as e:
-            exit_code = 1
-            error_message = str(e)
-            log.write(f"\\n\\n!!! Exception: {{error_message}}\\n")
-
-        # Write footer
-        end_time = datetime.now(timezone.utc).isoformat()
-        log.write("\\n" + "=" * 50 + "\\n")
-        log.write(f"Completed: {{end_time}}\\n")
-        log.write(f"Exit Code: {{exit_code}}\\n")
-        log.flush()
-
-        # Update task to completed/failed status
-        task = get_task_by_id(task_id)
-        if task:
-            if exit_code == 0:
-                task.mark_completed(exit_code)
-            else:
-                task.mark_failed(exit_code, error_message)
-            update_task(task)
-
-    sys.exit(exit_code)
-
-if __name__ == "__main__":
-    main()
-"""
-    return script
-
-
-def run_in_background(
-    command: str,
-    args: Optional[Dict[str, Any]] = None,
-    cwd: Optional[str] = None,
-) -> BackgroundTask:
+def _spawn_task_runner(handoff: TaskHandoff, cwd: Optional[str] = None) -> None:
     """
-    Run a CLI command in a detached background process.
+    Write a handoff file and launch a detached runner process for it.
 
-    The command runs in a separate process that:
-    - Continues running even if the parent process exits
-    - Writes all output to a log file
-    - Updates task state with progress and completion
-
-    Args:
-        command: The CLI command to run (e.g., "agdt-git-save-work")
-        args: Additional arguments/context to store with the task
-        cwd: Working directory for the command
-
-    Returns:
-        BackgroundTask object representing the spawned task
+    The runner is the precompiled agentic_devtools._task_runner module, so
+    the interpreter loads its cached bytecode instead of compiling a
+    generated script for every task. It is imported from this package's
+    directory, ahead of the task's working directory on sys.path.
     """
-    # Create log file path
-    log_file = create_log_file_path(command)
+    handoff_path = get_handoff_path(handoff.task_id)
+    handoff.write(handoff_path)
 
-    # Create task record
-    task = BackgroundTask.create(
-        command=command,
-        log_file=log_file,
-        args=args,
-    )
-
-    # Add task to state
-    add_task(task)
-
-    # Build runner script
-    runner_script = _build_runner_script(
-        command=command,
-        task_id=task.id,
-        log_file=log_file,
-        cwd=cwd,
-    )
-
-    # Get Python executable
     python_exe = _get_python_executable()
 
-    # Set up environment with UTF-8 encoding for child process
-    import os as _os
-
-    env = _os.environ.copy()
+    # Set up environment with UTF-8 encoding for child process. The bootstrap
+    # puts the package directory on the runner's sys.path only, so the
+    # commands the task runs see the caller's environment unchanged.
+    env = os.environ.copy()
     env["PYTHONIOENCODING"] = "utf-8"
+    package_dir = str(Path(__file__).parent.parent)
+
+    runner_args = [python_exe, "-c", TASK_RUNNER_BOOTSTRAP, package_dir, str(handoff_path)]
 
     # Launch detached process
     if sys.platform == "win32":
@@ -217,7 +108,7 @@ def run_in_background(
         # Combined with CREATE_NEW_PROCESS_GROUP for proper signal handling
         creation_flags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
         subprocess.Popen(
-            [python_exe, "-c", runner_script],
+            runner_args,
             creationflags=creation_flags,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
@@ -229,7 +120,7 @@ def run_in_background(
     else:
         # Unix: Use double-fork or nohup-like behavior
         subprocess.Popen(
-            [python_exe, "-c", runner_script],
+            runner_args,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             stdin=subprocess.DEVNULL,
@@ -239,143 +130,47 @@ def run_in_background(
             env=env,
         )
 
-    return task
-
 
-def _build_function_runner_script(
-    module_path: str,
-    function_name: str,
-    task_id: str,
-    log_file: Path,
+def run_in_background(
+    command: str,
+    args: Optional[Dict[str, Any]] = None,
     cwd: Optional[str] = None,
-) -> str:
+) -> BackgroundTask:
     """
-    Build a Python script that imports and runs a function, updating task state.
+    Run a CLI command in a detached background process.
+
+    The command runs in a separate process that:
+    - Continues running even if the parent process exits
+    - Writes all output to a log file
+    - Updates task state with progress and completion
 
     Args:
-        module_path: Full module path (e.g., "agentic_devtools.cli.jira.comment_commands")
-        function_name: Name of the function to call (e.g., "add_comment")
-        task_id: The task ID for state updates
-        log_file: Path to write logs to
-        cwd: Working directory for the function
+        command: The CLI command to run (e.g., "agdt-git-save-work")
+        args: Additional arguments/context to store with the task
+        cwd: Working directory for the command
 
     Returns:
-        Python script as a string
+        BackgroundTask object representing the spawned task
     """
-    package_dir = Path(__file__).parent.parent
-
-    script = f"""
-import io
-import os
-import sys
-import traceback
-from contextlib import redirect_stdout, redirect_stderr
-from datetime import datetime, timezone
-from pathlib import Path
-
-# Add package to path for imports
-sys.path.insert(0, {repr(str(package_dir))})
-
-from agentic_devtools.task_state import (
-    get_task_by_id,
-    update_task,
-    TaskStatus,
-)
-
-def main():
-    task_id = {repr(task_id)}
-    log_file = Path({repr(str(log_file))})
-    module_path = {repr(module_path)}
-    function_name = {repr(function_name)}
-    cwd = {repr(cwd)}
-
-    # Change to working directory if specified
-    if cwd:
-        os.chdir(cwd)
-
-    # Ensure log directory exists
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Open log file for writing
-    with open(log_file, "w", encoding="utf-8") as log:
-        # Write header
-        start_time = datetime.now(timezone.utc).isoformat()
-        log.write(f"=== Task {{task_id}} ===\\n")
-        log.write(f"Function: {{module_path}}.{{function_name}}\\n")
-        log.write(f"Started: {{start_time}}\\n")
-        log.write(f"Working Directory: {{os.getcwd()}}\\n")
-        log.write("=" * 50 + "\\n\\n")
-        log.flush()
-
-        # Update task to running status
-        task = get_task_by_id(task_id)
-        if task:
-            task.mark_running()
-            update_task(task)
+    # Create log file path
+    log_file = create_log_file_path(command)
 
-        # Capture stdout/stderr to log
-        exit_code = 0
-        error_message = None
+    # Create task record
+    task = BackgroundTask.create(
+        command=command,
+        log_file=log_file,
+        args=args,
+    )
 
-        try:
-            # Import the module and get the function
-            import importlib
-            module = importlib.import_module(module_path)
-            func = getattr(module, function_name)
-
-            # Redirect stdout/stderr to log file
-            # Create a writer that writes to both the log and flushes
-            class LogWriter:
-                def __init__(self, log_file):
-                    self.log = log_file
-                def write(self, text):
-                    self.log.write(text)
-                    self.log.flush()
-                def flush(self):
-                    self.log.flush()
-                def isatty(self):
-                    return False
-
-            log_writer = LogWriter(log)
-
-            with redirect_stdout(log_writer), redirect_stderr(log_writer):
-                # Call the function
-                result = func()
-                # If function returns an int, use as exit code
-                if isinstance(result, int):
-                    exit_code = result
-
-        except SystemExit as e:
-            # Function called sys.exit()
-            exit_code = e.code if isinstance(e.code, int) else (1 if e.code else 0)
-        except Exception as e:
-            exit_code = 1
-            error_message = str(e)
-            log.write(f"\\n\\n!!! Exception: {{error_message}}\\n")
-            log.write(traceback.format_exc())
-
-        # Write footer
-        end_time = datetime.now(timezone.utc).isoformat()
-        log.write("\\n" + "=" * 50 + "\\n")
-        log.write(f"Completed: {{end_time}}\\n")
-        log.write(f"Exit Code: {{exit_code}}\\n")
-        log.flush()
-
-        # Update task to completed/failed status
-        task = get_task_by_id(task_id)
-        if task:
-            if exit_code == 0:
-                task.mark_completed(exit_code)
-            else:
-                task.mark_failed(exit_code, error_message)
-            update_task(task)
+    # Add task to state
+    add_task(task)
 
-    sys.exit(exit_code)
+    _spawn_task_runner(
+        TaskHandoff(task_id=task.id, log_file=str(log_file), cwd=cwd, command=command),
+        cwd=cwd,
+    )
 
-if __name__ == "__main__":
-    main()
-"""
-    return script
+    return task
 
 
 def run_function_in_background(
@@ -423,51 +218,17 @@ def run_function_in_background(
     # Add task to state
     add_task(task)
 
-    # Build runner script
-    runner_script = _build_function_runner_script(
-        module_path=module_path,
-        function_name=function_name,
-        task_id=task.id,
-        log_file=log_file,
+    _spawn_task_runner(
+        TaskHandoff(
+            task_id=task.id,
+            log_file=str(log_file),
+            cwd=cwd,
+            module_path=module_path,
+            function_name=function_name,
+        ),
         cwd=cwd,
     )
 
-    # Get Python executable
-    python_exe = _get_python_executable()
-
-    # Set up environment with UTF-8 encoding for child process
-    import os as _os
-
-    env = _os.environ.copy()
-    env["PYTHONIOENCODING"] = "utf-8"
-
-    # Launch detached process
-    if sys.platform == "win32":
-        # Windows: Use CREATE_NO_WINDOW to prevent console windows from opening
-        # Combined with CREATE_NEW_PROCESS_GROUP for proper signal handling
-        creation_flags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
-        subprocess.Popen(
-            [python_exe, "-c", runner_script],
-            creationflags=creation_flags,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            stdin=subprocess.DEVNULL,
-            close_fds=True,
-            cwd=cwd,
-            env=env,
-        )
-    else:
-        subprocess.Popen(
-            [python_exe, "-c", runner_script],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            stdin=subprocess.DEVNULL,
-            start_new_session=True,
-            close_fds=True,
-            cwd=cwd,
-            env=env,
-        )
-
     return task
 
 
@@ -489,8 +250,6 @@ def wait_for_task(
         - success: True if task completed successfully
         - exit_code: The task's exit code (None if timeout or not found)
     """
-    import time
-
     start_time = time.time()
 
     while True:
@@ -508,13 +267,145 @@ def wait_for_task(
         time.sleep(poll_interval)
 
 
-def get_task_log_content(task_id: str, tail_lines: Optional[int] = None) -> Optional[str]:
+def read_log_tail(log_path: Path, lines: int, end: Optional[int] = None) -> str:
+    """
+    Read the last N lines of a log file without reading the whole file.
+
+    Reads fixed-size blocks backwards from the end until enough line breaks
+    have been seen, so the cost depends on the size of the tail, not of the log.
+    Compressed logs can't be read backwards; they are streamed instead,
+    keeping only the last N lines in memory.
+
+    Args:
+        log_path: Path to the log file
+        lines: Number of lines to return
+        end: Byte offset to treat as the end of the file (default: current size;
+            ignored for compressed logs)
+
+    Returns:
+        The last N lines, joined with newlines (without a trailing newline)
+    """
+    if lines <= 0:
+        return ""
+
+    if is_compressed_log(log_path):
+        with open_log_text(log_path) as f:
+            return "\n".join(deque((line.rstrip("\r\n") for line in f), maxlen=lines))
+
+    with open(log_path, "rb") as f:
+        position = f.seek(0, os.SEEK_END) if end is None else end
+        blocks: List[bytes] = []
+        newlines = 0
+        # A trailing newline terminates the last line rather than starting a new one
+        while position > 0 and newlines <= lines:
+            size = min(LOG_TAIL_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            block = f.read(size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    content = b"".join(reversed(blocks)).decode("utf-8", errors="replace")
+    return "\n".join(content.splitlines()[-lines:])
+
+
+def read_log_head(log_path: Path, lines: int) -> str:
+    """
+    Read the first N lines of a plain or compressed log, stopping as soon as they are read.
+
+    Args:
+        log_path: Path to the log file
+        lines: Number of lines to return
+
+    Returns:
+        The first N lines, joined with newlines (without a trailing newline)
+    """
+    with open_log_text(log_path) as f:
+        return "\n".join(line.rstrip("\r\n") for line in itertools.islice(f, max(lines, 0)))
+
+
+def _read_log_from(log_path: Path, offset: int) -> bytes:
+    """
+    Read a task log from a byte offset of its plain text.
+
+    The runner compresses the log once the task has finished. If the plain
+    log disappears between resolving and opening it, the compressed log
+    (renamed into place before the plain log is removed) is read instead.
+
+    Returns:
+        The bytes after ``offset``, or nothing if the log can't be read
+    """
+    for _ in range(2):
+        current = resolve_log_path(log_path)
+        if current is None:
+            return b""
+        try:
+            with open_log_binary(current) as f:
+                f.seek(offset)
+                return f.read()
+        except FileNotFoundError:
+            continue
+        except OSError:
+            return b""
+    return b""
+
+
+def follow_log(
+    log_path: Path,
+    offset: int,
+    is_finished: Callable[[], bool],
+    poll_interval: float = 0.5,
+) -> Iterator[str]:
+    """
+    Yield text appended to a log file until the writer has finished.
+
+    Polls the file size from ``offset`` onwards. Once ``is_finished`` returns
+    True, whatever was appended in the meantime is yielded and iteration stops.
+    If the log is compressed while it is being followed, the rest is read
+    from the compressed log.
+
+    Args:
+        log_path: Path to the log file
+        offset: Byte offset to start following from
+        is_finished: Returns True once nothing more will be written
+        poll_interval: Seconds to sleep when no new data is available
+
+    Yields:
+        Newly appended text, decoded as UTF-8
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        # Check before reading so that data written just before finishing isn't missed
+        finished = is_finished()
+        data = _read_log_from(log_path, offset)
+        if data:
+            offset += len(data)
+            text = decoder.decode(data)
+            if text:
+                yield text
+        if finished:
+            text = decoder.decode(b"", final=True)
+            if text:
+                yield text
+            return
+        if not data:
+            time.sleep(poll_interval)
+
+
+def get_task_log_content(
+    task_id: str,
+    tail_lines: Optional[int] = None,
+    head_lines: Optional[int] = None,
+) -> Optional[str]:
     """
     Get the content of a task's log file.
 
+    Finished logs are compressed by the task runner; they are read transparently.
+
     Args:
         task_id: ID of the task
-        tail_lines: If specified, only return the last N lines
+        tail_lines: If specified, only return the last N lines (read from the end of the file)
+        head_lines: If specified, only return the first N lines
 
     Returns:
         Log file content as string, or None if task/log not found
@@ -524,77 +415,41 @@ def get_task_log_content(task_id: str, tail_lines: Optional[int] = None) -> Opti
     if task is None or task.log_file is None:
         return None
 
-    log_path = Path(task.log_file)
-
-    if not log_path.exists():
-        return None  # pragma: no cover
-
-    try:
-        content = log_path.read_text(encoding="utf-8", errors="replace")
-
-        if tail_lines is not None:  # pragma: no cover
-            lines = content.splitlines()
-            content = "\n".join(lines[-tail_lines:])
-
-        return content
-    except OSError:  # pragma: no cover
-        return None
+    # The plain log may be compressed (and removed) between resolving and reading it
+    for _ in range(2):
+        log_path = resolve_log_path(Path(task.log_file))
+        if log_path is None:
+            return None
+        try:
+            if tail_lines is not None:
+                return read_log_tail(log_path, tail_lines)
+            if head_lines is not None:
+                return read_log_head(log_path, head_lines)
+            with open_log_text(log_path) as f:
+                return f.read()
+        except FileNotFoundError:
+            continue
+        except OSError:  # pragma: no cover
+            return None
+    return None
 
 
-def cleanup_old_logs(max_age_hours: float = 24, max_count: Optional[int] = None) -> int:
+def cleanup_old_logs(
+    max_age_hours: float = 24,
+    max_count: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> int:
     """
     Clean up old log files.
 
+    Uses the log index, so only logs that are not indexed yet are stat-ed.
+
     Args:
         max_age_hours: Delete logs older than this many hours
         max_count: Keep at most this many log files (oldest deleted first)
+        max_bytes: Delete the oldest compressed logs while all logs exceed this size
 
     Returns:
         Number of log files deleted
     """
-    from datetime import timedelta
-
-    logs_dir = get_logs_dir()
-    deleted_count = 0
-
-    if not logs_dir.exists():
-        return 0  # pragma: no cover
-
-    # Get all log files with their modification times
-    log_files: List[Tuple[Path, float]] = []
-    for log_file in logs_dir.glob("*.log"):
-        try:
-            mtime = log_file.stat().st_mtime
-            log_files.append((log_file, mtime))
-        except OSError:
-            continue
-
-    # Sort by modification time (oldest first)
-    log_files.sort(key=lambda x: x[1])
-
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-    cutoff_timestamp = cutoff_time.timestamp()
-
-    # Delete old files
-    for log_file, mtime in log_files:
-        if mtime < cutoff_timestamp:
-            try:
-                log_file.unlink()
-                deleted_count += 1
-            except OSError:
-                pass
-
-    # Delete excess files if max_count specified
-    if max_count is not None:
-        remaining = [f for f in logs_dir.glob("*.log")]
-        remaining.sort(key=lambda x: x.stat().st_mtime)
-
-        while len(remaining) > max_count:
-            oldest = remaining.pop(0)
-            try:
-                oldest.unlink()
-                deleted_count += 1
-            except OSError:
-                pass
-
-    return deleted_count
+    return cleanup_logs(max_age_hours=max_age_hours, max_count=max_count, max_bytes=max_bytes)
@@ -0,0 +1,368 @@
+"""Window-aware local result cache for templated App Insights queries.
+
+Agents often re-run the same Fabric DAP query (same dataproduct, same
+timespan) a few minutes apart. Each cache entry stores the rows of one
+absolute time window, keyed by the normalized KQL with the time range and
+row limit factored out. When a re-run's window overlaps a cached window,
+only the uncovered tail is queried and the results are merged.
+
+App Insights ingests telemetry with a delay, so the most recent
+INGESTION_GRACE of a cached window is never trusted: that part is always
+re-fetched along with the tail.
+
+Entries live in ``<state dir>/app-insights-cache/`` as one JSON file per key.
+The directory is kept under a byte budget by evicting the least recently
+written entries, and entries older than the maximum age are discarded.
+"""
+
+import hashlib
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ...state import get_state_dir
+from .app_insights_export import TimeWindow
+
+CACHE_DIR_NAME = "app-insights-cache"
+
+# Default byte budget for the cache directory
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Entries older than this are never reused
+DEFAULT_CACHE_MAX_AGE = timedelta(hours=24)
+
+# Trailing part of a cached window that may still receive late-ingested rows
+INGESTION_GRACE = timedelta(minutes=5)
+
+_KQL_TOKEN_PATTERN = re.compile(r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")|\s+")
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory for cached App Insights results.
+
+    The directory is created lazily by QueryResultCache.store().
+
+    Returns:
+        Path to scripts/temp/app-insights-cache/
+    """
+    return get_state_dir() / CACHE_DIR_NAME
+
+
+def normalize_kql(query: str) -> str:
+    """Collapse whitespace outside string literals so formatting changes share a key."""
+    return _KQL_TOKEN_PATTERN.sub(lambda m: m.group(1) or " ", query).strip()
+
+
+def make_cache_key(environment: str, kql: str) -> str:
+    """Return a stable file-name-safe key for a query in an environment."""
+    digest = hashlib.sha256(f"{environment.upper()}\n{normalize_kql(kql)}".encode())
+    return digest.hexdigest()
+
+
+def _as_utc(value: Any) -> Optional[datetime]:
+    """Interpret a cell value as a UTC datetime (naive values are assumed UTC)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a cell value for JSON, preserving datetimes."""
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """Reverse _encode_value."""
+    if isinstance(value, dict) and "$dt" in value:
+        return datetime.fromisoformat(value["$dt"])
+    return value
+
+
+@dataclass
+class CacheEntry:
+    """Rows of one query for one absolute time window."""
+
+    key: str
+    window: TimeWindow
+    columns: List[str]
+    rows: List[list]
+    complete: bool
+    fetched_at: datetime
+
+    @property
+    def settled_end(self) -> datetime:
+        """End of the part of the window that can no longer receive late rows."""
+        return min(self.window.end, self.fetched_at - INGESTION_GRACE)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "key": self.key,
+            "start": self.window.start.isoformat(),
+            "end": self.window.end.isoformat(),
+            "columns": self.columns,
+            "rows": [[_encode_value(v) for v in row] for row in self.rows],
+            "complete": self.complete,
+            "fetched_at": self.fetched_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CacheEntry":
+        """Create from dictionary."""
+        return cls(
+            key=data["key"],
+            window=TimeWindow(
+                start=datetime.fromisoformat(data["start"]),
+                end=datetime.fromisoformat(data["end"]),
+            ),
+            columns=list(data["columns"]),
+            rows=[[_decode_value(v) for v in row] for row in data["rows"]],
+            complete=bool(data["complete"]),
+            fetched_at=datetime.fromisoformat(data["fetched_at"]),
+        )
+
+
+@dataclass
+class CacheLookup:
+    """What a cached entry can contribute to a requested window."""
+
+    cached_rows: List[list] = field(default_factory=list)
+    columns: Optional[List[str]] = None
+    fetch_window: Optional[TimeWindow] = None
+    covered_end: Optional[datetime] = None
+
+    @property
+    def hit(self) -> bool:
+        """True if any part of the requested window is served from cache."""
+        return self.columns is not None
+
+
+class QueryResultCache:
+    """Size-bounded on-disk cache of App Insights query results."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        max_age: timedelta = DEFAULT_CACHE_MAX_AGE,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str, now: Optional[datetime] = None) -> Optional[CacheEntry]:
+        """Load a non-expired entry, or None if missing, expired or unreadable."""
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            entry = CacheEntry.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if (now or datetime.now(timezone.utc)) - entry.fetched_at > self.max_age:
+            return None
+        return entry
+
+    def lookup(
+        self,
+        key: str,
+        requested: TimeWindow,
+        limit: int,
+        descending: bool = False,
+        now: Optional[datetime] = None,
+    ) -> CacheLookup:
+        """
+        Work out which rows can be reused and which tail still has to be fetched.
+
+        A cached entry is only reused if it is complete (not truncated by its
+        row limit), has a timestamp column, and covers the start of the
+        requested window. Rows up to the entry's settled end are reused and the
+        remaining [settled end, requested end) interval is returned as the
+        window to fetch.
+
+        Args:
+            key: Cache key from make_cache_key.
+            requested: Absolute window of the new query.
+            limit: Row limit of the new query.
+            descending: Whether the query orders rows newest first.
+            now: Current time (default: now, UTC).
+        """
+        miss = CacheLookup(fetch_window=requested)
+        entry = self.load(key, now=now)
+        if entry is None or not entry.complete or "timestamp" not in entry.columns:
+            return miss
+
+        reuse_end = min(entry.settled_end, requested.end)
+        if entry.window.start > requested.start or reuse_end <= requested.start:
+            return miss
+
+        ts_index = entry.columns.index("timestamp")
+        cached_rows = []
+        for row in entry.rows:
+            timestamp = _as_utc(row[ts_index])
+            if timestamp is None:
+                return miss
+            if requested.start <= timestamp < reuse_end:
+                cached_rows.append(row)
+
+        fetch_window: Optional[TimeWindow] = None
+        covered_end = requested.end
+        if reuse_end < requested.end:
+            if not descending and len(cached_rows) >= limit:
+                # Ascending results are already full; the tail cannot contribute
+                covered_end = reuse_end
+            else:
+                fetch_window = TimeWindow(start=reuse_end, end=requested.end)
+
+        return CacheLookup(
+            cached_rows=cached_rows,
+            columns=entry.columns,
+            fetch_window=fetch_window,
+            covered_end=covered_end,
+        )
+
+    def store(self, entry: CacheEntry) -> bool:
+        """
+        Write an entry and evict old ones to stay within the byte budget.
+
+        Returns:
+            True if the entry was stored; False if it alone exceeds the budget.
+        """
+        content = json.dumps(entry.to_dict(), default=str)
+        if len(content.encode("utf-8")) > self.max_bytes:
+            return False
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(entry.key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(path)
+        self.evict(keep=path)
+        return True
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """
+        Remove expired entries, then the oldest ones until under the byte budget.
+
+        Args:
+            keep: Entry that must survive eviction (the one just written).
+
+        Returns:
+            Number of entries removed.
+        """
+        cutoff = datetime.now().timestamp() - self.max_age.total_seconds()
+        files = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:  # pragma: no cover - removed concurrently
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort(key=lambda item: item[0])
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in files:
+            if path == keep:
+                continue
+            if mtime >= cutoff and total <= self.max_bytes:
+                continue
+            try:
+                path.unlink()
+            except OSError:  # pragma: no cover - removed concurrently
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def run(
+        self,
+        key: str,
+        requested: TimeWindow,
+        limit: int,
+        descending: bool,
+        fetch: Callable[[TimeWindow], Optional[dict]],
+        now: Optional[datetime] = None,
+    ) -> Optional[dict]:
+        """
+        Answer a query from cache, fetching only the uncovered tail.
+
+        Args:
+            key: Cache key from make_cache_key.
+            requested: Absolute window of the query.
+            limit: Row limit of the query.
+            descending: Whether the query orders rows newest first.
+            fetch: Runs the query for a window, returning the
+                ``{"tables": [{"columns": [...], "rows": [...]}]}`` dict or None.
+            now: Current time (default: now, UTC).
+
+        Returns:
+            Merged results in the same dict format, or None if the fetch failed.
+        """
+        now = now or datetime.now(timezone.utc)
+        lookup = self.lookup(key, requested, limit, descending, now=now)
+        columns = lookup.columns
+        fetched_rows: List[list] = []
+        fetched_complete = True
+
+        if lookup.fetch_window is not None:
+            if lookup.hit:
+                print(
+                    f"Cache: reusing {len(lookup.cached_rows)} rows, fetching "
+                    f"{lookup.fetch_window.start.isoformat()} .. {lookup.fetch_window.end.isoformat()}",
+                    file=sys.stderr,
+                )
+            data = fetch(lookup.fetch_window)
+            if data is None:
+                return None
+            tables = data.get("tables", [])
+            if tables:
+                columns = [col.get("name", f"col{i}") for i, col in enumerate(tables[0].get("columns", []))]
+                fetched_rows = tables[0].get("rows", [])
+            fetched_complete = len(fetched_rows) < limit
+        else:
+            print(f"Cache: reusing {len(lookup.cached_rows)} rows, nothing new to fetch", file=sys.stderr)
+
+        if descending:
+            rows = fetched_rows + lookup.cached_rows
+        else:
+            rows = lookup.cached_rows + fetched_rows
+
+        if columns is None:
+            return {"tables": []}
+
+        self.store(
+            CacheEntry(
+                key=key,
+                window=TimeWindow(start=requested.start, end=lookup.covered_end or requested.end),
+                columns=columns,
+                rows=rows,
+                complete=fetched_complete,
+                fetched_at=now,
+            )
+        )
+
+        return {
+            "tables": [
+                {
+                    "columns": [{"name": col, "type": "string"} for col in columns],
+                    "rows": rows[:limit],
+                }
+            ]
+        }
@@ -20,6 +20,29 @@ from azure.monitor.query import LogsQueryClient, LogsQueryStatus
 from ...background_tasks import run_function_in_background
 from ...state import get_state_dir, get_value, is_dry_run, set_value
 from ...task_state import print_task_tracking_info
+from .app_insights_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    QueryResultCache,
+    get_cache_dir,
+    make_cache_key,
+)
+from .app_insights_export import (
+    DEFAULT_SLICE_SIZE,
+    EXPORT_EXTENSIONS,
+    EXPORT_FORMATS,
+    TimeWindow,
+    build_time_windows,
+    create_result_writer,
+    export_windows,
+    is_descending_query,
+)
+from .app_insights_planner import (
+    QueryPlan,
+    WindowQueryError,
+    build_query_plan,
+    execute_query_plan,
+    plan_window_count,
+)
 from .auth import ensure_azure_account
 from .config import (
     get_account_for_environment,
@@ -27,7 +50,7 @@ from .config import (
 )
 
 # Module version for debugging - increment when making changes
-MODULE_VERSION = "2.3.0"  # Added -q parameter support to query_app_insights_async
+MODULE_VERSION = "2.6.0"  # Added window-aware local result cache (azure.cache)
 
 
 def _get_temp_output_dir() -> Path:
@@ -94,6 +117,7 @@ def _build_combined_filter(
     dataproduct_id: Optional[str] = None,
     workbench: Optional[str] = None,
     include_mgmt: bool = True,
+    window: Optional[TimeWindow] = None,
 ) -> str:
     """
     Build a single optimized KQL WHERE clause with all conditions ANDed together.
@@ -107,13 +131,14 @@ def _build_combined_filter(
         dataproduct_id: Optional dataproduct ID or key to filter by.
         workbench: Workbench key (e.g., 'STND') to filter Fabric DAP logs.
         include_mgmt: If True, also include management backend logs.
+        window: Optional absolute time window; replaces the relative ago() condition.
 
     Returns:
         Complete WHERE clause like:
         | where timestamp > ago(1h) and (cloud_RoleName has 'stndfabric' or ...)
                 and (message contains 'xxx' or tostring(customDimensions) contains 'xxx')
     """
-    conditions = [f"timestamp > ago({timespan})"]
+    conditions = [window.to_kql_condition() if window else f"timestamp > ago({timespan})"]
 
     # Build service filter conditions
     service_conditions = []
@@ -153,6 +178,7 @@ def _format_query(
     dataproduct_id: Optional[str] = None,
     workbench: Optional[str] = None,
     include_mgmt: bool = True,
+    window: Optional[TimeWindow] = None,
 ) -> str:
     """Format a query template with combined filter for optimal Kusto execution."""
     combined_filter = _build_combined_filter(
@@ -160,6 +186,7 @@ def _format_query(
         dataproduct_id=dataproduct_id,
         workbench=workbench,
         include_mgmt=include_mgmt,
+        window=window,
     )
     return query_template.format(
         combined_filter=combined_filter,
@@ -270,6 +297,390 @@ def _run_app_insights_query(  # pragma: no cover
         return None
 
 
+def _get_query_window_count() -> Optional[int]:
+    """
+    Read the explicit number of parallel query windows from state.
+
+    Returns:
+        The 'azure.query_windows' value as an int, or None when unset
+        (the planner then chooses a count from the timespan).
+
+    Raises:
+        SystemExit: If the value is not a positive integer.
+    """
+    value = get_value("azure.query_windows")
+    if value is None or value == "":
+        return None
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        count = 0
+    if count < 1:
+        print(
+            f"Error: azure.query_windows must be a positive integer, got '{value}'.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return count
+
+
+def _get_query_cache() -> Optional[QueryResultCache]:
+    """
+    Create the local query-result cache unless it is disabled in state.
+
+    State keys read:
+        - azure.cache: Reuse cached results for overlapping windows (default: true)
+        - azure.cache_max_mb: Byte budget for the cache directory in MB (default: 64)
+
+    Raises:
+        SystemExit: If azure.cache_max_mb is not a positive number.
+    """
+    enabled = str(get_value("azure.cache") or "true").lower() in ("true", "1", "yes")
+    if not enabled:
+        return None
+
+    max_mb = get_value("azure.cache_max_mb")
+    max_bytes = DEFAULT_CACHE_MAX_BYTES
+    if max_mb not in (None, ""):
+        try:
+            max_bytes = int(float(max_mb) * 1024 * 1024)
+        except (TypeError, ValueError):
+            max_bytes = 0
+        if max_bytes <= 0:
+            print(
+                f"Error: azure.cache_max_mb must be a positive number, got '{max_mb}'.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+    return QueryResultCache(get_cache_dir(), max_bytes=max_bytes)
+
+
+def _run_templated_app_insights_query(
+    environment: str,
+    query_template: str,
+    timespan: str = "1h",
+    limit: int = 100,
+    dataproduct_id: Optional[str] = None,
+    workbench: Optional[str] = None,
+    include_mgmt: bool = True,
+    dry_run: bool = False,
+    auto_switch_account: bool = True,
+    output_file: Optional[Path] = None,
+) -> Optional[dict]:
+    """
+    Run a templated query, reusing cached rows and splitting long ranges.
+
+    With the result cache enabled, the query runs over an absolute window
+    ending now; rows already cached for an overlapping window are reused and
+    only the uncovered tail is queried. Without the cache, short ranges run
+    as the original single relative query.
+
+    Ranges spanning several planned windows run as concurrent time-window
+    queries, with failed windows retried individually.
+
+    Returns:
+        Query results as dict with 'tables' key, or None on failure.
+    """
+    requested_window_count = _get_query_window_count()
+
+    def format_window_query(window: Optional[TimeWindow] = None) -> str:
+        return _format_query(
+            query_template,
+            timespan=timespan,
+            limit=limit,
+            dataproduct_id=dataproduct_id,
+            workbench=workbench,
+            include_mgmt=include_mgmt,
+            window=window,
+        )
+
+    def run_range(time_range: Optional[TimeWindow], run_output_file: Optional[Path]) -> Optional[dict]:
+        window_count = plan_window_count(time_range.duration if time_range else timespan, requested_window_count)
+        if window_count == 1:
+            return _run_app_insights_query(
+                environment=environment,
+                query=format_window_query(time_range),
+                dry_run=dry_run,
+                auto_switch_account=auto_switch_account,
+                output_file=run_output_file,
+            )
+
+        return _run_planned_app_insights_query(
+            environment=environment,
+            plan=build_query_plan(
+                query_template, timespan, limit, format_window_query, window_count, time_range=time_range
+            ),
+            dry_run=dry_run,
+            auto_switch_account=auto_switch_account,
+            output_file=run_output_file,
+        )
+
+    cache = None if dry_run else _get_query_cache()
+    if cache is None:
+        return run_range(None, output_file)
+
+    # Key on the KQL with the time range and row limit factored out
+    key_query = query_template.format(
+        combined_filter=_build_combined_filter(
+            timespan="<window>",
+            dataproduct_id=dataproduct_id,
+            workbench=workbench,
+            include_mgmt=include_mgmt,
+        ),
+        limit="<limit>",
+    )
+    data = cache.run(
+        key=make_cache_key(environment, key_query),
+        requested=build_time_windows(timespan)[0],
+        limit=limit,
+        descending=is_descending_query(query_template),
+        fetch=lambda window: run_range(window, None),
+    )
+
+    if data is not None and output_file:
+        _write_results_to_file(data, output_file)
+
+    return data
+
+
+def _run_planned_app_insights_query(  # pragma: no cover
+    environment: str,
+    plan: QueryPlan,
+    dry_run: bool = False,
+    auto_switch_account: bool = True,
+    output_file: Optional[Path] = None,
+    timeout_seconds: int = 120,
+) -> Optional[dict]:
+    """
+    Execute a QueryPlan concurrently and merge the window results.
+
+    Args:
+        environment: Target environment (DEV, INT, PROD).
+        plan: Per-window queries built by build_query_plan.
+        dry_run: If True, only print what would be done.
+        auto_switch_account: If True, auto-switch to correct Azure account.
+        output_file: If provided, write merged results to this file.
+        timeout_seconds: Timeout for each window query (default: 120 seconds).
+
+    Returns:
+        Merged query results as dict with 'tables' key, or None if any window
+        failed without returning data.
+    """
+    config = get_app_insights_config(environment)
+    if config is None:
+        print(
+            f"Error: Unknown environment '{environment}'. Use DEV, INT, or PROD.",
+            file=sys.stderr,
+        )
+        return None
+
+    if dry_run:
+        print("DRY-RUN: Would query Application Insights with:")
+        print(f"  Environment   : {environment}")
+        print(f"  App Insights  : {config.name}")
+        print(f"  Time windows  : {len(plan.windows)} (parallel)")
+        for window in plan.windows:
+            print(f"    - {window.start.isoformat()} .. {window.end.isoformat()}")
+        if output_file:
+            print(f"  Output File   : {output_file}")
+        return {"dry_run": True}
+
+    required_account = get_account_for_environment(environment)
+    if not ensure_azure_account(required_account, auto_switch=auto_switch_account):
+        return None
+
+    print(f"Querying {config.name} in {environment} across {len(plan.windows)} parallel time windows...")
+
+    try:
+        client = LogsQueryClient(AzureCliCredential())
+    except Exception as e:
+        print(f"Error: Failed to create Application Insights client: {e}", file=sys.stderr)
+        return None
+
+    def run_window(query: str, window: TimeWindow) -> list:
+        try:
+            response = client.query_resource(
+                resource_id=config.resource_id,
+                query=query,
+                timespan=(window.start, window.end),
+                server_timeout=timeout_seconds,
+            )
+        except HttpResponseError as e:
+            raise WindowQueryError(f"HTTP error from Azure Monitor: {e.message}") from e
+        if response.status == LogsQueryStatus.PARTIAL:
+            raise WindowQueryError(f"Partial results: {response.partial_error}", response.partial_data)
+        if response.status == LogsQueryStatus.SUCCESS:
+            return response.tables
+        raise WindowQueryError(f"Query failed with status {response.status}")
+
+    result = execute_query_plan(plan, run_window)
+    if result.failed_windows:
+        print(
+            f"Error: {len(result.failed_windows)} of {len(plan.windows)} time window(s) failed.",
+            file=sys.stderr,
+        )
+        return None
+    if result.partial_windows:
+        print(
+            f"Warning: Partial results returned for {len(result.partial_windows)} time window(s).",
+            file=sys.stderr,
+        )
+
+    data = result.merge()
+    print(f"Completed {len(plan.windows)} time windows in {result.elapsed_seconds:.1f}s.")
+
+    if output_file:
+        _write_results_to_file(data, output_file)
+
+    return data
+
+
+def _export_app_insights_query(  # pragma: no cover
+    environment: str,
+    query_template: str,
+    output_file: Path,
+    export_format: str = "block",
+    timespan: str = "1h",
+    limit: int = 100,
+    slice_size: Optional[str] = DEFAULT_SLICE_SIZE,
+    dataproduct_id: Optional[str] = None,
+    workbench: Optional[str] = None,
+    include_mgmt: bool = True,
+    dry_run: bool = False,
+    auto_switch_account: bool = True,
+    timeout_seconds: int = 120,
+) -> Optional[dict]:
+    """
+    Run a templated query as time-sliced sub-queries, streaming rows to a file.
+
+    Each time window is queried separately with an absolute timestamp filter,
+    and its rows are written to ``output_file`` as they are converted, so the
+    full result set is never held in memory.
+
+    Args:
+        environment: Target environment (DEV, INT, PROD).
+        query_template: One of the FABRIC_DAP_*_QUERY templates.
+        output_file: File that receives the exported rows.
+        export_format: One of EXPORT_FORMATS (block, jsonl, csv).
+        timespan: Total time range (e.g., '24h').
+        limit: Maximum total number of rows to export.
+        slice_size: Size of each time window (e.g., '1h'); None for a single window.
+        dataproduct_id: Optional dataproduct ID or key to filter by.
+        workbench: Workbench key (e.g., 'STND') to filter Fabric DAP logs.
+        include_mgmt: If True, also include management backend logs.
+        dry_run: If True, only print what would be done.
+        auto_switch_account: If True, auto-switch to correct Azure account.
+        timeout_seconds: Timeout for each window query (default: 120 seconds).
+
+    Returns:
+        Dict with 'exported_rows' and 'output_file' keys, or None on failure.
+    """
+    config = get_app_insights_config(environment)
+    if config is None:
+        print(
+            f"Error: Unknown environment '{environment}'. Use DEV, INT, or PROD.",
+            file=sys.stderr,
+        )
+        return None
+
+    windows = build_time_windows(timespan, slice_size, newest_first=is_descending_query(query_template))
+
+    def build_query(window: TimeWindow, take: int) -> str:
+        return _format_query(
+            query_template,
+            timespan=timespan,
+            limit=take,
+            dataproduct_id=dataproduct_id,
+            workbench=workbench,
+            include_mgmt=include_mgmt,
+            window=window,
+        )
+
+    if dry_run:
+        print("DRY-RUN: Would export Application Insights query with:")
+        print(f"  Environment   : {environment}")
+        print(f"  App Insights  : {config.name}")
+        print(f"  Time windows  : {len(windows)} x {slice_size or timespan}")
+        print(f"  Export format : {export_format}")
+        print(f"  Output File   : {output_file}")
+        return {"dry_run": True}
+
+    required_account = get_account_for_environment(environment)
+    if not ensure_azure_account(required_account, auto_switch=auto_switch_account):
+        return None
+
+    print(f"Exporting from {config.name} in {environment} ({len(windows)} time window(s))...")
+
+    try:
+        client = LogsQueryClient(AzureCliCredential())
+
+        def run_query(query: str, window: TimeWindow) -> Optional[list]:
+            response = client.query_resource(
+                resource_id=config.resource_id,
+                query=query,
+                timespan=(window.start, window.end),
+                server_timeout=timeout_seconds,
+            )
+            if response.status == LogsQueryStatus.PARTIAL:
+                print(
+                    f"Warning: Partial results for window starting {window.start.isoformat()}: "
+                    f"{response.partial_error}",
+                    file=sys.stderr,
+                )
+                return response.partial_data
+            if response.status == LogsQueryStatus.SUCCESS:
+                return response.tables
+            print(f"Error: Query failed with status {response.status}", file=sys.stderr)
+            return None
+
+        with create_result_writer(export_format, output_file) as writer:
+            stats = export_windows(windows, build_query, run_query, writer, limit)
+
+        if stats is None:
+            return None
+
+        print(stats.format_summary(output_file))
+        return {"exported_rows": stats.rows, "output_file": str(output_file)}
+
+    except HttpResponseError as e:
+        print(f"Error: HTTP error from Azure Monitor: {e.message}", file=sys.stderr)
+        if e.error:
+            print(f"  Error code: {e.error.code}", file=sys.stderr)
+        return None
+    except Exception as e:
+        print(f"Error: Failed to export Application Insights query: {e}", file=sys.stderr)
+        return None
+
+
+def _get_export_format() -> Optional[str]:
+    """
+    Read and validate the streaming export format from state.
+
+    Returns:
+        The lower-cased format from 'azure.export_format', or None when unset.
+
+    Raises:
+        SystemExit: If the configured format is not supported.
+    """
+    export_format = get_value("azure.export_format")
+    if not export_format:
+        return None
+    export_format = str(export_format).lower()
+    if export_format not in EXPORT_FORMATS:
+        print(
+            f"Error: Unknown azure.export_format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return export_format
+
+
+def _get_export_output_file(base_name: str, export_format: str) -> Path:
+    """Return the temp output file for an export, e.g. temp-fabric-dap-errors.jsonl."""
+    return _get_temp_output_dir() / f"{base_name}.{EXPORT_EXTENSIONS[export_format]}"
+
+
 def _convert_sdk_response_to_dict(tables: list) -> dict:
     """
     Convert SDK response tables to dict format matching az CLI output.
@@ -414,6 +825,10 @@ def query_fabric_dap_errors() -> None:  # pragma: no cover
         - azure.include_mgmt: Include management backend logs (default: true)
         - azure.output_to_file: Write results to temp file instead of console (default: false)
         - azure.auto_switch_account: Auto-switch to AZA account (default: true)
+        - azure.export_format: Stream results to a file as block, jsonl or csv (optional)
+        - azure.slice: Time slice size for streaming export (default: 1h)
+        - azure.query_windows: Number of parallel time windows (default: one per 4h of timespan)
+        - azure.cache: Reuse cached results for overlapping time windows (default: true)
         - dry_run: If true, only print what would be done
 
     Raises:
@@ -441,15 +856,6 @@ def query_fabric_dap_errors() -> None:  # pragma: no cover
         "yes",
     )
 
-    query = _format_query(
-        FABRIC_DAP_ERROR_QUERY,
-        timespan=timespan,
-        limit=limit,
-        dataproduct_id=dataproduct_id,
-        workbench=workbench,
-        include_mgmt=include_mgmt,
-    )
-
     filter_parts = []
     if dataproduct_id:
         filter_parts.append(f"dataproduct='{dataproduct_id}'")
@@ -458,11 +864,36 @@ def query_fabric_dap_errors() -> None:  # pragma: no cover
     filter_msg = f" [{', '.join(filter_parts)}]" if filter_parts else ""
     print(f"Querying Fabric DAP errors in {environment} (last {timespan}){filter_msg}...")
 
+    export_format = _get_export_format()
+    if export_format:
+        result = _export_app_insights_query(
+            environment=environment,
+            query_template=FABRIC_DAP_ERROR_QUERY,
+            output_file=_get_export_output_file("temp-fabric-dap-errors", export_format),
+            export_format=export_format,
+            timespan=timespan,
+            limit=limit,
+            slice_size=get_value("azure.slice") or DEFAULT_SLICE_SIZE,
+            dataproduct_id=dataproduct_id,
+            workbench=workbench,
+            include_mgmt=include_mgmt,
+            dry_run=dry_run,
+            auto_switch_account=auto_switch,
+        )
+        if result is None:
+            sys.exit(1)
+        return
+
     output_file = _get_temp_output_dir() / "temp-fabric-dap-errors.txt" if output_to_file else None
 
-    result = _run_app_insights_query(
+    result = _run_templated_app_insights_query(
         environment=environment,
-        query=query,
+        query_template=FABRIC_DAP_ERROR_QUERY,
+        timespan=timespan,
+        limit=limit,
+        dataproduct_id=dataproduct_id,
+        workbench=workbench,
+        include_mgmt=include_mgmt,
         dry_run=dry_run,
         auto_switch_account=auto_switch,
         output_file=output_file,
@@ -493,6 +924,10 @@ def query_fabric_dap_provisioning() -> None:  # pragma: no cover
         - azure.output_to_file: Write results to temp file instead of console (default: false)
         - azure.background: Run query in background (default: false). Returns task ID immediately.
         - azure.auto_switch_account: Auto-switch to AZA account (default: true)
+        - azure.export_format: Stream results to a file as block, jsonl or csv (optional)
+        - azure.slice: Time slice size for streaming export (default: 1h)
+        - azure.query_windows: Number of parallel time windows (default: one per 4h of timespan)
+        - azure.cache: Reuse cached results for overlapping time windows (default: true)
         - dry_run: If true, only print what would be done
 
     Raises:
@@ -555,15 +990,6 @@ def _query_fabric_dap_provisioning_sync() -> int:  # pragma: no cover
         "yes",
     )
 
-    query = _format_query(
-        FABRIC_DAP_PROVISIONING_QUERY,
-        timespan=timespan,
-        limit=limit,
-        dataproduct_id=dataproduct_id,
-        workbench=workbench,
-        include_mgmt=include_mgmt,
-    )
-
     filter_parts = []
     if dataproduct_id:
         filter_parts.append(f"dataproduct='{dataproduct_id}'")
@@ -572,11 +998,36 @@ def _query_fabric_dap_provisioning_sync() -> int:  # pragma: no cover
     filter_msg = f" [{', '.join(filter_parts)}]" if filter_parts else ""
     print(f"Querying Fabric DAP provisioning flow in {environment} (last {timespan}){filter_msg}...")
 
+    export_format = _get_export_format()
+    if export_format:
+        result = _export_app_insights_query(
+            environment=environment,
+            query_template=FABRIC_DAP_PROVISIONING_QUERY,
+            output_file=_get_export_output_file("temp-fabric-dap-provisioning", export_format),
+            export_format=export_format,
+            timespan=timespan,
+            limit=limit,
+            slice_size=get_value("azure.slice") or DEFAULT_SLICE_SIZE,
+            dataproduct_id=dataproduct_id,
+            workbench=workbench,
+            include_mgmt=include_mgmt,
+            dry_run=dry_run,
+            auto_switch_account=auto_switch,
+        )
+        if result is None:
+            return 1
+        return 0
+
     output_file = _get_temp_output_dir() / "temp-fabric-dap-provisioning.txt" if output_to_file else None
 
-    result = _run_app_insights_query(
+    result = _run_templated_app_insights_query(
         environment=environment,
-        query=query,
+        query_template=FABRIC_DAP_PROVISIONING_QUERY,
+        timespan=timespan,
+        limit=limit,
+        dataproduct_id=dataproduct_id,
+        workbench=workbench,
+        include_mgmt=include_mgmt,
         dry_run=dry_run,
         auto_switch_account=auto_switch,
         output_file=output_file,
@@ -607,6 +1058,10 @@ def query_fabric_dap_timeline() -> None:  # pragma: no cover
         - azure.include_mgmt: Include management backend logs (default: true)
         - azure.output_to_file: Write results to temp file instead of console (default: true)
         - azure.auto_switch_account: Auto-switch to AZA account (default: true)
+        - azure.export_format: Stream results to a file as block, jsonl or csv (optional)
+        - azure.slice: Time slice size for streaming export (default: 1h)
+        - azure.query_windows: Number of parallel time windows (default: one per 4h of timespan)
+        - azure.cache: Reuse cached results for overlapping time windows (default: true)
         - dry_run: If true, only print what would be done
 
     Raises:
@@ -635,15 +1090,6 @@ def query_fabric_dap_timeline() -> None:  # pragma: no cover
         "yes",
     )
 
-    query = _format_query(
-        FABRIC_DAP_TIMELINE_QUERY,
-        timespan=timespan,
-        limit=limit,
-        dataproduct_id=dataproduct_id,
-        workbench=workbench,
-        include_mgmt=include_mgmt,
-    )
-
     filter_parts = []
     if dataproduct_id:
         filter_parts.append(f"dataproduct='{dataproduct_id}'")
@@ -652,11 +1098,36 @@ def query_fabric_dap_timeline() -> None:  # pragma: no cover
     filter_msg = f" [{', '.join(filter_parts)}]" if filter_parts else ""
     print(f"Querying Fabric DAP timeline in {environment} (last {timespan}){filter_msg}...")
 
+    export_format = _get_export_format()
+    if export_format:
+        result = _export_app_insights_query(
+            environment=environment,
+            query_template=FABRIC_DAP_TIMELINE_QUERY,
+            output_file=_get_export_output_file("temp-fabric-dap-timeline", export_format),
+            export_format=export_format,
+            timespan=timespan,
+            limit=limit,
+            slice_size=get_value("azure.slice") or DEFAULT_SLICE_SIZE,
+            dataproduct_id=dataproduct_id,
+            workbench=workbench,
+            include_mgmt=include_mgmt,
+            dry_run=dry_run,
+            auto_switch_account=auto_switch,
+        )
+        if result is None:
+            sys.exit(1)
+        return
+
     output_file = _get_temp_output_dir() / "temp-fabric-dap-timeline.txt" if output_to_file else None
 
-    result = _run_app_insights_query(
+    result = _run_templated_app_insights_query(
         environment=environment,
-        query=query,
+        query_template=FABRIC_DAP_TIMELINE_QUERY,
+        timespan=timespan,
+        limit=limit,
+        dataproduct_id=dataproduct_id,
+        workbench=workbench,
+        include_mgmt=include_mgmt,
         dry_run=dry_run,
         auto_switch_account=auto_switch,
         output_file=output_file,
@@ -737,6 +1208,31 @@ def _create_common_parser(description: str) -> argparse.ArgumentParser:
         action=argparse.BooleanOptionalAction,
         help="Auto-switch to correct Azure account (default: true)",
     )
+    parser.add_argument(
+        "--export-format",
+        "-f",
+        choices=list(EXPORT_FORMATS),
+        default=None,
+        help="Stream results to a temp file in this format (block, jsonl or csv)",
+    )
+    parser.add_argument(
+        "--slice",
+        default=None,
+        help="Time slice size for streaming export, e.g., '1h', '15m' (default: 1h)",
+    )
+    parser.add_argument(
+        "--cache/--no-cache",
+        dest="cache",
+        default=None,
+        action=argparse.BooleanOptionalAction,
+        help="Reuse locally cached results for overlapping time windows (default: true)",
+    )
+    parser.add_argument(
+        "--windows",
+        type=int,
+        default=None,
+        help="Number of parallel time windows to split the query into (default: one per 4h of timespan)",
+    )
     return parser
 
 
@@ -831,6 +1327,12 @@ def query_fabric_dap_errors_async() -> None:  # pragma: no cover
         set_value("azure.output_to_file", str(args.output_to_file).lower())
     if args.auto_switch is not None:
         set_value("azure.auto_switch_account", str(args.auto_switch).lower())
+    _set_if_provided("azure.export_format", args.export_format)
+    _set_if_provided("azure.slice", args.slice)
+    if args.windows is not None:
+        set_value("azure.query_windows", str(args.windows))
+    if args.cache is not None:
+        set_value("azure.cache", str(args.cache).lower())
 
     query_fabric_dap_errors()
 
@@ -870,6 +1372,12 @@ def query_fabric_dap_provisioning_async() -> None:  # pragma: no cover
         set_value("azure.output_to_file", str(args.output_to_file).lower())
     if args.auto_switch is not None:
         set_value("azure.auto_switch_account", str(args.auto_switch).lower())
+    _set_if_provided("azure.export_format", args.export_format)
+    _set_if_provided("azure.slice", args.slice)
+    if args.windows is not None:
+        set_value("azure.query_windows", str(args.windows))
+    if args.cache is not None:
+        set_value("azure.cache", str(args.cache).lower())
     if args.background is not None:
         set_value("azure.background", str(args.background).lower())
 
@@ -904,5 +1412,11 @@ def query_fabric_dap_timeline_async() -> None:  # pragma: no cover
         set_value("azure.output_to_file", str(args.output_to_file).lower())
     if args.auto_switch is not None:
         set_value("azure.auto_switch_account", str(args.auto_switch).lower())
+    _set_if_provided("azure.export_format", args.export_format)
+    _set_if_provided("azure.slice", args.slice)
+    if args.windows is not None:
+        set_value("azure.query_windows", str(args.windows))
+    if args.cache is not None:
+        set_value("azure.cache", str(args.cache).lower())
 
     query_fabric_dap_timeline()
@@ -0,0 +1,331 @@
+"""Streaming export of Application Insights query results.
+
+Long-range Fabric DAP queries can return hundreds of thousands of rows. Instead
+of materializing the whole result set as nested lists and then building the
+output text in memory, this module writes each row to disk as it is converted.
+Long time ranges are split into absolute time windows so that no single query
+approaches the service row cap.
+
+Supported export formats:
+    - block: the human-readable "--- Result N ---" format used by the commands
+    - jsonl: one JSON object per row, keyed by column name
+    - csv: header row followed by one line per row
+"""
+
+import abc
+import csv
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+EXPORT_FORMATS = ("block", "jsonl", "csv")
+
+# File extension used for each export format
+EXPORT_EXTENSIONS = {
+    "block": "txt",
+    "jsonl": "jsonl",
+    "csv": "csv",
+}
+
+# Default size of each time slice when exporting long time ranges
+DEFAULT_SLICE_SIZE = "1h"
+
+_TIMESPAN_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|d|h|m|s)\s*$", re.IGNORECASE)
+
+_TIMESPAN_UNITS = {
+    "d": timedelta(days=1),
+    "h": timedelta(hours=1),
+    "m": timedelta(minutes=1),
+    "s": timedelta(seconds=1),
+    "ms": timedelta(milliseconds=1),
+}
+
+_DESCENDING_ORDER_PATTERN = re.compile(r"\|\s*order\s+by\s+timestamp\s+desc\b", re.IGNORECASE)
+
+
+def parse_timespan(timespan: str) -> timedelta:
+    """
+    Parse a KQL-style timespan such as '30m', '1h', '24h' or '7d'.
+
+    Args:
+        timespan: Timespan string with a d/h/m/s/ms suffix.
+
+    Returns:
+        The equivalent timedelta.
+
+    Raises:
+        ValueError: If the timespan is malformed or not positive.
+    """
+    match = _TIMESPAN_PATTERN.match(timespan or "")
+    if not match:
+        raise ValueError(f"Invalid timespan '{timespan}'. Use a value like '30m', '1h', '24h' or '7d'.")
+    value = float(match.group(1))
+    if value <= 0:
+        raise ValueError(f"Timespan must be positive, got '{timespan}'.")
+    return _TIMESPAN_UNITS[match.group(2).lower()] * value
+
+
+def _format_kql_datetime(value: datetime) -> str:
+    """Format a datetime as a KQL datetime literal in UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return f"datetime({value.isoformat()}Z)"
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """An absolute, half-open [start, end) time range for a query slice."""
+
+    start: datetime
+    end: datetime
+
+    @property
+    def duration(self) -> timedelta:
+        """Length of the window."""
+        return self.end - self.start
+
+    def to_kql_condition(self) -> str:
+        """Return the KQL timestamp condition selecting rows inside this window."""
+        return f"timestamp >= {_format_kql_datetime(self.start)} and timestamp < {_format_kql_datetime(self.end)}"
+
+
+def build_time_windows(
+    timespan: str,
+    slice_size: Optional[str] = None,
+    end: Optional[datetime] = None,
+    newest_first: bool = False,
+) -> List[TimeWindow]:
+    """
+    Split the trailing ``timespan`` ending at ``end`` into consecutive windows.
+
+    Args:
+        timespan: Total time range to cover (e.g., '24h').
+        slice_size: Size of each window (e.g., '1h'). If None, a single window is returned.
+        end: End of the range (default: now, UTC).
+        newest_first: If True, return windows from most recent to oldest.
+
+    Returns:
+        List of non-overlapping windows covering the whole range.
+    """
+    range_end = end or datetime.now(timezone.utc)
+    range_start = range_end - parse_timespan(timespan)
+    step = parse_timespan(slice_size) if slice_size else range_end - range_start
+
+    windows = []
+    window_start = range_start
+    while window_start < range_end:
+        window_end = min(window_start + step, range_end)
+        windows.append(TimeWindow(start=window_start, end=window_end))
+        window_start = window_end
+
+    if newest_first:
+        windows.reverse()
+    return windows
+
+
+def is_descending_query(query_template: str) -> bool:
+    """Return True if the query orders results by timestamp descending."""
+    return bool(_DESCENDING_ORDER_PATTERN.search(query_template))
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert a cell value into a JSON/CSV friendly representation."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(value)
+    return value
+
+
+class ResultWriter(abc.ABC):
+    """Base class for streaming row writers.
+
+    Subclasses implement ``_write_row`` and may override ``_write_columns``.
+    Columns are written once, on the first non-empty table; rows are written
+    immediately.
+    """
+
+    def __init__(self, output_file: Path):
+        self.output_file = output_file
+        self.columns: Optional[List[str]] = None
+        self.rows_written = 0
+        self._handle = None
+
+    def __enter__(self) -> "ResultWriter":
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.output_file.open("w", encoding="utf-8", newline="")
+        self._write_preamble()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._write_footer()
+        self._handle.close()
+        self._handle = None
+
+    def write_columns(self, columns: Sequence[str]) -> None:
+        """Record the column names, writing a header if the format has one."""
+        if self.columns is None:
+            self.columns = list(columns)
+            self._write_columns()
+
+    def write_row(self, row: Iterable[Any]) -> None:
+        """Convert and write a single row."""
+        self._write_row(list(row))
+        self.rows_written += 1
+
+    def _write_preamble(self) -> None:
+        """Write content that precedes the rows (no-op by default)."""
+
+    def _write_columns(self) -> None:
+        """Write the column header (no-op by default)."""
+
+    @abc.abstractmethod
+    def _write_row(self, row: List[Any]) -> None:
+        """Write one converted row."""
+
+    def _write_footer(self) -> None:
+        """Write content that follows the rows (no-op by default)."""
+
+
+class BlockResultWriter(ResultWriter):
+    """Writes rows in the readable '--- Result N ---' block format."""
+
+    def _write_preamble(self) -> None:
+        self._handle.write(f"Query Results - {datetime.now().isoformat()}\n")
+        self._handle.write("=" * 80 + "\n\n")
+
+    def _write_row(self, row: List[Any]) -> None:
+        lines = [f"--- Result {self.rows_written + 1} ---"]
+        for col, val in zip(self.columns or [], row):
+            if val:
+                lines.append(f"  {col}: {val}")
+        self._handle.write("\n".join(lines) + "\n\n")
+
+    def _write_footer(self) -> None:
+        if self.rows_written == 0:
+            self._handle.write("No results found.\n")
+        self._handle.write(f"Total: {self.rows_written} rows\n")
+
+
+class JsonlResultWriter(ResultWriter):
+    """Writes one JSON object per row."""
+
+    def _write_row(self, row: List[Any]) -> None:
+        record = {col: _serialize_value(val) for col, val in zip(self.columns or [], row)}
+        self._handle.write(json.dumps(record, default=str) + "\n")
+
+
+class CsvResultWriter(ResultWriter):
+    """Writes a CSV header followed by one line per row."""
+
+    def __enter__(self) -> "CsvResultWriter":
+        super().__enter__()
+        self._csv = csv.writer(self._handle)
+        return self
+
+    def _write_columns(self) -> None:
+        self._csv.writerow(self.columns)
+
+    def _write_row(self, row: List[Any]) -> None:
+        self._csv.writerow(["" if val is None else _serialize_value(val) for val in row])
+
+
+_WRITERS = {
+    "block": BlockResultWriter,
+    "jsonl": JsonlResultWriter,
+    "csv": CsvResultWriter,
+}
+
+
+def create_result_writer(export_format: str, output_file: Path) -> ResultWriter:
+    """
+    Create a streaming writer for the given export format.
+
+    Raises:
+        ValueError: If the format is not one of EXPORT_FORMATS.
+    """
+    writer_class = _WRITERS.get((export_format or "").lower())
+    if writer_class is None:
+        raise ValueError(f"Unknown export format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}.")
+    return writer_class(output_file)
+
+
+@dataclass
+class ExportStats:
+    """Summary of a streaming export."""
+
+    rows: int = 0
+    windows: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Export throughput; 0 when nothing was timed."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows / self.elapsed_seconds
+
+    def format_summary(self, output_file: Path) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"Exported {self.rows} rows from {self.windows} time window(s) in "
+            f"{self.elapsed_seconds:.1f}s ({self.rows_per_second:.0f} rows/sec) to: {output_file}"
+        )
+
+
+def export_windows(
+    windows: Sequence[TimeWindow],
+    build_query: Callable[[TimeWindow, int], str],
+    run_query: Callable[[str, TimeWindow], Optional[list]],
+    writer: ResultWriter,
+    limit: int,
+) -> Optional[ExportStats]:
+    """
+    Run one query per window and stream the primary table's rows to ``writer``.
+
+    Windows are processed in the given order; the total row count is capped at
+    ``limit`` by shrinking the ``take`` of each subsequent window query.
+
+    Args:
+        windows: Time windows to query, in output order.
+        build_query: Builds the KQL for a window and the remaining row budget.
+        run_query: Executes KQL for a window, returning SDK tables or None on failure.
+        writer: Open ResultWriter receiving the rows.
+        limit: Maximum total number of rows to export.
+
+    Returns:
+        ExportStats on success, or None if any window query failed.
+    """
+    stats = ExportStats()
+    started = time.monotonic()
+
+    for window in windows:
+        remaining = limit - writer.rows_written
+        if remaining <= 0:
+            break
+
+        tables = run_query(build_query(window, remaining), window)
+        if tables is None:
+            return None
+        stats.windows += 1
+
+        if tables:
+            table = tables[0]
+            writer.write_columns(table.columns)
+            for row in table.rows:
+                writer.write_row(row)
+
+        print(
+            f"  [{stats.windows}/{len(windows)}] {window.start.isoformat()} .. {window.end.isoformat()}: "
+            f"{writer.rows_written} rows so far",
+            file=sys.stderr,
+        )
+
+    stats.rows = writer.rows_written
+    stats.elapsed_seconds = time.monotonic() - started
+    return stats
@@ -0,0 +1,301 @@
+"""Time-sliced parallel execution of templated App Insights queries.
+
+A single query over a long ``azure.timespan`` can time out or come back as
+``LogsQueryStatus.PARTIAL``. The planner splits the time range into N
+absolute windows, runs the per-window queries concurrently on a thread pool,
+retries only the windows that failed, and merges the window results back
+into one ordered table.
+
+Because the windows are disjoint and every templated query already orders
+its rows by timestamp, merging is a concatenation in window order (newest
+window first for descending queries) followed by truncation to the limit;
+no global sort is required.
+"""
+
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Union
+
+from .app_insights_export import TimeWindow, is_descending_query, parse_timespan
+
+# Target span of one window when the window count is chosen automatically
+DEFAULT_WINDOW_SPAN = "4h"
+
+# Upper bound for automatically chosen window counts
+MAX_AUTO_WINDOWS = 8
+
+# Maximum number of window queries in flight at once
+DEFAULT_MAX_WORKERS = 4
+
+# Number of additional attempts for windows that failed or returned partial data
+DEFAULT_MAX_RETRIES = 2
+
+
+class WindowQueryError(Exception):
+    """Raised by a window runner when a window query failed or was incomplete.
+
+    Attributes:
+        partial_tables: Tables returned alongside a partial failure, if any.
+    """
+
+    def __init__(self, message: str, partial_tables: Optional[list] = None):
+        super().__init__(message)
+        self.partial_tables = partial_tables
+
+
+def split_window(time_range: TimeWindow, count: int, newest_first: bool = False) -> List[TimeWindow]:
+    """
+    Split an absolute time range into ``count`` equal, contiguous windows.
+
+    Args:
+        time_range: The range to split.
+        count: Number of windows (values below 1 are treated as 1).
+        newest_first: If True, return windows from most recent to oldest.
+
+    Returns:
+        List of ``count`` non-overlapping windows covering ``time_range``.
+    """
+    count = max(1, count)
+    step = time_range.duration / count
+
+    windows = []
+    for index in range(count):
+        window_start = time_range.start + step * index
+        window_end = time_range.end if index == count - 1 else time_range.start + step * (index + 1)
+        windows.append(TimeWindow(start=window_start, end=window_end))
+
+    if newest_first:
+        windows.reverse()
+    return windows
+
+
+def split_time_windows(
+    timespan: str,
+    count: int,
+    end: Optional[datetime] = None,
+    newest_first: bool = False,
+) -> List[TimeWindow]:
+    """
+    Split the trailing ``timespan`` ending at ``end`` into ``count`` equal windows.
+
+    Args:
+        timespan: Total time range to cover (e.g., '24h').
+        count: Number of windows (values below 1 are treated as 1).
+        end: End of the range (default: now, UTC).
+        newest_first: If True, return windows from most recent to oldest.
+
+    Returns:
+        List of ``count`` contiguous, non-overlapping windows.
+    """
+    range_end = end or datetime.now(timezone.utc)
+    time_range = TimeWindow(start=range_end - parse_timespan(timespan), end=range_end)
+    return split_window(time_range, count, newest_first=newest_first)
+
+
+def plan_window_count(timespan: Union[str, timedelta], requested: Optional[int] = None) -> int:
+    """
+    Decide how many windows to split a query into.
+
+    An explicit ``requested`` count wins. Otherwise one window is used per
+    DEFAULT_WINDOW_SPAN of range, capped at MAX_AUTO_WINDOWS, so short ranges
+    keep running as a single query.
+
+    Args:
+        timespan: Range to cover, as a KQL timespan string or a timedelta.
+        requested: Explicit window count, if configured.
+    """
+    if requested is not None:
+        return max(1, requested)
+    duration = parse_timespan(timespan) if isinstance(timespan, str) else timespan
+    ratio = duration / parse_timespan(DEFAULT_WINDOW_SPAN)
+    return max(1, min(MAX_AUTO_WINDOWS, math.ceil(ratio)))
+
+
+@dataclass
+class QueryPlan:
+    """Per-window queries for one templated query, in output order."""
+
+    windows: List[TimeWindow]
+    queries: List[str]
+    limit: int
+    descending: bool = False
+
+
+def build_query_plan(
+    query_template: str,
+    timespan: str,
+    limit: int,
+    format_window_query: Callable[[TimeWindow], str],
+    window_count: Optional[int] = None,
+    end: Optional[datetime] = None,
+    time_range: Optional[TimeWindow] = None,
+) -> QueryPlan:
+    """
+    Build a QueryPlan for a templated query.
+
+    Args:
+        query_template: The KQL template (used to detect result ordering).
+        timespan: Total time range (e.g., '24h').
+        limit: Maximum number of rows in the merged result.
+        format_window_query: Renders the KQL for one window.
+        window_count: Explicit number of windows (default: chosen from the range).
+        end: End of the range (default: now, UTC).
+        time_range: Absolute range to plan; overrides ``timespan`` and ``end``.
+    """
+    descending = is_descending_query(query_template)
+    if time_range is None:
+        range_end = end or datetime.now(timezone.utc)
+        time_range = TimeWindow(start=range_end - parse_timespan(timespan), end=range_end)
+    windows = split_window(time_range, plan_window_count(time_range.duration, window_count), newest_first=descending)
+    return QueryPlan(
+        windows=windows,
+        queries=[format_window_query(window) for window in windows],
+        limit=limit,
+        descending=descending,
+    )
+
+
+@dataclass
+class WindowResult:
+    """Outcome of one window after all attempts."""
+
+    window: TimeWindow
+    tables: Optional[list] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    partial: bool = False
+
+    @property
+    def failed(self) -> bool:
+        """True if the window produced no usable data."""
+        return self.tables is None
+
+
+@dataclass
+class PlanResult:
+    """Results of an executed QueryPlan, in plan (output) order."""
+
+    plan: QueryPlan
+    results: List[WindowResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failed_windows(self) -> List[WindowResult]:
+        """Windows that failed on every attempt."""
+        return [result for result in self.results if result.failed]
+
+    @property
+    def partial_windows(self) -> List[WindowResult]:
+        """Windows that only returned partial data on their last attempt."""
+        return [result for result in self.results if result.partial]
+
+    def merge(self) -> dict:
+        """
+        Merge the primary table of every window into one ordered result.
+
+        Returns:
+            Dict in the ``{"tables": [{"columns": [...], "rows": [...]}]}`` format
+            produced by ``_convert_sdk_response_to_dict``.
+        """
+        columns: Optional[list] = None
+        rows: list = []
+        for result in self.results:
+            if not result.tables:
+                continue
+            table = result.tables[0]
+            if columns is None:
+                columns = [{"name": col, "type": "string"} for col in table.columns]
+            for row in table.rows:
+                if len(rows) >= self.plan.limit:
+                    break
+                rows.append(list(row))
+
+        if columns is None:
+            return {"tables": []}
+        return {"tables": [{"columns": columns, "rows": rows}]}
+
+
+def _run_window_attempt(
+    run_window: Callable[[str, TimeWindow], list],
+    query: str,
+    result: WindowResult,
+) -> WindowResult:
+    """Run one attempt for a window, recording data or error on ``result``."""
+    result.attempts += 1
+    try:
+        result.tables = run_window(query, result.window)
+        result.error = None
+        result.partial = False
+    except WindowQueryError as e:
+        result.error = str(e)
+        if e.partial_tables is not None:
+            result.tables = e.partial_tables
+            result.partial = True
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+
+def execute_query_plan(
+    plan: QueryPlan,
+    run_window: Callable[[str, TimeWindow], list],
+    max_workers: Optional[int] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_delay_seconds: float = 1.0,
+) -> PlanResult:
+    """
+    Run every window of ``plan`` concurrently, retrying only failed windows.
+
+    ``run_window`` returns the SDK tables for a window, or raises
+    WindowQueryError (optionally carrying partial tables) or any other
+    exception on failure. Windows that failed, or only returned partial
+    data, are re-submitted in later rounds; successful windows are never
+    re-queried.
+
+    Args:
+        plan: The QueryPlan to execute.
+        run_window: Executes one window's KQL.
+        max_workers: Thread pool size (default: min(windows, DEFAULT_MAX_WORKERS)).
+        max_retries: Extra rounds for failed or partial windows.
+        retry_delay_seconds: Base delay before each retry round (multiplied by round number).
+
+    Returns:
+        PlanResult with one WindowResult per window, in plan order.
+    """
+    started = time.monotonic()
+    results = [WindowResult(window=window) for window in plan.windows]
+    queries: Dict[int, str] = dict(enumerate(plan.queries))
+    pending = list(range(len(results)))
+    workers = max_workers or min(len(results), DEFAULT_MAX_WORKERS) or 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for attempt in range(max_retries + 1):
+            if attempt:
+                print(
+                    f"Retrying {len(pending)} of {len(results)} time window(s) (attempt {attempt + 1})...",
+                    file=sys.stderr,
+                )
+                time.sleep(retry_delay_seconds * attempt)
+
+            futures = [executor.submit(_run_window_attempt, run_window, queries[i], results[i]) for i in pending]
+            for future in futures:
+                future.result()
+
+            pending = [i for i in pending if results[i].failed or results[i].partial]
+            if not pending:
+                break
+
+    for result in results:
+        if result.error:
+            outcome = "partial data" if result.partial else "no data"
+            print(
+                f"Warning: Window {result.window.start.isoformat()} .. {result.window.end.isoformat()} "
+                f"failed after {result.attempts} attempt(s) ({outcome}): {result.error}",
+                file=sys.stderr,
+            )
+
+    return PlanResult(plan=plan, results=results, elapsed_seconds=time.monotonic() - started)
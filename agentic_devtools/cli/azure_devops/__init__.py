@@ -25,6 +25,8 @@ from .async_commands import (
     add_pull_request_comment_async_cli,
     approve_file_async,
     approve_file_async_cli,
+    approve_files_async,
+    approve_files_async_cli,
     approve_pull_request_async,
     approve_pull_request_async_cli,
     confirm_suggestion_addressed_async,
@@ -85,6 +87,7 @@ from .config import (
 # File review command exports
 from .file_review_commands import (
     approve_file,
+    approve_files,
     get_queue_status,
     request_changes,
     request_changes_with_suggestion,
@@ -107,7 +110,7 @@ from .helpers import (
 )
 
 # Mark reviewed export
-from .mark_reviewed import mark_file_reviewed, mark_file_reviewed_cli
+from .mark_reviewed import mark_file_reviewed, mark_file_reviewed_cli, mark_files_reviewed
 
 # Pipeline command exports
 from .pipeline_commands import (
@@ -164,6 +167,7 @@ from .review_state import (
     get_review_state_file_path,
     load_review_state,
     normalize_file_path,
+    review_state_lock,
     save_review_state,
     update_file_status,
 )
@@ -269,6 +273,7 @@ __all__ = [
     "get_pull_request_details",
     # File review commands
     "approve_file",
+    "approve_files",
     "get_queue_status",
     "submit_file_review",
     "request_changes",
@@ -276,6 +281,8 @@ __all__ = [
     # File review commands (async)
     "approve_file_async",
     "approve_file_async_cli",
+    "approve_files_async",
+    "approve_files_async_cli",
     "submit_file_review_async",
     "request_changes_async",
     "request_changes_async_cli",
@@ -285,6 +292,7 @@ __all__ = [
     # Mark reviewed
     "mark_file_reviewed",
     "mark_file_reviewed_cli",
+    "mark_files_reviewed",
     # PR summary commands
     "generate_overarching_pr_comments",
     "generate_overarching_pr_comments_cli",
@@ -308,6 +316,7 @@ __all__ = [
     "normalize_file_path",
     "get_review_state_file_path",
     "load_review_state",
+    "review_state_lock",
     "save_review_state",
     "get_file_entry",
     "get_folder_entry",
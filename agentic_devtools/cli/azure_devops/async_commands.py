@@ -10,7 +10,7 @@ not via CLI entry points.
 
 import argparse
 import sys
-from typing import Optional
+from typing import List, Optional
 
 from agentic_devtools.background_tasks import run_function_in_background
 from agentic_devtools.state import get_value, set_value
@@ -1000,6 +1000,143 @@ Examples:
     )
 
 
+def _auto_advance_after_batch_submission(task_id: str, outcome: str) -> None:
+    """
+    Handle auto-advancement after submitting a review of many files.
+
+    Resolves file_review.file_paths against review-state.json, marks every
+    matched file as submission-pending in one queue update, then prints
+    the next file prompt.
+
+    Args:
+        task_id: Background task ID
+        outcome: Review outcome ('Approve', 'Changes', 'Suggest')
+    """
+    from .file_review_commands import (
+        expand_file_patterns,
+        mark_files_as_submission_pending,
+        parse_file_paths,
+        print_next_file_prompt,
+    )
+    from .review_state import load_review_state
+
+    pr_id = get_value("pull_request_id")
+    if not pr_id:  # pragma: no cover
+        return
+
+    pr_id_int = int(pr_id)
+
+    try:
+        known_paths = load_review_state(pr_id_int).files
+    except FileNotFoundError:
+        known_paths = {}
+    file_paths, _ = expand_file_patterns(parse_file_paths(get_value("file_review.file_paths")), known_paths)
+    if file_paths:
+        mark_files_as_submission_pending(pr_id_int, file_paths, task_id, outcome)
+
+    # Print the next file prompt
+    print_next_file_prompt(pr_id_int)
+
+
+def approve_files_async(
+    file_paths: Optional[List[str]] = None,
+    summary: Optional[str] = None,
+    pull_request_id: Optional[int] = None,
+) -> None:
+    """
+    Approve many files in a pull request asynchronously in the background.
+
+    After spawning the background task, immediately marks the matched
+    files as submission-pending and shows the next file to review.
+
+    Args:
+        file_paths: File paths and/or glob patterns to approve (overrides state)
+        summary: Approval summary shared by all files (overrides state)
+        pull_request_id: PR ID (overrides state)
+
+    State keys (used as fallbacks):
+        pull_request_id (required): PR ID
+        file_review.file_paths (required): File paths and/or glob patterns
+        file_review.summary (required): Approval summary text
+
+    Usage:
+        agdt-approve-files --file-paths "src/generated/*" "package-lock.json" --summary "Generated code."
+
+        # Or using state:
+        agdt-set pull_request_id 12345
+        agdt-set file_review.file_paths "src/generated/*, package-lock.json"
+        agdt-set file_review.summary "Generated code."
+        agdt-approve-files
+    """
+    # Store CLI args in state if provided
+    if file_paths is not None:
+        set_value("file_review.file_paths", list(file_paths))
+    _set_value_if_provided("file_review.summary", summary)
+    if pull_request_id is not None:
+        set_value("pull_request_id", pull_request_id)
+
+    # Validate required values
+    _require_value("pull_request_id", "agdt-approve-files --pull-request-id 12345")
+    _require_value("file_review.file_paths", 'agdt-approve-files --file-paths "path/or/glob" ...')
+    _require_value("file_review.summary", 'agdt-approve-files --summary "Approval summary"')
+
+    task = run_function_in_background(
+        _FILE_REVIEW_MODULE,
+        "approve_files",
+        command_display_name="agdt-approve-files",
+    )
+    print_task_tracking_info(task, "Approving files")
+
+    # Auto-advance: mark the files as submission-pending and show next file
+    _auto_advance_after_batch_submission(task.id, "Approve")
+
+
+def approve_files_async_cli() -> None:
+    """CLI entry point for approve_files_async with argument parsing."""
+    parser = argparse.ArgumentParser(
+        description="Approve many files in a pull request review with one shared summary (async)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  agdt-approve-files --file-paths "src/generated/*" "package-lock.json" --summary "Generated code."
+  agdt-approve-files --pull-request-id 12345 --file-paths "docs/**" --summary "Docs only"
+
+  # Or using state:
+  agdt-set pull_request_id 12345
+  agdt-set file_review.file_paths "src/generated/*, package-lock.json"
+  agdt-set file_review.summary "Generated code."
+  agdt-approve-files
+        """,
+    )
+    parser.add_argument(
+        "--file-paths",
+        "-f",
+        nargs="+",
+        default=None,
+        help="File paths and/or glob patterns to approve (falls back to file_review.file_paths state)",
+    )
+    parser.add_argument(
+        "--summary",
+        "-s",
+        type=str,
+        default=None,
+        help="Approval summary shared by all files (falls back to file_review.summary state)",
+    )
+    parser.add_argument(
+        "--pull-request-id",
+        "-p",
+        type=int,
+        default=None,
+        help="Pull request ID (falls back to pull_request_id state)",
+    )
+    args = parser.parse_args()
+    approve_files_async(
+        file_paths=args.file_paths,
+        summary=args.summary,
+        pull_request_id=args.pull_request_id,
+    )
+
+
 def submit_file_review_async() -> None:
     """
     Submit a file review asynchronously in the background.
@@ -9,45 +9,34 @@ Each command:
 """
 
 import copy
+import fnmatch
 import json
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from ...file_locking import FileLockError
 from ...state import get_pull_request_id, get_state_dir, get_value, is_dry_run
 from .auth import get_auth_headers, get_pat
 from .config import AzureDevOpsConfig
-from .helpers import get_repository_id, patch_comment, patch_thread_status, require_requests
-from .mark_reviewed import mark_file_reviewed
-
-
-def _normalize_repo_path(path: Optional[str]) -> Optional[str]:
-    """Normalize a file path to repository format (/path/to/file)."""
-    if not path or not path.strip():
-        return None
-    clean = path.strip().replace("\\", "/").strip("/")
-    if not clean:  # pragma: no cover
-        return None
-    return f"/{clean}"
-
-
-def _get_thread_file_path(thread: dict) -> Optional[str]:
-    """Extract the file path from a thread's context."""
-    context = thread.get("threadContext")
-    if not context:
-        return None
-
-    raw_path = (
-        context.get("filePath")
-        or (context.get("leftFileStart") or {}).get("filePath")
-        or (context.get("rightFileStart") or {}).get("filePath")
-    )
-
-    if not raw_path:  # pragma: no cover
-        return None
-    return raw_path.replace("\\", "/").lstrip("/")
-
+from .helpers import (
+    DEFAULT_MAX_WORKERS,
+    create_pooled_session,
+    get_repository_id,
+    normalize_repo_path,
+    patch_comment,
+    patch_thread_status,
+    require_requests,
+)
+from .mark_reviewed import mark_file_reviewed, mark_files_reviewed
+from .review_queue import (
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SUBMISSION_PENDING,
+    ReviewQueue,
+)
+from .submission_outbox import queue_in_progress_update
 
 # =============================================================================
 # Queue Management
@@ -81,55 +70,49 @@ def mark_file_as_submission_pending(
     Returns:
         True if file was successfully marked, False otherwise
     """
-    queue_path = _get_queue_path(pull_request_id)
+    return mark_files_as_submission_pending(pull_request_id, [file_path], task_id, outcome) == 1
 
-    if not queue_path.exists():
-        print(f"Queue file not found at {queue_path}; cannot mark submission pending.")
-        return False
 
-    try:
-        with open(queue_path, encoding="utf-8") as f:
-            queue_data = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        print(f"Warning: Failed to read queue file: {e}")
-        return False
-
-    normalized_target = _normalize_repo_path(file_path)
-    if not normalized_target:  # pragma: no cover
-        return False
-
-    pending = queue_data.get("pending", [])
+def mark_files_as_submission_pending(
+    pull_request_id: int,
+    file_paths: list[str],
+    task_id: str,
+    outcome: str,
+) -> int:
+    """
+    Mark several files as submission-pending under one background task.
 
-    # Find matching entry in pending
-    matched_index = None
-    for idx, entry in enumerate(pending):
-        entry_normalized = _normalize_repo_path(entry.get("path"))
-        if entry_normalized and entry_normalized.lower() == normalized_target.lower():
-            matched_index = idx
-            break
+    The queue is locked, read and written once for the whole batch.
 
-    if matched_index is None:
-        print(f"File '{file_path}' not found in pending queue.")
-        return False
+    Args:
+        pull_request_id: PR ID
+        file_paths: Paths of files being submitted
+        task_id: Background task ID tracking the submission
+        outcome: Expected review outcome ('Approve', 'Changes', 'Suggest')
 
-    # Update the entry to submission-pending
-    pending[matched_index]["status"] = "submission-pending"
-    pending[matched_index]["taskId"] = task_id
-    pending[matched_index]["outcome"] = outcome
-    pending[matched_index]["submittedUtc"] = datetime.now(timezone.utc).isoformat()
-    # Clean up any failure fields from previous attempts
-    pending[matched_index].pop("failedUtc", None)
-    pending[matched_index].pop("errorMessage", None)
+    Returns:
+        Number of files marked (0 if the queue could not be updated)
+    """
+    queue_path = _get_queue_path(pull_request_id)
 
-    queue_data["lastUpdatedUtc"] = datetime.now(timezone.utc).isoformat()
+    if not queue_path.exists():
+        print(f"Queue file not found at {queue_path}; cannot mark submission pending.")
+        return 0
 
+    marked = 0
     try:
-        with open(queue_path, "w", encoding="utf-8") as f:
-            json.dump(queue_data, f, indent=2)
-        return True
-    except OSError as e:  # pragma: no cover
-        print(f"Warning: Failed to write queue file: {e}")
-        return False
+        with ReviewQueue.locked(queue_path) as queue:
+            for file_path in file_paths:
+                entry = queue.find(file_path)
+                if entry is None:
+                    print(f"File '{file_path}' not found in pending queue.")
+                    continue
+                queue.mark_submission_pending(entry, task_id, outcome)
+                marked += 1
+    except (json.JSONDecodeError, OSError, FileLockError) as e:
+        print(f"Warning: Failed to update queue file: {e}")
+        return 0
+    return marked
 
 
 def update_submission_to_completed(
@@ -154,51 +137,14 @@ def update_submission_to_completed(
         return False
 
     try:
-        with open(queue_path, encoding="utf-8") as f:
-            queue_data = json.load(f)
-    except (json.JSONDecodeError, OSError):  # pragma: no cover
-        return False
-
-    normalized_target = _normalize_repo_path(file_path)
-    if not normalized_target:  # pragma: no cover
-        return False
-
-    pending = queue_data.get("pending", [])
-    completed = queue_data.get("completed", [])
-
-    # Find matching entry (should be submission-pending)
-    matched_entry = None
-    remaining_pending = []
-
-    for entry in pending:
-        entry_normalized = _normalize_repo_path(entry.get("path"))
-        if entry_normalized and entry_normalized.lower() == normalized_target.lower():
-            matched_entry = entry
-        else:
-            remaining_pending.append(entry)
-
-    if not matched_entry:
-        return False
-
-    # Update to completed
-    matched_entry["status"] = "completed"
-    matched_entry["completedUtc"] = datetime.now(timezone.utc).isoformat()
-    # Remove task tracking fields
-    matched_entry.pop("taskId", None)
-    matched_entry.pop("submittedUtc", None)
-
-    completed.append(matched_entry)
-
-    queue_data["pending"] = remaining_pending
-    queue_data["completed"] = completed
-    queue_data["lastUpdatedUtc"] = datetime.now(timezone.utc).isoformat()
-
-    try:
-        with open(queue_path, "w", encoding="utf-8") as f:
-            json.dump(queue_data, f, indent=2)
-        return True
-    except OSError:  # pragma: no cover
+        with ReviewQueue.locked(queue_path) as queue:
+            entry = queue.find(file_path)
+            if entry is None:
+                return False
+            queue.complete(entry)
+    except (json.JSONDecodeError, OSError, FileLockError):  # pragma: no cover
         return False
+    return True
 
 
 def update_submission_to_failed(
@@ -225,34 +171,15 @@ def update_submission_to_failed(
         return False
 
     try:
-        with open(queue_path, encoding="utf-8") as f:
-            queue_data = json.load(f)
-    except (json.JSONDecodeError, OSError):  # pragma: no cover
-        return False
-
-    normalized_target = _normalize_repo_path(file_path)
-    if not normalized_target:  # pragma: no cover
-        return False
-
-    pending = queue_data.get("pending", [])
-
-    # Find and update matching entry
-    for entry in pending:
-        entry_normalized = _normalize_repo_path(entry.get("path"))
-        if entry_normalized and entry_normalized.lower() == normalized_target.lower():
-            entry["status"] = "failed"
-            entry["failedUtc"] = datetime.now(timezone.utc).isoformat()
-            entry["errorMessage"] = error_message
-            break
-
-    queue_data["lastUpdatedUtc"] = datetime.now(timezone.utc).isoformat()
-
-    try:
-        with open(queue_path, "w", encoding="utf-8") as f:
-            json.dump(queue_data, f, indent=2)
-        return True
-    except OSError:  # pragma: no cover
+        with ReviewQueue.locked(queue_path) as queue:
+            entry = queue.find(file_path)
+            if entry is not None:
+                queue.mark_failed(entry, error_message)
+            else:
+                queue.touch()
+    except (json.JSONDecodeError, OSError, FileLockError):  # pragma: no cover
         return False
+    return True
 
 
 def get_failed_submissions(pull_request_id: int) -> list[dict]:
@@ -265,19 +192,8 @@ def get_failed_submissions(pull_request_id: int) -> list[dict]:
     Returns:
         List of failed queue entries with file path and error info
     """
-    queue_path = _get_queue_path(pull_request_id)
-
-    if not queue_path.exists():
-        return []
-
-    try:
-        with open(queue_path, encoding="utf-8") as f:
-            queue_data = json.load(f)
-    except (json.JSONDecodeError, OSError):  # pragma: no cover
-        return []
-
-    pending = queue_data.get("pending", [])
-    return [entry for entry in pending if entry.get("status") == "failed"]
+    queue = _load_queue(pull_request_id)
+    return queue.entries_with_status(STATUS_FAILED) if queue else []
 
 
 def reset_failed_submission(pull_request_id: int, file_path: str) -> bool:
@@ -297,39 +213,42 @@ def reset_failed_submission(pull_request_id: int, file_path: str) -> bool:
         return False
 
     try:
-        with open(queue_path, encoding="utf-8") as f:
-            queue_data = json.load(f)
-    except (json.JSONDecodeError, OSError):  # pragma: no cover
+        with ReviewQueue.locked(queue_path) as queue:
+            entry = queue.find(file_path)
+            if entry is not None and entry.get("status") == STATUS_FAILED:
+                queue.reset(entry)
+            else:
+                queue.touch()
+    except (json.JSONDecodeError, OSError, FileLockError):  # pragma: no cover
         return False
+    return True
 
-    normalized_target = _normalize_repo_path(file_path)
-    if not normalized_target:  # pragma: no cover
-        return False
 
-    pending = queue_data.get("pending", [])
+def _sync_queue_with_tasks(queue: ReviewQueue) -> None:
+    """Settle a queue's submission-pending entries whose background task has finished."""
+    from ...task_state import TaskStatus, get_tasks_by_ids
 
-    # Find and reset matching failed entry
-    for entry in pending:
-        entry_normalized = _normalize_repo_path(entry.get("path"))
-        if entry_normalized and entry_normalized.lower() == normalized_target.lower():
-            if entry.get("status") == "failed":
-                entry["status"] = "pending"
-                # Remove failure tracking fields
-                entry.pop("taskId", None)
-                entry.pop("submittedUtc", None)
-                entry.pop("failedUtc", None)
-                entry.pop("errorMessage", None)
-                entry.pop("outcome", None)
-                break
+    submitting = queue.entries_with_status(STATUS_SUBMISSION_PENDING)
+    if not submitting:
+        return
+    tasks = get_tasks_by_ids(entry["taskId"] for entry in submitting if entry.get("taskId"))
 
-    queue_data["lastUpdatedUtc"] = datetime.now(timezone.utc).isoformat()
+    for entry in submitting:
+        task_id = entry.get("taskId")
+        if not task_id:  # pragma: no cover
+            continue
 
-    try:
-        with open(queue_path, "w", encoding="utf-8") as f:
-            json.dump(queue_data, f, indent=2)
-        return True
-    except OSError:  # pragma: no cover
-        return False
+        task = tasks.get(task_id)
+        if not task:
+            # Task not found - mark as failed
+            queue.mark_failed(entry, "Background task not found")
+        elif task.status == TaskStatus.COMPLETED:
+            # Task completed successfully - move to completed
+            queue.complete(entry)
+        elif task.status == TaskStatus.FAILED:
+            # Task failed - mark entry as failed
+            queue.mark_failed(entry, task.error_message or f"Task failed with exit code {task.exit_code}")
+        # If task is pending or running, leave entry unchanged
 
 
 def sync_submission_pending_with_tasks(pull_request_id: int) -> None:
@@ -341,78 +260,39 @@ def sync_submission_pending_with_tasks(pull_request_id: int) -> None:
     - If task failed: marks entry as failed with error message
     - If task still running: leaves entry unchanged
 
-    Called at the start of print_next_file_prompt() to ensure queue state
-    is accurate before showing the next file.
-
     Args:
         pull_request_id: PR ID
     """
-    from ...task_state import TaskStatus, get_task_by_id
+    _load_synced_queue(pull_request_id)
 
-    queue_path = _get_queue_path(pull_request_id)
 
+def _load_queue(pull_request_id: int) -> Optional[ReviewQueue]:
+    """Read a PR's review queue, or None if it is missing or unreadable."""
+    queue_path = _get_queue_path(pull_request_id)
     if not queue_path.exists():
-        return
-
+        return None
     try:
-        with open(queue_path, encoding="utf-8") as f:
-            queue_data = json.load(f)
+        return ReviewQueue.load(queue_path)
     except (json.JSONDecodeError, OSError):  # pragma: no cover
-        return
-
-    pending = queue_data.get("pending", [])
-    completed = queue_data.get("completed", [])
-    modified = False
-
-    # Process submission-pending entries
-    entries_to_complete = []
-    for entry in pending:
-        if entry.get("status") != "submission-pending":
-            continue
+        return None
 
-        task_id = entry.get("taskId")
-        if not task_id:  # pragma: no cover
-            continue
 
-        task = get_task_by_id(task_id)
-        if not task:
-            # Task not found - mark as failed
-            entry["status"] = "failed"
-            entry["failedUtc"] = datetime.now(timezone.utc).isoformat()
-            entry["errorMessage"] = "Background task not found"
-            modified = True
-        elif task.status == TaskStatus.COMPLETED:
-            # Task completed successfully - move to completed
-            entries_to_complete.append(entry)
-            modified = True
-        elif task.status == TaskStatus.FAILED:
-            # Task failed - mark entry as failed
-            entry["status"] = "failed"
-            entry["failedUtc"] = datetime.now(timezone.utc).isoformat()
-            error_msg = task.error_message or f"Task failed with exit code {task.exit_code}"
-            entry["errorMessage"] = error_msg
-            modified = True
-        # If task is pending or running, leave entry unchanged
+def _load_synced_queue(pull_request_id: int) -> Optional[ReviewQueue]:
+    """
+    Read a PR's review queue, syncing submission-pending entries with their tasks.
 
-    # Move completed entries to completed list
-    for entry in entries_to_complete:
-        pending.remove(entry)
-        entry["status"] = "completed"
-        entry["completedUtc"] = datetime.now(timezone.utc).isoformat()
-        # Clean up task tracking fields
-        entry.pop("taskId", None)
-        entry.pop("submittedUtc", None)
-        entry.pop("failedUtc", None)
-        entry.pop("errorMessage", None)
-        completed.append(entry)
-
-    if modified:
-        queue_data["lastUpdatedUtc"] = datetime.now(timezone.utc).isoformat()
-        try:
-            with open(queue_path, "w", encoding="utf-8") as f:
-                json.dump(queue_data, f, indent=2)
-        except OSError:  # pragma: no cover
-            pass
+    Returns:
+        The synced queue, or None if it is missing or unreadable
+    """
+    queue_path = _get_queue_path(pull_request_id)
+    if not queue_path.exists():
+        return None
+    try:
+        with ReviewQueue.locked(queue_path) as queue:
+            _sync_queue_with_tasks(queue)
+    except (json.JSONDecodeError, OSError, FileLockError):  # pragma: no cover
+        return None
+    return queue
 
 
 def trigger_in_progress_for_file(
@@ -437,72 +317,93 @@ def trigger_in_progress_for_file(
         file_path: File path to trigger status for
         dry_run: If True, skip API calls and print dry-run messages
     """
+    flush_in_progress_files(pull_request_id, [file_path], dry_run=dry_run)
+
+
+def flush_in_progress_files(
+    pull_request_id: int,
+    file_paths: list[str],
+    dry_run: bool = False,
+) -> None:
+    """
+    Mark a batch of files "In Progress" with one review-state load and save.
+
+    Each file still "unreviewed" gets its summary comment PATCHed; the
+    overall summary is then PATCHed once for the whole batch. Files that
+    are missing from review state or already past "unreviewed" are skipped.
+
+    Args:
+        pull_request_id: PR ID
+        file_paths: Files whose review prompts were served, oldest first
+        dry_run: If True, skip API calls and print dry-run messages
+    """
     from .review_scaffold import _build_pr_base_url
     from .review_state import (
         ReviewStatus,
         load_review_state,
         normalize_file_path,
+        review_state_lock,
         save_review_state,
         update_file_status,
     )
     from .review_templates import render_file_summary
     from .status_cascade import cascade_status_update, execute_cascade
 
-    try:
-        review_state = load_review_state(pull_request_id)
-    except FileNotFoundError:
-        return  # No review state yet; skip
-
-    normalized = normalize_file_path(file_path)
-    file_entry = review_state.files.get(normalized)
-    if file_entry is None:
-        return  # File not in review state; skip
-
-    if file_entry.status != ReviewStatus.UNREVIEWED.value:
-        return  # No-op for non-unreviewed files
-
-    # Update file status to "in-progress"
-    update_file_status(review_state, file_path, ReviewStatus.IN_PROGRESS.value)
-    # Refresh local reference after in-place mutation
-    file_entry = review_state.files[normalized]
+    with review_state_lock(pull_request_id):
+        try:
+            review_state = load_review_state(pull_request_id)
+        except FileNotFoundError:
+            return  # No review state yet; skip
+
+        started = []
+        for file_path in file_paths:
+            file_entry = review_state.files.get(normalize_file_path(file_path))
+            # No-op for files not in review state or no longer unreviewed
+            if file_entry is not None and file_entry.status == ReviewStatus.UNREVIEWED.value:
+                update_file_status(review_state, file_path, ReviewStatus.IN_PROGRESS.value)
+                started.append(file_path)
+        if not started:
+            return
+
+        config = AzureDevOpsConfig.from_state()
+        base_url = _build_pr_base_url(config, pull_request_id)
 
-    config = AzureDevOpsConfig.from_state()
-    base_url = _build_pr_base_url(config, pull_request_id)
+        # Use repoId already stored in review state (set during scaffolding)
+        # to avoid shelling out to `az repos show` on every prompt.
+        repo_id = review_state.repoId
 
-    # Use repoId already stored in review state (set during scaffolding)
-    # to avoid shelling out to `az repos show` on every prompt.
-    repo_id = review_state.repoId
+        if dry_run:
+            requests_module = None
+            auth_headers: dict = {}
+        else:
+            requests_module = require_requests()
+            auth_headers = get_auth_headers(get_pat())
 
-    if dry_run:
-        requests_module = None
-        auth_headers: dict = {}
-    else:
-        requests_module = require_requests()
-        auth_headers = get_auth_headers(get_pat())
-
-    # PATCH file summary comment content; file thread status stays "active" per spec
-    file_content = render_file_summary(file_entry, file_entry.suggestions, base_url)
-    patch_comment(
-        requests_module=requests_module,
-        headers=auth_headers,
-        config=config,
-        repo_id=repo_id,
-        pull_request_id=pull_request_id,
-        thread_id=file_entry.threadId,
-        comment_id=file_entry.commentId,
-        new_content=file_content,
-        dry_run=dry_run,
-    )
+        # PATCH file summary comment content; file thread status stays "active" per spec
+        for file_path in started:
+            file_entry = review_state.files[normalize_file_path(file_path)]
+            file_content = render_file_summary(file_entry, file_entry.suggestions, base_url)
+            patch_comment(
+                requests_module=requests_module,
+                headers=auth_headers,
+                config=config,
+                repo_id=repo_id,
+                pull_request_id=pull_request_id,
+                thread_id=file_entry.threadId,
+                comment_id=file_entry.commentId,
+                new_content=file_content,
+                dry_run=dry_run,
+            )
 
-    # Cascade folder and overall summary updates. Persist the updated
-    # review_state even if downstream cascade execution fails, so the
-    # local state reflects the already-PATCHed file comment.
-    try:
-        ops = cascade_status_update(review_state, file_path, base_url)
-        execute_cascade(ops, requests_module, auth_headers, config, repo_id, pull_request_id, dry_run=dry_run)
-    finally:
-        if not dry_run:
-            save_review_state(review_state)
+        # Cascade the overall summary once for the batch. Persist the updated
+        # review_state even if downstream cascade execution fails, so the
+        # local state reflects the already-PATCHed file comments.
+        try:
+            ops = cascade_status_update(review_state, started[-1], base_url)
+            execute_cascade(ops, requests_module, auth_headers, config, repo_id, pull_request_id, dry_run=dry_run)
+        finally:
+            if not dry_run:
+                save_review_state(review_state)
 
 
 def print_next_file_prompt(pull_request_id: int) -> None:
@@ -516,11 +417,12 @@ def print_next_file_prompt(pull_request_id: int) -> None:
     Args:
         pull_request_id: PR ID
     """
-    # Sync submission-pending entries with background task status
-    sync_submission_pending_with_tasks(pull_request_id)
+    # One read of the queue, synced with background task status, answers
+    # every question below
+    queue = _load_synced_queue(pull_request_id)
 
     # Check for failed submissions first
-    failed = get_failed_submissions(pull_request_id)
+    failed = queue.entries_with_status(STATUS_FAILED) if queue else []
     if failed:
         print("")
         print("=" * 60)
@@ -544,16 +446,21 @@ def print_next_file_prompt(pull_request_id: int) -> None:
         return
 
     # Get queue status
-    status = get_queue_status(pull_request_id)
+    status = _queue_status(pull_request_id, queue)
 
-    # Trigger "In Progress" when serving the next file's prompt
+    # Trigger "In Progress" when serving the next file's prompt. The PATCHes
+    # are queued for the background outbox drainer so the prompt is printed
+    # without waiting on Azure DevOps (dry runs apply them inline to print them).
     if not status["all_complete"] and status["current_file"]:
         try:
-            trigger_in_progress_for_file(
-                pull_request_id=pull_request_id,
-                file_path=status["current_file"],
-                dry_run=is_dry_run(),
-            )
+            if is_dry_run():
+                trigger_in_progress_for_file(
+                    pull_request_id=pull_request_id,
+                    file_path=status["current_file"],
+                    dry_run=True,
+                )
+            else:
+                queue_in_progress_update(pull_request_id, status["current_file"])
         except Exception as e:
             print(f"Warning: Could not trigger in-progress status: {e}", file=sys.stderr)
 
@@ -586,21 +493,8 @@ def print_next_file_prompt(pull_request_id: int) -> None:
             print("")
             print("This will advance the workflow to the decision step.")
     else:
-        # Count submission-pending files
-        queue_path = _get_queue_path(pull_request_id)
-        submission_pending_count = 0
-        if queue_path.exists():
-            try:
-                with open(queue_path, encoding="utf-8") as f:
-                    queue_data = json.load(f)
-                submission_pending_count = sum(
-                    1 for entry in queue_data.get("pending", []) if entry.get("status") == "submission-pending"
-                )
-            except (json.JSONDecodeError, OSError):  # pragma: no cover
-                pass
-
-        pending_count = status["pending_count"] - submission_pending_count
-        print(f"QUEUE STATUS: {status['completed_count']} completed, {pending_count} pending", end="")
+        submission_pending_count = status["submission_pending_count"]
+        print(f"QUEUE STATUS: {status['completed_count']} completed, {status['pending_count']} pending", end="")
         if submission_pending_count > 0:  # pragma: no cover
             print(f", {submission_pending_count} submitting")
         else:
@@ -639,70 +533,62 @@ def _update_queue_after_review(
     Returns:
         Tuple of (pending_count, completed_count) after update
     """
-    queue_path = _get_queue_path(pull_request_id)
-
-    if not queue_path.exists():
-        print(f"Queue file not found at {queue_path}; skipping queue update.")
-        return 0, 0
+    return _update_queue_after_reviews(pull_request_id, [file_path], outcome, dry_run=dry_run)
 
-    try:
-        with open(queue_path, encoding="utf-8") as f:
-            queue_data = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:  # pragma: no cover
-        print(f"Warning: Failed to read queue file: {e}")
-        return 0, 0
 
-    normalized_target = _normalize_repo_path(file_path)
-    if not normalized_target:  # pragma: no cover
-        return len(queue_data.get("pending", [])), len(queue_data.get("completed", []))
-
-    pending = queue_data.get("pending", [])
-    completed = queue_data.get("completed", [])
+def _update_queue_after_reviews(
+    pull_request_id: int,
+    file_paths: list[str],
+    outcome: str,
+    dry_run: bool = False,
+) -> tuple[int, int]:
+    """
+    Move several reviewed files to completed with one queue update.
 
-    # Find matching entry in pending (handles both "pending" and "submission-pending" status)
-    matched_entry = None
-    remaining_pending = []
+    Args:
+        pull_request_id: PR ID
+        file_paths: Paths of reviewed files
+        outcome: Review outcome ('Approve', 'Changes', 'Suggest')
+        dry_run: If True, only print what would be done
 
-    for entry in pending:
-        entry_normalized = _normalize_repo_path(entry.get("path"))
-        if entry_normalized and entry_normalized.lower() == normalized_target.lower():
-            matched_entry = entry
-        else:
-            remaining_pending.append(entry)
+    Returns:
+        Tuple of (pending_count, completed_count) after update
+    """
+    queue_path = _get_queue_path(pull_request_id)
 
-    if not matched_entry:  # pragma: no cover
-        print(f"File '{file_path}' not found in pending queue.")
-        return len(pending), len(completed)
+    if not queue_path.exists():
+        print(f"Queue file not found at {queue_path}; skipping queue update.")
+        return 0, 0
 
     if dry_run:
-        print(f"DRY-RUN: Would move '{file_path}' from pending to completed.")
-        return len(pending) - 1, len(completed) + 1
-
-    # Update the entry - clean up any submission tracking fields
-    matched_entry["status"] = "completed"
-    matched_entry["outcome"] = outcome
-    matched_entry["completedUtc"] = datetime.now(timezone.utc).isoformat()
-
-    # Remove submission tracking fields if present
-    matched_entry.pop("taskId", None)
-    matched_entry.pop("submittedUtc", None)
-    matched_entry.pop("failedUtc", None)
-    matched_entry.pop("errorMessage", None)
-
-    completed.append(matched_entry)
-
-    # Update queue data
-    queue_data["pending"] = remaining_pending
-    queue_data["completed"] = completed
-    queue_data["lastUpdatedUtc"] = datetime.now(timezone.utc).isoformat()
+        try:
+            queue = ReviewQueue.load(queue_path)
+        except (json.JSONDecodeError, OSError) as e:  # pragma: no cover
+            print(f"Warning: Failed to read queue file: {e}")
+            return 0, 0
+        moved = 0
+        for file_path in file_paths:
+            if queue.find(file_path) is None:  # pragma: no cover
+                print(f"File '{file_path}' not found in pending queue.")
+                continue
+            print(f"DRY-RUN: Would move '{file_path}' from pending to completed.")
+            moved += 1
+        return len(queue.pending) - moved, len(queue.completed) + moved
 
     try:
-        with open(queue_path, "w", encoding="utf-8") as f:
-            json.dump(queue_data, f, indent=2)
-    except OSError as e:  # pragma: no cover
-        print(f"Warning: Failed to write queue file: {e}")
+        with ReviewQueue.locked(queue_path) as queue:
+            for file_path in file_paths:
+                # Matches both "pending" and "submission-pending" entries
+                entry = queue.find(file_path)
+                if entry is None:  # pragma: no cover
+                    print(f"File '{file_path}' not found in pending queue.")
+                else:
+                    queue.complete(entry, outcome)
+    except (json.JSONDecodeError, OSError, FileLockError) as e:  # pragma: no cover
+        print(f"Warning: Failed to update queue file: {e}")
+        return 0, 0
 
-    return len(remaining_pending), len(completed)
+    return len(queue.pending), len(queue.completed)
 
 
 def _trigger_workflow_continuation(
@@ -770,8 +656,11 @@ def get_queue_status(pull_request_id: int) -> dict:
         - prompt_file_path: Full path to the current file's prompt (or None)
         - all_complete: True if all files have been reviewed
     """
-    queue_path = _get_queue_path(pull_request_id)
+    return _queue_status(pull_request_id, _load_queue(pull_request_id))
+
 
+def _queue_status(pull_request_id: int, queue: Optional[ReviewQueue]) -> dict:
+    """Build the get_queue_status dictionary from an already loaded queue."""
     result = {
         "pull_request_id": pull_request_id,
         "completed_count": 0,
@@ -784,47 +673,23 @@ def get_queue_status(pull_request_id: int) -> dict:
         "all_complete": False,
     }
 
-    if not queue_path.exists():
+    if queue is None:
         return result
 
-    try:
-        with open(queue_path, encoding="utf-8") as f:
-            queue_data = json.load(f)
-    except (json.JSONDecodeError, OSError):  # pragma: no cover
-        return result
-
-    pending = queue_data.get("pending", [])
-    completed = queue_data.get("completed", [])
-
-    # Categorize pending items by status
-    truly_pending = []
-    submission_pending = []
-    failed = []
-
-    for entry in pending:
-        status = entry.get("status", "pending")
-        if status == "submission-pending":
-            submission_pending.append(entry)
-        elif status == "failed":
-            failed.append(entry)
-        else:
-            truly_pending.append(entry)
-
-    result["pending_count"] = len(truly_pending)
-    result["submission_pending_count"] = len(submission_pending)
-    result["failed_count"] = len(failed)
-    result["completed_count"] = len(completed)
-    result["total_count"] = len(pending) + len(completed)
+    result["pending_count"] = queue.count(STATUS_PENDING)
+    result["submission_pending_count"] = queue.count(STATUS_SUBMISSION_PENDING)
+    result["failed_count"] = queue.count(STATUS_FAILED)
+    result["completed_count"] = queue.count(STATUS_COMPLETED)
+    result["total_count"] = len(queue.pending) + len(queue.completed)
 
     # All complete when no truly pending files remain
     # (submission-pending and failed are handled separately)
-    result["all_complete"] = len(truly_pending) == 0 and len(failed) == 0
+    result["all_complete"] = result["pending_count"] == 0 and result["failed_count"] == 0
 
     # Get the next file to review (skip submission-pending and failed)
-    if truly_pending:
-        next_file = truly_pending[0]
-        file_path = next_file.get("path", "")
-        result["current_file"] = file_path
+    next_file = queue.next_pending()
+    if next_file is not None:
+        result["current_file"] = next_file.get("path", "")
 
         # Use the prompt path from the queue item (already computed during prompt generation)
         prompt_path = next_file.get("promptPath", "")
@@ -846,72 +711,54 @@ def _resolve_file_threads(
     """
     Resolve (close) all active threads for a specific file.
 
+    The PR's threads come from the cached thread index (revalidated with
+    its ETag) and the matching threads are closed concurrently.
+
     Returns:
         Number of threads resolved.
     """
-    normalized_target = _normalize_repo_path(target_path)
+    from .thread_status import load_thread_index, save_thread_index, update_thread_statuses
+
+    normalized_target = normalize_repo_path(target_path)
     if not normalized_target:
         return 0
 
-    project_encoded = config.project.replace(" ", "%20")
-    threads_url = (
-        f"{config.organization}/{project_encoded}/_apis/git/repositories/{repo_id}"
-        f"/pullRequests/{pull_request_id}/threads?api-version=7.1-preview.1"
-    )
-
+    threads_url = config.build_api_url(repo_id, "pullRequests", pull_request_id, "threads")
+    session = create_pooled_session(requests)
     try:
-        response = requests.get(threads_url, headers=headers, timeout=30)
-        response.raise_for_status()
-        threads_data = response.json()
-    except Exception as e:
-        print(f"Warning: Failed to retrieve threads: {e}", file=sys.stderr)
-        return 0
-
-    thread_items = threads_data.get("value", [])
-    matching = []
+        try:
+            index = load_thread_index(session, headers, threads_url, pull_request_id)
+        except Exception as e:
+            print(f"Warning: Failed to retrieve threads: {e}", file=sys.stderr)
+            return 0
 
-    for thread in thread_items:
-        status = thread.get("status")
-        if status not in ("active", "pending"):
-            continue
+        thread_ids = [thread["id"] for thread in index.for_file(normalized_target)]
+        if not thread_ids:
+            print(f"No unresolved comment threads to resolve for '{target_path}'.")
+            return 0
 
-        thread_path = _get_thread_file_path(thread)
-        if not thread_path:  # pragma: no cover
-            continue
+        print(f"Resolving {len(thread_ids)} thread(s) for '{target_path}'...")
 
-        normalized_thread = _normalize_repo_path(thread_path)
-        if normalized_thread and normalized_thread.lower() == normalized_target.lower():
-            matching.append(thread)
-
-    if not matching:
-        print(f"No unresolved comment threads to resolve for '{target_path}'.")
-        return 0
+        if dry_run:
+            for thread_id in thread_ids:
+                print(f"DRY-RUN: Would resolve thread {thread_id} for {target_path}")
+            return len(thread_ids)
 
-    print(f"Resolving {len(matching)} thread(s) for '{target_path}'...")
+        results = update_thread_statuses(session, headers, config, repo_id, pull_request_id, thread_ids, "closed")
+    finally:
+        session.close()
 
     resolved_count = 0
-    for thread in matching:
-        thread_id = thread.get("id")
-        if not thread_id:  # pragma: no cover
-            continue
-
-        if dry_run:
-            print(f"DRY-RUN: Would resolve thread {thread_id} for {target_path}")
+    for result in results:
+        if result.ok:
+            index.set_status(result.thread_id, result.status)
             resolved_count += 1
-            continue
-
-        resolve_url = (
-            f"{config.organization}/{project_encoded}/_apis/git/repositories/{repo_id}"
-            f"/pullRequests/{pull_request_id}/threads/{thread_id}?api-version=7.1-preview.1"
-        )
-        try:
-            resp = requests.patch(resolve_url, headers=headers, json={"status": "closed"}, timeout=30)
-            resp.raise_for_status()
-            resolved_count += 1
-        except Exception as e:
-            print(f"Failed to resolve thread {thread_id}: {e}", file=sys.stderr)
+        else:
+            print(f"Failed to resolve thread {result.thread_id}: {result.error}", file=sys.stderr)
 
-    if not dry_run and resolved_count > 0:
+    if index.etag:
+        save_thread_index(pull_request_id, index)
+    if resolved_count > 0:
         print(f"Comment threads for '{target_path}' resolved.")
 
     return resolved_count
@@ -993,93 +840,95 @@ def approve_file() -> None:  # pragma: no cover
             clear_suggestions_for_re_review,
             load_review_state,
             normalize_file_path,
+            review_state_lock,
             save_review_state,
             update_file_status,
         )
         from .review_templates import render_file_summary
         from .status_cascade import cascade_status_update, execute_cascade
 
-        review_state = load_review_state(pull_request_id)
-        base_url = _build_pr_base_url(config, pull_request_id)
+        with review_state_lock(pull_request_id):
+            review_state = load_review_state(pull_request_id)
+            base_url = _build_pr_base_url(config, pull_request_id)
 
-        # Use repoId already stored in review state (set during scaffolding)
-        # to avoid shelling out to `az repos show` on every approval.
-        repo_id = review_state.repoId
+            # Use repoId already stored in review state (set during scaffolding)
+            # to avoid shelling out to `az repos show` on every approval.
+            repo_id = review_state.repoId
 
-        # Re-review detection: if the file already has a terminal status and
-        # previousSuggestions hasn't been set yet, this is a fresh re-review.
-        # Rotate old suggestions to the audit trail before approving.
-        normalized = normalize_file_path(file_path)
-        try:
-            clear_suggestions_for_re_review(review_state, file_path)
-        except KeyError:
-            pass  # handled by the KeyError catch on update_file_status below
-
-        # Update file status to Approved with summary text
-        try:
-            update_file_status(review_state, file_path, ReviewStatus.APPROVED.value, summary=summary)
-            file_entry = review_state.files[normalized]
-        except KeyError:
-            print(
-                f"Error: File {file_path!r} is not present in review-state.json "
-                f"for pull request {pull_request_id}. "
-                "Regenerate the review state (for example by re-running the review command) "
-                "before using this file-level command.",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-
-        # PATCH file summary comment with regenerated markdown
-        file_content = render_file_summary(file_entry, [], base_url)
-        patch_comment(
-            requests_module=requests,
-            headers=headers,
-            config=config,
-            repo_id=repo_id,
-            pull_request_id=pull_request_id,
-            thread_id=file_entry.threadId,
-            comment_id=file_entry.commentId,
-            new_content=file_content,
-            dry_run=dry_run,
-        )
+            # Re-review detection: if the file already has a terminal status and
+            # previousSuggestions hasn't been set yet, this is a fresh re-review.
+            # Rotate old suggestions to the audit trail before approving.
+            normalized = normalize_file_path(file_path)
+            try:
+                clear_suggestions_for_re_review(review_state, file_path)
+            except KeyError:
+                pass  # handled by the KeyError catch on update_file_status below
 
-        # PATCH file thread status to closed
-        patch_thread_status(
-            requests_module=requests,
-            headers=headers,
-            config=config,
-            repo_id=repo_id,
-            pull_request_id=pull_request_id,
-            thread_id=file_entry.threadId,
-            status="closed",
-            dry_run=dry_run,
-        )
+            # Update file status to Approved with summary text
+            try:
+                update_file_status(review_state, file_path, ReviewStatus.APPROVED.value, summary=summary)
+                file_entry = review_state.files[normalized]
+            except KeyError:
+                print(
+                    f"Error: File {file_path!r} is not present in review-state.json "
+                    f"for pull request {pull_request_id}. "
+                    "Regenerate the review state (for example by re-running the review command) "
+                    "before using this file-level command.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
 
-        # Mark file as reviewed in Azure DevOps
-        mark_file_reviewed(
-            file_path=file_path,
-            pull_request_id=pull_request_id,
-            config=config,
-            repo_id=repo_id,
-            dry_run=dry_run,
-        )
+            # PATCH file summary comment with regenerated markdown
+            file_content = render_file_summary(file_entry, [], base_url)
+            patch_comment(
+                requests_module=requests,
+                headers=headers,
+                config=config,
+                repo_id=repo_id,
+                pull_request_id=pull_request_id,
+                thread_id=file_entry.threadId,
+                comment_id=file_entry.commentId,
+                new_content=file_content,
+                dry_run=dry_run,
+            )
 
-        # Cascade folder and overall summary updates. Persist the updated
-        # review_state even if downstream cascade execution fails, so the
-        # local state reflects the already-PATCHed file comment.
-        try:
-            patch_operations = cascade_status_update(review_state, file_path, base_url)
-            execute_cascade(
-                patch_operations=patch_operations,
+            # PATCH file thread status to closed
+            patch_thread_status(
                 requests_module=requests,
                 headers=headers,
                 config=config,
                 repo_id=repo_id,
                 pull_request_id=pull_request_id,
+                thread_id=file_entry.threadId,
+                status="closed",
+                dry_run=dry_run,
+            )
+
+            # Mark file as reviewed in Azure DevOps
+            mark_file_reviewed(
+                file_path=file_path,
+                pull_request_id=pull_request_id,
+                config=config,
+                repo_id=repo_id,
                 dry_run=dry_run,
             )
-        finally:
-            save_review_state(review_state)
+
+            # Cascade folder and overall summary updates. Persist the updated
+            # review_state even if downstream cascade execution fails, so the
+            # local state reflects the already-PATCHed file comment.
+            try:
+                patch_operations = cascade_status_update(review_state, file_path, base_url)
+                execute_cascade(
+                    patch_operations=patch_operations,
+                    requests_module=requests,
+                    headers=headers,
+                    config=config,
+                    repo_id=repo_id,
+                    pull_request_id=pull_request_id,
+                    dry_run=dry_run,
+                )
+            finally:
+                save_review_state(review_state)
 
     except FileNotFoundError:
         # Legacy fallback: create new thread (no review-state.json available)
@@ -1124,6 +973,239 @@ def approve_file() -> None:  # pragma: no cover
     _trigger_workflow_continuation(pull_request_id, pending_count, completed_count)
 
 
+def parse_file_paths(value) -> list[str]:
+    """
+    Split a ``file_review.file_paths`` value into paths and glob patterns.
+
+    Accepts a list, or a string with one path per line or comma-separated.
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.replace(",", "\n").splitlines()
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+def expand_file_patterns(patterns: list[str], known_paths) -> tuple[list[str], list[str]]:
+    """
+    Resolve file paths and glob patterns against the files under review.
+
+    Matching is case-insensitive on normalized repository paths, so
+    ``src/gen/*`` and ``/src/gen/*`` are equivalent. As with fnmatch,
+    ``*`` also matches ``/``.
+
+    Args:
+        patterns: File paths and/or glob patterns
+        known_paths: Normalized paths of the files under review
+
+    Returns:
+        Tuple of (matched paths without duplicates, patterns that matched nothing)
+    """
+    from .review_state import normalize_file_path
+
+    by_key = {path.lower(): path for path in sorted(known_paths)}
+    matched: dict[str, None] = {}
+    unmatched: list[str] = []
+    for pattern in patterns:
+        key = normalize_file_path(pattern).lower()
+        if any(char in key for char in "*?["):
+            hits = [path for path_key, path in by_key.items() if fnmatch.fnmatchcase(path_key, key)]
+        else:
+            hits = [by_key[key]] if key in by_key else []
+        if not hits:
+            unmatched.append(pattern)
+        matched.update(dict.fromkeys(hits))
+    return list(matched), unmatched
+
+
+def _close_approved_file_threads(
+    requests_module,
+    headers: dict,
+    config: AzureDevOpsConfig,
+    repo_id: str,
+    pull_request_id: int,
+    review_state,
+    file_paths: list[str],
+    base_url: str,
+) -> dict[str, Exception]:
+    """
+    PATCH the summary comment and close the thread of each approved file.
+
+    Files are PATCHed concurrently over one pooled session; the two PATCHes
+    of a file run in order.
+
+    Returns:
+        Errors keyed by file path, for files whose PATCHes failed
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .review_templates import render_file_summary
+
+    # Render up front: the template fragment cache is not thread-safe
+    contents = {path: render_file_summary(review_state.files[path], [], base_url) for path in file_paths}
+
+    def _close(path: str) -> None:
+        file_entry = review_state.files[path]
+        patch_comment(
+            requests_module=session,
+            headers=headers,
+            config=config,
+            repo_id=repo_id,
+            pull_request_id=pull_request_id,
+            thread_id=file_entry.threadId,
+            comment_id=file_entry.commentId,
+            new_content=contents[path],
+        )
+        patch_thread_status(
+            requests_module=session,
+            headers=headers,
+            config=config,
+            repo_id=repo_id,
+            pull_request_id=pull_request_id,
+            thread_id=file_entry.threadId,
+            status="closed",
+        )
+
+    errors: dict[str, Exception] = {}
+    session = create_pooled_session(requests_module)
+    try:
+        with ThreadPoolExecutor(max_workers=min(DEFAULT_MAX_WORKERS, len(file_paths)) or 1) as executor:
+            futures = {path: executor.submit(_close, path) for path in file_paths}
+            for path, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[path] = e
+    finally:
+        session.close()
+    return errors
+
+
+def approve_files() -> None:
+    """
+    Approve many files in a pull request review at once.
+
+    Meant for large sets of trivial files (generated code, lockfiles,
+    renames) that share one approval summary. Compared to running
+    approve_file per file, review-state.json is loaded and saved once,
+    file threads are PATCHed concurrently, the reviewer entry is updated
+    once for all files, and the overall summary is cascaded and the queue
+    updated once at the end.
+
+    A file whose PATCHes fail keeps its previous review state and stays in
+    the queue; the command then exits with an error after approving the rest.
+
+    State keys read:
+        - pull_request_id (required): Pull request ID
+        - file_review.file_paths (required): File paths and/or glob patterns
+          (a list, or a newline- or comma-separated string)
+        - file_review.summary (required): Approval summary shared by all files
+        - dry_run: If true, only print what would be done
+
+    Raises:
+        SystemExit: On validation or execution errors.
+    """
+    from .review_scaffold import _build_pr_base_url
+    from .review_state import (
+        ReviewStatus,
+        clear_suggestions_for_re_review,
+        load_review_state,
+        review_state_lock,
+        save_review_state,
+        update_file_status,
+    )
+    from .status_cascade import cascade_status_update, execute_cascade
+
+    config = AzureDevOpsConfig.from_state()
+    dry_run = is_dry_run()
+    pull_request_id = get_pull_request_id(required=True)
+
+    patterns = parse_file_paths(get_value("file_review.file_paths"))
+    if not patterns:
+        print("Error: 'file_review.file_paths' is required.", file=sys.stderr)
+        print("Set it with: agdt-set file_review.file_paths '<path or glob>, <path or glob>'", file=sys.stderr)
+        sys.exit(1)
+
+    summary = get_value("file_review.summary")
+    if not summary:
+        print("Error: 'file_review.summary' is required for approval.", file=sys.stderr)
+        print("Set it with: agdt-set file_review.summary '<approval summary>'", file=sys.stderr)
+        sys.exit(1)
+
+    with review_state_lock(pull_request_id):
+        try:
+            review_state = load_review_state(pull_request_id)
+        except FileNotFoundError:
+            print(
+                f"Error: No review-state.json found for pull request {pull_request_id}. "
+                "Batch approval needs a scaffolded review; use agdt-approve-file for each file instead.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        file_paths, unmatched = expand_file_patterns(patterns, review_state.files)
+        if unmatched:
+            print(
+                f"Error: No files in review-state.json match: {', '.join(unmatched)}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        if dry_run:
+            print(f"DRY-RUN: Would approve {len(file_paths)} file(s) on PR {pull_request_id}:")
+            for file_path in file_paths:
+                print(f"  {file_path}")
+            print(f"Summary:\n{summary}")
+            return
+
+        requests = require_requests()
+        headers = get_auth_headers(get_pat())
+        base_url = _build_pr_base_url(config, pull_request_id)
+        repo_id = review_state.repoId
+
+        previous = {}
+        for file_path in file_paths:
+            previous[file_path] = copy.deepcopy(review_state.files[file_path])
+            # Rotate old suggestions to the audit trail when this is a re-review
+            clear_suggestions_for_re_review(review_state, file_path)
+            update_file_status(review_state, file_path, ReviewStatus.APPROVED.value, summary=summary)
+
+        print(f"Approving {len(file_paths)} file(s)...")
+        errors = _close_approved_file_threads(
+            requests, headers, config, repo_id, pull_request_id, review_state, file_paths, base_url
+        )
+        for file_path in errors:
+            review_state.files[file_path] = previous[file_path]
+        approved = [file_path for file_path in file_paths if file_path not in errors]
+
+        # Persist the updated review_state even if downstream calls fail, so the
+        # local state reflects the already-PATCHed file comments.
+        try:
+            if approved:
+                mark_files_reviewed(approved, pull_request_id, config, repo_id)
+                patch_operations = cascade_status_update(review_state, approved[-1], base_url)
+                execute_cascade(
+                    patch_operations=patch_operations,
+                    requests_module=requests,
+                    headers=headers,
+                    config=config,
+                    repo_id=repo_id,
+                    pull_request_id=pull_request_id,
+                )
+        finally:
+            save_review_state(review_state)
+
+    pending_count, completed_count = _update_queue_after_reviews(pull_request_id, approved, "Approve")
+
+    print(f"Approved {len(approved)} of {len(file_paths)} file(s).")
+    if errors:
+        for file_path, error in errors.items():
+            print(f"Error: Failed to approve '{file_path}': {error}", file=sys.stderr)
+        sys.exit(1)
+
+    _trigger_workflow_continuation(pull_request_id, pending_count, completed_count)
+
+
 def submit_file_review() -> None:  # pragma: no cover
     """
     Submit a file review (approve, request changes, or suggest).
@@ -1420,177 +1502,129 @@ def request_changes() -> None:
 
     # Try new PATCH flow (requires review-state.json)
     try:
-        from .helpers import build_thread_context
         from .review_scaffold import _build_pr_base_url
         from .review_state import (
             ReviewStatus,
-            SuggestionEntry,
-            add_suggestion_to_file,
             clear_suggestions_for_re_review,
             load_review_state,
             normalize_file_path,
+            review_state_lock,
             save_review_state,
             update_file_status,
         )
         from .review_templates import render_file_summary
         from .status_cascade import cascade_status_update, execute_cascade
+        from .suggestion_posting import (
+            SuggestionJournal,
+            get_suggestion_journal_path,
+            plan_suggestions,
+            post_suggestion_threads,
+        )
 
-        review_state = load_review_state(pull_request_id)
-        base_url = _build_pr_base_url(config, pull_request_id)
+        with review_state_lock(pull_request_id):
+            review_state = load_review_state(pull_request_id)
+            base_url = _build_pr_base_url(config, pull_request_id)
 
-        # Use repoId already stored in review state (set during scaffolding)
-        repo_id = review_state.repoId
+            # Use repoId already stored in review state (set during scaffolding)
+            repo_id = review_state.repoId
 
-        # Verify file is tracked in review state
-        normalized = normalize_file_path(file_path)
-        if normalized not in review_state.files:
-            print(
-                f"Error: File {file_path!r} is not present in review-state.json "
-                f"for pull request {pull_request_id}. "
-                "Regenerate the review state (for example by re-running the review command) "
-                "before using this file-level command.",
-                file=sys.stderr,
-            )
-            sys.exit(1)
+            # Verify file is tracked in review state
+            normalized = normalize_file_path(file_path)
+            if normalized not in review_state.files:
+                print(
+                    f"Error: File {file_path!r} is not present in review-state.json "
+                    f"for pull request {pull_request_id}. "
+                    "Regenerate the review state (for example by re-running the review command) "
+                    "before using this file-level command.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
 
-        # Re-review detection: if the file already has a terminal status and
-        # previousSuggestions hasn't been set yet, this is the start of a fresh
-        # re-review (not a retry).  Rotate old suggestions to the audit trail
-        # so that new threads aren't wrongly skipped by _already_posted.
-        clear_suggestions_for_re_review(review_state, file_path)
-
-        # Set file status to NEEDS_WORK upfront (preserving existing suggestions
-        # so that threads created by a prior partial run are not lost).
-        # The try/finally below ensures persistence even if a subsequent
-        # POST or PATCH call fails partway through.
-        update_file_status(
-            review_state,
-            file_path,
-            ReviewStatus.NEEDS_WORK.value,
-            summary=summary,
-        )
+            # Re-review detection: if the file already has a terminal status and
+            # previousSuggestions hasn't been set yet, this is the start of a fresh
+            # re-review (not a retry).  Rotate old suggestions to the audit trail
+            # so that new threads aren't wrongly skipped as duplicates.
+            clear_suggestions_for_re_review(review_state, file_path)
 
-        # Snapshot existing suggestions for duplicate detection on retry.
-        existing = review_state.files[normalized].suggestions
-
-        def _already_posted(line, end_line, severity, content, out_of_scope, link_text):
-            """Check if a matching suggestion already exists from a prior run."""
-            for e in existing:
-                if (
-                    e.line == line
-                    and e.endLine == end_line
-                    and e.severity == severity
-                    and e.content == content
-                    and e.outOfScope == out_of_scope
-                    and e.linkText == link_text
-                ):
-                    return True
-            return False
+            # Set file status to NEEDS_WORK upfront (preserving existing suggestions
+            # so that threads created by a prior partial run are not lost).
+            # The try/finally below ensures persistence even if a subsequent
+            # POST or PATCH call fails partway through.
+            update_file_status(
+                review_state,
+                file_path,
+                ReviewStatus.NEEDS_WORK.value,
+                summary=summary,
+            )
 
-        try:
-            # POST a line-anchored thread for each suggestion, persisting
-            # each thread ID incrementally into review_state so that partial
-            # progress is saved even if a later POST fails.
-            # Suggestions already persisted from a prior run are skipped to
-            # make retries idempotent and avoid duplicate Azure DevOps threads.
-            threads_url = config.build_api_url(repo_id, "pullRequests", pull_request_id, "threads")
-            for s in suggestions_data:
-                line = s["line"]
-                end_line = s.get("end_line", line)
-                severity = s["severity"]
-                out_of_scope = s.get("out_of_scope", False)
-                content = s["content"]
-
-                # Build link text: custom > "lines X - Y" > "line X"
-                if s.get("link_text"):
-                    link_text = s["link_text"]
-                elif end_line != line:
-                    link_text = f"lines {line} - {end_line}"
-                else:
-                    link_text = f"line {line}"
+            # Threads journaled by a run that died before saving review state
+            journal = SuggestionJournal(get_suggestion_journal_path(pull_request_id))
+            journal.replay(review_state)
 
-                # Skip suggestions already persisted from a prior (partial) run
-                if _already_posted(line, end_line, severity, content, out_of_scope, link_text):
-                    continue
+            # Suggestions already persisted from a prior (partial) run are
+            # skipped to keep retries idempotent and avoid duplicate threads.
+            pending = plan_suggestions(suggestions_data, review_state.files[normalized].suggestions)
 
-                # Build and POST line-anchored thread
-                thread_context = build_thread_context(normalized, line, end_line)
-                thread_body = {
-                    "comments": [{"content": content, "commentType": "text"}],
-                    "status": "active",
-                    "threadContext": thread_context,
-                }
-                response = requests.post(threads_url, headers=headers, json=thread_body, timeout=30)
-                response.raise_for_status()
-                result = response.json()
-                thread_id = result["id"]
-                comment_id = result["comments"][0]["id"]
-
-                add_suggestion_to_file(
-                    review_state,
-                    file_path,
-                    SuggestionEntry(
-                        threadId=thread_id,
-                        commentId=comment_id,
-                        line=line,
-                        endLine=end_line,
-                        severity=severity,
-                        outOfScope=out_of_scope,
-                        linkText=link_text,
-                        content=content,
-                    ),
+            session = create_pooled_session(requests)
+            try:
+                # POST the line-anchored threads concurrently; each thread ID is
+                # journaled and added to review_state as its POST returns, so
+                # partial progress is kept even if a later POST fails.
+                threads_url = config.build_api_url(repo_id, "pullRequests", pull_request_id, "threads")
+                post_suggestion_threads(session, headers, threads_url, review_state, file_path, pending, journal)
+
+                file_entry = review_state.files[normalized]
+
+                # PATCH file summary comment with regenerated markdown
+                file_content = render_file_summary(file_entry, file_entry.suggestions, base_url)
+                patch_comment(
+                    requests_module=requests,
+                    headers=headers,
+                    config=config,
+                    repo_id=repo_id,
+                    pull_request_id=pull_request_id,
+                    thread_id=file_entry.threadId,
+                    comment_id=file_entry.commentId,
+                    new_content=file_content,
+                    dry_run=dry_run,
                 )
 
-            file_entry = review_state.files[normalized]
-
-            # PATCH file summary comment with regenerated markdown
-            file_content = render_file_summary(file_entry, file_entry.suggestions, base_url)
-            patch_comment(
-                requests_module=requests,
-                headers=headers,
-                config=config,
-                repo_id=repo_id,
-                pull_request_id=pull_request_id,
-                thread_id=file_entry.threadId,
-                comment_id=file_entry.commentId,
-                new_content=file_content,
-                dry_run=dry_run,
-            )
-
-            # PATCH file thread status to "active" (needs work)
-            patch_thread_status(
-                requests_module=requests,
-                headers=headers,
-                config=config,
-                repo_id=repo_id,
-                pull_request_id=pull_request_id,
-                thread_id=file_entry.threadId,
-                status="active",
-                dry_run=dry_run,
-            )
+                # PATCH file thread status to "active" (needs work)
+                patch_thread_status(
+                    requests_module=requests,
+                    headers=headers,
+                    config=config,
+                    repo_id=repo_id,
+                    pull_request_id=pull_request_id,
+                    thread_id=file_entry.threadId,
+                    status="active",
+                    dry_run=dry_run,
+                )
 
-            # Mark file as reviewed in Azure DevOps
-            mark_file_reviewed(
-                file_path=file_path,
-                pull_request_id=pull_request_id,
-                config=config,
-                repo_id=repo_id,
-                dry_run=dry_run,
-            )
+                # Mark file as reviewed in Azure DevOps
+                mark_file_reviewed(
+                    file_path=file_path,
+                    pull_request_id=pull_request_id,
+                    config=config,
+                    repo_id=repo_id,
+                    dry_run=dry_run,
+                )
 
-            # Cascade folder and overall summary updates
-            patch_operations = cascade_status_update(review_state, file_path, base_url)
-            execute_cascade(
-                patch_operations=patch_operations,
-                requests_module=requests,
-                headers=headers,
-                config=config,
-                repo_id=repo_id,
-                pull_request_id=pull_request_id,
-                dry_run=dry_run,
-            )
-        finally:
-            save_review_state(review_state)
+                # Cascade folder and overall summary updates
+                patch_operations = cascade_status_update(review_state, file_path, base_url)
+                execute_cascade(
+                    patch_operations=patch_operations,
+                    requests_module=requests,
+                    headers=headers,
+                    config=config,
+                    repo_id=repo_id,
+                    pull_request_id=pull_request_id,
+                    dry_run=dry_run,
+                )
+            finally:
+                session.close()
+                save_review_state(review_state)
+                journal.clear()
 
     except FileNotFoundError:
         # Legacy fallback: create new threads (no review-state.json available)
@@ -1603,7 +1637,7 @@ def request_changes() -> None:
         threads_url = config.build_api_url(repo_id, "pullRequests", pull_request_id, "threads")
 
         # Post file-level summary comment (no line anchor, but scoped to the file)
-        normalized_path = _normalize_repo_path(file_path)
+        normalized_path = normalize_repo_path(file_path)
         summary_body: dict = {
             "comments": [{"content": summary, "commentType": "text"}],
             "status": "active",
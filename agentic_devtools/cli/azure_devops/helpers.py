@@ -8,6 +8,7 @@ import json
 import re
 import subprocess
 import sys
+import threading
 import time
 from typing import Any, Dict, List, Optional
 
@@ -39,11 +40,14 @@ def parse_bool_from_state_value(raw_value, default: bool = False) -> bool:
 
 
 def require_requests():
-    """Import and return requests module, exiting if not available."""
+    """
+    Import and return requests module, exiting if not available.
+
+    Cacheable Azure DevOps GETs made through the returned module go through
+    the on-disk HTTP cache (see http_cache; AGDT_HTTP_CACHE=0 disables it).
+    """
     try:
         import requests
-
-        return requests
     except ImportError:
         print(
             "Error: requests library required. Install with: pip install requests",
@@ -51,6 +55,10 @@ def require_requests():
         )
         sys.exit(1)
 
+    from .http_cache import wrap_with_http_cache
+
+    return wrap_with_http_cache(requests)
+
 
 def get_repository_id(
     organization: str = DEFAULT_ORGANIZATION,
@@ -114,6 +122,74 @@ def resolve_thread_by_id(
 
 _PATCH_MAX_RETRIES = 3
 
+# Seconds to wait after a throttled response that has no usable Retry-After header
+DEFAULT_RETRY_AFTER_SECONDS = 60
+
+# Status codes Azure DevOps throttles requests with
+THROTTLED_STATUS_CODES = (429, 503)
+
+# Maximum number of requests in flight at once over a pooled session
+DEFAULT_MAX_WORKERS = 4
+
+
+def retry_after_seconds(response, default: int = DEFAULT_RETRY_AFTER_SECONDS) -> int:
+    """
+    Get how long to wait before retrying a throttled (429/503) response.
+
+    Args:
+        response: The HTTP response.
+        default: Seconds to wait if the Retry-After header is missing or
+            isn't a non-negative number of seconds.
+
+    Returns:
+        Seconds to wait.
+    """
+    header_value = response.headers.get("Retry-After")
+    if header_value is None:
+        return default
+    try:
+        parsed = int(header_value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed >= 0 else default
+
+
+class RetryAfterGate:
+    """Shared pause that every worker waits out before sending a request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        """Sleep until any pause requested by a throttled response is over."""
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold all workers for at least ``seconds``."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def create_pooled_session(requests_module, pool_size: int = DEFAULT_MAX_WORKERS):
+    """
+    Create an HTTP session whose connection pool fits ``pool_size`` workers.
+
+    Args:
+        requests_module: The requests module.
+        pool_size: Number of concurrent requests the session must serve.
+
+    Returns:
+        A requests.Session
+    """
+    session = requests_module.Session()
+    adapter = requests_module.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
 
 def patch_comment(
     requests_module,
@@ -152,16 +228,7 @@ def patch_comment(
     for attempt in range(_PATCH_MAX_RETRIES):
         response = requests_module.patch(url, headers=headers, json={"content": new_content}, timeout=30)
         if response.status_code == 429 and attempt < _PATCH_MAX_RETRIES - 1:
-            retry_after_header = response.headers.get("Retry-After")
-            retry_after = 60
-            if retry_after_header is not None:
-                try:
-                    parsed = int(retry_after_header)
-                except (TypeError, ValueError):
-                    parsed = -1
-                if parsed >= 0:
-                    retry_after = parsed
-            time.sleep(retry_after)
+            time.sleep(retry_after_seconds(response))
             continue
         response.raise_for_status()
         return response.json()
@@ -202,16 +269,7 @@ def patch_thread_status(
     for attempt in range(_PATCH_MAX_RETRIES):
         response = requests_module.patch(url, headers=headers, json={"status": status}, timeout=30)
         if response.status_code == 429 and attempt < _PATCH_MAX_RETRIES - 1:
-            header_value = response.headers.get("Retry-After")
-            retry_after = 60
-            if header_value is not None:
-                try:
-                    parsed = int(header_value)
-                except (TypeError, ValueError):
-                    parsed = -1
-                if parsed >= 0:
-                    retry_after = parsed
-            time.sleep(retry_after)
+            time.sleep(retry_after_seconds(response))
             continue
         response.raise_for_status()
         return response.json()
@@ -270,6 +328,39 @@ def build_thread_context(
     return thread_context
 
 
+def get_thread_file_path(thread: dict) -> Optional[str]:
+    """Extract the file path from a thread's context."""
+    context = thread.get("threadContext")
+    if not context:
+        return None
+
+    raw_path = (
+        context.get("filePath")
+        or (context.get("leftFileStart") or {}).get("filePath")
+        or (context.get("rightFileStart") or {}).get("filePath")
+    )
+
+    if not raw_path:  # pragma: no cover
+        return None
+    return raw_path.replace("\\", "/").lstrip("/")
+
+
+def normalize_repo_path(path: Optional[str]) -> Optional[str]:
+    """Normalize a file path to repository format (/path/to/file)."""
+    if not path or not path.strip():
+        return None
+    clean = path.strip().replace("\\", "/").strip("/")
+    if not clean:  # pragma: no cover
+        return None
+    return f"/{clean}"
+
+
+def path_key(path: Optional[str]) -> Optional[str]:
+    """Get the key a file path is indexed under (normalized, case-insensitive)."""
+    normalized = normalize_repo_path(path)
+    return normalized.lower() if normalized else None
+
+
 def verify_az_cli() -> None:
     """Verify Azure CLI and azure-devops extension are installed."""
     try:
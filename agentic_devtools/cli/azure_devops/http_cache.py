@@ -0,0 +1,370 @@
+"""
+On-disk cache for read-heavy Azure DevOps GET requests.
+
+A review session fetches the same PR threads, iterations, iteration changes,
+reviewer entries and connectionData many times over, from several commands
+(pull request details, mark-reviewed, suggestion verification, thread
+resolution). require_requests() wraps the requests module in a
+CachingRequests client so those GETs are served from a cache under
+``<state_dir>/http-cache``:
+
+- Only the endpoints in _CACHEABLE_PATHS are cached. Every other request
+  goes straight to requests. The list of a PR's threads isn't cached here:
+  thread_status keeps its own ETag-validated thread index for it, and one
+  response shouldn't be revalidated by two caches.
+- A GET that already carries a conditional header (``If-None-Match`` etc.)
+  is the caller's own revalidation; it is sent unchanged and not cached.
+- A 200 response is stored with its ``ETag``/``Last-Modified``. Once the
+  entry is older than the TTL, the next GET sends ``If-None-Match`` /
+  ``If-Modified-Since``, and a 304 reuses the stored body.
+- POST/PUT/PATCH/DELETE through the client (or a Session it created) drop
+  the cached entries of the same pull request, so a write is never
+  followed by a stale read.
+- The least recently used entries are evicted beyond the configured size.
+
+Settings (environment variables):
+
+- ``AGDT_HTTP_CACHE``: set to ``0``/``false`` to disable the cache.
+- ``AGDT_HTTP_CACHE_TTL``: seconds an entry is served without revalidation
+  (default 0: always revalidate).
+- ``AGDT_HTTP_CACHE_MAX_ENTRIES``: entries kept on disk (default 256).
+- ``AGDT_HTTP_CACHE_VERBOSE``: print hit/miss/revalidation counts at exit.
+
+A cache that can't be read or written never fails a request; the request
+just goes to the server.
+"""
+
+import atexit
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+HTTP_CACHE_DIRNAME = "http-cache"
+
+DEFAULT_TTL_SECONDS = 0.0
+DEFAULT_MAX_ENTRIES = 256
+
+# Request paths (without the query string) whose GETs are cached. The thread
+# list (``/threads``) is left to thread_status's ETag-validated thread index.
+_CACHEABLE_PATHS = re.compile(
+    r"(/pullRequests/\d+/(threads/\d+|iterations(/\d+/changes)?|reviewers(/[^/]+)?)|/_apis/connectionData)/?$",
+    re.IGNORECASE,
+)
+
+# Request headers that make a GET conditional; such requests bypass the cache
+_CONDITIONAL_HEADERS = frozenset(("if-none-match", "if-modified-since", "if-match", "if-unmodified-since", "if-range"))
+
+# Everything up to the PR ID: writes under it invalidate the PR's cached reads
+_PULL_REQUEST_SCOPE = re.compile(r"^.*?/pullRequests/\d+", re.IGNORECASE)
+
+_DISABLED_VALUES = ("0", "false", "no", "off")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, "")))
+    except ValueError:
+        return default
+
+
+@dataclass
+class HttpCacheSettings:
+    """HTTP cache configuration, read from AGDT_HTTP_CACHE* environment variables."""
+
+    enabled: bool = True
+    ttl_seconds: float = DEFAULT_TTL_SECONDS
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    verbose: bool = False
+
+    @classmethod
+    def from_env(cls) -> "HttpCacheSettings":
+        """Read the settings from the environment."""
+        return cls(
+            enabled=os.environ.get("AGDT_HTTP_CACHE", "").strip().lower() not in _DISABLED_VALUES,
+            ttl_seconds=_env_float("AGDT_HTTP_CACHE_TTL", DEFAULT_TTL_SECONDS),
+            max_entries=int(_env_float("AGDT_HTTP_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            verbose=os.environ.get("AGDT_HTTP_CACHE_VERBOSE", "").strip().lower() in ("1", "true", "yes"),
+        )
+
+
+@dataclass
+class HttpCacheStats:
+    """Counts of how cacheable GETs were answered."""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+
+    def summary(self) -> str:
+        """One-line summary for verbose output."""
+        return f"HTTP cache: {self.hits} hit(s), {self.revalidated} revalidated, {self.misses} miss(es)"
+
+
+def is_cacheable_url(url: str) -> bool:
+    """Check whether GETs of a URL are cached."""
+    return bool(_CACHEABLE_PATHS.search(urlsplit(url).path))
+
+
+def _scope_of(url: str) -> str:
+    """Get the invalidation scope of a URL: its pull request, or else its path."""
+    path = urlsplit(url).path.rstrip("/")
+    match = _PULL_REQUEST_SCOPE.match(path)
+    return (match.group(0) if match else path).lower()
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """Get a response header as a string, or None."""
+    value = headers.get(name) if headers is not None else None
+    return value if isinstance(value, str) and value else None
+
+
+class CachedResponse:
+    """A 200 response served from the cache (the subset of requests.Response callers use)."""
+
+    status_code = 200
+    ok = True
+    from_cache = True
+
+    def __init__(self, url: str, text: str, headers: Dict[str, str]):
+        self.url = url
+        self.text = text
+        self.headers = headers
+
+    @property
+    def content(self) -> bytes:
+        """The response body as bytes."""
+        return self.text.encode("utf-8")
+
+    def json(self) -> Any:
+        """Parse the response body as JSON."""
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        """Cached responses are always successful."""
+
+
+class HttpCache:
+    """Cached GET responses, one JSON file per URL and credential."""
+
+    def __init__(self, directory: Path, settings: HttpCacheSettings):
+        self.directory = directory
+        self.settings = settings
+        self.stats = HttpCacheStats()
+        self._lock = threading.Lock()
+
+    def _entry_path(self, url: str, headers: Dict[str, str]) -> Path:
+        # The credential is part of the key: one user's response is never served to another
+        key = _digest("\n".join((url, headers.get("Authorization", ""), headers.get("Accept", ""))))
+        return self.directory / f"{_digest(_scope_of(url))}-{key}.json"
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and isinstance(entry.get("body"), str) else None
+
+    def _write(self, path: Path, entry: Dict[str, Any]) -> None:
+        """Write an entry atomically, then evict the least recently used entries."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=".entry-", suffix=".tmp", dir=self.directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_name, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+                raise
+        except OSError:
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries."""
+        with contextlib.suppress(OSError):
+            entries = [e for e in os.scandir(self.directory) if e.name.endswith(".json")]
+            excess = len(entries) - self.settings.max_entries
+            if excess <= 0:
+                return
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for entry in entries[:excess]:
+                with contextlib.suppress(OSError):
+                    os.unlink(entry.path)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def get(self, send, url: str, headers: Optional[Dict[str, str]], **kwargs: Any) -> Any:
+        """
+        GET a URL through the cache.
+
+        Args:
+            send: The underlying GET (requests.get or Session.get).
+            url: Request URL.
+            headers: Request headers.
+            **kwargs: Other arguments for send (e.g. timeout).
+
+        Returns:
+            A CachedResponse, or the server's response (unchanged and not
+            cached if the caller sent its own conditional headers)
+        """
+        if headers and any(name.lower() in _CONDITIONAL_HEADERS for name in headers):
+            return send(url, headers=headers, **kwargs)
+
+        headers = dict(headers or {})
+        path = self._entry_path(url, headers)
+        entry = self._read(path)
+
+        if entry is not None and time.time() - entry.get("storedAt", 0) < self.settings.ttl_seconds:
+            self._count("hits")
+            with contextlib.suppress(OSError):
+                os.utime(path)
+            return CachedResponse(url, entry["body"], entry.get("headers", {}))
+
+        request_headers = dict(headers)
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers.setdefault("If-None-Match", entry["etag"])
+            if entry.get("lastModified"):
+                request_headers.setdefault("If-Modified-Since", entry["lastModified"])
+
+        response = send(url, headers=request_headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self._count("revalidated")
+            entry["storedAt"] = time.time()
+            self._write(path, entry)
+            return CachedResponse(url, entry["body"], entry.get("headers", {}))
+
+        self._count("misses")
+        if response.status_code == 200:
+            self._store(path, response)
+        return response
+
+    def _store(self, path: Path, response: Any) -> None:
+        """Store a 200 response that can be revalidated (or served within the TTL)."""
+        etag = _header(response.headers, "ETag")
+        last_modified = _header(response.headers, "Last-Modified")
+        body = response.text
+        if not isinstance(body, str) or not (etag or last_modified or self.settings.ttl_seconds > 0):
+            return
+        stored_headers = {
+            name: value for name, value in (("ETag", etag), ("Last-Modified", last_modified)) if value is not None
+        }
+        content_type = _header(response.headers, "Content-Type")
+        if content_type:
+            stored_headers["Content-Type"] = content_type
+        self._write(
+            path,
+            {
+                "storedAt": time.time(),
+                "etag": etag,
+                "lastModified": last_modified,
+                "headers": stored_headers,
+                "body": body,
+            },
+        )
+
+    def invalidate(self, url: str) -> None:
+        """Drop the cached entries in a URL's scope (its pull request, if any)."""
+        prefix = f"{_digest(_scope_of(url))}-"
+        with contextlib.suppress(OSError):
+            for entry in os.scandir(self.directory):
+                if entry.name.startswith(prefix):
+                    with contextlib.suppress(OSError):
+                        os.unlink(entry.path)
+
+
+class _CacheAwareClient:
+    """Wraps requests or a Session: cacheable GETs use the cache, writes invalidate it."""
+
+    def __init__(self, client: Any, cache: HttpCache):
+        self._client = client
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def get(self, url: str, params: Any = None, **kwargs: Any) -> Any:
+        if params is not None or kwargs.get("stream") or not is_cacheable_url(url):
+            return self._client.get(url, params=params, **kwargs)
+        headers = kwargs.pop("headers", None)
+        return self._cache.get(self._client.get, url, headers, **kwargs)
+
+    def _write(self, method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return getattr(self._client, method)(url, *args, **kwargs)
+        finally:
+            self._cache.invalidate(url)
+
+    def post(self, url: str, *args: Any, **kwargs: Any) -> Any:
+        return self._write("post", url, *args, **kwargs)
+
+    def put(self, url: str, *args: Any, **kwargs: Any) -> Any:
+        return self._write("put", url, *args, **kwargs)
+
+    def patch(self, url: str, *args: Any, **kwargs: Any) -> Any:
+        return self._write("patch", url, *args, **kwargs)
+
+    def delete(self, url: str, *args: Any, **kwargs: Any) -> Any:
+        return self._write("delete", url, *args, **kwargs)
+
+
+class CachingRequests(_CacheAwareClient):
+    """The requests module with an HTTP cache in front of cacheable ADO GETs."""
+
+    def Session(self) -> _CacheAwareClient:
+        """Create a requests Session that shares the cache."""
+        return _CacheAwareClient(self._client.Session(), self._cache)
+
+
+_default_cache: Optional[HttpCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def _print_stats() -> None:
+    cache = _default_cache
+    if cache is not None and cache.settings.verbose:
+        print(cache.stats.summary(), file=sys.stderr)
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """
+    Get the process-wide HTTP cache.
+
+    Returns:
+        The cache, or None if AGDT_HTTP_CACHE disables it
+    """
+    global _default_cache
+    settings = HttpCacheSettings.from_env()
+    if not settings.enabled:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            from ...state import get_state_dir
+
+            _default_cache = HttpCache(get_state_dir() / HTTP_CACHE_DIRNAME, settings)
+            atexit.register(_print_stats)
+        return _default_cache
+
+
+def wrap_with_http_cache(requests_module: Any) -> Any:
+    """Put the HTTP cache in front of a requests module (unchanged if the cache is disabled)."""
+    cache = get_http_cache()
+    return CachingRequests(requests_module, cache) if cache is not None else requests_module
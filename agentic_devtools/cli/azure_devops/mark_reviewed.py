@@ -583,10 +583,41 @@ def mark_file_reviewed(  # pragma: no cover
     Returns:
         True if successful, False otherwise
     """
-    normalized_path = normalize_repo_path(file_path)
-    if not normalized_path:
-        print(f"Error: Invalid file path '{file_path}'", file=sys.stderr)
-        return False
+    return mark_files_reviewed([file_path], pull_request_id, config, repo_id, dry_run=dry_run)
+
+
+def mark_files_reviewed(  # pragma: no cover
+    file_paths: List[str],
+    pull_request_id: int,
+    config: AzureDevOpsConfig,
+    repo_id: str,
+    dry_run: bool = False,
+) -> bool:
+    """
+    Mark several files as reviewed with a single reviewer-entry update.
+
+    The authenticated user, reviewer entry and project ID are looked up
+    once, and the reviewedFiles list is updated once for all files. The
+    viewed status is then synced per file (best effort).
+
+    Args:
+        file_paths: Paths of files to mark as reviewed
+        pull_request_id: Pull request ID
+        config: Azure DevOps configuration
+        repo_id: Repository ID
+        dry_run: If True, only print what would be done
+
+    Returns:
+        True if successful, False otherwise
+    """
+    normalized_paths: List[str] = []
+    for file_path in file_paths:
+        normalized_path = normalize_repo_path(file_path)
+        if not normalized_path:
+            print(f"Error: Invalid file path '{file_path}'", file=sys.stderr)
+            return False
+        if normalized_path not in normalized_paths:
+            normalized_paths.append(normalized_path)
 
     org_root = config.organization.rstrip("/")
     if not org_root.startswith("http"):  # pragma: no cover
@@ -595,7 +626,8 @@ def mark_file_reviewed(  # pragma: no cover
     project_encoded = quote(config.project, safe="")
 
     if dry_run:
-        print(f"DRY-RUN: Would mark '{normalized_path}' as reviewed on PR {pull_request_id}.")
+        for normalized_path in normalized_paths:
+            print(f"DRY-RUN: Would mark '{normalized_path}' as reviewed on PR {pull_request_id}.")
         return True
 
     # Only require requests and PAT for actual execution
@@ -647,14 +679,19 @@ def mark_file_reviewed(  # pragma: no cover
         print(f"Failed to retrieve reviewer entry: {e}", file=sys.stderr)
         return False
 
-    # Check if already reviewed
+    # Skip files that are already reviewed
     existing_reviewed = reviewer_entry.get("reviewedFiles", []) if reviewer_entry else []
-    if normalized_path in existing_reviewed:
-        print(f"File '{normalized_path}' already marked as reviewed.")
+    new_paths = []
+    for normalized_path in normalized_paths:
+        if normalized_path in existing_reviewed:
+            print(f"File '{normalized_path}' already marked as reviewed.")
+        else:
+            new_paths.append(normalized_path)
+    if not new_paths:
         return True
 
-    # Update reviewer entry with new file
-    updated_reviewed = list(set(existing_reviewed + [normalized_path]))
+    # Update reviewer entry with all new files at once
+    updated_reviewed = list(set(existing_reviewed + new_paths))
 
     try:
         _update_reviewer_entry(
@@ -688,25 +725,27 @@ def mark_file_reviewed(  # pragma: no cover
         except Exception:
             existing_tokens = []
 
-        try:
-            _sync_viewed_status(
-                requests,
-                headers,
-                org_root,
-                config.project,
-                project_id,
-                config.repository,
-                repo_id,
-                pull_request_id,
-                normalized_path,
-                organization_account_name,
-                instance_id,
-                existing_tokens,
-            )
-        except Exception as e:
-            print(f"Warning: Failed to sync viewed status: {e}")
-
-    print(f"Marked '{normalized_path}' as reviewed.")
+        for normalized_path in new_paths:
+            try:
+                _sync_viewed_status(
+                    requests,
+                    headers,
+                    org_root,
+                    config.project,
+                    project_id,
+                    config.repository,
+                    repo_id,
+                    pull_request_id,
+                    normalized_path,
+                    organization_account_name,
+                    instance_id,
+                    existing_tokens,
+                )
+            except Exception as e:
+                print(f"Warning: Failed to sync viewed status for '{normalized_path}': {e}")
+
+    for normalized_path in new_paths:
+        print(f"Marked '{normalized_path}' as reviewed.")
     return True
 
 
@@ -11,29 +11,23 @@ import sys
 from typing import Any, Dict, List, Optional
 
 from ...state import get_pull_request_id, get_state_dir, is_dry_run
+from ..git.core import GitObjectReader
 from ..git.diff import (
     get_added_lines_info,
     get_diff_entries,
     get_diff_patch,
     normalize_ref_name,
-    sync_git_ref,
+    sync_git_refs,
 )
 from ..subprocess_utils import run_safe
 from .auth import get_auth_headers, get_pat
 from .config import AzureDevOpsConfig
-from .helpers import verify_az_cli
+from .helpers import require_requests, verify_az_cli
 
 
 def _invoke_ado_rest(url: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
-    """Make an Azure DevOps REST API GET request."""
-    try:
-        import requests
-    except ImportError:  # pragma: no cover
-        print(
-            "Error: 'requests' library required. Install with: pip install requests",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+    """Make an Azure DevOps REST API GET request (through the HTTP cache)."""
+    requests = require_requests()
 
     try:
         response = requests.get(url, headers=headers, timeout=30)
@@ -540,11 +534,14 @@ def get_pull_request_details() -> None:
     base_ref = base_commit or (f"origin/{target_branch}" if target_branch else "origin/main")
     compare_ref = source_commit or (f"origin/{source_branch}" if source_branch else "HEAD")
 
-    # Sync git refs
+    # Sync git refs: skip commits that are already local, fetch the rest at once
+    sync_refs: Dict[str, Optional[str]] = {}
     if target_branch:
-        sync_git_ref(f"origin/{target_branch}")
+        sync_refs[f"origin/{target_branch}"] = base_commit
     if source_branch:
-        sync_git_ref(f"origin/{source_branch}")
+        sync_refs[f"origin/{source_branch}"] = source_commit
+    with GitObjectReader() as reader:
+        sync_git_refs(sync_refs, reader)
 
     # Get file diffs
     files_details = []
@@ -0,0 +1,366 @@
+"""Rescaffold planning from git blob IDs.
+
+Incremental re-scaffolding used to classify files by asking the Azure
+DevOps iterations API which files changed, then cross-checking that list
+with ``git diff --name-only``. This module gets the same answer from one
+``git diff --raw`` between the previously scaffolded commit and the new
+one: every changed file is listed with its old and new blob ID, and any
+file not listed has the same content in both commits.
+
+From that classification it plans the minimal set of thread operations:
+
+  - New files: one thread POST each.
+  - Modified files: the main comment is demoted (GET + POST reply + PATCH)
+    only if it shows review progress worth keeping. An unreviewed file
+    with no summary or suggestions already shows the fresh content.
+  - Deleted files: demoted once; files already marked removed are skipped.
+
+The planned POSTs and demotions run with bounded concurrency over one
+pooled HTTP session. Review state is only updated by the calling thread.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .helpers import DEFAULT_MAX_WORKERS
+from .review_scaffold import (
+    FileChangeResult,
+    demote_main_comment,
+    get_file_name,
+    get_folder_for_path,
+    post_thread,
+)
+from .review_state import FileEntry, ReviewState, ReviewStatus, normalize_file_path
+from .review_templates import render_file_summary
+
+# Summary recorded on files deleted from the PR
+REMOVED_FILE_SUMMARY = "File removed"
+
+# API calls made to demote a main comment (GET thread, POST reply, PATCH main)
+DEMOTE_API_CALLS = 3
+
+
+@dataclass
+class BlobChange:
+    """A file listed by ``git diff --raw``."""
+
+    old_blob: str
+    new_blob: str
+    status: str
+
+    @property
+    def content_changed(self) -> bool:
+        """Whether the file's content differs (not just its mode)."""
+        return self.old_blob != self.new_blob
+
+
+def read_blob_changes(old_commit_hash: str, new_commit_hash: str) -> Optional[Dict[str, BlobChange]]:
+    """Get the blob IDs of every file changed between two commits.
+
+    Runs a single ``git diff --raw`` in the current repository. Renames are
+    reported as a deletion plus an addition, matching how the PR's file
+    threads are keyed by path.
+
+    Args:
+        old_commit_hash: Previously scaffolded commit.
+        new_commit_hash: Commit being scaffolded.
+
+    Returns:
+        Changes keyed by normalised file path, or None if git couldn't diff
+        the commits (e.g. they haven't been fetched locally).
+    """
+    from ..subprocess_utils import run_safe
+
+    if not old_commit_hash or not new_commit_hash:
+        return None
+
+    try:
+        proc = run_safe(
+            ["git", "diff", "--raw", "-z", "--no-abbrev", "--no-renames", old_commit_hash, new_commit_hash],
+            capture_output=True,
+            text=True,
+            shell=False,
+        )
+    except Exception:
+        return None
+    if proc.returncode != 0:
+        return None
+
+    # With -z each entry is ":<old mode> <new mode> <old blob> <new blob> <status>" NUL "<path>" NUL
+    tokens = proc.stdout.split("\0")
+    changes: Dict[str, BlobChange] = {}
+    for header, path in zip(tokens[::2], tokens[1::2]):
+        fields = header.lstrip(":").split()
+        if len(fields) != 5 or not path:
+            continue
+        _, _, old_blob, new_blob, status = fields
+        changes[normalize_file_path(path)] = BlobChange(old_blob=old_blob, new_blob=new_blob, status=status)
+    return changes
+
+
+def classify_blob_changes(
+    existing_state: ReviewState,
+    current_files: List[str],
+    blob_changes: Dict[str, BlobChange],
+) -> FileChangeResult:
+    """Categorise the PR's files from their blob changes.
+
+    Args:
+        existing_state: Previous review state.
+        current_files: File paths in the new iteration.
+        blob_changes: Output of read_blob_changes.
+
+    Returns:
+        FileChangeResult categorising every file.
+    """
+    existing_file_set = set(existing_state.files)
+    current_file_set = {normalize_file_path(f) for f in current_files}
+
+    result = FileChangeResult()
+    for f in sorted(current_file_set):
+        change = blob_changes.get(f)
+        if f not in existing_file_set:
+            result.new_files.append(f)
+        elif change is not None and change.content_changed:
+            result.modified_files.append(f)
+        else:
+            result.unchanged_files.append(f)
+
+    for f in sorted(existing_file_set - current_file_set):
+        result.deleted_files.append(f)
+
+    return result
+
+
+def _shows_review_progress(file_entry: FileEntry) -> bool:
+    """Check whether a file's main comment shows more than a fresh unreviewed summary."""
+    return bool(file_entry.status != ReviewStatus.UNREVIEWED.value or file_entry.summary or file_entry.suggestions)
+
+
+def _is_removed(file_entry: FileEntry) -> bool:
+    """Check whether a file was already marked removed by an earlier re-scaffold."""
+    return file_entry.status == ReviewStatus.APPROVED.value and file_entry.summary == REMOVED_FILE_SUMMARY
+
+
+@dataclass
+class RescaffoldPlan:
+    """Thread operations needed to re-scaffold a PR for a new commit.
+
+    ``demote_modified`` and ``demote_deleted`` are the subsets of
+    ``changes.modified_files`` and ``changes.deleted_files`` whose main
+    comment has to be demoted.
+    """
+
+    changes: FileChangeResult
+    demote_modified: List[str] = field(default_factory=list)
+    demote_deleted: List[str] = field(default_factory=list)
+    source: str = "git"
+
+    @property
+    def skipped_demotions(self) -> int:
+        """Number of modified or deleted files that need no demotion."""
+        return (
+            len(self.changes.modified_files)
+            + len(self.changes.deleted_files)
+            - len(self.demote_modified)
+            - len(self.demote_deleted)
+        )
+
+    def estimate_api_calls(self, existing_state: ReviewState) -> int:
+        """Estimate the API calls executing the plan will make.
+
+        Counts thread POSTs for new files, demotions of file comments, the
+        overall summary and the activity log, plus the thread lookup of
+        the suggestion verification gate. Replies posted when that gate
+        blocks the review aren't counted.
+
+        Args:
+            existing_state: Review state the plan was built from.
+
+        Returns:
+            Estimated number of API calls.
+        """
+        calls = len(self.changes.new_files)
+        calls += DEMOTE_API_CALLS * (len(self.demote_modified) + len(self.demote_deleted))
+        if existing_state.overallSummary.threadId:
+            calls += DEMOTE_API_CALLS
+        if existing_state.activityLogThreadId:
+            calls += DEMOTE_API_CALLS
+        if any(fe.previousSuggestions for fe in existing_state.files.values()):
+            calls += 1
+        return calls
+
+
+def plan_rescaffold(existing_state: ReviewState, changes: FileChangeResult, source: str = "git") -> RescaffoldPlan:
+    """Work out the minimal set of demotions for a set of file changes.
+
+    Args:
+        existing_state: Previous review state.
+        changes: Categorised file changes.
+        source: How the changes were detected ("git" or "iterations").
+
+    Returns:
+        RescaffoldPlan for the changes.
+    """
+    plan = RescaffoldPlan(changes=changes, source=source)
+    for file_path in changes.modified_files:
+        fe = existing_state.files.get(file_path)
+        if fe and fe.threadId and _shows_review_progress(fe):
+            plan.demote_modified.append(file_path)
+    for file_path in changes.deleted_files:
+        fe = existing_state.files.get(file_path)
+        if fe and fe.threadId and not _is_removed(fe):
+            plan.demote_deleted.append(file_path)
+    return plan
+
+
+def print_rescaffold_plan(
+    plan: RescaffoldPlan,
+    existing_state: ReviewState,
+    pull_request_id: int,
+    short_hash: str,
+) -> None:
+    """Print the re-scaffolding plan without making API calls.
+
+    Args:
+        plan: Plan to print.
+        existing_state: Review state the plan was built from.
+        pull_request_id: PR ID.
+        short_hash: Short hash of the new commit.
+    """
+    changes = plan.changes
+    demoted = set(plan.demote_modified) | set(plan.demote_deleted)
+    print(f"[DRY RUN] Would re-scaffold PR {pull_request_id} for commit {short_hash}")
+    for f in changes.new_files:
+        print(f"  [DRY RUN] New file: {f}")
+    for f in changes.modified_files:
+        suffix = "" if f in demoted else " (no demotion needed)"
+        print(f"  [DRY RUN] Modified file: {f}{suffix}")
+    for f in changes.deleted_files:
+        suffix = "" if f in demoted else " (already removed)"
+        print(f"  [DRY RUN] Deleted file: {f}{suffix}")
+    for f in changes.unchanged_files:
+        print(f"  [DRY RUN] Unchanged file: {f}")
+    print(f"  [DRY RUN] Changes detected via {plan.source}; {plan.skipped_demotions} demotion(s) skipped")
+    print(f"  [DRY RUN] Estimated API calls: {plan.estimate_api_calls(existing_state)}")
+
+
+def execute_rescaffold_plan(
+    plan: RescaffoldPlan,
+    existing_state: ReviewState,
+    session: Any,
+    headers: Dict[str, str],
+    threads_url: str,
+    base_url: str,
+    short_hash: str,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Create and demote the planned threads, then update review state.
+
+    Thread POSTs and demotions run concurrently. A failed demotion is
+    reported as a warning; the file's state is reset regardless, as before.
+    Threads that were created are added to review state even if another
+    POST failed.
+
+    Args:
+        plan: Plan to execute.
+        existing_state: Review state to update.
+        session: HTTP session (see helpers.create_pooled_session).
+        headers: Auth headers.
+        threads_url: The PR's threads API URL.
+        base_url: PR web URL for discussion links.
+        short_hash: Short hash of the new commit.
+        max_workers: Maximum requests in flight (default: DEFAULT_MAX_WORKERS).
+
+    Raises:
+        Exception: The first thread POST failure, after every other
+            operation has finished and its result was recorded.
+    """
+    changes = plan.changes
+
+    # Render up front: the template fragment cache is not thread-safe
+    new_entries: Dict[str, FileEntry] = {}
+    tasks: List[Tuple[str, str, Callable[[], Any]]] = []
+    for file_path in changes.new_files:
+        entry = FileEntry(
+            threadId=0,
+            commentId=0,
+            folder=get_folder_for_path(file_path),
+            fileName=get_file_name(file_path),
+            status=ReviewStatus.UNREVIEWED.value,
+        )
+        new_entries[file_path] = entry
+        content = render_file_summary(entry, [], base_url)
+        tasks.append(
+            ("create", file_path, lambda c=content, p=file_path: post_thread(session, headers, threads_url, c, p))
+        )
+    for file_path in plan.demote_modified:
+        fe = existing_state.files[file_path]
+        fresh = FileEntry(
+            threadId=fe.threadId,
+            commentId=fe.commentId,
+            folder=fe.folder,
+            fileName=fe.fileName,
+            status=ReviewStatus.UNREVIEWED.value,
+        )
+        content = render_file_summary(fresh, [], base_url)
+        tasks.append(("modified", file_path, _demotion(session, headers, threads_url, fe, content)))
+    removed_msg = f"🗑️ File removed in commit `{short_hash}`"
+    for file_path in plan.demote_deleted:
+        fe = existing_state.files[file_path]
+        tasks.append(("deleted", file_path, _demotion(session, headers, threads_url, fe, removed_msg)))
+
+    results: Dict[Tuple[str, str], Any] = {}
+    errors: Dict[Tuple[str, str], Exception] = {}
+    if tasks:
+        workers = min(max_workers or DEFAULT_MAX_WORKERS, len(tasks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {(kind, path): executor.submit(fn) for kind, path, fn in tasks}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as exc:
+                    errors[key] = exc
+
+    # Single writer: apply results in plan order
+    first_error: Optional[Exception] = None
+    for file_path in changes.new_files:
+        if ("create", file_path) in errors:
+            first_error = first_error or errors[("create", file_path)]
+            continue
+        print(f"Scaffolded new file thread for {file_path}.")
+        entry = new_entries[file_path]
+        entry.threadId, entry.commentId = results[("create", file_path)]
+        existing_state.files[file_path] = entry
+
+    for file_path in changes.modified_files:
+        if ("modified", file_path) in errors:
+            exc = errors[("modified", file_path)]
+            print(f"Warning: Could not demote comment for {file_path}: {exc}", file=sys.stderr)
+        fe = existing_state.files.get(file_path)
+        if fe:
+            fe.previousSuggestions = list(fe.suggestions) if fe.suggestions else []
+            fe.suggestions = []
+            fe.status = ReviewStatus.UNREVIEWED.value
+            fe.summary = None
+
+    for file_path in plan.demote_deleted:
+        if ("deleted", file_path) in errors:
+            exc = errors[("deleted", file_path)]
+            print(f"Warning: Could not demote comment for deleted {file_path}: {exc}", file=sys.stderr)
+        fe = existing_state.files[file_path]
+        fe.status = ReviewStatus.APPROVED.value
+        fe.summary = REMOVED_FILE_SUMMARY
+
+    if first_error is not None:
+        raise first_error
+
+
+def _demotion(
+    session: Any, headers: Dict[str, str], threads_url: str, file_entry: FileEntry, content: str
+) -> Callable[[], int]:
+    """Bind a demotion of a file's main comment for the worker pool."""
+    thread_id, comment_id = file_entry.threadId, file_entry.commentId
+    return lambda: demote_main_comment(session, headers, threads_url, thread_id, comment_id, content)
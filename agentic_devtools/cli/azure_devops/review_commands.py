@@ -579,6 +579,7 @@ def _scaffold_threads_for_review(
             or None to include all PR files.
     """
     from .review_scaffold import scaffold_review_threads
+    from .review_state import review_state_lock
 
     try:
         repo_id = pr_info.get("repository", {}).get("id")
@@ -616,19 +617,20 @@ def _scaffold_threads_for_review(
             auth_headers = get_auth_headers(get_pat())
 
         print(f"\nScaffolding review threads for PR {pull_request_id}...")
-        scaffold_review_threads(
-            pull_request_id=pull_request_id,
-            files=file_paths,
-            config=config,
-            repo_id=repo_id,
-            repo_name=config.repository,
-            latest_iteration_id=latest_iteration_id,
-            requests_module=requests_module,
-            headers=auth_headers,
-            dry_run=dry_run,
-            commit_hash=commit_hash,
-            model_id=model_id,
-        )
+        with review_state_lock(pull_request_id):
+            scaffold_review_threads(
+                pull_request_id=pull_request_id,
+                files=file_paths,
+                config=config,
+                repo_id=repo_id,
+                repo_name=config.repository,
+                latest_iteration_id=latest_iteration_id,
+                requests_module=requests_module,
+                headers=auth_headers,
+                dry_run=dry_run,
+                commit_hash=commit_hash,
+                model_id=model_id,
+            )
     except Exception as e:
         print(f"Warning: Scaffolding failed: {e}", file=sys.stderr)
 
@@ -0,0 +1,189 @@
+"""
+In-memory index over a pull request's review queue (queue.json).
+
+queue.json holds the files still to review under "pending" (each with a
+status of pending, submission-pending or failed) and the reviewed files
+under "completed". ReviewQueue parses the file once and keeps:
+
+- an index from normalized, case-folded file path to pending entry, so
+  finding a file doesn't rescan the list;
+- a count of pending entries per status, updated as entries change.
+
+Changes are written back atomically (temp file + rename) while holding a
+lock on a sidecar ``queue.json.lock`` file, so concurrent background
+submissions don't lose each other's updates.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ...file_locking import locked_file
+from .helpers import path_key
+
+STATUS_PENDING = "pending"
+STATUS_SUBMISSION_PENDING = "submission-pending"
+STATUS_FAILED = "failed"
+STATUS_COMPLETED = "completed"
+
+# Fields recording an in-flight or failed submission
+_SUBMISSION_FIELDS = ("taskId", "submittedUtc", "failedUtc", "errorMessage")
+
+
+def _status_of(entry: Dict[str, Any]) -> str:
+    """Get a pending entry's status; anything unrecognized still awaits review."""
+    status = entry.get("status")
+    return status if status in (STATUS_SUBMISSION_PENDING, STATUS_FAILED) else STATUS_PENDING
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class ReviewQueue:
+    """A parsed queue.json with a path index and per-status counts."""
+
+    def __init__(self, path: Path, data: Dict[str, Any]):
+        self.path = path
+        self.data = data
+        self.pending: List[Dict[str, Any]] = data.setdefault("pending", [])
+        self.completed: List[Dict[str, Any]] = data.setdefault("completed", [])
+        self.modified = False
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._counts: Counter = Counter()
+        for entry in self.pending:
+            key = path_key(entry.get("path"))
+            # First entry wins, as with the previous linear scans
+            if key and key not in self._index:
+                self._index[key] = entry
+            self._counts[_status_of(entry)] += 1
+
+    @classmethod
+    def load(cls, path: Path) -> "ReviewQueue":
+        """
+        Read and index a queue file.
+
+        Raises:
+            OSError: If the file can't be read
+            json.JSONDecodeError: If the file isn't valid JSON
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(path, json.load(f))
+
+    @classmethod
+    @contextlib.contextmanager
+    def locked(cls, path: Path) -> Iterator["ReviewQueue"]:
+        """
+        Load the queue under its lock and save it on exit if it was modified.
+
+        Raises:
+            FileLockError: If another process holds the lock for too long
+            OSError: If the file can't be read or written
+            json.JSONDecodeError: If the file isn't valid JSON
+        """
+        with locked_file(path.with_name(path.name + ".lock"), "a"):
+            queue = cls.load(path)
+            yield queue
+            if queue.modified:
+                queue.save()
+
+    def save(self) -> None:
+        """Write the queue atomically."""
+        fd, tmp_name = tempfile.mkstemp(prefix=".queue-", suffix=".json", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+        self.modified = False
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def find(self, file_path: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get the pending entry for a file (any spelling of its path)."""
+        key = path_key(file_path)
+        return self._index.get(key) if key else None
+
+    def count(self, status: str) -> int:
+        """Number of entries with a status (``completed`` counts reviewed files)."""
+        if status == STATUS_COMPLETED:
+            return len(self.completed)
+        return self._counts[status]
+
+    def entries_with_status(self, status: str) -> List[Dict[str, Any]]:
+        """Pending entries with a status, in queue order."""
+        if not self._counts[status]:
+            return []
+        return [entry for entry in self.pending if _status_of(entry) == status]
+
+    def next_pending(self) -> Optional[Dict[str, Any]]:
+        """The first entry still waiting for review, if any."""
+        if not self._counts[STATUS_PENDING]:
+            return None
+        return next(e for e in self.pending if _status_of(e) == STATUS_PENDING)
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def touch(self) -> None:
+        """Record that the queue changed."""
+        self.data["lastUpdatedUtc"] = _now()
+        self.modified = True
+
+    def set_status(self, entry: Dict[str, Any], status: str, **fields: Any) -> None:
+        """Change a pending entry's status and set extra fields on it."""
+        self._counts[_status_of(entry)] -= 1
+        self._counts[status] += 1
+        entry["status"] = status
+        entry.update(fields)
+        self.touch()
+
+    def mark_submission_pending(self, entry: Dict[str, Any], task_id: str, outcome: str) -> None:
+        """Record that a background task is submitting the entry's review."""
+        self.set_status(entry, STATUS_SUBMISSION_PENDING, taskId=task_id, outcome=outcome, submittedUtc=_now())
+        # Clean up any failure fields from previous attempts
+        entry.pop("failedUtc", None)
+        entry.pop("errorMessage", None)
+
+    def mark_failed(self, entry: Dict[str, Any], error_message: str) -> None:
+        """Record that the entry's submission failed."""
+        self.set_status(entry, STATUS_FAILED, failedUtc=_now(), errorMessage=error_message)
+
+    def reset(self, entry: Dict[str, Any]) -> None:
+        """Put a failed entry back up for review."""
+        self.set_status(entry, STATUS_PENDING)
+        for field in (*_SUBMISSION_FIELDS, "outcome"):
+            entry.pop(field, None)
+
+    def complete(self, entry: Dict[str, Any], outcome: Optional[str] = None) -> None:
+        """Move a pending entry to the completed list."""
+        self._counts[_status_of(entry)] -= 1
+        del self.pending[next(i for i, e in enumerate(self.pending) if e is entry)]
+        key = path_key(entry.get("path"))
+        if key and self._index.get(key) is entry:
+            del self._index[key]
+            # A later duplicate of the same file becomes the one found
+            for other in self.pending:
+                if path_key(other.get("path")) == key:
+                    self._index[key] = other
+                    break
+
+        entry["status"] = STATUS_COMPLETED
+        if outcome is not None:
+            entry["outcome"] = outcome
+        entry["completedUtc"] = _now()
+        for field in _SUBMISSION_FIELDS:
+            entry.pop(field, None)
+        self.completed.append(entry)
+        self.touch()
@@ -47,7 +47,7 @@ from .suggestion_verification import (
 STALE_SESSION_THRESHOLD = timedelta(hours=2)
 
 
-def _get_folder_for_path(file_path: str) -> str:
+def get_folder_for_path(file_path: str) -> str:
     """Get the top-level folder name for a file path.
 
     Args:
@@ -62,7 +62,7 @@ def _get_folder_for_path(file_path: str) -> str:
     return get_root_folder(normalized.lstrip("/"))
 
 
-def _get_file_name(file_path: str) -> str:
+def get_file_name(file_path: str) -> str:
     """Get the base file name from a file path.
 
     Args:
@@ -93,7 +93,7 @@ def _build_pr_base_url(config: AzureDevOpsConfig, pull_request_id: int) -> str:
     return f"{org}/{encoded_project}/_git/{encoded_repo}/pullrequest/{pull_request_id}"
 
 
-def _post_thread(
+def post_thread(
     requests_module: Any,
     headers: Dict[str, str],
     threads_url: str,
@@ -229,7 +229,7 @@ def _patch_comment_content(
     response.raise_for_status()
 
 
-def _demote_main_comment(
+def demote_main_comment(
     requests_module: Any,
     headers: Dict[str, str],
     threads_url: str,
@@ -338,7 +338,7 @@ def _post_activity_log_entry(
         comment_id: Activity log main comment ID.
         entry_content: Formatted markdown for the new entry.
     """
-    _demote_main_comment(requests_module, headers, threads_url, thread_id, comment_id, entry_content)
+    demote_main_comment(requests_module, headers, threads_url, thread_id, comment_id, entry_content)
 
 
 # ---------------------------------------------------------------------------
@@ -932,7 +932,7 @@ def _fresh_scaffold(
     # Group files by top-level folder
     folders: Dict[str, List[str]] = {}
     for file_path in files:
-        folder = _get_folder_for_path(file_path)
+        folder = get_folder_for_path(file_path)
         normalized = normalize_file_path(file_path)
         folders.setdefault(folder, []).append(normalized)
 
@@ -975,8 +975,8 @@ def _fresh_scaffold(
     file_entries: Dict[str, FileEntry] = {}
     for file_path in files:
         normalized = normalize_file_path(file_path)
-        folder = _get_folder_for_path(file_path)
-        file_name = _get_file_name(file_path)
+        folder = get_folder_for_path(file_path)
+        file_name = get_file_name(file_path)
 
         temp_entry = FileEntry(
             threadId=0,
@@ -988,7 +988,7 @@ def _fresh_scaffold(
         content = render_file_summary(temp_entry, [], base_url)
 
         print(f"Creating file summary thread for {normalized}...")
-        thread_id, comment_id = _post_thread(requests_module, headers, threads_url, content, file_path=normalized)
+        thread_id, comment_id = post_thread(requests_module, headers, threads_url, content, file_path=normalized)
         file_entries[normalized] = FileEntry(
             threadId=thread_id,
             commentId=comment_id,
@@ -1009,12 +1009,12 @@ def _fresh_scaffold(
     temp_state = _build_state(file_entries, folder_groups)
     overall_content = render_overall_summary(temp_state, base_url)
     print("Creating overall PR summary thread...")
-    overall_thread_id, overall_comment_id = _post_thread(requests_module, headers, threads_url, overall_content)
+    overall_thread_id, overall_comment_id = post_thread(requests_module, headers, threads_url, overall_content)
 
     # Step 4: Create activity log thread
     activity_log_content = "## Review Activity Log\n\n*This thread tracks all review sessions for this PR.*\n"
     print("Creating Review Activity Log thread...")
-    activity_log_thread_id, _ = _post_thread(requests_module, headers, threads_url, activity_log_content)
+    activity_log_thread_id, _ = post_thread(requests_module, headers, threads_url, activity_log_content)
 
     # Build final state and persist
     review_state = _build_state(
@@ -1076,11 +1076,15 @@ def _incremental_rescaffold(
 ) -> Optional[ReviewState]:
     """Perform incremental re-scaffolding for a new commit.
 
-    Detects file changes between old and new commit, then:
+    Detects file changes between old and new commit (from one local
+    ``git diff --raw``, or the iterations API when that fails), then:
       - New files: scaffold new threads.
-      - Modified files: demote old comment, re-scaffold with fresh unreviewed.
+      - Modified files: demote old comment (if it shows review progress),
+        re-scaffold with fresh unreviewed.
       - Deleted files: demote old comment, mark as removed.
       - Unchanged files: no action.
+    File threads are created and demoted concurrently (see
+    ``rescaffold_planner``).
     Updates folder groups, overall summary, and posts activity log entry.
 
     Args:
@@ -1089,6 +1093,15 @@ def _incremental_rescaffold(
     Returns:
         Updated ReviewState, or None in dry-run mode.
     """
+    from .helpers import create_pooled_session
+    from .rescaffold_planner import (
+        classify_blob_changes,
+        execute_rescaffold_plan,
+        plan_rescaffold,
+        print_rescaffold_plan,
+        read_blob_changes,
+    )
+
     if now is None:
         now = datetime.now(timezone.utc)
 
@@ -1100,17 +1113,26 @@ def _incremental_rescaffold(
 
     normalised_files = [normalize_file_path(f) for f in files]
 
-    changes = detect_file_changes(
-        existing_state,
-        normalised_files,
-        config,
-        repo_id,
-        pull_request_id,
-        old_commit_hash,
-        commit_hash or "",
-        requests_module,
-        headers,
-    )
+    # One local git diff gives every changed file's blob IDs; fall back to
+    # the iterations API when the commits aren't available locally.
+    blob_changes = read_blob_changes(old_commit_hash, commit_hash or "")
+    if blob_changes is not None:
+        changes = classify_blob_changes(existing_state, normalised_files, blob_changes)
+        source = "git"
+    else:
+        changes = detect_file_changes(
+            existing_state,
+            normalised_files,
+            config,
+            repo_id,
+            pull_request_id,
+            old_commit_hash,
+            commit_hash or "",
+            requests_module,
+            headers,
+        )
+        source = "iterations"
+    plan = plan_rescaffold(existing_state, changes, source=source)
 
     n_new = len(changes.new_files)
     n_mod = len(changes.modified_files)
@@ -1161,7 +1183,7 @@ def _incremental_rescaffold(
                     overall = existing_state.overallSummary
                     if overall.threadId:
                         try:
-                            _demote_main_comment(
+                            demote_main_comment(
                                 requests_module,
                                 headers,
                                 threads_url,
@@ -1225,94 +1247,21 @@ def _incremental_rescaffold(
             print("Warning: Could not fetch PR threads for verification. Proceeding.", file=sys.stderr)
 
     if dry_run:
-        print(f"[DRY RUN] Would re-scaffold PR {pull_request_id} for commit {short_new_hash}")
-        for f in changes.new_files:
-            print(f"  [DRY RUN] New file: {f}")
-        for f in changes.modified_files:
-            print(f"  [DRY RUN] Modified file: {f}")
-        for f in changes.deleted_files:
-            print(f"  [DRY RUN] Deleted file: {f}")
-        for f in changes.unchanged_files:
-            print(f"  [DRY RUN] Unchanged file: {f}")
+        print_rescaffold_plan(plan, existing_state, pull_request_id, short_new_hash)
         return None
 
-    # Process new files
-    for file_path in changes.new_files:
-        folder = _get_folder_for_path(file_path)
-        file_name = _get_file_name(file_path)
-        temp_entry = FileEntry(
-            threadId=0,
-            commentId=0,
-            folder=folder,
-            fileName=file_name,
-            status=ReviewStatus.UNREVIEWED.value,
-        )
-        content = render_file_summary(temp_entry, [], base_url)
-        print(f"Scaffolding new file thread for {file_path}...")
-        thread_id, comment_id = _post_thread(requests_module, headers, threads_url, content, file_path=file_path)
-        existing_state.files[file_path] = FileEntry(
-            threadId=thread_id,
-            commentId=comment_id,
-            folder=folder,
-            fileName=file_name,
-            status=ReviewStatus.UNREVIEWED.value,
-        )
-
-    # Process modified files
-    for file_path in changes.modified_files:
-        fe = existing_state.files.get(file_path)
-        if fe and fe.threadId:
-            try:
-                _demote_main_comment(
-                    requests_module,
-                    headers,
-                    threads_url,
-                    fe.threadId,
-                    fe.commentId,
-                    render_file_summary(
-                        FileEntry(
-                            threadId=fe.threadId,
-                            commentId=fe.commentId,
-                            folder=fe.folder,
-                            fileName=fe.fileName,
-                            status=ReviewStatus.UNREVIEWED.value,
-                        ),
-                        [],
-                        base_url,
-                    ),
-                )
-            except Exception as exc:
-                print(f"Warning: Could not demote comment for {file_path}: {exc}", file=sys.stderr)
-            # Reset file state
-            fe.previousSuggestions = list(fe.suggestions) if fe.suggestions else []
-            fe.suggestions = []
-            fe.status = ReviewStatus.UNREVIEWED.value
-            fe.summary = None
-
-    # Process deleted files
-    for file_path in changes.deleted_files:
-        fe = existing_state.files.get(file_path)
-        if fe and fe.threadId:
-            removed_msg = f"🗑️ File removed in commit `{short_new_hash}`"
-            try:
-                _demote_main_comment(
-                    requests_module,
-                    headers,
-                    threads_url,
-                    fe.threadId,
-                    fe.commentId,
-                    removed_msg,
-                )
-            except Exception as exc:
-                print(f"Warning: Could not demote comment for deleted {file_path}: {exc}", file=sys.stderr)
-            fe.status = ReviewStatus.APPROVED.value
-            fe.summary = "File removed"
+    # Create new file threads and demote changed ones
+    session = create_pooled_session(requests_module)
+    try:
+        execute_rescaffold_plan(plan, existing_state, session, headers, threads_url, base_url, short_new_hash)
+    finally:
+        session.close()
 
     # Update folder groups
     all_current_files = set(changes.new_files + changes.modified_files + changes.unchanged_files)
     new_folders: Dict[str, List[str]] = {}
     for f in sorted(all_current_files):
-        folder = _get_folder_for_path(f)
+        folder = get_folder_for_path(f)
         new_folders.setdefault(folder, []).append(f)
     # Keep existing empty folder groups for deleted files
     for folder_name in existing_state.folders:
@@ -1326,7 +1275,7 @@ def _incremental_rescaffold(
         if overall.threadId:
             new_summary = render_overall_summary(existing_state, base_url)
             try:
-                _demote_main_comment(
+                demote_main_comment(
                     requests_module,
                     headers,
                     threads_url,
@@ -1342,7 +1291,7 @@ def _incremental_rescaffold(
         if overall.threadId:
             new_summary = render_overall_summary(existing_state, base_url)
             try:
-                _demote_main_comment(
+                demote_main_comment(
                     requests_module,
                     headers,
                     threads_url,
@@ -2,19 +2,43 @@
 
 Provides dataclasses for each schema level and load/save/update functions.
 File location: scripts/temp/pull-request-review/prompts/{pr_id}/review-state.json
+
+Large multi-model reviews hold thousands of file and suggestion entries, so
+the schema dataclasses use ``__slots__`` (no per-instance ``__dict__``) and
+the state is saved as compact JSON, which the C encoder writes several
+times faster than indented JSON.
 """
 
+import contextlib
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
+from ...file_locking import locked_file
 from ...state import get_state_dir
 
 REVIEW_STATE_DIR_PARTS = ("pull-request-review", "prompts")
 REVIEW_STATE_FILENAME = "review-state.json"
 
+# How long to wait for another task's review-state update (which includes
+# its Azure DevOps PATCHes) before giving up
+REVIEW_STATE_LOCK_TIMEOUT = 600.0
+
+
+def _slotted(cls):
+    """Recreate a dataclass with ``__slots__`` (``dataclass(slots=True)`` needs Python 3.10)."""
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    # Field defaults live on in the generated __init__; as class attributes they'd clash with the slots
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
 
 class ReviewStatus(str, Enum):
     """Status values for PR review items."""
@@ -60,6 +84,7 @@ def compute_aggregate_status(statuses: List[str]) -> str:
         return ReviewStatus.APPROVED.value
 
 
+@_slotted
 @dataclass
 class SuggestionEntry:
     """A suggestion posted on a specific line/range of a file."""
@@ -101,6 +126,7 @@ class SuggestionEntry:
         )
 
 
+@_slotted
 @dataclass
 class OverallSummary:
     """Overall PR review summary metadata."""
@@ -130,6 +156,7 @@ class OverallSummary:
         )
 
 
+@_slotted
 @dataclass
 class FolderGroup:
     """Lightweight folder grouping — maps a folder name to its file paths.
@@ -184,6 +211,7 @@ class ConsolidationStatus:
 CONSOLIDATION_TERMINAL = frozenset({ConsolidationStatus.NOT_NEEDED, ConsolidationStatus.COMPLETE})
 
 
+@_slotted
 @dataclass
 class ModelVerdict:
     """Tracks an individual model's verdict for a file.
@@ -216,6 +244,7 @@ class ModelVerdict:
         )
 
 
+@_slotted
 @dataclass
 class FileEntry:
     """Review state for an individual file."""
@@ -299,6 +328,7 @@ class FileEntry:
         return self.all_reviewers_complete() and self.has_disagreements()
 
 
+@_slotted
 @dataclass
 class ReviewSession:
     """Tracks an individual review session.
@@ -338,6 +368,7 @@ class ReviewSession:
         )
 
 
+@_slotted
 @dataclass
 class ReviewState:
     """Top-level PR review state."""
@@ -453,6 +484,25 @@ def get_review_state_file_path(pr_id: int) -> Path:
     return get_state_dir() / REVIEW_STATE_DIR_PARTS[0] / REVIEW_STATE_DIR_PARTS[1] / str(pr_id) / REVIEW_STATE_FILENAME
 
 
+@contextlib.contextmanager
+def review_state_lock(pr_id: int) -> Iterator[None]:
+    """
+    Hold a PR's review-state lock around a load, update and save of its state.
+
+    Approvals, change requests and the in-progress outbox drainer run as
+    separate background tasks, and each saves the whole state it loaded.
+    Taking this lock before loading keeps one from overwriting another's
+    update. Holders PATCH Azure DevOps while they hold it, so waiters get
+    REVIEW_STATE_LOCK_TIMEOUT.
+
+    Raises:
+        FileLockError: If another process holds the lock for too long
+    """
+    path = get_review_state_file_path(pr_id)
+    with locked_file(path.with_name(path.name + ".lock"), "a", timeout=REVIEW_STATE_LOCK_TIMEOUT):
+        yield
+
+
 def load_review_state(pr_id: int) -> ReviewState:
     """
     Load review state from JSON file.
@@ -504,7 +554,7 @@ def save_review_state(review_state: ReviewState) -> None:
     """
     file_path = get_review_state_file_path(review_state.prId)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    content = json.dumps(review_state.to_dict(), indent=2, ensure_ascii=False)
+    content = json.dumps(review_state.to_dict(), ensure_ascii=False, separators=(",", ":"))
     file_path.write_text(content, encoding="utf-8")
 
 
@@ -2,9 +2,15 @@
 
 Provides functions to generate and regenerate full markdown content for
 file summaries and the overall PR summary at each status.
+
+A cascade re-renders the overall summary after every file change, yet only
+one file changed. Rendered file summaries and the overall summary's per-file
+lines are therefore cached, keyed by a fingerprint of everything the file
+contributes to the markdown (status, summary, suggestions, verdicts), so
+unchanged files are not re-rendered.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .review_attribution import format_status, render_attribution_line
 from .review_state import (
@@ -25,6 +31,15 @@ _SEVERITY_LABELS: Dict[str, str] = {
 
 _SEVERITY_ORDER: List[str] = ["high", "medium", "low"]
 
+# Maximum number of rendered fragments kept per cache before it is reset
+FRAGMENT_CACHE_SIZE = 4096
+
+# Rendered file summaries keyed by (file key, suggestions key, render arguments)
+_file_summary_cache: Dict[Tuple, str] = {}
+
+# Overall summary file lines keyed by section status, base URL and the fields shown
+_overall_item_cache: Dict[Tuple, str] = {}
+
 # Emoji character for each file/folder status (used in nested file lists)
 _STATUS_EMOJI: Dict[str, str] = {
     ReviewStatus.NEEDS_WORK.value: "📝",
@@ -56,6 +71,44 @@ def _file_display_path(file_entry: FileEntry) -> str:
     return f"/{folder}/{file_entry.fileName}"
 
 
+def _suggestions_key(suggestions: List[SuggestionEntry]) -> Tuple:
+    """Fingerprint the suggestion fields that appear in rendered markdown."""
+    return tuple((s.threadId, s.commentId, s.severity, s.linkText, s.outOfScope) for s in suggestions)
+
+
+def _file_entry_key(file_entry: FileEntry) -> Tuple:
+    """Fingerprint everything a file entry contributes to rendered markdown.
+
+    Two entries with equal keys render identically, so the key is safe to
+    cache rendered fragments under.
+    """
+    return (
+        file_entry.folder,
+        file_entry.fileName,
+        file_entry.status,
+        file_entry.threadId,
+        file_entry.commentId,
+        file_entry.summary,
+        file_entry.consolidationStatus,
+        _suggestions_key(file_entry.suggestions),
+        tuple((mv.modelId, mv.status) for mv in file_entry.modelVerdicts or []),
+    )
+
+
+def _cache_put(cache: Dict[Tuple, str], key: Tuple, value: str) -> str:
+    """Store a rendered fragment, resetting the cache once it is full."""
+    if len(cache) >= FRAGMENT_CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def clear_render_cache() -> None:
+    """Drop all cached rendered fragments."""
+    _file_summary_cache.clear()
+    _overall_item_cache.clear()
+
+
 def _format_severity_counts(suggestions: List[SuggestionEntry]) -> str:
     """Format severity counts as a human-readable string (e.g. '2 High, 1 Medium')."""
     counts: Dict[str, int] = {"high": 0, "medium": 0, "low": 0}
@@ -162,6 +215,20 @@ def render_file_summary(
     Returns:
         Markdown string for the file review summary.
     """
+    key = (
+        _file_entry_key(file_entry),
+        _suggestions_key(suggestions),
+        base_url,
+        model_name,
+        model_icon,
+        commit_hash,
+        commit_url,
+        boss_model,
+    )
+    cached = _file_summary_cache.get(key)
+    if cached is not None:
+        return cached
+
     complete_path = _file_display_path(file_entry)
     status = file_entry.status
     status_display = format_status(status, use_emoji=True)
@@ -226,7 +293,36 @@ def render_file_summary(
     if progress_table:
         lines += ["", progress_table]
 
-    return "\n".join(lines)
+    return _cache_put(_file_summary_cache, key, "\n".join(lines))
+
+
+def _render_overall_file_item(file_entry: FileEntry, section_status: str, base_url: str) -> str:
+    """Render (or reuse) a file's line in an overall summary status section."""
+    # Only the fields the line shows; severities only matter under Needs Work
+    key = (
+        section_status,
+        base_url,
+        file_entry.folder,
+        file_entry.fileName,
+        file_entry.threadId,
+        file_entry.commentId,
+        tuple(s.severity for s in file_entry.suggestions) if section_status == ReviewStatus.NEEDS_WORK.value else (),
+    )
+    cached = _overall_item_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Use the section status for emoji so unknown statuses
+    # normalized into Unreviewed still get the ⏳ prefix.
+    file_emoji = _STATUS_EMOJI.get(section_status, "")
+    url = build_discussion_url(base_url, file_entry.threadId, file_entry.commentId)
+    display = _file_display_path(file_entry)
+    item = f"   - {file_emoji} [{display}]({url})"
+    if section_status == ReviewStatus.NEEDS_WORK.value:
+        counts = _format_severity_counts(file_entry.suggestions)
+        if counts:
+            item += f" \u2014 {counts}"
+    return _cache_put(_overall_item_cache, key, item)
 
 
 def render_overall_summary(
@@ -310,17 +406,7 @@ def render_overall_summary(
         for folder_name in sorted(folder_files.keys()):
             lines.append(f"- {folder_name}")
             for fe in sorted(folder_files[folder_name], key=_file_display_path):
-                # Use the section status for emoji so unknown statuses
-                # normalized into Unreviewed still get the ⏳ prefix.
-                file_emoji = _STATUS_EMOJI.get(status_val, "")
-                url = build_discussion_url(base_url, fe.threadId, fe.commentId)
-                display = _file_display_path(fe)
-                item = f"   - {file_emoji} [{display}]({url})"
-                if status_val == ReviewStatus.NEEDS_WORK.value:
-                    counts = _format_severity_counts(fe.suggestions)
-                    if counts:
-                        item += f" \u2014 {counts}"
-                lines.append(item)
+                lines.append(_render_overall_file_item(fe, status_val, base_url))
 
     # Review Narrative section
     lines.extend(["", "### Review Narrative", ""])
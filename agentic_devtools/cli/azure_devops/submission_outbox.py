@@ -0,0 +1,214 @@
+"""
+Per-PR outbox of review-state updates that are flushed in the background.
+
+Serving the next file's review prompt marks that file "In Progress". That
+takes a PATCH of the file's summary comment plus a PATCH of the overall
+summary, and used to run in the foreground before the prompt was
+printed. Instead, print_next_file_prompt now queues the update here and
+returns straight away.
+
+One background drainer per PR flushes the outbox. It takes every queued
+update at once, so files served in quick succession cost one review-state
+load/save and one overall-summary PATCH per batch, not one per file.
+
+The outbox is ``outbox.json`` next to the PR's queue.json::
+
+    {"drainerStartedUtc": "<ISO time or null>", "ops": [{"op": "in-progress", "file": "/src/a.py", ...}]}
+
+``drainerStartedUtc`` is set while a drainer is running, so enqueueing
+starts a new drainer only when none is running (or the last one died).
+If starting the drainer fails, the flag is cleared again. Updates are
+removed from the outbox only after they were flushed, so a drainer that
+is killed mid-batch leaves them for the next one. Flushing loads and
+saves review-state.json under review_state_lock, like approvals and
+change requests, so their updates don't overwrite each other.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ...file_locking import locked_file
+from ...state import get_state_dir
+
+OUTBOX_FILENAME = "outbox.json"
+
+OP_IN_PROGRESS = "in-progress"
+
+# A drainer that hasn't finished after this long is assumed to have died
+DRAINER_STALE_SECONDS = 600
+
+
+def get_outbox_path(pull_request_id: int) -> Path:
+    """Get the path to a PR's outbox (next to its queue.json)."""
+    return get_state_dir() / "pull-request-review" / "prompts" / str(pull_request_id) / OUTBOX_FILENAME
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@contextlib.contextmanager
+def _locked_outbox(pull_request_id: int) -> Iterator[Dict[str, Any]]:
+    """
+    Read the outbox under its lock and write it back atomically when the block exits.
+
+    Raises:
+        FileLockError: If another process holds the lock for too long
+    """
+    path = get_outbox_path(pull_request_id)
+    with locked_file(path.with_name(path.name + ".lock"), "a"):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        if not isinstance(data.get("ops"), list):
+            data["ops"] = []
+        data.setdefault("drainerStartedUtc", None)
+
+        yield data
+
+        fd, tmp_name = tempfile.mkstemp(prefix=".outbox-", suffix=".json", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_name, path)
+        finally:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)  # Only still there if the write or replace failed
+
+
+def _drainer_running(data: Dict[str, Any]) -> bool:
+    """Check whether the outbox records a live drainer."""
+    started = data.get("drainerStartedUtc")
+    if not started:
+        return False
+    try:
+        age = (_now() - datetime.fromisoformat(started)).total_seconds()
+    except (TypeError, ValueError):
+        return False
+    return age < DRAINER_STALE_SECONDS
+
+
+def enqueue_in_progress(pull_request_id: int, file_path: str) -> bool:
+    """
+    Queue marking a file "In Progress".
+
+    Args:
+        pull_request_id: PR ID
+        file_path: File whose review prompt is being served
+
+    Returns:
+        True if the caller must start a drainer (none is running)
+    """
+    from .review_state import normalize_file_path
+
+    normalized = normalize_file_path(file_path)
+    with _locked_outbox(pull_request_id) as data:
+        if not any(op.get("op") == OP_IN_PROGRESS and op.get("file") == normalized for op in data["ops"]):
+            data["ops"].append({"op": OP_IN_PROGRESS, "file": normalized, "queuedUtc": _now().isoformat()})
+        if _drainer_running(data):
+            return False
+        data["drainerStartedUtc"] = _now().isoformat()
+        return True
+
+
+def queue_in_progress_update(pull_request_id: int, file_path: str) -> Optional[str]:
+    """
+    Mark a file "In Progress" in the background.
+
+    Queues the update and starts a drainer unless one is already running.
+    Nothing is queued without a review-state.json (legacy review flow).
+
+    Returns:
+        The ID of the drainer task started, or None if none was needed
+    """
+    from .review_state import get_review_state_file_path
+
+    if not get_review_state_file_path(pull_request_id).exists():
+        return None
+    if not enqueue_in_progress(pull_request_id, file_path):
+        return None
+
+    from ...background_tasks import run_function_in_background
+
+    try:
+        task = run_function_in_background(
+            module_path="agentic_devtools.cli.azure_devops.submission_outbox",
+            function_name="drain_submission_outbox",
+            command_display_name="agdt-review-outbox-drain",
+        )
+    except BaseException:
+        # No drainer is running after all; let the next enqueue start one
+        with _locked_outbox(pull_request_id) as data:
+            data["drainerStartedUtc"] = None
+        raise
+    return task.id
+
+
+def _peek_ops(pull_request_id: int) -> List[Dict[str, Any]]:
+    """
+    Get the queued updates, or release the drainer flag if there are none.
+
+    Returns:
+        The queued updates, oldest first
+    """
+    with _locked_outbox(pull_request_id) as data:
+        if not data["ops"]:
+            data["drainerStartedUtc"] = None
+        else:
+            # Keep the flag fresh while this drainer works through batches
+            data["drainerStartedUtc"] = _now().isoformat()
+        return list(data["ops"])
+
+
+def _remove_ops(pull_request_id: int, count: int) -> None:
+    """Remove the oldest ``count`` updates once they have been flushed."""
+    with _locked_outbox(pull_request_id) as data:
+        del data["ops"][:count]
+
+
+def drain_pull_request_outbox(pull_request_id: int) -> int:
+    """
+    Flush a PR's outbox until it is empty.
+
+    A batch that fails to flush is reported and dropped, like a failed
+    foreground update used to be, so one bad update can't wedge the outbox.
+
+    Returns:
+        Number of updates processed
+    """
+    from .file_review_commands import flush_in_progress_files
+
+    processed = 0
+    while True:
+        ops = _peek_ops(pull_request_id)
+        if not ops:
+            return processed
+
+        files = list(dict.fromkeys(op["file"] for op in ops if op.get("op") == OP_IN_PROGRESS and op.get("file")))
+        try:
+            flush_in_progress_files(pull_request_id, files)
+        except Exception as e:
+            print(f"Warning: Could not apply in-progress status for {', '.join(files)}: {e}", file=sys.stderr)
+        _remove_ops(pull_request_id, len(ops))
+        processed += len(ops)
+
+
+def drain_submission_outbox() -> None:
+    """
+    Background entry point: flush the outbox of the PR in state.
+
+    State keys read:
+        - pull_request_id (required): Pull request ID
+    """
+    from ...state import get_pull_request_id
+
+    pull_request_id = get_pull_request_id(required=True)
+    processed = drain_pull_request_outbox(pull_request_id)
+    print(f"Flushed {processed} queued review update(s) for PR {pull_request_id}.")
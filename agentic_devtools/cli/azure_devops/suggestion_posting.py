@@ -0,0 +1,306 @@
+"""
+Concurrent, idempotent posting of suggestion threads for request-changes.
+
+request_changes posts one line-anchored thread per suggestion. This module
+posts them with bounded concurrency over one pooled HTTP session:
+
+- Deduplication: each suggestion is identified by a hash of its content
+  and anchor (line range, severity, scope, link text). Suggestions whose
+  hash is already in review state, or repeated within the batch, are not
+  posted again.
+- Throttling: a 429/503 response pauses every worker for the response's
+  ``Retry-After`` interval before the request is retried.
+- Journal: each created thread is appended to a per-PR journal file as
+  soon as its POST returns. Only the calling thread writes the journal;
+  workers just return responses. The journal is replayed into review
+  state by the next run, so a run killed before review-state.json was
+  saved doesn't post the same threads again.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .helpers import (
+    DEFAULT_MAX_WORKERS,
+    THROTTLED_STATUS_CODES,
+    RetryAfterGate,
+    build_thread_context,
+    retry_after_seconds,
+)
+from .review_state import (
+    ReviewState,
+    SuggestionEntry,
+    add_suggestion_to_file,
+    get_review_state_file_path,
+    normalize_file_path,
+)
+
+SUGGESTION_JOURNAL_FILENAME = "suggestion-journal.jsonl"
+
+# Attempts per thread POST when Azure DevOps throttles the request
+_POST_MAX_ATTEMPTS = 3
+
+
+def suggestion_key(line: int, end_line: int, severity: str, content: str, out_of_scope: bool, link_text: str) -> str:
+    """
+    Get the deduplication hash of a suggestion.
+
+    Returns:
+        Hex SHA-256 of the suggestion's anchor and content
+    """
+    payload = json.dumps([line, end_line, severity, out_of_scope, link_text, content], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def entry_key(entry: SuggestionEntry) -> str:
+    """Get the deduplication hash of a suggestion already in review state."""
+    return suggestion_key(entry.line, entry.endLine, entry.severity, entry.content, entry.outOfScope, entry.linkText)
+
+
+@dataclass
+class PendingSuggestion:
+    """A validated suggestion that still needs a thread."""
+
+    line: int
+    end_line: int
+    severity: str
+    content: str
+    out_of_scope: bool
+    link_text: str
+
+    @property
+    def key(self) -> str:
+        """Deduplication hash (see suggestion_key)."""
+        return suggestion_key(self.line, self.end_line, self.severity, self.content, self.out_of_scope, self.link_text)
+
+    def to_entry(self, thread_id: int, comment_id: int) -> SuggestionEntry:
+        """Build the review state entry for the thread created for this suggestion."""
+        return SuggestionEntry(
+            threadId=thread_id,
+            commentId=comment_id,
+            line=self.line,
+            endLine=self.end_line,
+            severity=self.severity,
+            outOfScope=self.out_of_scope,
+            linkText=self.link_text,
+            content=self.content,
+        )
+
+
+def plan_suggestions(suggestions: List[Dict[str, Any]], existing: Iterable[SuggestionEntry]) -> List[PendingSuggestion]:
+    """
+    Turn validated suggestion objects into the suggestions still to post.
+
+    Link text defaults to "line X" or "lines X - Y". Suggestions matching
+    an existing entry, or an earlier suggestion in the list, are dropped.
+
+    Args:
+        suggestions: Validated ``file_review.suggestions`` objects.
+        existing: Suggestions already in review state for the file.
+
+    Returns:
+        Suggestions to post, in input order
+    """
+    seen = {entry_key(entry) for entry in existing}
+    pending: List[PendingSuggestion] = []
+    for s in suggestions:
+        line = s["line"]
+        end_line = s.get("end_line", line)
+        if s.get("link_text"):
+            link_text = s["link_text"]
+        elif end_line != line:
+            link_text = f"lines {line} - {end_line}"
+        else:
+            link_text = f"line {line}"
+
+        suggestion = PendingSuggestion(
+            line=line,
+            end_line=end_line,
+            severity=s["severity"],
+            content=s["content"],
+            out_of_scope=s.get("out_of_scope", False),
+            link_text=link_text,
+        )
+        key = suggestion.key
+        if key not in seen:
+            seen.add(key)
+            pending.append(suggestion)
+    return pending
+
+
+def get_suggestion_journal_path(pr_id: int) -> Path:
+    """
+    Get the path of a PR's suggestion journal.
+
+    Returns:
+        Path to suggestion-journal.jsonl next to review-state.json
+    """
+    return get_review_state_file_path(pr_id).with_name(SUGGESTION_JOURNAL_FILENAME)
+
+
+class SuggestionJournal:
+    """
+    Append-only record of suggestion threads created but not yet saved.
+
+    Each line is ``{"file": <normalized path>, "entry": <SuggestionEntry>}``,
+    flushed to disk before the next thread is recorded.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def append(self, file_path: str, entry: SuggestionEntry) -> None:
+        """Record a created thread."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"file": normalize_file_path(file_path), "entry": entry.to_dict()}, ensure_ascii=False)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def replay(self, review_state: ReviewState) -> int:
+        """
+        Add recorded threads missing from review state.
+
+        Lines for files no longer in review state, and a torn last line
+        from a run killed mid-write, are skipped.
+
+        Returns:
+            Number of suggestions added
+        """
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return 0
+
+        known: Dict[str, set] = {}
+        added = 0
+        for raw in lines:
+            try:
+                record = json.loads(raw)
+                file_path = record["file"]
+                entry = SuggestionEntry.from_dict(record["entry"])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+            if file_path not in review_state.files:
+                continue
+            if file_path not in known:
+                known[file_path] = {entry_key(e) for e in review_state.files[file_path].suggestions}
+            key = entry_key(entry)
+            if key not in known[file_path]:
+                known[file_path].add(key)
+                add_suggestion_to_file(review_state, file_path, entry)
+                added += 1
+        return added
+
+    def clear(self) -> None:
+        """Delete the journal once review state holding its threads has been saved."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _post_thread(
+    session, gate: RetryAfterGate, threads_url: str, headers: Dict[str, str], body: Dict[str, Any]
+) -> Tuple[int, int]:
+    """
+    POST one thread, waiting out throttling.
+
+    Returns:
+        Tuple of (thread ID, first comment ID)
+    """
+    attempt = 1
+    while True:
+        gate.wait()
+        response = session.post(threads_url, headers=headers, json=body, timeout=30)
+        if response.status_code in THROTTLED_STATUS_CODES and attempt < _POST_MAX_ATTEMPTS:
+            gate.pause(retry_after_seconds(response))
+            attempt += 1
+            continue
+        response.raise_for_status()
+        result = response.json()
+        return result["id"], result["comments"][0]["id"]
+
+
+def post_suggestion_threads(
+    session,
+    headers: Dict[str, str],
+    threads_url: str,
+    review_state: ReviewState,
+    file_path: str,
+    pending: List[PendingSuggestion],
+    journal: SuggestionJournal,
+    max_workers: Optional[int] = None,
+) -> List[SuggestionEntry]:
+    """
+    Create a line-anchored thread for each pending suggestion.
+
+    Threads are POSTed concurrently. Each created thread is journaled as
+    soon as its response arrives, and all created threads are added to the
+    file's suggestions in input order, even if another POST failed.
+
+    Args:
+        session: HTTP session (see helpers.create_pooled_session).
+        headers: Auth headers for API calls.
+        threads_url: The pull request's threads API URL.
+        review_state: Review state to add the created suggestions to.
+        file_path: File the suggestions are anchored in.
+        pending: Suggestions to post (see plan_suggestions).
+        journal: Journal recording created threads.
+        max_workers: Maximum POSTs in flight (default: DEFAULT_MAX_WORKERS).
+
+    Returns:
+        The created suggestion entries, in input order
+
+    Raises:
+        Exception: The first POST failure, after the POSTs already in
+            flight have finished and been recorded.
+    """
+    normalized = normalize_file_path(file_path)
+    gate = RetryAfterGate()
+    created: List[Optional[SuggestionEntry]] = [None] * len(pending)
+    workers = min(max_workers or DEFAULT_MAX_WORKERS, len(pending)) or 1
+
+    def _submit(executor: ThreadPoolExecutor, suggestion: PendingSuggestion) -> Future:
+        body = {
+            "comments": [{"content": suggestion.content, "commentType": "text"}],
+            "status": "active",
+            "threadContext": build_thread_context(normalized, suggestion.line, suggestion.end_line),
+        }
+        return executor.submit(_post_thread, session, gate, threads_url, headers, body)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {_submit(executor, suggestion): i for i, suggestion in enumerate(pending)}
+            remaining = set(futures)
+            error: Optional[BaseException] = None
+            while remaining:
+                done, remaining = wait(remaining, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    if future.exception() is not None:
+                        if error is None:
+                            error = future.exception()
+                            for other in remaining:
+                                other.cancel()
+                        continue
+                    # Single writer: only this thread touches the journal and review state
+                    index = futures[future]
+                    entry = pending[index].to_entry(*future.result())
+                    journal.append(normalized, entry)
+                    created[index] = entry
+            if error is not None:
+                raise error
+    finally:
+        for entry in created:
+            if entry is not None:
+                add_suggestion_to_file(review_state, normalized, entry)
+
+    return [entry for entry in created if entry is not None]
@@ -0,0 +1,231 @@
+"""
+Bulk status updates for pull request threads.
+
+Resolving a file's threads used to GET every thread of the PR and then
+PATCH the matching threads one at a time. This module instead:
+
+- Keeps a ThreadIndex of the PR's threads on disk (``thread-index.json``
+  next to queue.json), with the ETag of the response it was built from.
+  The next fetch sends ``If-None-Match``, and a 304 reuses the cached
+  threads instead of downloading them all again.
+- PATCHes thread statuses concurrently over one pooled session. A 429/503
+  response pauses every worker for the response's ``Retry-After`` interval
+  before the PATCH is retried.
+- Reports the outcome of every PATCH instead of stopping at the first
+  failure.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ...state import get_state_dir
+from .config import AzureDevOpsConfig
+from .helpers import (
+    DEFAULT_MAX_WORKERS,
+    THROTTLED_STATUS_CODES,
+    RetryAfterGate,
+    get_thread_file_path,
+    path_key,
+    retry_after_seconds,
+)
+
+THREAD_INDEX_FILENAME = "thread-index.json"
+
+# Statuses of threads that still need attention
+UNRESOLVED_STATUSES = ("active", "pending")
+
+# Attempts per status PATCH when Azure DevOps throttles the request
+_PATCH_MAX_ATTEMPTS = 3
+
+
+class ThreadIndex:
+    """A PR's threads, indexed by thread ID and by file path."""
+
+    def __init__(self, threads: List[Dict[str, Any]], etag: Optional[str] = None):
+        self.threads = threads
+        self.etag = etag
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        self._by_path: Dict[str, List[Dict[str, Any]]] = {}
+        for thread in threads:
+            if "id" not in thread:
+                continue
+            self._by_id[thread["id"]] = thread
+            key = path_key(get_thread_file_path(thread))
+            if key:
+                self._by_path.setdefault(key, []).append(thread)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ThreadIndex":
+        """Rebuild an index saved with to_dict."""
+        return cls(data["threads"], etag=data.get("etag"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index for the on-disk cache."""
+        return {"etag": self.etag, "threads": self.threads}
+
+    def get(self, thread_id: int) -> Optional[Dict[str, Any]]:
+        """Get a thread by ID."""
+        return self._by_id.get(thread_id)
+
+    def for_file(self, file_path: str, statuses: Iterable[str] = UNRESOLVED_STATUSES) -> List[Dict[str, Any]]:
+        """Get the threads anchored to a file (any spelling of its path) with one of the given statuses."""
+        key = path_key(file_path)
+        wanted = set(statuses)
+        return [t for t in self._by_path.get(key, []) if t.get("status") in wanted] if key else []
+
+    def set_status(self, thread_id: int, status: str) -> None:
+        """Record a thread's new status after it was PATCHed."""
+        thread = self._by_id.get(thread_id)
+        if thread is not None:
+            thread["status"] = status
+
+
+def get_thread_index_path(pull_request_id: int) -> Path:
+    """Get the path to a PR's cached thread index (next to its queue.json)."""
+    return get_state_dir() / "pull-request-review" / "prompts" / str(pull_request_id) / THREAD_INDEX_FILENAME
+
+
+def _read_cached_index(pull_request_id: int) -> Optional[ThreadIndex]:
+    """Read the cached thread index, or None if there is no usable cache."""
+    try:
+        data = json.loads(get_thread_index_path(pull_request_id).read_text(encoding="utf-8"))
+        return ThreadIndex.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_thread_index(pull_request_id: int, index: ThreadIndex) -> None:
+    """Write a PR's thread index cache atomically."""
+    path = get_thread_index_path(pull_request_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=".thread-index-", suffix=".json", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def load_thread_index(session, headers: Dict[str, str], threads_url: str, pull_request_id: int) -> ThreadIndex:
+    """
+    Get the PR's threads, revalidating the cached index with its ETag.
+
+    Responses with an ETag are cached; without one, the threads are simply
+    fetched every time.
+
+    Args:
+        session: HTTP session or requests module.
+        headers: Auth headers for API calls.
+        threads_url: The pull request's threads API URL.
+        pull_request_id: Pull request ID (selects the cache file).
+
+    Returns:
+        The cached index if the server answered 304, else a fresh index
+
+    Raises:
+        requests.HTTPError: If the threads can't be fetched
+    """
+    cached = _read_cached_index(pull_request_id)
+    request_headers = dict(headers)
+    if cached is not None and cached.etag:
+        request_headers["If-None-Match"] = cached.etag
+
+    response = session.get(threads_url, headers=request_headers, timeout=30)
+    if response.status_code == 304 and cached is not None:
+        return cached
+    response.raise_for_status()
+
+    index = ThreadIndex(response.json().get("value", []), etag=response.headers.get("ETag"))
+    if index.etag:
+        save_thread_index(pull_request_id, index)
+    return index
+
+
+@dataclass
+class ThreadStatusResult:
+    """Outcome of one thread's status PATCH."""
+
+    thread_id: int
+    status: str
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the thread's status was changed."""
+        return self.error is None
+
+
+def _patch_status(session, gate: RetryAfterGate, url: str, headers: Dict[str, str], status: str) -> None:
+    """PATCH one thread's status, waiting out throttling."""
+    attempt = 1
+    while True:
+        gate.wait()
+        response = session.patch(url, headers=headers, json={"status": status}, timeout=30)
+        if response.status_code in THROTTLED_STATUS_CODES and attempt < _PATCH_MAX_ATTEMPTS:
+            gate.pause(retry_after_seconds(response))
+            attempt += 1
+            continue
+        response.raise_for_status()
+        return
+
+
+def update_thread_statuses(
+    session,
+    headers: Dict[str, str],
+    config: AzureDevOpsConfig,
+    repo_id: str,
+    pull_request_id: int,
+    thread_ids: List[int],
+    status: str = "closed",
+    max_workers: Optional[int] = None,
+) -> List[ThreadStatusResult]:
+    """
+    Set the status of many threads concurrently.
+
+    Args:
+        session: HTTP session (see helpers.create_pooled_session).
+        headers: Auth headers for API calls.
+        config: Azure DevOps configuration.
+        repo_id: Repository ID.
+        pull_request_id: Pull request ID.
+        thread_ids: Threads to update.
+        status: New status value (e.g. "closed" or "fixed").
+        max_workers: Maximum PATCHes in flight (default: DEFAULT_MAX_WORKERS).
+
+    Returns:
+        One result per thread, in input order
+    """
+    if not thread_ids:
+        return []
+
+    gate = RetryAfterGate()
+    workers = min(max_workers or DEFAULT_MAX_WORKERS, len(thread_ids))
+    results: List[ThreadStatusResult] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _patch_status,
+                session,
+                gate,
+                config.build_api_url(repo_id, "pullRequests", pull_request_id, "threads", thread_id),
+                headers,
+                status,
+            )
+            for thread_id in thread_ids
+        ]
+        for thread_id, future in zip(thread_ids, futures):
+            try:
+                future.result()
+                results.append(ThreadStatusResult(thread_id=thread_id, status=status))
+            except Exception as e:
+                results.append(ThreadStatusResult(thread_id=thread_id, status=status, error=str(e)))
+    return results
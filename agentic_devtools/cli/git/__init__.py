@@ -15,7 +15,8 @@ Key advantage over PowerShell: multiline commit messages work natively
 without replacement tokens or line-by-line builders!
 
 Diff helpers provide utilities for extracting change information between refs,
-used by PR analysis workflows.
+used by PR analysis workflows. GitObjectReader resolves refs and reads blobs
+through one long-lived git cat-file process.
 """
 
 from .async_commands import (
@@ -36,6 +37,7 @@ from .commands import (
     stage_cmd,
     sync_cmd,
 )
+from .core import GitObjectInfo, GitObjectReader
 from .diff import (
     AddedLine,
     AddedLinesInfo,
@@ -44,7 +46,9 @@ from .diff import (
     get_diff_entries,
     get_diff_patch,
     normalize_ref_name,
+    plan_ref_fetch,
     sync_git_ref,
+    sync_git_refs,
 )
 from .operations import (
     CheckoutResult,
@@ -72,12 +76,17 @@ __all__ = [
     "push_async",
     "force_push_async",
     "publish_async",
+    # Object lookups
+    "GitObjectInfo",
+    "GitObjectReader",
     # Diff helpers
     "DiffEntry",
     "AddedLine",
     "AddedLinesInfo",
     "normalize_ref_name",
     "sync_git_ref",
+    "sync_git_refs",
+    "plan_ref_fetch",
     "get_diff_entries",
     "get_added_lines_info",
     "get_diff_patch",
@@ -4,16 +4,23 @@ Core utilities for git CLI commands.
 This module provides low-level helpers used by git operations:
 - State management helpers
 - Git command execution
+- Long-lived git cat-file co-process for object lookups
+- A lock that serializes fetches into one repository
 - Temporary file handling
 """
 
+import os
+import subprocess
 import sys
 import tempfile
-from contextlib import contextmanager
+import threading
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from subprocess import CompletedProcess
-from typing import Generator
+from typing import IO, Dict, Generator, List, Optional, Sequence, Tuple
 
+from ...file_locking import FileLockError, locked_file
 from ...state import get_value
 from ..subprocess_utils import run_safe
 
@@ -28,6 +35,12 @@ STATE_SKIP_REBASE = "skip_rebase"
 # Boolean truthy values for state parsing
 _TRUTHY_VALUES = (True, "true", "1", "yes")
 
+# Lock file in the common git directory that fetches are serialized on
+FETCH_LOCK_FILENAME = "agdt-fetch.lock"
+
+# How long to wait for another process's fetch before fetching anyway
+FETCH_LOCK_TIMEOUT = 600.0
+
 
 def get_bool_state(key: str, default: bool = False) -> bool:
     """
@@ -102,6 +115,148 @@ def get_current_branch() -> str:
     return branch
 
 
+@dataclass
+class GitObjectInfo:
+    """SHA, type and size of a git object, as reported by git cat-file."""
+
+    sha: str
+    type: str  # blob, tree, commit or tag
+    size: int
+
+
+class GitObjectReader:
+    """
+    Long-lived ``git cat-file`` co-process for resolving refs and reading blobs.
+
+    Each ``git rev-parse`` or ``git show`` call costs a git process. A reader
+    starts ``git cat-file --batch-check`` (for lookups) and ``git cat-file
+    --batch`` (for contents) the first time each is needed and sends every
+    request over their pipes. The ``*_many`` methods write all requests from
+    a feeder thread while reading the answers, so git works through them
+    without a round trip per request.
+
+    Names are anything git accepts as an object name: refs (``origin/main``),
+    SHAs, or ``<rev>:<path>`` for a file at a commit.
+
+    Use as a context manager so the git processes are closed::
+
+        with GitObjectReader() as reader:
+            sha = reader.resolve("origin/main")
+            text = reader.read_text("HEAD:README.md")
+    """
+
+    def __init__(self, cwd: Optional[str] = None):
+        self.cwd = cwd
+        self._processes: Dict[str, subprocess.Popen] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the git processes."""
+        with self._lock:
+            for process in self._processes.values():
+                try:
+                    process.stdin.close()
+                    process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    process.kill()
+            self._processes.clear()
+
+    def info(self, name: str) -> Optional[GitObjectInfo]:
+        """Look up an object, or None if it doesn't exist."""
+        return self.info_many([name])[0]
+
+    def info_many(self, names: Sequence[str]) -> List[Optional[GitObjectInfo]]:
+        """Look up several objects with one pipelined round trip, in order."""
+        return [info for info, _ in self._query("--batch-check", names)]
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Get the SHA an object name points at, or None if it doesn't exist."""
+        info = self.info(name)
+        return info.sha if info else None
+
+    def resolve_many(self, names: Sequence[str]) -> Dict[str, Optional[str]]:
+        """Resolve several object names, mapping each to its SHA or None."""
+        return {name: info.sha if info else None for name, info in zip(names, self.info_many(names))}
+
+    def read(self, name: str) -> Optional[bytes]:
+        """Read an object's contents, or None if it doesn't exist."""
+        return self.read_many([name])[0]
+
+    def read_many(self, names: Sequence[str]) -> List[Optional[bytes]]:
+        """Read several objects' contents with one pipelined round trip, in order."""
+        return [content for _, content in self._query("--batch", names)]
+
+    def read_text(self, name: str, encoding: str = "utf-8") -> Optional[str]:
+        """Read a blob as text (undecodable bytes are replaced), or None if it doesn't exist."""
+        content = self.read(name)
+        return content.decode(encoding, errors="replace") if content is not None else None
+
+    def _process(self, mode: str) -> subprocess.Popen:
+        """Get the cat-file process for a mode, starting it if needed."""
+        process = self._processes.get(mode)
+        if process is None or process.poll() is not None:
+            process = subprocess.Popen(
+                ["git", "cat-file", mode],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.cwd,
+            )
+            self._processes[mode] = process
+        return process
+
+    def _query(self, mode: str, names: Sequence[str]) -> List[Tuple[Optional[GitObjectInfo], Optional[bytes]]]:
+        """Send requests to a cat-file process and read (info, content) answers."""
+        for name in names:
+            if "\n" in name or not name:
+                raise ValueError(f"Invalid git object name: {name!r}")
+        if not names:
+            return []
+
+        with self._lock:
+            process = self._process(mode)
+            request = "".join(f"{name}\n" for name in names).encode("utf-8")
+            # Feed requests while reading answers, so neither pipe fills up and blocks
+            feeder = threading.Thread(target=_write_requests, args=(process.stdin, request), daemon=True)
+            feeder.start()
+            try:
+                return [self._read_answer(process.stdout, mode == "--batch") for _ in names]
+            finally:
+                feeder.join()
+
+    @staticmethod
+    def _read_answer(stdout: IO[bytes], with_content: bool) -> Tuple[Optional[GitObjectInfo], Optional[bytes]]:
+        """Read one answer: ``<sha> <type> <size>`` (plus contents) or ``<name> missing``."""
+        header = stdout.readline()
+        if not header:
+            raise RuntimeError("git cat-file exited unexpectedly")
+        parts = header.decode("utf-8", errors="replace").rstrip("\n").split(" ")
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None, None  # "<name> missing" or "<name> ambiguous"
+
+        info = GitObjectInfo(sha=parts[0], type=parts[1], size=int(parts[2]))
+        content = None
+        if with_content:
+            content = stdout.read(info.size)
+            stdout.read(1)  # Newline after the contents
+        return info, content
+
+
+def _write_requests(stdin: IO[bytes], request: bytes) -> None:
+    """Write requests to a cat-file process (runs on a feeder thread)."""
+    try:
+        stdin.write(request)
+        stdin.flush()
+    except OSError:
+        pass  # The reader sees the process exit
+
+
 def get_commit_message() -> str:
     """
     Get the commit message from state.
@@ -150,3 +305,62 @@ def temp_message_file(message: str) -> Generator[str, None, None]:
             Path(temp_file.name).unlink(missing_ok=True)
         except OSError:
             pass  # Best effort cleanup
+
+
+def find_git_common_dir(start: Optional[str] = None) -> Optional[Path]:
+    """
+    Find the git directory shared by a repository and all of its worktrees.
+
+    Reads ``.git`` (and, in a worktree, its ``commondir`` file) directly
+    rather than running ``git rev-parse --git-common-dir``.
+
+    Args:
+        start: Directory inside the repository (default: the working directory)
+
+    Returns:
+        Path of the common git directory, or None outside a repository
+    """
+    path = Path(start or os.getcwd()).resolve()
+    for directory in (path, *path.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if not dot_git.is_file():
+            continue
+        try:
+            content = dot_git.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = (directory / content[len("gitdir:") :].strip()).resolve()
+        try:
+            common_dir = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        except OSError:
+            return git_dir  # Not a worktree (e.g. a submodule): its git dir is its own
+        return (git_dir / common_dir).resolve()
+    return None
+
+
+@contextmanager
+def fetch_lock(repo_path: Optional[str] = None) -> Generator[None, None, None]:
+    """
+    Serialize ``git fetch`` runs into one repository.
+
+    Fetches into the same repository at the same time (a worktree pool
+    refill in the background and a fetch in a worktree, say) race for the
+    same ref locks, and one of them fails. The lock file lives in the common
+    git directory, so every worktree of the repository shares it. If the
+    lock can't be taken within FETCH_LOCK_TIMEOUT, the fetch runs anyway.
+
+    Args:
+        repo_path: Directory inside the repository (default: the working directory)
+    """
+    with ExitStack() as stack:
+        common_dir = find_git_common_dir(repo_path)
+        if common_dir is not None:
+            try:
+                stack.enter_context(locked_file(common_dir / FETCH_LOCK_FILENAME, "a", timeout=FETCH_LOCK_TIMEOUT))
+            except (FileLockError, OSError) as exc:
+                print(f"Warning: fetching without the fetch lock: {exc}", file=sys.stderr)
+        yield
@@ -7,9 +7,10 @@ useful for PR analysis and code review workflows.
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ..subprocess_utils import run_safe
+from .core import GitObjectReader, fetch_lock
 
 
 @dataclass
@@ -70,7 +71,6 @@ def sync_git_ref(ref: str) -> bool:
 
     # Check if ref exists locally
     result = run_safe(["git", "rev-parse", "--verify", ref], capture_output=True, text=True)
-
     if result.returncode == 0:
         return True
 
@@ -79,10 +79,80 @@ def sync_git_ref(ref: str) -> bool:
     if ref.startswith("origin/"):
         fetch_ref = ref[7:]  # Remove "origin/" prefix
 
-    result = run_safe(["git", "fetch", "origin", fetch_ref], capture_output=True, text=True)
+    with fetch_lock():
+        result = run_safe(["git", "fetch", "origin", fetch_ref], capture_output=True, text=True)
     return result.returncode == 0
 
 
+def plan_ref_fetch(refs: Dict[str, Optional[str]], reader: GitObjectReader) -> List[str]:
+    """
+    Work out which branches have to be fetched from origin.
+
+    A ref needs no fetch if the commit wanted from it is already local or,
+    when no commit is given, if the ref itself exists locally.
+
+    Args:
+        refs: Remote refs like "origin/main", each mapped to the commit
+            needed from it (e.g. a PR's lastMergeTargetCommit), or None.
+        reader: GitObjectReader to check local objects with.
+
+    Returns:
+        Branch names (without the "origin/" prefix) to fetch, in order.
+    """
+    lookups = [commit or ref for ref, commit in refs.items()]
+    found = reader.info_many(lookups) if lookups else []
+
+    branches = []
+    for ref, info in zip(refs, found):
+        branch = ref[7:] if ref.startswith("origin/") else ref
+        if info is None and branch not in branches:
+            branches.append(branch)
+    return branches
+
+
+def _supports_blob_filter() -> bool:
+    """Check whether origin is a partial clone remote, so fetch accepts --filter."""
+    result = run_safe(["git", "config", "--get", "extensions.partialClone"], capture_output=True, text=True)
+    return result.returncode == 0 and result.stdout.strip() == "origin"
+
+
+def sync_git_refs(refs: Dict[str, Optional[str]], reader: GitObjectReader) -> bool:
+    """
+    Make sure several refs (or the commits needed from them) exist locally.
+
+    Everything missing is fetched with a single ``git fetch origin <b1> <b2>``,
+    without tags, and with ``--filter=blob:none`` in partial clones. If that
+    fetch fails (for example because one branch was deleted on the server),
+    each branch is fetched on its own.
+
+    Args:
+        refs: Remote refs like "origin/main", each mapped to the commit
+            needed from it, or None (see plan_ref_fetch).
+        reader: GitObjectReader to check local objects with.
+
+    Returns:
+        True if nothing had to be fetched or every fetch succeeded.
+    """
+    branches = plan_ref_fetch(refs, reader)
+    if not branches:
+        return True
+
+    options = ["--no-tags"]
+    if _supports_blob_filter():
+        options.append("--filter=blob:none")
+
+    with fetch_lock():
+        result = run_safe(["git", "fetch", *options, "origin", *branches], capture_output=True, text=True)
+        if result.returncode == 0 or len(branches) == 1:
+            return result.returncode == 0
+
+        results = [
+            run_safe(["git", "fetch", *options, "origin", branch], capture_output=True, text=True)
+            for branch in branches
+        ]
+    return all(branch_result.returncode == 0 for branch_result in results)
+
+
 def get_diff_entries(base_ref: str, compare_ref: str) -> List[DiffEntry]:
     """
     Get file change entries between two git refs.
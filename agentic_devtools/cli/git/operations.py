@@ -5,12 +5,14 @@ This module provides the individual git operations:
 - Staging changes
 - Creating/amending commits
 - Pushing/publishing branches
-- Branch state detection
+- Branch state detection (answered from a cached RepoSnapshot, which the
+  operations that change the repository invalidate)
 """
 
 from typing import Optional
 
-from .core import get_current_branch, run_git, temp_message_file
+from .core import fetch_lock, get_current_branch, run_git, temp_message_file
+from .snapshot import count_ahead_behind, get_repo_snapshot, invalidate_repo_snapshot
 
 # Auto-generated files that must never be staged or committed.
 # After `git add .`, these are unstaged via `git reset HEAD <file>`.
@@ -36,6 +38,7 @@ def stage_changes(dry_run: bool) -> None:
         return
 
     print("Staging all changes...")
+    invalidate_repo_snapshot()
     run_git("add", ".")
 
     for excluded in STAGE_EXCLUDE_FILES:
@@ -65,6 +68,7 @@ def create_commit(message: str, dry_run: bool) -> None:
 
     print("Creating commit...")
 
+    invalidate_repo_snapshot()
     with temp_message_file(message) as temp_path:
         run_git("commit", "-F", temp_path)
 
@@ -90,6 +94,7 @@ def amend_commit(message: str, dry_run: bool) -> None:
 
     print("Amending commit...")
 
+    invalidate_repo_snapshot()
     with temp_message_file(message) as temp_path:
         run_git("commit", "--amend", "-F", temp_path)
 
@@ -110,6 +115,7 @@ def publish_branch(dry_run: bool) -> None:
         return
 
     print(f"Publishing branch '{branch}'...")
+    invalidate_repo_snapshot()
     run_git("push", "--set-upstream", "origin", branch)
     print("Branch published successfully.")
 
@@ -128,6 +134,7 @@ def force_push(dry_run: bool) -> None:
         return
 
     print("Force pushing changes...")
+    invalidate_repo_snapshot()
     run_git("push", "--force-with-lease")
     print("Changes pushed successfully.")
 
@@ -144,6 +151,7 @@ def push(dry_run: bool) -> None:
         return
 
     print("Pushing changes...")
+    invalidate_repo_snapshot()
     run_git("push")
     print("Changes pushed successfully.")
 
@@ -171,31 +179,19 @@ def branch_has_commits_ahead_of_main(main_branch: str = "main") -> bool:
     Returns:
         True if current branch has commits not in main
     """
-    current = get_current_branch()
-    if current == main_branch:
+    snapshot = get_repo_snapshot()
+    if snapshot.branch is None or snapshot.branch == main_branch:
         return False
 
-    # Check if main branch exists
-    result = run_git("rev-parse", "--verify", f"origin/{main_branch}", check=False)
-    if result.returncode != 0:
-        # Try without origin/
-        result = run_git("rev-parse", "--verify", main_branch, check=False)
-        if result.returncode != 0:
+    # Prefer origin/main, fall back to the local main branch
+    ref = f"origin/{main_branch}"
+    if snapshot.resolve_ref(ref) is None:
+        if snapshot.resolve_ref(main_branch) is None:
             return False
         ref = main_branch
-    else:
-        ref = f"origin/{main_branch}"
-
-    # Count commits ahead
-    result = run_git("rev-list", "--count", f"{ref}..HEAD", check=False)
-    if result.returncode != 0:
-        return False
 
-    try:
-        count = int(result.stdout.strip())
-        return count > 0
-    except ValueError:
-        return False
+    counts = snapshot.ahead_behind(ref)
+    return counts is not None and counts[0] > 0
 
 
 def last_commit_contains_issue_key(issue_key: str) -> bool:
@@ -244,22 +240,7 @@ def has_local_changes() -> bool:
     Returns:
         True if there are uncommitted changes
     """
-    # Check for staged changes
-    result = run_git("diff", "--cached", "--quiet", check=False)
-    if result.returncode != 0:
-        return True
-
-    # Check for unstaged changes
-    result = run_git("diff", "--quiet", check=False)
-    if result.returncode != 0:
-        return True
-
-    # Check for untracked files
-    result = run_git("ls-files", "--others", "--exclude-standard", check=False)
-    if result.returncode == 0 and result.stdout.strip():
-        return True
-
-    return False
+    return get_repo_snapshot().has_local_changes
 
 
 def local_branch_matches_origin() -> bool:
@@ -269,34 +250,13 @@ def local_branch_matches_origin() -> bool:
     Returns:
         True if local and origin are in sync
     """
-    branch = get_current_branch()
-
-    # Check if origin branch exists
-    result = run_git("rev-parse", "--verify", f"origin/{branch}", check=False)
-    if result.returncode != 0:
-        # Origin branch doesn't exist - not in sync
+    snapshot = get_repo_snapshot()
+    if snapshot.branch is None:
         return False
 
-    # Compare local and origin
-    result = run_git("rev-list", "--count", f"origin/{branch}..HEAD", check=False)
-    if result.returncode != 0:
-        return False
-
-    try:
-        ahead = int(result.stdout.strip())
-    except ValueError:
-        return False
-
-    result = run_git("rev-list", "--count", f"HEAD..origin/{branch}", check=False)
-    if result.returncode != 0:
-        return False
-
-    try:
-        behind = int(result.stdout.strip())
-    except ValueError:
-        return False
-
-    return ahead == 0 and behind == 0
+    # A missing origin branch counts as not in sync
+    counts = snapshot.ahead_behind(f"origin/{snapshot.branch}")
+    return counts == (0, 0)
 
 
 class BranchSafetyCheckResult:
@@ -340,17 +300,13 @@ def check_branch_safe_to_recreate(branch_name: str) -> BranchSafetyCheckResult:
     Returns:
         BranchSafetyCheckResult indicating whether it's safe to proceed
     """
-    # Check if the branch exists locally
-    result = run_git("rev-parse", "--verify", branch_name, check=False)
-    local_exists = result.returncode == 0
+    snapshot = get_repo_snapshot()
+    local_commit = snapshot.resolve_ref(f"refs/heads/{branch_name}")
+    origin_commit = snapshot.resolve_ref(f"refs/remotes/origin/{branch_name}")
 
-    # Check if the branch exists on origin
-    result = run_git("rev-parse", "--verify", f"origin/{branch_name}", check=False)
-    origin_exists = result.returncode == 0
-
-    if not local_exists:
+    if local_commit is None:
         # Branch doesn't exist locally - safe to create from origin
-        if origin_exists:
+        if origin_commit is not None:
             return BranchSafetyCheckResult(
                 BranchSafetyCheckResult.SAFE,
                 f"Branch '{branch_name}' doesn't exist locally, will checkout from origin.",
@@ -364,92 +320,46 @@ def check_branch_safe_to_recreate(branch_name: str) -> BranchSafetyCheckResult:
             )
 
     # Branch exists locally - check if we're on it
-    current = get_current_branch()
-    if not current:  # pragma: no cover
+    current = snapshot.branch
+    if not current:
         return BranchSafetyCheckResult(
             BranchSafetyCheckResult.NOT_ON_BRANCH,
             "Detached HEAD state. Cannot safely check branch status.",
             branch_name,
         )
 
-    # If we're on a different branch, we need to be careful
-    if current != branch_name:  # pragma: no cover
-        # Check for uncommitted changes on current branch first
-        if has_local_changes():
-            return BranchSafetyCheckResult(
-                BranchSafetyCheckResult.UNCOMMITTED_CHANGES,
-                f"You have uncommitted changes on branch '{current}'.\n"
-                f"Please commit, stash, or discard them before proceeding.",
-                branch_name,
-            )
-
-        # We'd need to switch branches - check if target branch is safe
-        # Get local and origin commits for target branch
-        local_commit = run_git("rev-parse", branch_name, check=False)
-        origin_commit = run_git("rev-parse", f"origin/{branch_name}", check=False)
-
-        if local_commit.returncode != 0:
-            return BranchSafetyCheckResult(
-                BranchSafetyCheckResult.NOT_ON_BRANCH,
-                f"Cannot determine commit for local branch '{branch_name}'.",
-                branch_name,
-            )
-
-        if origin_commit.returncode != 0:
-            return BranchSafetyCheckResult(
-                BranchSafetyCheckResult.BRANCH_NOT_ON_ORIGIN,
-                f"Branch '{branch_name}' exists locally but not on origin.\nLocal work may be lost if we proceed.",
-                branch_name,
-            )
-
-        if local_commit.stdout.strip() != origin_commit.stdout.strip():
-            return BranchSafetyCheckResult(
-                BranchSafetyCheckResult.DIVERGED_FROM_ORIGIN,
-                f"Local branch '{branch_name}' has diverged from origin.\n"
-                f"Local commits may be lost if we proceed.\n"
-                f"Please push your local changes first, or use a different worktree.",
-                branch_name,
-            )
-
-        return BranchSafetyCheckResult(
-            BranchSafetyCheckResult.SAFE,
-            f"Branch '{branch_name}' is safe to use.",
-            branch_name,
-        )
-
-    # We're on the target branch - check for uncommitted changes
-    if has_local_changes():
+    # Uncommitted changes are at risk whichever branch we're on
+    if snapshot.has_local_changes:
         return BranchSafetyCheckResult(
             BranchSafetyCheckResult.UNCOMMITTED_CHANGES,
-            f"You have uncommitted changes on branch '{branch_name}'.\n"
+            f"You have uncommitted changes on branch '{current}'.\n"
             f"Please commit, stash, or discard them before proceeding.",
             branch_name,
         )
 
-    # Check if local matches origin
-    if not origin_exists:  # pragma: no cover
+    if origin_commit is None:
         return BranchSafetyCheckResult(
             BranchSafetyCheckResult.BRANCH_NOT_ON_ORIGIN,
             f"Branch '{branch_name}' exists locally but not on origin.\nLocal work may be lost if we proceed.",
             branch_name,
         )
 
-    local_commit = run_git("rev-parse", "HEAD", check=False)
-    origin_commit = run_git("rev-parse", f"origin/{branch_name}", check=False)
-
-    if local_commit.returncode != 0 or origin_commit.returncode != 0:  # pragma: no cover
+    # If we're on a different branch we'd need to switch to the target branch
+    on_branch = current == branch_name
+    if local_commit != origin_commit:
+        hint = "Please push your local changes first."
+        if not on_branch:
+            hint = "Please push your local changes first, or use a different worktree."
         return BranchSafetyCheckResult(
-            BranchSafetyCheckResult.NOT_ON_BRANCH,
-            "Cannot determine commit hashes for comparison.",
+            BranchSafetyCheckResult.DIVERGED_FROM_ORIGIN,
+            f"Local branch '{branch_name}' has diverged from origin.\nLocal commits may be lost if we proceed.\n{hint}",
             branch_name,
         )
 
-    if local_commit.stdout.strip() != origin_commit.stdout.strip():
+    if not on_branch:
         return BranchSafetyCheckResult(
-            BranchSafetyCheckResult.DIVERGED_FROM_ORIGIN,
-            f"Local branch '{branch_name}' has diverged from origin.\n"
-            f"Local commits may be lost if we proceed.\n"
-            f"Please push your local changes first.",
+            BranchSafetyCheckResult.SAFE,
+            f"Branch '{branch_name}' is safe to use.",
             branch_name,
         )
 
@@ -476,7 +386,9 @@ def fetch_branch(branch_name: str, dry_run: bool = False) -> bool:
         return True
 
     print(f"Fetching origin/{branch_name}...")
-    result = run_git("fetch", "origin", branch_name, check=False)
+    invalidate_repo_snapshot()
+    with fetch_lock():
+        result = run_git("fetch", "origin", branch_name, check=False)
     if result.returncode != 0:
         print(f"Warning: Failed to fetch origin/{branch_name}")
         if result.stderr:
@@ -503,7 +415,9 @@ def fetch_main(main_branch: str = "main", dry_run: bool = False) -> bool:
         return True
 
     print(f"Fetching latest from origin/{main_branch}...")
-    result = run_git("fetch", "origin", main_branch, check=False)
+    invalidate_repo_snapshot()
+    with fetch_lock():
+        result = run_git("fetch", "origin", main_branch, check=False)
     if result.returncode != 0:
         print(f"Warning: Failed to fetch origin/{main_branch}")
         if result.stderr:
@@ -518,20 +432,17 @@ def get_commits_behind_main(main_branch: str = "main") -> int:
     """
     Get the number of commits the current branch is behind origin/main.
 
+    Asked right after fetch_main, so there is no snapshot to reuse; one
+    rev-list answers it without taking one.
+
     Args:
         main_branch: Name of the main branch (default: "main")
 
     Returns:
         Number of commits behind, or 0 if unable to determine
     """
-    result = run_git("rev-list", "--count", f"HEAD..origin/{main_branch}", check=False)
-    if result.returncode != 0:
-        return 0
-
-    try:
-        return int(result.stdout.strip())
-    except ValueError:
-        return 0
+    counts = count_ahead_behind(f"origin/{main_branch}")
+    return counts[1] if counts is not None else 0
 
 
 class RebaseResult:
@@ -588,6 +499,7 @@ def rebase_onto_main(main_branch: str = "main", dry_run: bool = False) -> Rebase
     print(f"Rebasing onto origin/{main_branch} ({commits_behind} commits behind)...")
 
     # Perform rebase (non-interactive, no editor)
+    invalidate_repo_snapshot()
     result = run_git(
         "rebase",
         f"origin/{main_branch}",
@@ -660,23 +572,19 @@ def checkout_branch(branch_name: str, dry_run: bool = False) -> CheckoutResult:
     Returns:
         CheckoutResult indicating success or the type of failure
     """
-    from .core import get_current_branch
+    snapshot = get_repo_snapshot()
 
-    # Check if already on the branch
-    try:
-        current = get_current_branch()
-        if current == branch_name:
-            print(f"Already on branch '{branch_name}'")
-            return CheckoutResult(CheckoutResult.SUCCESS)
-    except SystemExit:
-        pass  # Could be detached HEAD, continue with checkout
+    # Check if already on the branch (None on a detached HEAD)
+    if snapshot.branch == branch_name:
+        print(f"Already on branch '{branch_name}'")
+        return CheckoutResult(CheckoutResult.SUCCESS)
 
     if dry_run:
         print(f"[DRY RUN] Would checkout branch '{branch_name}'")
         return CheckoutResult(CheckoutResult.SUCCESS)
 
     # Check for uncommitted changes first
-    if has_local_changes():
+    if snapshot.has_local_changes:
         return CheckoutResult(
             CheckoutResult.UNCOMMITTED_CHANGES,
             f"Cannot checkout branch '{branch_name}' - you have uncommitted changes.\n"
@@ -688,6 +596,7 @@ def checkout_branch(branch_name: str, dry_run: bool = False) -> CheckoutResult:
         )
 
     print(f"Checking out branch '{branch_name}'...")
+    invalidate_repo_snapshot()
 
     # First try to checkout existing local branch
     result = run_git("checkout", branch_name, check=False)
@@ -0,0 +1,218 @@
+"""
+Batched repository state for git operations.
+
+A RepoSnapshot answers the questions the commit/amend and branch safety
+logic asks (current branch, HEAD commit, upstream, which refs exist and
+where they point, staged/unstaged/untracked files) with as few git
+processes as possible:
+
+- ``git for-each-ref refs/heads refs/remotes`` gives every branch, which
+  one is checked out, and its upstream.
+- ``git status --porcelain=v2 --branch -z`` (a full working tree scan) is
+  only run when a question about local changes is asked, or when HEAD
+  isn't on a branch with commits (detached or unborn).
+
+The snapshot is cached per working directory. Operations that change the
+repository (staging, committing, fetching, pushing, rebasing, checking
+out) call invalidate_repo_snapshot, so the next question takes a fresh
+snapshot.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .core import run_git
+
+# for-each-ref output format, NUL-separated: SHA, full ref name, "*" if checked out, upstream
+_REF_FORMAT = "%(objectname)%00%(refname)%00%(HEAD)%00%(upstream:short)"
+
+_cached_snapshot: Optional[Tuple[str, "RepoSnapshot"]] = None
+
+
+@dataclass
+class RepoSnapshot:
+    """Point-in-time view of the repository's branch and working tree state."""
+
+    branch: Optional[str]  # None on a detached HEAD
+    head_sha: Optional[str]  # None before the first commit
+    upstream: Optional[str] = None
+    ahead: int = 0  # Commits ahead of the upstream (set from git status)
+    behind: int = 0  # Commits behind the upstream (set from git status)
+    staged: List[str] = field(default_factory=list)
+    unstaged: List[str] = field(default_factory=list)
+    untracked: List[str] = field(default_factory=list)
+    conflicted: List[str] = field(default_factory=list)
+    refs: Dict[str, str] = field(default_factory=dict)  # Full ref name -> commit SHA
+    # False until git status has filled in the working tree fields and upstream counts
+    status_loaded: bool = field(default=True, repr=False, compare=False)
+    _ahead_behind: Dict[str, Optional[Tuple[int, int]]] = field(default_factory=dict, repr=False, compare=False)
+
+    def load_status(self) -> None:
+        """
+        Fill in the working tree state with git status, unless already done.
+
+        Raises:
+            SystemExit: If git status fails (e.g. not in a git repository)
+        """
+        if self.status_loaded:
+            return
+        status = run_git("status", "--porcelain=v2", "--branch", "--untracked-files=normal", "-z")
+        parse_status(status.stdout, self)
+        self.status_loaded = True
+
+    @property
+    def has_local_changes(self) -> bool:
+        """True if there are staged, unstaged, untracked or conflicted files."""
+        self.load_status()
+        return bool(self.staged or self.unstaged or self.untracked or self.conflicted)
+
+    def resolve_ref(self, name: str) -> Optional[str]:
+        """
+        Get the commit SHA of a branch.
+
+        Args:
+            name: Local branch (``feature/x``), remote branch (``origin/main``)
+                or full ref name (``refs/heads/main``)
+
+        Returns:
+            The commit SHA, or None if no such branch exists
+        """
+        if name.startswith("refs/"):
+            return self.refs.get(name)
+        return self.refs.get(f"refs/heads/{name}") or self.refs.get(f"refs/remotes/{name}")
+
+    def ahead_behind(self, ref: str) -> Optional[Tuple[int, int]]:
+        """
+        Count the commits HEAD is ahead of and behind another branch.
+
+        Answered from the snapshot when HEAD and the branch point at the
+        same commit, or when the branch is the upstream and git status has
+        already run. Otherwise runs one ``git rev-list --left-right --count``,
+        remembered for the lifetime of the snapshot.
+
+        Returns:
+            Tuple of (ahead, behind), or None if HEAD or the branch doesn't
+            exist or git can't compare them
+        """
+        ref_sha = self.resolve_ref(ref)
+        if ref_sha is None or self.head_sha is None:
+            return None
+        if ref_sha == self.head_sha:
+            return 0, 0
+        if self.status_loaded and self.upstream is not None and ref == self.upstream:
+            return self.ahead, self.behind
+        if ref not in self._ahead_behind:
+            self._ahead_behind[ref] = count_ahead_behind(ref)
+        return self._ahead_behind[ref]
+
+
+def count_ahead_behind(ref: str) -> Optional[Tuple[int, int]]:
+    """
+    Run rev-list to count commits HEAD is ahead of and behind a ref.
+
+    Returns:
+        Tuple of (ahead, behind), or None if git can't compare them (e.g.
+        the ref doesn't exist)
+    """
+    result = run_git("rev-list", "--left-right", "--count", f"{ref}...HEAD", check=False)
+    if result.returncode != 0:
+        return None
+    try:
+        behind, ahead = (int(part) for part in result.stdout.split())
+    except ValueError:
+        return None
+    return ahead, behind
+
+
+def parse_status(output: str, snapshot: RepoSnapshot) -> None:
+    """
+    Fill a snapshot from ``git status --porcelain=v2 --branch -z`` output.
+
+    Args:
+        output: NUL-separated status entries
+        snapshot: Snapshot to fill in
+    """
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        if entry.startswith("# "):
+            key, _, value = entry[2:].partition(" ")
+            if key == "branch.oid":
+                snapshot.head_sha = None if value == "(initial)" else value
+            elif key == "branch.head":
+                snapshot.branch = None if value == "(detached)" else value
+            elif key == "branch.upstream":
+                snapshot.upstream = value
+            elif key == "branch.ab":
+                ahead, behind = value.split()
+                snapshot.ahead, snapshot.behind = int(ahead), -int(behind)
+        elif entry.startswith(("1 ", "2 ")):
+            fields = entry.split(" ", 8 if entry[0] == "1" else 9)
+            xy, path = fields[1], fields[-1]
+            if xy[0] != ".":
+                snapshot.staged.append(path)
+            if xy[1] != ".":
+                snapshot.unstaged.append(path)
+            if entry[0] == "2":
+                next(entries, None)  # Original path of the rename/copy
+        elif entry.startswith("u "):
+            snapshot.conflicted.append(entry.split(" ", 10)[-1])
+        elif entry.startswith("? "):
+            snapshot.untracked.append(entry[2:])
+
+
+def parse_refs(output: str, snapshot: RepoSnapshot) -> None:
+    """
+    Fill a snapshot from ``git for-each-ref --format=<_REF_FORMAT>`` output.
+
+    Sets the refs, and the branch, HEAD commit and upstream of the ref
+    marked as checked out (if any).
+
+    Args:
+        output: One ref per line, fields separated by NUL
+        snapshot: Snapshot to fill in
+    """
+    for line in output.splitlines():
+        fields = line.split("\0")
+        if len(fields) < 2 or not fields[0] or not fields[1]:
+            continue
+        sha, name = fields[0], fields[1]
+        snapshot.refs[name] = sha
+        if len(fields) >= 3 and fields[2] == "*" and name.startswith("refs/heads/"):
+            snapshot.branch = name[len("refs/heads/") :]
+            snapshot.head_sha = sha
+            snapshot.upstream = fields[3] if len(fields) >= 4 and fields[3] else None
+
+
+def take_repo_snapshot() -> RepoSnapshot:
+    """
+    Read the branches with one for-each-ref call; git status runs when needed.
+
+    git status runs straight away only if for-each-ref fails or no branch
+    is checked out (detached HEAD, or a branch without commits yet).
+
+    Raises:
+        SystemExit: If git status fails (e.g. not in a git repository)
+    """
+    snapshot = RepoSnapshot(branch=None, head_sha=None, status_loaded=False)
+    refs = run_git("for-each-ref", f"--format={_REF_FORMAT}", "refs/heads", "refs/remotes", check=False)
+    if refs.returncode == 0:
+        parse_refs(refs.stdout, snapshot)
+    if snapshot.head_sha is None:
+        snapshot.load_status()
+    return snapshot
+
+
+def get_repo_snapshot() -> RepoSnapshot:
+    """Get the snapshot for the current directory, taking one if there is none."""
+    global _cached_snapshot
+    cwd = os.getcwd()
+    if _cached_snapshot is None or _cached_snapshot[0] != cwd:
+        _cached_snapshot = (cwd, take_repo_snapshot())
+    return _cached_snapshot[1]
+
+
+def invalidate_repo_snapshot() -> None:
+    """Discard the cached snapshot after a command that changes the repository."""
+    global _cached_snapshot
+    _cached_snapshot = None
@@ -42,11 +42,11 @@ def release_pypi_async() -> None:
 
 
 def _run_tests_and_wait(timeout_seconds: int = 3600) -> int:
-    """Run agdt-test in background and wait for completion."""
+    """Run agdt-test-sharded in background and wait for completion."""
     task = run_function_in_background(
         "agentic_devtools.cli.testing",
-        "_run_tests_sync",
-        command_display_name="agdt-test",
+        "_run_tests_sharded_sync",
+        command_display_name="agdt-test-sharded",
     )
     deadline = time.time() + timeout_seconds
     while time.time() < deadline:
@@ -99,6 +99,10 @@ COMMAND_MAP = {
         "agentic_devtools.cli.azure_devops",
         "approve_file_async_cli",
     ),
+    "agdt-approve-files": (
+        "agentic_devtools.cli.azure_devops",
+        "approve_files_async_cli",
+    ),
     "agdt-submit-file-review": (
         "agentic_devtools.cli.azure_devops",
         "submit_file_review_async",
@@ -205,6 +209,8 @@ COMMAND_MAP = {
     "agdt-test-quick": ("agentic_devtools.cli.testing", "run_tests_quick"),
     "agdt-test-file": ("agentic_devtools.cli.testing", "run_tests_file"),
     "agdt-test-pattern": ("agentic_devtools.cli.testing", "run_tests_pattern"),
+    "agdt-test-affected": ("agentic_devtools.cli.testing", "run_tests_affected"),
+    "agdt-test-sharded": ("agentic_devtools.cli.testing", "run_tests_sharded"),
     # Tasks
     "agdt-tasks": ("agentic_devtools.cli.tasks", "list_tasks"),
     "agdt-task-status": ("agentic_devtools.cli.tasks", "task_status"),
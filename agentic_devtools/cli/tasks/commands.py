@@ -7,9 +7,11 @@ CLI commands for monitoring and managing background tasks.
 import argparse
 import sys
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import List, Optional
 
-from ...background_tasks import get_task_log_content
+from ...background_tasks import follow_log, get_task_log_content, read_log_tail
+from ...task_logs import resolve_log_path
 from ...task_state import (
     BackgroundTask,
     TaskStatus,
@@ -19,6 +21,12 @@ from ...task_state import (
     get_task_by_id,
 )
 
+# Lines of existing output shown before following a log (like tail -f)
+DEFAULT_FOLLOW_TAIL_LINES = 20
+
+# Seconds between checks for new log output in follow mode
+DEFAULT_FOLLOW_POLL_INTERVAL = 0.5
+
 
 def _get_task_id_from_args_or_state(_argv: Optional[List[str]] = None) -> str:
     """
@@ -136,6 +144,17 @@ def _status_indicator(status: TaskStatus) -> str:
     return indicators.get(status, "❓")
 
 
+def _print_worktree_pool_status() -> None:
+    """Print the health of the current repository's worktree pool, if it has one."""
+    from ..workflows.worktree_pool import get_worktree_pool_status
+    from ..workflows.worktree_setup import get_main_repo_root
+
+    repo_root = get_main_repo_root()
+    status = get_worktree_pool_status(repo_root) if repo_root else None
+    if status is not None:
+        print(status.summary())
+
+
 def list_tasks() -> None:
     """
     List all background tasks.
@@ -146,6 +165,7 @@ def list_tasks() -> None:
 
     if not tasks:
         print("No background tasks found.")
+        _print_worktree_pool_status()
         return
 
     # Sort by start_time descending (most recent first)
@@ -177,6 +197,7 @@ def list_tasks() -> None:
         f"{status.value}: {count}" for status, count in sorted(status_counts.items(), key=lambda x: x[0].value)
     )
     print(f"By status: {status_summary}")
+    _print_worktree_pool_status()
 
 
 def task_status(_argv: Optional[List[str]] = None) -> None:
@@ -222,6 +243,97 @@ def task_status(_argv: Optional[List[str]] = None) -> None:
     print(f"{'=' * 60}")
 
 
+def _parse_log_args(_argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse arguments for task_log command (other than --id).
+
+    Args:
+        _argv: Optional list of CLI arguments (for testing)
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--follow",
+        "-f",
+        action="store_true",
+        help="Keep printing new output until the task completes",
+    )
+
+    args, _ = parser.parse_known_args(_argv)
+    return args
+
+
+def _get_log_lines_limit() -> int:
+    """
+    Get the background.log_lines limit from state.
+
+    Returns:
+        Positive for head mode, negative for tail mode, 0 for the whole log
+    """
+    from ...state import get_value
+
+    lines_str = get_value("background.log_lines")
+    if not lines_str:
+        return 0
+    try:
+        return int(lines_str)
+    except ValueError:
+        return 0  # Ignore invalid line count
+
+
+def _follow_task_log(task: BackgroundTask, lines_limit: int) -> None:
+    """
+    Print the end of a task's log, then stream new output until the task finishes.
+
+    Args:
+        task: Task whose log to follow (must have a log file)
+        lines_limit: background.log_lines value; a negative value sets how many
+            existing lines to show first (default: DEFAULT_FOLLOW_TAIL_LINES)
+    """
+    from ...state import get_value
+
+    poll_interval = DEFAULT_FOLLOW_POLL_INTERVAL
+    poll_interval_str = get_value("background.poll_interval")
+    if poll_interval_str:
+        try:
+            poll_interval = float(poll_interval_str)
+        except ValueError:
+            pass  # Keep default
+
+    log_path = Path(task.log_file)
+    tail_lines = -lines_limit if lines_limit < 0 else DEFAULT_FOLLOW_TAIL_LINES
+    try:
+        offset: Optional[int] = log_path.stat().st_size
+        tail_source = log_path
+    except FileNotFoundError:
+        # Already finished and compressed: the whole log is written, nothing to follow
+        offset = None
+        tail_source = resolve_log_path(log_path) or log_path
+
+    print(f"\n--- Following log for task {task.id} (until it completes) ---")
+    print(f"Command: {task.command}")
+    print("-" * 50)
+    tail = read_log_tail(tail_source, tail_lines, end=offset) if tail_source.exists() else ""
+    if tail:
+        print(tail)
+    sys.stdout.flush()
+
+    def is_finished() -> bool:
+        current = get_task_by_id(task.id)
+        return current is None or current.is_terminal()
+
+    if offset is not None:
+        for text in follow_log(log_path, offset, is_finished, poll_interval=poll_interval):
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    print("-" * 50)
+    final = get_task_by_id(task.id) or task
+    _safe_print(f"Status: {_status_indicator(final.status)} {final.status.value}")
+
+
 def task_log(_argv: Optional[List[str]] = None) -> None:
     """
     Display task log contents.
@@ -233,14 +345,17 @@ def task_log(_argv: Optional[List[str]] = None) -> None:
 
     CLI args:
         --id: Task ID to show log for (overrides state, updates background.task_id)
+        --follow, -f: Show the end of the log, then keep printing new output
+            until the task reaches a terminal state (finished tasks are shown
+            as without --follow)
 
     Reads task ID from state: background.task_id (if --id not provided)
     Optional state keys:
     - background.log_lines: Number of lines to show (default: all, use negative for tail)
+    - background.poll_interval: Seconds between checks for new output in follow mode (default: 0.5)
     """
-    from ...state import get_value
-
     task_id = _get_task_id_from_args_or_state(_argv)
+    args = _parse_log_args(_argv)
 
     task = get_task_by_id(task_id)
 
@@ -248,32 +363,27 @@ def task_log(_argv: Optional[List[str]] = None) -> None:
         print(f"Error: Task '{task_id}' not found.")
         sys.exit(1)
 
-    log_content = get_task_log_content(task_id)
+    lines_limit = _get_log_lines_limit()
 
-    if log_content is None:  # pragma: no cover
+    # Only a plain log can still grow; once the task finishes its log is compressed
+    if args.follow and task.log_file and Path(task.log_file).exists():
+        _follow_task_log(task, lines_limit)
+        return
+
+    # Tail mode reads backwards from the end, head mode stops after N lines
+    if lines_limit < 0:
+        log_content = get_task_log_content(task_id, tail_lines=-lines_limit)
+    elif lines_limit > 0:
+        log_content = get_task_log_content(task_id, head_lines=lines_limit)
+    else:
+        log_content = get_task_log_content(task_id)
+
+    if log_content is None:
         print(f"No log file available for task '{task_id}'.")
         if task.log_file:
             print(f"Expected log file: {task.log_file}")
         sys.exit(1)
 
-    # Check for line limit
-    lines_str = get_value("background.log_lines")
-    if lines_str:
-        try:
-            lines_limit = int(lines_str)
-            log_lines = log_content.splitlines()
-
-            if lines_limit < 0:
-                # Tail mode: show last N lines
-                log_lines = log_lines[lines_limit:]
-            elif lines_limit > 0:
-                # Head mode: show first N lines
-                log_lines = log_lines[:lines_limit]
-
-            log_content = "\n".join(log_lines)
-        except ValueError:
-            pass  # Ignore invalid line count
-
     print(f"\n--- Log for task {task_id} ---")
     print(f"Command: {task.command}")
     _safe_print(f"Status: {_status_indicator(task.status)} {task.status.value}")
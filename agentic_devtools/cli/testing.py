@@ -16,6 +16,8 @@ Commands:
 - agdt-test-quick: Fast run without coverage
 - agdt-test-file: Run tests matching a pattern from state
 - agdt-test-pattern <args>: Run specific tests with pytest arguments
+- agdt-test-affected: Run only the tests affected by changes since the merge base
+- agdt-test-sharded: Full test suite split across parallel worker processes
 
 After starting a test command, use:
 - agdt-task-wait: Wait for completion and see results
@@ -29,7 +31,9 @@ DO NOT:
 import argparse
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
+from typing import Dict
 
 from agentic_devtools.background_tasks import run_function_in_background
 from agentic_devtools.task_state import print_task_tracking_info
@@ -244,6 +248,187 @@ def _run_tests_file_sync() -> int:
     return _run_subprocess_with_streaming(args, cwd=str(package_root))
 
 
+def _run_full_suite_and_rebuild_impact_cache(package_root: Path, base_commit: str, cache_path: Path) -> int:
+    """
+    Run the full suite with per-test coverage contexts and rebuild the impact cache.
+
+    Returns pytest exit code.
+    """
+    from agentic_devtools.cli import testing_impact
+
+    exit_code = _run_subprocess_with_streaming(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            str(package_root / "tests"),
+            "-v",
+            "--tb=short",
+            "-o",
+            "addopts=",  # Clear default addopts; coverage is configured below
+            f"--cov={package_root / 'agentic_devtools'}",
+            "--cov-context=test",
+            "--cov-report=term-missing",
+        ],
+        cwd=str(package_root),
+    )
+
+    test_map = testing_impact.load_coverage_test_map(package_root / ".coverage", package_root)
+    if test_map is None:
+        print("Warning: No coverage data found; test impact cache not updated.", file=sys.stderr)
+        return exit_code
+
+    cache = testing_impact.ImpactCache(
+        base_commit=base_commit,
+        graph=testing_impact.build_import_graph(package_root),
+        test_map=test_map,
+    )
+    testing_impact.save_impact_cache(cache, cache_path)
+    print(f"Test impact cache rebuilt: {cache_path}")
+    return exit_code
+
+
+def _run_tests_affected_sync() -> int:
+    """
+    Internal: Run only the tests affected by changes since the merge base.
+
+    Falls back to the full suite (which also rebuilds the impact cache) when
+    the cache is missing or was built at a different merge base, or when a
+    change can't be mapped to specific tests. Returns pytest exit code.
+    """
+    from agentic_devtools.cli import testing_impact
+
+    package_root = get_package_root()
+    tests_dir = package_root / "tests"
+
+    if not tests_dir.exists():
+        print(f"Error: Tests directory not found at {tests_dir}", file=sys.stderr)
+        return 1
+
+    base_commit = testing_impact.get_merge_base(package_root)
+    if base_commit is None:
+        print("Error: Could not determine the merge base (is this a git repository?)", file=sys.stderr)
+        return 1
+
+    cache_path = testing_impact.get_impact_cache_path()
+    cache = testing_impact.load_impact_cache(cache_path)
+    if cache is None or cache.base_commit != base_commit:
+        print("Test impact cache is missing or stale - running the full suite to rebuild it...")
+        print()
+        return _run_full_suite_and_rebuild_impact_cache(package_root, base_commit, cache_path)
+
+    changed_files = testing_impact.get_changed_files(package_root, base_commit)
+    if changed_files is None:
+        print("Error: Could not list changed files with git", file=sys.stderr)
+        return 1
+
+    test_files = testing_impact.select_affected_tests(changed_files, cache, package_root)
+    if test_files is None:
+        print("Changes can't be mapped to specific tests - running the full suite...")
+        print()
+        return _run_full_suite_and_rebuild_impact_cache(package_root, base_commit, cache_path)
+
+    testing_impact.print_selection_summary(changed_files, test_files)
+    if not test_files:
+        print("No affected tests to run.")
+        return 0
+    print()
+
+    # Coverage is skipped: a subset of tests can't meet the project-wide coverage threshold
+    return _run_subprocess_with_streaming(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            *test_files,
+            "-v",
+            "--tb=short",
+            "-o",
+            "addopts=",
+        ],
+        cwd=str(package_root),
+    )
+
+
+def _run_tests_sharded_sync() -> int:
+    """
+    Internal: Run the full test suite with coverage, split across parallel shards.
+
+    Reads the shard count from state (test_shards, default: CPU count) and
+    balances shards using the recorded per-test durations. Coverage from all
+    shards is combined and checked against the configured threshold.
+
+    Returns the highest shard exit code, or 1 if coverage is below the
+    threshold. Called by background task.
+    """
+    from agentic_devtools.cli import testing_shards
+    from agentic_devtools.state import get_value
+
+    package_root = get_package_root()
+    tests_dir = package_root / "tests"
+
+    if not tests_dir.exists():
+        print(f"Error: Tests directory not found at {tests_dir}", file=sys.stderr)
+        return 1
+
+    shard_count_value = get_value("test_shards")
+    try:
+        shard_count = int(shard_count_value) if shard_count_value else testing_shards.get_default_shard_count()
+    except (TypeError, ValueError):
+        print(f"Error: test_shards must be a positive integer, got: {shard_count_value}", file=sys.stderr)
+        return 1
+    if shard_count < 1:
+        print(f"Error: test_shards must be a positive integer, got: {shard_count_value}", file=sys.stderr)
+        return 1
+
+    history_path = testing_shards.get_duration_history_path()
+    history = testing_shards.load_duration_history(history_path)
+    test_files = testing_shards.collect_test_files(package_root)
+    shards = testing_shards.plan_shards(
+        test_files,
+        testing_shards.file_durations(history),
+        shard_count,
+    )
+    if not shards:
+        print(f"Error: No test files found in {tests_dir}", file=sys.stderr)
+        return 1
+
+    print(f"Running tests from {package_root}...")
+    testing_shards.print_shard_plan(shards)
+    print()
+
+    with tempfile.TemporaryDirectory(prefix="agdt-test-shards-") as work_dir:
+        work_path = Path(work_dir)
+        exit_codes = testing_shards.run_shards(shards, package_root, work_path)
+
+        run_durations: Dict[str, float] = {}
+        for shard in shards:
+            run_durations.update(testing_shards.parse_junit_durations(work_path / f"shard-{shard.index}.xml"))
+        history = testing_shards.merge_duration_history(history, run_durations, test_files)
+        testing_shards.save_duration_history(history, history_path)
+
+        print()
+        total = testing_shards.combine_coverage(
+            [work_path / f".coverage.shard-{shard.index}" for shard in shards],
+            package_root,
+        )
+
+    print()
+    for shard, code in zip(shards, exit_codes):
+        print(f"{shard.label(len(shards))} exit code {code}")
+
+    exit_code = testing_shards.aggregate_exit_code(exit_codes)
+    if exit_code == 0:
+        threshold = testing_shards.get_coverage_threshold(package_root)
+        if total is None:
+            print("Error: No coverage data was collected", file=sys.stderr)
+            return 1
+        if total < threshold:
+            print(f"Error: Total coverage {total:.2f}% is below the required {threshold:g}%", file=sys.stderr)
+            return 1
+    return exit_code
+
+
 # Module path for background task imports
 _TESTING_MODULE = "agentic_devtools.cli.testing"
 
@@ -303,6 +488,100 @@ def run_tests_quick() -> None:
     print_task_tracking_info(task, "Running tests without coverage (faster)")
 
 
+def run_tests_affected() -> None:
+    """
+    Run only the tests affected by changes since the merge base (BACKGROUND TASK).
+
+    Intersects `git diff` against the merge base with a cached import graph
+    and coverage-derived test map, then runs just the affected test files.
+    When the cache is missing or stale, the full suite runs with per-test
+    coverage contexts and the cache is rebuilt.
+
+    Returns immediately with a task ID for tracking.
+    Use agdt-task-wait to wait for completion and see results.
+
+    Usage:
+        agdt-test-affected
+        agdt-task-wait  # Wait for completion
+
+    DO NOT run pytest directly - use this command instead.
+    """
+    task = run_function_in_background(
+        _TESTING_MODULE,
+        "_run_tests_affected_sync",
+        command_display_name="agdt-test-affected",
+    )
+    print_task_tracking_info(task, "Running tests affected by changes since the merge base")
+
+
+def _create_test_sharded_parser() -> argparse.ArgumentParser:
+    """Create argument parser for agdt-test-sharded command."""
+    parser = argparse.ArgumentParser(
+        prog="agdt-test-sharded",
+        description="Run the full test suite with coverage, split across parallel worker processes.",
+        epilog="""
+Examples:
+    agdt-test-sharded               # One shard per CPU core
+    agdt-test-sharded --shards 4
+    agdt-test-sharded               # Uses test_shards from state if previously set
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--shards",
+        dest="shards",
+        type=int,
+        metavar="N",
+        help="Number of worker processes (default: CPU count). Auto-saves to state for subsequent runs.",
+    )
+    return parser
+
+
+def run_tests_sharded(_argv: list | None = None) -> None:
+    """
+    Run the full test suite split across parallel worker processes (BACKGROUND TASK).
+
+    Test files are balanced across shards using the durations recorded by
+    previous runs. Output from every shard is streamed into the task log with
+    a shard prefix, coverage is combined at the end, and the task fails if
+    any shard fails or total coverage is below the threshold.
+
+    Returns immediately with a task ID for tracking.
+    Use agdt-task-wait to wait for completion and see results.
+
+    Args:
+        _argv: CLI arguments (for testing). If None, uses sys.argv[1:].
+
+    Usage:
+        agdt-test-sharded
+        agdt-test-sharded --shards 4
+        agdt-task-wait  # Wait for completion
+
+    DO NOT run pytest directly - use this command instead.
+    """
+    from agentic_devtools.state import get_value, set_value
+
+    parser = _create_test_sharded_parser()
+    argv = _argv if _argv is not None else sys.argv[1:]
+    args, _ = parser.parse_known_args(argv)
+
+    if args.shards is not None:
+        if args.shards < 1:
+            print("Error: --shards must be a positive integer")
+            return
+        # Auto-save to state for future runs
+        set_value("test_shards", str(args.shards))
+
+    shard_count = get_value("test_shards") or "one per CPU core"
+
+    task = run_function_in_background(
+        _TESTING_MODULE,
+        "_run_tests_sharded_sync",
+        command_display_name="agdt-test-sharded",
+    )
+    print_task_tracking_info(task, f"Running full test suite in parallel shards ({shard_count})")
+
+
 def _create_test_file_parser() -> argparse.ArgumentParser:
     """Create argument parser for agdt-test-file command."""
     parser = argparse.ArgumentParser(
@@ -0,0 +1,366 @@
+"""
+Change-impact test selection for agdt-test-affected.
+
+Selects the tests affected by the current changes instead of running the
+whole suite. Two maps are combined:
+
+- An import graph of the agentic_devtools package (module -> internal modules
+  it imports), built by parsing the source with ``ast``.
+- A coverage-derived test map (module -> test files that executed it), built
+  from a full test run recorded with ``--cov-context=test``.
+
+Both are cached on disk together with the merge base they were built at.
+Changed files come from ``git diff --name-only`` against the merge base plus
+untracked files. A changed module affects every module that imports it,
+directly or transitively, and the tests that covered any affected module
+are selected.
+
+When the cache is missing or was built at a different merge base, or a
+change cannot be mapped safely (new modules, conftest.py, package data,
+packaging config), the full suite must run instead.
+"""
+
+import ast
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..state import get_state_dir
+from .subprocess_utils import run_safe
+
+PACKAGE_NAME = "agentic_devtools"
+
+IMPACT_CACHE_FILENAME = "test-impact-cache.json"
+
+# Bump when the cache layout changes so that old caches are rebuilt
+IMPACT_CACHE_VERSION = 1
+
+# Refs tried, in order, when looking for the merge base of HEAD
+MERGE_BASE_REFS = ("origin/main", "origin/master", "main", "master")
+
+# Changes to these files can affect any test
+FULL_SUITE_FILES = frozenset({"pyproject.toml", "setup.py", "setup.cfg", "requirements.txt", "tests/conftest.py"})
+
+
+def get_impact_cache_path() -> Path:
+    """Get the path of the on-disk test impact cache."""
+    return get_state_dir() / IMPACT_CACHE_FILENAME
+
+
+def module_name_for_path(relative_path: str) -> Optional[str]:
+    """
+    Convert a package-relative source path to a module name.
+
+    Examples:
+        "agentic_devtools/state.py" -> "agentic_devtools.state"
+        "agentic_devtools/cli/__init__.py" -> "agentic_devtools.cli"
+
+    Returns:
+        The module name, or None if the path is not a Python file in the package.
+    """
+    path = PurePosixPath(relative_path.replace("\\", "/"))
+    if not path.parts or path.parts[0] != PACKAGE_NAME or path.suffix != ".py":
+        return None
+    parts = list(path.with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _parent_packages(module: str) -> List[str]:
+    """Return the packages that are imported implicitly when importing ``module``."""
+    parts = module.split(".")
+    return [".".join(parts[:index]) for index in range(1, len(parts))]
+
+
+def _resolve_imports(tree: ast.AST, module: str, is_package: bool, known: Set[str]) -> Set[str]:
+    """Resolve every import in ``tree`` to the known package modules it loads."""
+    package = module if is_package else module.rpartition(".")[0]
+    imported: Set[str] = set()
+
+    def add(name: str) -> None:
+        for candidate in _parent_packages(name) + [name]:
+            if candidate in known:
+                imported.add(candidate)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                add(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package.split(".")
+                if node.level > 1:
+                    base_parts = base_parts[: -(node.level - 1)]
+                base = ".".join(base_parts + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            add(base)
+            for alias in node.names:
+                # "from pkg import name" may import a submodule
+                if f"{base}.{alias.name}" in known:
+                    add(f"{base}.{alias.name}")
+
+    imported.discard(module)
+    return imported
+
+
+def build_import_graph(package_root: Path, only: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+    """
+    Build the internal import graph of the package.
+
+    Args:
+        package_root: Directory containing the agentic_devtools package.
+        only: If given, only parse these package-relative source paths
+            (the module set is still taken from the whole package).
+
+    Returns:
+        Mapping of module name to the sorted internal modules it imports.
+    """
+    sources = {
+        module_name_for_path(path.relative_to(package_root).as_posix()): path
+        for path in sorted((package_root / PACKAGE_NAME).rglob("*.py"))
+    }
+    known = set(sources)
+
+    if only is not None:
+        selected = {module_name_for_path(path) for path in only}
+        sources = {module: path for module, path in sources.items() if module in selected}
+
+    graph: Dict[str, List[str]] = {}
+    for module, path in sources.items():
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        except (OSError, SyntaxError, ValueError):
+            graph[module] = []
+            continue
+        graph[module] = sorted(_resolve_imports(tree, module, path.name == "__init__.py", known))
+    return graph
+
+
+def find_affected_modules(graph: Dict[str, List[str]], changed_modules: Iterable[str]) -> Set[str]:
+    """
+    Find the changed modules and every module that imports them, transitively.
+
+    Args:
+        graph: Import graph from build_import_graph.
+        changed_modules: Modules whose source changed.
+
+    Returns:
+        Set of affected module names (including the changed ones).
+    """
+    importers: Dict[str, Set[str]] = {}
+    for module, imports in graph.items():
+        for imported in imports:
+            importers.setdefault(imported, set()).add(module)
+
+    affected = set(changed_modules)
+    pending = list(affected)
+    while pending:
+        for importer in importers.get(pending.pop(), ()):
+            if importer not in affected:
+                affected.add(importer)
+                pending.append(importer)
+    return affected
+
+
+def load_coverage_test_map(data_file: Path, package_root: Path) -> Optional[Dict[str, List[str]]]:
+    """
+    Build a module -> test files map from coverage data recorded with contexts.
+
+    The data must come from a run with ``--cov-context=test``, whose contexts
+    look like ``tests/unit/x/test_y.py::TestY::test_z|run``.
+
+    Returns:
+        Mapping of module name to sorted test file paths, or None if the data
+        is missing or unreadable.
+    """
+    try:
+        from coverage import CoverageData
+    except ImportError:  # pragma: no cover
+        return None
+
+    if not data_file.exists():
+        return None
+
+    try:
+        data = CoverageData(basename=str(data_file))
+        data.read()
+        measured_files = data.measured_files()
+    except Exception:
+        return None
+
+    test_map: Dict[str, List[str]] = {}
+    for measured in measured_files:
+        try:
+            relative = Path(measured).resolve().relative_to(package_root.resolve()).as_posix()
+        except ValueError:
+            continue
+        module = module_name_for_path(relative)
+        if module is None:
+            continue
+        test_files = {
+            context.split("::", 1)[0]
+            for contexts in data.contexts_by_lineno(measured).values()
+            for context in contexts
+            if "::" in context
+        }
+        test_map[module] = sorted(test_files)
+    return test_map
+
+
+@dataclass
+class ImpactCache:
+    """Import graph and coverage test map built at a merge base."""
+
+    base_commit: str
+    graph: Dict[str, List[str]] = field(default_factory=dict)
+    test_map: Dict[str, List[str]] = field(default_factory=dict)
+    version: int = IMPACT_CACHE_VERSION
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "version": self.version,
+            "base_commit": self.base_commit,
+            "graph": self.graph,
+            "test_map": self.test_map,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ImpactCache":
+        """Create from dictionary."""
+        return cls(
+            base_commit=data["base_commit"],
+            graph={module: list(imports) for module, imports in data.get("graph", {}).items()},
+            test_map={module: list(tests) for module, tests in data.get("test_map", {}).items()},
+            version=data.get("version", 0),
+        )
+
+
+def load_impact_cache(path: Path) -> Optional[ImpactCache]:
+    """Load the impact cache, or None if it is missing, unreadable or outdated."""
+    if not path.exists():
+        return None
+    try:
+        cache = ImpactCache.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if cache.version != IMPACT_CACHE_VERSION:
+        return None
+    return cache
+
+
+def save_impact_cache(cache: ImpactCache, path: Path) -> None:
+    """Write the impact cache to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cache.to_dict(), indent=2), encoding="utf-8")
+
+
+def get_merge_base(package_root: Path) -> Optional[str]:
+    """
+    Find the merge base of HEAD with the main branch.
+
+    Tries each of MERGE_BASE_REFS in order and falls back to HEAD itself.
+
+    Returns:
+        The commit SHA, or None if this is not a git repository.
+    """
+    for ref in MERGE_BASE_REFS + ("HEAD",):
+        args = ["git", "merge-base", "HEAD", ref] if ref != "HEAD" else ["git", "rev-parse", "HEAD"]
+        result = run_safe(args, capture_output=True, text=True, shell=False, cwd=str(package_root))
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    return None
+
+
+def get_changed_files(package_root: Path, base_commit: str) -> Optional[List[str]]:
+    """
+    List files changed since ``base_commit``, including uncommitted and untracked files.
+
+    Paths are relative to ``package_root``.
+
+    Returns:
+        Sorted list of changed paths, or None if git failed.
+    """
+    changed: Set[str] = set()
+    for args in (
+        ["git", "diff", "--name-only", "--relative", base_commit],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ):
+        result = run_safe(args, capture_output=True, text=True, shell=False, cwd=str(package_root))
+        if result.returncode != 0:
+            return None
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return sorted(changed)
+
+
+def select_affected_tests(
+    changed_files: Iterable[str],
+    cache: ImpactCache,
+    package_root: Path,
+) -> Optional[List[str]]:
+    """
+    Select the test files affected by a set of changed files.
+
+    Changed test files are selected directly. Changed source modules are
+    expanded to every module that imports them, and the tests that covered
+    any of those modules are selected. The import graph entries of changed
+    modules are re-parsed so that newly added imports are taken into account.
+
+    Args:
+        changed_files: Paths relative to ``package_root``.
+        cache: Impact cache built at the merge base.
+        package_root: Directory containing the package and tests.
+
+    Returns:
+        Sorted test file paths (possibly empty), or None if the change cannot
+        be mapped safely and the full suite must run.
+    """
+    tests: Set[str] = set()
+    changed_sources: List[str] = []
+
+    for changed in changed_files:
+        path = PurePosixPath(changed.replace("\\", "/"))
+        posix = path.as_posix()
+
+        if posix in FULL_SUITE_FILES:
+            return None
+
+        if path.parts[0] == "tests":
+            if path.name.startswith("test_") and path.suffix == ".py":
+                if (package_root / posix).exists():
+                    tests.add(posix)
+                continue
+            if path.suffix == ".py":
+                # conftest.py or shared helpers can affect any test below them
+                return None
+            continue
+
+        if path.parts[0] == PACKAGE_NAME:
+            module = module_name_for_path(posix)
+            if module is None or module not in cache.graph:
+                # Package data (prompt templates, ...) or a module the cache doesn't know
+                return None
+            changed_sources.append(posix)
+
+    if changed_sources:
+        graph = dict(cache.graph)
+        graph.update(build_import_graph(package_root, only=changed_sources))
+        for module in find_affected_modules(graph, [module_name_for_path(p) for p in changed_sources]):
+            tests.update(test for test in cache.test_map.get(module, []) if (package_root / test).exists())
+
+    return sorted(tests)
+
+
+def print_selection_summary(changed_files: List[str], tests: List[str]) -> None:
+    """Print which changes were found and how many tests were selected."""
+    print(f"Changed files: {len(changed_files)}")
+    for changed in changed_files[:20]:
+        print(f"  {changed}")
+    if len(changed_files) > 20:
+        print(f"  ... and {len(changed_files) - 20} more")
+    print(f"Affected test files: {len(tests)}")
+    sys.stdout.flush()
@@ -0,0 +1,341 @@
+"""
+Sharded parallel test runs for agdt-test-sharded.
+
+Splits the test suite across several pytest worker processes. Shards are
+made of whole test files so that module-level fixtures keep working, and
+files are assigned heaviest first to the currently lightest shard, using
+the per-test durations recorded by previous runs.
+
+Each shard writes its own coverage data file (via ``COVERAGE_FILE``) and
+JUnit XML report. When all shards are done the coverage data is combined
+into a single report and the durations from the JUnit reports are merged
+into the history for the next run. Tests that no longer exist are dropped
+from the history so that they stop counting toward shard balancing.
+
+Shard output is streamed line by line to stdout, prefixed with the shard
+number, so that it ends up in the background task log.
+"""
+
+import heapq
+import json
+import os
+import subprocess
+import sys
+import threading
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import IO, Dict, Iterable, List, Optional
+
+from ..state import get_state_dir
+from .testing_impact import PACKAGE_NAME
+
+DURATION_HISTORY_FILENAME = "test-durations.json"
+
+# Bump when the history layout changes so that old histories are discarded
+DURATION_HISTORY_VERSION = 1
+
+# Estimated duration of a test file when there is no history at all
+DEFAULT_FILE_SECONDS = 1.0
+
+
+def get_duration_history_path() -> Path:
+    """Get the path of the on-disk test duration history."""
+    return get_state_dir() / DURATION_HISTORY_FILENAME
+
+
+def get_default_shard_count() -> int:
+    """Get the default number of shards (one per CPU core)."""
+    return os.cpu_count() or 1
+
+
+def load_duration_history(path: Path) -> Dict[str, float]:
+    """
+    Load per-test durations keyed by pytest node ID.
+
+    Returns:
+        Mapping of node ID to seconds, or an empty dict if the history is
+        missing, unreadable or outdated.
+    """
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != DURATION_HISTORY_VERSION:
+            return {}
+        return {str(nodeid): float(seconds) for nodeid, seconds in data.get("tests", {}).items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def save_duration_history(durations: Dict[str, float], path: Path) -> None:
+    """Write per-test durations to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": DURATION_HISTORY_VERSION, "tests": dict(sorted(durations.items()))}
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def parse_junit_durations(xml_path: Path) -> Dict[str, float]:
+    """
+    Read per-test durations from a pytest JUnit XML report.
+
+    The report must use ``junit_family=xunit1`` so that each test case
+    carries its ``file`` attribute.
+
+    Returns:
+        Mapping of node ID to seconds, or an empty dict if the report is
+        missing or unreadable.
+    """
+    try:
+        root = ElementTree.parse(xml_path).getroot()
+    except (OSError, ElementTree.ParseError):
+        return {}
+
+    durations: Dict[str, float] = {}
+    for case in root.iter("testcase"):
+        file = case.get("file")
+        name = case.get("name")
+        if not file or not name:
+            continue
+        file = file.replace("\\", "/")
+        # classname is the dotted module path, followed by the class name if any
+        module = PurePosixPath(file).with_suffix("").as_posix().replace("/", ".")
+        classname = case.get("classname", "")
+        test_class = classname[len(module) + 1 :] if classname.startswith(module + ".") else ""
+        nodeid = "::".join(part for part in (file, test_class, name) if part)
+        try:
+            durations[nodeid] = float(case.get("time", 0))
+        except ValueError:
+            continue
+    return durations
+
+
+def merge_duration_history(
+    history: Dict[str, float], run_durations: Dict[str, float], test_files: Iterable[str]
+) -> Dict[str, float]:
+    """
+    Merge the durations of a run into the history, dropping stale tests.
+
+    Entries of files that are no longer collected are removed. A file that
+    reported durations in this run replaces all of its previous entries, so
+    renamed or deleted tests don't linger in the history.
+
+    Args:
+        history: Durations loaded from the history file.
+        run_durations: Durations reported by the shards of this run.
+        test_files: Test files collected for this run.
+
+    Returns:
+        The new history, keyed by node ID.
+    """
+    collected = set(test_files)
+    reported = set(file_durations(run_durations))
+    merged = {
+        nodeid: seconds
+        for nodeid, seconds in history.items()
+        if nodeid.split("::", 1)[0] in collected and nodeid.split("::", 1)[0] not in reported
+    }
+    merged.update(run_durations)
+    return merged
+
+
+def file_durations(durations: Dict[str, float]) -> Dict[str, float]:
+    """Sum per-test durations into per-file durations."""
+    totals: Dict[str, float] = {}
+    for nodeid, seconds in durations.items():
+        file = nodeid.split("::", 1)[0]
+        totals[file] = totals.get(file, 0.0) + seconds
+    return totals
+
+
+def collect_test_files(package_root: Path) -> List[str]:
+    """
+    List the test files of the suite.
+
+    Returns:
+        Sorted test file paths relative to ``package_root``.
+    """
+    return sorted(path.relative_to(package_root).as_posix() for path in (package_root / "tests").rglob("test_*.py"))
+
+
+@dataclass
+class Shard:
+    """Test files assigned to one worker process."""
+
+    index: int
+    files: List[str] = field(default_factory=list)
+    estimated_seconds: float = 0.0
+
+    def label(self, shard_count: int) -> str:
+        """Return the prefix used for this shard's output lines."""
+        return f"[shard {self.index}/{shard_count}]"
+
+
+def plan_shards(test_files: Iterable[str], durations: Dict[str, float], shard_count: int) -> List[Shard]:
+    """
+    Split test files into shards with balanced estimated durations.
+
+    Files are assigned heaviest first to the shard with the lowest estimated
+    total so far. Files without history are estimated at the mean duration
+    of the known files (or DEFAULT_FILE_SECONDS if nothing is known).
+
+    Args:
+        test_files: Test file paths.
+        durations: Per-file durations from file_durations.
+        shard_count: Requested number of shards.
+
+    Returns:
+        Non-empty shards numbered from 1, at most one per test file.
+    """
+    files = list(test_files)
+    if not files:
+        return []
+
+    known = [durations[file] for file in files if file in durations]
+    fallback = sum(known) / len(known) if known else DEFAULT_FILE_SECONDS
+    estimates = {file: durations.get(file, fallback) for file in files}
+
+    shards = [Shard(index=index) for index in range(1, max(1, min(shard_count, len(files))) + 1)]
+    heap = [(0.0, shard.index) for shard in shards]
+    for file in sorted(files, key=lambda f: (-estimates[f], f)):
+        total, index = heapq.heappop(heap)
+        shard = shards[index - 1]
+        shard.files.append(file)
+        shard.estimated_seconds = total + estimates[file]
+        heapq.heappush(heap, (shard.estimated_seconds, index))
+
+    for shard in shards:
+        shard.files.sort()
+    return shards
+
+
+def build_shard_command(shard: Shard, package_root: Path, junit_path: Path) -> List[str]:
+    """Build the pytest command line for one shard."""
+    return [
+        sys.executable,
+        "-m",
+        "pytest",
+        *shard.files,
+        "-v",
+        "--tb=short",
+        "-o",
+        "addopts=",  # Clear default addopts; coverage is combined and checked after all shards
+        f"--cov={package_root / PACKAGE_NAME}",
+        "--cov-report=",
+        "--cov-fail-under=0",
+        "-o",
+        "junit_family=xunit1",
+        f"--junitxml={junit_path}",
+        "-p",
+        "no:cacheprovider",  # Shards would race on .pytest_cache
+    ]
+
+
+def _stream_with_prefix(stream: IO[str], prefix: str, lock: threading.Lock) -> None:
+    """Copy lines from a shard's output to stdout, prefixed with its label."""
+    for line in stream:
+        with lock:
+            sys.stdout.write(f"{prefix} {line}")
+            sys.stdout.flush()
+
+
+def run_shards(shards: List[Shard], package_root: Path, work_dir: Path) -> List[int]:
+    """
+    Run every shard in its own pytest process and wait for all of them.
+
+    Shard N writes ``work_dir/.coverage.shard-N`` and ``work_dir/shard-N.xml``.
+
+    Returns:
+        Exit code of each shard, in shard order.
+    """
+    lock = threading.Lock()
+    running = []
+    for shard in shards:
+        env = os.environ.copy()
+        env["COVERAGE_FILE"] = str(work_dir / f".coverage.shard-{shard.index}")
+        process = subprocess.Popen(
+            build_shard_command(shard, package_root, work_dir / f"shard-{shard.index}.xml"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=str(package_root),
+            env=env,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,  # Line buffered
+        )
+        reader = threading.Thread(
+            target=_stream_with_prefix,
+            args=(process.stdout, shard.label(len(shards)), lock),
+            daemon=True,
+        )
+        reader.start()
+        running.append((process, reader))
+
+    exit_codes = []
+    for process, reader in running:
+        process.wait()
+        reader.join()
+        exit_codes.append(process.returncode)
+    return exit_codes
+
+
+def aggregate_exit_code(exit_codes: Iterable[int]) -> int:
+    """Combine shard exit codes: 0 only if every shard passed, otherwise the highest code."""
+    return max(exit_codes, default=0)
+
+
+def combine_coverage(data_files: Iterable[Path], package_root: Path) -> Optional[float]:
+    """
+    Combine per-shard coverage data and print the term-missing and HTML reports.
+
+    The combined data is written to ``package_root/.coverage`` and the
+    coverage configuration is read from the package's pyproject.toml.
+
+    Returns:
+        Total coverage percentage, or None if there was no data to combine.
+    """
+    try:
+        from coverage import Coverage
+        from coverage.exceptions import NoDataError
+    except ImportError:  # pragma: no cover
+        return None
+
+    existing = [str(path) for path in data_files if path.exists()]
+    if not existing:
+        return None
+
+    pyproject = package_root / "pyproject.toml"
+    cov = Coverage(
+        data_file=str(package_root / ".coverage"),
+        config_file=str(pyproject) if pyproject.exists() else False,
+    )
+    cov.erase()
+    cov.combine(data_paths=existing, keep=True)
+    cov.save()
+    try:
+        total = cov.report(show_missing=True, file=sys.stdout)
+        cov.html_report(directory=str(package_root / cov.get_option("html:directory")))
+    except NoDataError:
+        return None
+    return total
+
+
+def get_coverage_threshold(package_root: Path) -> float:
+    """Get ``[tool.coverage.report] fail_under`` from the package's pyproject.toml."""
+    try:
+        from coverage import Coverage
+    except ImportError:  # pragma: no cover
+        return 0.0
+
+    pyproject = package_root / "pyproject.toml"
+    cov = Coverage(config_file=str(pyproject) if pyproject.exists() else False)
+    return float(cov.get_option("report:fail_under") or 0.0)
+
+
+def print_shard_plan(shards: List[Shard]) -> None:
+    """Print how the test files were split across shards."""
+    print(f"Running tests in {len(shards)} shard(s):")
+    for shard in shards:
+        print(f"  {shard.label(len(shards))} {len(shard.files)} files, ~{shard.estimated_seconds:.1f}s estimated")
+    sys.stdout.flush()
@@ -9,10 +9,10 @@ This module provides common functionality for all workflow commands:
 """
 
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from ...prompts import TemplateValidationError, load_and_render_prompt
-from ...state import clear_state, get_value, set_workflow_state
+from ...state import clear_state, get_state_snapshot, set_workflow_state
 
 
 def clear_state_for_workflow_initiation() -> None:
@@ -29,12 +29,16 @@ def clear_state_for_workflow_initiation() -> None:
     print("✓ Cleared previous workflow state")
 
 
-def validate_required_state(required_keys: List[str]) -> Dict[str, Any]:
+def validate_required_state(
+    required_keys: List[str],
+    snapshot: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Validate that required state keys exist and return their values.
 
     Args:
         required_keys: List of state keys that must be present
+        snapshot: State snapshot containing the keys (default: read from state)
 
     Returns:
         Dictionary mapping key names to their values
@@ -42,11 +46,14 @@ def validate_required_state(required_keys: List[str]) -> Dict[str, Any]:
     Raises:
         SystemExit: If any required key is missing
     """
+    if snapshot is None:
+        snapshot = get_state_snapshot(required_keys)
+
     values = {}
     missing = []
 
     for key in required_keys:
-        value = get_value(key)
+        value = snapshot.get(key)
         if value is None:
             missing.append(key)
         else:
@@ -62,7 +69,10 @@ def validate_required_state(required_keys: List[str]) -> Dict[str, Any]:
     return values
 
 
-def collect_variables_from_state(variable_keys: List[str]) -> Dict[str, Any]:
+def collect_variables_from_state(
+    variable_keys: List[str],
+    snapshot: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Collect variable values from state.
 
@@ -71,13 +81,17 @@ def collect_variables_from_state(variable_keys: List[str]) -> Dict[str, Any]:
 
     Args:
         variable_keys: List of state keys to collect
+        snapshot: State snapshot containing the keys (default: read from state)
 
     Returns:
         Dictionary mapping variable names to their values (only includes keys that exist)
     """
+    if snapshot is None:
+        snapshot = get_state_snapshot(variable_keys)
+
     variables = {}
     for key in variable_keys:
-        value = get_value(key)
+        value = snapshot.get(key)
         if value is not None:
             # Convert dotted keys to underscore format for template variables
             # e.g., "jira.issue_key" -> "jira_issue_key"
@@ -142,14 +156,17 @@ def initiate_workflow(
         FileNotFoundError: If no template exists
         TemplateValidationError: If override template is invalid
     """
+    # Read all required and optional keys in a single state load
+    all_state_keys = (required_state_keys or []) + (optional_state_keys or [])
+    snapshot = get_state_snapshot(all_state_keys)
+
     # Validate required state
     required_values = {}
     if required_state_keys:
-        required_values = validate_required_state(required_state_keys)
+        required_values = validate_required_state(required_state_keys, snapshot=snapshot)
 
     # Collect all variables
-    all_state_keys = (required_state_keys or []) + (optional_state_keys or [])
-    variables = collect_variables_from_state(all_state_keys)
+    variables = collect_variables_from_state(all_state_keys, snapshot=snapshot)
 
     # Add any additional variables
     if additional_variables:
@@ -162,7 +162,19 @@ def get_checklist() -> Optional[Checklist]:
     Returns:
         Checklist object or None if no checklist exists
     """
-    workflow = get_workflow_state()
+    return checklist_from_workflow_state(get_workflow_state())
+
+
+def checklist_from_workflow_state(workflow: Optional[Dict[str, Any]]) -> Optional[Checklist]:
+    """
+    Get the checklist from an already loaded workflow state.
+
+    Args:
+        workflow: Workflow state dictionary (as returned by get_workflow_state)
+
+    Returns:
+        Checklist object or None if no checklist exists
+    """
     if not workflow:
         return None
 
@@ -21,8 +21,8 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Set
 
 from ...prompts import get_temp_output_dir, load_and_render_prompt
-from ...state import get_value, get_workflow_state, set_workflow_state
-from ...task_state import TaskStatus, get_active_tasks, get_task_by_id
+from ...state import get_state_snapshot, get_workflow_state, set_workflow_state
+from ...task_state import TaskStatus, get_active_tasks, get_tasks_by_ids
 
 
 def _safe_print(text: str) -> None:
@@ -529,8 +529,9 @@ def _check_required_tasks_status(required_task_commands: List[str], context: Dic
     # Get recent task IDs from events log
     recent_task_ids = [e.get("task_id") for e in events_log if e.get("task_id")]
 
+    tasks = get_tasks_by_ids(recent_task_ids)
     for task_id in recent_task_ids:
-        task = get_task_by_id(task_id)
+        task = tasks.get(task_id)
         if task and task.status == TaskStatus.FAILED:
             failed_tasks.append(
                 {
@@ -594,7 +595,7 @@ def _render_step_prompt(workflow_name: str, step_name: str, context: Dict[str, A
     # Build variables from context and state
     variables = dict(context)
 
-    # Add common state values (raw values)
+    # Read every state value the prompt needs in a single state load
     state_keys = [
         "jira.issue_key",
         "jira.last_issue",
@@ -604,15 +605,18 @@ def _render_step_prompt(workflow_name: str, step_name: str, context: Dict[str, A
         "source_branch",
         "commit_message",
     ]
+    snapshot = get_state_snapshot(state_keys + ["workflow"])
+
+    # Add common state values (raw values)
     for key in state_keys:
-        value = get_value(key)
+        value = snapshot[key]
         if value is not None:
             var_name = key.replace(".", "_")
             variables[var_name] = value
 
     # For pull-request-review workflow, fetch fresh queue status
     if workflow_name == "pull-request-review":  # pragma: no cover
-        pull_request_id = context.get("pull_request_id") or get_value("pull_request_id")
+        pull_request_id = context.get("pull_request_id") or snapshot["pull_request_id"]
         if pull_request_id:
             try:
                 from ..azure_devops.file_review_commands import get_queue_status
@@ -634,9 +638,9 @@ def _render_step_prompt(workflow_name: str, step_name: str, context: Dict[str, A
         variables.setdefault("issue_key", variables["jira_issue_key"])
 
     # Add checklist markdown if checklist exists
-    from .checklist import get_checklist
+    from .checklist import checklist_from_workflow_state
 
-    checklist = get_checklist()
+    checklist = checklist_from_workflow_state(snapshot["workflow"])
     if checklist:
         variables["checklist_markdown"] = checklist.render_markdown()
     else:
@@ -652,10 +656,8 @@ def _render_step_prompt(workflow_name: str, step_name: str, context: Dict[str, A
         variables.setdefault("issue_description", fields.get("description", ""))
 
     # Build dynamic command hints for common commands
-    jira_comment = get_value("jira.comment")
-    get_value("jira.issue_key")
-    commit_message = get_value("commit_message")
-    get_value("source_branch")
+    jira_comment = snapshot["jira.comment"]
+    commit_message = snapshot["commit_message"]
 
     # Add Jira comment command hint
     variables["add_jira_comment_hint"] = _build_command_hint(
@@ -0,0 +1,114 @@
+"""Worktree configuration for workflows.
+
+Loaded from ``.agdt/config/worktrees.json`` in the main repository root.
+Every setting is optional; without the file, worktrees are full checkouts
+created on demand.
+
+Example::
+
+    {
+      "sparseCheckout": true,
+      "sparsePaths": ["services/payments", "shared/python"],
+      "poolSize": 2
+    }
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Relative path under the repository root
+_CONFIG_PATH = ".agdt/config/worktrees.json"
+
+
+@dataclass
+class WorktreeConfig:
+    """Configuration for workflow worktrees.
+
+    Attributes:
+        sparseCheckout: Create worktrees with ``--no-checkout`` and check out
+            only the directories an issue needs (sparse-checkout cone mode).
+        sparsePaths: Directories always included in sparse worktrees, on top
+            of the ones the issue's branch touches.
+        poolSize: Number of ready worktrees to keep in the worktree pool for
+            new work (0 disables the pool).
+    """
+
+    sparseCheckout: bool = False
+    sparsePaths: List[str] = field(default_factory=list)
+    poolSize: int = 0
+
+    def to_dict(self) -> Dict:
+        """Serialize to JSON-compatible dictionary."""
+        return {
+            "sparseCheckout": self.sparseCheckout,
+            "sparsePaths": list(self.sparsePaths),
+            "poolSize": self.poolSize,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WorktreeConfig":
+        """Deserialize from a dictionary.
+
+        Raises:
+            ValueError: If a setting has the wrong type.
+        """
+        config = cls(
+            sparseCheckout=data.get("sparseCheckout", False),
+            sparsePaths=data.get("sparsePaths", []),
+            poolSize=data.get("poolSize", 0),
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        """Validate the configuration.
+
+        Raises:
+            ValueError: If ``sparseCheckout`` isn't a boolean or ``sparsePaths``
+                isn't a list of non-empty strings, or ``poolSize`` isn't a
+                non-negative integer.
+        """
+        if not isinstance(self.sparseCheckout, bool):
+            raise ValueError(f"sparseCheckout must be true or false, got: {self.sparseCheckout!r}")
+        if not isinstance(self.sparsePaths, list):
+            raise ValueError("sparsePaths must be a list of directories.")
+        for i, path in enumerate(self.sparsePaths):
+            if not isinstance(path, str) or not path.strip("/ "):
+                raise ValueError(f"sparsePaths[{i}] must be a non-empty string, got: {path!r}")
+        if isinstance(self.poolSize, bool) or not isinstance(self.poolSize, int) or self.poolSize < 0:
+            raise ValueError(f"poolSize must be a non-negative integer, got: {self.poolSize!r}")
+
+
+def load_worktree_config(repo_path: str) -> WorktreeConfig:
+    """Load the worktree configuration for a repository.
+
+    Args:
+        repo_path: Path to the root of the main repository.
+
+    Returns:
+        Validated ``WorktreeConfig``, or the defaults if the file is missing
+        or unreadable.
+
+    Raises:
+        ValueError: If the loaded JSON fails validation.
+    """
+    config_path = Path(repo_path).resolve() / _CONFIG_PATH
+    if not config_path.is_file():
+        return WorktreeConfig()
+
+    try:
+        data = json.loads(config_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as exc:
+        logger.warning("Could not load %s: %s; using defaults.", config_path, exc)
+        return WorktreeConfig()
+
+    if not isinstance(data, dict):
+        logger.warning("Expected JSON object in %s, got %s; using defaults.", config_path, type(data).__name__)
+        return WorktreeConfig()
+
+    return WorktreeConfig.from_dict(data)
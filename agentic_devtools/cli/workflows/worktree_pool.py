@@ -0,0 +1,430 @@
+"""
+Pool of pre-warmed worktrees for new work.
+
+A new worktree isn't usable until it has been added, had its VS Code
+settings injected and had the repository's setup script (which usually
+installs dependencies) run. With ``poolSize`` set in
+``.agdt/config/worktrees.json``, that work is done ahead of time: up to
+``poolSize`` detached worktrees of ``origin/main`` are kept ready in
+``<repos parent>/.agdt-worktree-pool/<repo name>/``.
+
+When work on a new branch starts, a ready worktree is handed out by
+creating the branch in it (``git switch -c``) and moving it to the issue's
+worktree path (``git worktree move``); nothing else runs in the
+foreground. The setup script therefore runs only in the pool directory, so
+whatever it writes must not depend on the worktree's absolute path (the
+injected VS Code settings don't). A background task then refills the pool,
+replacing worktrees whose base is no longer the tip of main. Its fetch of
+main takes the same fetch lock as foreground fetches.
+
+The pool manifest (``pool.json``) lists each slot and its state. It is only
+changed under a file lock, so concurrent handouts and refills never hand
+out or create the same slot twice.
+"""
+
+import contextlib
+import json
+import shutil
+import subprocess
+import sys
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from ...file_locking import FileLockError, locked_file
+from ..git.core import fetch_lock
+from .worktree_config import load_worktree_config
+from .worktree_sparse import apply_sparse_checkout, resolve_sparse_directories
+
+# Exported for dynamic invocation by run_function_in_background
+__all__ = ["_fill_worktree_pool_from_cwd"]
+
+POOL_DIR_NAME = ".agdt-worktree-pool"
+POOL_MANIFEST_FILENAME = "pool.json"
+
+# Refs pool worktrees are based on, in order of preference
+POOL_BASE_REFS = ("origin/main", "main")
+
+SLOT_WARMING = "warming"
+SLOT_READY = "ready"
+
+# A slot still warming after this long belongs to a refill that died
+WARMING_TIMEOUT = timedelta(hours=1)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class PoolSlot:
+    """One worktree in the pool."""
+
+    name: str  # Directory name under the pool directory
+    status: str  # SLOT_WARMING or SLOT_READY
+    base_ref: str
+    base_sha: str
+    updated: str = field(default_factory=_now)  # ISO timestamp of the last status change
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "name": self.name,
+            "status": self.status,
+            "base_ref": self.base_ref,
+            "base_sha": self.base_sha,
+            "updated": self.updated,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PoolSlot":
+        """Create from dictionary."""
+        return cls(
+            name=data["name"],
+            status=data["status"],
+            base_ref=data["base_ref"],
+            base_sha=data["base_sha"],
+            updated=data.get("updated", ""),
+        )
+
+
+@dataclass
+class PoolManifest:
+    """All slots in a worktree pool."""
+
+    slots: List[PoolSlot] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {"slots": [slot.to_dict() for slot in self.slots]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PoolManifest":
+        """Create from dictionary."""
+        return cls(slots=[PoolSlot.from_dict(slot) for slot in data.get("slots", [])])
+
+
+@dataclass
+class PoolStatus:
+    """Health of a worktree pool."""
+
+    size: int  # Configured number of ready worktrees
+    ready: int
+    warming: int
+    stale: int  # Ready worktrees based on an older main
+
+    def summary(self) -> str:
+        """One-line description for agdt-tasks."""
+        line = f"Worktree pool: {self.ready}/{self.size} ready"
+        if self.stale:
+            line += f" ({self.stale} behind main)"
+        if self.warming:
+            line += f", {self.warming} warming"
+        return line
+
+
+def get_pool_dir(repo_root: str) -> Path:
+    """
+    Get the directory holding a repository's pool worktrees.
+
+    Args:
+        repo_root: Root of the main repository.
+
+    Returns:
+        ``<repos parent>/.agdt-worktree-pool/<repo name>``
+    """
+    root = Path(repo_root)
+    return root.parent / POOL_DIR_NAME / root.name
+
+
+def _parse_manifest(text: str) -> PoolManifest:
+    """Parse manifest JSON, treating anything unreadable as an empty pool."""
+    try:
+        return PoolManifest.from_dict(json.loads(text or "{}"))
+    except (json.JSONDecodeError, AttributeError, KeyError, TypeError):
+        return PoolManifest()
+
+
+@contextlib.contextmanager
+def _locked_manifest(pool_dir: Path) -> Iterator[PoolManifest]:
+    """
+    Read the manifest under a lock and write it back when the block exits.
+
+    Raises:
+        FileLockError: If another process holds the lock for too long
+    """
+    with locked_file(pool_dir / POOL_MANIFEST_FILENAME, "r+") as f:
+        manifest = _parse_manifest(f.read())
+        yield manifest
+        f.seek(0)
+        f.write(json.dumps(manifest.to_dict(), indent=2))
+        f.truncate()
+
+
+def _read_manifest(pool_dir: Path) -> PoolManifest:
+    """Read the manifest without locking (for reporting only)."""
+    try:
+        return _parse_manifest((pool_dir / POOL_MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except OSError:
+        return PoolManifest()
+
+
+def _git(*args: str) -> subprocess.CompletedProcess:
+    """Run git, capturing output."""
+    return subprocess.run(["git", *args], capture_output=True, text=True, check=False)
+
+
+def _resolve_base(repo_root: str) -> Optional[Tuple[str, str]]:
+    """
+    Find the ref and commit new pool worktrees are based on.
+
+    Returns:
+        Tuple of (ref, commit SHA), or None if neither origin/main nor main exists
+    """
+    for ref in POOL_BASE_REFS:
+        result = _git("-C", repo_root, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}")
+        if result.returncode == 0:
+            return ref, result.stdout.strip()
+    return None
+
+
+def _remove_slot_worktree(repo_root: str, slot_path: Path) -> None:
+    """Remove a pool worktree (even if locked), deleting the directory if git can't."""
+    result = _git("-C", repo_root, "worktree", "remove", "--force", "--force", str(slot_path))
+    if result.returncode != 0 and slot_path.exists():
+        shutil.rmtree(slot_path, ignore_errors=True)
+        _git("-C", repo_root, "worktree", "prune")
+
+
+def take_pooled_worktree(repo_root: str, worktree_path: str, branch_name: str) -> bool:
+    """
+    Hand out a ready pool worktree as the worktree for a new branch.
+
+    Creates ``branch_name`` from the slot's base ref inside the slot (files
+    changed on main since the slot was warmed are updated), then moves the
+    slot to ``worktree_path``.
+
+    Args:
+        repo_root: Root of the main repository.
+        worktree_path: Where the worktree should end up.
+        branch_name: New branch to create; must not exist yet.
+
+    Returns:
+        True if a pool worktree is now at ``worktree_path``; False if the pool
+        had none ready or the handout failed (the caller should create the
+        worktree the usual way).
+    """
+    pool_dir = get_pool_dir(repo_root)
+    # git worktree move would put the slot inside an existing directory
+    if Path(worktree_path).exists() or not (pool_dir / POOL_MANIFEST_FILENAME).is_file():
+        return False
+
+    try:
+        with _locked_manifest(pool_dir) as manifest:
+            ready = [slot for slot in manifest.slots if slot.status == SLOT_READY]
+            if not ready:
+                return False
+            slot = max(ready, key=lambda s: s.updated)
+            manifest.slots.remove(slot)
+    except FileLockError:
+        return False
+
+    slot_path = pool_dir / slot.name
+    print(f"Using pre-warmed worktree {slot.name} from the worktree pool...")
+    try:
+        switched = _git("-C", str(slot_path), "switch", "--no-track", "-c", branch_name, slot.base_ref)
+        if switched.returncode != 0:
+            # The slot is untouched (e.g. the branch already exists), so it goes back to the pool
+            print(f"Warning: could not create branch in pool worktree: {switched.stderr.strip()}", file=sys.stderr)
+            with _locked_manifest(pool_dir) as manifest:
+                manifest.slots.append(slot)
+            return False
+
+        moved = _git("-C", repo_root, "worktree", "move", str(slot_path), worktree_path)
+        if moved.returncode != 0:
+            print(f"Warning: could not move pool worktree: {moved.stderr.strip()}", file=sys.stderr)
+            _git("-C", str(slot_path), "switch", "--detach")
+            _git("-C", repo_root, "branch", "-D", branch_name)
+            _remove_slot_worktree(repo_root, slot_path)
+            return False
+    except (FileNotFoundError, OSError, FileLockError) as exc:
+        print(f"Warning: could not use pool worktree: {exc}", file=sys.stderr)
+        return False
+    return True
+
+
+def get_worktree_pool_status(repo_root: str) -> Optional[PoolStatus]:
+    """
+    Get the health of a repository's worktree pool.
+
+    Returns:
+        PoolStatus, or None if the pool is disabled and empty
+    """
+    try:
+        size = load_worktree_config(repo_root).poolSize
+    except ValueError:
+        size = 0
+    pool_dir = get_pool_dir(repo_root)
+    if not size and not (pool_dir / POOL_MANIFEST_FILENAME).is_file():
+        return None
+
+    manifest = _read_manifest(pool_dir)
+    ready = [slot for slot in manifest.slots if slot.status == SLOT_READY]
+    base = _resolve_base(repo_root)
+    return PoolStatus(
+        size=size,
+        ready=len(ready),
+        warming=sum(1 for slot in manifest.slots if slot.status == SLOT_WARMING),
+        stale=sum(1 for slot in ready if base is None or slot.base_sha != base[1]),
+    )
+
+
+def _plan_refill(
+    manifest: PoolManifest, size: int, base_ref: str, base_sha: str
+) -> Tuple[List[PoolSlot], List[PoolSlot]]:
+    """
+    Work out which slots to discard and which to create.
+
+    Stale ready slots, ready slots beyond the pool size and slots left
+    warming by a refill that died are removed from the manifest; new
+    warming slots are added to bring the pool up to size.
+
+    Returns:
+        Tuple of (slots to remove, slots to create)
+    """
+    expired = (datetime.now(timezone.utc) - WARMING_TIMEOUT).isoformat()
+    keep: List[PoolSlot] = []
+    remove: List[PoolSlot] = []
+    for slot in sorted(manifest.slots, key=lambda s: s.updated, reverse=True):
+        if slot.status == SLOT_WARMING:
+            (keep if slot.updated >= expired else remove).append(slot)
+        elif slot.base_sha == base_sha and len(keep) < size:
+            keep.append(slot)
+        else:
+            remove.append(slot)
+
+    create = [
+        PoolSlot(name=f"slot-{uuid.uuid4().hex[:8]}", status=SLOT_WARMING, base_ref=base_ref, base_sha=base_sha)
+        for _ in range(size - len(keep))
+    ]
+    manifest.slots = keep + create
+    return remove, create
+
+
+def _warm_slot(repo_root: str, slot_path: Path, base_sha: str) -> bool:
+    """Add a pool worktree and run the same setup as a new worktree."""
+    from .worktree_setup import inject_git_path_settings, run_worktree_setup_script
+
+    sparse_directories = resolve_sparse_directories(repo_root)
+    add_options = ["--no-checkout"] if sparse_directories else []
+    result = _git("-C", repo_root, "worktree", "add", "--detach", *add_options, str(slot_path), base_sha)
+    if result.returncode != 0:
+        print(f"Failed to add pool worktree {slot_path.name}: {result.stderr.strip()}", file=sys.stderr)
+        return False
+    if sparse_directories and not apply_sparse_checkout(str(slot_path), sparse_directories):
+        _remove_slot_worktree(repo_root, slot_path)
+        return False
+
+    inject_git_path_settings(str(slot_path))
+    run_worktree_setup_script(str(slot_path))
+    return True
+
+
+def fill_worktree_pool(repo_root: str) -> PoolStatus:
+    """
+    Bring the worktree pool up to the configured size.
+
+    Fetches main (serialized with other fetches of the repository),
+    discards stale and surplus worktrees and warms new ones.
+
+    Args:
+        repo_root: Root of the main repository.
+
+    Returns:
+        Pool status after the refill
+
+    Raises:
+        RuntimeError: If main can't be resolved or a worktree failed to warm
+    """
+    size = load_worktree_config(repo_root).poolSize
+    pool_dir = get_pool_dir(repo_root)
+
+    with fetch_lock(repo_root):
+        _git("-C", repo_root, "fetch", "--no-tags", "origin", "main")
+    base = _resolve_base(repo_root)
+    if base is None:
+        raise RuntimeError(f"Neither {' nor '.join(POOL_BASE_REFS)} exists in {repo_root}")
+    base_ref, base_sha = base
+
+    with _locked_manifest(pool_dir) as manifest:
+        remove, create = _plan_refill(manifest, size, base_ref, base_sha)
+
+    for slot in remove:
+        print(f"Removing pool worktree {slot.name}")
+        _remove_slot_worktree(repo_root, pool_dir / slot.name)
+
+    failed = []
+    for slot in create:
+        print(f"Warming pool worktree {slot.name} at {base_ref} ({base_sha[:8]})...")
+        warmed = _warm_slot(repo_root, pool_dir / slot.name, base_sha)
+        with _locked_manifest(pool_dir) as manifest:
+            for entry in manifest.slots:
+                if entry.name == slot.name:
+                    if warmed:
+                        entry.status, entry.updated = SLOT_READY, _now()
+                    else:
+                        manifest.slots.remove(entry)
+                    break
+        if not warmed:
+            failed.append(slot.name)
+
+    status = get_worktree_pool_status(repo_root) or PoolStatus(size=size, ready=0, warming=0, stale=0)
+    print(status.summary())
+    if failed:
+        raise RuntimeError(f"Failed to warm pool worktree(s): {', '.join(failed)}")
+    return status
+
+
+def _fill_worktree_pool_from_cwd() -> None:
+    """
+    Wrapper function for background task execution.
+
+    Refills the pool of the repository containing the working directory.
+    """
+    from .worktree_setup import get_main_repo_root
+
+    repo_root = get_main_repo_root()
+    if not repo_root:
+        raise RuntimeError("Not in a git repository")
+    fill_worktree_pool(repo_root)
+
+
+def start_worktree_pool_refill(repo_root: str) -> Optional[str]:
+    """
+    Start a background refill if the repository uses a worktree pool.
+
+    Runs when the pool is enabled, and also when it has been disabled but
+    still holds worktrees (so they get cleaned up).
+
+    Returns:
+        The background task ID, or None if there is no pool to refill
+    """
+    from ...background_tasks import run_function_in_background
+
+    try:
+        size = load_worktree_config(repo_root).poolSize
+    except ValueError:
+        return None
+    if not size and not (get_pool_dir(repo_root) / POOL_MANIFEST_FILENAME).is_file():
+        return None
+
+    task = run_function_in_background(
+        module_path="agentic_devtools.cli.workflows.worktree_pool",
+        function_name="_fill_worktree_pool_from_cwd",
+        command_display_name="agdt-worktree-pool-refill",
+        cwd=repo_root,
+    )
+    print(f"Refilling worktree pool in the background (task {task.id})")
+    return task.id
@@ -14,7 +14,10 @@ import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+from .worktree_pool import start_worktree_pool_refill, take_pooled_worktree
+from .worktree_sparse import apply_sparse_checkout, resolve_sparse_directories
 
 # Exported for dynamic invocation by run_function_in_background
 __all__ = ["_setup_worktree_from_state"]
@@ -259,6 +262,8 @@ def create_worktree(
     branch_prefix: str = "feature",
     branch_name: Optional[str] = None,
     use_existing_branch: bool = False,
+    sparse_directories: Optional[List[str]] = None,
+    branch_fetched: bool = False,
 ) -> WorktreeSetupResult:
     """
     Create a git worktree for the given issue key.
@@ -275,6 +280,10 @@ def create_worktree(
         use_existing_branch: If True and branch_name is provided, checkout the
             existing branch from origin instead of creating a new one.
             Enables safety checks before proceeding.
+        sparse_directories: If given, add the worktree with ``--no-checkout``
+            and check out only these directories (sparse-checkout cone mode).
+        branch_fetched: True if the caller already fetched the existing branch
+            from origin, so it isn't fetched again.
 
     Returns:
         WorktreeSetupResult with success status and paths
@@ -342,8 +351,9 @@ def create_worktree(
     if use_existing_branch and branch_name:
         print(f"Checking if branch '{branch_name}' is safe to use...")
 
-        # First fetch the branch from origin
-        fetch_branch(branch_name)
+        # First fetch the branch from origin (unless the caller just did)
+        if not branch_fetched:
+            fetch_branch(branch_name)
 
         # Perform safety check
         safety_result = check_branch_safe_to_recreate(branch_name)
@@ -362,10 +372,13 @@ def create_worktree(
     try:
         print(f"Creating worktree at {worktree_path}...")
 
+        # Sparse worktrees are populated after the sparse-checkout cone is set
+        add_options = ["--no-checkout"] if sparse_directories else []
+
         if use_existing_branch and branch_name:
             # For PR review: checkout existing branch from origin
             result = subprocess.run(
-                ["git", "worktree", "add", worktree_path, branch_name],
+                ["git", "worktree", "add", *add_options, worktree_path, branch_name],
                 capture_output=True,
                 text=True,
                 check=False,
@@ -374,7 +387,17 @@ def create_worktree(
             if result.returncode != 0:
                 # Try tracking the remote branch
                 result = subprocess.run(
-                    ["git", "worktree", "add", worktree_path, "--track", "-b", branch_name, f"origin/{branch_name}"],
+                    [
+                        "git",
+                        "worktree",
+                        "add",
+                        *add_options,
+                        worktree_path,
+                        "--track",
+                        "-b",
+                        branch_name,
+                        f"origin/{branch_name}",
+                    ],
                     capture_output=True,
                     text=True,
                     check=False,
@@ -382,7 +405,7 @@ def create_worktree(
         else:
             # Standard flow: create new branch
             result = subprocess.run(
-                ["git", "worktree", "add", worktree_path, "-b", resolved_branch_name],
+                ["git", "worktree", "add", *add_options, worktree_path, "-b", resolved_branch_name],
                 capture_output=True,
                 text=True,
                 check=False,
@@ -393,7 +416,7 @@ def create_worktree(
                 if "already exists" in result.stderr:
                     print(f"Branch {resolved_branch_name} already exists, using existing branch...")
                     result = subprocess.run(
-                        ["git", "worktree", "add", worktree_path, resolved_branch_name],
+                        ["git", "worktree", "add", *add_options, worktree_path, resolved_branch_name],
                         capture_output=True,
                         text=True,
                         check=False,
@@ -407,6 +430,14 @@ def create_worktree(
                 error_message=f"Failed to create worktree: {result.stderr.strip()}",
             )
 
+        if sparse_directories and not apply_sparse_checkout(worktree_path, sparse_directories):
+            return WorktreeSetupResult(
+                success=False,
+                worktree_path=worktree_path,
+                branch_name=resolved_branch_name,
+                error_message=f"Worktree added at {worktree_path} but checking out files failed",
+            )
+
         print(f"Worktree created successfully at {worktree_path}")
         return WorktreeSetupResult(
             success=True,
@@ -659,11 +690,18 @@ def setup_worktree_environment(
 
     This is the main entry point for setting up a new development environment
     for an issue. It:
-    1. Creates a git worktree for the issue
+    1. Creates a git worktree for the issue (sparse if enabled in
+       ``.agdt/config/worktrees.json``)
     2. Injects ``.vscode/settings.json`` with Git for Windows PATH entries (Windows only)
     3. Runs ``.agdt/agentic-devtools-worktree-setup.py`` if present
     4. Opens VS Code with the workspace file
 
+    For a new branch, steps 1-3 are replaced by taking a pre-warmed worktree
+    from the worktree pool (``poolSize`` in the same config) when one is
+    ready: its settings and dependencies were set up when it was warmed, so
+    it is only switched to the branch and moved. The pool is then refilled
+    in the background.
+
     Args:
         issue_key: The issue key (e.g., "DFLY-1234")
         branch_prefix: Prefix for the branch name (default: "feature").
@@ -677,22 +715,48 @@ def setup_worktree_environment(
     Returns:
         WorktreeSetupResult with success status and details
     """
-    # Step 1: Create worktree
-    result = create_worktree(
-        issue_key=issue_key,
-        branch_prefix=branch_prefix,
-        branch_name=branch_name,
-        use_existing_branch=use_existing_branch,
-    )
+    repo_root = get_main_repo_root()
+
+    result = None
+    if repo_root and not use_existing_branch:
+        worktree_path = os.path.join(os.path.dirname(repo_root), issue_key)
+        resolved_branch_name = branch_name or f"{branch_prefix}/{issue_key}/implementation"
+        if take_pooled_worktree(repo_root, worktree_path, resolved_branch_name):
+            result = WorktreeSetupResult(success=True, worktree_path=worktree_path, branch_name=resolved_branch_name)
+
+    if result is None:
+        # Step 1: Create worktree. An existing branch is fetched once, up front:
+        # the sparse directories are resolved from it and create_worktree uses it.
+        existing_branch = branch_name if use_existing_branch and branch_name else None
+        if existing_branch:
+            from ..git.operations import fetch_branch
+
+            fetch_branch(existing_branch)
+
+        sparse_directories = None
+        if repo_root:
+            sparse_directories = resolve_sparse_directories(repo_root, existing_branch)
+
+        result = create_worktree(
+            issue_key=issue_key,
+            branch_prefix=branch_prefix,
+            branch_name=branch_name,
+            use_existing_branch=use_existing_branch,
+            sparse_directories=sparse_directories,
+            branch_fetched=existing_branch is not None,
+        )
+
+        if not result.success:
+            return result
 
-    if not result.success:
-        return result
+        # Step 2: Inject VS Code settings for Windows Git PATH
+        inject_git_path_settings(result.worktree_path)
 
-    # Step 2: Inject VS Code settings for Windows Git PATH
-    inject_git_path_settings(result.worktree_path)
+        # Step 3: Run project-specific worktree setup script if present
+        run_worktree_setup_script(result.worktree_path)
 
-    # Step 3: Run project-specific worktree setup script if present
-    run_worktree_setup_script(result.worktree_path)
+    if repo_root:
+        start_worktree_pool_refill(repo_root)
 
     # Step 4: Open VS Code
     if open_vscode:
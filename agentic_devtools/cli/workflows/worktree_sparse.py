@@ -0,0 +1,155 @@
+"""
+Sparse worktrees for workflows.
+
+In a large monorepo a full checkout per worktree takes minutes and
+gigabytes. With ``sparseCheckout`` enabled in ``.agdt/config/worktrees.json``,
+workflow worktrees are added with ``git worktree add --no-checkout`` and then
+populated with sparse-checkout cone patterns: the directories the issue's
+branch touches (for existing branches, e.g. PR reviews), the configured
+``sparsePaths``, and ``.agdt`` so the worktree setup script and config are
+present. Cone mode always includes the files at the repository root.
+
+Directories can be added later with ``git sparse-checkout add <dir>``, or the
+full tree restored with ``git sparse-checkout disable``.
+"""
+
+import subprocess
+import sys
+from typing import Iterable, List, Optional
+
+from .worktree_config import load_worktree_config
+
+# Directories every sparse worktree includes
+ALWAYS_INCLUDED_DIRS = (".agdt",)
+
+
+def cone_directories(paths: Iterable[str]) -> List[str]:
+    """
+    Reduce directories to the minimal set of sparse-checkout cone directories.
+
+    Blank entries (the repository root, which cone mode always includes) and
+    directories inside another listed directory are dropped.
+
+    Args:
+        paths: Repository-relative directories using ``/`` separators.
+
+    Returns:
+        Sorted list of directories.
+    """
+    directories = set()
+    for path in paths:
+        directory = path.strip().strip("/")
+        if directory:
+            directories.add(directory)
+    return sorted(
+        directory
+        for directory in directories
+        if not any(directory.startswith(f"{other}/") for other in directories if other != directory)
+    )
+
+
+def get_branch_touched_paths(branch_name: str, main_branch: str = "main") -> List[str]:
+    """
+    Get the directories containing files a branch changed relative to main.
+
+    ``origin/<branch_name>`` must already be fetched (see
+    operations.fetch_branch); the worktree setup fetches it once before
+    resolving the sparse directories.
+
+    Args:
+        branch_name: Branch on origin (without the ``origin/`` prefix).
+        main_branch: Branch the changes are measured against.
+
+    Returns:
+        Repository-relative directories of changed files (empty if the
+        branch can't be compared).
+    """
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", f"origin/{main_branch}...origin/{branch_name}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except (FileNotFoundError, OSError):
+        return []
+    if result.returncode != 0:
+        return []
+    return [line.rpartition("/")[0] for line in result.stdout.splitlines() if "/" in line]
+
+
+def resolve_sparse_directories(repo_root: str, branch_name: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Decide which directories a new worktree should check out.
+
+    Args:
+        repo_root: Root of the main repository (where the config lives).
+        branch_name: Existing branch whose changed directories to include,
+            or None for a new branch.
+
+    Returns:
+        Cone directories for a sparse worktree, or None for a full checkout
+        (sparse checkout disabled, or nothing to check out beyond ``.agdt``).
+    """
+    try:
+        config = load_worktree_config(repo_root)
+    except ValueError as exc:
+        print(f"Warning: invalid worktree config, using a full checkout: {exc}", file=sys.stderr)
+        return None
+    if not config.sparseCheckout:
+        return None
+
+    paths = list(config.sparsePaths)
+    if branch_name:
+        paths.extend(get_branch_touched_paths(branch_name))
+    if not paths:
+        print("Sparse checkout enabled but no paths configured or touched; using a full checkout.")
+        return None
+    return cone_directories([*paths, *ALWAYS_INCLUDED_DIRS])
+
+
+def apply_sparse_checkout(worktree_path: str, directories: List[str]) -> bool:
+    """
+    Populate a worktree added with ``--no-checkout``.
+
+    Sets the sparse-checkout cone to ``directories`` and checks out. If the
+    sparse-checkout setup fails, the full tree is checked out instead so the
+    worktree is still usable.
+
+    Args:
+        worktree_path: Path to the worktree.
+        directories: Cone directories (see cone_directories).
+
+    Returns:
+        True if the worktree was checked out (sparse or full), False otherwise.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-C", worktree_path, "sparse-checkout", "set", "--cone", *directories],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode == 0:
+            print(f"Sparse checkout of {len(directories)} director{'y' if len(directories) == 1 else 'ies'}:")
+            for directory in directories:
+                print(f"  {directory}")
+        else:
+            print(
+                f"Warning: sparse-checkout failed, checking out the full tree: {result.stderr.strip()}",
+                file=sys.stderr,
+            )
+
+        result = subprocess.run(
+            ["git", "-C", worktree_path, "checkout"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except (FileNotFoundError, OSError) as exc:
+        print(f"Warning: could not check out worktree: {exc}", file=sys.stderr)
+        return False
+    if result.returncode != 0:
+        print(f"Warning: could not check out worktree: {result.stderr.strip()}", file=sys.stderr)
+        return False
+    return True
@@ -9,10 +9,12 @@ Key features:
 - Variable validation: ensures override templates include all required variables
 - Multi-step workflows: supports different prompts for different workflow steps
 - Generated prompt output: saves rendered prompts to temp folder for reference
+- Template caching: loaded and compiled templates are reused until the files change
 """
 
 from .loader import (
     TemplateValidationError,
+    clear_template_cache,
     get_prompts_dir,
     get_required_variables,
     get_temp_output_dir,
@@ -34,5 +36,6 @@ __all__ = [
     "save_generated_prompt",
     "load_and_render_prompt",
     "log_prompt_with_save_notice",
+    "clear_template_cache",
     "TemplateValidationError",
 ]
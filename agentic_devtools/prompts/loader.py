@@ -5,16 +5,29 @@ This module handles:
 - Loading prompt templates (with override support)
 - Variable extraction and validation
 - Variable substitution in templates
+- Caching of loaded and compiled templates
 - Saving generated prompts to temp folder
 - Console output with save notice
 """
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from jinja2 import BaseLoader, Environment, TemplateSyntaxError, Undefined
+from jinja2 import BaseLoader, Environment, Template, TemplateSyntaxError, Undefined
+
+# Maximum number of distinct template sources kept compiled in memory
+COMPILED_TEMPLATE_CACHE_SIZE = 64
+
+# (mtime_ns, size) of a template file, or None if it does not exist
+_FileSignature = Optional[Tuple[int, int]]
+
+# Loaded template content keyed by (default path, override path, validate_override).
+# Each entry remembers the file signatures it was loaded from so that edits to
+# either file invalidate it.
+_template_cache: Dict[Tuple[Path, Path, bool], Tuple[_FileSignature, _FileSignature, str]] = {}
 
 
 class TemplateValidationError(Exception):
@@ -177,6 +190,31 @@ _jinja_env = Environment(
 )
 
 
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def _compile_template(template: str) -> Template:
+    """
+    Parse and compile template source, once per distinct source string.
+
+    Syntax errors are not cached, so a broken template raises on every call.
+    """
+    return _jinja_env.from_string(template)
+
+
+def _file_signature(path: Path) -> _FileSignature:
+    """Return the (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def clear_template_cache() -> None:
+    """Drop all cached template content and compiled templates."""
+    _template_cache.clear()
+    _compile_template.cache_clear()
+
+
 def substitute_variables(template: str, variables: Dict[str, Any]) -> str:
     """
     Replace {{variable}} placeholders with actual values using Jinja2.
@@ -196,7 +234,7 @@ def substitute_variables(template: str, variables: Dict[str, Any]) -> str:
         Template with variables substituted
     """
     try:
-        jinja_template = _jinja_env.from_string(template)
+        jinja_template = _compile_template(template)
         return jinja_template.render(**variables)
     except TemplateSyntaxError:
         # If Jinja2 can't parse it, fall back to simple regex substitution
@@ -217,6 +255,10 @@ def load_prompt_template(
     """
     Load a prompt template, preferring override if it exists.
 
+    Results are cached per template path and reused until the default or
+    override file changes (detected by mtime and size), so repeated renders
+    skip re-reading the files and re-validating the override.
+
     Args:
         workflow_name: Name of the workflow (e.g., "pull-request-review")
         step_name: Name of the step (e.g., "initiate", "review-file")
@@ -233,25 +275,35 @@ def load_prompt_template(
     default_path = get_template_path(workflow_name, step_name, is_default=True)
     override_path = get_template_path(workflow_name, step_name, is_default=False)
 
+    cache_key = (default_path, override_path, validate_override)
+    default_signature = _file_signature(default_path)
+    override_signature = _file_signature(override_path)
+    cached = _template_cache.get(cache_key)
+    if cached is not None and cached[:2] == (default_signature, override_signature):
+        return cached[2]
+
     # Check for override first
-    if override_path.exists():
-        override_content = override_path.read_text(encoding="utf-8")
+    if override_signature is not None:
+        content = override_path.read_text(encoding="utf-8")
 
-        if validate_override and default_path.exists():
+        if validate_override and default_signature is not None:
             default_content = default_path.read_text(encoding="utf-8")
             # This will raise TemplateValidationError if override has extra variables
-            validate_template_variables(default_content, override_content)
-
-        return override_content
+            validate_template_variables(default_content, content)
 
     # Fall back to default
-    if default_path.exists():
-        return default_path.read_text(encoding="utf-8")
+    elif default_signature is not None:
+        content = default_path.read_text(encoding="utf-8")
 
     # No template found
-    raise FileNotFoundError(
-        f"No prompt template found for workflow '{workflow_name}', step '{step_name}'.\nExpected file: {default_path}"
-    )
+    else:
+        raise FileNotFoundError(
+            f"No prompt template found for workflow '{workflow_name}', step '{step_name}'.\n"
+            f"Expected file: {default_path}"
+        )
+
+    _template_cache[cache_key] = (default_signature, override_signature, content)
+    return content
 
 
 def save_generated_prompt(workflow_name: str, step_name: str, content: str) -> Path:
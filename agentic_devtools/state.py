@@ -17,7 +17,8 @@ import json
 import os
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 from .file_locking import FileLockError, locked_state_file
 
@@ -26,6 +27,9 @@ STATE_FILENAME = "agdt-state.json"
 # Default lock timeout in seconds
 DEFAULT_LOCK_TIMEOUT = 5.0
 
+# Sentinel for keys that are not present in state (distinct from a stored None)
+_MISSING = object()
+
 
 def _get_git_repo_root() -> Optional[Path]:
     """
@@ -223,22 +227,54 @@ def get_value(key: str, required: bool = False) -> Optional[Any]:
     Returns:
         Value or None if not found
     """
-    state = load_state()
+    value = _resolve_key(load_state(), key)
+    if value is _MISSING:
+        if required:
+            raise KeyError(f"Required state key not found: {key}")
+        return None
+    return value
 
-    # Support dot notation for nested keys
-    parts = key.split(".")
-    current = state
 
-    for part in parts:
+def _resolve_key(state: Dict[str, Any], key: str) -> Any:
+    """
+    Resolve a dotted key against an already loaded state dictionary.
+
+    Returns:
+        The value, or _MISSING if any part of the key path doesn't exist
+    """
+    current: Any = state
+    for part in key.split("."):
         if not isinstance(current, dict) or part not in current:
-            if required:
-                raise KeyError(f"Required state key not found: {key}")
-            return None
+            return _MISSING
         current = current[part]
-
     return current
 
 
+def get_state_snapshot(keys: Iterable[str]) -> Mapping[str, Any]:
+    """
+    Get several values from a single state load.
+
+    Each get_value() call re-reads the state file (and re-resolves the state
+    directory via git), so code that needs many keys at once should take a
+    snapshot instead.
+
+    Supports the same dot notation as get_value(). Every requested key is
+    present in the snapshot; keys not found in state map to None.
+
+    Args:
+        keys: State keys to read (e.g., ['pull_request_id', 'jira.issue_key'])
+
+    Returns:
+        Read-only mapping of each requested key to its value
+    """
+    state = load_state()
+    values = {}
+    for key in keys:
+        value = _resolve_key(state, key)
+        values[key] = None if value is _MISSING else value
+    return MappingProxyType(values)
+
+
 def set_value(key: str, value: Any) -> None:
     """
     Set a value in state.
@@ -0,0 +1,393 @@
+"""
+Compression and size-capped retention for background task logs.
+
+When a background task finishes, its runner compresses the plain-text log
+(zstd if the optional ``zstandard`` package is installed, gzip otherwise)
+and records it in a small index file in the logs directory. The index keeps
+each log's size and modification time, so retention can be enforced (by
+age, by count and by a total byte budget) without stat-ing every log.
+
+Task records keep pointing at the original ``.log`` path; resolve_log_path
+finds the compressed file and open_log_text reads either form transparently.
+Housekeeping failures are appended to the log itself (append_log_note),
+since background runners have no console to report them on.
+"""
+
+import contextlib
+import gzip
+import io
+import json
+import os
+import shutil
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, TextIO
+
+from .file_locking import FileLockError, locked_file
+from .task_state import get_logs_dir
+
+LOG_INDEX_FILENAME = "logs-index.json"
+
+# Bump when the index layout changes so that old indexes are rebuilt
+LOG_INDEX_VERSION = 1
+
+# Default byte budget for the logs directory
+DEFAULT_LOGS_MAX_BYTES = 256 * 1024 * 1024
+
+PLAIN_LOG_SUFFIX = ".log"
+GZIP_LOG_SUFFIX = ".log.gz"
+ZSTD_LOG_SUFFIX = ".log.zst"
+
+LOG_SUFFIXES = (PLAIN_LOG_SUFFIX, GZIP_LOG_SUFFIX, ZSTD_LOG_SUFFIX)
+
+
+def _get_zstandard():
+    """Return the zstandard module, or None if it is not installed."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def get_log_index_path() -> Path:
+    """
+    Get the path of the log index file.
+
+    Returns:
+        Path to scripts/temp/background-tasks/logs/logs-index.json
+    """
+    return get_logs_dir() / LOG_INDEX_FILENAME
+
+
+def get_logs_max_bytes() -> int:
+    """
+    Get the byte budget for the logs directory.
+
+    Reads background.logs_max_mb from state. Invalid or non-positive values
+    fall back to the default, since this runs unattended after every task.
+    """
+    from .state import get_value
+
+    max_mb = get_value("background.logs_max_mb")
+    if max_mb in (None, ""):
+        return DEFAULT_LOGS_MAX_BYTES
+    try:
+        max_bytes = int(float(max_mb) * 1024 * 1024)
+    except (TypeError, ValueError):
+        return DEFAULT_LOGS_MAX_BYTES
+    return max_bytes if max_bytes > 0 else DEFAULT_LOGS_MAX_BYTES
+
+
+def is_log_file_name(name: str) -> bool:
+    """Return True if a file name is a plain or compressed task log."""
+    return name.endswith(LOG_SUFFIXES)
+
+
+def is_compressed_log(path: Path) -> bool:
+    """Return True if a log path is a compressed log."""
+    return path.name.endswith((GZIP_LOG_SUFFIX, ZSTD_LOG_SUFFIX))
+
+
+def resolve_log_path(log_path: Path) -> Optional[Path]:
+    """
+    Find the current file for a task log.
+
+    Args:
+        log_path: The plain ``.log`` path recorded on the task
+
+    Returns:
+        The plain log if it exists, otherwise its compressed form, or None
+    """
+    for candidate in (log_path, Path(f"{log_path}.zst"), Path(f"{log_path}.gz")):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def open_log_binary(path: Path) -> BinaryIO:
+    """
+    Open a plain or compressed log for reading its (decompressed) bytes.
+
+    Raises:
+        OSError: If the log can't be opened (including zstd logs without zstandard)
+    """
+    if path.name.endswith(GZIP_LOG_SUFFIX):
+        return gzip.open(path, "rb")
+    if path.name.endswith(ZSTD_LOG_SUFFIX):
+        zstandard = _get_zstandard()
+        if zstandard is None:
+            raise OSError(f"Reading {path.name} requires the zstandard package")
+        # Notes appended after compression are separate frames
+        return zstandard.ZstdDecompressor().stream_reader(  # pragma: no cover
+            open(path, "rb"), closefd=True, read_across_frames=True
+        )
+    return open(path, "rb")
+
+
+def open_log_text(path: Path) -> TextIO:
+    """
+    Open a plain or compressed log for reading as UTF-8 text.
+
+    Raises:
+        OSError: If the log can't be opened (including zstd logs without zstandard)
+    """
+    if path.name.endswith(GZIP_LOG_SUFFIX):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    if path.name.endswith(ZSTD_LOG_SUFFIX):
+        raw = open_log_binary(path)  # pragma: no cover
+        return io.TextIOWrapper(raw, encoding="utf-8", errors="replace")  # pragma: no cover
+    return open(path, encoding="utf-8", errors="replace")
+
+
+def append_log_note(log_path: Path, message: str) -> None:
+    """
+    Append a housekeeping note to a task log, in whichever form it currently has.
+
+    A compressed log gets the note as an extra gzip member or zstd frame,
+    which readers decompress as part of the log. If the log can't be written
+    the note goes to stderr instead.
+
+    Args:
+        log_path: The plain ``.log`` path recorded on the task
+        message: The note to append
+    """
+    text = f"\n[log housekeeping] {message}\n"
+    current = resolve_log_path(log_path) or log_path
+    try:
+        if current.name.endswith(GZIP_LOG_SUFFIX):
+            with gzip.open(current, "at", encoding="utf-8") as f:
+                f.write(text)
+        elif current.name.endswith(ZSTD_LOG_SUFFIX):  # pragma: no cover - optional dependency
+            zstandard = _get_zstandard()
+            if zstandard is None:
+                raise OSError(f"Writing {current.name} requires the zstandard package")
+            with open(current, "ab") as f:
+                f.write(zstandard.ZstdCompressor().compress(text.encode("utf-8")))
+        else:
+            with open(current, "a", encoding="utf-8") as f:
+                f.write(text)
+    except OSError:
+        print(f"{log_path}: {message}", file=sys.stderr)
+
+
+def compress_log(log_path: Path) -> Path:
+    """
+    Compress a finished plain-text log and remove the original.
+
+    The compressed file is written next to the log and keeps its
+    modification time, so retention order is unchanged. It is written to a
+    temporary file and renamed into place before the plain log is removed,
+    so a reader always finds one complete form of the log.
+
+    Returns:
+        Path of the compressed log
+    """
+    zstandard = _get_zstandard()
+    target = Path(f"{log_path}.zst" if zstandard is not None else f"{log_path}.gz")
+    tmp_path = target.with_name(target.name + ".tmp")
+
+    try:
+        with open(log_path, "rb") as source, open(tmp_path, "wb") as raw:
+            if zstandard is not None:  # pragma: no cover - optional dependency
+                with zstandard.ZstdCompressor().stream_writer(raw, closefd=False) as writer:
+                    shutil.copyfileobj(source, writer)
+            else:
+                with gzip.GzipFile(filename=log_path.name, mode="wb", fileobj=raw) as writer:
+                    shutil.copyfileobj(source, writer)
+
+        stat = log_path.stat()
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        tmp_path.replace(target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+    log_path.unlink()
+    return target
+
+
+@dataclass
+class LogIndexEntry:
+    """Size and modification time of one log file."""
+
+    size: int
+    mtime: float
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {"size": self.size, "mtime": self.mtime}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogIndexEntry":
+        """Create from dictionary."""
+        return cls(size=int(data["size"]), mtime=float(data["mtime"]))
+
+
+@dataclass
+class LogIndex:
+    """Known log files in the logs directory, keyed by file name."""
+
+    entries: Dict[str, LogIndexEntry] = field(default_factory=dict)
+    version: int = LOG_INDEX_VERSION
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all indexed logs."""
+        return sum(entry.size for entry in self.entries.values())
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "version": self.version,
+            "entries": {name: entry.to_dict() for name, entry in sorted(self.entries.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogIndex":
+        """Create from dictionary."""
+        return cls(
+            entries={name: LogIndexEntry.from_dict(entry) for name, entry in data.get("entries", {}).items()},
+            version=data.get("version", 0),
+        )
+
+
+def _parse_log_index(content: str) -> LogIndex:
+    """Parse index file content, returning an empty index if it is unreadable or outdated."""
+    try:
+        index = LogIndex.from_dict(json.loads(content))
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return LogIndex()
+    if index.version != LOG_INDEX_VERSION:
+        return LogIndex()
+    return index
+
+
+def sync_log_index(index: LogIndex, logs_dir: Path) -> None:
+    """
+    Reconcile the index with the log files on disk.
+
+    Lists the directory once (names only). Only new files and plain logs
+    (which may still be growing) are stat-ed; compressed logs never change,
+    so their indexed size and time are reused. Index entries whose files
+    are gone are dropped.
+    """
+    names = set()
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and is_log_file_name(entry.name):
+                names.add(entry.name)
+
+    for name in list(index.entries):
+        if name not in names:
+            del index.entries[name]
+
+    for name in names:
+        if name in index.entries and is_compressed_log(Path(name)):
+            continue
+        try:
+            stat = (logs_dir / name).stat()
+        except OSError:
+            index.entries.pop(name, None)
+            continue
+        index.entries[name] = LogIndexEntry(size=stat.st_size, mtime=stat.st_mtime)
+
+
+def enforce_log_retention(
+    index: LogIndex,
+    logs_dir: Path,
+    max_age_hours: Optional[float] = None,
+    max_count: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> int:
+    """
+    Delete indexed logs, oldest first, until the retention limits are met.
+
+    Logs older than ``max_age_hours`` are always deleted; then the oldest
+    remaining logs are deleted while there are more than ``max_count`` logs.
+    While all logs take more than ``max_bytes`` in total, the oldest
+    compressed logs are deleted too; plain logs may still be written by a
+    running task, so the byte budget never deletes them. Deleted logs are
+    removed from the index; logs that can't be deleted are kept in it.
+
+    Returns:
+        Number of log files deleted
+    """
+    cutoff = None
+    if max_age_hours is not None:
+        cutoff = datetime.now(timezone.utc).timestamp() - max_age_hours * 3600
+
+    ordered: List[str] = sorted(index.entries, key=lambda name: index.entries[name].mtime)
+    remaining_count = len(ordered)
+    remaining_bytes = index.total_bytes
+    deleted = 0
+
+    for name in ordered:
+        entry = index.entries[name]
+        too_old = cutoff is not None and entry.mtime < cutoff
+        too_many = max_count is not None and remaining_count > max_count
+        too_big = max_bytes is not None and remaining_bytes > max_bytes and is_compressed_log(Path(name))
+        if not (too_old or too_many or too_big):
+            continue
+        try:
+            (logs_dir / name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            continue
+        del index.entries[name]
+        remaining_count -= 1
+        remaining_bytes -= entry.size
+        deleted += 1
+
+    return deleted
+
+
+def cleanup_logs(
+    max_age_hours: Optional[float] = None,
+    max_count: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> int:
+    """
+    Apply the retention limits to the logs directory, using the index.
+
+    Returns:
+        Number of log files deleted
+    """
+    logs_dir = get_logs_dir()
+    try:
+        with locked_file(get_log_index_path(), "r+") as f:
+            index = _parse_log_index(f.read())
+            sync_log_index(index, logs_dir)
+            deleted = enforce_log_retention(index, logs_dir, max_age_hours, max_count, max_bytes)
+            f.seek(0)
+            f.write(json.dumps(index.to_dict(), indent=2))
+            f.truncate()
+    except FileLockError:  # Another process is cleaning up
+        return 0
+    return deleted
+
+
+def finalize_task_log(log_path: Path) -> Optional[Path]:
+    """
+    Compress a finished task log and enforce the logs byte budget.
+
+    Called by background task runners after the task completes. Failures
+    never change a task's outcome; they are noted at the end of its log.
+
+    Returns:
+        Path of the compressed log, or None if it couldn't be compressed
+    """
+    try:
+        compressed = compress_log(log_path)
+    except Exception as e:
+        if log_path.exists():
+            append_log_note(log_path, f"Could not compress log: {e}")
+        return None
+    try:
+        cleanup_logs(max_bytes=get_logs_max_bytes())
+    except Exception as e:  # Retention is retried after the next task
+        append_log_note(log_path, f"Could not enforce log retention: {e}")
+    return compressed
@@ -21,7 +21,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from .state import get_state_dir, load_state, save_state
 
@@ -632,6 +632,60 @@ def get_task_by_id(task_id: str, use_locking: bool = True) -> Optional[Backgroun
     return get_task_from_all_tasks(task_id)
 
 
+def _match_task_ids(task_ids: List[str], tasks: List[BackgroundTask], found: Dict[str, BackgroundTask]) -> List[str]:
+    """
+    Resolve task IDs against a task list, like get_task_by_id does.
+
+    Args:
+        task_ids: IDs (or ID prefixes of at least 8 characters) to resolve
+        tasks: Sorted tasks to search
+        found: Dictionary receiving the resolved tasks, keyed by requested ID
+
+    Returns:
+        The IDs that were not resolved
+    """
+    by_id = {}
+    for task in tasks:
+        by_id.setdefault(task.id, task)
+
+    missing = []
+    for task_id in task_ids:
+        task = by_id.get(task_id)
+        if task is None and len(task_id) >= 8:
+            task = next((t for t in tasks if t.id.startswith(task_id)), None)
+        if task is None:
+            missing.append(task_id)
+        else:
+            found[task_id] = task
+    return missing
+
+
+def get_tasks_by_ids(task_ids: Iterable[str], use_locking: bool = True) -> Dict[str, BackgroundTask]:
+    """
+    Get several tasks by ID at once.
+
+    Resolves each ID like get_task_by_id, but loads the state file once and
+    the all-tasks file at most once, however many IDs are requested.
+
+    Args:
+        task_ids: Task IDs to look up
+        use_locking: Whether to use file locking for thread safety
+
+    Returns:
+        Dictionary of requested ID to BackgroundTask; IDs that weren't found
+        are left out
+    """
+    pending = list(dict.fromkeys(task_ids))
+    found: Dict[str, BackgroundTask] = {}
+    if not pending:
+        return found
+
+    missing = _match_task_ids(pending, get_recent_tasks(use_locking=use_locking), found)
+    if missing:
+        _match_task_ids(missing, get_all_tasks(), found)
+    return found
+
+
 def get_tasks_by_status(status: TaskStatus, use_locking: bool = True) -> List[BackgroundTask]:
     """
     Get all tasks with a specific status.
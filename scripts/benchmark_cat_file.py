@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark resolving refs with GitObjectReader against one git process per ref.
+
+Creates a throwaway repository with N branches and resolves every branch
+three ways:
+
+- ``git rev-parse --verify <ref>``, one process per ref (what sync_git_ref
+  does without a reader)
+- GitObjectReader.resolve, one request at a time over the cat-file pipe
+- GitObjectReader.resolve_many, all requests pipelined
+
+Usage:
+    python scripts/benchmark_cat_file.py             # 1000 refs
+    python scripts/benchmark_cat_file.py --refs 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def _git(repo: Path, *args: str, stdin: str | None = None) -> str:
+    """Run a git command in the benchmark repository."""
+    result = subprocess.run(["git", *args], cwd=repo, input=stdin, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def _create_repo(repo: Path, ref_count: int) -> list:
+    """Create a repository with one commit and ref_count branches pointing at it."""
+    _git(repo, "init", "-q")
+    (repo / "README.md").write_text("benchmark\n", encoding="utf-8")
+    _git(repo, "add", "README.md")
+    _git(repo, "-c", "user.name=bench", "-c", "user.email=bench@example.com", "commit", "-q", "-m", "init")
+    head = _git(repo, "rev-parse", "HEAD").strip()
+    names = [f"bench/branch-{i:05d}" for i in range(ref_count)]
+    _git(repo, "update-ref", "--stdin", stdin="".join(f"create refs/heads/{name} {head}\n" for name in names))
+    return names
+
+
+def main() -> int:
+    """Run the benchmark and print timings."""
+    from agentic_devtools.cli.git.core import GitObjectReader
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--refs", type=int, default=1000, help="Number of refs to resolve (default: 1000)")
+    args = parser.parse_args()
+
+    repo = Path(tempfile.mkdtemp(prefix="agdt-bench-"))
+    try:
+        names = _create_repo(repo, args.refs)
+
+        started = time.perf_counter()
+        for name in names:
+            subprocess.run(["git", "rev-parse", "--verify", name], cwd=repo, capture_output=True, check=True)
+        rev_parse = time.perf_counter() - started
+
+        with GitObjectReader(cwd=str(repo)) as reader:
+            started = time.perf_counter()
+            for name in names:
+                reader.resolve(name)
+            one_at_a_time = time.perf_counter() - started
+
+        with GitObjectReader(cwd=str(repo)) as reader:
+            started = time.perf_counter()
+            resolved = reader.resolve_many(names)
+            pipelined = time.perf_counter() - started
+        if None in resolved.values():
+            raise RuntimeError("GitObjectReader failed to resolve a benchmark ref")
+    finally:
+        shutil.rmtree(repo, ignore_errors=True)
+
+    print(f"Resolved {args.refs} refs")
+    print(f"  git rev-parse per ref:        {rev_parse * 1000:8.1f} ms")
+    print(f"  GitObjectReader.resolve:      {one_at_a_time * 1000:8.1f} ms")
+    print(f"  GitObjectReader.resolve_many: {pipelined * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark rendering of the pull request file-review prompt.
+
+The PR review flow renders the file-review prompt once per changed file.
+This script renders it for N synthetic files, first with the template cache
+cleared before every render (the pre-cache behaviour: re-read, re-validate and
+re-compile each time) and then with the cache warm.
+
+Usage:
+    python scripts/benchmark_prompt_rendering.py            # 1,000 files
+    python scripts/benchmark_prompt_rendering.py --files 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from agentic_devtools.prompts.loader import (  # noqa: E402
+    clear_template_cache,
+    load_and_render_prompt,
+)
+
+WORKFLOW_NAME = "pull-request-review"
+STEP_NAME = "file-review"
+
+
+def _file_variables(index: int, total: int) -> dict:
+    """Return the variables rendered into the prompt for the index-th file."""
+    return {
+        "pull_request_id": 12345,
+        "current_file": f"src/module_{index // 50}/file_{index}.py",
+        "prompt_file_path": f"scripts/temp/pull-request-review/prompts/12345/file-{index}.md",
+        "completed_count": index,
+        "pending_count": total - index - 1,
+        "total_count": total,
+    }
+
+
+def _render_all(files: int, cold: bool) -> float:
+    """Render the prompt for every file and return the elapsed seconds."""
+    started = time.perf_counter()
+    for index in range(files):
+        if cold:
+            clear_template_cache()
+        load_and_render_prompt(
+            WORKFLOW_NAME,
+            STEP_NAME,
+            _file_variables(index, files),
+            save_to_temp=False,
+            log_output=False,
+        )
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000, help="Number of file prompts to render (default: 1000)")
+    args = parser.parse_args()
+
+    cold = _render_all(args.files, cold=True)
+    clear_template_cache()
+    warm = _render_all(args.files, cold=False)
+
+    print(f"Rendered {args.files} '{STEP_NAME}' prompts")
+    print(f"  uncached: {cold:.3f}s ({cold / args.files * 1000:.3f} ms/prompt)")
+    print(f"  cached:   {warm:.3f}s ({warm / args.files * 1000:.3f} ms/prompt)")
+    if warm > 0:
+        print(f"  speedup:  {cold / warm:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
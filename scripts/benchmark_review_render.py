@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark rendering review summaries with and without the fragment cache.
+
+Builds a ReviewState with N files spread over folders and statuses, then
+simulates a review cascade: one file changes status and the overall
+summary plus that file's summary are re-rendered. This runs twice:
+
+- cleared: the render cache is cleared before every cascade, so every
+  file is rendered again
+- cached: the cache is kept, so only the changed file is re-rendered
+
+Usage:
+    python scripts/benchmark_review_render.py              # 500 files
+    python scripts/benchmark_review_render.py --files 2000 --cascades 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+BASE_URL = "https://dev.azure.com/org/project/_git/repo/pullRequest/1"
+
+
+def _build_state(file_count: int):
+    """Build a ReviewState with file_count files, some of them needing work."""
+    from agentic_devtools.cli.azure_devops.review_state import (
+        FileEntry,
+        FolderGroup,
+        ModelVerdict,
+        OverallSummary,
+        ReviewState,
+        ReviewStatus,
+        SuggestionEntry,
+    )
+
+    statuses = [
+        ReviewStatus.UNREVIEWED.value,
+        ReviewStatus.APPROVED.value,
+        ReviewStatus.NEEDS_WORK.value,
+        ReviewStatus.IN_PROGRESS.value,
+    ]
+    folders: dict = {}
+    files: dict = {}
+    for i in range(file_count):
+        folder = f"src/module_{i % 25:02d}"
+        path = f"/{folder}/file_{i:05d}.py"
+        status = statuses[i % len(statuses)]
+        suggestions = []
+        if status == ReviewStatus.NEEDS_WORK.value:
+            suggestions = [
+                SuggestionEntry(
+                    threadId=100000 + i * 10 + n,
+                    commentId=1,
+                    line=n + 1,
+                    endLine=n + 1,
+                    severity=("high", "medium", "low")[n % 3],
+                    outOfScope=False,
+                    linkText=f"line {n + 1}",
+                    content=f"Suggestion {n}",
+                )
+                for n in range(4)
+            ]
+        files[path] = FileEntry(
+            threadId=i + 1,
+            commentId=1,
+            folder=folder,
+            fileName=f"file_{i:05d}.py",
+            status=status,
+            summary="Looks fine." if status != ReviewStatus.UNREVIEWED.value else None,
+            suggestions=suggestions,
+            modelVerdicts=[ModelVerdict(modelId="model-a", status=status)],
+        )
+        folders.setdefault(folder, FolderGroup()).files.append(path)
+
+    return ReviewState(
+        prId=1,
+        repoId="repo-guid",
+        repoName="repo",
+        project="project",
+        organization="https://dev.azure.com/org",
+        latestIterationId=1,
+        scaffoldedUtc="2026-01-01T00:00:00Z",
+        overallSummary=OverallSummary(threadId=1, commentId=1),
+        folders=folders,
+        files=files,
+    )
+
+
+def _run_cascades(state, cascades: int, clear_cache: bool) -> float:
+    """Flip one file per cascade and re-render; return the total seconds taken."""
+    from agentic_devtools.cli.azure_devops.review_state import ReviewStatus
+    from agentic_devtools.cli.azure_devops.review_templates import (
+        clear_render_cache,
+        render_file_summary,
+        render_overall_summary,
+    )
+
+    paths = list(state.files)
+    clear_render_cache()
+    render_overall_summary(state, BASE_URL)
+
+    started = time.perf_counter()
+    for n in range(cascades):
+        if clear_cache:
+            clear_render_cache()
+        entry = state.files[paths[n % len(paths)]]
+        entry.status = (
+            ReviewStatus.APPROVED.value
+            if entry.status != ReviewStatus.APPROVED.value
+            else ReviewStatus.IN_PROGRESS.value
+        )
+        render_file_summary(entry, entry.suggestions, BASE_URL)
+        render_overall_summary(state, BASE_URL)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500, help="Number of files in the review state (default: 500)")
+    parser.add_argument("--cascades", type=int, default=100, help="Number of cascades to render (default: 100)")
+    args = parser.parse_args()
+
+    cold = _run_cascades(_build_state(args.files), args.cascades, clear_cache=True)
+    warm = _run_cascades(_build_state(args.files), args.cascades, clear_cache=False)
+
+    print(f"Rendered {args.cascades} cascades over {args.files} files")
+    print(f"  cache cleared per cascade: {cold * 1000 / args.cascades:8.2f} ms per cascade")
+    print(f"  fragment cache kept:       {warm * 1000 / args.cascades:8.2f} ms per cascade")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
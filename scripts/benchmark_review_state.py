@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark loading and saving a large review-state.json.
+
+Builds a synthetic ReviewState (default: 2,000 files carrying 10,000
+suggestions and two model verdicts each), then times:
+
+- ReviewState.to_dict + save_review_state (serialize and write)
+- load_review_state (read and deserialize)
+
+and reports the memory held by the loaded state, measured with
+tracemalloc.
+
+Usage:
+    python scripts/benchmark_review_state.py
+    python scripts/benchmark_review_state.py --files 5000 --suggestions 25000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def _build_state(file_count: int, suggestion_count: int):
+    """Build a ReviewState with suggestions spread evenly over its files."""
+    from agentic_devtools.cli.azure_devops.review_state import (
+        FileEntry,
+        FolderGroup,
+        ModelVerdict,
+        OverallSummary,
+        ReviewSession,
+        ReviewState,
+        SuggestionEntry,
+    )
+
+    folders: dict = {}
+    files: dict = {}
+    for i in range(file_count):
+        folder = f"src/module_{i % 50:02d}"
+        path = f"/{folder}/file_{i:05d}.py"
+        suggestions = [
+            SuggestionEntry(
+                threadId=100000 + n,
+                commentId=1,
+                line=n % 400 + 1,
+                endLine=n % 400 + 3,
+                severity=("high", "medium", "low")[n % 3],
+                outOfScope=n % 7 == 0,
+                linkText=f"lines {n % 400 + 1} - {n % 400 + 3}",
+                content=f"Suggestion {n}: consider handling the empty case before indexing.",
+            )
+            for n in range(i * suggestion_count // file_count, (i + 1) * suggestion_count // file_count)
+        ]
+        files[path] = FileEntry(
+            threadId=i + 1,
+            commentId=1,
+            folder=folder,
+            fileName=f"file_{i:05d}.py",
+            status="needs-work" if suggestions else "approved",
+            summary="Refactors the module and adds validation.",
+            suggestions=suggestions,
+            modelVerdicts=[
+                ModelVerdict(modelId="model-a", status="approved", verdictType="agree"),
+                ModelVerdict(modelId="model-b", status="needs-work", verdictType="supplement"),
+            ],
+        )
+        folders.setdefault(folder, FolderGroup()).files.append(path)
+
+    return ReviewState(
+        prId=1,
+        repoId="repo-guid",
+        repoName="repo",
+        project="project",
+        organization="https://dev.azure.com/org",
+        latestIterationId=1,
+        scaffoldedUtc="2026-01-01T00:00:00Z",
+        overallSummary=OverallSummary(threadId=1, commentId=1),
+        folders=folders,
+        files=files,
+        commitHash="0" * 40,
+        sessions=[ReviewSession(sessionId="s1", modelId="model-a", startedUtc="2026-01-01T00:00:00Z")],
+        reviewerModels=["model-a", "model-b"],
+    )
+
+
+def main() -> int:
+    """Run the benchmark and print timings."""
+    from agentic_devtools.cli.azure_devops import review_state as review_state_module
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000, help="Number of files (default: 2000)")
+    parser.add_argument("--suggestions", type=int, default=10000, help="Number of suggestions (default: 10000)")
+    parser.add_argument("--rounds", type=int, default=3, help="Load/save rounds to average (default: 3)")
+    args = parser.parse_args()
+
+    state_dir = Path(tempfile.mkdtemp(prefix="agdt-bench-"))
+    try:
+        with patch.object(review_state_module, "get_state_dir", return_value=state_dir):
+            state = _build_state(args.files, args.suggestions)
+
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                review_state_module.save_review_state(state)
+            save = (time.perf_counter() - started) / args.rounds
+
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                review_state_module.load_review_state(state.prId)
+            load = (time.perf_counter() - started) / args.rounds
+
+            size = review_state_module.get_review_state_file_path(state.prId).stat().st_size
+            del state
+
+            tracemalloc.start()
+            loaded = review_state_module.load_review_state(1)
+            held, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del loaded
+    finally:
+        shutil.rmtree(state_dir, ignore_errors=True)
+
+    print(f"Review state: {args.files} files, {args.suggestions} suggestions, {size / 1024:.0f} KiB on disk")
+    print(f"  save_review_state: {save * 1000:8.1f} ms")
+    print(f"  load_review_state: {load * 1000:8.1f} ms")
+    print(f"  loaded state held: {held / 1024:8.0f} KiB (peak while loading {peak / 1024:.0f} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark spawn-to-first-log-line latency of background tasks.
+
+Every async command spawns a detached Python process through
+run_function_in_background. This script spawns N tasks that run a trivial
+function and measures, for each one, the time from the spawn call until
+the first line appears in the task's log file, and until the task is
+marked completed.
+
+The tasks run against a throwaway state directory
+(AGENTIC_DEVTOOLS_STATE_DIR), so the real task list is not touched.
+
+Usage:
+    python scripts/benchmark_task_spawn.py            # 20 tasks
+    python scripts/benchmark_task_spawn.py --tasks 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+POLL_INTERVAL = 0.001
+TIMEOUT_SECONDS = 30.0
+
+
+def _wait_for_first_line(log_file: Path, deadline: float) -> bool:
+    """Poll until the log file contains a complete first line."""
+    while time.perf_counter() < deadline:
+        try:
+            if b"\n" in log_file.read_bytes():
+                return True
+        except OSError:
+            pass
+        time.sleep(POLL_INTERVAL)
+    return False
+
+
+def _spawn_and_measure() -> tuple:
+    """Spawn one task and return (first log line seconds, completion seconds)."""
+    from agentic_devtools.background_tasks import run_function_in_background
+    from agentic_devtools.task_state import TaskStatus, get_task_by_id
+
+    started = time.perf_counter()
+    task = run_function_in_background("agentic_devtools.task_state", "get_logs_dir", command_display_name="bench")
+    deadline = started + TIMEOUT_SECONDS
+    if not _wait_for_first_line(Path(task.log_file), deadline):
+        raise RuntimeError(f"Task {task.id} wrote no log line within {TIMEOUT_SECONDS}s")
+    first_line = time.perf_counter() - started
+
+    completed = None
+    while time.perf_counter() < deadline:
+        if completed is None:
+            current = get_task_by_id(task.id)
+            if current and current.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+                completed = time.perf_counter() - started
+        # Wait for the runner to compress the log, so runs don't overlap
+        if completed is not None and not Path(task.log_file).exists():
+            return first_line, completed
+        time.sleep(POLL_INTERVAL)
+    raise RuntimeError(f"Task {task.id} did not finish within {TIMEOUT_SECONDS}s")
+
+
+def main() -> int:
+    """Run the benchmark and print latency statistics."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=20, help="Number of tasks to spawn (default: 20)")
+    args = parser.parse_args()
+
+    state_dir = tempfile.mkdtemp(prefix="agdt-bench-")
+    os.environ["AGENTIC_DEVTOOLS_STATE_DIR"] = state_dir
+    try:
+        results = [_spawn_and_measure() for _ in range(args.tasks)]
+    finally:
+        # The last runner may still be updating the log index
+        time.sleep(0.5)
+        shutil.rmtree(state_dir, ignore_errors=True)
+
+    first_lines = [first for first, _ in results]
+    completions = [done for _, done in results]
+    print(f"Spawned {args.tasks} background tasks")
+    print(
+        f"  first log line: median {statistics.median(first_lines) * 1000:.1f} ms, max {max(first_lines) * 1000:.1f} ms"
+    )
+    print(
+        f"  completed:      median {statistics.median(completions) * 1000:.1f} ms, max {max(completions) * 1000:.1f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
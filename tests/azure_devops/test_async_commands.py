@@ -5,6 +5,8 @@ Tests verify that async commands spawn background tasks correctly,
 calling Python functions directly via run_function_in_background.
 """
 
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -53,17 +55,17 @@ def mock_background_and_state(tmp_path):
                     }
 
 
-def _get_script_from_call(mock_popen):
-    """Extract the Python script from the Popen call args."""
+def _get_handoff_from_call(mock_popen):
+    """Read the runner handoff file from the Popen call args."""
     call_args = mock_popen.call_args[0][0]  # First positional arg is the command list
-    # Script is the third element: [python, -c, <script>]
-    return call_args[2] if len(call_args) > 2 else ""
+    # The handoff file is the last element: [python, -c, <bootstrap>, <package dir>, <handoff>]
+    return json.loads(Path(call_args[-1]).read_text(encoding="utf-8"))
 
 
-def _assert_function_in_script(script: str, module_path: str, function_name: str):
-    """Assert that the generated script calls the correct module and function."""
-    assert f"module_path = '{module_path}'" in script, f"Expected module_path='{module_path}' in script"
-    assert f"function_name = '{function_name}'" in script, f"Expected function_name='{function_name}' in script"
+def _assert_function_in_handoff(handoff: dict, module_path: str, function_name: str):
+    """Assert that the runner handoff calls the expected module and function."""
+    assert handoff["module_path"] == module_path
+    assert handoff["function_name"] == function_name
 
 
 # =============================================================================
@@ -118,8 +120,8 @@ class TestAddPullRequestCommentAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "add_pull_request_comment")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "add_pull_request_comment")
 
 
 class TestApprovePullRequestAsync:
@@ -137,8 +139,8 @@ class TestApprovePullRequestAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "approve_pull_request")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "approve_pull_request")
 
 
 class TestCreatePullRequestAsync:
@@ -157,8 +159,8 @@ class TestCreatePullRequestAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "create_pull_request")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "create_pull_request")
 
     def test_accepts_cli_parameters(self, mock_background_and_state, capsys):
         """Test command accepts CLI parameters that override state."""
@@ -194,8 +196,8 @@ class TestGetPullRequestThreadsAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "get_pull_request_threads")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "get_pull_request_threads")
 
 
 class TestReplyToThreadAsync:
@@ -215,8 +217,10 @@ class TestReplyToThreadAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "reply_to_pull_request_thread")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.commands", "reply_to_pull_request_thread"
+        )
 
 
 class TestResolveThreadAsync:
@@ -235,8 +239,8 @@ class TestResolveThreadAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "resolve_thread")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "resolve_thread")
 
 
 class TestMarkPullRequestDraftAsync:
@@ -249,8 +253,8 @@ class TestMarkPullRequestDraftAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "mark_pull_request_draft")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "mark_pull_request_draft")
 
 
 class TestPublishPullRequestAsync:
@@ -263,8 +267,8 @@ class TestPublishPullRequestAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "publish_pull_request")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "publish_pull_request")
 
 
 class TestGetPullRequestDetailsAsync:
@@ -277,9 +281,9 @@ class TestGetPullRequestDetailsAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(
-            script, "agentic_devtools.cli.azure_devops.pull_request_details_commands", "get_pull_request_details"
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.pull_request_details_commands", "get_pull_request_details"
         )
 
 
@@ -298,9 +302,9 @@ class TestRunE2ETestsSynapseAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(
-            script, "agentic_devtools.cli.azure_devops.pipeline_commands", "run_e2e_tests_synapse"
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.pipeline_commands", "run_e2e_tests_synapse"
         )
 
 
@@ -314,9 +318,9 @@ class TestRunE2ETestsFabricAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(
-            script,
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff,
             "agentic_devtools.cli.azure_devops.pipeline_commands",
             "run_e2e_tests_fabric",
         )
@@ -332,8 +336,8 @@ class TestRunWbPatchAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.pipeline_commands", "run_wb_patch")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.pipeline_commands", "run_wb_patch")
 
 
 class TestGetRunDetailsAsync:
@@ -346,8 +350,10 @@ class TestGetRunDetailsAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.run_details_commands", "get_run_details")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.run_details_commands", "get_run_details"
+        )
 
 
 # =============================================================================
@@ -372,8 +378,8 @@ class TestApproveFileAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.file_review_commands", "approve_file")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.file_review_commands", "approve_file")
 
     def test_accepts_cli_parameters(self, mock_background_and_state, capsys):
         """Test command accepts CLI parameters that override state."""
@@ -404,9 +410,9 @@ class TestSubmitFileReviewAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(
-            script, "agentic_devtools.cli.azure_devops.file_review_commands", "submit_file_review"
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.file_review_commands", "submit_file_review"
         )
 
 
@@ -428,8 +434,10 @@ class TestRequestChangesAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.file_review_commands", "request_changes")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.file_review_commands", "request_changes"
+        )
 
     def test_accepts_cli_parameters(self, mock_background_and_state, capsys):
         """Test command accepts CLI parameters that override state."""
@@ -482,9 +490,9 @@ class TestRequestChangesWithSuggestionAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(
-            script, "agentic_devtools.cli.azure_devops.file_review_commands", "request_changes_with_suggestion"
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.file_review_commands", "request_changes_with_suggestion"
         )
 
     def test_accepts_cli_parameters(self, mock_background_and_state, capsys):
@@ -521,8 +529,10 @@ class TestMarkFileReviewedAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.azure_devops.mark_reviewed", "mark_file_reviewed_cli")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.mark_reviewed", "mark_file_reviewed_cli"
+        )
 
 
 # =============================================================================
@@ -1146,7 +1146,7 @@ class TestGetPullRequestDetailsExecution:
         ), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_auth_headers",
             return_value={"Authorization": "Basic xxx"},
-        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_ref"), patch(
+        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_refs"), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_diff_entries",
             return_value=[],
         ), patch(
@@ -1197,7 +1197,7 @@ class TestGetPullRequestDetailsExecution:
         ), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_auth_headers",
             return_value={},
-        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_ref"), patch(
+        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_refs"), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_diff_entries",
             return_value=[],
         ), patch(
@@ -1251,7 +1251,7 @@ class TestGetPullRequestDetailsExecution:
         ), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_auth_headers",
             return_value={},
-        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_ref"), patch(
+        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_refs"), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_diff_entries",
             return_value=[],
         ), patch(
@@ -1,5 +1,6 @@
 """Tests for azure/app_insights_commands.py module."""
 
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -25,6 +26,7 @@ from agentic_devtools.cli.azure.app_insights_commands import (
     query_fabric_dap_timeline,
     query_fabric_dap_timeline_async,
 )
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
 
 
 class TestGetTempOutputDir:
@@ -101,6 +103,14 @@ class TestBuildCombinedFilter:
         assert "dp-x" in result
         assert " and " in result
 
+    def test_filter_with_window_replaces_relative_timespan(self):
+        """Test an absolute time window replaces the ago() condition."""
+        window = TimeWindow(start=datetime(2024, 1, 1, 0, 0), end=datetime(2024, 1, 1, 1, 0))
+        result = _build_combined_filter("24h", window=window)
+        assert "ago(" not in result
+        assert "timestamp >= datetime(2024-01-01T00:00:00Z)" in result
+        assert "timestamp < datetime(2024-01-01T01:00:00Z)" in result
+
 
 class TestFormatQuery:
     """Tests for _format_query function."""
@@ -79,3 +79,30 @@ def mock_jira_vpn_context(request):
             return_value="https://mock.vpn",
         ):
             yield mock_context
+
+
+@pytest.fixture(autouse=True)
+def reset_repo_snapshot():
+    """
+    Discard the cached git RepoSnapshot around every test.
+
+    The snapshot is cached per working directory, so without this a test
+    could see the repository state mocked by a previous test.
+    """
+    from agentic_devtools.cli.git.snapshot import invalidate_repo_snapshot
+
+    invalidate_repo_snapshot()
+    yield
+    invalidate_repo_snapshot()
+
+
+@pytest.fixture(autouse=True)
+def disable_http_cache(monkeypatch):
+    """
+    Turn off the on-disk Azure DevOps HTTP cache around every test.
+
+    Otherwise require_requests() would wrap the requests module, and a
+    response stored by one test could be served to another. The cache's own
+    tests enable it against a temporary directory.
+    """
+    monkeypatch.setenv("AGDT_HTTP_CACHE", "0")
@@ -22,98 +22,87 @@ def mock_requests():
 
 
 class TestNormalizeRepoPath:
-    """Tests for _normalize_repo_path function."""
+    """Tests for normalize_repo_path function."""
 
     def test_normalize_empty_path_returns_none(self):
         """Test that empty path returns None."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _normalize_repo_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import normalize_repo_path
 
-        assert _normalize_repo_path(None) is None
-        assert _normalize_repo_path("") is None
-        assert _normalize_repo_path("   ") is None
+        assert normalize_repo_path(None) is None
+        assert normalize_repo_path("") is None
+        assert normalize_repo_path("   ") is None
 
     def test_normalize_backslashes_to_forward_slashes(self):
         """Test that backslashes are converted to forward slashes."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _normalize_repo_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import normalize_repo_path
 
-        result = _normalize_repo_path("src\\components\\App.tsx")
+        result = normalize_repo_path("src\\components\\App.tsx")
         assert result == "/src/components/App.tsx"
 
     def test_normalize_strips_leading_trailing_slashes(self):
         """Test that leading and trailing slashes are handled."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _normalize_repo_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import normalize_repo_path
 
-        result = _normalize_repo_path("/src/file.ts/")
+        result = normalize_repo_path("/src/file.ts/")
         assert result == "/src/file.ts"
 
     def test_normalize_adds_leading_slash(self):
         """Test that a leading slash is added."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _normalize_repo_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import normalize_repo_path
 
-        result = _normalize_repo_path("src/file.ts")
+        result = normalize_repo_path("src/file.ts")
         assert result == "/src/file.ts"
 
 
 class TestGetThreadFilePath:
-    """Tests for _get_thread_file_path function."""
+    """Tests for get_thread_file_path function."""
 
     def test_no_thread_context_returns_none(self):
         """Test that no thread context returns None."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _get_thread_file_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import get_thread_file_path
 
-        assert _get_thread_file_path({}) is None
-        assert _get_thread_file_path({"status": "active"}) is None
+        assert get_thread_file_path({}) is None
+        assert get_thread_file_path({"status": "active"}) is None
 
     def test_extracts_file_path_from_context(self):
         """Test extracting file path from thread context."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _get_thread_file_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import get_thread_file_path
 
         thread = {"threadContext": {"filePath": "/src/app.ts"}}
-        assert _get_thread_file_path(thread) == "src/app.ts"
+        assert get_thread_file_path(thread) == "src/app.ts"
 
     def test_extracts_from_left_file_start(self):
         """Test extracting from leftFileStart."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _get_thread_file_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import get_thread_file_path
 
         thread = {"threadContext": {"leftFileStart": {"filePath": "/src/old.ts"}}}
-        assert _get_thread_file_path(thread) == "src/old.ts"
+        assert get_thread_file_path(thread) == "src/old.ts"
 
     def test_extracts_from_right_file_start(self):
         """Test extracting from rightFileStart."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _get_thread_file_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import get_thread_file_path
 
         thread = {"threadContext": {"rightFileStart": {"filePath": "/src/new.ts"}}}
-        assert _get_thread_file_path(thread) == "src/new.ts"
+        assert get_thread_file_path(thread) == "src/new.ts"
 
     def test_no_file_path_in_context_returns_none(self):
         """Test that empty file path in context returns None."""
-        from agentic_devtools.cli.azure_devops.file_review_commands import (
-            _get_thread_file_path,
-        )
+        from agentic_devtools.cli.azure_devops.helpers import get_thread_file_path
 
         thread = {"threadContext": {}}
-        assert _get_thread_file_path(thread) is None
+        assert get_thread_file_path(thread) is None
 
 
 class TestResolveFileThreads:
     """Tests for _resolve_file_threads function."""
 
+    @pytest.fixture(autouse=True)
+    def thread_index_dir(self, tmp_path, mock_requests):
+        """Keep the thread index cache in a temp dir and route the pooled session to mock_requests."""
+        mock_requests.Session.return_value = mock_requests
+        with patch("agentic_devtools.cli.azure_devops.thread_status.get_state_dir", return_value=tmp_path):
+            yield tmp_path
+
     def test_returns_zero_for_empty_path(self, mock_requests):
         """Test that empty target path returns 0."""
         from agentic_devtools.cli.azure_devops.config import AzureDevOpsConfig
@@ -162,6 +151,7 @@ class TestResolveFileThreads:
         )
 
         mock_response = MagicMock()
+        mock_response.headers = {}
         mock_response.json.return_value = {"value": []}
         mock_requests.get.return_value = mock_response
 
@@ -182,6 +172,7 @@ class TestResolveFileThreads:
         )
 
         mock_response = MagicMock()
+        mock_response.headers = {}
         mock_response.json.return_value = {
             "value": [
                 {
@@ -212,6 +203,7 @@ class TestResolveFileThreads:
         )
 
         mock_get_response = MagicMock()
+        mock_get_response.headers = {}
         mock_get_response.json.return_value = {
             "value": [
                 {
@@ -259,6 +251,7 @@ class TestResolveFileThreads:
         )
 
         mock_get_response = MagicMock()
+        mock_get_response.headers = {}
         mock_get_response.json.return_value = {
             "value": [
                 {
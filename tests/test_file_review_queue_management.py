@@ -556,8 +556,8 @@ class TestSyncSubmissionPendingWithTasks:
             return_value=queue_path,
         ):
             with patch(
-                "agdt_ai_helpers.task_state.get_task_by_id",
-                return_value=mock_task,
+                "agdt_ai_helpers.task_state.get_tasks_by_ids",
+                side_effect=lambda ids: {task_id: mock_task for task_id in ids},
             ):
                 sync_submission_pending_with_tasks(pull_request_id=12345)
 
@@ -601,8 +601,8 @@ class TestSyncSubmissionPendingWithTasks:
             return_value=queue_path,
         ):
             with patch(
-                "agdt_ai_helpers.task_state.get_task_by_id",
-                return_value=mock_task,
+                "agdt_ai_helpers.task_state.get_tasks_by_ids",
+                side_effect=lambda ids: {task_id: mock_task for task_id in ids},
             ):
                 sync_submission_pending_with_tasks(pull_request_id=12345)
 
@@ -640,8 +640,8 @@ class TestSyncSubmissionPendingWithTasks:
             return_value=queue_path,
         ):
             with patch(
-                "agdt_ai_helpers.task_state.get_task_by_id",
-                return_value=None,
+                "agdt_ai_helpers.task_state.get_tasks_by_ids",
+                return_value={},
             ):
                 sync_submission_pending_with_tasks(pull_request_id=12345)
 
@@ -682,8 +682,8 @@ class TestSyncSubmissionPendingWithTasks:
             return_value=queue_path,
         ):
             with patch(
-                "agdt_ai_helpers.task_state.get_task_by_id",
-                return_value=mock_task,
+                "agdt_ai_helpers.task_state.get_tasks_by_ids",
+                side_effect=lambda ids: {task_id: mock_task for task_id in ids},
             ):
                 sync_submission_pending_with_tasks(pull_request_id=12345)
 
@@ -899,8 +899,8 @@ class TestPrintNextFilePrompt:
             return_value=queue_path,
         ):
             with patch(
-                "agdt_ai_helpers.task_state.get_task_by_id",
-                return_value=None,
+                "agdt_ai_helpers.task_state.get_tasks_by_ids",
+                return_value={},
             ):
                 print_next_file_prompt(pull_request_id=12345)
 
@@ -5,6 +5,8 @@ Tests verify that async commands spawn background tasks correctly,
 calling Python functions directly via run_function_in_background.
 """
 
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -37,17 +39,17 @@ def mock_background_and_state(tmp_path):
                 }
 
 
-def _get_script_from_call(mock_popen):
-    """Extract the Python script from the Popen call args."""
+def _get_handoff_from_call(mock_popen):
+    """Read the runner handoff file from the Popen call args."""
     call_args = mock_popen.call_args[0][0]  # First positional arg is the command list
-    # Script is the third element: [python, -c, <script>]
-    return call_args[2] if len(call_args) > 2 else ""
+    # The handoff file is the last element: [python, -c, <bootstrap>, <package dir>, <handoff>]
+    return json.loads(Path(call_args[-1]).read_text(encoding="utf-8"))
 
 
-def _assert_function_in_script(script: str, module_path: str, function_name: str):
-    """Assert that the generated script calls the correct module and function."""
-    assert f"module_path = '{module_path}'" in script, f"Expected module_path='{module_path}' in script"
-    assert f"function_name = '{function_name}'" in script, f"Expected function_name='{function_name}' in script"
+def _assert_function_in_handoff(handoff: dict, module_path: str, function_name: str):
+    """Assert that the runner handoff calls the expected module and function."""
+    assert handoff["module_path"] == module_path
+    assert handoff["function_name"] == function_name
 
 
 class TestCommitAsync:
@@ -60,8 +62,8 @@ class TestCommitAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.git.commands", "commit_cmd")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.git.commands", "commit_cmd")
 
     def test_prints_tracking_instructions(self, mock_background_and_state, capsys):
         """Test tracking instructions are printed."""
@@ -143,8 +145,8 @@ class TestAmendAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.git.commands", "amend_cmd")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.git.commands", "amend_cmd")
 
     def test_prints_tracking_instructions(self, mock_background_and_state, capsys):
         """Test tracking instructions are printed."""
@@ -195,8 +197,8 @@ class TestStageAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.git.commands", "stage_cmd")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.git.commands", "stage_cmd")
 
 
 class TestPushAsync:
@@ -209,8 +211,8 @@ class TestPushAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.git.commands", "push_cmd")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.git.commands", "push_cmd")
 
 
 class TestForcePushAsync:
@@ -223,8 +225,8 @@ class TestForcePushAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.git.commands", "force_push_cmd")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.git.commands", "force_push_cmd")
 
 
 class TestPublishAsync:
@@ -237,8 +239,8 @@ class TestPublishAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = _get_script_from_call(mock_background_and_state["mock_popen"])
-        _assert_function_in_script(script, "agentic_devtools.cli.git.commands", "publish_cmd")
+        handoff = _get_handoff_from_call(mock_background_and_state["mock_popen"])
+        _assert_function_in_handoff(handoff, "agentic_devtools.cli.git.commands", "publish_cmd")
 
 
 class TestGitAsyncIntegration:
@@ -28,6 +28,75 @@ def mock_run_safe():
         yield mock_run
 
 
+# A modified file, staged or not (porcelain v2 "1" entries)
+_STAGED = "1 M. N... 100644 100644 100644 abc123 def456 staged.py"
+_UNSTAGED = "1 .M N... 100644 100644 100644 abc123 abc123 unstaged.py"
+
+
+class _GitState:
+    """
+    run_safe side effect answering the git calls a RepoSnapshot is taken with.
+
+    for-each-ref and git status are answered from the given state (git
+    status only runs when a question needs it), and rev-list of the upstream
+    from ``upstream_ab``. Every other call gets the next of the extra
+    results added with ``+``, then a plain success.
+    """
+
+    def __init__(self, refs, status, upstream, upstream_ab, extra=()):
+        self.refs = refs
+        self.status = status
+        self.upstream = upstream
+        self.upstream_ab = upstream_ab
+        self.extra = list(extra)
+
+    def __add__(self, extra):
+        return _GitState(self.refs, self.status, self.upstream, self.upstream_ab, [*self.extra, *extra])
+
+    def __call__(self, cmd, *args, **kwargs):
+        if cmd[1] == "for-each-ref":
+            return self.refs
+        if cmd[1] == "status":
+            return self.status
+        if cmd[1] == "rev-list" and self.upstream_ab is not None and cmd[-1] == f"{self.upstream}...HEAD":
+            ahead, behind = self.upstream_ab
+            return MagicMock(returncode=0, stdout=f"{behind}\t{ahead}\n", stderr="")
+        if self.extra:
+            return self.extra.pop(0)
+        return MagicMock(returncode=0, stdout="", stderr="")
+
+
+def _git_state(branch, origin=None, main=None, local_main=None, upstream_ab=None, changes=(), origin_branch=None):
+    """
+    Build the for-each-ref and git status results a RepoSnapshot is taken from.
+
+    HEAD is at abc123 on ``branch`` (None for a detached HEAD); ``origin``,
+    ``main`` and ``local_main`` are the commits of origin/<branch>,
+    origin/main and main, if they exist. ``origin_branch`` points ``origin``
+    at a branch other than the current one. ``upstream_ab`` sets origin/<branch>
+    as the upstream, with HEAD that many commits (ahead, behind) of it.
+    """
+    upstream = f"origin/{branch}" if upstream_ab is not None else None
+    status = ["# branch.oid abc123", f"# branch.head {branch or '(detached)'}"]
+    if upstream_ab is not None:
+        status += [f"# branch.upstream {upstream}", f"# branch.ab +{upstream_ab[0]} -{upstream_ab[1]}"]
+    status += list(changes)
+
+    refs = [f"abc123\0refs/heads/{branch}\0*\0{upstream or ''}"] if branch else []
+    if origin:
+        refs.append(f"{origin}\0refs/remotes/origin/{origin_branch or branch}\0 \0")
+    if main:
+        refs.append(f"{main}\0refs/remotes/origin/main\0 \0")
+    if local_main:
+        refs.append(f"{local_main}\0refs/heads/main\0 \0")
+    return _GitState(
+        refs=MagicMock(returncode=0, stdout="\n".join(refs) + "\n", stderr=""),
+        status=MagicMock(returncode=0, stdout="\0".join(status) + "\0", stderr=""),
+        upstream=upstream,
+        upstream_ab=upstream_ab,
+    )
+
+
 # =============================================================================
 # Staging Tests
 # =============================================================================
@@ -269,75 +338,43 @@ class TestLocalBranchMatchesOrigin:
 
     def test_returns_true_when_in_sync(self, mock_run_safe):
         """Test returns True when local and origin are in sync."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse origin/branch
-                MagicMock(returncode=0, stdout="0\n", stderr=""),  # 0 commits ahead
-                MagicMock(returncode=0, stdout="0\n", stderr=""),  # 0 commits behind
-            ]
-            result = operations.local_branch_matches_origin()
-            assert result is True
+        mock_run_safe.side_effect = _git_state("feature/test", origin="abc123", upstream_ab=(0, 0))
+        result = operations.local_branch_matches_origin()
+        assert result is True
 
     def test_returns_false_when_ahead(self, mock_run_safe):
         """Test returns False when local is ahead of origin."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=0, stdout="2\n", stderr=""),  # 2 commits ahead
-                MagicMock(returncode=0, stdout="0\n", stderr=""),  # 0 commits behind
-            ]
-            result = operations.local_branch_matches_origin()
-            assert result is False
+        mock_run_safe.side_effect = _git_state("feature/test", origin="def456", upstream_ab=(2, 0))
+        result = operations.local_branch_matches_origin()
+        assert result is False
 
     def test_returns_false_when_behind(self, mock_run_safe):
         """Test returns False when local is behind origin."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=0, stdout="0\n", stderr=""),  # 0 commits ahead
-                MagicMock(returncode=0, stdout="3\n", stderr=""),  # 3 commits behind
-            ]
-            result = operations.local_branch_matches_origin()
-            assert result is False
+        mock_run_safe.side_effect = _git_state("feature/test", origin="def456", upstream_ab=(0, 3))
+        result = operations.local_branch_matches_origin()
+        assert result is False
 
     def test_returns_false_when_origin_branch_not_exists(self, mock_run_safe):
         """Test returns False when origin branch doesn't exist."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.return_value = MagicMock(returncode=1, stdout="", stderr="not found")
-            result = operations.local_branch_matches_origin()
-            assert result is False
+        mock_run_safe.side_effect = _git_state("feature/test")
+        result = operations.local_branch_matches_origin()
+        assert result is False
 
     def test_returns_false_on_invalid_value(self, mock_run_safe):
-        """Test returns False when git returns invalid value."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=0, stdout="invalid\n", stderr=""),  # invalid
-            ]
-            result = operations.local_branch_matches_origin()
-            assert result is False
-
-    def test_returns_false_on_behind_error(self, mock_run_safe):
-        """Test returns False when checking behind commits fails."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=0, stdout="0\n", stderr=""),  # 0 commits ahead
-                MagicMock(returncode=1, stdout="", stderr="error"),  # behind check fails
-            ]
-            result = operations.local_branch_matches_origin()
-            assert result is False
+        """Test returns False when rev-list returns an invalid value."""
+        mock_run_safe.side_effect = _git_state("feature/test", origin="def456") + [
+            MagicMock(returncode=0, stdout="invalid\n", stderr=""),
+        ]
+        result = operations.local_branch_matches_origin()
+        assert result is False
 
-    def test_returns_false_on_behind_invalid_value(self, mock_run_safe):
-        """Test returns False when behind returns invalid value."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=0, stdout="0\n", stderr=""),  # 0 commits ahead
-                MagicMock(returncode=0, stdout="not-a-number\n", stderr=""),  # invalid
-            ]
-            result = operations.local_branch_matches_origin()
-            assert result is False
+    def test_returns_false_on_rev_list_error(self, mock_run_safe):
+        """Test returns False when counting commits fails."""
+        mock_run_safe.side_effect = _git_state("feature/test", origin="def456") + [
+            MagicMock(returncode=1, stdout="", stderr="error"),
+        ]
+        result = operations.local_branch_matches_origin()
+        assert result is False
 
 
 # =============================================================================
@@ -350,70 +387,54 @@ class TestBranchHasCommitsAheadOfMain:
 
     def test_returns_true_when_ahead(self, mock_run_safe):
         """Test returns True when branch is ahead of main."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse origin/main
-                MagicMock(returncode=0, stdout="3\n", stderr=""),  # 3 commits ahead
-            ]
-            result = operations.branch_has_commits_ahead_of_main()
-            assert result is True
+        mock_run_safe.side_effect = _git_state("feature/test", main="def456") + [
+            MagicMock(returncode=0, stdout="0\t3\n", stderr=""),  # 3 commits ahead
+        ]
+        result = operations.branch_has_commits_ahead_of_main()
+        assert result is True
 
     def test_returns_false_when_not_ahead(self, mock_run_safe):
-        """Test returns False when branch is not ahead."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse origin/main
-                MagicMock(returncode=0, stdout="0\n", stderr=""),  # 0 commits ahead
-            ]
-            result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        """Test returns False when HEAD is at origin/main."""
+        mock_run_safe.side_effect = _git_state("feature/test", main="abc123")
+        result = operations.branch_has_commits_ahead_of_main()
+        assert result is False
 
     def test_returns_false_when_on_main(self, mock_run_safe):
         """Test returns False when already on main branch."""
-        with patch.object(operations, "get_current_branch", return_value="main"):
-            result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        mock_run_safe.side_effect = _git_state("main", main="def456")
+        result = operations.branch_has_commits_ahead_of_main()
+        assert result is False
 
     def test_fallback_to_main_without_origin(self, mock_run_safe):
         """Test falls back to main when origin/main doesn't exist."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=1, stdout="", stderr="not found"),  # origin/main fails
-                MagicMock(returncode=0, stdout="", stderr=""),  # main succeeds
-                MagicMock(returncode=0, stdout="2\n", stderr=""),  # 2 commits ahead
-            ]
-            result = operations.branch_has_commits_ahead_of_main()
-            assert result is True
+        mock_run_safe.side_effect = _git_state("feature/test", local_main="def456") + [
+            MagicMock(returncode=0, stdout="0\t2\n", stderr=""),  # 2 commits ahead
+        ]
+        result = operations.branch_has_commits_ahead_of_main()
+        assert result is True
+        assert "main...HEAD" in mock_run_safe.call_args[0][0]
 
     def test_returns_false_when_main_not_found(self, mock_run_safe):
         """Test returns False when neither origin/main nor main exists."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=1, stdout="", stderr="not found"),  # origin/main fails
-                MagicMock(returncode=1, stdout="", stderr="not found"),  # main also fails
-            ]
-            result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        mock_run_safe.side_effect = _git_state("feature/test")
+        result = operations.branch_has_commits_ahead_of_main()
+        assert result is False
 
     def test_returns_false_on_rev_list_error(self, mock_run_safe):
         """Test returns False when rev-list fails."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=1, stdout="", stderr="error"),  # rev-list fails
-            ]
-            result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        mock_run_safe.side_effect = _git_state("feature/test", main="def456") + [
+            MagicMock(returncode=1, stdout="", stderr="error"),
+        ]
+        result = operations.branch_has_commits_ahead_of_main()
+        assert result is False
 
     def test_returns_false_on_invalid_count(self, mock_run_safe):
         """Test returns False when count is not a valid integer."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=0, stdout="invalid\n", stderr=""),  # invalid count
-            ]
-            result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        mock_run_safe.side_effect = _git_state("feature/test", main="def456") + [
+            MagicMock(returncode=0, stdout="invalid\n", stderr=""),
+        ]
+        result = operations.branch_has_commits_ahead_of_main()
+        assert result is False
 
 
 # =============================================================================
@@ -426,36 +447,25 @@ class TestHasLocalChanges:
 
     def test_returns_true_with_staged_changes(self, mock_run_safe):
         """Test returns True when there are staged changes."""
-        mock_run_safe.return_value = MagicMock(returncode=1, stdout="", stderr="")  # diff --cached shows changes
+        mock_run_safe.side_effect = _git_state("feature/test", changes=[_STAGED])
         result = operations.has_local_changes()
         assert result is True
 
     def test_returns_true_with_unstaged_changes(self, mock_run_safe):
         """Test returns True when there are unstaged changes."""
-        mock_run_safe.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),  # diff --cached OK (no staged)
-            MagicMock(returncode=1, stdout="", stderr=""),  # diff shows unstaged changes
-        ]
+        mock_run_safe.side_effect = _git_state("feature/test", changes=[_UNSTAGED])
         result = operations.has_local_changes()
         assert result is True
 
     def test_returns_true_with_untracked_files(self, mock_run_safe):
         """Test returns True when there are untracked files."""
-        mock_run_safe.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),  # diff --cached OK
-            MagicMock(returncode=0, stdout="", stderr=""),  # diff OK
-            MagicMock(returncode=0, stdout="untracked.txt\n", stderr=""),  # has untracked
-        ]
+        mock_run_safe.side_effect = _git_state("feature/test", changes=["? untracked.txt"])
         result = operations.has_local_changes()
         assert result is True
 
     def test_returns_false_with_no_changes(self, mock_run_safe):
         """Test returns False when there are no changes."""
-        mock_run_safe.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),  # diff --cached OK
-            MagicMock(returncode=0, stdout="", stderr=""),  # diff OK
-            MagicMock(returncode=0, stdout="", stderr=""),  # no untracked files
-        ]
+        mock_run_safe.side_effect = _git_state("feature/test")
         result = operations.has_local_changes()
         assert result is False
 
@@ -470,25 +480,31 @@ class TestGetCommitsBehindMain:
 
     def test_returns_count_when_behind(self, mock_run_safe):
         """Test returns correct count when behind main."""
-        mock_run_safe.return_value = MagicMock(returncode=0, stdout="5\n", stderr="")
+        mock_run_safe.side_effect = _git_state("feature/test", main="def456") + [
+            MagicMock(returncode=0, stdout="5\t1\n", stderr=""),
+        ]
         result = operations.get_commits_behind_main()
         assert result == 5
 
     def test_returns_zero_when_up_to_date(self, mock_run_safe):
         """Test returns 0 when up to date with main."""
-        mock_run_safe.return_value = MagicMock(returncode=0, stdout="0\n", stderr="")
+        mock_run_safe.side_effect = _git_state("feature/test", main="abc123")
         result = operations.get_commits_behind_main()
         assert result == 0
 
     def test_returns_zero_on_error(self, mock_run_safe):
         """Test returns 0 when git command fails."""
-        mock_run_safe.return_value = MagicMock(returncode=1, stdout="", stderr="error")
+        mock_run_safe.side_effect = _git_state("feature/test", main="def456") + [
+            MagicMock(returncode=1, stdout="", stderr="error"),
+        ]
         result = operations.get_commits_behind_main()
         assert result == 0
 
     def test_returns_zero_on_invalid_count(self, mock_run_safe):
         """Test returns 0 when count is not a valid integer."""
-        mock_run_safe.return_value = MagicMock(returncode=0, stdout="invalid\n", stderr="")
+        mock_run_safe.side_effect = _git_state("feature/test", main="def456") + [
+            MagicMock(returncode=0, stdout="invalid\n", stderr=""),
+        ]
         result = operations.get_commits_behind_main()
         assert result == 0
 
@@ -676,103 +692,96 @@ class TestCheckoutBranch:
 
     def test_checkout_success(self, mock_run_safe):
         """Test successful checkout."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run_safe.side_effect = _git_state("other-branch")
+        with patch.object(operations, "run_git") as mock_run_git:
+            mock_run_git.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-                    result = operations.checkout_branch("feature/test", dry_run=False)
+            result = operations.checkout_branch("feature/test", dry_run=False)
 
-                    assert result.is_success
-                    mock_run_git.assert_called()
+            assert result.is_success
+            mock_run_git.assert_called()
 
     def test_checkout_already_on_branch(self, mock_run_safe):
         """Test checkout when already on the branch."""
-        with patch.object(core, "get_current_branch", return_value="feature/test"):
-            result = operations.checkout_branch("feature/test", dry_run=False)
+        mock_run_safe.side_effect = _git_state("feature/test")
+        result = operations.checkout_branch("feature/test", dry_run=False)
 
-            assert result.is_success
+        assert result.is_success
 
     def test_checkout_dry_run(self, mock_run_safe, capsys):
         """Test dry run doesn't execute checkout."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            result = operations.checkout_branch("feature/test", dry_run=True)
+        mock_run_safe.side_effect = _git_state("other-branch")
+        result = operations.checkout_branch("feature/test", dry_run=True)
 
-            assert result.is_success
-            captured = capsys.readouterr()
-            assert "[DRY RUN]" in captured.out
-            assert "feature/test" in captured.out
+        assert result.is_success
+        captured = capsys.readouterr()
+        assert "[DRY RUN]" in captured.out
+        assert "feature/test" in captured.out
 
     def test_checkout_uncommitted_changes(self, mock_run_safe):
         """Test checkout fails with uncommitted changes."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            with patch.object(operations, "has_local_changes", return_value=True):
-                result = operations.checkout_branch("feature/test", dry_run=False)
+        mock_run_safe.side_effect = _git_state("other-branch", changes=[_STAGED])
+        result = operations.checkout_branch("feature/test", dry_run=False)
 
-                assert not result.is_success
-                assert result.status == operations.CheckoutResult.UNCOMMITTED_CHANGES
+        assert not result.is_success
+        assert result.status == operations.CheckoutResult.UNCOMMITTED_CHANGES
 
     def test_checkout_branch_not_found(self, mock_run_safe):
         """Test checkout fails when branch doesn't exist."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.return_value = MagicMock(
-                        returncode=1,
-                        stdout="",
-                        stderr="error: pathspec 'feature/nonexistent' did not match any file(s) known to git",
-                    )
+        mock_run_safe.side_effect = _git_state("other-branch")
+        with patch.object(operations, "run_git") as mock_run_git:
+            mock_run_git.return_value = MagicMock(
+                returncode=1,
+                stdout="",
+                stderr="error: pathspec 'feature/nonexistent' did not match any file(s) known to git",
+            )
 
-                    result = operations.checkout_branch("feature/nonexistent", dry_run=False)
+            result = operations.checkout_branch("feature/nonexistent", dry_run=False)
 
-                    assert not result.is_success
-                    assert result.status == operations.CheckoutResult.BRANCH_NOT_FOUND
+            assert not result.is_success
+            assert result.status == operations.CheckoutResult.BRANCH_NOT_FOUND
 
     def test_checkout_generic_error(self, mock_run_safe):
         """Test checkout handles generic errors."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.return_value = MagicMock(
-                        returncode=1,
-                        stdout="",
-                        stderr="fatal: some unexpected error",
-                    )
+        mock_run_safe.side_effect = _git_state("other-branch")
+        with patch.object(operations, "run_git") as mock_run_git:
+            mock_run_git.return_value = MagicMock(
+                returncode=1,
+                stdout="",
+                stderr="fatal: some unexpected error",
+            )
 
-                    result = operations.checkout_branch("feature/test", dry_run=False)
+            result = operations.checkout_branch("feature/test", dry_run=False)
 
-                    assert not result.is_success
-                    assert result.status == operations.CheckoutResult.ERROR
+            assert not result.is_success
+            assert result.status == operations.CheckoutResult.ERROR
 
     def test_checkout_from_detached_head(self, mock_run_safe):
-        """Test checkout when starting from detached HEAD (get_current_branch raises SystemExit)."""
-        with patch.object(core, "get_current_branch", side_effect=SystemExit(1)):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        """Test checkout when starting from detached HEAD (no current branch)."""
+        mock_run_safe.side_effect = _git_state(None)
+        with patch.object(operations, "run_git") as mock_run_git:
+            mock_run_git.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-                    result = operations.checkout_branch("feature/test", dry_run=False)
+            result = operations.checkout_branch("feature/test", dry_run=False)
 
-                    # Should still succeed since we catch SystemExit and proceed
-                    assert result.is_success
-                    mock_run_git.assert_called()
+            assert result.is_success
+            mock_run_git.assert_called()
 
     def test_checkout_from_origin_when_local_does_not_exist(self, mock_run_safe):
         """Test checkout creates local branch from origin when local doesn't exist."""
-        with patch.object(core, "get_current_branch", return_value="main"):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    # First call (checkout branch_name) fails, second (checkout -b from origin) succeeds
-                    mock_run_git.side_effect = [
-                        MagicMock(returncode=1, stdout="", stderr="did not match"),  # local fails
-                        MagicMock(returncode=0, stdout="", stderr=""),  # from origin succeeds
-                    ]
+        mock_run_safe.side_effect = _git_state("main")
+        with patch.object(operations, "run_git") as mock_run_git:
+            # First call (checkout branch_name) fails, second (checkout -b from origin) succeeds
+            mock_run_git.side_effect = [
+                MagicMock(returncode=1, stdout="", stderr="did not match"),  # local fails
+                MagicMock(returncode=0, stdout="", stderr=""),  # from origin succeeds
+            ]
 
-                    result = operations.checkout_branch("feature/new-branch", dry_run=False)
+            result = operations.checkout_branch("feature/new-branch", dry_run=False)
 
-                    assert result.is_success
-                    # Should have tried twice
-                    assert mock_run_git.call_count == 2
+            assert result.is_success
+            # Should have tried twice
+            assert mock_run_git.call_count == 2
 
 
 # =============================================================================
@@ -893,68 +902,38 @@ class TestCheckBranchSafeToRecreate:
 
     def test_returns_safe_when_branch_does_not_exist_but_on_origin(self, mock_run_safe):
         """Test returns SAFE when branch doesn't exist locally but exists on origin."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            mock_run_git.side_effect = [
-                MagicMock(returncode=1, stdout="", stderr=""),  # branch doesn't exist locally
-                MagicMock(returncode=0, stdout="abc123", stderr=""),  # origin/branch exists
-            ]
-            result = operations.check_branch_safe_to_recreate("feature/test")
-            assert result.status == operations.BranchSafetyCheckResult.SAFE
-            assert result.is_safe
+        mock_run_safe.side_effect = _git_state("main", origin="abc123", origin_branch="feature/test")
+        result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.SAFE
+        assert result.is_safe
 
     def test_returns_branch_not_on_origin_when_neither_exists(self, mock_run_safe):
         """Test returns BRANCH_NOT_ON_ORIGIN when branch doesn't exist anywhere."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            mock_run_git.side_effect = [
-                MagicMock(returncode=1, stdout="", stderr=""),  # branch doesn't exist locally
-                MagicMock(returncode=1, stdout="", stderr=""),  # origin/branch doesn't exist
-            ]
-            result = operations.check_branch_safe_to_recreate("feature/test")
-            assert result.status == operations.BranchSafetyCheckResult.BRANCH_NOT_ON_ORIGIN
-            assert not result.is_safe
+        mock_run_safe.side_effect = _git_state("main")
+        result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.BRANCH_NOT_ON_ORIGIN
+        assert not result.is_safe
 
     def test_returns_uncommitted_changes_when_on_target_branch_dirty(self, mock_run_safe):
         """Test returns UNCOMMITTED_CHANGES when on the target branch with local changes."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            with patch.object(operations, "get_current_branch", return_value="feature/test"):
-                with patch.object(operations, "has_local_changes", return_value=True):
-                    mock_run_git.side_effect = [
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),  # branch exists locally
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),  # origin/branch exists
-                    ]
-                    result = operations.check_branch_safe_to_recreate("feature/test")
-                    assert result.status == operations.BranchSafetyCheckResult.UNCOMMITTED_CHANGES
-                    assert result.has_local_work_at_risk
+        mock_run_safe.side_effect = _git_state("feature/test", origin="abc123", changes=[_UNSTAGED])
+        result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.UNCOMMITTED_CHANGES
+        assert result.has_local_work_at_risk
 
     def test_returns_safe_when_on_target_branch_clean_matching_origin(self, mock_run_safe):
         """Test returns SAFE when on target branch, clean, and matching origin."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            with patch.object(operations, "get_current_branch", return_value="feature/test"):
-                with patch.object(operations, "has_local_changes", return_value=False):
-                    mock_run_git.side_effect = [
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),  # branch exists locally
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),  # origin/branch exists
-                        MagicMock(returncode=0, stdout="abc123\n", stderr=""),  # HEAD commit
-                        MagicMock(returncode=0, stdout="abc123\n", stderr=""),  # origin/branch commit
-                    ]
-                    result = operations.check_branch_safe_to_recreate("feature/test")
-                    assert result.status == operations.BranchSafetyCheckResult.SAFE
-                    assert result.is_safe
+        mock_run_safe.side_effect = _git_state("feature/test", origin="abc123")
+        result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.SAFE
+        assert result.is_safe
 
     def test_returns_diverged_when_on_target_branch_clean_different_from_origin(self, mock_run_safe):
         """Test returns DIVERGED_FROM_ORIGIN when on target branch but different from origin."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            with patch.object(operations, "get_current_branch", return_value="feature/test"):
-                with patch.object(operations, "has_local_changes", return_value=False):
-                    mock_run_git.side_effect = [
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),  # branch exists locally
-                        MagicMock(returncode=0, stdout="def456", stderr=""),  # origin/branch exists
-                        MagicMock(returncode=0, stdout="abc123\n", stderr=""),  # HEAD commit
-                        MagicMock(returncode=0, stdout="def456\n", stderr=""),  # origin/branch commit (different)
-                    ]
-                    result = operations.check_branch_safe_to_recreate("feature/test")
-                    assert result.status == operations.BranchSafetyCheckResult.DIVERGED_FROM_ORIGIN
-                    assert result.has_local_work_at_risk
+        mock_run_safe.side_effect = _git_state("feature/test", origin="def456")
+        result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.DIVERGED_FROM_ORIGIN
+        assert result.has_local_work_at_risk
 
 
 class TestFetchBranch:
@@ -106,6 +106,25 @@ def test_run_tests_and_wait_returns_exit_code(monkeypatch: pytest.MonkeyPatch) -
     assert commands._run_tests_and_wait(timeout_seconds=1) == 0
 
 
+def test_run_tests_and_wait_runs_sharded_suite(monkeypatch: pytest.MonkeyPatch) -> None:
+    task = SimpleNamespace(id="task-shards")
+    background = Mock(return_value=task)
+    monkeypatch.setattr(commands, "run_function_in_background", background)
+    monkeypatch.setattr(
+        commands,
+        "get_task_by_id",
+        Mock(return_value=SimpleNamespace(status=TaskStatus.COMPLETED, exit_code=0)),
+    )
+
+    commands._run_tests_and_wait(timeout_seconds=1)
+
+    background.assert_called_once_with(
+        "agentic_devtools.cli.testing",
+        "_run_tests_sharded_sync",
+        command_display_name="agdt-test-sharded",
+    )
+
+
 def test_run_tests_and_wait_defaults_exit_code(monkeypatch: pytest.MonkeyPatch) -> None:
     task = SimpleNamespace(id="task-999")
     monkeypatch.setattr(commands, "run_function_in_background", Mock(return_value=task))
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for _task_runner tests.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def runner_state_dir(tmp_path):
+    """Point both state and task state at a temporary directory."""
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    with patch("agentic_devtools.state.get_state_dir", return_value=state_dir), patch(
+        "agentic_devtools.task_state.get_state_dir", return_value=state_dir
+    ):
+        yield state_dir
+
+
+@pytest.fixture
+def task_module(tmp_path, monkeypatch):
+    """Create an importable module from source and return its name."""
+    modules_dir = tmp_path / "modules"
+    modules_dir.mkdir()
+    monkeypatch.syspath_prepend(str(modules_dir))
+    counter = iter(range(1000))
+
+    def _create(source: str) -> str:
+        name = f"runner_target_{next(counter)}_{abs(hash(str(tmp_path)))}"
+        (modules_dir / f"{name}.py").write_text(source, encoding="utf-8")
+        return name
+
+    return _create
@@ -0,0 +1,105 @@
+"""Tests for agentic_devtools._task_runner.LogWriter."""
+
+import time
+from unittest.mock import MagicMock
+
+from agentic_devtools._task_runner import LogWriter
+
+
+class TestLogWriter:
+    """Tests for LogWriter class."""
+
+    def test_write_returns_length(self):
+        """Test that write returns the number of characters written."""
+        log = MagicMock()
+
+        assert LogWriter(log).write("hello") == 5
+        log.write.assert_called_once_with("hello")
+
+    def test_does_not_flush_within_interval(self):
+        """Test that completed lines are not flushed before the interval has passed."""
+        log = MagicMock()
+        writer = LogWriter(log, flush_interval=60)
+
+        writer.write("line\n")
+        writer.flush()
+
+        log.flush.assert_not_called()
+
+    def test_flushes_at_line_boundary_when_due(self):
+        """Test that a completed line is flushed once the interval has passed."""
+        log = MagicMock()
+        writer = LogWriter(log, flush_interval=0)
+
+        writer.write("partial")
+        log.flush.assert_not_called()
+        writer.write(" line\n")
+
+        log.flush.assert_called_once()
+
+    def test_flush_when_due(self):
+        """Test that an explicit flush flushes once the interval has passed."""
+        log = MagicMock()
+        writer = LogWriter(log, flush_interval=0)
+
+        writer.write("partial")
+        writer.flush()
+
+        log.flush.assert_called_once()
+
+    def test_flush_skipped_when_nothing_written(self):
+        """Test that flushing without pending output doesn't touch the log."""
+        log = MagicMock()
+
+        LogWriter(log, flush_interval=0).flush()
+
+        log.flush.assert_not_called()
+
+    def test_timer_flushes_pending_output(self):
+        """Test that the timer thread flushes output left in the buffer."""
+        log = MagicMock()
+        writer = LogWriter(log, flush_interval=0.01)
+        writer.start()
+        try:
+            writer.write("no newline")
+            deadline = time.monotonic() + 5
+            while not log.flush.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            writer.close()
+
+        assert log.flush.called
+
+    def test_close_flushes_and_stops_timer(self):
+        """Test that close flushes pending output and stops the timer."""
+        log = MagicMock()
+        writer = LogWriter(log, flush_interval=60)
+        writer.start()
+        writer.write("line\n")
+
+        writer.close()
+
+        log.flush.assert_called_once()
+        assert writer._timer is None
+
+    def test_close_without_start(self):
+        """Test that close works when the timer was never started."""
+        log = MagicMock()
+        writer = LogWriter(log)
+        writer.write("x")
+
+        writer.close()
+
+        log.flush.assert_called_once()
+
+    def test_writelines(self):
+        """Test that writelines writes every string."""
+        log = MagicMock()
+
+        LogWriter(log, flush_interval=60).writelines(["a\n", "b\n"])
+
+        assert [call.args[0] for call in log.write.call_args_list] == ["a\n", "b\n"]
+
+    def test_isatty(self):
+        """Test that the writer never reports a terminal."""
+        assert LogWriter(MagicMock()).isatty() is False
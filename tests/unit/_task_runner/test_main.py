@@ -0,0 +1,37 @@
+"""Tests for agentic_devtools._task_runner.main."""
+
+from unittest.mock import patch
+
+from agentic_devtools._task_runner import TaskHandoff, main
+
+
+class TestMain:
+    """Tests for main function."""
+
+    def test_runs_handoff(self, tmp_path):
+        """Test that the handoff file is read, deleted and run."""
+        path = tmp_path / "abc.json"
+        TaskHandoff(task_id="abc", log_file="task.log", command="echo hi").write(path)
+
+        with patch("agentic_devtools._task_runner.run_task", return_value=3) as mock_run:
+            assert main([str(path)]) == 3
+
+        assert mock_run.call_args[0][0].task_id == "abc"
+        assert not path.exists()
+
+    def test_reads_sys_argv(self, tmp_path):
+        """Test that the handoff path defaults to the command line argument."""
+        path = tmp_path / "abc.json"
+        TaskHandoff(task_id="abc", log_file="task.log").write(path)
+
+        with patch("sys.argv", ["runner", str(path)]), patch(
+            "agentic_devtools._task_runner.run_task", return_value=0
+        ) as mock_run:
+            assert main() == 0
+
+        mock_run.assert_called_once()
+
+    def test_usage_error(self, capsys):
+        """Test that a missing handoff argument is a usage error."""
+        assert main([]) == 2
+        assert "Usage:" in capsys.readouterr().err
@@ -0,0 +1,39 @@
+"""Tests for agentic_devtools._task_runner.run_command."""
+
+import sys
+from unittest.mock import patch
+
+from agentic_devtools._task_runner import run_command
+
+
+class TestRunCommand:
+    """Tests for run_command function."""
+
+    def test_writes_output_to_log(self, tmp_path):
+        """Test that command output goes to the log and the exit code is returned."""
+        log_path = tmp_path / "task.log"
+        command = f'"{sys.executable}" -c "print(\'hello\')"'
+
+        with open(log_path, "w", encoding="utf-8") as log:
+            result = run_command(command, log)
+
+        assert result == (0, None)
+        assert "hello" in log_path.read_text(encoding="utf-8")
+
+    def test_returns_failing_exit_code(self, tmp_path):
+        """Test that a failing command's exit code is returned."""
+        command = f'"{sys.executable}" -c "import sys; sys.exit(3)"'
+
+        with open(tmp_path / "task.log", "w", encoding="utf-8") as log:
+            assert run_command(command, log) == (3, None)
+
+    def test_exception_is_logged(self, tmp_path):
+        """Test that a failure to start the command is logged as exit code 1."""
+        log_path = tmp_path / "task.log"
+
+        with patch("agentic_devtools._task_runner.subprocess.run", side_effect=OSError("no shell")):
+            with open(log_path, "w", encoding="utf-8") as log:
+                result = run_command("anything", log)
+
+        assert result == (1, "no shell")
+        assert "!!! Exception: no shell" in log_path.read_text(encoding="utf-8")
@@ -0,0 +1,67 @@
+"""Tests for agentic_devtools._task_runner.run_function."""
+
+import pytest
+
+from agentic_devtools._task_runner import run_function
+
+
+def _run(task_module, tmp_path, source: str):
+    """Run the module's main function and return (result, log text)."""
+    module_name = task_module(source)
+    log_path = tmp_path / "task.log"
+    with open(log_path, "w", encoding="utf-8") as log:
+        result = run_function(module_name, "main", log)
+    return result, log_path.read_text(encoding="utf-8")
+
+
+class TestRunFunction:
+    """Tests for run_function function."""
+
+    def test_output_goes_to_log(self, task_module, tmp_path):
+        """Test that stdout and stderr of the function are written to the log."""
+        result, log_text = _run(
+            task_module,
+            tmp_path,
+            "import sys\ndef main():\n    print('out')\n    print('err', file=sys.stderr)\n",
+        )
+
+        assert result == (0, None)
+        assert "out\n" in log_text
+        assert "err\n" in log_text
+
+    def test_int_return_is_exit_code(self, task_module, tmp_path):
+        """Test that an int return value is used as the exit code."""
+        result, _ = _run(task_module, tmp_path, "def main():\n    return 4\n")
+
+        assert result == (4, None)
+
+    @pytest.mark.parametrize(
+        "exit_arg, expected",
+        [("2", 2), ("'failed'", 1), ("None", 0)],
+    )
+    def test_sys_exit(self, task_module, tmp_path, exit_arg, expected):
+        """Test that sys.exit() calls are turned into exit codes."""
+        result, _ = _run(task_module, tmp_path, f"import sys\ndef main():\n    sys.exit({exit_arg})\n")
+
+        assert result == (expected, None)
+
+    def test_exception_is_logged(self, task_module, tmp_path):
+        """Test that an exception is logged with its traceback after the function's output."""
+        result, log_text = _run(
+            task_module,
+            tmp_path,
+            "def main():\n    print('before')\n    raise ValueError('boom')\n",
+        )
+
+        assert result == (1, "boom")
+        assert log_text.index("before") < log_text.index("!!! Exception: boom")
+        assert "Traceback" in log_text
+
+    def test_missing_function(self, task_module, tmp_path):
+        """Test that a missing function fails the task."""
+        module_name = task_module("")
+        with open(tmp_path / "task.log", "w", encoding="utf-8") as log:
+            exit_code, error_message = run_function(module_name, "main", log)
+
+        assert exit_code == 1
+        assert "main" in error_message
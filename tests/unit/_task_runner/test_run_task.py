@@ -0,0 +1,85 @@
+"""Tests for agentic_devtools._task_runner.run_task."""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from agentic_devtools._task_runner import TaskHandoff, run_task
+from agentic_devtools.task_logs import open_log_text, resolve_log_path
+from agentic_devtools.task_state import BackgroundTask, TaskStatus, add_task, get_logs_dir, get_task_by_id
+
+
+def _create_task(command: str) -> BackgroundTask:
+    """Add a pending task and return it."""
+    task = BackgroundTask.create(command=command, log_file=get_logs_dir() / f"{command}.log")
+    add_task(task)
+    return task
+
+
+def _read_log(task: BackgroundTask) -> str:
+    """Read a task's (possibly compressed) log."""
+    with open_log_text(resolve_log_path(Path(task.log_file))) as f:
+        return f.read()
+
+
+class TestRunTask:
+    """Tests for run_task function."""
+
+    def test_function_task_completes(self, runner_state_dir, task_module, tmp_path, monkeypatch):
+        """Test that a function task runs in its working directory and is marked completed."""
+        monkeypatch.chdir(tmp_path)
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        module_name = task_module("import os\ndef main():\n    print('cwd=' + os.getcwd())\n")
+        task = _create_task("fn")
+
+        exit_code = run_task(
+            TaskHandoff(
+                task_id=task.id,
+                log_file=str(task.log_file),
+                cwd=str(work_dir),
+                module_path=module_name,
+                function_name="main",
+            )
+        )
+
+        assert exit_code == 0
+        assert get_task_by_id(task.id).status == TaskStatus.COMPLETED
+        log_text = _read_log(task)
+        assert log_text.startswith(f"=== Task {task.id} ===\nFunction: {module_name}.main\n")
+        assert f"cwd={os.getcwd()}" in log_text
+        assert os.getcwd() == str(work_dir)
+        assert "Exit Code: 0" in log_text
+
+    def test_command_task_fails(self, runner_state_dir):
+        """Test that a failing command task is marked failed."""
+        task = _create_task("cmd")
+        command = f'"{sys.executable}" -c "import sys; sys.exit(5)"'
+
+        exit_code = run_task(TaskHandoff(task_id=task.id, log_file=str(task.log_file), command=command))
+
+        assert exit_code == 5
+        stored = get_task_by_id(task.id)
+        assert stored.status == TaskStatus.FAILED
+        assert stored.exit_code == 5
+        assert f"Command: {command}" in _read_log(task)
+
+    def test_unknown_task(self, runner_state_dir, tmp_path):
+        """Test that a task missing from state still runs."""
+        log_file = tmp_path / "logs" / "orphan.log"
+        command = f'"{sys.executable}" -c "pass"'
+
+        assert run_task(TaskHandoff(task_id="missing", log_file=str(log_file), command=command)) == 0
+        assert resolve_log_path(log_file) is not None
+
+    def test_finalize_failure_is_noted_in_log(self, runner_state_dir):
+        """Test that log housekeeping errors don't change the exit code and are noted in the log."""
+        task = _create_task("cmd")
+        command = f'"{sys.executable}" -c "pass"'
+
+        with patch("agentic_devtools.task_logs.finalize_task_log", side_effect=RuntimeError("boom")):
+            exit_code = run_task(TaskHandoff(task_id=task.id, log_file=str(task.log_file), command=command))
+
+        assert exit_code == 0
+        assert "Could not finalize log: boom" in Path(task.log_file).read_text()
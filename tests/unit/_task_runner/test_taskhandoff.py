@@ -0,0 +1,60 @@
+"""Tests for agentic_devtools._task_runner.TaskHandoff."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from agentic_devtools._task_runner import TaskHandoff
+
+
+class TestTaskHandoff:
+    """Tests for TaskHandoff dataclass."""
+
+    def test_round_trips_through_dict(self):
+        """Test that to_dict and from_dict are inverse operations."""
+        handoff = TaskHandoff(
+            task_id="abc",
+            log_file="/logs/task.log",
+            cwd="/repo",
+            module_path="pkg.mod",
+            function_name="run",
+        )
+
+        assert TaskHandoff.from_dict(handoff.to_dict()) == handoff
+
+    def test_from_dict_defaults(self):
+        """Test that optional fields default to None."""
+        handoff = TaskHandoff.from_dict({"task_id": "abc", "log_file": "task.log"})
+
+        assert handoff.cwd is None
+        assert handoff.command is None
+        assert handoff.module_path is None
+        assert handoff.function_name is None
+
+    def test_write_creates_json_file(self, tmp_path):
+        """Test that write creates parent directories and writes JSON."""
+        path = tmp_path / "handoffs" / "abc.json"
+
+        TaskHandoff(task_id="abc", log_file="task.log", command="echo hi").write(path)
+
+        assert json.loads(path.read_text(encoding="utf-8"))["command"] == "echo hi"
+
+    def test_read_deletes_file(self, tmp_path):
+        """Test that read returns the handoff and removes the file."""
+        path = tmp_path / "abc.json"
+        TaskHandoff(task_id="abc", log_file="task.log", command="echo hi").write(path)
+
+        handoff = TaskHandoff.read(path)
+
+        assert handoff.command == "echo hi"
+        assert not path.exists()
+
+    def test_read_ignores_delete_failure(self, tmp_path):
+        """Test that a handoff file that can't be deleted is still read."""
+        path = tmp_path / "abc.json"
+        TaskHandoff(task_id="abc", log_file="task.log").write(path)
+
+        with patch.object(Path, "unlink", side_effect=OSError("locked")):
+            handoff = TaskHandoff.read(path)
+
+        assert handoff.task_id == "abc"
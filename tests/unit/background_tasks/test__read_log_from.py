@@ -0,0 +1,60 @@
+"""Tests for agentic_devtools.background_tasks._read_log_from."""
+
+import gzip
+from unittest.mock import patch
+
+from agentic_devtools import background_tasks
+from agentic_devtools.background_tasks import _read_log_from
+
+
+class TestReadLogFrom:
+    """Tests for _read_log_from function."""
+
+    def test_reads_plain_log_from_offset(self, tmp_path):
+        """Test that the bytes after the offset are returned."""
+        log_path = tmp_path / "task.log"
+        log_path.write_bytes(b"hello world")
+
+        assert _read_log_from(log_path, 6) == b"world"
+
+    def test_reads_compressed_log_from_offset(self, tmp_path):
+        """Test that a compressed log is read from the same offset of its plain text."""
+        log_path = tmp_path / "task.log"
+        (tmp_path / "task.log.gz").write_bytes(gzip.compress(b"hello world"))
+
+        assert _read_log_from(log_path, 6) == b"world"
+
+    def test_falls_back_when_compressed_mid_read(self, tmp_path):
+        """Test that a plain log removed after resolving is read from its compressed form."""
+        log_path = tmp_path / "task.log"
+        log_path.write_bytes(b"hello world")
+        real_open = background_tasks.open_log_binary
+
+        def compress_then_open(path):
+            if path == log_path:
+                (tmp_path / "task.log.gz").write_bytes(gzip.compress(b"hello world"))
+                log_path.unlink()
+            return real_open(path)
+
+        with patch.object(background_tasks, "open_log_binary", side_effect=compress_then_open):
+            assert _read_log_from(log_path, 6) == b"world"
+
+    def test_missing_log(self, tmp_path):
+        """Test that a missing log reads as empty."""
+        assert _read_log_from(tmp_path / "task.log", 0) == b""
+
+    def test_unreadable_log(self, tmp_path):
+        """Test that a log that can't be opened reads as empty."""
+        log_path = tmp_path / "task.log"
+        log_path.write_bytes(b"x")
+
+        with patch.object(background_tasks, "open_log_binary", side_effect=PermissionError):
+            assert _read_log_from(log_path, 0) == b""
+
+    def test_log_that_keeps_disappearing(self, tmp_path):
+        """Test that a log that vanishes on every attempt reads as empty."""
+        log_path = tmp_path / "task.log"
+        log_path.write_bytes(b"x")
+
+        with patch.object(background_tasks, "open_log_binary", side_effect=FileNotFoundError):
+            assert _read_log_from(log_path, 0) == b""
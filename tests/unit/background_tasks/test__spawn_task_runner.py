@@ -0,0 +1,69 @@
+"""Tests for agentic_devtools.background_tasks._spawn_task_runner."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_devtools._task_runner import TaskHandoff
+from agentic_devtools.background_tasks import TASK_RUNNER_BOOTSTRAP, _spawn_task_runner
+
+
+@pytest.fixture
+def mock_state_dir(tmp_path):
+    """Fixture to mock the state directory."""
+    with patch("agentic_devtools.state.get_state_dir", return_value=tmp_path), patch(
+        "agentic_devtools.task_state.get_state_dir", return_value=tmp_path
+    ):
+        yield tmp_path
+
+
+class TestSpawnTaskRunner:
+    """Tests for _spawn_task_runner function."""
+
+    def test_runs_runner_module_with_handoff(self, mock_state_dir):
+        """Test that the runner module is started with the written handoff file."""
+        handoff = TaskHandoff(task_id="abc", log_file="task.log", command="echo hi")
+
+        with patch("subprocess.Popen", return_value=MagicMock(pid=1)) as mock_popen:
+            _spawn_task_runner(handoff, cwd="/repo")
+
+        argv = mock_popen.call_args[0][0]
+        assert argv[1:4] == ["-c", TASK_RUNNER_BOOTSTRAP, str(Path(__file__).resolve().parents[3])]
+        assert json.loads(Path(argv[4]).read_text(encoding="utf-8")) == handoff.to_dict()
+        assert mock_popen.call_args[1]["cwd"] == "/repo"
+
+    def test_pythonpath_left_unchanged(self, mock_state_dir):
+        """Test that PYTHONPATH is passed through as is, so task commands don't see the package directory."""
+        handoff = TaskHandoff(task_id="abc", log_file="task.log", command="echo hi")
+
+        with patch.dict(os.environ, {"PYTHONPATH": "existing"}), patch(
+            "subprocess.Popen", return_value=MagicMock(pid=1)
+        ) as mock_popen:
+            _spawn_task_runner(handoff)
+
+        env = mock_popen.call_args[1]["env"]
+        assert env["PYTHONPATH"] == "existing"
+        assert env["PYTHONIOENCODING"] == "utf-8"
+
+    def test_runner_ignores_package_shadowed_by_cwd(self, mock_state_dir, tmp_path):
+        """Test that a copy of the package in the task's cwd isn't imported instead of this one."""
+        shadow = tmp_path / "checkout" / "agentic_devtools"
+        shadow.mkdir(parents=True)
+        (shadow / "__init__.py").write_text("print('SHADOWED')\n")
+        handoff = TaskHandoff(task_id="abc", log_file="task.log", command="echo hi")
+
+        with patch("subprocess.Popen", return_value=MagicMock(pid=1)) as mock_popen:
+            _spawn_task_runner(handoff, cwd=str(shadow.parent))
+
+        # Without the handoff file the real runner only prints its usage
+        argv = mock_popen.call_args[0][0][:-1]
+        env = {**os.environ, "PYTHONPATH": ""}
+        result = subprocess.run(argv, cwd=str(shadow.parent), env=env, capture_output=True, text=True, timeout=60)
+
+        assert "SHADOWED" not in result.stdout
+        assert result.returncode == 2
+        assert "Usage" in result.stderr
@@ -0,0 +1,55 @@
+"""Tests for agentic_devtools.background_tasks.follow_log."""
+
+from unittest.mock import patch
+
+from agentic_devtools import background_tasks
+from agentic_devtools.background_tasks import follow_log
+
+
+class TestFollowLog:
+    """Tests for follow_log function."""
+
+    def test_yields_appended_text_until_finished(self, tmp_path):
+        """Test that text appended after the offset is yielded, including the final write."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("old\n")
+        appends = iter(["", "new 1\n", "new 2\n"])
+        checks = iter([False, False, True])
+
+        def is_finished():
+            with open(log_path, "a") as f:
+                f.write(next(appends))
+            return next(checks)
+
+        with patch.object(background_tasks.time, "sleep") as mock_sleep:
+            chunks = list(follow_log(log_path, len("old\n"), is_finished, poll_interval=0.25))
+
+        assert chunks == ["new 1\n", "new 2\n"]
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_multibyte_character_split_across_reads(self, tmp_path):
+        """Test that a UTF-8 character written in two parts is decoded once complete."""
+        log_path = tmp_path / "task.log"
+        log_path.write_bytes(b"")
+        encoded = "🎉\n".encode()
+        appends = iter([encoded[:2], encoded[2:]])
+        checks = iter([False, True])
+
+        def is_finished():
+            with open(log_path, "ab") as f:
+                f.write(next(appends))
+            return next(checks)
+
+        with patch.object(background_tasks.time, "sleep"):
+            assert "".join(follow_log(log_path, 0, is_finished)) == "🎉\n"
+
+    def test_incomplete_character_at_end(self, tmp_path):
+        """Test that a truncated UTF-8 sequence is flushed as a replacement character."""
+        log_path = tmp_path / "task.log"
+        log_path.write_bytes("🎉".encode()[:2])
+
+        assert list(follow_log(log_path, 0, lambda: True)) == ["�"]
+
+    def test_missing_file(self, tmp_path):
+        """Test that a log that was removed ends quietly once the task finishes."""
+        assert list(follow_log(tmp_path / "missing.log", 0, lambda: True)) == []
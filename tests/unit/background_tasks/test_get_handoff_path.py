@@ -0,0 +1,26 @@
+"""Tests for agentic_devtools.background_tasks.get_handoff_path."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.background_tasks import HANDOFF_DIR_NAME, get_handoff_path
+
+
+@pytest.fixture
+def mock_state_dir(tmp_path):
+    """Fixture to mock the state directory."""
+    with patch("agentic_devtools.state.get_state_dir", return_value=tmp_path), patch(
+        "agentic_devtools.task_state.get_state_dir", return_value=tmp_path
+    ):
+        yield tmp_path
+
+
+class TestGetHandoffPath:
+    """Tests for get_handoff_path function."""
+
+    def test_path_under_background_tasks_dir(self, mock_state_dir):
+        """Test that handoff files live in the handoffs directory, named by task ID."""
+        path = get_handoff_path("abc-123")
+
+        assert path == mock_state_dir / "background-tasks" / HANDOFF_DIR_NAME / "abc-123.json"
@@ -71,3 +71,72 @@ class TestGetTaskLogContent:
         assert content is not None
         assert "Unicode" in content
         assert "äöü" in content
+
+    def test_tail_lines(self, mock_state_dir):
+        """Test that tail_lines returns only the last lines of the log."""
+        log_path = mock_state_dir / "logs" / "tail-task.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text("Line 1\nLine 2\nLine 3\n")
+        task = BackgroundTask.create(command="cmd", log_file=log_path)
+        add_task(task)
+
+        assert get_task_log_content(task.id, tail_lines=2) == "Line 2\nLine 3"
+
+    def test_head_lines(self, mock_state_dir):
+        """Test that head_lines returns only the first lines of the log."""
+        log_path = mock_state_dir / "logs" / "head-task.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text("Line 1\nLine 2\nLine 3\n")
+        task = BackgroundTask.create(command="cmd", log_file=log_path)
+        add_task(task)
+
+        assert get_task_log_content(task.id, head_lines=1) == "Line 1"
+
+    def test_reads_compressed_log(self, mock_state_dir):
+        """Test that a log compressed after the task finished is read transparently."""
+        import gzip
+
+        log_path = mock_state_dir / "logs" / "done-task.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.with_name("done-task.log.gz").write_bytes(gzip.compress(b"Line 1\nLine 2\nLine 3\n"))
+        task = BackgroundTask.create(command="cmd", log_file=log_path)
+        add_task(task)
+
+        assert get_task_log_content(task.id) == "Line 1\nLine 2\nLine 3\n"
+        assert get_task_log_content(task.id, tail_lines=1) == "Line 3"
+        assert get_task_log_content(task.id, head_lines=1) == "Line 1"
+
+    def test_falls_back_to_log_compressed_mid_read(self, mock_state_dir):
+        """Test that a log compressed between resolving and reading is read from its compressed form."""
+        import gzip
+
+        from agentic_devtools import background_tasks
+
+        log_path = mock_state_dir / "logs" / "racing-task.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text("Line 1\n")
+        task = BackgroundTask.create(command="cmd", log_file=log_path)
+        add_task(task)
+        real_open = background_tasks.open_log_text
+
+        def compress_then_open(path):
+            if path == log_path:
+                log_path.with_name("racing-task.log.gz").write_bytes(gzip.compress(b"Line 1\n"))
+                log_path.unlink()
+            return real_open(path)
+
+        with patch.object(background_tasks, "open_log_text", side_effect=compress_then_open):
+            assert get_task_log_content(task.id) == "Line 1\n"
+
+    def test_returns_none_when_log_keeps_disappearing(self, mock_state_dir):
+        """Test that a log that vanishes on every attempt is reported as missing."""
+        from agentic_devtools import background_tasks
+
+        log_path = mock_state_dir / "logs" / "gone-task.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text("Line 1\n")
+        task = BackgroundTask.create(command="cmd", log_file=log_path)
+        add_task(task)
+
+        with patch.object(background_tasks, "open_log_text", side_effect=FileNotFoundError):
+            assert get_task_log_content(task.id) is None
@@ -0,0 +1,19 @@
+"""Tests for agentic_devtools.background_tasks.read_log_head."""
+
+from agentic_devtools.background_tasks import read_log_head
+
+
+class TestReadLogHead:
+    """Tests for read_log_head function."""
+
+    def test_returns_first_lines(self, tmp_path):
+        """Test that only the first N lines are returned."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("one\r\ntwo\nthree\n")
+        assert read_log_head(log_path, 2) == "one\ntwo"
+
+    def test_more_lines_than_file(self, tmp_path):
+        """Test that asking for more lines than exist returns the whole log."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("one\ntwo")
+        assert read_log_head(log_path, 5) == "one\ntwo"
@@ -0,0 +1,79 @@
+"""Tests for agentic_devtools.background_tasks.read_log_tail."""
+
+from unittest.mock import patch
+
+from agentic_devtools import background_tasks
+from agentic_devtools.background_tasks import read_log_tail
+
+
+class TestReadLogTail:
+    """Tests for read_log_tail function."""
+
+    def test_returns_last_lines(self, tmp_path):
+        """Test that only the last N lines are returned."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("one\ntwo\nthree\nfour\n")
+        assert read_log_tail(log_path, 2) == "three\nfour"
+
+    def test_without_trailing_newline(self, tmp_path):
+        """Test that an unterminated last line counts as a line."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("one\ntwo\nthree")
+        assert read_log_tail(log_path, 2) == "two\nthree"
+
+    def test_more_lines_than_file(self, tmp_path):
+        """Test that asking for more lines than exist returns the whole log."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("one\ntwo\n")
+        assert read_log_tail(log_path, 10) == "one\ntwo"
+
+    def test_non_positive_lines(self, tmp_path):
+        """Test that zero lines returns an empty string without reading."""
+        assert read_log_tail(tmp_path / "missing.log", 0) == ""
+
+    def test_reads_only_blocks_near_the_end(self, tmp_path):
+        """Test that a large log is read in blocks from the end, not in full."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("".join(f"line {i}\n" for i in range(10000)))
+        bytes_read = []
+        real_open = open
+
+        def counting_open(*args, **kwargs):
+            handle = real_open(*args, **kwargs)
+            real_read = handle.read
+
+            def read(size=-1):
+                data = real_read(size)
+                bytes_read.append(len(data))
+                return data
+
+            handle.read = read
+            return handle
+
+        with patch.object(background_tasks, "LOG_TAIL_BLOCK_SIZE", 64):
+            with patch("builtins.open", side_effect=counting_open):
+                assert read_log_tail(log_path, 3) == "line 9997\nline 9998\nline 9999"
+
+        assert sum(bytes_read) <= 128
+
+    def test_block_boundaries_and_multibyte_text(self, tmp_path):
+        """Test that lines and UTF-8 characters split across blocks are reassembled."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("äöü first\n日本語 second\n🎉 third\n", encoding="utf-8")
+
+        with patch.object(background_tasks, "LOG_TAIL_BLOCK_SIZE", 5):
+            assert read_log_tail(log_path, 2) == "日本語 second\n🎉 third"
+
+    def test_end_offset(self, tmp_path):
+        """Test that data after the end offset is ignored."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("one\ntwo\nthree\n")
+        assert read_log_tail(log_path, 1, end=len("one\ntwo\n")) == "two"
+
+    def test_compressed_log(self, tmp_path):
+        """Test that compressed logs are streamed, keeping only the last lines."""
+        import gzip
+
+        log_path = tmp_path / "task.log.gz"
+        log_path.write_bytes(gzip.compress(b"one\ntwo\nthree\n"))
+        assert read_log_tail(log_path, 2) == "two\nthree"
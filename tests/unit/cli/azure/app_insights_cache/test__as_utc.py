@@ -0,0 +1,28 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache._as_utc."""
+
+from datetime import datetime, timedelta, timezone
+
+from agentic_devtools.cli.azure.app_insights_cache import _as_utc
+
+
+class TestAsUtc:
+    """Tests for _as_utc function."""
+
+    def test_naive_datetime_assumed_utc(self):
+        """Test that naive datetimes are tagged as UTC."""
+        assert _as_utc(datetime(2024, 1, 1, 12)) == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+    def test_aware_datetime_converted(self):
+        """Test that aware datetimes are converted to UTC."""
+        value = datetime(2024, 1, 1, 14, tzinfo=timezone(timedelta(hours=2)))
+        assert _as_utc(value) == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+    def test_iso_string_parsed(self):
+        """Test that ISO 8601 strings with a Z suffix are parsed."""
+        assert _as_utc("2024-01-01T12:00:00Z") == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+    def test_unparseable_values(self):
+        """Test that non-timestamp values yield None."""
+        assert _as_utc("not a date") is None
+        assert _as_utc(42) is None
+        assert _as_utc(None) is None
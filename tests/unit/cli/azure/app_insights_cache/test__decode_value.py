@@ -0,0 +1,18 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache._decode_value."""
+
+from datetime import datetime, timezone
+
+from agentic_devtools.cli.azure.app_insights_cache import _decode_value
+
+
+class TestDecodeValue:
+    """Tests for _decode_value function."""
+
+    def test_tagged_datetime_is_restored(self):
+        """Test that tagged datetimes round-trip."""
+        assert _decode_value({"$dt": "2024-01-01T00:00:00+00:00"}) == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def test_plain_values_pass_through(self):
+        """Test that other values, including plain dicts, are unchanged."""
+        assert _decode_value({"a": 1}) == {"a": 1}
+        assert _decode_value(None) is None
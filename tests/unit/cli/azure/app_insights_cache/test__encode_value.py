@@ -0,0 +1,19 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache._encode_value."""
+
+from datetime import datetime, timezone
+
+from agentic_devtools.cli.azure.app_insights_cache import _encode_value
+
+
+class TestEncodeValue:
+    """Tests for _encode_value function."""
+
+    def test_datetime_is_tagged(self):
+        """Test that datetimes are wrapped so they can be restored."""
+        value = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert _encode_value(value) == {"$dt": "2024-01-01T00:00:00+00:00"}
+
+    def test_plain_values_pass_through(self):
+        """Test that JSON-native values are unchanged."""
+        assert _encode_value("x") == "x"
+        assert _encode_value(1.5) == 1.5
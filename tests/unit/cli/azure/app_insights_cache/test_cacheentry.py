@@ -0,0 +1,39 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache.CacheEntry."""
+
+from datetime import datetime, timedelta, timezone
+
+from agentic_devtools.cli.azure.app_insights_cache import INGESTION_GRACE, CacheEntry
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+
+NOW = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _entry(window_end=NOW, fetched_at=NOW):
+    return CacheEntry(
+        key="k",
+        window=TimeWindow(start=window_end - timedelta(hours=1), end=window_end),
+        columns=["timestamp", "message"],
+        rows=[[NOW - timedelta(minutes=30), "hello"]],
+        complete=True,
+        fetched_at=fetched_at,
+    )
+
+
+class TestCacheEntry:
+    """Tests for CacheEntry dataclass."""
+
+    def test_settled_end_excludes_ingestion_grace(self):
+        """Test that the last INGESTION_GRACE before fetch time is not settled."""
+        assert _entry().settled_end == NOW - INGESTION_GRACE
+
+    def test_settled_end_for_historic_window(self):
+        """Test that windows ending well before the fetch are fully settled."""
+        entry = _entry(window_end=NOW - timedelta(hours=2))
+        assert entry.settled_end == NOW - timedelta(hours=2)
+
+    def test_round_trip(self):
+        """Test that to_dict/from_dict preserve all fields including datetimes."""
+        entry = _entry()
+        restored = CacheEntry.from_dict(entry.to_dict())
+        assert restored == entry
+        assert isinstance(restored.rows[0][0], datetime)
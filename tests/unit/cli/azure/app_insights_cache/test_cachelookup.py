@@ -0,0 +1,15 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache.CacheLookup."""
+
+from agentic_devtools.cli.azure.app_insights_cache import CacheLookup
+
+
+class TestCacheLookup:
+    """Tests for CacheLookup dataclass."""
+
+    def test_miss_by_default(self):
+        """Test that a lookup without columns is a miss."""
+        assert CacheLookup().hit is False
+
+    def test_hit_with_columns(self):
+        """Test that a lookup carrying cached columns is a hit, even without rows."""
+        assert CacheLookup(columns=["timestamp"]).hit is True
@@ -0,0 +1,17 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache.get_cache_dir."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure import app_insights_cache
+
+
+class TestGetCacheDir:
+    """Tests for get_cache_dir function."""
+
+    def test_lives_in_state_dir_without_creating_it(self, tmp_path):
+        """Test that the cache dir is under the state dir and created lazily."""
+        with patch.object(app_insights_cache, "get_state_dir", return_value=tmp_path):
+            cache_dir = app_insights_cache.get_cache_dir()
+
+        assert cache_dir == tmp_path / "app-insights-cache"
+        assert not cache_dir.exists()
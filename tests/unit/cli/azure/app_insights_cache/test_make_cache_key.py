@@ -0,0 +1,23 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache.make_cache_key."""
+
+from agentic_devtools.cli.azure.app_insights_cache import make_cache_key
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key function."""
+
+    def test_is_stable_hex_digest(self):
+        """Test that the key is a 64-character hex digest and deterministic."""
+        key = make_cache_key("DEV", "traces | take 1")
+        assert len(key) == 64
+        assert key == make_cache_key("DEV", "traces | take 1")
+
+    def test_ignores_formatting_and_environment_case(self):
+        """Test that whitespace and environment casing do not change the key."""
+        assert make_cache_key("dev", "traces\n|  take 1") == make_cache_key("DEV", "traces | take 1")
+
+    def test_differs_by_environment_and_query(self):
+        """Test that different environments or queries get different keys."""
+        base = make_cache_key("DEV", "traces | take 1")
+        assert make_cache_key("PROD", "traces | take 1") != base
+        assert make_cache_key("DEV", "exceptions | take 1") != base
@@ -0,0 +1,20 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache.normalize_kql."""
+
+from agentic_devtools.cli.azure.app_insights_cache import normalize_kql
+
+
+class TestNormalizeKql:
+    """Tests for normalize_kql function."""
+
+    def test_collapses_whitespace(self):
+        """Test that runs of whitespace and newlines become single spaces."""
+        assert normalize_kql("  traces\n|   where x  ==  1\n") == "traces | where x == 1"
+
+    def test_preserves_string_literals(self):
+        """Test that whitespace inside quoted strings is kept."""
+        query = "traces | where message contains 'a   b' and name == \"c  d\""
+        assert normalize_kql(query) == query
+
+    def test_escaped_quotes_inside_literals(self):
+        """Test that escaped quotes do not end a literal early."""
+        assert normalize_kql("x == 'it\\'s   here'   | take 1") == "x == 'it\\'s   here' | take 1"
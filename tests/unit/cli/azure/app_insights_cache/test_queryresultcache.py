@@ -0,0 +1,267 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_cache.QueryResultCache."""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from agentic_devtools.cli.azure.app_insights_cache import CacheEntry, QueryResultCache
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+
+NOW = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+COLUMNS = ["timestamp", "message"]
+
+
+def _ts(minutes_ago):
+    return NOW - timedelta(minutes=minutes_ago)
+
+
+def _window(start_minutes_ago, end_minutes_ago=0):
+    return TimeWindow(start=_ts(start_minutes_ago), end=_ts(end_minutes_ago))
+
+
+def _entry(rows, window=None, complete=True, fetched_at=NOW, columns=COLUMNS, key="k"):
+    return CacheEntry(
+        key=key,
+        window=window or _window(60),
+        columns=columns,
+        rows=rows,
+        complete=complete,
+        fetched_at=fetched_at,
+    )
+
+
+def _result(rows):
+    return {"tables": [{"columns": [{"name": c} for c in COLUMNS], "rows": rows}]}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return QueryResultCache(tmp_path / "cache")
+
+
+class TestQueryResultCacheLoad:
+    """Tests for QueryResultCache.load."""
+
+    def test_missing_entry(self, cache):
+        """Test that an unknown key loads as None."""
+        assert cache.load("k") is None
+
+    def test_round_trip(self, cache):
+        """Test that stored entries load back unchanged."""
+        entry = _entry([[_ts(30), "a"]])
+        cache.store(entry)
+        assert cache.load("k", now=NOW) == entry
+
+    def test_expired_entry(self, cache):
+        """Test that entries older than max_age are ignored."""
+        cache.store(_entry([], fetched_at=NOW - timedelta(days=2)))
+        assert cache.load("k", now=NOW) is None
+
+    def test_corrupt_entry(self, cache):
+        """Test that unreadable entries are treated as missing."""
+        cache.cache_dir.mkdir(parents=True)
+        (cache.cache_dir / "k.json").write_text("{not json")
+        assert cache.load("k") is None
+
+
+class TestQueryResultCacheLookup:
+    """Tests for QueryResultCache.lookup."""
+
+    def test_miss_fetches_whole_window(self, cache):
+        """Test that without an entry the whole requested window is fetched."""
+        requested = _window(60)
+        lookup = cache.lookup("k", requested, 100, now=NOW)
+        assert lookup.hit is False
+        assert lookup.fetch_window == requested
+
+    def test_overlap_fetches_only_tail(self, cache):
+        """Test that a re-run a few minutes later reuses settled rows and fetches the tail."""
+        cache.store(_entry([[_ts(50), "old"], [_ts(20), "mid"], [_ts(2), "recent"]], fetched_at=NOW))
+        later = NOW + timedelta(minutes=10)
+        requested = TimeWindow(start=_ts(55), end=later)
+
+        lookup = cache.lookup("k", requested, 100, now=later)
+
+        assert lookup.hit is True
+        assert lookup.cached_rows == [[_ts(50), "old"], [_ts(20), "mid"]]
+        assert lookup.fetch_window == TimeWindow(start=_ts(5), end=later)
+        assert lookup.covered_end == later
+
+    def test_requested_start_filters_cached_rows(self, cache):
+        """Test that cached rows before the requested start are dropped."""
+        cache.store(_entry([[_ts(50), "old"], [_ts(20), "mid"]], fetched_at=NOW))
+        lookup = cache.lookup("k", _window(30, -5), 100, now=NOW)
+        assert lookup.cached_rows == [[_ts(20), "mid"]]
+
+    def test_fully_covered_window_needs_no_fetch(self, cache):
+        """Test that a historic window inside the cached range is served entirely from cache."""
+        cache.store(_entry([[_ts(50), "old"], [_ts(20), "mid"]], fetched_at=NOW))
+        lookup = cache.lookup("k", _window(55, 15), 100, now=NOW)
+        assert lookup.fetch_window is None
+        assert lookup.cached_rows == [[_ts(50), "old"], [_ts(20), "mid"]]
+
+    def test_ascending_full_result_skips_tail(self, cache):
+        """Test that ascending queries already at the limit do not fetch the tail."""
+        cache.store(_entry([[_ts(50), "a"], [_ts(40), "b"]], fetched_at=NOW))
+        lookup = cache.lookup("k", _window(55, -10), 2, descending=False, now=NOW)
+        assert lookup.fetch_window is None
+        assert lookup.covered_end == _ts(5)
+
+    def test_descending_full_result_still_fetches_tail(self, cache):
+        """Test that descending queries always fetch the newer tail."""
+        cache.store(_entry([[_ts(40), "b"], [_ts(50), "a"]], fetched_at=NOW))
+        lookup = cache.lookup("k", _window(55, -10), 2, descending=True, now=NOW)
+        assert lookup.fetch_window == TimeWindow(start=_ts(5), end=_ts(-10))
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            _entry([[_ts(30), "a"]], complete=False),
+            _entry([["x", "a"]], columns=["name", "message"]),
+            _entry([[_ts(30), "a"]], window=_window(30)),
+            _entry([["garbage", "a"]]),
+        ],
+        ids=["incomplete", "no-timestamp-column", "starts-too-late", "unparseable-timestamp"],
+    )
+    def test_unusable_entries_miss(self, cache, entry):
+        """Test that truncated, untimed or non-covering entries are not reused."""
+        cache.store(entry)
+        requested = _window(45, -5)
+        lookup = cache.lookup("k", requested, 100, now=NOW)
+        assert lookup.hit is False
+        assert lookup.fetch_window == requested
+
+    def test_requested_window_after_settled_end_misses(self, cache):
+        """Test that windows starting after the settled part are a plain miss."""
+        cache.store(_entry([[_ts(30), "a"]], fetched_at=NOW))
+        requested = _window(3, -5)
+        assert cache.lookup("k", requested, 100, now=NOW).hit is False
+
+
+class TestQueryResultCacheStore:
+    """Tests for QueryResultCache.store and evict."""
+
+    def test_store_writes_json_file(self, cache):
+        """Test that entries are written as JSON named after their key."""
+        assert cache.store(_entry([[_ts(1), "a"]])) is True
+        data = json.loads((cache.cache_dir / "k.json").read_text())
+        assert data["key"] == "k"
+        assert not list(cache.cache_dir.glob("*.tmp"))
+
+    def test_entry_larger_than_budget_is_not_stored(self, tmp_path):
+        """Test that an entry bigger than the whole budget is skipped."""
+        cache = QueryResultCache(tmp_path / "cache", max_bytes=10)
+        assert cache.store(_entry([[_ts(1), "a"]])) is False
+        assert not (tmp_path / "cache").exists()
+
+    def test_evicts_oldest_entries_over_budget(self, tmp_path):
+        """Test that the least recently written entries are evicted first."""
+        probe = QueryResultCache(tmp_path / "probe")
+        probe.store(_entry([[_ts(1), "x" * 100]], key="probe"))
+        entry_size = (tmp_path / "probe" / "probe.json").stat().st_size
+        cache = QueryResultCache(tmp_path / "cache", max_bytes=entry_size * 2 + entry_size // 2)
+
+        for index, key in enumerate(["a", "b"]):
+            cache.store(_entry([[_ts(1), "x" * 100]], key=key))
+            os.utime(cache.cache_dir / f"{key}.json", (time.time() - 100 + index, time.time() - 100 + index))
+        cache.store(_entry([[_ts(1), "x" * 100]], key="c"))
+
+        assert sorted(p.stem for p in cache.cache_dir.glob("*.json")) == ["b", "c"]
+
+    def test_evicts_expired_entries(self, cache):
+        """Test that entries past max_age are evicted even within budget."""
+        cache.store(_entry([], key="old"))
+        old_time = time.time() - timedelta(days=2).total_seconds()
+        os.utime(cache.cache_dir / "old.json", (old_time, old_time))
+
+        removed = cache.evict()
+
+        assert removed == 1
+        assert not (cache.cache_dir / "old.json").exists()
+
+    def test_evict_on_missing_dir(self, cache):
+        """Test that evicting a never-created cache is a no-op."""
+        assert cache.evict() == 0
+
+
+class TestQueryResultCacheRun:
+    """Tests for QueryResultCache.run."""
+
+    def test_miss_fetches_and_stores(self, cache):
+        """Test that a miss fetches the whole window and caches the result."""
+        requested = _window(60)
+        fetched = []
+
+        def fetch(window):
+            fetched.append(window)
+            return _result([[_ts(30), "a"]])
+
+        result = cache.run("k", requested, 100, False, fetch, now=NOW)
+
+        assert fetched == [requested]
+        assert result["tables"][0]["rows"] == [[_ts(30), "a"]]
+        assert [col["name"] for col in result["tables"][0]["columns"]] == ["timestamp", "message"]
+        assert cache.load("k", now=NOW).complete is True
+
+    def test_rerun_merges_cached_rows_with_tail_ascending(self, cache, capsys):
+        """Test that an ascending re-run returns cached rows followed by the tail."""
+        cache.run("k", _window(60), 100, False, lambda w: _result([[_ts(50), "a"], [_ts(20), "b"]]), now=NOW)
+        later = NOW + timedelta(minutes=10)
+
+        result = cache.run(
+            "k",
+            TimeWindow(start=_ts(50), end=later),
+            100,
+            False,
+            lambda w: _result([[_ts(3), "c"], [_ts(-5), "d"]]),
+            now=later,
+        )
+
+        assert [row[1] for row in result["tables"][0]["rows"]] == ["a", "b", "c", "d"]
+        assert "Cache: reusing 2 rows, fetching" in capsys.readouterr().err
+
+    def test_rerun_merges_descending_and_truncates(self, cache):
+        """Test that a descending re-run puts the tail first and applies the limit."""
+        cache.run("k", _window(60), 10, True, lambda w: _result([[_ts(20), "b"], [_ts(50), "a"]]), now=NOW)
+        later = NOW + timedelta(minutes=10)
+
+        result = cache.run(
+            "k", TimeWindow(start=_ts(60), end=later), 2, True, lambda w: _result([[_ts(-5), "c"]]), now=later
+        )
+
+        assert [row[1] for row in result["tables"][0]["rows"]] == ["c", "b"]
+
+    def test_truncated_fetch_marks_entry_incomplete(self, cache):
+        """Test that a fetch hitting the limit is stored as incomplete."""
+        cache.run("k", _window(60), 1, True, lambda w: _result([[_ts(5), "a"]]), now=NOW)
+        assert cache.load("k", now=NOW).complete is False
+
+    def test_fully_cached_run_does_not_fetch(self, cache, capsys):
+        """Test that a window served entirely from cache makes no remote call."""
+        cache.run("k", _window(60), 100, False, lambda w: _result([[_ts(30), "a"]]), now=NOW)
+
+        def fetch(window):
+            raise AssertionError("should not fetch")
+
+        result = cache.run("k", _window(50, 20), 100, False, fetch, now=NOW)
+
+        assert result["tables"][0]["rows"] == [[_ts(30), "a"]]
+        assert "nothing new to fetch" in capsys.readouterr().err
+
+    def test_fetch_failure_returns_none(self, cache):
+        """Test that a failed fetch returns None and stores nothing."""
+        assert cache.run("k", _window(60), 100, False, lambda w: None, now=NOW) is None
+        assert cache.load("k", now=NOW) is None
+
+    def test_empty_result(self, cache):
+        """Test that a fetch returning no tables yields an empty result."""
+        assert cache.run("k", _window(60), 100, False, lambda w: {"tables": []}, now=NOW) == {"tables": []}
+
+    def test_defaults_now(self, cache):
+        """Test that run works without an explicit current time."""
+        now = datetime.now(timezone.utc)
+        requested = TimeWindow(start=now - timedelta(hours=1), end=now)
+        assert cache.run("k", requested, 100, False, lambda w: {"tables": []}) == {"tables": []}
@@ -0,0 +1,29 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_commands._get_export_format."""
+
+import pytest
+
+from agentic_devtools import state
+from agentic_devtools.cli.azure.app_insights_commands import _get_export_format
+
+
+class TestGetExportFormat:
+    """Tests for _get_export_format function."""
+
+    def test_returns_none_when_unset(self, temp_state_dir):
+        """Test that no export format means the classic output path."""
+        assert _get_export_format() is None
+
+    def test_returns_lowercase_format(self, temp_state_dir):
+        """Test that the configured format is normalized to lowercase."""
+        state.set_value("azure.export_format", "JSONL")
+        assert _get_export_format() == "jsonl"
+
+    def test_exits_on_unknown_format(self, temp_state_dir, capsys):
+        """Test that an unsupported format exits with an error."""
+        state.set_value("azure.export_format", "xml")
+
+        with pytest.raises(SystemExit) as exc_info:
+            _get_export_format()
+
+        assert exc_info.value.code == 1
+        assert "Unknown azure.export_format 'xml'" in capsys.readouterr().err
@@ -0,0 +1,16 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_commands._get_export_output_file."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure import app_insights_commands
+
+
+class TestGetExportOutputFile:
+    """Tests for _get_export_output_file function."""
+
+    def test_uses_extension_for_format(self, tmp_path):
+        """Test that the file lives in the temp dir with the format's extension."""
+        with patch.object(app_insights_commands, "get_state_dir", return_value=tmp_path):
+            assert app_insights_commands._get_export_output_file("temp-x", "jsonl") == tmp_path / "temp-x.jsonl"
+            assert app_insights_commands._get_export_output_file("temp-x", "csv") == tmp_path / "temp-x.csv"
+            assert app_insights_commands._get_export_output_file("temp-x", "block") == tmp_path / "temp-x.txt"
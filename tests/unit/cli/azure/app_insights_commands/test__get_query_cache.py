@@ -0,0 +1,43 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_commands._get_query_cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools import state
+from agentic_devtools.cli.azure import app_insights_cache
+from agentic_devtools.cli.azure.app_insights_cache import DEFAULT_CACHE_MAX_BYTES
+from agentic_devtools.cli.azure.app_insights_commands import _get_query_cache
+
+
+class TestGetQueryCache:
+    """Tests for _get_query_cache function."""
+
+    def test_enabled_by_default(self, temp_state_dir):
+        """Test that the cache is on by default, in the state dir, with the default budget."""
+        with patch.object(app_insights_cache, "get_state_dir", return_value=temp_state_dir):
+            cache = _get_query_cache()
+        assert cache.cache_dir == temp_state_dir / "app-insights-cache"
+        assert cache.max_bytes == DEFAULT_CACHE_MAX_BYTES
+
+    @pytest.mark.parametrize("value", ["false", "0", "no"])
+    def test_disabled_in_state(self, temp_state_dir, value):
+        """Test that azure.cache=false disables the cache."""
+        state.set_value("azure.cache", value)
+        assert _get_query_cache() is None
+
+    def test_custom_budget(self, temp_state_dir):
+        """Test that azure.cache_max_mb sets the byte budget."""
+        state.set_value("azure.cache_max_mb", "1.5")
+        assert _get_query_cache().max_bytes == int(1.5 * 1024 * 1024)
+
+    @pytest.mark.parametrize("value", ["0", "-1", "lots"])
+    def test_invalid_budget_exits(self, temp_state_dir, value, capsys):
+        """Test that a non-positive or non-numeric budget exits with an error."""
+        state.set_value("azure.cache_max_mb", value)
+
+        with pytest.raises(SystemExit) as exc_info:
+            _get_query_cache()
+
+        assert exc_info.value.code == 1
+        assert "azure.cache_max_mb must be a positive number" in capsys.readouterr().err
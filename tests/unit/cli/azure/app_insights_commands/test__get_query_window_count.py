@@ -0,0 +1,35 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_commands._get_query_window_count."""
+
+import pytest
+
+from agentic_devtools import state
+from agentic_devtools.cli.azure.app_insights_commands import _get_query_window_count
+
+
+class TestGetQueryWindowCount:
+    """Tests for _get_query_window_count function."""
+
+    def test_returns_none_when_unset(self, temp_state_dir):
+        """Test that an unset value lets the planner decide."""
+        assert _get_query_window_count() is None
+
+    def test_returns_none_for_empty_value(self, temp_state_dir):
+        """Test that an empty value is treated as unset."""
+        state.set_value("azure.query_windows", "")
+        assert _get_query_window_count() is None
+
+    def test_returns_integer(self, temp_state_dir):
+        """Test that a numeric string is converted to int."""
+        state.set_value("azure.query_windows", "6")
+        assert _get_query_window_count() == 6
+
+    @pytest.mark.parametrize("value", ["0", "-2", "many"])
+    def test_exits_on_invalid_value(self, temp_state_dir, value, capsys):
+        """Test that non-positive or non-numeric values exit with an error."""
+        state.set_value("azure.query_windows", value)
+
+        with pytest.raises(SystemExit) as exc_info:
+            _get_query_window_count()
+
+        assert exc_info.value.code == 1
+        assert "must be a positive integer" in capsys.readouterr().err
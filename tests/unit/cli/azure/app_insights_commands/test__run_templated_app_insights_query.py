@@ -0,0 +1,125 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_commands._run_templated_app_insights_query."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.azure import app_insights_cache, app_insights_commands
+from agentic_devtools.cli.azure.app_insights_commands import (
+    FABRIC_DAP_TIMELINE_QUERY,
+    _run_templated_app_insights_query,
+)
+
+
+@pytest.fixture
+def mock_runners():
+    with patch.object(app_insights_commands, "_run_app_insights_query", return_value={"tables": []}) as single:
+        with patch.object(
+            app_insights_commands, "_run_planned_app_insights_query", return_value={"tables": []}
+        ) as planned:
+            yield single, planned
+
+
+@pytest.fixture
+def cache_state_dir(temp_state_dir):
+    with patch.object(app_insights_cache, "get_state_dir", return_value=temp_state_dir):
+        yield temp_state_dir
+
+
+@pytest.fixture
+def no_cache(temp_state_dir):
+    app_insights_commands.set_value("azure.cache", "false")
+
+
+class TestRunTemplatedAppInsightsQuery:
+    """Tests for _run_templated_app_insights_query function."""
+
+    def test_short_range_runs_single_relative_query(self, no_cache, mock_runners):
+        """Test that without the cache a single planned window keeps the original ago() query."""
+        single, planned = mock_runners
+
+        result = _run_templated_app_insights_query(
+            "DEV", FABRIC_DAP_TIMELINE_QUERY, timespan="1h", limit=50, output_file=Path("out.txt")
+        )
+
+        assert result == {"tables": []}
+        planned.assert_not_called()
+        kwargs = single.call_args.kwargs
+        assert "timestamp > ago(1h)" in kwargs["query"]
+        assert "take 50" in kwargs["query"]
+        assert kwargs["output_file"] == Path("out.txt")
+
+    def test_long_range_runs_planned_windows(self, no_cache, mock_runners):
+        """Test that long ranges are planned into absolute windows."""
+        single, planned = mock_runners
+
+        _run_templated_app_insights_query(
+            "DEV", FABRIC_DAP_TIMELINE_QUERY, timespan="24h", limit=500, dataproduct_id="dp-1"
+        )
+
+        single.assert_not_called()
+        plan = planned.call_args.kwargs["plan"]
+        assert len(plan.windows) == 6
+        assert all("ago(" not in query and "dp-1" in query for query in plan.queries)
+
+    def test_explicit_window_count_from_state(self, no_cache, mock_runners):
+        """Test that azure.query_windows overrides the automatic window count."""
+        _, planned = mock_runners
+        app_insights_commands.set_value("azure.query_windows", "3")
+
+        _run_templated_app_insights_query("DEV", FABRIC_DAP_TIMELINE_QUERY, timespan="1h")
+
+        assert len(planned.call_args.kwargs["plan"].windows) == 3
+
+    def test_dry_run_bypasses_cache(self, cache_state_dir, mock_runners):
+        """Test that dry runs never consult the cache and keep the relative query."""
+        single, _ = mock_runners
+
+        _run_templated_app_insights_query("DEV", FABRIC_DAP_TIMELINE_QUERY, timespan="1h", dry_run=True)
+
+        assert "timestamp > ago(1h)" in single.call_args.kwargs["query"]
+        assert single.call_args.kwargs["dry_run"] is True
+
+    def test_cached_run_queries_absolute_window_and_writes_output(self, cache_state_dir, mock_runners, tmp_path):
+        """Test that the cache path queries an absolute window and writes the merged file."""
+        single, _ = mock_runners
+        single.return_value = {
+            "tables": [{"columns": [{"name": "timestamp"}, {"name": "message"}], "rows": [["2024-01-01", "x"]]}]
+        }
+        output_file = tmp_path / "out.txt"
+
+        result = _run_templated_app_insights_query(
+            "DEV", FABRIC_DAP_TIMELINE_QUERY, timespan="1h", limit=10, output_file=output_file
+        )
+
+        kwargs = single.call_args.kwargs
+        assert "ago(" not in kwargs["query"]
+        assert "timestamp >= datetime(" in kwargs["query"]
+        assert kwargs["output_file"] is None
+        assert result["tables"][0]["rows"] == [["2024-01-01", "x"]]
+        assert "Total: 1 rows" in output_file.read_text()
+        assert list((cache_state_dir / "app-insights-cache").glob("*.json"))
+
+    def test_cached_run_long_tail_is_planned(self, cache_state_dir, mock_runners):
+        """Test that a long uncovered range still runs as parallel windows."""
+        _, planned = mock_runners
+
+        _run_templated_app_insights_query("DEV", FABRIC_DAP_TIMELINE_QUERY, timespan="24h")
+
+        plan = planned.call_args.kwargs["plan"]
+        assert len(plan.windows) == 6
+        assert planned.call_args.kwargs["output_file"] is None
+
+    def test_cached_run_failure_returns_none(self, cache_state_dir, mock_runners, tmp_path):
+        """Test that a failed fetch returns None without writing output."""
+        single, _ = mock_runners
+        single.return_value = None
+        output_file = tmp_path / "out.txt"
+
+        result = _run_templated_app_insights_query(
+            "DEV", FABRIC_DAP_TIMELINE_QUERY, timespan="1h", output_file=output_file
+        )
+
+        assert result is None
+        assert not output_file.exists()
@@ -0,0 +1,18 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export._format_kql_datetime."""
+
+from datetime import datetime, timedelta, timezone
+
+from agentic_devtools.cli.azure.app_insights_export import _format_kql_datetime
+
+
+class TestFormatKqlDatetime:
+    """Tests for _format_kql_datetime function."""
+
+    def test_naive_datetime_is_treated_as_utc(self):
+        """Test that a naive datetime is formatted as-is with a Z suffix."""
+        assert _format_kql_datetime(datetime(2024, 5, 1, 12, 30)) == "datetime(2024-05-01T12:30:00Z)"
+
+    def test_aware_datetime_is_converted_to_utc(self):
+        """Test that a timezone-aware datetime is converted to UTC."""
+        value = datetime(2024, 5, 1, 14, 30, tzinfo=timezone(timedelta(hours=2)))
+        assert _format_kql_datetime(value) == "datetime(2024-05-01T12:30:00Z)"
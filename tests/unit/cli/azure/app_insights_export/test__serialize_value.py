@@ -0,0 +1,23 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export._serialize_value."""
+
+from datetime import datetime, timedelta
+
+from agentic_devtools.cli.azure.app_insights_export import _serialize_value
+
+
+class TestSerializeValue:
+    """Tests for _serialize_value function."""
+
+    def test_datetime_becomes_isoformat(self):
+        """Test that datetimes are converted to ISO 8601 strings."""
+        assert _serialize_value(datetime(2024, 1, 1, 12, 0)) == "2024-01-01T12:00:00"
+
+    def test_timedelta_becomes_string(self):
+        """Test that timedeltas are converted to strings."""
+        assert _serialize_value(timedelta(seconds=90)) == "0:01:30"
+
+    def test_other_values_pass_through(self):
+        """Test that plain values are returned unchanged."""
+        assert _serialize_value(3) == 3
+        assert _serialize_value("text") == "text"
+        assert _serialize_value(None) is None
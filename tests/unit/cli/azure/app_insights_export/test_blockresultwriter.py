@@ -0,0 +1,39 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.BlockResultWriter."""
+
+from agentic_devtools.cli.azure.app_insights_export import BlockResultWriter
+
+
+class TestBlockResultWriter:
+    """Tests for BlockResultWriter class."""
+
+    def test_writes_blocks_and_total(self, tmp_path):
+        """Test that each row becomes a numbered block and the total is appended."""
+        output_file = tmp_path / "out.txt"
+        with BlockResultWriter(output_file) as writer:
+            writer.write_columns(["timestamp", "message"])
+            writer.write_row(["2024-01-01", "first"])
+            writer.write_row(["2024-01-02", "second"])
+
+        content = output_file.read_text()
+        assert content.startswith("Query Results - ")
+        assert "--- Result 1 ---\n  timestamp: 2024-01-01\n  message: first" in content
+        assert "--- Result 2 ---" in content
+        assert content.endswith("Total: 2 rows\n")
+
+    def test_skips_empty_values(self, tmp_path):
+        """Test that empty cells are omitted from the block."""
+        output_file = tmp_path / "out.txt"
+        with BlockResultWriter(output_file) as writer:
+            writer.write_columns(["a", "b"])
+            writer.write_row(["value", None])
+
+        content = output_file.read_text()
+        assert "  a: value" in content
+        assert "  b:" not in content
+
+    def test_no_rows_writes_no_results(self, tmp_path):
+        """Test that an empty export says no results were found."""
+        output_file = tmp_path / "out.txt"
+        with BlockResultWriter(output_file):
+            pass
+        assert "No results found.\nTotal: 0 rows\n" in output_file.read_text()
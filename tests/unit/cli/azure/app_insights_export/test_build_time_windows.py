@@ -0,0 +1,44 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.build_time_windows."""
+
+from datetime import datetime, timedelta, timezone
+
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow, build_time_windows
+
+END = datetime(2024, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class TestBuildTimeWindows:
+    """Tests for build_time_windows function."""
+
+    def test_single_window_without_slice_size(self):
+        """Test that no slice size yields one window covering the timespan."""
+        windows = build_time_windows("24h", end=END)
+        assert windows == [TimeWindow(start=END - timedelta(hours=24), end=END)]
+
+    def test_splits_into_consecutive_windows(self):
+        """Test that windows are contiguous and cover the whole range oldest first."""
+        windows = build_time_windows("3h", "1h", end=END)
+
+        assert len(windows) == 3
+        assert windows[0].start == END - timedelta(hours=3)
+        assert windows[-1].end == END
+        for previous, current in zip(windows, windows[1:]):
+            assert previous.end == current.start
+
+    def test_last_window_is_truncated(self):
+        """Test that a slice size not dividing the timespan shortens the final window."""
+        windows = build_time_windows("90m", "1h", end=END)
+        assert [w.duration for w in windows] == [timedelta(hours=1), timedelta(minutes=30)]
+
+    def test_newest_first_reverses_order(self):
+        """Test that newest_first returns the most recent window first."""
+        windows = build_time_windows("2h", "1h", end=END, newest_first=True)
+        assert windows[0].end == END
+        assert windows[1].end == END - timedelta(hours=1)
+
+    def test_defaults_end_to_now(self):
+        """Test that the range ends at the current time when end is omitted."""
+        before = datetime.now(timezone.utc)
+        windows = build_time_windows("1h")
+        after = datetime.now(timezone.utc)
+        assert before <= windows[0].end <= after
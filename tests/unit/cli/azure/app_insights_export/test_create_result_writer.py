@@ -0,0 +1,30 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.create_result_writer."""
+
+import pytest
+
+from agentic_devtools.cli.azure.app_insights_export import (
+    BlockResultWriter,
+    CsvResultWriter,
+    JsonlResultWriter,
+    create_result_writer,
+)
+
+
+class TestCreateResultWriter:
+    """Tests for create_result_writer function."""
+
+    @pytest.mark.parametrize(
+        "export_format,writer_class",
+        [("block", BlockResultWriter), ("jsonl", JsonlResultWriter), ("CSV", CsvResultWriter)],
+    )
+    def test_returns_writer_for_format(self, tmp_path, export_format, writer_class):
+        """Test that each supported format maps to its writer (case-insensitive)."""
+        writer = create_result_writer(export_format, tmp_path / "out")
+        assert isinstance(writer, writer_class)
+        assert writer.output_file == tmp_path / "out"
+
+    @pytest.mark.parametrize("export_format", ["xml", "", None])
+    def test_rejects_unknown_format(self, tmp_path, export_format):
+        """Test that unsupported formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown export format"):
+            create_result_writer(export_format, tmp_path / "out")
@@ -0,0 +1,28 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.CsvResultWriter."""
+
+import csv
+from datetime import datetime
+
+from agentic_devtools.cli.azure.app_insights_export import CsvResultWriter
+
+
+class TestCsvResultWriter:
+    """Tests for CsvResultWriter class."""
+
+    def test_writes_header_and_rows(self, tmp_path):
+        """Test that the header is written once followed by each row."""
+        output_file = tmp_path / "out.csv"
+        with CsvResultWriter(output_file) as writer:
+            writer.write_columns(["timestamp", "message"])
+            writer.write_row([datetime(2024, 1, 1, 8, 0), "hello, world"])
+            writer.write_columns(["ignored"])
+            writer.write_row([datetime(2024, 1, 1, 9, 0), None])
+
+        with output_file.open(newline="", encoding="utf-8") as handle:
+            rows = list(csv.reader(handle))
+
+        assert rows == [
+            ["timestamp", "message"],
+            ["2024-01-01T08:00:00", "hello, world"],
+            ["2024-01-01T09:00:00", ""],
+        ]
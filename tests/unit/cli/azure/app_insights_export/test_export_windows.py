@@ -0,0 +1,103 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.export_windows."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.azure.app_insights_export import JsonlResultWriter, TimeWindow, export_windows
+
+START = datetime(2024, 1, 1, 0, 0)
+WINDOWS = [TimeWindow(start=START + timedelta(hours=i), end=START + timedelta(hours=i + 1)) for i in range(3)]
+
+
+def _table(rows, columns=("timestamp", "message")):
+    table = MagicMock()
+    table.columns = list(columns)
+    table.rows = rows
+    return table
+
+
+class TestExportWindows:
+    """Tests for export_windows function."""
+
+    def test_streams_rows_from_every_window(self, tmp_path):
+        """Test that rows from each window are written in window order."""
+        results = {
+            WINDOWS[0]: [_table([["t0", "a"]])],
+            WINDOWS[1]: [_table([["t1", "b"], ["t1", "c"]])],
+            WINDOWS[2]: [_table([])],
+        }
+        with JsonlResultWriter(tmp_path / "out.jsonl") as writer:
+            stats = export_windows(
+                WINDOWS,
+                build_query=lambda window, take: f"q {window.start} {take}",
+                run_query=lambda query, window: results[window],
+                writer=writer,
+                limit=100,
+            )
+
+        assert stats.rows == 3
+        assert stats.windows == 3
+        assert stats.elapsed_seconds >= 0
+        assert [line.split('"message": ')[1] for line in (tmp_path / "out.jsonl").read_text().splitlines()] == [
+            '"a"}',
+            '"b"}',
+            '"c"}',
+        ]
+
+    def test_shrinks_take_and_stops_at_limit(self, tmp_path):
+        """Test that the remaining row budget is passed on and exhausted budgets stop the export."""
+        takes = []
+
+        def build_query(window, take):
+            takes.append(take)
+            return "q"
+
+        with JsonlResultWriter(tmp_path / "out.jsonl") as writer:
+            stats = export_windows(
+                WINDOWS,
+                build_query=build_query,
+                run_query=lambda query, window: [_table([["t", "x"], ["t", "y"]])],
+                writer=writer,
+                limit=4,
+            )
+
+        assert takes == [4, 2]
+        assert stats.rows == 4
+        assert stats.windows == 2
+
+    def test_returns_none_when_window_fails(self, tmp_path):
+        """Test that a failed window query aborts the export."""
+        with JsonlResultWriter(tmp_path / "out.jsonl") as writer:
+            stats = export_windows(
+                WINDOWS,
+                build_query=lambda window, take: "q",
+                run_query=lambda query, window: None,
+                writer=writer,
+                limit=10,
+            )
+        assert stats is None
+
+    def test_empty_table_list_writes_nothing(self, tmp_path):
+        """Test that windows returning no tables are counted but add no rows."""
+        with JsonlResultWriter(tmp_path / "out.jsonl") as writer:
+            stats = export_windows(
+                WINDOWS[:1],
+                build_query=lambda window, take: "q",
+                run_query=lambda query, window: [],
+                writer=writer,
+                limit=10,
+            )
+        assert stats.rows == 0
+        assert stats.windows == 1
+
+    def test_reports_progress_to_stderr(self, tmp_path, capsys):
+        """Test that per-window progress is printed to stderr."""
+        with JsonlResultWriter(tmp_path / "out.jsonl") as writer:
+            export_windows(
+                WINDOWS[:1],
+                build_query=lambda window, take: "q",
+                run_query=lambda query, window: [_table([["t", "x"]])],
+                writer=writer,
+                limit=10,
+            )
+        assert "[1/1]" in capsys.readouterr().err
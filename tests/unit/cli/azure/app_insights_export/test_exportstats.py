@@ -0,0 +1,23 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.ExportStats."""
+
+from pathlib import Path
+
+from agentic_devtools.cli.azure.app_insights_export import ExportStats
+
+
+class TestExportStats:
+    """Tests for ExportStats dataclass."""
+
+    def test_rows_per_second(self):
+        """Test that throughput is rows divided by elapsed seconds."""
+        assert ExportStats(rows=1000, windows=2, elapsed_seconds=4.0).rows_per_second == 250.0
+
+    def test_rows_per_second_without_elapsed_time(self):
+        """Test that throughput is zero when no time elapsed."""
+        assert ExportStats(rows=10).rows_per_second == 0.0
+
+    def test_format_summary(self):
+        """Test that the summary mentions rows, windows, throughput and file."""
+        stats = ExportStats(rows=500, windows=5, elapsed_seconds=2.0)
+        summary = stats.format_summary(Path("out.jsonl"))
+        assert summary == "Exported 500 rows from 5 time window(s) in 2.0s (250 rows/sec) to: out.jsonl"
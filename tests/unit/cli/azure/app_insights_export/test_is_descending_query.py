@@ -0,0 +1,25 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.is_descending_query."""
+
+from agentic_devtools.cli.azure.app_insights_commands import (
+    FABRIC_DAP_ERROR_QUERY,
+    FABRIC_DAP_PROVISIONING_QUERY,
+    FABRIC_DAP_TIMELINE_QUERY,
+)
+from agentic_devtools.cli.azure.app_insights_export import is_descending_query
+
+
+class TestIsDescendingQuery:
+    """Tests for is_descending_query function."""
+
+    def test_error_query_is_descending(self):
+        """Test that the error query orders newest first."""
+        assert is_descending_query(FABRIC_DAP_ERROR_QUERY) is True
+
+    def test_ascending_queries(self):
+        """Test that the provisioning and timeline queries are ascending."""
+        assert is_descending_query(FABRIC_DAP_PROVISIONING_QUERY) is False
+        assert is_descending_query(FABRIC_DAP_TIMELINE_QUERY) is False
+
+    def test_unordered_query(self):
+        """Test that a query without ordering is not descending."""
+        assert is_descending_query("traces | take 10") is False
@@ -0,0 +1,40 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.JsonlResultWriter."""
+
+import json
+from datetime import datetime
+
+from agentic_devtools.cli.azure.app_insights_export import JsonlResultWriter
+
+
+class _Opaque:
+    """Value type that JSON cannot encode directly."""
+
+    def __str__(self):
+        return "opaque"
+
+
+class TestJsonlResultWriter:
+    """Tests for JsonlResultWriter class."""
+
+    def test_writes_one_object_per_row(self, tmp_path):
+        """Test that each row is written as a JSON object keyed by column."""
+        output_file = tmp_path / "out.jsonl"
+        with JsonlResultWriter(output_file) as writer:
+            writer.write_columns(["timestamp", "severityLevel", "message"])
+            writer.write_row([datetime(2024, 1, 1, 8, 0), 3, "boom"])
+            writer.write_row([datetime(2024, 1, 1, 9, 0), None, "bang"])
+
+        lines = output_file.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"timestamp": "2024-01-01T08:00:00", "severityLevel": 3, "message": "boom"},
+            {"timestamp": "2024-01-01T09:00:00", "severityLevel": None, "message": "bang"},
+        ]
+
+    def test_unknown_types_are_stringified(self, tmp_path):
+        """Test that values JSON cannot encode fall back to str()."""
+        output_file = tmp_path / "out.jsonl"
+        with JsonlResultWriter(output_file) as writer:
+            writer.write_columns(["value"])
+            writer.write_row([_Opaque()])
+
+        assert json.loads(output_file.read_text()) == {"value": "opaque"}
@@ -0,0 +1,44 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.parse_timespan."""
+
+from datetime import timedelta
+
+import pytest
+
+from agentic_devtools.cli.azure.app_insights_export import parse_timespan
+
+
+class TestParseTimespan:
+    """Tests for parse_timespan function."""
+
+    @pytest.mark.parametrize(
+        "timespan,expected",
+        [
+            ("30m", timedelta(minutes=30)),
+            ("1h", timedelta(hours=1)),
+            ("24h", timedelta(hours=24)),
+            ("7d", timedelta(days=7)),
+            ("90s", timedelta(seconds=90)),
+            ("500ms", timedelta(milliseconds=500)),
+            ("1.5h", timedelta(minutes=90)),
+            (" 2H ", timedelta(hours=2)),
+        ],
+    )
+    def test_parses_supported_units(self, timespan, expected):
+        """Test that each supported suffix is converted to a timedelta."""
+        assert parse_timespan(timespan) == expected
+
+    @pytest.mark.parametrize("timespan", ["", "h", "1w", "abc", "-1h"])
+    def test_rejects_malformed_timespan(self, timespan):
+        """Test that malformed timespans raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid timespan"):
+            parse_timespan(timespan)
+
+    def test_rejects_zero_timespan(self):
+        """Test that a zero timespan raises ValueError."""
+        with pytest.raises(ValueError, match="must be positive"):
+            parse_timespan("0h")
+
+    def test_rejects_none(self):
+        """Test that None is treated as malformed."""
+        with pytest.raises(ValueError):
+            parse_timespan(None)
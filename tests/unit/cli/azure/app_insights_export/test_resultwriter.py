@@ -0,0 +1,50 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.ResultWriter."""
+
+import pytest
+
+from agentic_devtools.cli.azure.app_insights_export import ResultWriter
+
+
+class _RecordingWriter(ResultWriter):
+    """Minimal concrete writer that records rows in the file as repr lines."""
+
+    def _write_row(self, row):
+        self._handle.write(repr(row) + "\n")
+
+
+class TestResultWriter:
+    """Tests for ResultWriter base class."""
+
+    def test_creates_parent_directories(self, tmp_path):
+        """Test that entering the writer creates missing parent directories."""
+        output_file = tmp_path / "nested" / "dir" / "out.txt"
+        with _RecordingWriter(output_file):
+            pass
+        assert output_file.exists()
+
+    def test_counts_rows(self, tmp_path):
+        """Test that rows_written tracks every written row."""
+        with _RecordingWriter(tmp_path / "out.txt") as writer:
+            writer.write_columns(["a"])
+            writer.write_row(("x",))
+            writer.write_row(("y",))
+        assert writer.rows_written == 2
+
+    def test_columns_recorded_once(self, tmp_path):
+        """Test that only the first set of columns is kept."""
+        with _RecordingWriter(tmp_path / "out.txt") as writer:
+            writer.write_columns(["a", "b"])
+            writer.write_columns(["c"])
+        assert writer.columns == ["a", "b"]
+
+    def test_rows_are_materialized_as_lists(self, tmp_path):
+        """Test that row iterables are converted to lists before writing."""
+        output_file = tmp_path / "out.txt"
+        with _RecordingWriter(output_file) as writer:
+            writer.write_row(iter([1, 2]))
+        assert output_file.read_text() == "[1, 2]\n"
+
+    def test_write_row_is_abstract(self, tmp_path):
+        """Test that a writer without _write_row can't be instantiated."""
+        with pytest.raises(TypeError):
+            ResultWriter(tmp_path / "out.txt")
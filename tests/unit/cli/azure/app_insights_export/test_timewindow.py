@@ -0,0 +1,32 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_export.TimeWindow."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+
+
+class TestTimeWindow:
+    """Tests for TimeWindow dataclass."""
+
+    def test_duration(self):
+        """Test that duration is the difference between end and start."""
+        window = TimeWindow(start=datetime(2024, 1, 1, 0, 0), end=datetime(2024, 1, 1, 2, 30))
+        assert window.duration == timedelta(hours=2, minutes=30)
+
+    def test_to_kql_condition_is_half_open(self):
+        """Test that the KQL condition includes start and excludes end."""
+        window = TimeWindow(
+            start=datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc),
+            end=datetime(2024, 1, 1, 1, 0, tzinfo=timezone.utc),
+        )
+        assert window.to_kql_condition() == (
+            "timestamp >= datetime(2024-01-01T00:00:00Z) and timestamp < datetime(2024-01-01T01:00:00Z)"
+        )
+
+    def test_is_frozen(self):
+        """Test that windows are immutable."""
+        window = TimeWindow(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))
+        with pytest.raises(AttributeError):
+            window.start = datetime(2023, 1, 1)
@@ -0,0 +1,60 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner._run_window_attempt."""
+
+from datetime import datetime
+
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+from agentic_devtools.cli.azure.app_insights_planner import WindowQueryError, WindowResult, _run_window_attempt
+
+WINDOW = TimeWindow(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))
+
+
+class TestRunWindowAttempt:
+    """Tests for _run_window_attempt function."""
+
+    def test_records_tables_on_success(self):
+        """Test that a successful attempt stores tables and clears earlier errors."""
+        result = WindowResult(window=WINDOW, error="old", partial=True)
+
+        _run_window_attempt(lambda query, window: ["table"], "q", result)
+
+        assert result.tables == ["table"]
+        assert result.error is None
+        assert result.partial is False
+        assert result.attempts == 1
+
+    def test_records_partial_tables(self):
+        """Test that partial data is kept and flagged."""
+        result = WindowResult(window=WINDOW)
+
+        def run(query, window):
+            raise WindowQueryError("cut off", partial_tables=["partial"])
+
+        _run_window_attempt(run, "q", result)
+
+        assert result.tables == ["partial"]
+        assert result.partial is True
+        assert result.error == "cut off"
+
+    def test_window_error_without_data_keeps_previous_tables(self):
+        """Test that a later failure does not discard earlier partial data."""
+        result = WindowResult(window=WINDOW, tables=["earlier"], partial=True)
+
+        def run(query, window):
+            raise WindowQueryError("timeout")
+
+        _run_window_attempt(run, "q", result)
+
+        assert result.tables == ["earlier"]
+        assert result.error == "timeout"
+
+    def test_records_unexpected_exceptions(self):
+        """Test that arbitrary exceptions are captured as errors."""
+        result = WindowResult(window=WINDOW)
+
+        def run(query, window):
+            raise RuntimeError("socket closed")
+
+        _run_window_attempt(run, "q", result)
+
+        assert result.failed is True
+        assert result.error == "socket closed"
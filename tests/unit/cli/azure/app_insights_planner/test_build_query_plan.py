@@ -0,0 +1,42 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.build_query_plan."""
+
+from datetime import datetime, timedelta, timezone
+
+from agentic_devtools.cli.azure.app_insights_commands import FABRIC_DAP_ERROR_QUERY, FABRIC_DAP_TIMELINE_QUERY
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+from agentic_devtools.cli.azure.app_insights_planner import build_query_plan
+
+END = datetime(2024, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class TestBuildQueryPlan:
+    """Tests for build_query_plan function."""
+
+    def test_one_query_per_window(self):
+        """Test that each window gets its own rendered query."""
+        plan = build_query_plan(
+            FABRIC_DAP_TIMELINE_QUERY, "24h", 500, lambda w: f"q {w.start.hour}", window_count=3, end=END
+        )
+        assert len(plan.windows) == 3
+        assert plan.queries == ["q 0", "q 8", "q 16"]
+        assert plan.limit == 500
+        assert plan.descending is False
+
+    def test_descending_query_orders_newest_window_first(self):
+        """Test that descending queries plan windows from newest to oldest."""
+        plan = build_query_plan(FABRIC_DAP_ERROR_QUERY, "24h", 100, lambda w: "q", window_count=2, end=END)
+        assert plan.descending is True
+        assert plan.windows[0].end == END
+
+    def test_window_count_chosen_from_timespan(self):
+        """Test that the window count defaults to the automatic plan."""
+        plan = build_query_plan(FABRIC_DAP_TIMELINE_QUERY, "8h", 100, lambda w: "q", end=END)
+        assert len(plan.windows) == 2
+
+    def test_explicit_time_range_overrides_timespan(self):
+        """Test that an absolute time range is planned instead of the trailing timespan."""
+        time_range = TimeWindow(start=END - timedelta(hours=2), end=END)
+        plan = build_query_plan(FABRIC_DAP_TIMELINE_QUERY, "24h", 100, lambda w: "q", 2, time_range=time_range)
+        assert plan.windows[0].start == time_range.start
+        assert plan.windows[-1].end == END
+        assert all(w.duration == timedelta(hours=1) for w in plan.windows)
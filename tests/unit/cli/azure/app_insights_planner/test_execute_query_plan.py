@@ -0,0 +1,115 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.execute_query_plan."""
+
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure import app_insights_planner
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+from agentic_devtools.cli.azure.app_insights_planner import QueryPlan, WindowQueryError, execute_query_plan
+
+START = datetime(2024, 1, 1)
+WINDOWS = [TimeWindow(start=START + timedelta(hours=i), end=START + timedelta(hours=i + 1)) for i in range(4)]
+
+
+def _plan():
+    return QueryPlan(windows=WINDOWS, queries=[f"q{i}" for i in range(4)], limit=100)
+
+
+class TestExecuteQueryPlan:
+    """Tests for execute_query_plan function."""
+
+    def test_runs_every_window_once_on_success(self):
+        """Test that each window query runs exactly once when all succeed."""
+        calls = []
+        lock = threading.Lock()
+
+        def run(query, window):
+            with lock:
+                calls.append(query)
+            return [query]
+
+        result = execute_query_plan(_plan(), run, retry_delay_seconds=0)
+
+        assert sorted(calls) == ["q0", "q1", "q2", "q3"]
+        assert [r.tables for r in result.results] == [["q0"], ["q1"], ["q2"], ["q3"]]
+        assert result.failed_windows == []
+        assert result.elapsed_seconds >= 0
+
+    def test_runs_windows_concurrently(self):
+        """Test that windows are in flight at the same time."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def run(query, window):
+            barrier.wait()
+            return []
+
+        result = execute_query_plan(_plan(), run, max_workers=4, retry_delay_seconds=0)
+
+        assert result.failed_windows == []
+
+    def test_retries_only_failed_windows(self):
+        """Test that successful windows are never re-queried."""
+        calls = []
+        lock = threading.Lock()
+
+        def run(query, window):
+            with lock:
+                calls.append(query)
+                attempt = calls.count(query)
+            if query == "q2" and attempt == 1:
+                raise RuntimeError("timeout")
+            return [query]
+
+        with patch.object(app_insights_planner.time, "sleep") as mock_sleep:
+            result = execute_query_plan(_plan(), run, retry_delay_seconds=0.5)
+
+        assert sorted(calls) == ["q0", "q1", "q2", "q2", "q3"]
+        assert result.results[2].attempts == 2
+        assert result.results[2].tables == ["q2"]
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_partial_windows_are_retried(self):
+        """Test that partial results trigger a retry of that window."""
+        attempts = {"n": 0}
+
+        def run(query, window):
+            if query != "q1":
+                return []
+            attempts["n"] += 1
+            if attempts["n"] == 1:
+                raise WindowQueryError("cut", partial_tables=["partial"])
+            return ["full"]
+
+        result = execute_query_plan(_plan(), run, retry_delay_seconds=0)
+
+        assert result.results[1].tables == ["full"]
+        assert result.results[1].partial is False
+
+    def test_gives_up_after_max_retries(self, capsys):
+        """Test that persistently failing windows are reported after the last attempt."""
+
+        def run(query, window):
+            if query == "q3":
+                raise RuntimeError("always down")
+            return []
+
+        result = execute_query_plan(_plan(), run, max_retries=1, retry_delay_seconds=0)
+
+        assert result.results[3].attempts == 2
+        assert result.failed_windows == [result.results[3]]
+        err = capsys.readouterr().err
+        assert "Retrying 1 of 4 time window(s)" in err
+        assert "failed after 2 attempt(s) (no data): always down" in err
+
+    def test_keeps_partial_data_after_retries(self, capsys):
+        """Test that partial data survives when retries are exhausted."""
+
+        def run(query, window):
+            raise WindowQueryError("cut", partial_tables=["partial"])
+
+        result = execute_query_plan(_plan(), run, max_retries=0, retry_delay_seconds=0)
+
+        assert result.failed_windows == []
+        assert len(result.partial_windows) == 4
+        assert "(partial data)" in capsys.readouterr().err
@@ -0,0 +1,39 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.plan_window_count."""
+
+from datetime import timedelta
+
+import pytest
+
+from agentic_devtools.cli.azure.app_insights_planner import MAX_AUTO_WINDOWS, plan_window_count
+
+
+class TestPlanWindowCount:
+    """Tests for plan_window_count function."""
+
+    @pytest.mark.parametrize("timespan", ["30m", "1h", "4h"])
+    def test_short_ranges_use_single_window(self, timespan):
+        """Test that ranges up to the default window span are not split."""
+        assert plan_window_count(timespan) == 1
+
+    def test_long_ranges_use_one_window_per_span(self):
+        """Test that longer ranges get one window per default span, rounded up."""
+        assert plan_window_count("24h") == 6
+        assert plan_window_count("9h") == 3
+
+    def test_auto_count_is_capped(self):
+        """Test that automatic counts never exceed MAX_AUTO_WINDOWS."""
+        assert plan_window_count("7d") == MAX_AUTO_WINDOWS
+
+    def test_explicit_count_wins(self):
+        """Test that an explicit request overrides the automatic choice."""
+        assert plan_window_count("1h", 3) == 3
+        assert plan_window_count("7d", 20) == 20
+
+    def test_explicit_count_is_at_least_one(self):
+        """Test that non-positive explicit counts are clamped to one."""
+        assert plan_window_count("24h", 0) == 1
+
+    def test_accepts_timedelta(self):
+        """Test that a timedelta range is planned like the equivalent timespan."""
+        assert plan_window_count(timedelta(hours=24)) == 6
+        assert plan_window_count(timedelta(minutes=5)) == 1
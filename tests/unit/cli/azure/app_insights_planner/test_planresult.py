@@ -0,0 +1,70 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.PlanResult."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+from agentic_devtools.cli.azure.app_insights_planner import PlanResult, QueryPlan, WindowResult
+
+START = datetime(2024, 1, 1)
+WINDOWS = [TimeWindow(start=START + timedelta(hours=i), end=START + timedelta(hours=i + 1)) for i in range(3)]
+
+
+def _table(rows):
+    table = MagicMock()
+    table.columns = ["timestamp", "message"]
+    table.rows = rows
+    return table
+
+
+def _plan(limit=100):
+    return QueryPlan(windows=WINDOWS, queries=["q"] * 3, limit=limit)
+
+
+class TestPlanResult:
+    """Tests for PlanResult dataclass."""
+
+    def test_merge_concatenates_in_window_order(self):
+        """Test that window rows are concatenated in plan order."""
+        result = PlanResult(
+            plan=_plan(),
+            results=[
+                WindowResult(window=WINDOWS[0], tables=[_table([("t0", "a")])]),
+                WindowResult(window=WINDOWS[1], tables=[]),
+                WindowResult(window=WINDOWS[2], tables=[_table([("t2", "b"), ("t2", "c")])]),
+            ],
+        )
+
+        merged = result.merge()
+
+        assert merged["tables"][0]["columns"] == [
+            {"name": "timestamp", "type": "string"},
+            {"name": "message", "type": "string"},
+        ]
+        assert merged["tables"][0]["rows"] == [["t0", "a"], ["t2", "b"], ["t2", "c"]]
+
+    def test_merge_truncates_to_limit(self):
+        """Test that the merged rows are capped at the plan limit."""
+        result = PlanResult(
+            plan=_plan(limit=2),
+            results=[
+                WindowResult(window=WINDOWS[0], tables=[_table([("t0", "a"), ("t0", "b")])]),
+                WindowResult(window=WINDOWS[1], tables=[_table([("t1", "c")])]),
+            ],
+        )
+        assert result.merge()["tables"][0]["rows"] == [["t0", "a"], ["t0", "b"]]
+
+    def test_merge_without_tables(self):
+        """Test that no data merges to an empty table list."""
+        result = PlanResult(plan=_plan(), results=[WindowResult(window=WINDOWS[0], tables=[])])
+        assert result.merge() == {"tables": []}
+
+    def test_failed_and_partial_windows(self):
+        """Test that failed and partial windows are reported separately."""
+        failed = WindowResult(window=WINDOWS[0], error="boom")
+        partial = WindowResult(window=WINDOWS[1], tables=[], partial=True, error="cut")
+        ok = WindowResult(window=WINDOWS[2], tables=[])
+        result = PlanResult(plan=_plan(), results=[failed, partial, ok])
+
+        assert result.failed_windows == [failed]
+        assert result.partial_windows == [partial]
@@ -0,0 +1,17 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.QueryPlan."""
+
+from datetime import datetime
+
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+from agentic_devtools.cli.azure.app_insights_planner import QueryPlan
+
+
+class TestQueryPlan:
+    """Tests for QueryPlan dataclass."""
+
+    def test_defaults_to_ascending(self):
+        """Test that plans are ascending unless stated otherwise."""
+        window = TimeWindow(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))
+        plan = QueryPlan(windows=[window], queries=["q"], limit=10)
+        assert plan.descending is False
+        assert plan.limit == 10
@@ -0,0 +1,43 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.split_time_windows."""
+
+from datetime import datetime, timedelta, timezone
+
+from agentic_devtools.cli.azure.app_insights_planner import split_time_windows
+
+END = datetime(2024, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class TestSplitTimeWindows:
+    """Tests for split_time_windows function."""
+
+    def test_splits_into_equal_windows(self):
+        """Test that the range is split into count equal, contiguous windows."""
+        windows = split_time_windows("24h", 4, end=END)
+
+        assert len(windows) == 4
+        assert windows[0].start == END - timedelta(hours=24)
+        assert windows[-1].end == END
+        assert all(w.duration == timedelta(hours=6) for w in windows)
+        for previous, current in zip(windows, windows[1:]):
+            assert previous.end == current.start
+
+    def test_last_window_ends_exactly_at_range_end(self):
+        """Test that rounding never leaves a gap at the end of the range."""
+        windows = split_time_windows("1h", 7, end=END)
+        assert windows[-1].end == END
+
+    def test_count_below_one_yields_single_window(self):
+        """Test that non-positive counts fall back to one window."""
+        assert len(split_time_windows("1h", 0, end=END)) == 1
+
+    def test_newest_first(self):
+        """Test that newest_first returns the most recent window first."""
+        windows = split_time_windows("2h", 2, end=END, newest_first=True)
+        assert windows[0].end == END
+        assert windows[1].end == END - timedelta(hours=1)
+
+    def test_defaults_end_to_now(self):
+        """Test that the range ends at the current time when end is omitted."""
+        before = datetime.now(timezone.utc)
+        windows = split_time_windows("1h", 2)
+        assert windows[-1].end >= before
@@ -0,0 +1,28 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.split_window."""
+
+from datetime import datetime, timedelta
+
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+from agentic_devtools.cli.azure.app_insights_planner import split_window
+
+RANGE = TimeWindow(start=datetime(2024, 1, 1, 0, 0), end=datetime(2024, 1, 1, 6, 0))
+
+
+class TestSplitWindow:
+    """Tests for split_window function."""
+
+    def test_splits_absolute_range(self):
+        """Test that an absolute range is split into equal contiguous windows."""
+        windows = split_window(RANGE, 3)
+        assert [w.start.hour for w in windows] == [0, 2, 4]
+        assert windows[-1].end == RANGE.end
+        assert all(w.duration == timedelta(hours=2) for w in windows)
+
+    def test_newest_first(self):
+        """Test that newest_first reverses the window order."""
+        windows = split_window(RANGE, 2, newest_first=True)
+        assert windows[0].end == RANGE.end
+
+    def test_count_below_one(self):
+        """Test that non-positive counts yield the whole range."""
+        assert split_window(RANGE, 0) == [RANGE]
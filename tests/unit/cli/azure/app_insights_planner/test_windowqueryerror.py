@@ -0,0 +1,17 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.WindowQueryError."""
+
+from agentic_devtools.cli.azure.app_insights_planner import WindowQueryError
+
+
+class TestWindowQueryError:
+    """Tests for WindowQueryError exception."""
+
+    def test_carries_message_and_partial_tables(self):
+        """Test that the message and partial tables are preserved."""
+        error = WindowQueryError("partial", partial_tables=["t"])
+        assert str(error) == "partial"
+        assert error.partial_tables == ["t"]
+
+    def test_partial_tables_default_to_none(self):
+        """Test that plain failures carry no partial data."""
+        assert WindowQueryError("boom").partial_tables is None
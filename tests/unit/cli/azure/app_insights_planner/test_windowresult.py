@@ -0,0 +1,20 @@
+"""Tests for agentic_devtools.cli.azure.app_insights_planner.WindowResult."""
+
+from datetime import datetime
+
+from agentic_devtools.cli.azure.app_insights_export import TimeWindow
+from agentic_devtools.cli.azure.app_insights_planner import WindowResult
+
+WINDOW = TimeWindow(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))
+
+
+class TestWindowResult:
+    """Tests for WindowResult dataclass."""
+
+    def test_failed_without_tables(self):
+        """Test that a window without data is failed."""
+        assert WindowResult(window=WINDOW).failed is True
+
+    def test_not_failed_with_empty_tables(self):
+        """Test that an empty table list still counts as a successful window."""
+        assert WindowResult(window=WINDOW, tables=[]).failed is False
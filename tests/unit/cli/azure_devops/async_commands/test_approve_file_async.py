@@ -1,7 +1,7 @@
 """Tests for approve_file_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import approve_file_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestApproveFileAsync:
@@ -14,8 +14,8 @@ class TestApproveFileAsync:
         approve_file_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.file_review_commands", "approve_file")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.file_review_commands", "approve_file")
 
     def test_accepts_summary_parameter(self, mock_background_and_state, capsys):
         approve_file_async(
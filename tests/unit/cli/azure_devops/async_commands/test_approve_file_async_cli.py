@@ -4,7 +4,7 @@ import sys
 from unittest.mock import patch
 
 from agentic_devtools.cli.azure_devops.async_commands import approve_file_async_cli
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestApproveFileAsyncCli:
@@ -47,9 +47,9 @@ class TestApproveFileAsyncCli:
         ):
             approve_file_async_cli()
 
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(
-            script,
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(
+            handoff,
             "agentic_devtools.cli.azure_devops.file_review_commands",
             "approve_file",
         )
@@ -0,0 +1,57 @@
+"""Tests for approve_files_async function."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.azure_devops.async_commands import approve_files_async
+from agentic_devtools.state import get_value, set_value
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
+
+_FILE_REVIEW = "agentic_devtools.cli.azure_devops.file_review_commands"
+_LOAD_REVIEW_STATE = "agentic_devtools.cli.azure_devops.review_state.load_review_state"
+
+
+class TestApproveFilesAsync:
+    """Tests for approve_files_async function."""
+
+    def test_spawns_background_task(self, mock_background_and_state, capsys):
+        """Should spawn approve_files in the background using values from state."""
+        set_value("pull_request_id", 12345)
+        set_value("file_review.file_paths", "src/gen/*")
+        set_value("file_review.summary", "Generated code.")
+
+        approve_files_async()
+
+        assert "Background task started" in capsys.readouterr().out
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, _FILE_REVIEW, "approve_files")
+
+    def test_stores_parameters_in_state(self, mock_background_and_state):
+        """Should store the given paths, summary and PR ID in state."""
+        approve_files_async(file_paths=("src/a.py", "src/gen/*"), summary="LGTM", pull_request_id=99999)
+
+        assert get_value("file_review.file_paths") == ["src/a.py", "src/gen/*"]
+        assert get_value("file_review.summary") == "LGTM"
+        assert get_value("pull_request_id") == 99999
+
+    def test_marks_matched_files_submission_pending(self, mock_background_and_state):
+        """Should mark every file matched by the patterns as submission-pending in one call."""
+        review_state = MagicMock(files={"/src/gen/a.py": None, "/src/gen/b.py": None, "/src/app.py": None})
+        with patch(_LOAD_REVIEW_STATE, return_value=review_state):
+            with patch(f"{_FILE_REVIEW}.mark_files_as_submission_pending") as mock_mark:
+                with patch(f"{_FILE_REVIEW}.print_next_file_prompt") as mock_prompt:
+                    approve_files_async(file_paths=["src/gen/*"], summary="Generated code.", pull_request_id=42)
+
+        mock_mark.assert_called_once()
+        pr_id, paths, _task_id, outcome = mock_mark.call_args.args
+        assert (pr_id, paths, outcome) == (42, ["/src/gen/a.py", "/src/gen/b.py"], "Approve")
+        mock_prompt.assert_called_once_with(42)
+
+    def test_skips_queue_update_without_review_state(self, mock_background_and_state):
+        """Should still show the next prompt when review-state.json doesn't exist."""
+        with patch(_LOAD_REVIEW_STATE, side_effect=FileNotFoundError("missing")):
+            with patch(f"{_FILE_REVIEW}.mark_files_as_submission_pending") as mock_mark:
+                with patch(f"{_FILE_REVIEW}.print_next_file_prompt") as mock_prompt:
+                    approve_files_async(file_paths=["src/gen/*"], summary="Generated code.", pull_request_id=42)
+
+        mock_mark.assert_not_called()
+        mock_prompt.assert_called_once_with(42)
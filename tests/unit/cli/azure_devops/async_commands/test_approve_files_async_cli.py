@@ -0,0 +1,35 @@
+"""Tests for approve_files_async_cli function."""
+
+import sys
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure_devops.async_commands import approve_files_async_cli
+from agentic_devtools.state import get_value
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
+
+
+class TestApproveFilesAsyncCli:
+    """Tests for approve_files_async_cli function."""
+
+    def test_spawns_correct_function(self, mock_background_and_state, capsys):
+        """Should spawn approve_files with every path given on the command line."""
+        with patch.object(
+            sys,
+            "argv",
+            [
+                "agdt-approve-files",
+                "--pull-request-id",
+                "12345",
+                "--file-paths",
+                "src/gen/*",
+                "package-lock.json",
+                "--summary",
+                "Generated code.",
+            ],
+        ):
+            approve_files_async_cli()
+
+        assert "Background task started" in capsys.readouterr().out
+        assert get_value("file_review.file_paths") == ["src/gen/*", "package-lock.json"]
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.file_review_commands", "approve_files")
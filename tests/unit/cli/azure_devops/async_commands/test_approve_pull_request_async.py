@@ -1,7 +1,7 @@
 """Tests for approve_pull_request_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import approve_pull_request_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestApprovePullRequestAsync:
@@ -12,5 +12,5 @@ class TestApprovePullRequestAsync:
         approve_pull_request_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "approve_pull_request")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "approve_pull_request")
@@ -1,7 +1,7 @@
 """Tests for create_pull_request_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import create_pull_request_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestCreatePullRequestAsync:
@@ -13,8 +13,8 @@ class TestCreatePullRequestAsync:
         create_pull_request_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "create_pull_request")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "create_pull_request")
 
     def test_accepts_cli_parameters(self, mock_background_and_state, capsys):
         create_pull_request_async(
@@ -1,7 +1,7 @@
 """Tests for get_pull_request_threads_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import get_pull_request_threads_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestGetPullRequestThreadsAsync:
@@ -12,5 +12,5 @@ class TestGetPullRequestThreadsAsync:
         get_pull_request_threads_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "get_pull_request_threads")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "get_pull_request_threads")
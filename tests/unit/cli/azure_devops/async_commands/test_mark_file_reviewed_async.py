@@ -1,7 +1,7 @@
 """Tests for mark_file_reviewed_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import mark_file_reviewed_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestMarkFileReviewedAsync:
@@ -9,5 +9,5 @@ class TestMarkFileReviewedAsync:
         mark_file_reviewed_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.mark_reviewed", "mark_file_reviewed_cli")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.mark_reviewed", "mark_file_reviewed_cli")
@@ -1,7 +1,7 @@
 """Tests for mark_pull_request_draft_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import mark_pull_request_draft_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestMarkPullRequestDraftAsync:
@@ -9,5 +9,5 @@ class TestMarkPullRequestDraftAsync:
         mark_pull_request_draft_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "mark_pull_request_draft")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "mark_pull_request_draft")
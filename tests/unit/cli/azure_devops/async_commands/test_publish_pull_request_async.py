@@ -1,7 +1,7 @@
 """Tests for publish_pull_request_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import publish_pull_request_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestPublishPullRequestAsync:
@@ -9,5 +9,5 @@ class TestPublishPullRequestAsync:
         publish_pull_request_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "publish_pull_request")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "publish_pull_request")
@@ -1,7 +1,7 @@
 """Tests for reject_suggestion_resolution_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import reject_suggestion_resolution_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestRejectSuggestionResolutionAsync:
@@ -14,9 +14,9 @@ class TestRejectSuggestionResolutionAsync:
         reject_suggestion_resolution_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(
-            script, "agentic_devtools.cli.azure_devops.suggestion_commands", "reject_suggestion_resolution"
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(
+            handoff, "agentic_devtools.cli.azure_devops.suggestion_commands", "reject_suggestion_resolution"
         )
 
     def test_cli_args_override_state(self, mock_background_and_state, capsys):
@@ -3,7 +3,7 @@
 import json
 
 from agentic_devtools.cli.azure_devops.async_commands import request_changes_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 _SUGGESTIONS = json.dumps([{"line": 42, "severity": "high", "content": "Missing null check"}])
 
@@ -19,8 +19,8 @@ class TestRequestChangesAsync:
         request_changes_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.file_review_commands", "request_changes")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.file_review_commands", "request_changes")
 
     def test_accepts_cli_parameters(self, mock_background_and_state, capsys):
         request_changes_async(
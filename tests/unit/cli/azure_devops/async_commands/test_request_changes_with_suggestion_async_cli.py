@@ -5,7 +5,7 @@ import sys
 from unittest.mock import patch
 
 from agentic_devtools.cli.azure_devops.async_commands import request_changes_with_suggestion_async_cli
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 _SUGGESTIONS = json.dumps(
     [{"line": 42, "severity": "high", "content": "Use null-conditional", "replacement_code": "var x = y?.Z;"}]
@@ -56,9 +56,9 @@ class TestRequestChangesWithSuggestionAsyncCli:
         ):
             request_changes_with_suggestion_async_cli()
 
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(
-            script,
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(
+            handoff,
             "agentic_devtools.cli.azure_devops.file_review_commands",
             "request_changes_with_suggestion",
         )
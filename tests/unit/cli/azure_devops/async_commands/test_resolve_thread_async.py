@@ -1,7 +1,7 @@
 """Tests for resolve_thread_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import resolve_thread_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestResolveThreadAsync:
@@ -13,5 +13,5 @@ class TestResolveThreadAsync:
         resolve_thread_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.azure_devops.commands", "resolve_thread")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.azure_devops.commands", "resolve_thread")
@@ -1,7 +1,7 @@
 """Tests for run_e2e_tests_fabric_async function."""
 
 from agentic_devtools.cli.azure_devops.async_commands import run_e2e_tests_fabric_async
-from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.azure_devops.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestRunE2ETestsFabricAsync:
@@ -9,9 +9,9 @@ class TestRunE2ETestsFabricAsync:
         run_e2e_tests_fabric_async()
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(
-            script,
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(
+            handoff,
             "agentic_devtools.cli.azure_devops.pipeline_commands",
             "run_e2e_tests_fabric",
         )
@@ -0,0 +1,91 @@
+"""Tests for _close_approved_file_threads function."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.azure_devops.file_review_commands import _close_approved_file_threads
+from agentic_devtools.cli.azure_devops.review_state import (
+    FileEntry,
+    FolderGroup,
+    OverallSummary,
+    ReviewState,
+)
+
+_BASE_URL = "https://dev.azure.com/org/proj/_git/repo/pullRequest/42"
+_PATHS = ["/src/a.py", "/src/b.py"]
+
+
+def _make_review_state() -> ReviewState:
+    """Build a ReviewState with two approved files."""
+    return ReviewState(
+        prId=42,
+        repoId="repo-guid",
+        repoName="repo",
+        project="proj",
+        organization="https://dev.azure.com/org",
+        latestIterationId=1,
+        scaffoldedUtc="2026-01-01T00:00:00Z",
+        overallSummary=OverallSummary(threadId=1, commentId=2),
+        folders={"src": FolderGroup(files=["/src/a.py", "/src/b.py"])},
+        files={
+            "/src/a.py": FileEntry(threadId=10, commentId=20, folder="src", fileName="a.py", status="approved"),
+            "/src/b.py": FileEntry(threadId=11, commentId=21, folder="src", fileName="b.py", status="approved"),
+        },
+    )
+
+
+class TestCloseApprovedFileThreads:
+    """Tests for _close_approved_file_threads function."""
+
+    def test_patches_comment_and_closes_thread_per_file(self):
+        """Should PATCH each file's summary comment and close its thread over one pooled session."""
+        requests_module = MagicMock()
+        session = requests_module.Session.return_value
+
+        with patch("agentic_devtools.cli.azure_devops.file_review_commands.patch_comment") as mock_comment:
+            with patch("agentic_devtools.cli.azure_devops.file_review_commands.patch_thread_status") as mock_status:
+                errors = _close_approved_file_threads(
+                    requests_module,
+                    {},
+                    MagicMock(),
+                    "repo-guid",
+                    42,
+                    _make_review_state(),
+                    ["/src/a.py", "/src/b.py"],
+                    _BASE_URL,
+                )
+
+        assert errors == {}
+        assert sorted(c.kwargs["comment_id"] for c in mock_comment.call_args_list) == [20, 21]
+        assert all(c.kwargs["requests_module"] is session for c in mock_comment.call_args_list)
+        assert all("Approved" in c.kwargs["new_content"] for c in mock_comment.call_args_list)
+        assert sorted(c.kwargs["thread_id"] for c in mock_status.call_args_list) == [10, 11]
+        assert {c.kwargs["status"] for c in mock_status.call_args_list} == {"closed"}
+        session.close.assert_called_once()
+
+    def test_collects_errors_per_file(self):
+        """Should return the error of a failed file and still close the others."""
+
+        def _fail_for_a(**kwargs):
+            if kwargs["thread_id"] == 10:
+                raise RuntimeError("boom")
+
+        with patch(
+            "agentic_devtools.cli.azure_devops.file_review_commands.patch_comment",
+            side_effect=_fail_for_a,
+        ):
+            with patch("agentic_devtools.cli.azure_devops.file_review_commands.patch_thread_status") as mock_status:
+                errors = _close_approved_file_threads(
+                    MagicMock(),
+                    {},
+                    MagicMock(),
+                    "repo-guid",
+                    42,
+                    _make_review_state(),
+                    ["/src/a.py", "/src/b.py"],
+                    _BASE_URL,
+                )
+
+        assert list(errors) == ["/src/a.py"]
+        assert str(errors["/src/a.py"]) == "boom"
+        mock_status.assert_called_once()
+        assert mock_status.call_args.kwargs["thread_id"] == 11
@@ -0,0 +1,85 @@
+"""Tests for _resolve_file_threads function."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.config import AzureDevOpsConfig
+from agentic_devtools.cli.azure_devops.file_review_commands import _resolve_file_threads
+from agentic_devtools.cli.azure_devops.thread_status import ThreadIndex, get_thread_index_path, save_thread_index
+
+_CONFIG = AzureDevOpsConfig(organization="https://dev.azure.com/org", project="proj", repository="repo")
+
+
+def _threads():
+    return [
+        {"id": 1, "status": "active", "threadContext": {"filePath": "/src/app.ts"}},
+        {"id": 2, "status": "pending", "threadContext": {"filePath": "/src/app.ts"}},
+        {"id": 3, "status": "active", "threadContext": {"filePath": "/src/other.ts"}},
+    ]
+
+
+@pytest.fixture
+def requests_mock(tmp_path):
+    """Requests mock whose pooled session is itself, with the thread index cached in a temp dir."""
+    mock = MagicMock()
+    mock.Session.return_value = mock
+    with patch("agentic_devtools.cli.azure_devops.thread_status.get_state_dir", return_value=tmp_path):
+        yield mock
+
+
+def _response(status_code=200, threads=None, etag=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"ETag": etag} if etag else {}
+    response.json.return_value = {"value": threads or []}
+    return response
+
+
+class TestResolveFileThreads:
+    """Tests for _resolve_file_threads function."""
+
+    def test_reuses_cached_index_and_records_closed_threads(self, requests_mock):
+        """A 304 reuses the cached threads, and closed threads are saved back to the cache."""
+        save_thread_index(42, ThreadIndex(_threads(), etag='"v1"'))
+        requests_mock.get.return_value = _response(status_code=304)
+        requests_mock.patch.return_value = _response()
+
+        resolved = _resolve_file_threads(requests_mock, {}, _CONFIG, "repo-id", 42, "src/app.ts")
+
+        assert resolved == 2
+        assert requests_mock.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert requests_mock.patch.call_count == 2
+        cached = ThreadIndex.from_dict(json.loads(get_thread_index_path(42).read_text(encoding="utf-8")))
+        assert cached.for_file("/src/app.ts") == []
+        requests_mock.close.assert_called_once()
+
+    def test_reports_failed_threads(self, requests_mock, capsys):
+        """Threads whose PATCH failed are reported and not counted."""
+        requests_mock.get.return_value = _response(threads=_threads())
+
+        def patch_thread(url, **kwargs):
+            response = _response()
+            if "/threads/2?" in url:
+                response.raise_for_status.side_effect = RuntimeError("boom")
+            return response
+
+        requests_mock.patch.side_effect = patch_thread
+
+        resolved = _resolve_file_threads(requests_mock, {}, _CONFIG, "repo-id", 42, "/src/app.ts")
+
+        assert resolved == 1
+        captured = capsys.readouterr()
+        assert "Failed to resolve thread 2: boom" in captured.err
+        assert "Comment threads for '/src/app.ts' resolved." in captured.out
+
+    def test_dry_run_lists_threads_without_patching(self, requests_mock, capsys):
+        """Dry run prints the threads it would resolve and makes no PATCH."""
+        requests_mock.get.return_value = _response(threads=_threads())
+
+        resolved = _resolve_file_threads(requests_mock, {}, _CONFIG, "repo-id", 42, "/src/app.ts", dry_run=True)
+
+        assert resolved == 2
+        assert "DRY-RUN: Would resolve thread 2 for /src/app.ts" in capsys.readouterr().out
+        requests_mock.patch.assert_not_called()
@@ -0,0 +1,58 @@
+"""Tests for _update_queue_after_reviews function."""
+
+import json
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure_devops.file_review_commands import _update_queue_after_reviews
+
+
+def _write_queue(tmp_path):
+    """Write a queue with three pending files."""
+    queue_file = tmp_path / "queue.json"
+    queue_file.write_text(
+        json.dumps(
+            {
+                "pending": [
+                    {"path": "/src/a.py", "status": "submission-pending", "taskId": "t1"},
+                    {"path": "/src/b.py", "status": "pending"},
+                    {"path": "/src/c.py", "status": "pending"},
+                ],
+                "completed": [],
+            }
+        )
+    )
+    return queue_file
+
+
+class TestUpdateQueueAfterReviews:
+    """Tests for _update_queue_after_reviews function."""
+
+    def test_completes_all_files_in_one_update(self, tmp_path):
+        """Should move every reviewed file to completed and return the new counts."""
+        queue_file = _write_queue(tmp_path)
+
+        with patch(
+            "agentic_devtools.cli.azure_devops.file_review_commands._get_queue_path",
+            return_value=queue_file,
+        ):
+            counts = _update_queue_after_reviews(42, ["/src/a.py", "/src/c.py"], "Approve")
+
+        assert counts == (1, 2)
+        data = json.loads(queue_file.read_text())
+        assert [e["path"] for e in data["completed"]] == ["/src/a.py", "/src/c.py"]
+        assert all(e["outcome"] == "Approve" for e in data["completed"])
+
+    def test_dry_run_leaves_queue_untouched(self, tmp_path, capsys):
+        """Should only report the moves in dry-run mode."""
+        queue_file = _write_queue(tmp_path)
+        before = queue_file.read_text()
+
+        with patch(
+            "agentic_devtools.cli.azure_devops.file_review_commands._get_queue_path",
+            return_value=queue_file,
+        ):
+            counts = _update_queue_after_reviews(42, ["/src/a.py", "/src/b.py"], "Approve", dry_run=True)
+
+        assert counts == (1, 2)
+        assert queue_file.read_text() == before
+        assert capsys.readouterr().out.count("DRY-RUN: Would move") == 2
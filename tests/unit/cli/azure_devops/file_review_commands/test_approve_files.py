@@ -0,0 +1,201 @@
+"""Tests for approve_files function."""
+
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.file_review_commands import approve_files
+from agentic_devtools.cli.azure_devops.review_state import (
+    FileEntry,
+    FolderGroup,
+    OverallSummary,
+    ReviewState,
+    ReviewStatus,
+    SuggestionEntry,
+)
+from agentic_devtools.state import set_value
+
+_BASE_URL = "https://dev.azure.com/org/proj/_git/repo/pullRequest/42"
+_MODULE = "agentic_devtools.cli.azure_devops.file_review_commands"
+
+
+def _make_review_state() -> ReviewState:
+    """Build a ReviewState with two generated files and one source file."""
+    paths = ["/src/gen/a.py", "/src/gen/b.py", "/src/app.py"]
+    return ReviewState(
+        prId=42,
+        repoId="repo-guid",
+        repoName="repo",
+        project="proj",
+        organization="https://dev.azure.com/org",
+        latestIterationId=1,
+        scaffoldedUtc="2026-01-01T00:00:00Z",
+        overallSummary=OverallSummary(threadId=1, commentId=2),
+        folders={"src": FolderGroup(files=paths)},
+        files={
+            path: FileEntry(threadId=10 + i, commentId=20 + i, folder="src", fileName=path.rsplit("/", 1)[-1])
+            for i, path in enumerate(paths)
+        },
+    )
+
+
+@pytest.fixture
+def approve_env(temp_state_dir):
+    """State for PR 42 plus mocks for every API-facing call approve_files makes."""
+    set_value("pull_request_id", 42)
+    set_value("file_review.file_paths", ["src/gen/*"])
+    set_value("file_review.summary", "Generated code.")
+    review_state = _make_review_state()
+
+    with ExitStack() as stack:
+        stack.enter_context(patch(f"{_MODULE}.AzureDevOpsConfig"))
+        stack.enter_context(patch(f"{_MODULE}.require_requests", return_value=MagicMock()))
+        stack.enter_context(patch(f"{_MODULE}.get_pat", return_value="pat"))
+        stack.enter_context(patch(f"{_MODULE}.get_auth_headers", return_value={}))
+        stack.enter_context(
+            patch("agentic_devtools.cli.azure_devops.review_scaffold._build_pr_base_url", return_value=_BASE_URL)
+        )
+        stack.enter_context(
+            patch("agentic_devtools.cli.azure_devops.review_state.load_review_state", return_value=review_state)
+        )
+        mocks = {
+            "state": review_state,
+            "save": stack.enter_context(patch("agentic_devtools.cli.azure_devops.review_state.save_review_state")),
+            "close": stack.enter_context(patch(f"{_MODULE}._close_approved_file_threads", return_value={})),
+            "mark": stack.enter_context(patch(f"{_MODULE}.mark_files_reviewed")),
+            "cascade": stack.enter_context(
+                patch("agentic_devtools.cli.azure_devops.status_cascade.cascade_status_update", return_value=[])
+            ),
+            "execute": stack.enter_context(patch("agentic_devtools.cli.azure_devops.status_cascade.execute_cascade")),
+            "queue": stack.enter_context(patch(f"{_MODULE}._update_queue_after_reviews", return_value=(1, 2))),
+            "continue": stack.enter_context(patch(f"{_MODULE}._trigger_workflow_continuation")),
+        }
+        yield mocks
+
+
+class TestApproveFiles:
+    """Tests for approve_files function."""
+
+    def test_approves_matched_files_with_one_cascade(self, approve_env):
+        """Should approve every matched file, then mark, cascade, save and update the queue once."""
+        approve_files()
+
+        state = approve_env["state"]
+        expected = ["/src/gen/a.py", "/src/gen/b.py"]
+        assert [state.files[p].status for p in expected] == [ReviewStatus.APPROVED.value] * 2
+        assert state.files["/src/gen/a.py"].summary == "Generated code."
+        assert state.files["/src/app.py"].status == ReviewStatus.UNREVIEWED.value
+        assert approve_env["close"].call_args.args[6] == expected
+        approve_env["mark"].assert_called_once()
+        assert approve_env["mark"].call_args.args[0] == expected
+        approve_env["cascade"].assert_called_once_with(state, "/src/gen/b.py", _BASE_URL)
+        approve_env["execute"].assert_called_once()
+        approve_env["save"].assert_called_once_with(state)
+        approve_env["queue"].assert_called_once_with(42, expected, "Approve")
+        approve_env["continue"].assert_called_once_with(42, 1, 2)
+
+    def test_rotates_suggestions_on_re_review(self, approve_env):
+        """Should move a needs-work file's suggestions to previousSuggestions before approving."""
+        entry = approve_env["state"].files["/src/gen/a.py"]
+        entry.status = ReviewStatus.NEEDS_WORK.value
+        entry.suggestions.append(
+            SuggestionEntry(
+                threadId=99, commentId=1, line=1, endLine=1, severity="low", outOfScope=False, linkText="l", content="c"
+            )
+        )
+
+        approve_files()
+
+        assert entry.suggestions == []
+        assert [s.threadId for s in entry.previousSuggestions] == [99]
+
+    def test_failed_file_keeps_previous_state_and_exits(self, approve_env, capsys):
+        """Should restore a file whose PATCHes failed, approve the rest and exit with an error."""
+        approve_env["close"].return_value = {"/src/gen/a.py": RuntimeError("boom")}
+
+        with pytest.raises(SystemExit) as exc_info:
+            approve_files()
+
+        assert exc_info.value.code == 1
+        state = approve_env["state"]
+        assert state.files["/src/gen/a.py"].status == ReviewStatus.UNREVIEWED.value
+        assert state.files["/src/gen/b.py"].status == ReviewStatus.APPROVED.value
+        approve_env["queue"].assert_called_once_with(42, ["/src/gen/b.py"], "Approve")
+        approve_env["save"].assert_called_once_with(state)
+        approve_env["continue"].assert_not_called()
+        assert "Failed to approve '/src/gen/a.py': boom" in capsys.readouterr().err
+
+    def test_all_failed_skips_mark_and_cascade(self, approve_env):
+        """Should neither mark reviewed nor cascade when no file could be approved."""
+        approve_env["close"].return_value = {
+            "/src/gen/a.py": RuntimeError("boom"),
+            "/src/gen/b.py": RuntimeError("boom"),
+        }
+
+        with pytest.raises(SystemExit):
+            approve_files()
+
+        approve_env["mark"].assert_not_called()
+        approve_env["cascade"].assert_not_called()
+        approve_env["save"].assert_called_once()
+
+    def test_saves_state_when_cascade_fails(self, approve_env):
+        """Should persist review state even if the cascade raises."""
+        approve_env["execute"].side_effect = RuntimeError("cascade API error")
+
+        with pytest.raises(RuntimeError, match="cascade API error"):
+            approve_files()
+
+        approve_env["save"].assert_called_once_with(approve_env["state"])
+
+    def test_dry_run_only_lists_files(self, approve_env, capsys):
+        """Should list the matched files without calling any API in dry-run mode."""
+        set_value("dry_run", True)
+
+        approve_files()
+
+        out = capsys.readouterr().out
+        assert "DRY-RUN: Would approve 2 file(s) on PR 42" in out
+        assert "/src/gen/b.py" in out
+        approve_env["close"].assert_not_called()
+        approve_env["save"].assert_not_called()
+
+    def test_unmatched_pattern_exits(self, approve_env, capsys):
+        """Should exit with an error naming patterns that match no file."""
+        set_value("file_review.file_paths", "src/gen/*, docs/*")
+
+        with pytest.raises(SystemExit):
+            approve_files()
+
+        assert "docs/*" in capsys.readouterr().err
+        approve_env["close"].assert_not_called()
+
+    def test_requires_file_paths(self, approve_env, capsys):
+        """Should exit with an error when no file paths are set."""
+        set_value("file_review.file_paths", "")
+
+        with pytest.raises(SystemExit):
+            approve_files()
+
+        assert "file_review.file_paths" in capsys.readouterr().err
+
+    def test_requires_summary(self, approve_env, capsys):
+        """Should exit with an error when no summary is set."""
+        set_value("file_review.summary", "")
+
+        with pytest.raises(SystemExit):
+            approve_files()
+
+        assert "file_review.summary" in capsys.readouterr().err
+
+    def test_requires_review_state(self, approve_env, capsys):
+        """Should exit with an error pointing to agdt-approve-file when review-state.json is missing."""
+        with patch(
+            "agentic_devtools.cli.azure_devops.review_state.load_review_state",
+            side_effect=FileNotFoundError("missing"),
+        ):
+            with pytest.raises(SystemExit):
+                approve_files()
+
+        assert "agdt-approve-file" in capsys.readouterr().err
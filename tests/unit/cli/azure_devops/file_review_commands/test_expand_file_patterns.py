@@ -0,0 +1,35 @@
+"""Tests for expand_file_patterns function."""
+
+from agentic_devtools.cli.azure_devops.file_review_commands import expand_file_patterns
+
+_KNOWN = ["/src/gen/b.py", "/src/gen/a.py", "/src/App.py", "/package-lock.json"]
+
+
+class TestExpandFilePatterns:
+    """Tests for expand_file_patterns function."""
+
+    def test_literal_paths_match_case_insensitively(self):
+        """Should resolve literal paths, with or without leading slash, to their state keys."""
+        matched, unmatched = expand_file_patterns(["src/app.py", "/package-lock.json"], _KNOWN)
+
+        assert matched == ["/src/App.py", "/package-lock.json"]
+        assert unmatched == []
+
+    def test_glob_expands_in_sorted_order(self):
+        """Should expand a glob to every matching file in path order."""
+        matched, _ = expand_file_patterns(["src/gen/*"], _KNOWN)
+
+        assert matched == ["/src/gen/a.py", "/src/gen/b.py"]
+
+    def test_deduplicates_overlapping_patterns(self):
+        """Should list a file matched by several patterns once."""
+        matched, _ = expand_file_patterns(["src/gen/a.py", "src/gen/*"], _KNOWN)
+
+        assert matched == ["/src/gen/a.py", "/src/gen/b.py"]
+
+    def test_reports_unmatched_patterns(self):
+        """Should report literal paths and globs that match no file."""
+        matched, unmatched = expand_file_patterns(["src/missing.py", "docs/*", "src/gen/a.py"], _KNOWN)
+
+        assert matched == ["/src/gen/a.py"]
+        assert unmatched == ["src/missing.py", "docs/*"]
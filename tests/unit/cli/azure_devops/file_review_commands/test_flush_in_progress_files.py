@@ -0,0 +1,151 @@
+"""Tests for flush_in_progress_files function."""
+
+from contextlib import ExitStack, contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.file_review_commands import flush_in_progress_files
+from agentic_devtools.cli.azure_devops.review_state import (
+    FileEntry,
+    FolderGroup,
+    OverallSummary,
+    ReviewState,
+    ReviewStatus,
+)
+
+_BASE_URL = "https://dev.azure.com/org/proj/_git/repo/pullRequest/42"
+
+
+def _make_review_state(statuses: dict) -> ReviewState:
+    """Build a ReviewState with one file per path in ``statuses`` under the src folder."""
+    return ReviewState(
+        prId=42,
+        repoId="repo-guid",
+        repoName="repo",
+        project="proj",
+        organization="https://dev.azure.com/org",
+        latestIterationId=1,
+        scaffoldedUtc="2026-01-01T00:00:00Z",
+        overallSummary=OverallSummary(threadId=1, commentId=2),
+        folders={"src": FolderGroup(files=list(statuses))},
+        files={
+            path: FileEntry(
+                threadId=10 + i,
+                commentId=20 + i,
+                folder="src",
+                fileName=path.rsplit("/", 1)[-1],
+                status=status,
+            )
+            for i, (path, status) in enumerate(statuses.items())
+        },
+    )
+
+
+@pytest.fixture()
+def api_mocks():
+    """Set up API-layer mocks needed for the non-dry-run path."""
+    with ExitStack() as stack:
+        MockConfig = stack.enter_context(
+            patch("agentic_devtools.cli.azure_devops.file_review_commands.AzureDevOpsConfig")
+        )
+        MockConfig.from_state.return_value = MagicMock()
+        stack.enter_context(
+            patch("agentic_devtools.cli.azure_devops.review_scaffold._build_pr_base_url", return_value=_BASE_URL)
+        )
+        mock_patch_comment = stack.enter_context(
+            patch("agentic_devtools.cli.azure_devops.file_review_commands.patch_comment")
+        )
+        mock_cascade = stack.enter_context(
+            patch("agentic_devtools.cli.azure_devops.status_cascade.cascade_status_update", return_value=[])
+        )
+        mock_execute = stack.enter_context(patch("agentic_devtools.cli.azure_devops.status_cascade.execute_cascade"))
+        stack.enter_context(
+            patch("agentic_devtools.cli.azure_devops.file_review_commands.require_requests", return_value=MagicMock())
+        )
+        stack.enter_context(patch("agentic_devtools.cli.azure_devops.file_review_commands.get_pat", return_value="pat"))
+        stack.enter_context(
+            patch("agentic_devtools.cli.azure_devops.file_review_commands.get_auth_headers", return_value={})
+        )
+        mock_save = stack.enter_context(patch("agentic_devtools.cli.azure_devops.review_state.save_review_state"))
+
+        yield {
+            "patch_comment": mock_patch_comment,
+            "cascade": mock_cascade,
+            "execute": mock_execute,
+            "save": mock_save,
+        }
+
+
+class TestFlushInProgressFiles:
+    """Tests for flush_in_progress_files function."""
+
+    def test_marks_batch_with_one_cascade_and_save(self, api_mocks):
+        """Should PATCH every file in the batch but cascade and save only once."""
+        state = _make_review_state(
+            {"/src/a.py": ReviewStatus.UNREVIEWED.value, "/src/b.py": ReviewStatus.UNREVIEWED.value}
+        )
+
+        with patch("agentic_devtools.cli.azure_devops.review_state.load_review_state", return_value=state):
+            flush_in_progress_files(42, ["/src/a.py", "src/b.py"])
+
+        assert state.files["/src/a.py"].status == ReviewStatus.IN_PROGRESS.value
+        assert state.files["/src/b.py"].status == ReviewStatus.IN_PROGRESS.value
+        assert [c.kwargs["thread_id"] for c in api_mocks["patch_comment"].call_args_list] == [10, 11]
+        api_mocks["cascade"].assert_called_once_with(state, "src/b.py", _BASE_URL)
+        api_mocks["execute"].assert_called_once()
+        api_mocks["save"].assert_called_once_with(state)
+
+    def test_skips_files_not_unreviewed_or_missing(self, api_mocks):
+        """Should only PATCH files that are in review state and still unreviewed."""
+        state = _make_review_state(
+            {"/src/a.py": ReviewStatus.APPROVED.value, "/src/b.py": ReviewStatus.UNREVIEWED.value}
+        )
+
+        with patch("agentic_devtools.cli.azure_devops.review_state.load_review_state", return_value=state):
+            flush_in_progress_files(42, ["/src/a.py", "/src/missing.py", "/src/b.py"])
+
+        assert state.files["/src/a.py"].status == ReviewStatus.APPROVED.value
+        api_mocks["patch_comment"].assert_called_once()
+        assert api_mocks["patch_comment"].call_args.kwargs["thread_id"] == 11
+
+    def test_no_op_when_nothing_to_start(self, api_mocks):
+        """Should neither PATCH nor save when no file in the batch is unreviewed."""
+        state = _make_review_state({"/src/a.py": ReviewStatus.IN_PROGRESS.value})
+
+        with patch("agentic_devtools.cli.azure_devops.review_state.load_review_state", return_value=state):
+            flush_in_progress_files(42, ["/src/a.py"])
+
+        api_mocks["patch_comment"].assert_not_called()
+        api_mocks["cascade"].assert_not_called()
+        api_mocks["save"].assert_not_called()
+
+    def test_no_op_when_review_state_not_found(self, api_mocks):
+        """Should return without error when review-state.json does not exist."""
+        with patch(
+            "agentic_devtools.cli.azure_devops.review_state.load_review_state",
+            side_effect=FileNotFoundError("not found"),
+        ):
+            flush_in_progress_files(42, ["/src/a.py"])
+
+        api_mocks["patch_comment"].assert_not_called()
+
+    def test_holds_review_state_lock_from_load_to_save(self, api_mocks):
+        """Should load and save review state under the PR's review-state lock."""
+        state = _make_review_state({"/src/a.py": ReviewStatus.UNREVIEWED.value})
+        events = []
+
+        @contextmanager
+        def fake_lock(pull_request_id):
+            events.append(("lock", pull_request_id))
+            yield
+            events.append("unlock")
+
+        api_mocks["save"].side_effect = lambda _state: events.append("save")
+        with patch("agentic_devtools.cli.azure_devops.review_state.review_state_lock", fake_lock), patch(
+            "agentic_devtools.cli.azure_devops.review_state.load_review_state",
+            side_effect=lambda _pr: events.append("load") or state,
+        ):
+            flush_in_progress_files(42, ["/src/a.py"])
+
+        assert events == [("lock", 42), "load", "save", "unlock"]
@@ -0,0 +1,47 @@
+"""Tests for mark_files_as_submission_pending function."""
+
+import json
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure_devops.file_review_commands import mark_files_as_submission_pending
+
+
+class TestMarkFilesAsSubmissionPending:
+    """Tests for mark_files_as_submission_pending function."""
+
+    def test_marks_all_files_with_one_task(self, tmp_path, capsys):
+        """Should mark each queued file submission-pending under the shared task ID."""
+        queue_file = tmp_path / "queue.json"
+        queue_file.write_text(
+            json.dumps(
+                {
+                    "pending": [
+                        {"path": "/src/a.py", "status": "pending"},
+                        {"path": "/src/b.py", "status": "pending"},
+                        {"path": "/src/c.py", "status": "pending"},
+                    ],
+                    "completed": [],
+                }
+            )
+        )
+
+        with patch(
+            "agentic_devtools.cli.azure_devops.file_review_commands._get_queue_path",
+            return_value=queue_file,
+        ):
+            marked = mark_files_as_submission_pending(42, ["/src/a.py", "/src/c.py", "/src/x.py"], "task-1", "Approve")
+
+        assert marked == 2
+        entries = {e["path"]: e for e in json.loads(queue_file.read_text())["pending"]}
+        assert entries["/src/a.py"]["status"] == "submission-pending"
+        assert entries["/src/c.py"]["taskId"] == "task-1"
+        assert entries["/src/b.py"]["status"] == "pending"
+        assert "'/src/x.py' not found" in capsys.readouterr().out
+
+    def test_returns_zero_without_queue(self, tmp_path):
+        """Should mark nothing when the queue file does not exist."""
+        with patch(
+            "agentic_devtools.cli.azure_devops.file_review_commands._get_queue_path",
+            return_value=tmp_path / "queue.json",
+        ):
+            assert mark_files_as_submission_pending(42, ["/src/a.py"], "task-1", "Approve") == 0
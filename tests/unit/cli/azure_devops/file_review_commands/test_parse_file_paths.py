@@ -0,0 +1,19 @@
+"""Tests for parse_file_paths function."""
+
+from agentic_devtools.cli.azure_devops.file_review_commands import parse_file_paths
+
+
+class TestParseFilePaths:
+    """Tests for parse_file_paths function."""
+
+    def test_empty_value(self):
+        """Should return no paths for a missing value."""
+        assert parse_file_paths(None) == []
+
+    def test_list_value(self):
+        """Should strip list items and drop blank ones."""
+        assert parse_file_paths([" src/a.py ", "", "src/gen/*"]) == ["src/a.py", "src/gen/*"]
+
+    def test_comma_and_newline_separated_string(self):
+        """Should split a string on commas and newlines."""
+        assert parse_file_paths("src/a.py, src/b.py\nsrc/gen/*\n") == ["src/a.py", "src/b.py", "src/gen/*"]
@@ -1,9 +1,10 @@
 """Tests for print_next_file_prompt function."""
 
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from agentic_devtools.cli.azure_devops.file_review_commands import print_next_file_prompt
+from agentic_devtools.task_state import TaskStatus
 
 
 class TestPrintNextFilePrompt:
@@ -28,28 +29,31 @@ class TestPrintNextFilePrompt:
         captured = capsys.readouterr()
         assert captured.out != "" or captured.err != ""
 
-    def test_calls_sync_submission_pending_with_tasks(self, tmp_path):
-        """Should call sync_submission_pending_with_tasks to refresh task status."""
+    def test_syncs_submission_pending_with_tasks(self, tmp_path, capsys):
+        """Should settle finished background submissions before reporting the queue."""
         queue_data = {
-            "pending": [],
-            "completed": [{"path": "src/a.ts"}],
+            "pending": [{"path": "src/a.ts", "status": "submission-pending", "taskId": "task-1"}],
+            "completed": [],
         }
         queue_file = tmp_path / "queue.json"
         queue_file.write_text(json.dumps(queue_data))
+        mock_task = MagicMock(status=TaskStatus.COMPLETED)
 
         with patch(
             "agentic_devtools.cli.azure_devops.file_review_commands._get_queue_path",
             return_value=queue_file,
         ):
             with patch(
-                "agentic_devtools.cli.azure_devops.file_review_commands.sync_submission_pending_with_tasks"
-            ) as mock_sync:
+                "agentic_devtools.task_state.get_tasks_by_ids",
+                side_effect=lambda ids: {task_id: mock_task for task_id in ids},
+            ):
                 print_next_file_prompt(pull_request_id=42)
 
-        mock_sync.assert_called_once_with(42)
+        assert json.loads(queue_file.read_text())["completed"][0]["path"] == "src/a.ts"
+        assert "READY FOR DECISION" in capsys.readouterr().out
 
-    def test_calls_trigger_in_progress_when_file_pending(self, tmp_path):
-        """Should call trigger_in_progress_for_file when there is a pending file."""
+    def test_queues_in_progress_when_file_pending(self, tmp_path):
+        """Should queue the in-progress update for the background drainer when there is a pending file."""
         queue_data = {
             "pending": [{"path": "src/app.py", "status": "pending"}],
             "completed": [],
@@ -61,18 +65,38 @@ class TestPrintNextFilePrompt:
             "agentic_devtools.cli.azure_devops.file_review_commands._get_queue_path",
             return_value=queue_file,
         ):
-            with patch("agentic_devtools.cli.azure_devops.file_review_commands.sync_submission_pending_with_tasks"):
+            with patch("agentic_devtools.cli.azure_devops.file_review_commands.queue_in_progress_update") as mock_queue:
                 with patch(
                     "agentic_devtools.cli.azure_devops.file_review_commands.trigger_in_progress_for_file"
                 ) as mock_trigger:
                     with patch("agentic_devtools.cli.azure_devops.file_review_commands.is_dry_run", return_value=False):
                         print_next_file_prompt(pull_request_id=42)
 
-        mock_trigger.assert_called_once_with(
-            pull_request_id=42,
-            file_path="src/app.py",
-            dry_run=False,
-        )
+        mock_queue.assert_called_once_with(42, "src/app.py")
+        mock_trigger.assert_not_called()
+
+    def test_dry_run_triggers_in_progress_inline(self, tmp_path):
+        """Should apply the in-progress update inline in dry-run mode so its output is shown."""
+        queue_data = {
+            "pending": [{"path": "src/app.py", "status": "pending"}],
+            "completed": [],
+        }
+        queue_file = tmp_path / "queue.json"
+        queue_file.write_text(json.dumps(queue_data))
+
+        with patch(
+            "agentic_devtools.cli.azure_devops.file_review_commands._get_queue_path",
+            return_value=queue_file,
+        ):
+            with patch("agentic_devtools.cli.azure_devops.file_review_commands.queue_in_progress_update") as mock_queue:
+                with patch(
+                    "agentic_devtools.cli.azure_devops.file_review_commands.trigger_in_progress_for_file"
+                ) as mock_trigger:
+                    with patch("agentic_devtools.cli.azure_devops.file_review_commands.is_dry_run", return_value=True):
+                        print_next_file_prompt(pull_request_id=42)
+
+        mock_trigger.assert_called_once_with(pull_request_id=42, file_path="src/app.py", dry_run=True)
+        mock_queue.assert_not_called()
 
     def test_does_not_call_trigger_in_progress_when_all_complete(self, tmp_path):
         """Should not call trigger_in_progress_for_file when all files are reviewed."""
@@ -138,7 +162,7 @@ class TestPrintNextFilePrompt:
         assert "agdt-task-wait" not in captured.out
 
     def test_trigger_exception_does_not_crash(self, tmp_path, capsys):
-        """Should print a warning but not crash when trigger_in_progress_for_file raises."""
+        """Should print a warning but not crash when queueing the in-progress update raises."""
         queue_data = {
             "pending": [{"path": "src/app.py", "status": "pending"}],
             "completed": [],
@@ -152,7 +176,7 @@ class TestPrintNextFilePrompt:
         ):
             with patch("agentic_devtools.cli.azure_devops.file_review_commands.sync_submission_pending_with_tasks"):
                 with patch(
-                    "agentic_devtools.cli.azure_devops.file_review_commands.trigger_in_progress_for_file",
+                    "agentic_devtools.cli.azure_devops.file_review_commands.queue_in_progress_update",
                     side_effect=RuntimeError("boom"),
                 ):
                     with patch("agentic_devtools.cli.azure_devops.file_review_commands.is_dry_run", return_value=False):
@@ -606,6 +606,24 @@ def _make_post_response(thread_id, comment_id):
     return resp
 
 
+def _post_responses_by_content(responses):
+    """Create a requests.post side effect answering each thread POST by its content prefix.
+
+    Thread POSTs run concurrently, so responses can't be handed out in call order.
+    """
+
+    def _post(url, **kwargs):
+        content = kwargs["json"]["comments"][0]["content"]
+        for prefix, response in responses.items():
+            if content.startswith(prefix):
+                if isinstance(response, Exception):
+                    raise response
+                return response
+        raise AssertionError(f"Unexpected thread POST: {content!r}")
+
+    return _post
+
+
 def _enter_patch_flow_mocks(stack, review_state, mock_requests, mock_save=None):
     """Enter all mocks needed for the PATCH flow into an ExitStack.
 
@@ -639,6 +657,8 @@ def _enter_patch_flow_mocks(stack, review_state, mock_requests, mock_save=None):
         )
     )
     mock_execute = stack.enter_context(patch("agentic_devtools.cli.azure_devops.status_cascade.execute_cascade"))
+    # Thread POSTs go through a pooled session; route them to the module mock
+    mock_requests.Session.return_value = mock_requests
     stack.enter_context(patch(f"{_MOD}.require_requests", return_value=mock_requests))
     stack.enter_context(patch(f"{_MOD}.get_pat", return_value="fake-pat"))
     stack.enter_context(patch(f"{_MOD}.get_auth_headers", return_value={"Authorization": "Basic xxx"}))
@@ -671,10 +691,12 @@ class TestRequestChangesPatchFlow:
         from agentic_devtools.state import set_value
 
         mock_requests = MagicMock()
-        mock_requests.post.side_effect = [
-            _make_post_response(1001, 2001),
-            _make_post_response(1002, 2002),
-        ]
+        mock_requests.post.side_effect = _post_responses_by_content(
+            {
+                "Critical issue": _make_post_response(1001, 2001),
+                "Name convention": _make_post_response(1002, 2002),
+            }
+        )
 
         review_state = _make_review_state()
         with ExitStack() as stack:
@@ -718,10 +740,12 @@ class TestRequestChangesPatchFlow:
         from agentic_devtools.state import set_value
 
         mock_requests = MagicMock()
-        mock_requests.post.side_effect = [
-            _make_post_response(1001, 2001),
-            _make_post_response(1002, 2002),
-        ]
+        mock_requests.post.side_effect = _post_responses_by_content(
+            {
+                "Critical issue": _make_post_response(1001, 2001),
+                "Name convention": _make_post_response(1002, 2002),
+            }
+        )
 
         review_state = _make_review_state()
         mock_save = MagicMock()
@@ -807,10 +831,12 @@ class TestRequestChangesPatchFlow:
         from agentic_devtools.state import set_value
 
         mock_requests = MagicMock()
-        mock_requests.post.side_effect = [
-            _make_post_response(1001, 2001),
-            RuntimeError("POST #2 failed"),
-        ]
+        mock_requests.post.side_effect = _post_responses_by_content(
+            {
+                "Critical issue": _make_post_response(1001, 2001),
+                "Name convention": RuntimeError("POST #2 failed"),
+            }
+        )
 
         review_state = _make_review_state()
         mock_save = MagicMock()
@@ -35,8 +35,8 @@ class TestSyncSubmissionPendingWithTasks:
             return_value=queue_file,
         ):
             with patch(
-                "agentic_devtools.task_state.get_task_by_id",
-                return_value=mock_task,
+                "agentic_devtools.task_state.get_tasks_by_ids",
+                side_effect=lambda ids: {task_id: mock_task for task_id in ids},
             ):
                 sync_submission_pending_with_tasks(pull_request_id=42)
 
@@ -0,0 +1,28 @@
+"""Tests for create_pooled_session function."""
+
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.azure_devops.helpers import create_pooled_session
+
+
+class TestCreatePooledSession:
+    """Tests for create_pooled_session function."""
+
+    def test_mounts_sized_adapter(self):
+        """Should mount an HTTPS adapter whose pool fits the workers."""
+        mock_requests = MagicMock()
+        session = create_pooled_session(mock_requests, pool_size=6)
+
+        assert session is mock_requests.Session.return_value
+        mock_requests.adapters.HTTPAdapter.assert_called_once_with(pool_connections=1, pool_maxsize=6)
+        session.mount.assert_called_once_with("https://", mock_requests.adapters.HTTPAdapter.return_value)
+
+    def test_real_session(self):
+        """Should build a working requests session."""
+        import requests
+
+        session = create_pooled_session(requests, pool_size=3)
+        try:
+            assert session.get_adapter("https://dev.azure.com")._pool_maxsize == 3
+        finally:
+            session.close()
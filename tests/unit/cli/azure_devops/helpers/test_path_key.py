@@ -0,0 +1,16 @@
+"""Tests for path_key function."""
+
+from agentic_devtools.cli.azure_devops.helpers import path_key
+
+
+class TestPathKey:
+    """Tests for path_key function."""
+
+    def test_spellings_of_one_path_share_a_key(self):
+        """Should give the same key regardless of slashes and case."""
+        assert path_key("src\\App.ts") == path_key("/SRC/app.ts/") == "/src/app.ts"
+
+    def test_empty_path_has_no_key(self):
+        """Should return None for a missing or blank path."""
+        assert path_key(None) is None
+        assert path_key("  ") is None
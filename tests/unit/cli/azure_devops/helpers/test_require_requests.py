@@ -17,6 +17,21 @@ class TestRequireRequests:
         assert hasattr(requests, "get")
         assert hasattr(requests, "post")
 
+    def test_wraps_requests_in_http_cache_when_enabled(self, monkeypatch, tmp_path):
+        """Test returns the requests module behind the HTTP cache when it is enabled."""
+        import requests as requests_module
+
+        from agentic_devtools.cli.azure_devops import http_cache
+
+        monkeypatch.setenv("AGDT_HTTP_CACHE", "1")
+        monkeypatch.setattr(http_cache, "_default_cache", None)
+        with patch("agentic_devtools.state.get_state_dir", return_value=tmp_path):
+            with patch.object(http_cache.atexit, "register"):
+                requests = azure_devops.require_requests()
+
+        assert isinstance(requests, http_cache.CachingRequests)
+        assert requests.exceptions is requests_module.exceptions
+
     def test_exits_when_requests_not_available(self, capsys):
         """Test exits when requests import fails."""
         import builtins
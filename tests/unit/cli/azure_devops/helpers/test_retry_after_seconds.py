@@ -0,0 +1,36 @@
+"""Tests for retry_after_seconds function."""
+
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.azure_devops.helpers import DEFAULT_RETRY_AFTER_SECONDS, retry_after_seconds
+
+
+def _response(headers):
+    response = MagicMock()
+    response.headers = headers
+    return response
+
+
+class TestRetryAfterSeconds:
+    """Tests for retry_after_seconds function."""
+
+    def test_uses_retry_after_header(self):
+        """Should return the Retry-After header as seconds."""
+        assert retry_after_seconds(_response({"Retry-After": "7"})) == 7
+
+    def test_zero_is_honoured(self):
+        """Should return 0 when the server asks for an immediate retry."""
+        assert retry_after_seconds(_response({"Retry-After": "0"})) == 0
+
+    def test_missing_header_uses_default(self):
+        """Should return the default when there is no Retry-After header."""
+        assert retry_after_seconds(_response({})) == DEFAULT_RETRY_AFTER_SECONDS
+
+    def test_http_date_uses_default(self):
+        """Should return the default when Retry-After is an HTTP date."""
+        response = _response({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+        assert retry_after_seconds(response, default=5) == 5
+
+    def test_negative_value_uses_default(self):
+        """Should return the default when Retry-After is negative."""
+        assert retry_after_seconds(_response({"Retry-After": "-3"}), default=5) == 5
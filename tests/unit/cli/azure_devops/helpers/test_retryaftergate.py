@@ -0,0 +1,34 @@
+"""Tests for RetryAfterGate class."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure_devops.helpers import RetryAfterGate
+
+_MOD = "agentic_devtools.cli.azure_devops.helpers"
+
+
+class TestRetryAfterGate:
+    """Tests for RetryAfterGate class."""
+
+    def test_wait_without_pause_does_not_sleep(self):
+        """Should return immediately when no pause was requested."""
+        with patch(f"{_MOD}.time.sleep") as mock_sleep:
+            RetryAfterGate().wait()
+        mock_sleep.assert_not_called()
+
+    def test_wait_sleeps_out_pause(self):
+        """Should sleep for the remainder of a requested pause."""
+        gate = RetryAfterGate()
+        with patch(f"{_MOD}.time.monotonic", return_value=100.0), patch(f"{_MOD}.time.sleep") as mock_sleep:
+            gate.pause(5)
+            gate.wait()
+        mock_sleep.assert_called_once_with(5.0)
+
+    def test_pause_keeps_longest(self):
+        """Should not shorten a pause already in effect."""
+        gate = RetryAfterGate()
+        with patch(f"{_MOD}.time.monotonic", return_value=100.0), patch(f"{_MOD}.time.sleep") as mock_sleep:
+            gate.pause(10)
+            gate.pause(2)
+            gate.wait()
+        mock_sleep.assert_called_once_with(10.0)
@@ -0,0 +1,28 @@
+"""Shared helpers for http_cache tests."""
+
+import json
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.azure_devops.http_cache import HttpCache, HttpCacheSettings
+
+BASE = "https://dev.azure.com/org/proj/_apis/git/repositories/repo"
+ITERATIONS_URL = f"{BASE}/pullRequests/42/iterations?api-version=7.1-preview.1"
+HEADERS = {"Authorization": "Basic abc"}
+
+
+def make_cache(tmp_path, **settings):
+    """Create a cache in a temporary directory."""
+    return HttpCache(tmp_path / "http-cache", HttpCacheSettings(**settings))
+
+
+def response(status_code=200, body=None, etag=None, last_modified=None):
+    """Build a mock requests.Response."""
+    mock = MagicMock()
+    mock.status_code = status_code
+    mock.headers = {"Content-Type": "application/json"}
+    if etag:
+        mock.headers["ETag"] = etag
+    if last_modified:
+        mock.headers["Last-Modified"] = last_modified
+    mock.text = json.dumps(body if body is not None else {"value": []})
+    return mock
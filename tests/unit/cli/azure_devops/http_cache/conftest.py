@@ -0,0 +1,17 @@
+"""Shared fixtures for http_cache tests."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops import http_cache
+
+
+@pytest.fixture
+def enabled_http_cache(tmp_path, monkeypatch):
+    """Enable the process-wide HTTP cache against a temporary state directory."""
+    monkeypatch.setenv("AGDT_HTTP_CACHE", "1")
+    monkeypatch.setattr(http_cache, "_default_cache", None)
+    with patch("agentic_devtools.state.get_state_dir", return_value=tmp_path):
+        with patch.object(http_cache.atexit, "register") as mock_register:
+            yield mock_register
@@ -0,0 +1,19 @@
+"""Tests for CachedResponse."""
+
+from agentic_devtools.cli.azure_devops.http_cache import CachedResponse
+
+
+class TestCachedResponse:
+    """Tests for CachedResponse."""
+
+    def test_behaves_like_a_successful_response(self):
+        """A cached response exposes the body, headers and a 200 status."""
+        response = CachedResponse("https://x/threads", '{"value": [1]}', {"ETag": '"v1"'})
+
+        response.raise_for_status()
+        assert response.status_code == 200
+        assert response.ok
+        assert response.from_cache
+        assert response.json() == {"value": [1]}
+        assert response.content == b'{"value": [1]}'
+        assert response.headers == {"ETag": '"v1"'}
@@ -0,0 +1,78 @@
+"""Tests for CachingRequests."""
+
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.azure_devops.http_cache import CachedResponse, CachingRequests
+from tests.unit.cli.azure_devops.http_cache._helpers import BASE, HEADERS, ITERATIONS_URL, make_cache, response
+
+
+def _client(tmp_path):
+    requests_module = MagicMock()
+    requests_module.get.return_value = response(etag='"v1"')
+    return requests_module, CachingRequests(requests_module, make_cache(tmp_path, ttl_seconds=60))
+
+
+class TestCachingRequests:
+    """Tests for CachingRequests."""
+
+    def test_cacheable_get_uses_cache(self, tmp_path):
+        """Repeated GETs of a cacheable URL reach the server once."""
+        requests_module, client = _client(tmp_path)
+
+        client.get(ITERATIONS_URL, headers=HEADERS, timeout=30)
+        result = client.get(ITERATIONS_URL, headers=HEADERS, timeout=30)
+
+        assert isinstance(result, CachedResponse)
+        requests_module.get.assert_called_once_with(ITERATIONS_URL, headers=HEADERS, timeout=30)
+
+    def test_other_gets_pass_through(self, tmp_path):
+        """GETs of other URLs, or with params, always go to the server."""
+        requests_module, client = _client(tmp_path)
+
+        client.get(f"{BASE}/items", headers=HEADERS)
+        client.get(ITERATIONS_URL, params={"$top": 1}, headers=HEADERS)
+
+        assert requests_module.get.call_count == 2
+        assert not (tmp_path / "http-cache").exists()
+
+    def test_thread_list_is_not_cached(self, tmp_path):
+        """GETs of a PR's thread list go to the server every time (thread_status indexes them)."""
+        requests_module, client = _client(tmp_path)
+        threads_url = f"{BASE}/pullRequests/42/threads?api-version=7.1-preview.1"
+
+        client.get(threads_url, headers=HEADERS)
+        client.get(threads_url, headers={**HEADERS, "If-None-Match": '"v1"'})
+
+        assert requests_module.get.call_count == 2
+        assert requests_module.get.call_args.kwargs["headers"] == {**HEADERS, "If-None-Match": '"v1"'}
+        assert not (tmp_path / "http-cache").exists()
+
+    def test_writes_invalidate_pull_request(self, tmp_path):
+        """POST/PUT/PATCH/DELETE drop the PR's cached reads."""
+        requests_module, client = _client(tmp_path)
+        for method in ("post", "put", "patch", "delete"):
+            client.get(ITERATIONS_URL, headers=HEADERS)
+
+            getattr(client, method)(f"{BASE}/pullRequests/42/threads/1", headers=HEADERS, json={})
+
+            getattr(requests_module, method).assert_called_once()
+        assert requests_module.get.call_count == 4
+
+    def test_session_shares_cache(self, tmp_path):
+        """Sessions created by the client use the same cache."""
+        requests_module, client = _client(tmp_path)
+        client.get(ITERATIONS_URL, headers=HEADERS)
+
+        session = client.Session()
+        result = session.get(ITERATIONS_URL, headers=HEADERS)
+        session.patch(ITERATIONS_URL, headers=HEADERS, json={})
+
+        assert isinstance(result, CachedResponse)
+        requests_module.Session.return_value.get.assert_not_called()
+        assert not list((tmp_path / "http-cache").glob("*.json"))
+
+    def test_delegates_other_attributes(self, tmp_path):
+        """Everything else (exceptions, other methods) comes from requests."""
+        requests_module, client = _client(tmp_path)
+
+        assert client.exceptions is requests_module.exceptions
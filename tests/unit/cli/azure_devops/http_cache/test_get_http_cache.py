@@ -0,0 +1,38 @@
+"""Tests for get_http_cache function."""
+
+from agentic_devtools.cli.azure_devops import http_cache
+
+
+class TestGetHttpCache:
+    """Tests for get_http_cache."""
+
+    def test_disabled(self, monkeypatch):
+        """AGDT_HTTP_CACHE=0 disables the cache."""
+        monkeypatch.setenv("AGDT_HTTP_CACHE", "0")
+
+        assert http_cache.get_http_cache() is None
+
+    def test_creates_one_cache_in_state_dir(self, enabled_http_cache, tmp_path):
+        """The cache lives under the state directory and is created once."""
+        cache = http_cache.get_http_cache()
+
+        assert http_cache.get_http_cache() is cache
+        assert cache.directory == tmp_path / http_cache.HTTP_CACHE_DIRNAME
+        enabled_http_cache.assert_called_once_with(http_cache._print_stats)
+
+    def test_prints_stats_when_verbose(self, enabled_http_cache, monkeypatch, capsys):
+        """Verbose mode prints the hit/miss counts at exit."""
+        monkeypatch.setenv("AGDT_HTTP_CACHE_VERBOSE", "1")
+        http_cache.get_http_cache().stats.hits = 3
+
+        http_cache._print_stats()
+
+        assert "HTTP cache: 3 hit(s), 0 revalidated, 0 miss(es)" in capsys.readouterr().err
+
+    def test_quiet_by_default(self, enabled_http_cache, capsys):
+        """Without verbose mode nothing is printed."""
+        http_cache.get_http_cache()
+
+        http_cache._print_stats()
+
+        assert capsys.readouterr().err == ""
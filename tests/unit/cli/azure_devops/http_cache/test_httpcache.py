@@ -0,0 +1,177 @@
+"""Tests for HttpCache."""
+
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.azure_devops.http_cache import CachedResponse
+from tests.unit.cli.azure_devops.http_cache._helpers import BASE, HEADERS, ITERATIONS_URL, make_cache, response
+
+
+class TestHttpCache:
+    """Tests for HttpCache."""
+
+    def test_miss_stores_response_with_etag(self, tmp_path):
+        """A 200 with an ETag is returned and stored."""
+        cache = make_cache(tmp_path)
+        send = MagicMock(return_value=response(body={"value": [1]}, etag='"v1"'))
+
+        result = cache.get(send, ITERATIONS_URL, HEADERS, timeout=30)
+
+        assert result is send.return_value
+        send.assert_called_once_with(ITERATIONS_URL, headers=HEADERS, timeout=30)
+        assert cache.stats.misses == 1
+        assert len(list(cache.directory.glob("*.json"))) == 1
+
+    def test_revalidates_with_validators(self, tmp_path):
+        """A stored entry is revalidated, and a 304 serves the stored body."""
+        cache = make_cache(tmp_path)
+        cache.get(
+            MagicMock(return_value=response(body={"value": [1]}, etag='"v1"', last_modified="Mon")),
+            ITERATIONS_URL,
+            HEADERS,
+        )
+        send = MagicMock(return_value=response(status_code=304))
+
+        result = cache.get(send, ITERATIONS_URL, HEADERS)
+
+        assert isinstance(result, CachedResponse)
+        assert result.json() == {"value": [1]}
+        assert send.call_args.kwargs["headers"] == {**HEADERS, "If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+        assert cache.stats.revalidated == 1
+
+    def test_caller_conditional_headers_pass_through(self, tmp_path):
+        """A GET with the caller's own If-None-Match is sent unchanged, and its 304 isn't replaced."""
+        cache = make_cache(tmp_path, ttl_seconds=60)
+        cache.get(MagicMock(return_value=response(body={"value": [1]}, etag='"v1"')), ITERATIONS_URL, HEADERS)
+        headers = {**HEADERS, "if-none-match": '"v0"'}
+        send = MagicMock(return_value=response(status_code=304))
+
+        result = cache.get(send, ITERATIONS_URL, headers, timeout=30)
+
+        assert result is send.return_value
+        send.assert_called_once_with(ITERATIONS_URL, headers=headers, timeout=30)
+        assert (cache.stats.hits, cache.stats.revalidated, cache.stats.misses) == (0, 0, 1)
+
+    def test_caller_conditional_get_is_not_stored(self, tmp_path):
+        """A 200 to the caller's own conditional GET isn't stored."""
+        cache = make_cache(tmp_path)
+        send = MagicMock(return_value=response(etag='"v2"'))
+
+        cache.get(send, ITERATIONS_URL, {**HEADERS, "If-Modified-Since": "Mon"})
+
+        assert not list(cache.directory.glob("*.json"))
+
+    def test_changed_resource_replaces_entry(self, tmp_path):
+        """A 200 to a conditional GET replaces the stored body."""
+        cache = make_cache(tmp_path)
+        cache.get(MagicMock(return_value=response(body={"value": [1]}, etag='"v1"')), ITERATIONS_URL, HEADERS)
+        cache.get(MagicMock(return_value=response(body={"value": [2]}, etag='"v2"')), ITERATIONS_URL, HEADERS)
+        send = MagicMock(return_value=response(status_code=304))
+
+        result = cache.get(send, ITERATIONS_URL, HEADERS)
+
+        assert send.call_args.kwargs["headers"]["If-None-Match"] == '"v2"'
+        assert result.json() == {"value": [2]}
+        assert cache.stats.misses == 2
+
+    def test_fresh_entry_is_served_without_request(self, tmp_path):
+        """Within the TTL an entry is served without contacting the server."""
+        cache = make_cache(tmp_path, ttl_seconds=60)
+        cache.get(MagicMock(return_value=response(body={"value": [1]})), ITERATIONS_URL, HEADERS)
+        send = MagicMock()
+
+        result = cache.get(send, ITERATIONS_URL, HEADERS)
+
+        send.assert_not_called()
+        assert result.json() == {"value": [1]}
+        assert cache.stats.hits == 1
+
+    def test_response_without_validators_is_not_stored(self, tmp_path):
+        """Without a TTL, responses that can't be revalidated aren't stored."""
+        cache = make_cache(tmp_path)
+
+        cache.get(MagicMock(return_value=response()), ITERATIONS_URL, HEADERS)
+
+        assert not cache.directory.exists()
+
+    def test_error_response_is_not_stored(self, tmp_path):
+        """Only 200 responses are stored."""
+        cache = make_cache(tmp_path, ttl_seconds=60)
+
+        result = cache.get(MagicMock(return_value=response(status_code=404, etag='"v1"')), ITERATIONS_URL, HEADERS)
+
+        assert result.status_code == 404
+        assert not cache.directory.exists()
+
+    def test_entries_are_per_credential(self, tmp_path):
+        """A response stored for one credential isn't served for another."""
+        cache = make_cache(tmp_path, ttl_seconds=60)
+        cache.get(MagicMock(return_value=response()), ITERATIONS_URL, HEADERS)
+        send = MagicMock(return_value=response())
+
+        cache.get(send, ITERATIONS_URL, {"Authorization": "Basic other"})
+
+        send.assert_called_once()
+
+    def test_corrupt_entry_is_ignored(self, tmp_path):
+        """An unreadable entry is treated as a miss."""
+        cache = make_cache(tmp_path, ttl_seconds=60)
+        cache.get(MagicMock(return_value=response()), ITERATIONS_URL, HEADERS)
+        next(cache.directory.glob("*.json")).write_text("{not json", encoding="utf-8")
+        send = MagicMock(return_value=response())
+
+        cache.get(send, ITERATIONS_URL, HEADERS)
+
+        send.assert_called_once()
+
+    def test_unwritable_directory_does_not_fail_request(self, tmp_path):
+        """A cache that can't be written still returns the response."""
+        (tmp_path / "http-cache").write_text("not a directory", encoding="utf-8")
+        cache = make_cache(tmp_path, ttl_seconds=60)
+        send = MagicMock(return_value=response())
+
+        assert cache.get(send, ITERATIONS_URL, HEADERS) is send.return_value
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        """A write that fails midway removes its temp file."""
+        cache = make_cache(tmp_path, ttl_seconds=60)
+
+        with patch("agentic_devtools.cli.azure_devops.http_cache.os.replace", side_effect=OSError("busy")):
+            cache.get(MagicMock(return_value=response()), ITERATIONS_URL, HEADERS)
+
+        assert list(cache.directory.iterdir()) == []
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Beyond max_entries the least recently used entry is removed."""
+        cache = make_cache(tmp_path, ttl_seconds=60, max_entries=2)
+        urls = [f"{BASE}/pullRequests/{pr}/threads" for pr in (1, 2)]
+        for url in urls:
+            cache.get(MagicMock(return_value=response()), url, HEADERS)
+        old = time.time() - 100
+        for path in cache.directory.glob("*.json"):
+            os.utime(path, (old, old))
+        cache.get(MagicMock(), urls[0], HEADERS)  # hit: now the most recently used
+
+        cache.get(MagicMock(return_value=response()), f"{BASE}/pullRequests/3/threads", HEADERS)
+
+        send = MagicMock(return_value=response())
+        cache.get(send, urls[1], HEADERS)
+        send.assert_called_once()
+        assert len(list(cache.directory.glob("*.json"))) == 2
+
+    def test_invalidate_drops_pull_request_entries(self, tmp_path):
+        """Invalidating a PR URL drops every cached read of that PR only."""
+        cache = make_cache(tmp_path, ttl_seconds=60)
+        for url in (ITERATIONS_URL, f"{BASE}/pullRequests/42/iterations", f"{BASE}/pullRequests/7/threads"):
+            cache.get(MagicMock(return_value=response()), url, HEADERS)
+
+        cache.invalidate(f"{BASE}/pullRequests/42/threads/5/comments")
+
+        remaining = [json.loads(p.read_text(encoding="utf-8")) for p in cache.directory.glob("*.json")]
+        assert len(remaining) == 1
+
+    def test_invalidate_without_directory(self, tmp_path):
+        """Invalidating an empty cache does nothing."""
+        make_cache(tmp_path).invalidate(ITERATIONS_URL)
@@ -0,0 +1,42 @@
+"""Tests for HttpCacheSettings."""
+
+from agentic_devtools.cli.azure_devops.http_cache import DEFAULT_MAX_ENTRIES, HttpCacheSettings
+
+
+class TestHttpCacheSettings:
+    """Tests for HttpCacheSettings.from_env."""
+
+    def test_defaults(self, monkeypatch):
+        """Without settings the cache is on, always revalidates and is quiet."""
+        for name in (
+            "AGDT_HTTP_CACHE",
+            "AGDT_HTTP_CACHE_TTL",
+            "AGDT_HTTP_CACHE_MAX_ENTRIES",
+            "AGDT_HTTP_CACHE_VERBOSE",
+        ):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = HttpCacheSettings.from_env()
+
+        assert settings == HttpCacheSettings(enabled=True, ttl_seconds=0.0, max_entries=DEFAULT_MAX_ENTRIES)
+
+    def test_reads_environment(self, monkeypatch):
+        """Every setting can be changed through its environment variable."""
+        monkeypatch.setenv("AGDT_HTTP_CACHE", "false")
+        monkeypatch.setenv("AGDT_HTTP_CACHE_TTL", "30")
+        monkeypatch.setenv("AGDT_HTTP_CACHE_MAX_ENTRIES", "10")
+        monkeypatch.setenv("AGDT_HTTP_CACHE_VERBOSE", "1")
+
+        settings = HttpCacheSettings.from_env()
+
+        assert settings == HttpCacheSettings(enabled=False, ttl_seconds=30.0, max_entries=10, verbose=True)
+
+    def test_invalid_numbers_use_defaults(self, monkeypatch):
+        """Unparseable numbers fall back to the defaults."""
+        monkeypatch.setenv("AGDT_HTTP_CACHE_TTL", "soon")
+        monkeypatch.setenv("AGDT_HTTP_CACHE_MAX_ENTRIES", "many")
+
+        settings = HttpCacheSettings.from_env()
+
+        assert settings.ttl_seconds == 0.0
+        assert settings.max_entries == DEFAULT_MAX_ENTRIES
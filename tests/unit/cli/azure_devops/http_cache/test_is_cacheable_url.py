@@ -0,0 +1,38 @@
+"""Tests for is_cacheable_url function."""
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.http_cache import is_cacheable_url
+from tests.unit.cli.azure_devops.http_cache._helpers import BASE
+
+
+class TestIsCacheableUrl:
+    """Tests for is_cacheable_url."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            f"{BASE}/pullRequests/42/threads/7",
+            f"{BASE}/pullRequests/42/iterations",
+            f"{BASE}/pullRequests/42/iterations/3/changes?$top=2000",
+            f"{BASE}/pullRequests/42/reviewers/abc-123",
+            "https://dev.azure.com/org/_apis/connectionData?api-version=7.1-preview.1",
+        ],
+    )
+    def test_read_heavy_endpoints_are_cacheable(self, url):
+        """Single PR threads, iterations, changes, reviewers and connectionData are cached."""
+        assert is_cacheable_url(url)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            f"{BASE}/pullRequests/42",
+            f"{BASE}/pullRequests/42/threads?api-version=7.1",
+            f"{BASE}/pullRequests/42/threads/7/comments",
+            f"{BASE}/items?path=/src/a.py",
+            "https://dev.azure.com/org/proj/_apis/build/builds/1",
+        ],
+    )
+    def test_other_endpoints_are_not_cacheable(self, url):
+        """The thread list (kept in thread_status's thread index) and other endpoints are never cached."""
+        assert not is_cacheable_url(url)
@@ -0,0 +1,21 @@
+"""Tests for wrap_with_http_cache function."""
+
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.azure_devops.http_cache import CachingRequests, wrap_with_http_cache
+
+
+class TestWrapWithHttpCache:
+    """Tests for wrap_with_http_cache."""
+
+    def test_wraps_when_enabled(self, enabled_http_cache):
+        """With the cache enabled, requests is wrapped."""
+        requests_module = MagicMock()
+
+        assert isinstance(wrap_with_http_cache(requests_module), CachingRequests)
+
+    def test_unchanged_when_disabled(self):
+        """With the cache disabled, requests is returned as is."""
+        requests_module = MagicMock()
+
+        assert wrap_with_http_cache(requests_module) is requests_module
@@ -144,7 +144,9 @@ class TestGetPullRequestDetailsExecution:
         ), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_auth_headers",
             return_value={"Authorization": "Basic xxx"},
-        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_ref"), patch(
+        ), patch(
+            "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_refs"
+        ) as mock_sync_refs, patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_diff_entries",
             return_value=[],
         ), patch(
@@ -159,6 +161,7 @@ class TestGetPullRequestDetailsExecution:
         ), patch("pathlib.Path.mkdir"), patch("builtins.open", MagicMock()):
             get_pull_request_details()
 
+        assert mock_sync_refs.call_args[0][0] == {"origin/main": "abc123", "origin/feature": "def456"}
         captured = capsys.readouterr()
         assert "12345" in captured.out
         assert "Test PR" in captured.out
@@ -195,7 +198,7 @@ class TestGetPullRequestDetailsExecution:
         ), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_auth_headers",
             return_value={},
-        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_ref"), patch(
+        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_refs"), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_diff_entries",
             return_value=[],
         ), patch(
@@ -249,7 +252,7 @@ class TestGetPullRequestDetailsExecution:
         ), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_auth_headers",
             return_value={},
-        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_ref"), patch(
+        ), patch("agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.sync_git_refs"), patch(
             "agdt_ai_helpers.cli.azure_devops.pull_request_details_commands.get_diff_entries",
             return_value=[],
         ), patch(
@@ -0,0 +1,41 @@
+"""Shared helpers for rescaffold_planner tests."""
+
+from agentic_devtools.cli.azure_devops.review_state import (
+    FileEntry,
+    FolderGroup,
+    OverallSummary,
+    ReviewState,
+    ReviewStatus,
+)
+
+
+def make_entry(thread_id=100, status=ReviewStatus.APPROVED.value, summary="Previously reviewed", **kwargs):
+    """Build a FileEntry for a scaffolded file."""
+    return FileEntry(
+        threadId=thread_id,
+        commentId=1,
+        folder="src",
+        fileName="x.ts",
+        status=status,
+        summary=summary,
+        **kwargs,
+    )
+
+
+def make_state(files=None, overall_thread_id=500, activity_log_thread_id=999):
+    """Build a scaffolded ReviewState holding the given file entries."""
+    files = files if files is not None else {"/src/a.ts": make_entry()}
+    return ReviewState(
+        prId=12345,
+        repoId="repo-guid",
+        repoName="test-repo",
+        project="TestProject",
+        organization="https://dev.azure.com/testorg",
+        latestIterationId=1,
+        scaffoldedUtc="2026-01-01T00:00:00+00:00",
+        overallSummary=OverallSummary(threadId=overall_thread_id, commentId=1),
+        folders={"src": FolderGroup(files=sorted(files))},
+        files=files,
+        commitHash="old_hash",
+        activityLogThreadId=activity_log_thread_id,
+    )
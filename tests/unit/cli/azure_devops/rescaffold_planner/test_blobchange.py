@@ -0,0 +1,15 @@
+"""Tests for BlobChange dataclass."""
+
+from agentic_devtools.cli.azure_devops.rescaffold_planner import BlobChange
+
+
+class TestBlobChange:
+    """Tests for BlobChange."""
+
+    def test_content_changed_when_blobs_differ(self):
+        """A different blob ID means the content changed."""
+        assert BlobChange(old_blob="a", new_blob="b", status="M").content_changed is True
+
+    def test_mode_only_change_is_not_content_change(self):
+        """Same blob ID with a different mode is not a content change."""
+        assert BlobChange(old_blob="a", new_blob="a", status="M").content_changed is False
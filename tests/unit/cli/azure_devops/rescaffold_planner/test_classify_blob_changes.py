@@ -0,0 +1,42 @@
+"""Tests for classify_blob_changes function."""
+
+from agentic_devtools.cli.azure_devops.rescaffold_planner import BlobChange, classify_blob_changes
+from tests.unit.cli.azure_devops.rescaffold_planner._helpers import make_entry, make_state
+
+
+class TestClassifyBlobChanges:
+    """Tests for classify_blob_changes."""
+
+    def test_categorises_every_file(self):
+        """Files are new, modified, deleted or unchanged by state membership and blob change."""
+        state = make_state({"/src/a.ts": make_entry(), "/src/b.ts": make_entry(), "/src/gone.ts": make_entry()})
+        blob_changes = {
+            "/src/a.ts": BlobChange("1", "2", "M"),
+            "/src/new.ts": BlobChange("0", "3", "A"),
+            "/src/gone.ts": BlobChange("4", "0", "D"),
+        }
+
+        result = classify_blob_changes(state, ["src/a.ts", "/src/b.ts", "/src/new.ts"], blob_changes)
+
+        assert result.new_files == ["/src/new.ts"]
+        assert result.modified_files == ["/src/a.ts"]
+        assert result.deleted_files == ["/src/gone.ts"]
+        assert result.unchanged_files == ["/src/b.ts"]
+
+    def test_mode_only_change_is_unchanged(self):
+        """A file whose blob ID didn't change is unchanged."""
+        state = make_state({"/src/a.ts": make_entry()})
+
+        result = classify_blob_changes(state, ["/src/a.ts"], {"/src/a.ts": BlobChange("1", "1", "M")})
+
+        assert result.unchanged_files == ["/src/a.ts"]
+        assert result.modified_files == []
+
+    def test_new_file_in_state_is_not_new(self):
+        """A re-added file that still has a thread is modified, not new."""
+        state = make_state({"/src/a.ts": make_entry()})
+
+        result = classify_blob_changes(state, ["/src/a.ts"], {"/src/a.ts": BlobChange("0", "2", "A")})
+
+        assert result.new_files == []
+        assert result.modified_files == ["/src/a.ts"]
@@ -0,0 +1,141 @@
+"""Tests for execute_rescaffold_plan function."""
+
+import threading
+from itertools import count
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.rescaffold_planner import (
+    REMOVED_FILE_SUMMARY,
+    RescaffoldPlan,
+    execute_rescaffold_plan,
+)
+from agentic_devtools.cli.azure_devops.review_scaffold import FileChangeResult
+from agentic_devtools.cli.azure_devops.review_state import ReviewStatus, SuggestionEntry
+from tests.unit.cli.azure_devops.rescaffold_planner._helpers import make_entry, make_state
+
+_THREADS_URL = "https://dev.azure.com/testorg/TestProject/_apis/git/repositories/repo-guid/pullRequests/12345/threads"
+
+
+def _make_session(fail_post_for=None, fail_get=False):
+    """Session mock whose thread POSTs return increasing IDs."""
+    session = MagicMock()
+    ids = count(1000)
+    lock = threading.Lock()
+
+    def post(url, headers=None, json=None, timeout=None):
+        context = (json or {}).get("threadContext") or {}
+        if fail_post_for and context.get("filePath") == fail_post_for:
+            raise RuntimeError("POST failed")
+        with lock:
+            i = next(ids)
+        resp = MagicMock()
+        resp.json.return_value = {"id": i, "comments": [{"id": i + 1}]}
+        return resp
+
+    session.post.side_effect = post
+    get_resp = MagicMock()
+    get_resp.json.return_value = {"comments": [{"id": 1, "content": "Old content"}]}
+    session.get.side_effect = RuntimeError("GET failed") if fail_get else None
+    session.get.return_value = get_resp
+    return session
+
+
+def _execute(plan, state, session):
+    execute_rescaffold_plan(plan, state, session, {}, _THREADS_URL, "https://pr", "abc1234", max_workers=2)
+
+
+class TestExecuteRescaffoldPlan:
+    """Tests for execute_rescaffold_plan."""
+
+    def test_creates_threads_for_new_files(self, capsys):
+        """New files get a thread each and an unreviewed entry in review state."""
+        state = make_state()
+        plan = RescaffoldPlan(changes=FileChangeResult(new_files=["/src/b.ts", "/lib/c.ts"]))
+        session = _make_session()
+
+        _execute(plan, state, session)
+
+        assert session.post.call_count == 2
+        for path in ("/src/b.ts", "/lib/c.ts"):
+            entry = state.files[path]
+            assert entry.threadId >= 1000
+            assert entry.status == ReviewStatus.UNREVIEWED.value
+        assert state.files["/lib/c.ts"].folder == "lib"
+        assert state.files["/lib/c.ts"].fileName == "c.ts"
+        assert "Scaffolded new file thread for /src/b.ts." in capsys.readouterr().out
+
+    def test_demotes_only_planned_modified_files(self):
+        """Only planned files are demoted, but every modified file is reset."""
+        suggestion = SuggestionEntry(
+            threadId=7, commentId=1, line=1, endLine=1, severity="low", outOfScope=False, linkText="l", content="c"
+        )
+        state = make_state(
+            {
+                "/src/a.ts": make_entry(thread_id=100, suggestions=[suggestion]),
+                "/src/b.ts": make_entry(thread_id=200, status=ReviewStatus.UNREVIEWED.value, summary=None),
+            }
+        )
+        plan = RescaffoldPlan(
+            changes=FileChangeResult(modified_files=["/src/a.ts", "/src/b.ts"]), demote_modified=["/src/a.ts"]
+        )
+        session = _make_session()
+
+        _execute(plan, state, session)
+
+        session.get.assert_called_once_with(f"{_THREADS_URL}/100", headers={}, timeout=30)
+        session.patch.assert_called_once()
+        a = state.files["/src/a.ts"]
+        assert (a.status, a.summary, a.suggestions) == (ReviewStatus.UNREVIEWED.value, None, [])
+        assert a.previousSuggestions == [suggestion]
+
+    def test_marks_demoted_deleted_files_removed(self):
+        """Deleted files are demoted with a removal note and marked removed."""
+        state = make_state({"/src/gone.ts": make_entry()})
+        plan = RescaffoldPlan(changes=FileChangeResult(deleted_files=["/src/gone.ts"]), demote_deleted=["/src/gone.ts"])
+        session = _make_session()
+
+        _execute(plan, state, session)
+
+        assert "File removed in commit `abc1234`" in session.patch.call_args.kwargs["json"]["content"]
+        gone = state.files["/src/gone.ts"]
+        assert (gone.status, gone.summary) == (ReviewStatus.APPROVED.value, REMOVED_FILE_SUMMARY)
+
+    def test_demotion_failure_warns_and_still_resets(self, capsys):
+        """A failed demotion is reported and the file state is still updated."""
+        state = make_state({"/src/a.ts": make_entry(), "/src/gone.ts": make_entry()})
+        plan = RescaffoldPlan(
+            changes=FileChangeResult(modified_files=["/src/a.ts"], deleted_files=["/src/gone.ts"]),
+            demote_modified=["/src/a.ts"],
+            demote_deleted=["/src/gone.ts"],
+        )
+
+        _execute(plan, state, _make_session(fail_get=True))
+
+        err = capsys.readouterr().err
+        assert "Warning: Could not demote comment for /src/a.ts: GET failed" in err
+        assert "Warning: Could not demote comment for deleted /src/gone.ts: GET failed" in err
+        assert state.files["/src/a.ts"].status == ReviewStatus.UNREVIEWED.value
+        assert state.files["/src/gone.ts"].summary == REMOVED_FILE_SUMMARY
+
+    def test_post_failure_keeps_created_threads_and_raises(self):
+        """Threads created before a POST failure are recorded before the error is raised."""
+        state = make_state()
+        plan = RescaffoldPlan(changes=FileChangeResult(new_files=["/src/b.ts", "/src/c.ts"]))
+
+        with pytest.raises(RuntimeError, match="POST failed"):
+            _execute(plan, state, _make_session(fail_post_for="/src/b.ts"))
+
+        assert "/src/b.ts" not in state.files
+        assert state.files["/src/c.ts"].threadId >= 1000
+
+    def test_empty_plan_makes_no_calls(self):
+        """A plan with nothing to do makes no API calls."""
+        state = make_state()
+        session = _make_session()
+
+        _execute(RescaffoldPlan(changes=FileChangeResult(unchanged_files=["/src/a.ts"])), state, session)
+
+        session.post.assert_not_called()
+        session.get.assert_not_called()
@@ -0,0 +1,46 @@
+"""Tests for plan_rescaffold function."""
+
+from agentic_devtools.cli.azure_devops.rescaffold_planner import REMOVED_FILE_SUMMARY, plan_rescaffold
+from agentic_devtools.cli.azure_devops.review_scaffold import FileChangeResult
+from agentic_devtools.cli.azure_devops.review_state import ReviewStatus, SuggestionEntry
+from tests.unit.cli.azure_devops.rescaffold_planner._helpers import make_entry, make_state
+
+
+def _suggestion():
+    return SuggestionEntry(
+        threadId=7, commentId=1, line=1, endLine=1, severity="low", outOfScope=False, linkText="l", content="c"
+    )
+
+
+class TestPlanRescaffold:
+    """Tests for plan_rescaffold."""
+
+    def test_demotes_modified_files_with_review_progress(self):
+        """Reviewed, summarised or suggested files are demoted; pristine ones are not."""
+        unreviewed = ReviewStatus.UNREVIEWED.value
+        state = make_state(
+            {
+                "/src/approved.ts": make_entry(),
+                "/src/pristine.ts": make_entry(status=unreviewed, summary=None),
+                "/src/in_progress.ts": make_entry(status=ReviewStatus.IN_PROGRESS.value, summary=None),
+                "/src/suggested.ts": make_entry(status=unreviewed, summary=None, suggestions=[_suggestion()]),
+                "/src/no_thread.ts": make_entry(thread_id=0),
+            }
+        )
+        changes = FileChangeResult(modified_files=sorted(state.files))
+
+        plan = plan_rescaffold(state, changes)
+
+        assert plan.demote_modified == ["/src/approved.ts", "/src/in_progress.ts", "/src/suggested.ts"]
+        assert plan.skipped_demotions == 2
+
+    def test_skips_files_already_removed(self):
+        """Deleted files already marked removed aren't demoted again."""
+        removed = make_entry(status=ReviewStatus.APPROVED.value, summary=REMOVED_FILE_SUMMARY)
+        state = make_state({"/src/gone.ts": make_entry(), "/src/old.ts": removed})
+        changes = FileChangeResult(deleted_files=["/src/gone.ts", "/src/old.ts"])
+
+        plan = plan_rescaffold(state, changes, source="iterations")
+
+        assert plan.demote_deleted == ["/src/gone.ts"]
+        assert plan.source == "iterations"
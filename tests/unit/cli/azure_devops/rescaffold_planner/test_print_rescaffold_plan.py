@@ -0,0 +1,35 @@
+"""Tests for print_rescaffold_plan function."""
+
+from agentic_devtools.cli.azure_devops.rescaffold_planner import RescaffoldPlan, print_rescaffold_plan
+from agentic_devtools.cli.azure_devops.review_scaffold import FileChangeResult
+from tests.unit.cli.azure_devops.rescaffold_planner._helpers import make_state
+
+
+class TestPrintRescaffoldPlan:
+    """Tests for print_rescaffold_plan."""
+
+    def test_prints_files_and_estimate(self, capsys):
+        """Lists every file, marks skipped demotions and prints the API call estimate."""
+        plan = RescaffoldPlan(
+            changes=FileChangeResult(
+                new_files=["/src/new.ts"],
+                modified_files=["/src/a.ts", "/src/b.ts"],
+                deleted_files=["/src/gone.ts", "/src/old.ts"],
+                unchanged_files=["/src/same.ts"],
+            ),
+            demote_modified=["/src/a.ts"],
+            demote_deleted=["/src/gone.ts"],
+        )
+
+        print_rescaffold_plan(plan, make_state(), 12345, "abc1234")
+
+        out = capsys.readouterr().out
+        assert "[DRY RUN] Would re-scaffold PR 12345 for commit abc1234" in out
+        assert "[DRY RUN] New file: /src/new.ts" in out
+        assert "[DRY RUN] Modified file: /src/a.ts\n" in out
+        assert "[DRY RUN] Modified file: /src/b.ts (no demotion needed)" in out
+        assert "[DRY RUN] Deleted file: /src/gone.ts\n" in out
+        assert "[DRY RUN] Deleted file: /src/old.ts (already removed)" in out
+        assert "[DRY RUN] Unchanged file: /src/same.ts" in out
+        assert "Changes detected via git; 2 demotion(s) skipped" in out
+        assert "[DRY RUN] Estimated API calls: 13" in out
@@ -0,0 +1,71 @@
+"""Tests for read_blob_changes function."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.azure_devops.rescaffold_planner import read_blob_changes
+
+# run_safe is imported locally inside read_blob_changes, so we patch it at
+# the source module.
+_RUN_SAFE_PATH = "agentic_devtools.cli.subprocess_utils.run_safe"
+
+_OLD = "a" * 40
+_NEW = "b" * 40
+_ZERO = "0" * 40
+
+
+def _proc(stdout="", returncode=0):
+    proc = MagicMock()
+    proc.returncode = returncode
+    proc.stdout = stdout
+    return proc
+
+
+class TestReadBlobChanges:
+    """Tests for read_blob_changes."""
+
+    def test_parses_raw_entries(self):
+        """Each -z entry maps the normalised path to its old and new blob IDs."""
+        stdout = (
+            f":100644 100644 {_OLD} {_NEW} M\0src/a.ts\0"
+            f":000000 100644 {_ZERO} {_NEW} A\0src/dir with space/b.ts\0"
+            f":100644 000000 {_OLD} {_ZERO} D\0c.md\0"
+        )
+        with patch(_RUN_SAFE_PATH, return_value=_proc(stdout)) as mock_run:
+            changes = read_blob_changes("old", "new")
+
+        assert sorted(changes) == ["/c.md", "/src/a.ts", "/src/dir with space/b.ts"]
+        assert (changes["/src/a.ts"].old_blob, changes["/src/a.ts"].new_blob) == (_OLD, _NEW)
+        assert changes["/src/dir with space/b.ts"].status == "A"
+        assert changes["/c.md"].status == "D"
+        args = mock_run.call_args.args[0]
+        assert args[:3] == ["git", "diff", "--raw"]
+        assert args[-2:] == ["old", "new"]
+        assert "--no-renames" in args
+
+    def test_empty_diff_returns_empty_dict(self):
+        """No changed files yields an empty mapping (not None)."""
+        with patch(_RUN_SAFE_PATH, return_value=_proc("")):
+            assert read_blob_changes("old", "new") == {}
+
+    def test_skips_malformed_entries(self):
+        """Entries without the five raw fields are ignored."""
+        stdout = f":100644 {_OLD} M\0src/a.ts\0:100644 100644 {_OLD} {_NEW} M\0src/b.ts\0"
+        with patch(_RUN_SAFE_PATH, return_value=_proc(stdout)):
+            assert list(read_blob_changes("old", "new")) == ["/src/b.ts"]
+
+    def test_returns_none_on_git_error(self):
+        """A failing git diff (e.g. unknown commit) returns None."""
+        with patch(_RUN_SAFE_PATH, return_value=_proc(returncode=128)):
+            assert read_blob_changes("old", "new") is None
+
+    def test_returns_none_when_git_missing(self):
+        """An exception running git returns None."""
+        with patch(_RUN_SAFE_PATH, side_effect=FileNotFoundError("git")):
+            assert read_blob_changes("old", "new") is None
+
+    def test_returns_none_without_both_commits(self):
+        """Missing commit hashes return None without running git."""
+        with patch(_RUN_SAFE_PATH) as mock_run:
+            assert read_blob_changes("", "new") is None
+            assert read_blob_changes("old", "") is None
+        mock_run.assert_not_called()
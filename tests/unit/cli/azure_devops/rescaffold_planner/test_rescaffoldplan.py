@@ -0,0 +1,38 @@
+"""Tests for RescaffoldPlan dataclass."""
+
+from agentic_devtools.cli.azure_devops.rescaffold_planner import RescaffoldPlan
+from agentic_devtools.cli.azure_devops.review_scaffold import FileChangeResult
+from agentic_devtools.cli.azure_devops.review_state import SuggestionEntry
+from tests.unit.cli.azure_devops.rescaffold_planner._helpers import make_entry, make_state
+
+
+class TestRescaffoldPlan:
+    """Tests for RescaffoldPlan."""
+
+    def test_estimate_counts_posts_and_demotions(self):
+        """One POST per new file, three calls per demotion, overall summary and activity log."""
+        state = make_state()
+        plan = RescaffoldPlan(
+            changes=FileChangeResult(new_files=["/n1", "/n2"], modified_files=["/m1", "/m2"], deleted_files=["/d"]),
+            demote_modified=["/m1"],
+            demote_deleted=["/d"],
+        )
+
+        assert plan.estimate_api_calls(state) == 2 + 3 * 2 + 3 + 3
+        assert plan.skipped_demotions == 1
+
+    def test_estimate_without_summary_or_activity_log_threads(self):
+        """Missing overall summary and activity log threads cost nothing."""
+        state = make_state(overall_thread_id=0, activity_log_thread_id=None)
+        plan = RescaffoldPlan(changes=FileChangeResult(new_files=["/n1"]))
+
+        assert plan.estimate_api_calls(state) == 1
+
+    def test_estimate_counts_verification_lookup(self):
+        """Files with previous suggestions add the verification gate's thread lookup."""
+        suggestion = SuggestionEntry(
+            threadId=7, commentId=1, line=1, endLine=1, severity="low", outOfScope=False, linkText="l", content="c"
+        )
+        state = make_state({"/src/a.ts": make_entry(previousSuggestions=[suggestion])}, 0, None)
+
+        assert RescaffoldPlan(changes=FileChangeResult()).estimate_api_calls(state) == 1
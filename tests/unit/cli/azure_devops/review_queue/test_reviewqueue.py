@@ -0,0 +1,135 @@
+"""Tests for ReviewQueue class."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.review_queue import (
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SUBMISSION_PENDING,
+    ReviewQueue,
+)
+
+
+def _write_queue(path, pending, completed=None):
+    path.write_text(json.dumps({"pending": pending, "completed": completed or []}), encoding="utf-8")
+    return path
+
+
+class TestReviewQueue:
+    """Tests for ReviewQueue class."""
+
+    def test_indexes_paths_case_insensitively(self, tmp_path):
+        """Should find an entry by any spelling of its path."""
+        queue = ReviewQueue.load(_write_queue(tmp_path / "queue.json", [{"path": "/Src/App.ts", "status": "pending"}]))
+        assert queue.find("src\\app.ts") is queue.pending[0]
+        assert queue.find("/other.ts") is None
+        assert queue.find("") is None
+
+    def test_first_duplicate_wins(self, tmp_path):
+        """Should index the first of duplicate entries for a file."""
+        queue = ReviewQueue(tmp_path / "queue.json", {"pending": [{"path": "/a"}, {"path": "a", "n": 2}]})
+        assert queue.find("/a") is queue.pending[0]
+
+    def test_counts_by_status(self, tmp_path):
+        """Should count entries per status, treating unknown statuses as pending."""
+        queue = ReviewQueue(
+            tmp_path / "queue.json",
+            {
+                "pending": [
+                    {"path": "/a", "status": "pending"},
+                    {"path": "/b"},
+                    {"path": "/c", "status": "in-progress"},
+                    {"path": "/d", "status": "submission-pending"},
+                    {"path": "/e", "status": "failed"},
+                ],
+                "completed": [{"path": "/f"}],
+            },
+        )
+        assert queue.count(STATUS_PENDING) == 3
+        assert queue.count(STATUS_SUBMISSION_PENDING) == 1
+        assert queue.count(STATUS_FAILED) == 1
+        assert queue.count(STATUS_COMPLETED) == 1
+        assert [e["path"] for e in queue.entries_with_status(STATUS_FAILED)] == ["/e"]
+        assert queue.next_pending()["path"] == "/a"
+
+    def test_empty_queue(self, tmp_path):
+        """Should answer queries on a queue without pending entries."""
+        queue = ReviewQueue(tmp_path / "queue.json", {})
+        assert queue.next_pending() is None
+        assert queue.entries_with_status(STATUS_FAILED) == []
+        assert queue.data == {"pending": [], "completed": []}
+
+    def test_status_changes_update_counts(self, tmp_path):
+        """Should keep counts in step through submit, fail, reset and complete."""
+        queue = ReviewQueue(tmp_path / "queue.json", {"pending": [{"path": "/a", "status": "pending"}]})
+        entry = queue.find("/a")
+
+        queue.mark_submission_pending(entry, "task-1", "Approve")
+        assert (queue.count(STATUS_PENDING), queue.count(STATUS_SUBMISSION_PENDING)) == (0, 1)
+        assert entry["taskId"] == "task-1" and entry["outcome"] == "Approve"
+
+        queue.mark_failed(entry, "boom")
+        assert queue.count(STATUS_FAILED) == 1
+        assert entry["errorMessage"] == "boom"
+
+        queue.reset(entry)
+        assert queue.count(STATUS_PENDING) == 1
+        assert entry == {"path": "/a", "status": "pending"}
+
+        queue.mark_submission_pending(entry, "task-2", "Changes")
+        queue.complete(entry)
+        assert queue.count(STATUS_SUBMISSION_PENDING) == 0
+        assert queue.pending == []
+        assert queue.completed == [entry]
+        assert entry["status"] == "completed"
+        assert entry["outcome"] == "Changes"
+        assert "taskId" not in entry
+        assert queue.find("/a") is None
+        assert queue.modified
+
+    def test_complete_reindexes_duplicate(self, tmp_path):
+        """Should index the remaining duplicate after completing the first."""
+        queue = ReviewQueue(tmp_path / "queue.json", {"pending": [{"path": "/a"}, {"path": "/b"}, {"path": "A"}]})
+        queue.complete(queue.find("/a"), "Approve")
+        assert queue.find("/a")["path"] == "A"
+
+    def test_locked_saves_changes_atomically(self, tmp_path):
+        """Should write modifications back when the locked block exits."""
+        path = _write_queue(tmp_path / "queue.json", [{"path": "/a", "status": "pending"}])
+
+        with ReviewQueue.locked(path) as queue:
+            queue.complete(queue.find("/a"), "Approve")
+
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert saved["pending"] == []
+        assert saved["completed"][0]["outcome"] == "Approve"
+        assert "lastUpdatedUtc" in saved
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["queue.json", "queue.json.lock"]
+
+    def test_locked_without_changes_does_not_write(self, tmp_path):
+        """Should leave the file alone when nothing changed."""
+        path = _write_queue(tmp_path / "queue.json", [])
+        before = path.read_text(encoding="utf-8")
+
+        with ReviewQueue.locked(path) as queue:
+            queue.find("/a")
+
+        assert path.read_text(encoding="utf-8") == before
+
+    def test_failed_save_keeps_original(self, tmp_path):
+        """Should leave the original file and no temp file when the write fails."""
+        path = _write_queue(tmp_path / "queue.json", [{"path": "/a"}])
+        before = path.read_text(encoding="utf-8")
+        queue = ReviewQueue.load(path)
+        queue.touch()
+
+        with patch("agentic_devtools.cli.azure_devops.review_queue.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                queue.save()
+
+        assert path.read_text(encoding="utf-8") == before
+        assert [p.name for p in tmp_path.iterdir()] == ["queue.json"]
@@ -3,6 +3,8 @@
 from itertools import count
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from agentic_devtools.cli.azure_devops.config import AzureDevOpsConfig
 from agentic_devtools.cli.azure_devops.review_scaffold import _incremental_rescaffold
 from agentic_devtools.cli.azure_devops.review_state import (
@@ -21,6 +23,13 @@ _REPO_ID = "repo-guid"
 _PR_ID = 12345
 
 
+@pytest.fixture(autouse=True)
+def _no_local_git_diff():
+    """Detect changes via (mocked) detect_file_changes, as when the commits aren't available locally."""
+    with patch("agentic_devtools.cli.azure_devops.rescaffold_planner.read_blob_changes", return_value=None):
+        yield
+
+
 def _make_config():
     return AzureDevOpsConfig(organization=_ORG, project=_PROJECT, repository=_REPO)
 
@@ -72,6 +81,8 @@ class TestIncrementalRescaffold:
     def _run_rescaffold(self, existing_state, current_files, changed_paths=None):
         """Run _incremental_rescaffold with mocked detect_file_changes."""
         requests_mock = MagicMock()
+        # Thread operations go through a pooled session; route it back to the mock
+        requests_mock.Session.return_value = requests_mock
         id_gen = count(1000)
 
         def make_resp(*args, **kwargs):
@@ -253,6 +264,21 @@ class TestIncrementalRescaffold:
 
         assert result.commitHash == "new_hash"
 
+    def test_detects_changes_from_local_git_diff(self):
+        """Blob changes from git diff are used instead of the iterations API when available."""
+        from agentic_devtools.cli.azure_devops.rescaffold_planner import BlobChange
+
+        existing = _make_existing_state(files=["/src/a.ts", "/src/b.ts"])
+        blob_changes = {"/src/a.ts": BlobChange(old_blob="1", new_blob="2", status="M")}
+        with patch(
+            "agentic_devtools.cli.azure_devops.rescaffold_planner.read_blob_changes", return_value=blob_changes
+        ) as mock_read:
+            result, _, _ = self._run_rescaffold(existing, ["/src/a.ts", "/src/b.ts"], changed_paths=["/src/b.ts"])
+
+        mock_read.assert_called_once_with("old_hash", "new_hash")
+        assert result.files["/src/a.ts"].status == ReviewStatus.UNREVIEWED.value
+        assert result.files["/src/b.ts"].status == ReviewStatus.APPROVED.value
+
 
 class TestIncrementalRescaffoldDryRun:
     """Tests for dry-run mode in _incremental_rescaffold."""
@@ -324,6 +350,8 @@ class TestIncrementalRescaffoldExceptionHandling:
     def _make_failing_requests_mock(self):
         """Create a requests mock where GET always fails."""
         requests_mock = MagicMock()
+        # Thread operations go through a pooled session; route it back to the mock
+        requests_mock.Session.return_value = requests_mock
         requests_mock.get.side_effect = Exception("Network error")
         post_resp = MagicMock()
         post_resp.raise_for_status = MagicMock()
@@ -383,6 +411,8 @@ class TestIncrementalRescaffoldExceptionHandling:
 
         existing = _make_existing_state(files=["/src/a.ts"])
         requests_mock = MagicMock()
+        # Thread operations go through a pooled session; route it back to the mock
+        requests_mock.Session.return_value = requests_mock
         call_count = [0]
 
         def get_side_effect(*args, **kwargs):
@@ -502,6 +532,8 @@ class TestIncrementalRescaffoldVerificationGate:
     ):
         """Run _incremental_rescaffold with mocked verification functions."""
         requests_mock = MagicMock()
+        # Thread operations go through a pooled session; route it back to the mock
+        requests_mock.Session.return_value = requests_mock
         id_gen = count(1000)
 
         def make_resp(*args, **kwargs):
@@ -802,6 +834,8 @@ class TestIncrementalRescaffoldVerificationGate:
         )
 
         requests_mock = MagicMock()
+        # Thread operations go through a pooled session; route it back to the mock
+        requests_mock.Session.return_value = requests_mock
         # POST fails (thread comment + activity log)
         requests_mock.post.side_effect = Exception("API error")
         get_resp = MagicMock()
@@ -866,11 +900,13 @@ class TestIncrementalRescaffoldVerificationGate:
         )
 
         requests_mock = MagicMock()
+        # Thread operations go through a pooled session; route it back to the mock
+        requests_mock.Session.return_value = requests_mock
         post_resp = MagicMock()
         post_resp.raise_for_status = MagicMock()
         post_resp.json.return_value = {"id": 999, "comments": [{"id": 1}]}
         requests_mock.post.return_value = post_resp
-        # GET fails (used by _demote_main_comment for abort summary)
+        # GET fails (used by demote_main_comment for abort summary)
         requests_mock.get.side_effect = Exception("GET error")
 
         save_mock = MagicMock()
@@ -9,7 +9,7 @@ class TestPostActivityLogEntry:
     """Tests for _post_activity_log_entry."""
 
     def _setup_mocks(self, old_content="Previous entry", reply_id=99):
-        """Build requests mock for the underlying _demote_main_comment call."""
+        """Build requests mock for the underlying demote_main_comment call."""
         requests_mock = MagicMock()
 
         get_resp = MagicMock()
@@ -29,10 +29,10 @@ class TestPostActivityLogEntry:
         return requests_mock
 
     def test_delegates_to_demote_main_comment(self):
-        """Calls _demote_main_comment with the correct arguments."""
+        """Calls demote_main_comment with the correct arguments."""
         requests_mock = self._setup_mocks()
 
-        with patch("agentic_devtools.cli.azure_devops.review_scaffold._demote_main_comment") as mock_demote:
+        with patch("agentic_devtools.cli.azure_devops.review_scaffold.demote_main_comment") as mock_demote:
             mock_demote.return_value = 42
             _post_activity_log_entry(
                 requests_mock, {"Auth": "token"}, "https://api/threads", 10, 1, "New entry content"
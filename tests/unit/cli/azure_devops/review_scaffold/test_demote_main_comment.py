@@ -1,12 +1,12 @@
-"""Tests for _demote_main_comment helper function."""
+"""Tests for demote_main_comment helper function."""
 
 from unittest.mock import MagicMock
 
-from agentic_devtools.cli.azure_devops.review_scaffold import _demote_main_comment
+from agentic_devtools.cli.azure_devops.review_scaffold import demote_main_comment
 
 
 class TestDemoteMainComment:
-    """Tests for _demote_main_comment helper."""
+    """Tests for demote_main_comment helper."""
 
     def _setup_mocks(self, old_content="Previous content", reply_id=99):
         """Build requests mock with GET→POST→PATCH configured."""
@@ -35,7 +35,7 @@ class TestDemoteMainComment:
         """Returns the comment ID of the newly-created reply."""
         requests_mock = self._setup_mocks(reply_id=42)
 
-        result = _demote_main_comment(
+        result = demote_main_comment(
             requests_mock,
             {},
             "https://api/threads",
@@ -50,7 +50,7 @@ class TestDemoteMainComment:
         """Step 1: GETs the thread to read the current main comment."""
         requests_mock = self._setup_mocks()
 
-        _demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "New content")
+        demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "New content")
 
         requests_mock.get.assert_called_once()
         url = requests_mock.get.call_args[0][0]
@@ -60,7 +60,7 @@ class TestDemoteMainComment:
         """Step 2: Posts the old main comment content as a reply."""
         requests_mock = self._setup_mocks(old_content="Old review text")
 
-        _demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "New content")
+        demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "New content")
 
         post_call = requests_mock.post.call_args
         assert post_call[0][0] == "https://api/threads/10/comments"
@@ -70,7 +70,7 @@ class TestDemoteMainComment:
         """Step 3: PATCHes the main comment with new content."""
         requests_mock = self._setup_mocks()
 
-        _demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "Fresh content")
+        demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "Fresh content")
 
         patch_call = requests_mock.patch.call_args
         assert patch_call[0][0] == "https://api/threads/10/comments/1"
@@ -97,7 +97,7 @@ class TestDemoteMainComment:
         requests_mock.post.side_effect = _post
         requests_mock.patch.side_effect = _patch
 
-        _demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "New")
+        demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "New")
 
         assert call_order == ["GET", "POST", "PATCH"]
 
@@ -118,7 +118,7 @@ class TestDemoteMainComment:
         patch_resp.raise_for_status = MagicMock()
         requests_mock.patch.return_value = patch_resp
 
-        result = _demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "New")
+        result = demote_main_comment(requests_mock, {}, "https://api/threads", 10, 1, "New")
 
         # Should still work, posting empty string as old content
         assert result == 50
@@ -1,8 +1,8 @@
-"""Tests for _post_thread helper."""
+"""Tests for post_thread helper."""
 
 from unittest.mock import MagicMock
 
-from agentic_devtools.cli.azure_devops.review_scaffold import _post_thread
+from agentic_devtools.cli.azure_devops.review_scaffold import post_thread
 
 
 def _make_post_response(thread_id: int, comment_id: int) -> MagicMock:
@@ -17,14 +17,14 @@ def _make_post_response(thread_id: int, comment_id: int) -> MagicMock:
 
 
 class TestPostThread:
-    """Tests for _post_thread helper."""
+    """Tests for post_thread helper."""
 
     def test_returns_thread_and_comment_id(self):
         """Returns (thread_id, comment_id) from API response."""
         requests_mock = MagicMock()
         requests_mock.post.return_value = _make_post_response(thread_id=100, comment_id=200)
 
-        thread_id, comment_id = _post_thread(requests_mock, {}, "https://url", "content")
+        thread_id, comment_id = post_thread(requests_mock, {}, "https://url", "content")
 
         assert thread_id == 100
         assert comment_id == 200
@@ -34,7 +34,7 @@ class TestPostThread:
         requests_mock = MagicMock()
         requests_mock.post.return_value = _make_post_response(1, 2)
 
-        _post_thread(requests_mock, {}, "https://url", "content", file_path=None)
+        post_thread(requests_mock, {}, "https://url", "content", file_path=None)
 
         call_kwargs = requests_mock.post.call_args[1]
         body = call_kwargs["json"]
@@ -45,7 +45,7 @@ class TestPostThread:
         requests_mock = MagicMock()
         requests_mock.post.return_value = _make_post_response(1, 2)
 
-        _post_thread(requests_mock, {}, "https://url", "content", file_path="/src/file.ts")
+        post_thread(requests_mock, {}, "https://url", "content", file_path="/src/file.ts")
 
         call_kwargs = requests_mock.post.call_args[1]
         body = call_kwargs["json"]
@@ -57,7 +57,7 @@ class TestPostThread:
         resp = _make_post_response(1, 2)
         requests_mock.post.return_value = resp
 
-        _post_thread(requests_mock, {}, "https://url", "content")
+        post_thread(requests_mock, {}, "https://url", "content")
 
         resp.raise_for_status.assert_called_once()
 
@@ -66,7 +66,7 @@ class TestPostThread:
         requests_mock = MagicMock()
         requests_mock.post.return_value = _make_post_response(1, 2)
 
-        _post_thread(requests_mock, {}, "https://url", "content")
+        post_thread(requests_mock, {}, "https://url", "content")
 
         body = requests_mock.post.call_args[1]["json"]
         assert body["status"] == "active"
@@ -76,7 +76,7 @@ class TestPostThread:
         requests_mock = MagicMock()
         requests_mock.post.return_value = _make_post_response(1, 2)
 
-        _post_thread(requests_mock, {}, "https://url", "my comment")
+        post_thread(requests_mock, {}, "https://url", "my comment")
 
         body = requests_mock.post.call_args[1]["json"]
         assert body["comments"][0]["commentType"] == "text"
@@ -0,0 +1,49 @@
+"""Tests for _slotted decorator."""
+
+from dataclasses import dataclass, field
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.review_state import FileEntry, SuggestionEntry, _slotted
+
+
+class TestSlotted:
+    """Tests for _slotted decorator."""
+
+    def test_adds_slots_for_fields(self):
+        """Test that the recreated class declares a slot per field and has no instance dict."""
+
+        @_slotted
+        @dataclass
+        class Sample:
+            name: str
+            count: int = 0
+            tags: list = field(default_factory=list)
+
+        sample = Sample("a")
+        assert Sample.__slots__ == ("name", "count", "tags")
+        assert not hasattr(sample, "__dict__")
+        assert (sample.name, sample.count, sample.tags) == ("a", 0, [])
+
+    def test_rejects_unknown_attributes(self):
+        """Test that setting an attribute that is not a field raises AttributeError."""
+        entry = SuggestionEntry(
+            threadId=1,
+            commentId=2,
+            line=3,
+            endLine=3,
+            severity="low",
+            outOfScope=False,
+            linkText="line 3",
+            content="x",
+        )
+        with pytest.raises(AttributeError):
+            entry.notAField = True
+
+    def test_defaults_and_equality_preserved(self):
+        """Test that field defaults and dataclass equality still work on schema classes."""
+        a = FileEntry(threadId=1, commentId=2, folder="src", fileName="a.py")
+        b = FileEntry(threadId=1, commentId=2, folder="src", fileName="a.py")
+        assert a == b
+        assert a.status == "unreviewed"
+        assert a.suggestions is not b.suggestions
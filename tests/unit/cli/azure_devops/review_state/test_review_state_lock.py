@@ -0,0 +1,44 @@
+"""Tests for review_state_lock context manager."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops import review_state as rs_module
+from agentic_devtools.cli.azure_devops.review_state import review_state_lock
+from agentic_devtools.file_locking import FileLockError, locked_file
+
+
+class TestReviewStateLock:
+    """Tests for review_state_lock context manager."""
+
+    def test_locks_file_next_to_review_state(self, tmp_path):
+        """Test the lock file sits next to review-state.json and is held inside the block."""
+        lock_path = tmp_path / "pull-request-review" / "prompts" / "42" / "review-state.json.lock"
+        with patch.object(rs_module, "get_state_dir", return_value=tmp_path):
+            with review_state_lock(42):
+                assert lock_path.is_file()
+                with pytest.raises(FileLockError):
+                    with locked_file(lock_path, "a", timeout=0.05):
+                        pass
+
+        with locked_file(lock_path, "a", timeout=0.05):
+            pass
+
+    def test_raises_when_held_too_long(self, tmp_path):
+        """Test FileLockError is raised when another holder keeps the lock past the timeout."""
+        lock_path = tmp_path / "pull-request-review" / "prompts" / "42" / "review-state.json.lock"
+        with patch.object(rs_module, "get_state_dir", return_value=tmp_path):
+            with patch.object(rs_module, "REVIEW_STATE_LOCK_TIMEOUT", 0.05):
+                with locked_file(lock_path, "a"):
+                    with pytest.raises(FileLockError):
+                        with review_state_lock(42):
+                            pass
+
+    def test_locks_are_per_pull_request(self, tmp_path):
+        """Test holding one PR's lock doesn't block another PR's."""
+        with patch.object(rs_module, "get_state_dir", return_value=tmp_path):
+            with patch.object(rs_module, "REVIEW_STATE_LOCK_TIMEOUT", 0.05):
+                with review_state_lock(42):
+                    with review_state_lock(43):
+                        pass
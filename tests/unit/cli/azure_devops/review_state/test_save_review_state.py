@@ -124,3 +124,12 @@ class TestSaveReviewState:
             expected_path = tmp_path / "pull-request-review" / "prompts" / "25365" / "review-state.json"
             data = json.loads(expected_path.read_text(encoding="utf-8"))
             assert data["overallSummary"]["narrativeSummary"] == "Great PR"
+
+    def test_writes_compact_json(self, tmp_path):
+        """Test that the state is written without indentation or padding."""
+        with patch.object(rs_module, "get_state_dir", return_value=tmp_path):
+            save_review_state(_make_review_state())
+
+            content = (tmp_path / "pull-request-review" / "prompts" / "25365" / "review-state.json").read_text()
+            assert "\n" not in content
+            assert '"prId":25365,' in content
@@ -0,0 +1,13 @@
+"""Shared fixtures for review_templates tests."""
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.review_templates import clear_render_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_render_cache():
+    """Keep rendered fragments (possibly from patched helpers) from leaking between tests."""
+    clear_render_cache()
+    yield
+    clear_render_cache()
@@ -0,0 +1,23 @@
+"""Tests for _cache_put function."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure_devops.review_templates import _cache_put
+
+
+class TestCachePut:
+    """Tests for _cache_put."""
+
+    def test_stores_and_returns_value(self):
+        """Test that the fragment is stored under its key and returned."""
+        cache: dict = {}
+        assert _cache_put(cache, ("a",), "text") == "text"
+        assert cache == {("a",): "text"}
+
+    def test_resets_full_cache(self):
+        """Test that a full cache is emptied before the new fragment is stored."""
+        cache: dict = {("a",): "1", ("b",): "2"}
+        with patch("agentic_devtools.cli.azure_devops.review_templates.FRAGMENT_CACHE_SIZE", 2):
+            _cache_put(cache, ("c",), "3")
+
+        assert cache == {("c",): "3"}
@@ -0,0 +1,24 @@
+"""Tests for clear_render_cache function."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure_devops.review_state import FileEntry
+from agentic_devtools.cli.azure_devops.review_templates import clear_render_cache, render_file_summary
+
+_BASE_URL = "https://dev.azure.com/org/proj/_git/repo/pullRequest/42"
+
+
+class TestClearRenderCache:
+    """Tests for clear_render_cache."""
+
+    def test_forces_rerender(self):
+        """Test that a file is rendered again after the cache is cleared."""
+        fe = FileEntry(threadId=1, commentId=2, folder="src", fileName="app.py")
+        render_file_summary(fe, [], _BASE_URL)
+        clear_render_cache()
+
+        with patch("agentic_devtools.cli.azure_devops.review_templates.format_status", return_value="X") as mock_format:
+            result = render_file_summary(fe, [], _BASE_URL)
+
+        mock_format.assert_called_once()
+        assert "*Status:* X" in result
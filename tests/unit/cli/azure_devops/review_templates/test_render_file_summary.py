@@ -1,5 +1,7 @@
 """Tests for render_file_summary function."""
 
+from unittest.mock import patch
+
 from agentic_devtools.cli.azure_devops.review_state import (
     ConsolidationStatus,
     FileEntry,
@@ -308,3 +310,24 @@ class TestRenderFileSummary:
         )
         result = render_file_summary(fe, [], _BASE_URL, boss_model="Boss Model")
         assert "*🔃 Consolidation underway by Boss Model*" in result
+
+    def test_reuses_cached_render(self):
+        """Test that re-rendering an unchanged file is served from the fragment cache."""
+        fe = _make_file_entry(status=ReviewStatus.APPROVED.value, summary="Fine")
+        first = render_file_summary(fe, [], _BASE_URL)
+
+        with patch("agentic_devtools.cli.azure_devops.review_templates.format_status") as mock_format:
+            second = render_file_summary(fe, [], _BASE_URL)
+
+        mock_format.assert_not_called()
+        assert second == first
+
+    def test_rerenders_after_change(self):
+        """Test that changing the entry's verdicts invalidates its cached render."""
+        fe = _make_file_entry(status=ReviewStatus.IN_PROGRESS.value)
+        render_file_summary(fe, [], _BASE_URL)
+
+        fe.modelVerdicts.append(ModelVerdict(modelId="model-a", status=ReviewStatus.APPROVED.value))
+        result = render_file_summary(fe, [], _BASE_URL)
+
+        assert "| model-a | ✅ Approved |" in result
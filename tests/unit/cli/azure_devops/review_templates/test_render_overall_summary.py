@@ -1,5 +1,7 @@
 """Tests for render_overall_summary function."""
 
+from unittest.mock import patch
+
 from agentic_devtools.cli.azure_devops.review_state import (
     FileEntry,
     FolderGroup,
@@ -435,3 +437,27 @@ class TestRenderOverallSummary:
         mango_pos = result.index("mango.py")
         zebra_pos = result.index("zebra.py")
         assert alpha_pos < mango_pos < zebra_pos
+
+    def test_reuses_cached_file_lines(self):
+        """Test that an unchanged file's line is served from the fragment cache."""
+        state = _make_state({"src": [("app.py", "approved"), ("util.py", "unreviewed")]})
+        render_overall_summary(state, _BASE_URL)
+
+        with patch(
+            "agentic_devtools.cli.azure_devops.review_templates.build_discussion_url",
+            wraps=build_discussion_url,
+        ) as mock_url:
+            state.files["/src/util.py"].status = "in-progress"
+            result = render_overall_summary(state, _BASE_URL)
+
+        mock_url.assert_called_once_with(_BASE_URL, 11, 21)
+        assert "🔃 [/src/util.py]" in result
+
+    def test_cached_line_reflects_new_suggestions(self):
+        """Test that adding a suggestion to a needs-work file updates its severity counts."""
+        state = _make_state({"src": [("app.py", "needs-work")]})
+        state.files["/src/app.py"].suggestions.append(_make_suggestion("high"))
+        assert "1 High" in render_overall_summary(state, _BASE_URL)
+
+        state.files["/src/app.py"].suggestions.append(_make_suggestion("low"))
+        assert "1 High, 1 Low" in render_overall_summary(state, _BASE_URL)
@@ -0,0 +1,27 @@
+"""Shared fixtures for submission_outbox tests."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def outbox_state_dir(tmp_path):
+    """Point the outbox and review state at a temporary state directory."""
+    with patch("agentic_devtools.cli.azure_devops.submission_outbox.get_state_dir", return_value=tmp_path):
+        with patch("agentic_devtools.cli.azure_devops.review_state.get_state_dir", return_value=tmp_path):
+            yield tmp_path
+
+
+def read_outbox(state_dir, pull_request_id=42):
+    """Read a PR's outbox.json from a state directory."""
+    path = state_dir / "pull-request-review" / "prompts" / str(pull_request_id) / "outbox.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_outbox(state_dir, data, pull_request_id=42):
+    """Write a PR's outbox.json into a state directory."""
+    path = state_dir / "pull-request-review" / "prompts" / str(pull_request_id) / "outbox.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
@@ -0,0 +1,27 @@
+"""Tests for _drainer_running function."""
+
+from datetime import datetime, timedelta, timezone
+
+from agentic_devtools.cli.azure_devops.submission_outbox import DRAINER_STALE_SECONDS, _drainer_running
+
+
+class TestDrainerRunning:
+    """Tests for _drainer_running function."""
+
+    def test_false_without_start_time(self):
+        """Should report no drainer when the flag is unset."""
+        assert _drainer_running({"drainerStartedUtc": None}) is False
+
+    def test_true_for_recent_start(self):
+        """Should report a drainer that started recently as running."""
+        started = datetime.now(timezone.utc).isoformat()
+        assert _drainer_running({"drainerStartedUtc": started}) is True
+
+    def test_false_for_stale_start(self):
+        """Should treat a drainer older than the stale limit as dead."""
+        started = datetime.now(timezone.utc) - timedelta(seconds=DRAINER_STALE_SECONDS + 1)
+        assert _drainer_running({"drainerStartedUtc": started.isoformat()}) is False
+
+    def test_false_for_unparseable_start(self):
+        """Should treat a malformed start time as no drainer."""
+        assert _drainer_running({"drainerStartedUtc": "yesterday"}) is False
@@ -0,0 +1,49 @@
+"""Tests for _locked_outbox context manager."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.submission_outbox import _locked_outbox
+
+from .conftest import read_outbox, write_outbox
+
+
+class TestLockedOutbox:
+    """Tests for _locked_outbox context manager."""
+
+    def test_writes_changes_back(self, outbox_state_dir):
+        """Should save the changes made inside the block."""
+        with _locked_outbox(42) as data:
+            data["ops"].append({"op": "in-progress", "file": "/src/a.py"})
+
+        assert read_outbox(outbox_state_dir)["ops"] == [{"op": "in-progress", "file": "/src/a.py"}]
+
+    def test_defaults_for_unreadable_outbox(self, outbox_state_dir):
+        """Should start from an empty outbox when outbox.json holds no op list."""
+        write_outbox(outbox_state_dir, {"ops": "bad"})
+
+        with _locked_outbox(42) as data:
+            assert data == {"ops": [], "drainerStartedUtc": None}
+
+    def test_failed_replace_removes_temp_file(self, outbox_state_dir):
+        """Should delete the temp file and keep the old outbox when the replace fails."""
+        write_outbox(outbox_state_dir, {"ops": [], "drainerStartedUtc": None})
+
+        with patch("agentic_devtools.cli.azure_devops.submission_outbox.os.replace", side_effect=OSError("busy")):
+            with pytest.raises(OSError, match="busy"):
+                with _locked_outbox(42) as data:
+                    data["ops"].append({"op": "in-progress", "file": "/src/a.py"})
+
+        outbox_dir = outbox_state_dir / "pull-request-review" / "prompts" / "42"
+        assert not list(outbox_dir.glob(".outbox-*"))
+        assert read_outbox(outbox_state_dir)["ops"] == []
+
+    def test_failed_write_removes_temp_file(self, outbox_state_dir):
+        """Should delete the temp file when serializing the outbox fails."""
+        with pytest.raises(TypeError):
+            with _locked_outbox(42) as data:
+                data["ops"].append({"op": "in-progress", "file": object()})
+
+        outbox_dir = outbox_state_dir / "pull-request-review" / "prompts" / "42"
+        assert not list(outbox_dir.glob(".outbox-*"))
@@ -0,0 +1,62 @@
+"""Tests for drain_pull_request_outbox function."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure_devops.submission_outbox import drain_pull_request_outbox, enqueue_in_progress
+
+from .conftest import read_outbox
+
+
+class TestDrainPullRequestOutbox:
+    """Tests for drain_pull_request_outbox function."""
+
+    def test_flushes_queued_files_in_one_batch(self, outbox_state_dir):
+        """Should flush all queued files together and empty the outbox."""
+        enqueue_in_progress(42, "/src/a.py")
+        enqueue_in_progress(42, "/src/b.py")
+
+        with patch("agentic_devtools.cli.azure_devops.file_review_commands.flush_in_progress_files") as mock_flush:
+            processed = drain_pull_request_outbox(42)
+
+        assert processed == 2
+        mock_flush.assert_called_once_with(42, ["/src/a.py", "/src/b.py"])
+        data = read_outbox(outbox_state_dir)
+        assert data == {"drainerStartedUtc": None, "ops": []}
+
+    def test_picks_up_updates_queued_during_flush(self, outbox_state_dir):
+        """Should flush updates queued while a batch was in flight in a further batch."""
+        enqueue_in_progress(42, "/src/a.py")
+
+        def _queue_more(pr, files):
+            if files == ["/src/a.py"]:
+                enqueue_in_progress(42, "/src/b.py")
+
+        with patch(
+            "agentic_devtools.cli.azure_devops.file_review_commands.flush_in_progress_files",
+            side_effect=_queue_more,
+        ) as mock_flush:
+            processed = drain_pull_request_outbox(42)
+
+        assert processed == 2
+        assert [c.args[1] for c in mock_flush.call_args_list] == [["/src/a.py"], ["/src/b.py"]]
+
+    def test_failed_batch_is_reported_and_dropped(self, outbox_state_dir, capsys):
+        """Should warn about a batch that fails to flush and not retry it forever."""
+        enqueue_in_progress(42, "/src/a.py")
+
+        with patch(
+            "agentic_devtools.cli.azure_devops.file_review_commands.flush_in_progress_files",
+            side_effect=RuntimeError("boom"),
+        ):
+            processed = drain_pull_request_outbox(42)
+
+        assert processed == 1
+        assert "Warning" in capsys.readouterr().err
+        assert read_outbox(outbox_state_dir)["ops"] == []
+
+    def test_empty_outbox(self, outbox_state_dir):
+        """Should return zero when nothing is queued."""
+        with patch("agentic_devtools.cli.azure_devops.file_review_commands.flush_in_progress_files") as mock_flush:
+            assert drain_pull_request_outbox(42) == 0
+
+        mock_flush.assert_not_called()
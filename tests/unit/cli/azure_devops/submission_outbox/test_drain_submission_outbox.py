@@ -0,0 +1,21 @@
+"""Tests for drain_submission_outbox function."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.azure_devops.submission_outbox import drain_submission_outbox
+
+
+class TestDrainSubmissionOutbox:
+    """Tests for drain_submission_outbox function."""
+
+    def test_drains_pull_request_from_state(self, capsys):
+        """Should drain the outbox of the PR ID in state and report the count."""
+        with patch("agentic_devtools.state.get_pull_request_id", return_value=42):
+            with patch(
+                "agentic_devtools.cli.azure_devops.submission_outbox.drain_pull_request_outbox",
+                return_value=3,
+            ) as mock_drain:
+                drain_submission_outbox()
+
+        mock_drain.assert_called_once_with(42)
+        assert "Flushed 3 queued review update(s) for PR 42." in capsys.readouterr().out
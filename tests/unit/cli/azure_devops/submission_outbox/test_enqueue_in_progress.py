@@ -0,0 +1,50 @@
+"""Tests for enqueue_in_progress function."""
+
+from datetime import datetime, timezone
+
+from agentic_devtools.cli.azure_devops.submission_outbox import OP_IN_PROGRESS, enqueue_in_progress
+
+from .conftest import read_outbox, write_outbox
+
+
+class TestEnqueueInProgress:
+    """Tests for enqueue_in_progress function."""
+
+    def test_first_update_requests_drainer(self, outbox_state_dir):
+        """Should queue the normalized file and ask the caller to start a drainer."""
+        assert enqueue_in_progress(42, "src/app.py") is True
+
+        data = read_outbox(outbox_state_dir)
+        assert [(op["op"], op["file"]) for op in data["ops"]] == [(OP_IN_PROGRESS, "/src/app.py")]
+        assert data["drainerStartedUtc"] is not None
+
+    def test_running_drainer_is_reused(self, outbox_state_dir):
+        """Should not request a second drainer while one is running."""
+        enqueue_in_progress(42, "/src/a.py")
+
+        assert enqueue_in_progress(42, "/src/b.py") is False
+        assert [op["file"] for op in read_outbox(outbox_state_dir)["ops"]] == ["/src/a.py", "/src/b.py"]
+
+    def test_deduplicates_queued_file(self, outbox_state_dir):
+        """Should not queue the same file twice."""
+        enqueue_in_progress(42, "/src/a.py")
+        enqueue_in_progress(42, "src/a.py")
+
+        assert len(read_outbox(outbox_state_dir)["ops"]) == 1
+
+    def test_stale_drainer_is_replaced(self, outbox_state_dir):
+        """Should request a new drainer when the recorded one is stale."""
+        write_outbox(outbox_state_dir, {"drainerStartedUtc": "2020-01-01T00:00:00+00:00", "ops": []})
+
+        assert enqueue_in_progress(42, "/src/a.py") is True
+        started = datetime.fromisoformat(read_outbox(outbox_state_dir)["drainerStartedUtc"])
+        assert started.year == datetime.now(timezone.utc).year
+
+    def test_recovers_from_corrupt_outbox(self, outbox_state_dir):
+        """Should start a fresh outbox when outbox.json is not valid JSON."""
+        path = outbox_state_dir / "pull-request-review" / "prompts" / "42" / "outbox.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json", encoding="utf-8")
+
+        assert enqueue_in_progress(42, "/src/a.py") is True
+        assert len(read_outbox(outbox_state_dir)["ops"]) == 1
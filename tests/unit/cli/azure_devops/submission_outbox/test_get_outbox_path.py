@@ -0,0 +1,11 @@
+"""Tests for get_outbox_path function."""
+
+from agentic_devtools.cli.azure_devops.submission_outbox import get_outbox_path
+
+
+class TestGetOutboxPath:
+    """Tests for get_outbox_path function."""
+
+    def test_is_next_to_queue_file(self, outbox_state_dir):
+        """Should place outbox.json in the PR's prompts directory next to queue.json."""
+        assert get_outbox_path(42) == outbox_state_dir / "pull-request-review" / "prompts" / "42" / "outbox.json"
@@ -0,0 +1,68 @@
+"""Tests for queue_in_progress_update function."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.submission_outbox import queue_in_progress_update
+
+from .conftest import read_outbox
+
+
+@pytest.fixture
+def review_state_file(outbox_state_dir):
+    """Create an (empty) review-state.json for PR 42."""
+    path = outbox_state_dir / "pull-request-review" / "prompts" / "42" / "review-state.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{}", encoding="utf-8")
+    return path
+
+
+class TestQueueInProgressUpdate:
+    """Tests for queue_in_progress_update function."""
+
+    def test_starts_drainer_for_first_update(self, review_state_file):
+        """Should start one background drainer and return its task ID."""
+        with patch("agentic_devtools.background_tasks.run_function_in_background") as mock_run:
+            mock_run.return_value = MagicMock(id="task-1")
+            task_id = queue_in_progress_update(42, "/src/a.py")
+
+        assert task_id == "task-1"
+        mock_run.assert_called_once_with(
+            module_path="agentic_devtools.cli.azure_devops.submission_outbox",
+            function_name="drain_submission_outbox",
+            command_display_name="agdt-review-outbox-drain",
+        )
+
+    def test_does_not_start_second_drainer(self, review_state_file):
+        """Should only queue the update while a drainer is running."""
+        with patch("agentic_devtools.background_tasks.run_function_in_background") as mock_run:
+            mock_run.return_value = MagicMock(id="task-1")
+            queue_in_progress_update(42, "/src/a.py")
+            assert queue_in_progress_update(42, "/src/b.py") is None
+
+        mock_run.assert_called_once()
+        assert len(read_outbox(review_state_file.parents[3])["ops"]) == 2
+
+    def test_failed_spawn_releases_drainer_flag(self, review_state_file):
+        """Should clear the drainer flag when the drainer can't be started, so the next update starts one."""
+        with patch("agentic_devtools.background_tasks.run_function_in_background") as mock_run:
+            mock_run.side_effect = OSError("spawn failed")
+            with pytest.raises(OSError, match="spawn failed"):
+                queue_in_progress_update(42, "/src/a.py")
+
+            outbox = read_outbox(review_state_file.parents[3])
+            assert outbox["drainerStartedUtc"] is None
+            assert len(outbox["ops"]) == 1
+
+            mock_run.side_effect = None
+            mock_run.return_value = MagicMock(id="task-2")
+            assert queue_in_progress_update(42, "/src/b.py") == "task-2"
+
+    def test_skips_without_review_state(self, outbox_state_dir):
+        """Should neither queue nor start a drainer when the PR has no review-state.json."""
+        with patch("agentic_devtools.background_tasks.run_function_in_background") as mock_run:
+            assert queue_in_progress_update(42, "/src/a.py") is None
+
+        mock_run.assert_not_called()
+        assert not (outbox_state_dir / "pull-request-review" / "prompts" / "42" / "outbox.json").exists()
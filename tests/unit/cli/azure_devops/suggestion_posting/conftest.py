@@ -0,0 +1,40 @@
+"""Shared fixtures for suggestion_posting tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.review_state import (
+    FileEntry,
+    FolderGroup,
+    OverallSummary,
+    ReviewState,
+)
+
+
+@pytest.fixture
+def review_state():
+    """A review state tracking /src/main.py."""
+    return ReviewState(
+        prId=42,
+        repoId="repo-guid",
+        repoName="repo",
+        project="proj",
+        organization="org",
+        latestIterationId=1,
+        scaffoldedUtc="2026-01-01T00:00:00Z",
+        overallSummary=OverallSummary(threadId=100, commentId=200),
+        folders={"/src": FolderGroup(files=["/src/main.py"])},
+        files={"/src/main.py": FileEntry(threadId=500, commentId=600, folder="/src", fileName="main.py")},
+    )
+
+
+def make_response(status_code=200, thread_id=1, comment_id=2, headers=None):
+    """Create a mock thread POST response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"id": thread_id, "comments": [{"id": comment_id}]}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = RuntimeError(f"HTTP {status_code}")
+    return response
@@ -0,0 +1,46 @@
+"""Tests for _post_thread function."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.suggestion_posting import _POST_MAX_ATTEMPTS, _post_thread
+
+from .conftest import make_response
+
+
+class TestPostThread:
+    """Tests for _post_thread function."""
+
+    def test_returns_thread_and_comment_ids(self):
+        """Should POST the body and return the created IDs."""
+        session = MagicMock()
+        session.post.return_value = make_response(thread_id=7, comment_id=8)
+        gate = MagicMock()
+
+        assert _post_thread(session, gate, "https://x/threads", {"A": "b"}, {"k": 1}) == (7, 8)
+        session.post.assert_called_once_with("https://x/threads", headers={"A": "b"}, json={"k": 1}, timeout=30)
+        gate.wait.assert_called_once()
+
+    def test_throttled_response_pauses_and_retries(self):
+        """Should pause all workers for Retry-After and retry a 429."""
+        session = MagicMock()
+        session.post.side_effect = [
+            make_response(429, headers={"Retry-After": "3"}),
+            make_response(thread_id=7, comment_id=8),
+        ]
+        gate = MagicMock()
+
+        assert _post_thread(session, gate, "u", {}, {}) == (7, 8)
+        gate.pause.assert_called_once_with(3)
+        assert gate.wait.call_count == 2
+
+    def test_gives_up_after_max_attempts(self):
+        """Should raise once the throttled attempts are used up."""
+        session = MagicMock()
+        session.post.side_effect = [make_response(503) for _ in range(_POST_MAX_ATTEMPTS)]
+
+        with patch("agentic_devtools.cli.azure_devops.helpers.time.sleep"):
+            with pytest.raises(RuntimeError, match="HTTP 503"):
+                _post_thread(session, MagicMock(), "u", {}, {})
+        assert session.post.call_count == _POST_MAX_ATTEMPTS
@@ -0,0 +1,29 @@
+"""Tests for entry_key function."""
+
+from agentic_devtools.cli.azure_devops.review_state import SuggestionEntry
+from agentic_devtools.cli.azure_devops.suggestion_posting import entry_key, suggestion_key
+
+
+class TestEntryKey:
+    """Tests for entry_key function."""
+
+    def test_matches_suggestion_key(self):
+        """Should hash a stored entry like the suggestion it was created from."""
+        entry = SuggestionEntry(
+            threadId=1,
+            commentId=2,
+            line=10,
+            endLine=12,
+            severity="high",
+            outOfScope=True,
+            linkText="lines 10 - 12",
+            content="Fix it",
+        )
+        assert entry_key(entry) == suggestion_key(10, 12, "high", "Fix it", True, "lines 10 - 12")
+
+    def test_ignores_thread_ids(self):
+        """Should not depend on the thread and comment IDs."""
+        fields = dict(line=1, endLine=1, severity="low", outOfScope=False, linkText="line 1", content="x")
+        assert entry_key(SuggestionEntry(threadId=1, commentId=2, **fields)) == entry_key(
+            SuggestionEntry(threadId=3, commentId=4, **fields)
+        )
@@ -0,0 +1,17 @@
+"""Tests for get_suggestion_journal_path function."""
+
+from agentic_devtools.cli.azure_devops.review_state import get_review_state_file_path
+from agentic_devtools.cli.azure_devops.suggestion_posting import (
+    SUGGESTION_JOURNAL_FILENAME,
+    get_suggestion_journal_path,
+)
+
+
+class TestGetSuggestionJournalPath:
+    """Tests for get_suggestion_journal_path function."""
+
+    def test_next_to_review_state(self, temp_state_dir):
+        """Should put the journal in the PR's review state directory."""
+        path = get_suggestion_journal_path(42)
+        assert path.name == SUGGESTION_JOURNAL_FILENAME
+        assert path.parent == get_review_state_file_path(42).parent
@@ -0,0 +1,27 @@
+"""Tests for PendingSuggestion dataclass."""
+
+from agentic_devtools.cli.azure_devops.suggestion_posting import PendingSuggestion, entry_key
+
+
+class TestPendingSuggestion:
+    """Tests for PendingSuggestion dataclass."""
+
+    def _make(self):
+        return PendingSuggestion(
+            line=5, end_line=7, severity="medium", content="Rename", out_of_scope=False, link_text="lines 5 - 7"
+        )
+
+    def test_to_entry_copies_fields(self):
+        """Should build a SuggestionEntry with the created thread's IDs."""
+        entry = self._make().to_entry(11, 22)
+        assert entry.threadId == 11
+        assert entry.commentId == 22
+        assert (entry.line, entry.endLine, entry.severity) == (5, 7, "medium")
+        assert entry.linkText == "lines 5 - 7"
+        assert entry.content == "Rename"
+        assert entry.outOfScope is False
+
+    def test_key_matches_entry_key(self):
+        """Should hash to the same key as the entry it becomes."""
+        suggestion = self._make()
+        assert suggestion.key == entry_key(suggestion.to_entry(1, 2))
@@ -0,0 +1,49 @@
+"""Tests for plan_suggestions function."""
+
+from agentic_devtools.cli.azure_devops.suggestion_posting import plan_suggestions
+
+
+class TestPlanSuggestions:
+    """Tests for plan_suggestions function."""
+
+    def test_default_link_text(self):
+        """Should default the link text to the line or line range."""
+        pending = plan_suggestions(
+            [
+                {"line": 3, "severity": "low", "content": "a"},
+                {"line": 4, "end_line": 9, "severity": "low", "content": "b"},
+            ],
+            [],
+        )
+        assert [p.link_text for p in pending] == ["line 3", "lines 4 - 9"]
+        assert pending[0].end_line == 3
+
+    def test_explicit_link_text_and_scope(self):
+        """Should keep an explicit link text and the out_of_scope flag."""
+        pending = plan_suggestions(
+            [{"line": 3, "severity": "low", "content": "a", "link_text": "Rename", "out_of_scope": True}], []
+        )
+        assert pending[0].link_text == "Rename"
+        assert pending[0].out_of_scope is True
+
+    def test_skips_existing(self):
+        """Should drop suggestions already stored in review state."""
+        first = plan_suggestions([{"line": 3, "severity": "low", "content": "a"}], [])[0]
+        pending = plan_suggestions(
+            [
+                {"line": 3, "severity": "low", "content": "a"},
+                {"line": 8, "severity": "high", "content": "b"},
+            ],
+            [first.to_entry(1, 2)],
+        )
+        assert [p.content for p in pending] == ["b"]
+
+    def test_skips_duplicates_within_batch(self):
+        """Should post a suggestion repeated in the same batch only once."""
+        suggestion = {"line": 3, "severity": "low", "content": "a"}
+        assert len(plan_suggestions([suggestion, dict(suggestion)], [])) == 1
+
+    def test_keeps_input_order(self):
+        """Should return suggestions in input order."""
+        pending = plan_suggestions([{"line": n, "severity": "low", "content": str(n)} for n in (9, 2, 5)], [])
+        assert [p.line for p in pending] == [9, 2, 5]
@@ -0,0 +1,110 @@
+"""Tests for post_suggestion_threads function."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.suggestion_posting import (
+    SuggestionJournal,
+    plan_suggestions,
+    post_suggestion_threads,
+)
+
+from .conftest import make_response
+
+
+def _pending(count):
+    return plan_suggestions([{"line": n, "severity": "low", "content": f"s{n}"} for n in range(1, count + 1)], [])
+
+
+def _session_by_line(responses):
+    """Session whose POST answers each thread by its anchor line."""
+    session = MagicMock()
+
+    def _post(url, **kwargs):
+        line = kwargs["json"]["threadContext"]["rightFileStart"]["line"]
+        response = responses[line]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    session.post.side_effect = _post
+    return session
+
+
+class TestPostSuggestionThreads:
+    """Tests for post_suggestion_threads function."""
+
+    def test_posts_all_and_adds_in_input_order(self, tmp_path, review_state):
+        """Should create every thread and store them in input order."""
+        session = _session_by_line({n: make_response(thread_id=n * 10, comment_id=n) for n in (1, 2, 3)})
+        journal = SuggestionJournal(tmp_path / "journal.jsonl")
+
+        created = post_suggestion_threads(session, {}, "u", review_state, "src/main.py", _pending(3), journal)
+
+        assert [e.threadId for e in created] == [10, 20, 30]
+        assert [s.threadId for s in review_state.files["/src/main.py"].suggestions] == [10, 20, 30]
+        body = session.post.call_args_list[0][1]["json"]
+        assert body["status"] == "active"
+        assert body["threadContext"]["filePath"] == "/src/main.py"
+        assert len(journal.path.read_text(encoding="utf-8").splitlines()) == 3
+
+    def test_posts_concurrently(self, tmp_path, review_state):
+        """Should have several POSTs in flight at once."""
+        barrier = threading.Barrier(3, timeout=5)
+        session = MagicMock()
+
+        def _post(url, **kwargs):
+            barrier.wait()
+            line = kwargs["json"]["threadContext"]["rightFileStart"]["line"]
+            return make_response(thread_id=line, comment_id=line)
+
+        session.post.side_effect = _post
+        journal = SuggestionJournal(tmp_path / "journal.jsonl")
+
+        created = post_suggestion_threads(session, {}, "u", review_state, "/src/main.py", _pending(3), journal)
+
+        assert [e.threadId for e in created] == [1, 2, 3]
+
+    def test_failure_keeps_created_threads(self, tmp_path, review_state):
+        """Should store and journal the threads that were created before re-raising the failure."""
+        session = _session_by_line({1: make_response(thread_id=10, comment_id=1), 2: RuntimeError("boom")})
+        journal = SuggestionJournal(tmp_path / "journal.jsonl")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            post_suggestion_threads(session, {}, "u", review_state, "/src/main.py", _pending(2), journal, max_workers=2)
+
+        assert [s.threadId for s in review_state.files["/src/main.py"].suggestions] == [10]
+        assert len(journal.path.read_text(encoding="utf-8").splitlines()) == 1
+
+    def test_failure_cancels_queued_posts(self, tmp_path, review_state):
+        """Should not start POSTs still queued when one fails."""
+        session = MagicMock()
+        posted = []
+
+        def _post(url, **kwargs):
+            line = kwargs["json"]["threadContext"]["rightFileStart"]["line"]
+            posted.append(line)
+            if line == 1:
+                raise RuntimeError("boom")
+            # Keep the worker busy so the third POST is still queued when the failure is seen
+            time.sleep(0.2)
+            return make_response(thread_id=line, comment_id=line)
+
+        session.post.side_effect = _post
+        journal = SuggestionJournal(tmp_path / "journal.jsonl")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            post_suggestion_threads(session, {}, "u", review_state, "/src/main.py", _pending(3), journal, max_workers=1)
+
+        assert 3 not in posted
+
+    def test_nothing_pending(self, tmp_path, review_state):
+        """Should post nothing when every suggestion already exists."""
+        session = MagicMock()
+        journal = SuggestionJournal(tmp_path / "journal.jsonl")
+
+        assert post_suggestion_threads(session, {}, "u", review_state, "/src/main.py", [], journal) == []
+        session.post.assert_not_called()
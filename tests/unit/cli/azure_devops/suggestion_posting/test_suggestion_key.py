@@ -0,0 +1,33 @@
+"""Tests for suggestion_key function."""
+
+from agentic_devtools.cli.azure_devops.suggestion_posting import suggestion_key
+
+
+class TestSuggestionKey:
+    """Tests for suggestion_key function."""
+
+    def test_same_suggestion_same_key(self):
+        """Should hash identical suggestions to the same key."""
+        assert suggestion_key(1, 2, "high", "Fix", False, "line 1") == suggestion_key(
+            1, 2, "high", "Fix", False, "line 1"
+        )
+
+    def test_key_is_sha256_hex(self):
+        """Should return a 64-character hex digest."""
+        key = suggestion_key(1, 1, "low", "x", False, "line 1")
+        assert len(key) == 64
+        int(key, 16)
+
+    def test_every_field_changes_key(self):
+        """Should give a different key when any anchor or content field differs."""
+        base = (10, 12, "high", "Fix it", False, "lines 10 - 12")
+        keys = {suggestion_key(*base)}
+        for index, value in enumerate((11, 13, "low", "Fix that", True, "here")):
+            changed = list(base)
+            changed[index] = value
+            keys.add(suggestion_key(*changed))
+        assert len(keys) == 7
+
+    def test_fields_do_not_run_together(self):
+        """Should not confuse content split differently across fields."""
+        assert suggestion_key(1, 1, "high", "a b", False, "c") != suggestion_key(1, 1, "high", "a", False, "b c")
@@ -0,0 +1,66 @@
+"""Tests for SuggestionJournal class."""
+
+import json
+
+from agentic_devtools.cli.azure_devops.review_state import SuggestionEntry
+from agentic_devtools.cli.azure_devops.suggestion_posting import SuggestionJournal
+
+
+def _entry(thread_id, content="Fix"):
+    return SuggestionEntry(
+        threadId=thread_id,
+        commentId=thread_id + 1000,
+        line=1,
+        endLine=1,
+        severity="high",
+        outOfScope=False,
+        linkText="line 1",
+        content=content,
+    )
+
+
+class TestSuggestionJournal:
+    """Tests for SuggestionJournal class."""
+
+    def test_append_writes_one_line_per_thread(self, tmp_path):
+        """Should append one JSON line per created thread, with the normalized file path."""
+        journal = SuggestionJournal(tmp_path / "state" / "journal.jsonl")
+        journal.append("src/main.py", _entry(1))
+        journal.append("/src/main.py", _entry(2, "Other"))
+
+        lines = journal.path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["file"] for line in lines] == ["/src/main.py", "/src/main.py"]
+        assert json.loads(lines[1])["entry"]["threadId"] == 2
+
+    def test_replay_adds_missing_threads(self, tmp_path, review_state):
+        """Should add journaled threads missing from review state."""
+        journal = SuggestionJournal(tmp_path / "journal.jsonl")
+        journal.append("/src/main.py", _entry(1))
+        journal.append("/src/main.py", _entry(2, "Other"))
+        review_state.files["/src/main.py"].suggestions.append(_entry(1))
+
+        assert journal.replay(review_state) == 1
+        assert [s.threadId for s in review_state.files["/src/main.py"].suggestions] == [1, 2]
+
+    def test_replay_skips_torn_and_unknown_lines(self, tmp_path, review_state):
+        """Should skip lines for untracked files and a partially written last line."""
+        journal = SuggestionJournal(tmp_path / "journal.jsonl")
+        journal.append("/other.py", _entry(1))
+        journal.append("/src/main.py", _entry(2))
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"file": "/src/main.py", "ent')
+
+        assert journal.replay(review_state) == 1
+        assert [s.threadId for s in review_state.files["/src/main.py"].suggestions] == [2]
+
+    def test_replay_without_journal(self, tmp_path, review_state):
+        """Should add nothing when there is no journal."""
+        assert SuggestionJournal(tmp_path / "missing.jsonl").replay(review_state) == 0
+
+    def test_clear_removes_journal(self, tmp_path):
+        """Should delete the journal, and tolerate it already being gone."""
+        journal = SuggestionJournal(tmp_path / "journal.jsonl")
+        journal.append("/src/main.py", _entry(1))
+        journal.clear()
+        assert not journal.path.exists()
+        journal.clear()
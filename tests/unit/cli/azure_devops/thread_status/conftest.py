@@ -0,0 +1,12 @@
+"""Shared fixtures for thread_status tests."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def thread_index_dir(tmp_path):
+    """Point the thread index cache at a temporary state directory."""
+    with patch("agentic_devtools.cli.azure_devops.thread_status.get_state_dir", return_value=tmp_path):
+        yield tmp_path
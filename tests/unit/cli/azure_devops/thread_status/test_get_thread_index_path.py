@@ -0,0 +1,13 @@
+"""Tests for get_thread_index_path function."""
+
+from agentic_devtools.cli.azure_devops.thread_status import get_thread_index_path
+
+
+class TestGetThreadIndexPath:
+    """Tests for get_thread_index_path."""
+
+    def test_path_is_next_to_queue(self, thread_index_dir):
+        """The cache lives in the PR's prompts directory."""
+        expected = thread_index_dir / "pull-request-review" / "prompts" / "42" / "thread-index.json"
+
+        assert get_thread_index_path(42) == expected
@@ -0,0 +1,93 @@
+"""Tests for load_thread_index function."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.thread_status import (
+    ThreadIndex,
+    get_thread_index_path,
+    load_thread_index,
+    save_thread_index,
+)
+
+_URL = "https://dev.azure.com/org/proj/_apis/git/repositories/repo/pullRequests/42/threads?api-version=7.0"
+_THREADS = [{"id": 1, "status": "active", "threadContext": {"filePath": "/src/a.ts"}}]
+
+
+def _response(status_code=200, threads=None, etag=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"ETag": etag} if etag else {}
+    response.json.return_value = {"value": threads if threads is not None else _THREADS}
+    return response
+
+
+class TestLoadThreadIndex:
+    """Tests for load_thread_index."""
+
+    def test_fetches_and_caches_with_etag(self, thread_index_dir):
+        """A response with an ETag is indexed and cached."""
+        session = MagicMock()
+        session.get.return_value = _response(etag='"v1"')
+
+        index = load_thread_index(session, {"Authorization": "x"}, _URL, 42)
+
+        assert index.etag == '"v1"'
+        assert [t["id"] for t in index.for_file("src/a.ts")] == [1]
+        assert session.get.call_args.kwargs["headers"] == {"Authorization": "x"}
+        assert get_thread_index_path(42).exists()
+
+    def test_reuses_cache_on_not_modified(self, thread_index_dir):
+        """A 304 to If-None-Match returns the cached index."""
+        save_thread_index(42, ThreadIndex(_THREADS, etag='"v1"'))
+        session = MagicMock()
+        session.get.return_value = _response(status_code=304, threads=[])
+
+        index = load_thread_index(session, {"Authorization": "x"}, _URL, 42)
+
+        assert session.get.call_args.kwargs["headers"] == {"Authorization": "x", "If-None-Match": '"v1"'}
+        assert [t["id"] for t in index.for_file("/src/a.ts")] == [1]
+        session.get.return_value.json.assert_not_called()
+
+    def test_replaces_cache_when_modified(self, thread_index_dir):
+        """A 200 to If-None-Match replaces the cached index."""
+        save_thread_index(42, ThreadIndex(_THREADS, etag='"v1"'))
+        session = MagicMock()
+        session.get.return_value = _response(threads=[], etag='"v2"')
+
+        index = load_thread_index(session, {}, _URL, 42)
+
+        assert index.for_file("/src/a.ts") == []
+        assert load_thread_index(MagicMock(get=MagicMock(return_value=_response(304))), {}, _URL, 42).etag == '"v2"'
+
+    def test_no_etag_is_not_cached(self, thread_index_dir):
+        """Without an ETag the threads are returned but not cached."""
+        session = MagicMock()
+        session.get.return_value = _response()
+
+        index = load_thread_index(session, {}, _URL, 42)
+
+        assert index.etag is None
+        assert not get_thread_index_path(42).exists()
+
+    def test_ignores_corrupt_cache(self, thread_index_dir):
+        """An unreadable cache is ignored and no If-None-Match is sent."""
+        path = get_thread_index_path(42)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json", encoding="utf-8")
+        session = MagicMock()
+        session.get.return_value = _response()
+
+        load_thread_index(session, {}, _URL, 42)
+
+        assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+
+    def test_raises_on_http_error(self, thread_index_dir):
+        """HTTP errors from the fetch propagate."""
+        session = MagicMock()
+        session.get.return_value = _response(status_code=500)
+        session.get.return_value.raise_for_status.side_effect = RuntimeError("500 Server Error")
+
+        with pytest.raises(RuntimeError, match="500"):
+            load_thread_index(session, {}, _URL, 42)
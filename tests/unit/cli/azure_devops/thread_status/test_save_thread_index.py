@@ -0,0 +1,27 @@
+"""Tests for save_thread_index function."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.azure_devops.thread_status import ThreadIndex, get_thread_index_path, save_thread_index
+
+
+class TestSaveThreadIndex:
+    """Tests for save_thread_index."""
+
+    def test_writes_index(self, thread_index_dir):
+        """The index is written with its ETag."""
+        save_thread_index(42, ThreadIndex([{"id": 1, "status": "active"}], etag='"v1"'))
+
+        data = json.loads(get_thread_index_path(42).read_text(encoding="utf-8"))
+        assert data == {"etag": '"v1"', "threads": [{"id": 1, "status": "active"}]}
+
+    def test_failed_write_leaves_no_temp_file(self, thread_index_dir):
+        """A failed write removes its temp file and raises."""
+        with patch("agentic_devtools.cli.azure_devops.thread_status.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                save_thread_index(42, ThreadIndex([], etag='"v1"'))
+
+        assert list(get_thread_index_path(42).parent.iterdir()) == []
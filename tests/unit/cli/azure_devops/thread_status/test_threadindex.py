@@ -0,0 +1,57 @@
+"""Tests for ThreadIndex class."""
+
+from agentic_devtools.cli.azure_devops.thread_status import ThreadIndex
+
+
+def _threads():
+    """Build a fresh list of threads (ThreadIndex.set_status mutates them)."""
+    return [
+        {"id": 1, "status": "active", "threadContext": {"filePath": "/src/App.ts"}},
+        {"id": 2, "status": "pending", "threadContext": {"rightFileStart": {"line": 3}, "filePath": "/src/app.ts"}},
+        {"id": 3, "status": "closed", "threadContext": {"filePath": "/src/app.ts"}},
+        {"id": 4, "status": "active", "threadContext": {"filePath": "/src/other.ts"}},
+        {"id": 5, "status": "active"},
+        {"status": "active", "threadContext": {"filePath": "/src/app.ts"}},
+    ]
+
+
+class TestThreadIndex:
+    """Tests for ThreadIndex."""
+
+    def test_for_file_matches_any_spelling_of_path(self):
+        """Unresolved threads of a file are found case-insensitively, with or without a leading slash."""
+        index = ThreadIndex(_threads())
+
+        assert [t["id"] for t in index.for_file("src\\APP.ts")] == [1, 2]
+
+    def test_for_file_with_statuses(self):
+        """Only threads with one of the requested statuses are returned."""
+        index = ThreadIndex(_threads())
+
+        assert [t["id"] for t in index.for_file("/src/app.ts", statuses=("closed",))] == [3]
+
+    def test_for_file_without_path(self):
+        """An empty path matches nothing."""
+        assert ThreadIndex(_threads()).for_file("") == []
+
+    def test_get_by_id(self):
+        """Threads are looked up by ID; PR-level threads are included."""
+        index = ThreadIndex(_threads())
+
+        assert index.get(5)["status"] == "active"
+        assert index.get(99) is None
+
+    def test_set_status(self):
+        """A PATCHed thread's status is recorded so it no longer counts as unresolved."""
+        index = ThreadIndex(_threads()[:2])
+        index.set_status(1, "closed")
+        index.set_status(99, "closed")
+
+        assert [t["id"] for t in index.for_file("/src/app.ts")] == [2]
+
+    def test_round_trips_through_dict(self):
+        """to_dict/from_dict preserve the threads and ETag."""
+        index = ThreadIndex.from_dict(ThreadIndex(_threads(), etag='"abc"').to_dict())
+
+        assert index.etag == '"abc"'
+        assert [t["id"] for t in index.for_file("/src/app.ts")] == [1, 2]
@@ -0,0 +1,15 @@
+"""Tests for ThreadStatusResult dataclass."""
+
+from agentic_devtools.cli.azure_devops.thread_status import ThreadStatusResult
+
+
+class TestThreadStatusResult:
+    """Tests for ThreadStatusResult."""
+
+    def test_ok_without_error(self):
+        """A result without an error is ok."""
+        assert ThreadStatusResult(thread_id=1, status="closed").ok is True
+
+    def test_not_ok_with_error(self):
+        """A result with an error is not ok."""
+        assert ThreadStatusResult(thread_id=1, status="closed", error="boom").ok is False
@@ -0,0 +1,89 @@
+"""Tests for update_thread_statuses function."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.azure_devops.config import AzureDevOpsConfig
+from agentic_devtools.cli.azure_devops.thread_status import update_thread_statuses
+
+_CONFIG = AzureDevOpsConfig(organization="https://dev.azure.com/org", project="proj", repository="repo")
+
+
+def _response(status_code=200, retry_after=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return response
+
+
+def _update(session, thread_ids, **kwargs):
+    return update_thread_statuses(session, {}, _CONFIG, "repo-id", 42, thread_ids, **kwargs)
+
+
+class TestUpdateThreadStatuses:
+    """Tests for update_thread_statuses."""
+
+    def test_patches_every_thread(self):
+        """Each thread gets one status PATCH and an ok result, in input order."""
+        session = MagicMock()
+        session.patch.return_value = _response()
+
+        results = _update(session, [3, 1, 2], status="fixed", max_workers=2)
+
+        assert [(r.thread_id, r.status, r.ok) for r in results] == [
+            (3, "fixed", True),
+            (1, "fixed", True),
+            (2, "fixed", True),
+        ]
+        urls = sorted(call.args[0] for call in session.patch.call_args_list)
+        assert urls[0].startswith(
+            "https://dev.azure.com/org/proj/_apis/git/repositories/repo-id/pullRequests/42/threads/1?"
+        )
+        assert all(call.kwargs["json"] == {"status": "fixed"} for call in session.patch.call_args_list)
+
+    def test_reports_failures_per_thread(self):
+        """A failing PATCH is reported on its thread without stopping the others."""
+        session = MagicMock()
+
+        def patch_thread(url, **kwargs):
+            response = _response()
+            if "/threads/2?" in url:
+                response.raise_for_status.side_effect = RuntimeError("403 Forbidden")
+            return response
+
+        session.patch.side_effect = patch_thread
+
+        results = _update(session, [1, 2, 3])
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[1].error == "403 Forbidden"
+
+    def test_retries_throttled_patch_after_retry_after(self):
+        """A 429 pauses for Retry-After and the PATCH is retried."""
+        session = MagicMock()
+        session.patch.side_effect = [_response(429, retry_after="2"), _response()]
+
+        with patch("agentic_devtools.cli.azure_devops.helpers.time.sleep") as mock_sleep:
+            results = _update(session, [1])
+
+        assert results[0].ok
+        assert session.patch.call_count == 2
+        assert 0 < mock_sleep.call_args.args[0] <= 2
+
+    def test_gives_up_after_max_attempts(self):
+        """A thread still throttled after the last attempt is reported as failed."""
+        throttled = _response(503, retry_after="0")
+        throttled.raise_for_status.side_effect = RuntimeError("503 Service Unavailable")
+        session = MagicMock()
+        session.patch.return_value = throttled
+
+        results = _update(session, [1])
+
+        assert session.patch.call_count == 3
+        assert results[0].error == "503 Service Unavailable"
+
+    def test_no_threads(self):
+        """No thread IDs means no PATCHes."""
+        session = MagicMock()
+
+        assert _update(session, []) == []
+        session.patch.assert_not_called()
@@ -3,14 +3,18 @@ Shared test helper functions for async_commands tests.
 These complement the fixtures in conftest.py.
 """
 
+import json
+from pathlib import Path
 
-def get_script_from_call(mock_popen):
-    """Extract the Python script from the Popen call args."""
-    call_args = mock_popen.call_args[0][0]
-    return call_args[2] if len(call_args) > 2 else ""
 
+def get_handoff_from_call(mock_popen):
+    """Read the runner handoff file from the Popen call args."""
+    call_args = mock_popen.call_args[0][0]  # First positional arg is the command list
+    # The handoff file is the last element: [python, -c, <bootstrap>, <package dir>, <handoff>]
+    return json.loads(Path(call_args[-1]).read_text(encoding="utf-8"))
 
-def assert_function_in_script(script: str, module_path: str, function_name: str):
-    """Assert that the generated script calls the correct module and function."""
-    assert f"module_path = '{module_path}'" in script, f"Expected module_path='{module_path}' in script"
-    assert f"function_name = '{function_name}'" in script, f"Expected function_name='{function_name}' in script"
+
+def assert_function_in_handoff(handoff: dict, module_path: str, function_name: str):
+    """Assert that the runner handoff calls the expected module and function."""
+    assert handoff["module_path"] == module_path
+    assert handoff["function_name"] == function_name
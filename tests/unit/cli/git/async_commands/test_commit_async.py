@@ -5,7 +5,7 @@ import re
 import pytest
 
 from agentic_devtools.cli.git.async_commands import commit_async
-from tests.unit.cli.git.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.git.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestCommitAsync:
@@ -18,8 +18,8 @@ class TestCommitAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.git.commands", "commit_cmd")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.git.commands", "commit_cmd")
 
     def test_prints_tracking_instructions(self, mock_background_and_state, capsys):
         """Test tracking instructions are printed."""
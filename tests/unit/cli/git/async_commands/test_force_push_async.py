@@ -1,7 +1,7 @@
 """Tests for agentic_devtools.cli.git.async_commands.force_push_async."""
 
 from agentic_devtools.cli.git.async_commands import force_push_async
-from tests.unit.cli.git.async_commands._helpers import assert_function_in_script, get_script_from_call
+from tests.unit.cli.git.async_commands._helpers import assert_function_in_handoff, get_handoff_from_call
 
 
 class TestForcePushAsync:
@@ -14,8 +14,8 @@ class TestForcePushAsync:
         captured = capsys.readouterr()
         assert "Background task started" in captured.out
 
-        script = get_script_from_call(mock_background_and_state["mock_popen"])
-        assert_function_in_script(script, "agentic_devtools.cli.git.commands", "force_push_cmd")
+        handoff = get_handoff_from_call(mock_background_and_state["mock_popen"])
+        assert_function_in_handoff(handoff, "agentic_devtools.cli.git.commands", "force_push_cmd")
 
     def test_importable(self):
         """Test force_push_async can be imported and is callable."""
@@ -0,0 +1,25 @@
+"""Tests for agentic_devtools.cli.git.core._write_requests."""
+
+import io
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.git.core import _write_requests
+
+
+class TestWriteRequests:
+    """Tests for _write_requests function."""
+
+    def test_writes_and_flushes(self):
+        """Test the request bytes are written to the pipe."""
+        stdin = io.BytesIO()
+
+        _write_requests(stdin, b"HEAD\n")
+
+        assert stdin.getvalue() == b"HEAD\n"
+
+    def test_ignores_broken_pipe(self):
+        """Test a closed pipe doesn't raise on the feeder thread."""
+        stdin = MagicMock()
+        stdin.write.side_effect = BrokenPipeError()
+
+        _write_requests(stdin, b"HEAD\n")
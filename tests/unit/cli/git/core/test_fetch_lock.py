@@ -0,0 +1,53 @@
+"""Tests for agentic_devtools.cli.git.core.fetch_lock."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.git import core
+from agentic_devtools.file_locking import FileLockError, locked_file
+
+
+class TestFetchLock:
+    """Tests for fetch_lock context manager."""
+
+    def test_lock_file_is_in_common_git_dir(self, temp_git_repo, tmp_path):
+        """Test a fetch in a worktree locks the file in the main repository's .git directory."""
+        worktree = tmp_path / "wt"
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(worktree)], cwd=temp_git_repo, check=True, capture_output=True
+        )
+
+        with core.fetch_lock(str(worktree)):
+            lock_path = temp_git_repo / ".git" / core.FETCH_LOCK_FILENAME
+            assert lock_path.is_file()
+            with pytest.raises(FileLockError):
+                with locked_file(lock_path, "a", timeout=0.05):
+                    pass
+
+        with locked_file(lock_path, "a", timeout=0.05):
+            pass
+
+    def test_fetches_anyway_when_lock_times_out(self, temp_git_repo, capsys):
+        """Test the block still runs, with a warning, when another process holds the lock too long."""
+        ran = []
+        with locked_file(temp_git_repo / ".git" / core.FETCH_LOCK_FILENAME, "a"):
+            with patch.object(core, "FETCH_LOCK_TIMEOUT", 0.05):
+                with core.fetch_lock(str(temp_git_repo)):
+                    ran.append(True)
+
+        assert ran == [True]
+        assert "fetching without the fetch lock" in capsys.readouterr().err
+
+    def test_outside_repository_runs_unlocked(self, tmp_path):
+        """Test the block runs without a lock when there is no repository."""
+        ran = []
+        with patch.object(core, "find_git_common_dir", return_value=None), patch.object(
+            core, "locked_file"
+        ) as mock_lock:
+            with core.fetch_lock(str(tmp_path)):
+                ran.append(True)
+
+        assert ran == [True]
+        mock_lock.assert_not_called()
@@ -0,0 +1,62 @@
+"""Tests for agentic_devtools.cli.git.core.find_git_common_dir."""
+
+import subprocess
+from unittest.mock import patch
+
+from agentic_devtools.cli.git import core
+
+
+class TestFindGitCommonDir:
+    """Tests for find_git_common_dir function."""
+
+    def test_main_repository(self, temp_git_repo):
+        """Test the .git directory of the main repository is found from a subdirectory."""
+        subdir = temp_git_repo / "src"
+        subdir.mkdir()
+
+        assert core.find_git_common_dir(str(subdir)) == (temp_git_repo / ".git").resolve()
+
+    def test_worktree_shares_main_git_dir(self, temp_git_repo, tmp_path):
+        """Test a worktree resolves to the main repository's .git directory."""
+        worktree = tmp_path / "wt"
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(worktree)], cwd=temp_git_repo, check=True, capture_output=True
+        )
+
+        assert core.find_git_common_dir(str(worktree)) == (temp_git_repo / ".git").resolve()
+
+    def test_gitdir_without_commondir(self, tmp_path):
+        """Test a .git file pointing at a git dir with no commondir (e.g. a submodule) returns that dir."""
+        git_dir = tmp_path / "modules" / "sub"
+        git_dir.mkdir(parents=True)
+        checkout = tmp_path / "sub"
+        checkout.mkdir()
+        (checkout / ".git").write_text("gitdir: ../modules/sub\n")
+
+        assert core.find_git_common_dir(str(checkout)) == git_dir.resolve()
+
+    def test_unrecognized_git_file(self, tmp_path):
+        """Test a .git file that isn't a gitdir pointer is not treated as a repository."""
+        (tmp_path / ".git").write_text("garbage")
+
+        assert core.find_git_common_dir(str(tmp_path)) is None
+
+    def test_unreadable_git_file(self, tmp_path):
+        """Test an unreadable .git file is not treated as a repository."""
+        (tmp_path / ".git").write_text("gitdir: x")
+
+        with patch.object(core.Path, "read_text", side_effect=OSError("denied")):
+            assert core.find_git_common_dir(str(tmp_path)) is None
+
+    def test_outside_repository(self, tmp_path):
+        """Test None is returned when no parent directory has a .git."""
+        with patch.object(core.Path, "is_dir", return_value=False), patch.object(
+            core.Path, "is_file", return_value=False
+        ):
+            assert core.find_git_common_dir(str(tmp_path)) is None
+
+    def test_defaults_to_working_directory(self, temp_git_repo, monkeypatch):
+        """Test the working directory is used when no start directory is given."""
+        monkeypatch.chdir(temp_git_repo)
+
+        assert core.find_git_common_dir() == (temp_git_repo / ".git").resolve()
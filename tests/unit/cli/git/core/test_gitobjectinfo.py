@@ -0,0 +1,15 @@
+"""Tests for agentic_devtools.cli.git.core.GitObjectInfo."""
+
+from agentic_devtools.cli.git.core import GitObjectInfo
+
+
+class TestGitObjectInfo:
+    """Tests for GitObjectInfo dataclass."""
+
+    def test_holds_object_details(self):
+        """Test the SHA, type and size are stored as given."""
+        info = GitObjectInfo(sha="abc123", type="blob", size=42)
+
+        assert info.sha == "abc123"
+        assert info.type == "blob"
+        assert info.size == 42
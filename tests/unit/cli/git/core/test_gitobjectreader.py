@@ -0,0 +1,146 @@
+"""Tests for agentic_devtools.cli.git.core.GitObjectReader."""
+
+import io
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_devtools.cli.git.core import GitObjectInfo, GitObjectReader
+
+
+def _head_sha(repo) -> str:
+    return subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+
+
+class TestGitObjectReader:
+    """Tests for GitObjectReader class."""
+
+    def test_resolve_ref(self, temp_git_repo):
+        """Test a ref resolves to the commit SHA."""
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            assert reader.resolve("HEAD") == _head_sha(temp_git_repo)
+
+    def test_resolve_missing_ref_returns_none(self, temp_git_repo):
+        """Test a ref that doesn't exist resolves to None."""
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            assert reader.resolve("origin/does-not-exist") is None
+
+    def test_resolve_many_keeps_order_and_misses(self, temp_git_repo):
+        """Test resolve_many maps every name, in one pipelined batch."""
+        head = _head_sha(temp_git_repo)
+        names = ["HEAD", "missing-branch", "HEAD:README.md", "no such path"]
+
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            resolved = reader.resolve_many(names)
+
+        assert list(resolved) == names
+        assert resolved["HEAD"] == head
+        assert resolved["missing-branch"] is None
+        assert resolved["HEAD:README.md"] is not None
+        assert resolved["no such path"] is None
+
+    def test_info_reports_type_and_size(self, temp_git_repo):
+        """Test info returns the object type and size."""
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            info = reader.info("HEAD:README.md")
+
+        assert info.type == "blob"
+        assert info.size == len("# Test Repository\n")
+
+    def test_info_many_empty(self, temp_git_repo):
+        """Test no requests means no git process."""
+        reader = GitObjectReader(cwd=str(temp_git_repo))
+        assert reader.info_many([]) == []
+        assert reader._processes == {}
+
+    def test_read_text(self, temp_git_repo):
+        """Test a blob is read as text."""
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            assert reader.read_text("HEAD:README.md") == "# Test Repository\n"
+            assert reader.read_text("HEAD:missing.md") is None
+
+    def test_read_many_streams_contents(self, temp_git_repo):
+        """Test many blob reads in one batch return each blob's bytes."""
+        (temp_git_repo / "big.txt").write_bytes(b"x" * 200_000)
+        subprocess.run(["git", "add", "big.txt"], cwd=temp_git_repo, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "--no-verify", "-m", "big"], cwd=temp_git_repo, check=True, capture_output=True
+        )
+
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            contents = reader.read_many(["HEAD:big.txt", "HEAD:nope", "HEAD:README.md"] * 3)
+
+        assert contents[0] == b"x" * 200_000
+        assert contents[1] is None
+        assert contents[2] == b"# Test Repository\n"
+        assert contents[3:6] == contents[6:] == contents[:3]
+
+    def test_read_single_object(self, temp_git_repo):
+        """Test read returns the raw bytes of one object."""
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            assert reader.read("HEAD:README.md") == b"# Test Repository\n"
+
+    def test_reuses_process_across_requests(self, temp_git_repo):
+        """Test one cat-file process answers repeated lookups."""
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            reader.resolve("HEAD")
+            process = reader._processes["--batch-check"]
+            reader.resolve("HEAD")
+            assert reader._processes["--batch-check"] is process
+
+    def test_close_stops_processes(self, temp_git_repo):
+        """Test leaving the context closes the git processes."""
+        with GitObjectReader(cwd=str(temp_git_repo)) as reader:
+            reader.resolve("HEAD")
+            process = reader._processes["--batch-check"]
+
+        assert process.poll() is not None
+        assert reader._processes == {}
+
+    def test_close_kills_process_that_does_not_exit(self):
+        """Test a process that doesn't exit after stdin closes is killed."""
+        process = MagicMock()
+        process.wait.side_effect = subprocess.TimeoutExpired("git", 5)
+        reader = GitObjectReader()
+        reader._processes["--batch"] = process
+
+        reader.close()
+
+        process.kill.assert_called_once()
+
+    def test_rejects_invalid_names(self):
+        """Test names with newlines or empty names are rejected."""
+        reader = GitObjectReader()
+        with pytest.raises(ValueError):
+            reader.resolve("HEAD\nmain")
+        with pytest.raises(ValueError):
+            reader.resolve("")
+
+    def test_raises_when_process_exits(self):
+        """Test an unexpected end of output raises RuntimeError."""
+        process = MagicMock()
+        process.poll.return_value = None
+        process.stdin = io.BytesIO()
+        process.stdout = io.BytesIO(b"")
+        reader = GitObjectReader()
+        reader._processes["--batch-check"] = process
+
+        with pytest.raises(RuntimeError):
+            reader.resolve("HEAD")
+
+    def test_restarts_exited_process(self):
+        """Test a process that has exited is replaced by a new one."""
+        dead = MagicMock()
+        dead.poll.return_value = 1
+        alive = MagicMock()
+        alive.stdin = io.BytesIO()
+        alive.stdout = io.BytesIO(b"abc123 commit 10\n")
+        reader = GitObjectReader()
+        reader._processes["--batch-check"] = dead
+
+        with patch("agentic_devtools.cli.git.core.subprocess.Popen", return_value=alive) as mock_popen:
+            info = reader.info("HEAD")
+
+        assert info == GitObjectInfo(sha="abc123", type="commit", size=10)
+        assert mock_popen.call_args[0][0] == ["git", "cat-file", "--batch-check"]
@@ -0,0 +1,19 @@
+"""Tests for agentic_devtools.cli.git.diff._supports_blob_filter."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.git.diff import _supports_blob_filter
+
+
+class TestSupportsBlobFilter:
+    """Tests for _supports_blob_filter function."""
+
+    def test_true_for_partial_clone_of_origin(self):
+        """Should return True when origin is the partial clone remote."""
+        with patch("agentic_devtools.cli.git.diff.run_safe", return_value=MagicMock(returncode=0, stdout="origin\n")):
+            assert _supports_blob_filter() is True
+
+    def test_false_for_full_clone(self):
+        """Should return False when extensions.partialClone isn't set."""
+        with patch("agentic_devtools.cli.git.diff.run_safe", return_value=MagicMock(returncode=1, stdout="")):
+            assert _supports_blob_filter() is False
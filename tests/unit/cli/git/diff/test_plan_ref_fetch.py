@@ -0,0 +1,57 @@
+"""Tests for agentic_devtools.cli.git.diff.plan_ref_fetch."""
+
+from unittest.mock import MagicMock
+
+from agentic_devtools.cli.git.core import GitObjectInfo
+from agentic_devtools.cli.git.diff import plan_ref_fetch
+
+_COMMIT = GitObjectInfo(sha="abc123", type="commit", size=200)
+
+
+class TestPlanRefFetch:
+    """Tests for plan_ref_fetch function."""
+
+    def test_skips_fetch_when_commits_are_local(self):
+        """Should plan no fetch when the wanted commits already exist."""
+        reader = MagicMock()
+        reader.info_many.return_value = [_COMMIT, _COMMIT]
+
+        branches = plan_ref_fetch({"origin/main": "abc123", "origin/feature": "def456"}, reader)
+
+        assert branches == []
+        reader.info_many.assert_called_once_with(["abc123", "def456"])
+
+    def test_checks_ref_when_no_commit_given(self):
+        """Should look up the ref itself when no commit is given."""
+        reader = MagicMock()
+        reader.info_many.return_value = [None]
+
+        branches = plan_ref_fetch({"origin/feature": None}, reader)
+
+        assert branches == ["feature"]
+        reader.info_many.assert_called_once_with(["origin/feature"])
+
+    def test_plans_only_missing_branches(self):
+        """Should fetch only the branches whose commits are missing."""
+        reader = MagicMock()
+        reader.info_many.return_value = [_COMMIT, None]
+
+        branches = plan_ref_fetch({"origin/main": "abc123", "origin/feature": "def456"}, reader)
+
+        assert branches == ["feature"]
+
+    def test_keeps_names_without_origin_prefix(self):
+        """Should fetch a ref without an origin/ prefix by its own name, once."""
+        reader = MagicMock()
+        reader.info_many.return_value = [None, None]
+
+        branches = plan_ref_fetch({"main": None, "origin/main": "abc123"}, reader)
+
+        assert branches == ["main"]
+
+    def test_empty_plan_needs_no_lookups(self):
+        """Should not query git when there are no refs."""
+        reader = MagicMock()
+
+        assert plan_ref_fetch({}, reader) == []
+        reader.info_many.assert_not_called()
@@ -0,0 +1,75 @@
+"""Tests for agentic_devtools.cli.git.diff.sync_git_refs."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.git.core import GitObjectReader
+from agentic_devtools.cli.git.diff import sync_git_refs
+
+_MODULE = "agentic_devtools.cli.git.diff"
+
+
+class TestSyncGitRefs:
+    """Tests for sync_git_refs function."""
+
+    def test_no_fetch_when_everything_is_local(self):
+        """Should not fetch when the plan is empty."""
+        with patch(f"{_MODULE}.plan_ref_fetch", return_value=[]), patch(f"{_MODULE}.run_safe") as mock_run:
+            assert sync_git_refs({"origin/main": "abc123"}, MagicMock()) is True
+        mock_run.assert_not_called()
+
+    def test_fetches_all_branches_at_once(self):
+        """Should fetch every missing branch with one git fetch."""
+        with patch(f"{_MODULE}.plan_ref_fetch", return_value=["main", "feature"]), patch(
+            f"{_MODULE}._supports_blob_filter", return_value=False
+        ), patch(f"{_MODULE}.run_safe", return_value=MagicMock(returncode=0)) as mock_run:
+            assert sync_git_refs({}, MagicMock()) is True
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["git", "fetch", "--no-tags", "origin", "main", "feature"]
+
+    def test_uses_blob_filter_in_partial_clone(self):
+        """Should add --filter=blob:none when origin is a partial clone remote."""
+        with patch(f"{_MODULE}.plan_ref_fetch", return_value=["main"]), patch(
+            f"{_MODULE}._supports_blob_filter", return_value=True
+        ), patch(f"{_MODULE}.run_safe", return_value=MagicMock(returncode=0)) as mock_run:
+            sync_git_refs({}, MagicMock())
+
+        assert mock_run.call_args[0][0] == ["git", "fetch", "--no-tags", "--filter=blob:none", "origin", "main"]
+
+    def test_single_branch_failure_returns_false(self):
+        """Should return False without retrying when a single-branch fetch fails."""
+        with patch(f"{_MODULE}.plan_ref_fetch", return_value=["main"]), patch(
+            f"{_MODULE}._supports_blob_filter", return_value=False
+        ), patch(f"{_MODULE}.run_safe", return_value=MagicMock(returncode=1)) as mock_run:
+            assert sync_git_refs({}, MagicMock()) is False
+        assert mock_run.call_count == 1
+
+    def test_retries_branches_separately_after_failure(self):
+        """Should fetch each branch on its own when the combined fetch fails."""
+        results = [MagicMock(returncode=1), MagicMock(returncode=0), MagicMock(returncode=1)]
+        with patch(f"{_MODULE}.plan_ref_fetch", return_value=["main", "deleted"]), patch(
+            f"{_MODULE}._supports_blob_filter", return_value=False
+        ), patch(f"{_MODULE}.run_safe", side_effect=results) as mock_run:
+            assert sync_git_refs({}, MagicMock()) is False
+
+        assert mock_run.call_args_list[1][0][0][-1] == "main"
+        assert mock_run.call_args_list[2][0][0][-1] == "deleted"
+
+    def test_fetches_missing_commit_in_real_repo(self, temp_git_repo, tmp_path, monkeypatch):
+        """Should fetch a branch whose commit isn't local yet from a real origin."""
+        clone = tmp_path / "clone"
+        subprocess.run(["git", "clone", "-q", str(temp_git_repo), str(clone)], check=True, capture_output=True)
+        subprocess.run(["git", "checkout", "-q", "-b", "feature"], cwd=temp_git_repo, check=True)
+        (temp_git_repo / "new.txt").write_text("new")
+        subprocess.run(["git", "add", "new.txt"], cwd=temp_git_repo, check=True)
+        subprocess.run(["git", "commit", "-q", "--no-verify", "-m", "new"], cwd=temp_git_repo, check=True)
+        feature_sha = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=temp_git_repo, capture_output=True, text=True
+        ).stdout.strip()
+        monkeypatch.chdir(clone)
+
+        with GitObjectReader() as reader:
+            assert reader.resolve(feature_sha) is None
+            assert sync_git_refs({"origin/feature": feature_sha}, reader) is True
+            assert reader.resolve(feature_sha) == feature_sha
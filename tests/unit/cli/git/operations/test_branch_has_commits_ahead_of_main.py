@@ -3,6 +3,13 @@
 from unittest.mock import MagicMock, patch
 
 from agentic_devtools.cli.git import operations
+from agentic_devtools.cli.git.snapshot import RepoSnapshot
+
+
+def _snapshot(branch="feature/test", refs=None) -> RepoSnapshot:
+    if refs is None:
+        refs = {"refs/remotes/origin/main": "def456"}
+    return RepoSnapshot(branch=branch, head_sha="abc123", refs=refs)
 
 
 class TestBranchHasCommitsAheadOfMain:
@@ -10,67 +17,65 @@ class TestBranchHasCommitsAheadOfMain:
 
     def test_returns_true_when_ahead(self, mock_run_safe):
         """Test returns True when branch is ahead of main."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse origin/main
-                MagicMock(returncode=0, stdout="3\n", stderr=""),  # 3 commits ahead
-            ]
+        mock_run_safe.return_value = MagicMock(returncode=0, stdout="0\t3\n", stderr="")
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot()):
             result = operations.branch_has_commits_ahead_of_main()
-            assert result is True
+        assert result is True
+        assert "origin/main...HEAD" in mock_run_safe.call_args[0][0]
 
     def test_returns_false_when_not_ahead(self, mock_run_safe):
         """Test returns False when branch is not ahead."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse origin/main
-                MagicMock(returncode=0, stdout="0\n", stderr=""),  # 0 commits ahead
-            ]
+        mock_run_safe.return_value = MagicMock(returncode=0, stdout="4\t0\n", stderr="")
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot()):
+            result = operations.branch_has_commits_ahead_of_main()
+        assert result is False
+
+    def test_returns_false_when_at_main(self, mock_run_safe):
+        """Test returns False without running git when HEAD is at origin/main."""
+        snapshot = _snapshot(refs={"refs/remotes/origin/main": "abc123"})
+        with patch.object(operations, "get_repo_snapshot", return_value=snapshot):
             result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        assert result is False
+        mock_run_safe.assert_not_called()
 
     def test_returns_false_when_on_main(self, mock_run_safe):
         """Test returns False when already on main branch."""
-        with patch.object(operations, "get_current_branch", return_value="main"):
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(branch="main")):
+            result = operations.branch_has_commits_ahead_of_main()
+        assert result is False
+
+    def test_returns_false_when_detached(self, mock_run_safe):
+        """Test returns False on a detached HEAD."""
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(branch=None)):
             result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        assert result is False
 
     def test_fallback_to_main_without_origin(self, mock_run_safe):
         """Test falls back to main when origin/main doesn't exist."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=1, stdout="", stderr="not found"),  # origin/main fails
-                MagicMock(returncode=0, stdout="", stderr=""),  # main succeeds
-                MagicMock(returncode=0, stdout="2\n", stderr=""),  # 2 commits ahead
-            ]
+        mock_run_safe.return_value = MagicMock(returncode=0, stdout="0\t2\n", stderr="")
+        snapshot = _snapshot(refs={"refs/heads/main": "def456"})
+        with patch.object(operations, "get_repo_snapshot", return_value=snapshot):
             result = operations.branch_has_commits_ahead_of_main()
-            assert result is True
+        assert result is True
+        assert "main...HEAD" in mock_run_safe.call_args[0][0]
 
     def test_returns_false_when_main_not_found(self, mock_run_safe):
         """Test returns False when neither origin/main nor main exists."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=1, stdout="", stderr="not found"),  # origin/main fails
-                MagicMock(returncode=1, stdout="", stderr="not found"),  # main also fails
-            ]
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(refs={})):
             result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        assert result is False
+        mock_run_safe.assert_not_called()
 
     def test_returns_false_on_rev_list_error(self, mock_run_safe):
         """Test returns False when rev-list fails."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=1, stdout="", stderr="error"),  # rev-list fails
-            ]
+        mock_run_safe.return_value = MagicMock(returncode=1, stdout="", stderr="error")
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot()):
             result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        assert result is False
 
     def test_returns_false_on_invalid_count(self, mock_run_safe):
         """Test returns False when count is not a valid integer."""
-        with patch.object(operations, "get_current_branch", return_value="feature/test"):
-            mock_run_safe.side_effect = [
-                MagicMock(returncode=0, stdout="", stderr=""),  # rev-parse succeeds
-                MagicMock(returncode=0, stdout="invalid\n", stderr=""),  # invalid count
-            ]
+        mock_run_safe.return_value = MagicMock(returncode=0, stdout="invalid\n", stderr="")
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot()):
             result = operations.branch_has_commits_ahead_of_main()
-            assert result is False
+        assert result is False
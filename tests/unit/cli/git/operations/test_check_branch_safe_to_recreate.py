@@ -1,8 +1,18 @@
 """Tests for agentic_devtools.cli.git.operations.check_branch_safe_to_recreate."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from agentic_devtools.cli.git import operations
+from agentic_devtools.cli.git.snapshot import RepoSnapshot
+
+
+def _snapshot(current="feature/test", local=None, origin=None, **kwargs) -> RepoSnapshot:
+    refs = {}
+    if local:
+        refs["refs/heads/feature/test"] = local
+    if origin:
+        refs["refs/remotes/origin/feature/test"] = origin
+    return RepoSnapshot(branch=current, head_sha="abc123", refs=refs, **kwargs)
 
 
 class TestCheckBranchSafeToRecreate:
@@ -10,65 +20,75 @@ class TestCheckBranchSafeToRecreate:
 
     def test_returns_safe_when_branch_does_not_exist_but_on_origin(self, mock_run_safe):
         """Test returns SAFE when branch doesn't exist locally but exists on origin."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            mock_run_git.side_effect = [
-                MagicMock(returncode=1, stdout="", stderr=""),
-                MagicMock(returncode=0, stdout="abc123", stderr=""),
-            ]
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("main", origin="abc123")):
             result = operations.check_branch_safe_to_recreate("feature/test")
-            assert result.status == operations.BranchSafetyCheckResult.SAFE
-            assert result.is_safe
+        assert result.status == operations.BranchSafetyCheckResult.SAFE
+        assert result.is_safe
+        mock_run_safe.assert_not_called()
 
     def test_returns_branch_not_on_origin_when_neither_exists(self, mock_run_safe):
         """Test returns BRANCH_NOT_ON_ORIGIN when branch doesn't exist anywhere."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            mock_run_git.side_effect = [
-                MagicMock(returncode=1, stdout="", stderr=""),
-                MagicMock(returncode=1, stdout="", stderr=""),
-            ]
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("main")):
+            result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.BRANCH_NOT_ON_ORIGIN
+        assert not result.is_safe
+
+    def test_returns_not_on_branch_when_detached(self, mock_run_safe):
+        """Test returns NOT_ON_BRANCH on a detached HEAD."""
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(None, "abc123", "abc123")):
             result = operations.check_branch_safe_to_recreate("feature/test")
-            assert result.status == operations.BranchSafetyCheckResult.BRANCH_NOT_ON_ORIGIN
-            assert not result.is_safe
+        assert result.status == operations.BranchSafetyCheckResult.NOT_ON_BRANCH
+        assert not result.is_safe
 
     def test_returns_uncommitted_changes_when_on_target_branch_dirty(self, mock_run_safe):
         """Test returns UNCOMMITTED_CHANGES when on the target branch with local changes."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            with patch.object(operations, "get_current_branch", return_value="feature/test"):
-                with patch.object(operations, "has_local_changes", return_value=True):
-                    mock_run_git.side_effect = [
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),
-                    ]
-                    result = operations.check_branch_safe_to_recreate("feature/test")
-                    assert result.status == operations.BranchSafetyCheckResult.UNCOMMITTED_CHANGES
-                    assert result.has_local_work_at_risk
+        snapshot = _snapshot(local="abc123", origin="abc123", unstaged=["a.py"])
+        with patch.object(operations, "get_repo_snapshot", return_value=snapshot):
+            result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.UNCOMMITTED_CHANGES
+        assert result.has_local_work_at_risk
+
+    def test_returns_uncommitted_changes_when_on_other_branch_dirty(self, mock_run_safe):
+        """Test names the current branch when another branch has local changes."""
+        snapshot = _snapshot("main", "abc123", "abc123", untracked=["new.py"])
+        with patch.object(operations, "get_repo_snapshot", return_value=snapshot):
+            result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.UNCOMMITTED_CHANGES
+        assert "'main'" in result.message
+
+    def test_returns_branch_not_on_origin_when_only_local_exists(self, mock_run_safe):
+        """Test returns BRANCH_NOT_ON_ORIGIN when the branch only exists locally."""
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(local="abc123")):
+            result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.BRANCH_NOT_ON_ORIGIN
+        assert not result.is_safe
 
     def test_returns_safe_when_on_target_branch_clean_matching_origin(self, mock_run_safe):
         """Test returns SAFE when on target branch, clean, and matching origin."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            with patch.object(operations, "get_current_branch", return_value="feature/test"):
-                with patch.object(operations, "has_local_changes", return_value=False):
-                    mock_run_git.side_effect = [
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),
-                        MagicMock(returncode=0, stdout="abc123\n", stderr=""),
-                        MagicMock(returncode=0, stdout="abc123\n", stderr=""),
-                    ]
-                    result = operations.check_branch_safe_to_recreate("feature/test")
-                    assert result.status == operations.BranchSafetyCheckResult.SAFE
-                    assert result.is_safe
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(local="abc123", origin="abc123")):
+            result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.SAFE
+        assert result.is_safe
+        assert "in sync with origin" in result.message
+
+    def test_returns_safe_when_on_other_branch_matching_origin(self, mock_run_safe):
+        """Test returns SAFE when the target branch matches origin and we're on another branch."""
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("main", "def456", "def456")):
+            result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.SAFE
+        assert result.message == "Branch 'feature/test' is safe to use."
 
     def test_returns_diverged_when_on_target_branch_clean_different_from_origin(self, mock_run_safe):
         """Test returns DIVERGED_FROM_ORIGIN when on target branch but different from origin."""
-        with patch.object(operations, "run_git") as mock_run_git:
-            with patch.object(operations, "get_current_branch", return_value="feature/test"):
-                with patch.object(operations, "has_local_changes", return_value=False):
-                    mock_run_git.side_effect = [
-                        MagicMock(returncode=0, stdout="abc123", stderr=""),
-                        MagicMock(returncode=0, stdout="def456", stderr=""),
-                        MagicMock(returncode=0, stdout="abc123\n", stderr=""),
-                        MagicMock(returncode=0, stdout="def456\n", stderr=""),
-                    ]
-                    result = operations.check_branch_safe_to_recreate("feature/test")
-                    assert result.status == operations.BranchSafetyCheckResult.DIVERGED_FROM_ORIGIN
-                    assert result.has_local_work_at_risk
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(local="abc123", origin="def456")):
+            result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.DIVERGED_FROM_ORIGIN
+        assert result.has_local_work_at_risk
+        assert "different worktree" not in result.message
+
+    def test_returns_diverged_when_on_other_branch_different_from_origin(self, mock_run_safe):
+        """Test suggests a different worktree when the diverged branch isn't checked out."""
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("main", "abc123", "def456")):
+            result = operations.check_branch_safe_to_recreate("feature/test")
+        assert result.status == operations.BranchSafetyCheckResult.DIVERGED_FROM_ORIGIN
+        assert "different worktree" in result.message
@@ -2,7 +2,12 @@
 
 from unittest.mock import MagicMock, patch
 
-from agentic_devtools.cli.git import core, operations
+from agentic_devtools.cli.git import operations
+from agentic_devtools.cli.git.snapshot import RepoSnapshot
+
+
+def _snapshot(branch, **kwargs) -> RepoSnapshot:
+    return RepoSnapshot(branch=branch, head_sha="abc123", **kwargs)
 
 
 class TestCheckoutBranch:
@@ -10,26 +15,25 @@ class TestCheckoutBranch:
 
     def test_checkout_success(self, mock_run_safe):
         """Test successful checkout."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("other-branch")):
+            with patch.object(operations, "run_git") as mock_run_git:
+                mock_run_git.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-                    result = operations.checkout_branch("feature/test", dry_run=False)
+                result = operations.checkout_branch("feature/test", dry_run=False)
 
-                    assert result.is_success
-                    mock_run_git.assert_called()
+                assert result.is_success
+                mock_run_git.assert_called()
 
     def test_checkout_already_on_branch(self, mock_run_safe):
         """Test checkout when already on the branch."""
-        with patch.object(core, "get_current_branch", return_value="feature/test"):
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("feature/test")):
             result = operations.checkout_branch("feature/test", dry_run=False)
 
             assert result.is_success
 
     def test_checkout_dry_run(self, mock_run_safe, capsys):
         """Test dry run doesn't execute checkout."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("other-branch")):
             result = operations.checkout_branch("feature/test", dry_run=True)
 
             assert result.is_success
@@ -39,68 +43,63 @@ class TestCheckoutBranch:
 
     def test_checkout_uncommitted_changes(self, mock_run_safe):
         """Test checkout fails with uncommitted changes."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            with patch.object(operations, "has_local_changes", return_value=True):
-                result = operations.checkout_branch("feature/test", dry_run=False)
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("other-branch", staged=["a.py"])):
+            result = operations.checkout_branch("feature/test", dry_run=False)
 
-                assert not result.is_success
-                assert result.status == operations.CheckoutResult.UNCOMMITTED_CHANGES
+            assert not result.is_success
+            assert result.status == operations.CheckoutResult.UNCOMMITTED_CHANGES
 
     def test_checkout_branch_not_found(self, mock_run_safe):
         """Test checkout fails when branch doesn't exist."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.return_value = MagicMock(
-                        returncode=1,
-                        stdout="",
-                        stderr="error: pathspec 'feature/nonexistent' did not match any file(s) known to git",
-                    )
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("other-branch")):
+            with patch.object(operations, "run_git") as mock_run_git:
+                mock_run_git.return_value = MagicMock(
+                    returncode=1,
+                    stdout="",
+                    stderr="error: pathspec 'feature/nonexistent' did not match any file(s) known to git",
+                )
 
-                    result = operations.checkout_branch("feature/nonexistent", dry_run=False)
+                result = operations.checkout_branch("feature/nonexistent", dry_run=False)
 
-                    assert not result.is_success
-                    assert result.status == operations.CheckoutResult.BRANCH_NOT_FOUND
+                assert not result.is_success
+                assert result.status == operations.CheckoutResult.BRANCH_NOT_FOUND
 
     def test_checkout_generic_error(self, mock_run_safe):
         """Test checkout handles generic errors."""
-        with patch.object(core, "get_current_branch", return_value="other-branch"):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.return_value = MagicMock(
-                        returncode=1,
-                        stdout="",
-                        stderr="fatal: some unexpected error",
-                    )
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("other-branch")):
+            with patch.object(operations, "run_git") as mock_run_git:
+                mock_run_git.return_value = MagicMock(
+                    returncode=1,
+                    stdout="",
+                    stderr="fatal: some unexpected error",
+                )
 
-                    result = operations.checkout_branch("feature/test", dry_run=False)
+                result = operations.checkout_branch("feature/test", dry_run=False)
 
-                    assert not result.is_success
-                    assert result.status == operations.CheckoutResult.ERROR
+                assert not result.is_success
+                assert result.status == operations.CheckoutResult.ERROR
 
     def test_checkout_from_detached_head(self, mock_run_safe):
-        """Test checkout when starting from detached HEAD (get_current_branch raises SystemExit)."""
-        with patch.object(core, "get_current_branch", side_effect=SystemExit(1)):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        """Test checkout when starting from detached HEAD (snapshot has no branch)."""
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(None)):
+            with patch.object(operations, "run_git") as mock_run_git:
+                mock_run_git.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-                    result = operations.checkout_branch("feature/test", dry_run=False)
+                result = operations.checkout_branch("feature/test", dry_run=False)
 
-                    assert result.is_success
-                    mock_run_git.assert_called()
+                assert result.is_success
+                mock_run_git.assert_called()
 
     def test_checkout_from_origin_when_local_does_not_exist(self, mock_run_safe):
         """Test checkout creates local branch from origin when local doesn't exist."""
-        with patch.object(core, "get_current_branch", return_value="main"):
-            with patch.object(operations, "has_local_changes", return_value=False):
-                with patch.object(operations, "run_git") as mock_run_git:
-                    mock_run_git.side_effect = [
-                        MagicMock(returncode=1, stdout="", stderr="did not match"),
-                        MagicMock(returncode=0, stdout="", stderr=""),
-                    ]
-
-                    result = operations.checkout_branch("feature/new-branch", dry_run=False)
-
-                    assert result.is_success
-                    assert mock_run_git.call_count == 2
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("main")):
+            with patch.object(operations, "run_git") as mock_run_git:
+                mock_run_git.side_effect = [
+                    MagicMock(returncode=1, stdout="", stderr="did not match"),
+                    MagicMock(returncode=0, stdout="", stderr=""),
+                ]
+
+                result = operations.checkout_branch("feature/new-branch", dry_run=False)
+
+                assert result.is_success
+                assert mock_run_git.call_count == 2
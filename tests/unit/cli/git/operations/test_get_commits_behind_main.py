@@ -1,6 +1,6 @@
 """Tests for agentic_devtools.cli.git.operations.get_commits_behind_main."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from agentic_devtools.cli.git import operations
 
@@ -9,25 +9,26 @@ class TestGetCommitsBehindMain:
     """Tests for get_commits_behind_main function."""
 
     def test_returns_count_when_behind(self, mock_run_safe):
-        """Test returns correct count when behind main."""
-        mock_run_safe.return_value = MagicMock(returncode=0, stdout="5\n", stderr="")
-        result = operations.get_commits_behind_main()
+        """Test returns the behind count from a single rev-list, without taking a snapshot."""
+        mock_run_safe.return_value = MagicMock(returncode=0, stdout="5\t2\n", stderr="")
+        with patch.object(operations, "get_repo_snapshot") as mock_snapshot:
+            result = operations.get_commits_behind_main()
         assert result == 5
+        mock_snapshot.assert_not_called()
+        mock_run_safe.assert_called_once()
+        assert "origin/main...HEAD" in mock_run_safe.call_args[0][0]
 
     def test_returns_zero_when_up_to_date(self, mock_run_safe):
-        """Test returns 0 when up to date with main."""
-        mock_run_safe.return_value = MagicMock(returncode=0, stdout="0\n", stderr="")
-        result = operations.get_commits_behind_main()
-        assert result == 0
+        """Test returns 0 when HEAD contains origin/main."""
+        mock_run_safe.return_value = MagicMock(returncode=0, stdout="0\t3\n", stderr="")
+        assert operations.get_commits_behind_main() == 0
 
     def test_returns_zero_on_error(self, mock_run_safe):
-        """Test returns 0 when git command fails."""
-        mock_run_safe.return_value = MagicMock(returncode=1, stdout="", stderr="error")
-        result = operations.get_commits_behind_main()
-        assert result == 0
+        """Test returns 0 when git command fails (e.g. origin/main doesn't exist)."""
+        mock_run_safe.return_value = MagicMock(returncode=128, stdout="", stderr="error")
+        assert operations.get_commits_behind_main() == 0
 
     def test_returns_zero_on_invalid_count(self, mock_run_safe):
         """Test returns 0 when count is not a valid integer."""
         mock_run_safe.return_value = MagicMock(returncode=0, stdout="invalid\n", stderr="")
-        result = operations.get_commits_behind_main()
-        assert result == 0
+        assert operations.get_commits_behind_main() == 0
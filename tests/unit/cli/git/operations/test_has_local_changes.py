@@ -1,90 +1,48 @@
 """Tests for agentic_devtools.cli.git.operations.has_local_changes."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from agentic_devtools.cli.git import operations
+from agentic_devtools.cli.git.snapshot import RepoSnapshot
+
+
+def _snapshot(**kwargs) -> RepoSnapshot:
+    return RepoSnapshot(branch="feature/test", head_sha="abc123", **kwargs)
 
 
 class TestHasLocalChanges:
     """Tests for has_local_changes function."""
 
-    def test_staged_changes_returns_true(self, mock_run_safe):
+    def test_staged_changes_returns_true(self):
         """When there are staged changes, should return True."""
-        mock_result_staged = MagicMock()
-        mock_result_staged.returncode = 1  # Non-zero = has staged changes
-
-        with patch.object(operations, "run_git", return_value=mock_result_staged):
-            result = operations.has_local_changes()
-
-        assert result is True
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(staged=["a.py"])):
+            assert operations.has_local_changes() is True
 
-    def test_unstaged_changes_returns_true(self, mock_run_safe):
+    def test_unstaged_changes_returns_true(self):
         """When there are unstaged changes, should return True."""
-        mock_result_no_staged = MagicMock()
-        mock_result_no_staged.returncode = 0
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(unstaged=["a.py"])):
+            assert operations.has_local_changes() is True
 
-        mock_result_unstaged = MagicMock()
-        mock_result_unstaged.returncode = 1  # Non-zero = has unstaged changes
-
-        with patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_result_no_staged, mock_result_unstaged],
-        ):
-            result = operations.has_local_changes()
-
-        assert result is True
-
-    def test_untracked_files_returns_true(self, mock_run_safe):
+    def test_untracked_files_returns_true(self):
         """When there are untracked files, should return True."""
-        mock_result_clean = MagicMock()
-        mock_result_clean.returncode = 0
-
-        mock_result_untracked = MagicMock()
-        mock_result_untracked.returncode = 0
-        mock_result_untracked.stdout = "new_file.txt\nanother_file.py\n"
+        snapshot = _snapshot(untracked=["new_file.txt", "another_file.py"])
+        with patch.object(operations, "get_repo_snapshot", return_value=snapshot):
+            assert operations.has_local_changes() is True
 
-        with patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_result_clean, mock_result_clean, mock_result_untracked],
-        ):
-            result = operations.has_local_changes()
+    def test_conflicted_files_returns_true(self):
+        """When there are unmerged files, should return True."""
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(conflicted=["a.py"])):
+            assert operations.has_local_changes() is True
 
-        assert result is True
-
-    def test_clean_working_directory_returns_false(self, mock_run_safe):
+    def test_clean_working_directory_returns_false(self):
         """When working directory is clean, should return False."""
-        mock_result_clean = MagicMock()
-        mock_result_clean.returncode = 0
-
-        mock_result_no_untracked = MagicMock()
-        mock_result_no_untracked.returncode = 0
-        mock_result_no_untracked.stdout = ""
-
-        with patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_result_clean, mock_result_clean, mock_result_no_untracked],
-        ):
-            result = operations.has_local_changes()
-
-        assert result is False
-
-    def test_untracked_with_only_whitespace_returns_false(self, mock_run_safe):
-        """When untracked output is only whitespace, should return False."""
-        mock_result_clean = MagicMock()
-        mock_result_clean.returncode = 0
-
-        mock_result_whitespace = MagicMock()
-        mock_result_whitespace.returncode = 0
-        mock_result_whitespace.stdout = "   \n  \n"
-
-        with patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_result_clean, mock_result_clean, mock_result_whitespace],
-        ):
-            result = operations.has_local_changes()
-
-        assert result is False
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot()):
+            assert operations.has_local_changes() is False
+
+    def test_reads_real_repository(self, temp_git_repo, monkeypatch):
+        """An untracked file in a real repository counts as a local change."""
+        monkeypatch.chdir(temp_git_repo)
+        assert operations.has_local_changes() is False
+        (temp_git_repo / "new_file.txt").write_text("content")
+        operations.invalidate_repo_snapshot()
+        assert operations.has_local_changes() is True
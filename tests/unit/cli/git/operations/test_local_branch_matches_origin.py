@@ -3,6 +3,14 @@
 from unittest.mock import MagicMock, patch
 
 from agentic_devtools.cli.git import operations
+from agentic_devtools.cli.git.snapshot import RepoSnapshot
+
+
+def _snapshot(origin_sha, upstream="origin/feature/test-branch", ahead=0, behind=0, branch="feature/test-branch"):
+    refs = {"refs/heads/feature/test-branch": "abc123"}
+    if origin_sha:
+        refs["refs/remotes/origin/feature/test-branch"] = origin_sha
+    return RepoSnapshot(branch=branch, head_sha="abc123", upstream=upstream, ahead=ahead, behind=behind, refs=refs)
 
 
 class TestLocalBranchMatchesOrigin:
@@ -10,190 +18,53 @@ class TestLocalBranchMatchesOrigin:
 
     def test_in_sync_returns_true(self, mock_run_safe):
         """When local and origin are in sync, should return True."""
-        mock_origin_exists = MagicMock()
-        mock_origin_exists.returncode = 0
-
-        mock_ahead = MagicMock()
-        mock_ahead.returncode = 0
-        mock_ahead.stdout = "0\n"
-
-        mock_behind = MagicMock()
-        mock_behind.returncode = 0
-        mock_behind.stdout = "0\n"
-
-        with patch.object(
-            operations,
-            "get_current_branch",
-            return_value="feature/test-branch",
-        ), patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_origin_exists, mock_ahead, mock_behind],
-        ):
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("abc123")):
             result = operations.local_branch_matches_origin()
 
         assert result is True
+        mock_run_safe.assert_not_called()
 
     def test_ahead_of_origin_returns_false(self, mock_run_safe):
         """When local is ahead of origin, should return False."""
-        mock_origin_exists = MagicMock()
-        mock_origin_exists.returncode = 0
-
-        mock_ahead = MagicMock()
-        mock_ahead.returncode = 0
-        mock_ahead.stdout = "3\n"
-
-        mock_behind = MagicMock()
-        mock_behind.returncode = 0
-        mock_behind.stdout = "0\n"
-
-        with patch.object(
-            operations,
-            "get_current_branch",
-            return_value="feature/test-branch",
-        ), patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_origin_exists, mock_ahead, mock_behind],
-        ):
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("def456", ahead=3)):
             result = operations.local_branch_matches_origin()
 
         assert result is False
 
     def test_behind_origin_returns_false(self, mock_run_safe):
         """When local is behind origin, should return False."""
-        mock_origin_exists = MagicMock()
-        mock_origin_exists.returncode = 0
-
-        mock_ahead = MagicMock()
-        mock_ahead.returncode = 0
-        mock_ahead.stdout = "0\n"
-
-        mock_behind = MagicMock()
-        mock_behind.returncode = 0
-        mock_behind.stdout = "2\n"
-
-        with patch.object(
-            operations,
-            "get_current_branch",
-            return_value="feature/test-branch",
-        ), patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_origin_exists, mock_ahead, mock_behind],
-        ):
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("def456", behind=2)):
             result = operations.local_branch_matches_origin()
 
         assert result is False
 
     def test_origin_branch_not_exists_returns_false(self, mock_run_safe):
         """When origin branch doesn't exist, should return False."""
-        mock_origin_not_exists = MagicMock()
-        mock_origin_not_exists.returncode = 128
-
-        with patch.object(
-            operations,
-            "get_current_branch",
-            return_value="feature/new-branch",
-        ), patch.object(
-            operations,
-            "run_git",
-            return_value=mock_origin_not_exists,
-        ):
-            result = operations.local_branch_matches_origin()
-
-        assert result is False
-
-    def test_ahead_count_parse_error_returns_false(self, mock_run_safe):
-        """When ahead count can't be parsed, should return False."""
-        mock_origin_exists = MagicMock()
-        mock_origin_exists.returncode = 0
-
-        mock_ahead_bad = MagicMock()
-        mock_ahead_bad.returncode = 0
-        mock_ahead_bad.stdout = "not-a-number\n"
-
-        with patch.object(
-            operations,
-            "get_current_branch",
-            return_value="feature/test-branch",
-        ), patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_origin_exists, mock_ahead_bad],
-        ):
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot(None, upstream=None)):
             result = operations.local_branch_matches_origin()
 
         assert result is False
 
-    def test_behind_count_parse_error_returns_false(self, mock_run_safe):
-        """When behind count can't be parsed, should return False."""
-        mock_origin_exists = MagicMock()
-        mock_origin_exists.returncode = 0
-
-        mock_ahead = MagicMock()
-        mock_ahead.returncode = 0
-        mock_ahead.stdout = "0\n"
-
-        mock_behind_bad = MagicMock()
-        mock_behind_bad.returncode = 0
-        mock_behind_bad.stdout = "invalid\n"
-
-        with patch.object(
-            operations,
-            "get_current_branch",
-            return_value="feature/test-branch",
-        ), patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_origin_exists, mock_ahead, mock_behind_bad],
-        ):
+    def test_detached_head_returns_false(self, mock_run_safe):
+        """On a detached HEAD there is no origin branch to compare with, should return False."""
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("abc123", branch=None)):
             result = operations.local_branch_matches_origin()
 
         assert result is False
 
-    def test_ahead_command_fails_returns_false(self, mock_run_safe):
-        """When rev-list for ahead fails, should return False."""
-        mock_origin_exists = MagicMock()
-        mock_origin_exists.returncode = 0
-
-        mock_ahead_fail = MagicMock()
-        mock_ahead_fail.returncode = 1
-
-        with patch.object(
-            operations,
-            "get_current_branch",
-            return_value="feature/test-branch",
-        ), patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_origin_exists, mock_ahead_fail],
-        ):
+    def test_counts_without_upstream_uses_rev_list(self, mock_run_safe):
+        """When origin isn't the upstream, the counts come from rev-list."""
+        mock_run_safe.return_value = MagicMock(returncode=0, stdout="1\t0\n", stderr="")
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("def456", upstream=None)):
             result = operations.local_branch_matches_origin()
 
         assert result is False
+        assert "origin/feature/test-branch...HEAD" in mock_run_safe.call_args[0][0]
 
-    def test_behind_command_fails_returns_false(self, mock_run_safe):
-        """When rev-list for behind fails, should return False."""
-        mock_origin_exists = MagicMock()
-        mock_origin_exists.returncode = 0
-
-        mock_ahead = MagicMock()
-        mock_ahead.returncode = 0
-        mock_ahead.stdout = "0\n"
-
-        mock_behind_fail = MagicMock()
-        mock_behind_fail.returncode = 1
-
-        with patch.object(
-            operations,
-            "get_current_branch",
-            return_value="feature/test-branch",
-        ), patch.object(
-            operations,
-            "run_git",
-            side_effect=[mock_origin_exists, mock_ahead, mock_behind_fail],
-        ):
+    def test_rev_list_fails_returns_false(self, mock_run_safe):
+        """When rev-list fails, should return False."""
+        mock_run_safe.return_value = MagicMock(returncode=1, stdout="", stderr="error")
+        with patch.object(operations, "get_repo_snapshot", return_value=_snapshot("def456", upstream=None)):
             result = operations.local_branch_matches_origin()
 
         assert result is False
@@ -0,0 +1,25 @@
+"""Tests for agentic_devtools.cli.git.snapshot.count_ahead_behind."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.git import snapshot
+from agentic_devtools.cli.git.snapshot import count_ahead_behind
+
+
+class TestCountAheadBehind:
+    """Tests for count_ahead_behind function."""
+
+    def test_parses_left_right_counts(self):
+        """Test that the left (behind) and right (ahead) counts are returned as (ahead, behind)."""
+        with patch.object(snapshot, "run_git", return_value=MagicMock(returncode=0, stdout="4\t1\n")):
+            assert count_ahead_behind("origin/main") == (1, 4)
+
+    def test_git_failure(self):
+        """Test that a failing rev-list returns None."""
+        with patch.object(snapshot, "run_git", return_value=MagicMock(returncode=128, stdout="")):
+            assert count_ahead_behind("origin/main") is None
+
+    def test_invalid_output(self):
+        """Test that unparseable output returns None."""
+        with patch.object(snapshot, "run_git", return_value=MagicMock(returncode=0, stdout="garbage\n")):
+            assert count_ahead_behind("origin/main") is None
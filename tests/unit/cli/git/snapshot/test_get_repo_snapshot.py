@@ -0,0 +1,35 @@
+"""Tests for agentic_devtools.cli.git.snapshot.get_repo_snapshot."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.git import snapshot
+from agentic_devtools.cli.git.snapshot import RepoSnapshot, get_repo_snapshot
+
+
+class TestGetRepoSnapshot:
+    """Tests for get_repo_snapshot function."""
+
+    def test_caches_snapshot(self, tmp_path, monkeypatch):
+        """Test that the snapshot is taken once per working directory."""
+        monkeypatch.chdir(tmp_path)
+        taken = RepoSnapshot(branch="main", head_sha=None)
+
+        with patch.object(snapshot, "take_repo_snapshot", return_value=taken) as mock_take:
+            assert get_repo_snapshot() is taken
+            assert get_repo_snapshot() is taken
+
+        mock_take.assert_called_once()
+
+    def test_new_snapshot_for_other_directory(self, tmp_path, monkeypatch):
+        """Test that changing directory takes a new snapshot."""
+        (tmp_path / "other").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        with patch.object(
+            snapshot,
+            "take_repo_snapshot",
+            side_effect=[RepoSnapshot(branch="a", head_sha=None), RepoSnapshot(branch="b", head_sha=None)],
+        ):
+            assert get_repo_snapshot().branch == "a"
+            monkeypatch.chdir(tmp_path / "other")
+            assert get_repo_snapshot().branch == "b"
@@ -0,0 +1,21 @@
+"""Tests for agentic_devtools.cli.git.snapshot.invalidate_repo_snapshot."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.git import snapshot
+from agentic_devtools.cli.git.snapshot import RepoSnapshot, get_repo_snapshot, invalidate_repo_snapshot
+
+
+class TestInvalidateRepoSnapshot:
+    """Tests for invalidate_repo_snapshot function."""
+
+    def test_next_call_takes_new_snapshot(self):
+        """Test that a snapshot is taken again after invalidation."""
+        with patch.object(
+            snapshot,
+            "take_repo_snapshot",
+            side_effect=[RepoSnapshot(branch="a", head_sha=None), RepoSnapshot(branch="b", head_sha=None)],
+        ):
+            assert get_repo_snapshot().branch == "a"
+            invalidate_repo_snapshot()
+            assert get_repo_snapshot().branch == "b"
@@ -0,0 +1,40 @@
+"""Tests for agentic_devtools.cli.git.snapshot.parse_refs."""
+
+from agentic_devtools.cli.git.snapshot import RepoSnapshot, parse_refs
+
+
+def _empty() -> RepoSnapshot:
+    return RepoSnapshot(branch=None, head_sha=None)
+
+
+class TestParseRefs:
+    """Tests for parse_refs function."""
+
+    def test_maps_ref_names_to_shas(self):
+        """Test that each line maps a full ref name to its SHA, skipping malformed lines."""
+        output = "aaa\0refs/heads/main\0 \0\nbbb\0refs/remotes/origin/main\0 \0\n\nccc\n"
+        snapshot = _empty()
+
+        parse_refs(output, snapshot)
+
+        assert snapshot.refs == {"refs/heads/main": "aaa", "refs/remotes/origin/main": "bbb"}
+        assert snapshot.branch is None
+        assert snapshot.head_sha is None
+
+    def test_checked_out_branch(self):
+        """Test that the branch marked as checked out sets the branch, HEAD and upstream."""
+        output = "aaa\0refs/heads/feature/x\0*\0origin/feature/x\nbbb\0refs/heads/main\0 \0origin/main\n"
+        snapshot = _empty()
+
+        parse_refs(output, snapshot)
+
+        assert (snapshot.branch, snapshot.head_sha, snapshot.upstream) == ("feature/x", "aaa", "origin/feature/x")
+
+    def test_checked_out_branch_without_upstream(self):
+        """Test that a checked-out branch without an upstream leaves the upstream unset."""
+        snapshot = _empty()
+
+        parse_refs("aaa\0refs/heads/local\0*\0\n", snapshot)
+
+        assert snapshot.branch == "local"
+        assert snapshot.upstream is None
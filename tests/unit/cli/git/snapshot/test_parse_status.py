@@ -0,0 +1,54 @@
+"""Tests for agentic_devtools.cli.git.snapshot.parse_status."""
+
+from agentic_devtools.cli.git.snapshot import RepoSnapshot, parse_status
+
+SHA = "c" * 40
+
+
+def _parse(*entries: str) -> RepoSnapshot:
+    """Parse NUL-terminated status entries into a fresh snapshot."""
+    snapshot = RepoSnapshot(branch=None, head_sha=None)
+    parse_status("".join(f"{entry}\0" for entry in entries), snapshot)
+    return snapshot
+
+
+class TestParseStatus:
+    """Tests for parse_status function."""
+
+    def test_branch_headers(self):
+        """Test that branch, HEAD, upstream and ahead/behind headers are read."""
+        snapshot = _parse(
+            f"# branch.oid {SHA}",
+            "# branch.head feature/x",
+            "# branch.upstream origin/feature/x",
+            "# branch.ab +2 -3",
+        )
+
+        assert snapshot.head_sha == SHA
+        assert snapshot.branch == "feature/x"
+        assert snapshot.upstream == "origin/feature/x"
+        assert (snapshot.ahead, snapshot.behind) == (2, 3)
+
+    def test_initial_and_detached(self):
+        """Test that an unborn HEAD and a detached HEAD are recorded as None."""
+        snapshot = _parse("# branch.oid (initial)", "# branch.head (detached)")
+
+        assert snapshot.head_sha is None
+        assert snapshot.branch is None
+
+    def test_file_entries(self):
+        """Test that staged, unstaged, renamed, conflicted and untracked files are sorted out."""
+        snapshot = _parse(
+            "1 M. N... 100644 100644 100644 aaa bbb staged.py",
+            "1 .M N... 100644 100644 100644 aaa aaa unstaged file.py",
+            "1 MM N... 100644 100644 100644 aaa bbb both.py",
+            "2 R. N... 100644 100644 100644 aaa aaa R100 new name.py",
+            "old name.py",
+            "u UU N... 100644 100644 100644 100644 aaa bbb ccc conflict.py",
+            "? new dir/",
+        )
+
+        assert snapshot.staged == ["staged.py", "both.py", "new name.py"]
+        assert snapshot.unstaged == ["unstaged file.py", "both.py"]
+        assert snapshot.conflicted == ["conflict.py"]
+        assert snapshot.untracked == ["new dir/"]
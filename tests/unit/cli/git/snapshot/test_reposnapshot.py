@@ -0,0 +1,101 @@
+"""Tests for agentic_devtools.cli.git.snapshot.RepoSnapshot."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.git import snapshot as snapshot_module
+from agentic_devtools.cli.git.snapshot import RepoSnapshot
+
+HEAD = "a" * 40
+MAIN = "b" * 40
+
+
+def _snapshot(**kwargs) -> RepoSnapshot:
+    """Create a snapshot on feature/x with origin/main and origin/feature/x refs."""
+    defaults = {
+        "branch": "feature/x",
+        "head_sha": HEAD,
+        "refs": {
+            "refs/heads/feature/x": HEAD,
+            "refs/remotes/origin/feature/x": HEAD,
+            "refs/remotes/origin/main": MAIN,
+        },
+    }
+    defaults.update(kwargs)
+    return RepoSnapshot(**defaults)
+
+
+class TestRepoSnapshot:
+    """Tests for RepoSnapshot dataclass."""
+
+    def test_has_local_changes_when_clean(self):
+        """Test that a clean working tree has no local changes."""
+        assert _snapshot().has_local_changes is False
+
+    def test_has_local_changes(self):
+        """Test that any staged, unstaged, untracked or conflicted file counts as a change."""
+        for field_name in ("staged", "unstaged", "untracked", "conflicted"):
+            assert _snapshot(**{field_name: ["file.py"]}).has_local_changes is True
+
+    def test_resolve_ref(self):
+        """Test that local, remote and full ref names resolve to SHAs."""
+        snapshot = _snapshot()
+
+        assert snapshot.resolve_ref("feature/x") == HEAD
+        assert snapshot.resolve_ref("origin/main") == MAIN
+        assert snapshot.resolve_ref("refs/remotes/origin/main") == MAIN
+        assert snapshot.resolve_ref("refs/heads/main") is None
+        assert snapshot.resolve_ref("missing") is None
+
+    def test_ahead_behind_same_commit(self):
+        """Test that a ref at HEAD is answered without running git."""
+        with patch.object(snapshot_module, "run_git") as mock_run_git:
+            assert _snapshot().ahead_behind("origin/feature/x") == (0, 0)
+
+        mock_run_git.assert_not_called()
+
+    def test_ahead_behind_upstream(self):
+        """Test that the upstream's counts come from git status."""
+        snapshot = _snapshot(upstream="origin/main", ahead=2, behind=1)
+
+        with patch.object(snapshot_module, "run_git") as mock_run_git:
+            assert snapshot.ahead_behind("origin/main") == (2, 1)
+
+        mock_run_git.assert_not_called()
+
+    def test_ahead_behind_upstream_before_status(self):
+        """Test that the upstream is counted with rev-list until git status has run."""
+        snapshot = _snapshot(upstream="origin/main", status_loaded=False)
+        result = MagicMock(returncode=0, stdout="1\t2\n")
+
+        with patch.object(snapshot_module, "run_git", return_value=result) as mock_run_git:
+            assert snapshot.ahead_behind("origin/main") == (2, 1)
+
+        assert mock_run_git.call_args[0][0] == "rev-list"
+
+    def test_has_local_changes_loads_status_once(self):
+        """Test that the first working tree question runs git status, later ones reuse it."""
+        snapshot = _snapshot(status_loaded=False)
+        status = MagicMock(returncode=0, stdout="# branch.head feature/x\0? new.txt\0")
+
+        with patch.object(snapshot_module, "run_git", return_value=status) as mock_run_git:
+            assert snapshot.has_local_changes is True
+            assert snapshot.has_local_changes is True
+
+        mock_run_git.assert_called_once()
+        assert snapshot.untracked == ["new.txt"]
+
+    def test_ahead_behind_runs_rev_list_once(self):
+        """Test that other refs are counted with one remembered rev-list call."""
+        snapshot = _snapshot()
+        result = MagicMock(returncode=0, stdout="3\t5\n")
+
+        with patch.object(snapshot_module, "run_git", return_value=result) as mock_run_git:
+            assert snapshot.ahead_behind("origin/main") == (5, 3)
+            assert snapshot.ahead_behind("origin/main") == (5, 3)
+
+        mock_run_git.assert_called_once_with("rev-list", "--left-right", "--count", "origin/main...HEAD", check=False)
+
+    def test_ahead_behind_unknown_ref(self):
+        """Test that a missing ref or missing HEAD can't be compared."""
+        assert _snapshot().ahead_behind("origin/missing") is None
+        assert _snapshot(head_sha=None).ahead_behind("origin/main") is None
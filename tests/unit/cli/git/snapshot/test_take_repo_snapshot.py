@@ -0,0 +1,68 @@
+"""Tests for agentic_devtools.cli.git.snapshot.take_repo_snapshot."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.git import snapshot
+from agentic_devtools.cli.git.snapshot import take_repo_snapshot
+
+
+def _git(repo, *args: str) -> str:
+    """Run git in the test repository and return its output."""
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+class TestTakeRepoSnapshot:
+    """Tests for take_repo_snapshot function."""
+
+    def test_reads_real_repository(self, temp_git_repo, monkeypatch):
+        """Test that branch, HEAD, refs and file states are read from a real repository."""
+        monkeypatch.chdir(temp_git_repo)
+        branch = _git(temp_git_repo, "rev-parse", "--abbrev-ref", "HEAD")
+        head = _git(temp_git_repo, "rev-parse", "HEAD")
+        (temp_git_repo / "README.md").write_text("changed\n")
+        (temp_git_repo / "new.txt").write_text("new\n")
+
+        result = take_repo_snapshot()
+
+        assert result.branch == branch
+        assert result.head_sha == head
+        assert result.resolve_ref(branch) == head
+        assert result.status_loaded is False
+        assert result.has_local_changes is True
+        assert result.unstaged == ["README.md"]
+        assert result.untracked == ["new.txt"]
+
+    def test_branch_questions_skip_git_status(self):
+        """Test that a checked-out branch is read from for-each-ref alone."""
+        refs = MagicMock(returncode=0, stdout="aaa\0refs/heads/main\0*\0origin/main\n")
+
+        with patch.object(snapshot, "run_git", return_value=refs) as mock_run_git:
+            result = take_repo_snapshot()
+
+        assert (result.branch, result.head_sha, result.upstream) == ("main", "aaa", "origin/main")
+        assert mock_run_git.call_count == 1
+        assert mock_run_git.call_args[0][0] == "for-each-ref"
+
+    def test_detached_head_runs_git_status(self):
+        """Test that git status fills in HEAD when no branch is checked out."""
+        refs = MagicMock(returncode=0, stdout="aaa\0refs/heads/main\0 \0\n")
+        status = MagicMock(returncode=0, stdout="# branch.oid bbb\0# branch.head (detached)\0")
+
+        with patch.object(snapshot, "run_git", side_effect=[refs, status]):
+            result = take_repo_snapshot()
+
+        assert result.branch is None
+        assert result.head_sha == "bbb"
+        assert result.status_loaded is True
+
+    def test_for_each_ref_failure(self):
+        """Test that a failing for-each-ref leaves the refs empty and falls back to git status."""
+        refs = MagicMock(returncode=1, stdout="")
+        status = MagicMock(returncode=0, stdout="# branch.oid aaa\0# branch.head main\0")
+
+        with patch.object(snapshot, "run_git", side_effect=[refs, status]):
+            result = take_repo_snapshot()
+
+        assert result.branch == "main"
+        assert result.refs == {}
@@ -2,6 +2,8 @@
 Tests for Jira async commands and write_async_status function.
 """
 
+import json
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -11,17 +13,17 @@ from agdt_ai_helpers.cli.jira.async_commands import (
 )
 
 
-def _get_script_from_call(mock_popen):
-    """Extract the Python script from the Popen call args."""
+def _get_handoff_from_call(mock_popen):
+    """Read the runner handoff file from the Popen call args."""
     call_args = mock_popen.call_args[0][0]  # First positional arg is the command list
-    # Script is the third element: [python, -c, <script>]
-    return call_args[2] if len(call_args) > 2 else ""
+    # The handoff file is the last element: [python, -c, <bootstrap>, <package dir>, <handoff>]
+    return json.loads(Path(call_args[-1]).read_text(encoding="utf-8"))
 
 
-def _assert_function_in_script(script, module_path, function_name):
-    """Assert the script calls the expected function from the expected module."""
-    assert f"module_path = '{module_path}'" in script, f"Expected module_path = '{module_path}' in script"
-    assert f"function_name = '{function_name}'" in script, f"Expected function_name = '{function_name}' in script"
+def _assert_function_in_handoff(handoff, module_path, function_name):
+    """Assert that the runner handoff calls the expected module and function."""
+    assert handoff["module_path"] == module_path
+    assert handoff["function_name"] == function_name
 
 
 class TestCreateIssueAsync:
@@ -45,6 +45,8 @@ class TestCommandMapIntegrity:
             "agdt-test",
             "agdt-test-quick",
             "agdt-test-file",
+            "agdt-test-affected",
+            "agdt-test-sharded",
         ],
     )
     def test_testing_commands_map_correctly(self, command):
@@ -71,6 +73,7 @@ class TestCommandMapIntegrity:
             "agdt-create-pull-request",
             "agdt-approve-pull-request",
             "agdt-get-pull-request-details",
+            "agdt-approve-files",
         ],
     )
     def test_azure_devops_commands_map_correctly(self, command):
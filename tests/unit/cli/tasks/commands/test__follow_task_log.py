@@ -0,0 +1,109 @@
+"""Tests for agentic_devtools.cli.tasks.commands._follow_task_log."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.tasks import commands
+from agentic_devtools.cli.tasks.commands import DEFAULT_FOLLOW_POLL_INTERVAL, _follow_task_log
+from agentic_devtools.state import set_value
+from agentic_devtools.task_state import BackgroundTask, TaskStatus, add_task, update_task
+
+
+def _add_running_task(log_path):
+    task = BackgroundTask.create(command="agdt-test", log_file=log_path)
+    task.mark_running()
+    add_task(task)
+    return task
+
+
+class TestFollowTaskLog:
+    """Tests for _follow_task_log function."""
+
+    def test_prints_tail_then_appended_output(self, temp_state_dir, capsys):
+        """Test that the last lines are shown, then new output until the task completes."""
+        log_path = temp_state_dir / "task.log"
+        log_path.write_text("".join(f"old {i}\n" for i in range(30)))
+        task = _add_running_task(log_path)
+
+        def fake_follow(path, offset, is_finished, poll_interval):
+            assert offset == log_path.stat().st_size
+            assert poll_interval == DEFAULT_FOLLOW_POLL_INTERVAL
+            assert is_finished() is False
+            task.mark_completed(exit_code=0)
+            update_task(task)
+            assert is_finished() is True
+            yield "new output\n"
+
+        with patch.object(commands, "follow_log", side_effect=fake_follow):
+            _follow_task_log(task, 0)
+
+        out = capsys.readouterr().out
+        assert "old 9\n" not in out
+        assert "old 10\n" in out
+        assert "old 29\nnew output\n" in out
+        assert "completed" in out
+
+    def test_tail_length_and_poll_interval_from_state(self, temp_state_dir, capsys):
+        """Test that a negative log_lines sets the tail length and poll_interval the polling rate."""
+        log_path = temp_state_dir / "task.log"
+        log_path.write_text("a\nb\nc\n")
+        task = _add_running_task(log_path)
+        set_value("background.poll_interval", "2")
+
+        with patch.object(commands, "follow_log", return_value=iter([])) as mock_follow:
+            _follow_task_log(task, -1)
+
+        assert mock_follow.call_args.kwargs["poll_interval"] == 2.0
+        out = capsys.readouterr().out
+        assert "b\n" not in out
+        assert "c\n" in out
+
+    def test_invalid_poll_interval_and_empty_log(self, temp_state_dir, capsys):
+        """Test that an invalid poll interval is ignored and an empty log prints no tail."""
+        log_path = temp_state_dir / "task.log"
+        log_path.write_text("")
+        task = _add_running_task(log_path)
+        set_value("background.poll_interval", "soon")
+
+        with patch.object(commands, "follow_log", return_value=iter([])) as mock_follow:
+            _follow_task_log(task, 0)
+
+        assert mock_follow.call_args.kwargs["poll_interval"] == DEFAULT_FOLLOW_POLL_INTERVAL
+        assert TaskStatus.RUNNING.value in capsys.readouterr().out
+
+    def test_removed_task_counts_as_finished(self, temp_state_dir):
+        """Test that following stops if the task is removed from state."""
+        log_path = temp_state_dir / "task.log"
+        log_path.write_text("")
+        task = BackgroundTask.create(command="agdt-test", log_file=log_path)
+
+        def fake_follow(path, offset, is_finished, poll_interval):
+            assert is_finished() is True
+            return iter([])
+
+        with patch.object(commands, "follow_log", side_effect=fake_follow):
+            _follow_task_log(task, 0)
+
+    def test_already_compressed_log_prints_tail_only(self, temp_state_dir, capsys):
+        """Test that a log compressed before following started prints its tail without following."""
+        import gzip
+
+        log_path = temp_state_dir / "task.log"
+        (temp_state_dir / "task.log.gz").write_bytes(gzip.compress(b"a\nb\nc\n"))
+        task = _add_running_task(log_path)
+
+        with patch.object(commands, "follow_log") as mock_follow:
+            _follow_task_log(task, -2)
+
+        mock_follow.assert_not_called()
+        out = capsys.readouterr().out
+        assert "b\nc\n" in out
+
+    def test_missing_log_prints_no_tail(self, temp_state_dir, capsys):
+        """Test that a log that is gone entirely prints no tail and isn't followed."""
+        task = _add_running_task(temp_state_dir / "task.log")
+
+        with patch.object(commands, "follow_log") as mock_follow:
+            _follow_task_log(task, 0)
+
+        mock_follow.assert_not_called()
+        assert "Status:" in capsys.readouterr().out
@@ -0,0 +1,22 @@
+"""Tests for agentic_devtools.cli.tasks.commands._get_log_lines_limit."""
+
+from agentic_devtools.cli.tasks.commands import _get_log_lines_limit
+from agentic_devtools.state import set_value
+
+
+class TestGetLogLinesLimit:
+    """Tests for _get_log_lines_limit function."""
+
+    def test_unset(self, temp_state_dir):
+        """Test that no limit means the whole log."""
+        assert _get_log_lines_limit() == 0
+
+    def test_parses_value(self, temp_state_dir):
+        """Test that head and tail limits are parsed from state."""
+        set_value("background.log_lines", "-50")
+        assert _get_log_lines_limit() == -50
+
+    def test_invalid_value(self, temp_state_dir):
+        """Test that an invalid limit is ignored."""
+        set_value("background.log_lines", "lots")
+        assert _get_log_lines_limit() == 0
@@ -0,0 +1,16 @@
+"""Tests for agentic_devtools.cli.tasks.commands._parse_log_args."""
+
+from agentic_devtools.cli.tasks.commands import _parse_log_args
+
+
+class TestParseLogArgs:
+    """Tests for _parse_log_args function."""
+
+    def test_follow_defaults_to_false(self):
+        """Test that follow mode is off unless requested."""
+        assert _parse_log_args([]).follow is False
+
+    def test_follow_flags(self):
+        """Test that --follow and -f enable follow mode alongside --id."""
+        assert _parse_log_args(["--id", "abc", "--follow"]).follow is True
+        assert _parse_log_args(["-f"]).follow is True
@@ -0,0 +1,39 @@
+"""Tests for agentic_devtools.cli.tasks.commands._print_worktree_pool_status."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.tasks.commands import _print_worktree_pool_status
+from agentic_devtools.cli.workflows.worktree_pool import PoolStatus
+
+_WORKFLOWS = "agentic_devtools.cli.workflows"
+
+
+class TestPrintWorktreePoolStatus:
+    """Tests for _print_worktree_pool_status function."""
+
+    def test_prints_pool_summary(self, capsys):
+        """Test the pool summary of the current repository is printed."""
+        status = PoolStatus(size=2, ready=2, warming=0, stale=0)
+        with patch(f"{_WORKFLOWS}.worktree_setup.get_main_repo_root", return_value="/repos/main"), patch(
+            f"{_WORKFLOWS}.worktree_pool.get_worktree_pool_status", return_value=status
+        ) as mock_status:
+            _print_worktree_pool_status()
+
+        mock_status.assert_called_once_with("/repos/main")
+        assert capsys.readouterr().out == "Worktree pool: 2/2 ready\n"
+
+    def test_prints_nothing_without_pool(self, capsys):
+        """Test nothing is printed when the repository has no pool."""
+        with patch(f"{_WORKFLOWS}.worktree_setup.get_main_repo_root", return_value="/repos/main"), patch(
+            f"{_WORKFLOWS}.worktree_pool.get_worktree_pool_status", return_value=None
+        ):
+            _print_worktree_pool_status()
+
+        assert capsys.readouterr().out == ""
+
+    def test_prints_nothing_outside_repository(self, capsys):
+        """Test nothing is printed outside a git repository."""
+        with patch(f"{_WORKFLOWS}.worktree_setup.get_main_repo_root", return_value=None):
+            _print_worktree_pool_status()
+
+        assert capsys.readouterr().out == ""
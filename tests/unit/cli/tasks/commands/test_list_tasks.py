@@ -75,3 +75,14 @@ class TestListTasks:
 
         captured = capsys.readouterr()
         assert "running" in captured.out.lower()
+
+    def test_list_tasks_shows_worktree_pool(self, mock_state_dir, capsys):
+        """Test list_tasks reports the worktree pool's health."""
+        from agentic_devtools.cli.workflows.worktree_pool import PoolStatus
+
+        _create_and_add_task("agdt-worktree-pool-refill")
+        status = PoolStatus(size=2, ready=1, warming=1, stale=0)
+        with patch("agentic_devtools.cli.workflows.worktree_pool.get_worktree_pool_status", return_value=status):
+            list_tasks()
+
+        assert "Worktree pool: 1/2 ready, 1 warming" in capsys.readouterr().out
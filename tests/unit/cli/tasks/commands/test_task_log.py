@@ -87,3 +87,52 @@ class TestTaskLog:
                 pass  # Expected if no log file
 
         # Just verify no crash - captured output may vary
+
+    def test_task_log_follow(self, mock_state_dir, capsys):
+        """Test task_log --follow hands the task to the follow loop."""
+        log_path = mock_state_dir / "follow.log"
+        log_path.write_text("Line 1\n")
+        task = BackgroundTask.create(command="agdt-follow", log_file=log_path)
+        add_task(task)
+
+        with patch("agdt_ai_helpers.cli.tasks.commands._follow_task_log") as mock_follow:
+            task_log(["--id", task.id, "--follow"])
+
+        assert mock_follow.call_args[0][0].id == task.id
+        assert mock_follow.call_args[0][1] == 0
+
+    def test_task_log_follow_without_log_file(self, mock_state_dir, capsys):
+        """Test task_log --follow exits when the task's log file doesn't exist."""
+        task = BackgroundTask.create(command="agdt-follow", log_file=mock_state_dir / "missing.log")
+        add_task(task)
+
+        with pytest.raises(SystemExit):
+            task_log(["--id", task.id, "-f"])
+
+        captured = capsys.readouterr()
+        assert "No log file available" in captured.out
+        assert "missing.log" in captured.out
+
+    def test_task_log_follow_without_log_path(self, mock_state_dir, capsys):
+        """Test task_log --follow exits when the task has no log file at all."""
+        task = _create_and_add_task("agdt-follow")
+
+        with pytest.raises(SystemExit):
+            task_log(["--id", task.id, "--follow"])
+
+        assert "No log file available" in capsys.readouterr().out
+
+    def test_task_log_follow_finished_task_shows_compressed_log(self, mock_state_dir, capsys):
+        """Test task_log --follow on a finished task shows its compressed log without following."""
+        import gzip
+
+        log_path = mock_state_dir / "done.log"
+        log_path.with_name("done.log.gz").write_bytes(gzip.compress(b"All done\n"))
+        task = BackgroundTask.create(command="agdt-follow", log_file=log_path)
+        add_task(task)
+
+        with patch("agdt_ai_helpers.cli.tasks.commands._follow_task_log") as mock_follow:
+            task_log(["--id", task.id, "--follow"])
+
+        mock_follow.assert_not_called()
+        assert "All done" in capsys.readouterr().out
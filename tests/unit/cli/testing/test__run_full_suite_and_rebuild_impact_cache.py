@@ -0,0 +1,43 @@
+"""Tests for _run_full_suite_and_rebuild_impact_cache function."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli import testing, testing_impact
+
+
+class TestRunFullSuiteAndRebuildImpactCache:
+    """Tests for _run_full_suite_and_rebuild_impact_cache function."""
+
+    def test_runs_with_test_contexts_and_saves_cache(self, tmp_path, capsys):
+        """Should run the whole suite with per-test contexts and write the rebuilt cache."""
+        (tmp_path / "agentic_devtools").mkdir()
+        (tmp_path / "agentic_devtools" / "state.py").write_text("")
+        cache_path = tmp_path / "cache.json"
+        test_map = {"agentic_devtools.state": ["tests/test_state.py"]}
+
+        with patch.object(testing, "_run_subprocess_with_streaming", return_value=1) as mock_run:
+            with patch.object(testing_impact, "load_coverage_test_map", return_value=test_map):
+                result = testing._run_full_suite_and_rebuild_impact_cache(tmp_path, "abc", cache_path)
+
+        assert result == 1
+        args = mock_run.call_args[0][0]
+        assert str(tmp_path / "tests") in args
+        assert "--cov-context=test" in args
+        assert "addopts=" in args
+        cache = testing_impact.load_impact_cache(cache_path)
+        assert cache.base_commit == "abc"
+        assert cache.test_map == test_map
+        assert "agentic_devtools.state" in cache.graph
+        assert "Test impact cache rebuilt" in capsys.readouterr().out
+
+    def test_missing_coverage_data_keeps_cache(self, tmp_path, capsys):
+        """Should warn and not write a cache when no coverage data was produced."""
+        cache_path = tmp_path / "cache.json"
+
+        with patch.object(testing, "_run_subprocess_with_streaming", return_value=0):
+            with patch.object(testing_impact, "load_coverage_test_map", return_value=None):
+                result = testing._run_full_suite_and_rebuild_impact_cache(tmp_path, "abc", cache_path)
+
+        assert result == 0
+        assert not cache_path.exists()
+        assert "test impact cache not updated" in capsys.readouterr().err
@@ -0,0 +1,86 @@
+"""Tests for _run_tests_affected_sync function."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli import testing, testing_impact
+
+
+@pytest.fixture
+def package_root(tmp_path):
+    (tmp_path / "tests").mkdir()
+    cache_path = tmp_path / "cache.json"
+    with patch.object(testing, "get_package_root", return_value=tmp_path):
+        with patch.object(testing_impact, "get_impact_cache_path", return_value=cache_path):
+            with patch.object(testing_impact, "get_merge_base", return_value="abc"):
+                yield tmp_path
+
+
+@pytest.fixture
+def fresh_cache(package_root):
+    testing_impact.save_impact_cache(testing_impact.ImpactCache(base_commit="abc"), package_root / "cache.json")
+
+
+class TestRunTestsAffectedSync:
+    """Tests for _run_tests_affected_sync function."""
+
+    def test_returns_error_when_tests_dir_missing(self, tmp_path):
+        """Should return error code when tests directory is missing."""
+        with patch.object(testing, "get_package_root", return_value=tmp_path):
+            assert testing._run_tests_affected_sync() == 1
+
+    def test_returns_error_without_merge_base(self, package_root, capsys):
+        """Should return error code outside a git repository."""
+        with patch.object(testing_impact, "get_merge_base", return_value=None):
+            assert testing._run_tests_affected_sync() == 1
+        assert "merge base" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("cached_base", [None, "old"])
+    def test_missing_or_stale_cache_runs_full_suite(self, package_root, cached_base):
+        """Should run the full suite and rebuild when the cache is missing or from another merge base."""
+        if cached_base:
+            testing_impact.save_impact_cache(
+                testing_impact.ImpactCache(base_commit=cached_base), package_root / "cache.json"
+            )
+
+        with patch.object(testing, "_run_full_suite_and_rebuild_impact_cache", return_value=0) as mock_full:
+            assert testing._run_tests_affected_sync() == 0
+
+        mock_full.assert_called_once_with(package_root, "abc", package_root / "cache.json")
+
+    def test_returns_error_when_diff_fails(self, package_root, fresh_cache, capsys):
+        """Should return error code when changed files can't be listed."""
+        with patch.object(testing_impact, "get_changed_files", return_value=None):
+            assert testing._run_tests_affected_sync() == 1
+        assert "changed files" in capsys.readouterr().err
+
+    def test_unmappable_changes_run_full_suite(self, package_root, fresh_cache):
+        """Should fall back to the full suite when the selection can't be made safely."""
+        with patch.object(testing_impact, "get_changed_files", return_value=["pyproject.toml"]):
+            with patch.object(testing, "_run_full_suite_and_rebuild_impact_cache", return_value=1) as mock_full:
+                assert testing._run_tests_affected_sync() == 1
+
+        mock_full.assert_called_once()
+
+    def test_no_affected_tests(self, package_root, fresh_cache, capsys):
+        """Should succeed without running pytest when nothing is affected."""
+        with patch.object(testing_impact, "get_changed_files", return_value=["README.md"]):
+            with patch.object(testing, "_run_subprocess_with_streaming") as mock_run:
+                assert testing._run_tests_affected_sync() == 0
+
+        mock_run.assert_not_called()
+        assert "No affected tests" in capsys.readouterr().out
+
+    def test_runs_only_affected_tests(self, package_root, fresh_cache):
+        """Should run pytest on just the selected test files without coverage."""
+        (package_root / "tests" / "test_a.py").write_text("")
+
+        with patch.object(testing_impact, "get_changed_files", return_value=["tests/test_a.py"]):
+            with patch.object(testing, "_run_subprocess_with_streaming", return_value=0) as mock_run:
+                assert testing._run_tests_affected_sync() == 0
+
+        args = mock_run.call_args[0][0]
+        assert "tests/test_a.py" in args
+        assert "addopts=" in args
+        assert not any(arg.startswith("--cov") for arg in args)
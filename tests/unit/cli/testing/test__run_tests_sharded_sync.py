@@ -0,0 +1,106 @@
+"""Tests for _run_tests_sharded_sync function."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli import testing, testing_shards
+from agentic_devtools.state import set_value
+
+
+@pytest.fixture
+def package_root(tmp_path, temp_state_dir):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text("")
+    (tmp_path / "tests" / "test_b.py").write_text("")
+    with patch.object(testing, "get_package_root", return_value=tmp_path):
+        with patch.object(testing_shards, "get_duration_history_path", return_value=tmp_path / "durations.json"):
+            with patch.object(testing_shards, "get_default_shard_count", return_value=2):
+                with patch.object(testing_shards, "get_coverage_threshold", return_value=100.0):
+                    yield tmp_path
+
+
+class TestRunTestsShardedSync:
+    """Tests for _run_tests_sharded_sync function."""
+
+    def test_returns_error_when_tests_dir_missing(self, tmp_path):
+        """Should return error code when tests directory is missing."""
+        with patch.object(testing, "get_package_root", return_value=tmp_path):
+            assert testing._run_tests_sharded_sync() == 1
+
+    @pytest.mark.parametrize("value", ["many", "0"])
+    def test_returns_error_for_invalid_shard_count(self, package_root, value, capsys):
+        """Should return error code when test_shards is not a positive integer."""
+        set_value("test_shards", value)
+        assert testing._run_tests_sharded_sync() == 1
+        assert "test_shards" in capsys.readouterr().err
+
+    def test_returns_error_without_test_files(self, package_root, capsys):
+        """Should return error code when there are no test files to shard."""
+        for path in (package_root / "tests").iterdir():
+            path.unlink()
+        assert testing._run_tests_sharded_sync() == 1
+        assert "No test files" in capsys.readouterr().err
+
+    def test_runs_shards_and_records_durations(self, package_root, capsys):
+        """Should run one shard per core, save durations and pass when coverage meets the threshold."""
+
+        def fake_run(shards, root, work_dir):
+            (work_dir / "shard-1.xml").write_text(
+                '<testsuite><testcase classname="tests.test_a" name="test_x" file="tests/test_a.py" time="2.5"/>'
+                "</testsuite>"
+            )
+            return [0, 0]
+
+        with patch.object(testing_shards, "run_shards", side_effect=fake_run) as mock_run:
+            with patch.object(testing_shards, "combine_coverage", return_value=100.0) as mock_combine:
+                assert testing._run_tests_sharded_sync() == 0
+
+        shards = mock_run.call_args[0][0]
+        assert [shard.files for shard in shards] == [["tests/test_a.py"], ["tests/test_b.py"]]
+        assert len(mock_combine.call_args[0][0]) == 2
+        assert testing_shards.load_duration_history(package_root / "durations.json") == {"tests/test_a.py::test_x": 2.5}
+        out = capsys.readouterr().out
+        assert "[shard 1/2] exit code 0" in out
+
+    def test_drops_deleted_tests_from_history(self, package_root):
+        """Should remove history entries of test files that no longer exist."""
+        testing_shards.save_duration_history(
+            {"tests/test_gone.py::test_x": 9.0, "tests/test_b.py::test_y": 1.0}, package_root / "durations.json"
+        )
+
+        with patch.object(testing_shards, "run_shards", return_value=[0, 0]):
+            with patch.object(testing_shards, "combine_coverage", return_value=100.0):
+                testing._run_tests_sharded_sync()
+
+        assert testing_shards.load_duration_history(package_root / "durations.json") == {"tests/test_b.py::test_y": 1.0}
+
+    def test_uses_shard_count_from_state(self, package_root):
+        """Should use test_shards from state instead of the CPU count."""
+        set_value("test_shards", "1")
+
+        with patch.object(testing_shards, "run_shards", return_value=[0]) as mock_run:
+            with patch.object(testing_shards, "combine_coverage", return_value=100.0):
+                assert testing._run_tests_sharded_sync() == 0
+
+        assert len(mock_run.call_args[0][0]) == 1
+
+    def test_failed_shard_fails_run(self, package_root):
+        """Should return the highest shard exit code when a shard fails."""
+        with patch.object(testing_shards, "run_shards", return_value=[0, 1]):
+            with patch.object(testing_shards, "combine_coverage", return_value=100.0):
+                assert testing._run_tests_sharded_sync() == 1
+
+    def test_coverage_below_threshold_fails_run(self, package_root, capsys):
+        """Should fail when all shards pass but combined coverage is below the threshold."""
+        with patch.object(testing_shards, "run_shards", return_value=[0, 0]):
+            with patch.object(testing_shards, "combine_coverage", return_value=99.5):
+                assert testing._run_tests_sharded_sync() == 1
+        assert "below the required 100%" in capsys.readouterr().err
+
+    def test_missing_coverage_fails_run(self, package_root, capsys):
+        """Should fail when all shards pass but no coverage data was collected."""
+        with patch.object(testing_shards, "run_shards", return_value=[0, 0]):
+            with patch.object(testing_shards, "combine_coverage", return_value=None):
+                assert testing._run_tests_sharded_sync() == 1
+        assert "No coverage data" in capsys.readouterr().err
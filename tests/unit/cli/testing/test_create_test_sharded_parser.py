@@ -0,0 +1,22 @@
+"""Tests for _create_test_sharded_parser function."""
+
+import argparse
+
+from agentic_devtools.cli import testing
+
+
+class TestCreateTestShardedParser:
+    """Tests for _create_test_sharded_parser function."""
+
+    def test_returns_parser(self):
+        """Should return an argparse.ArgumentParser."""
+        assert isinstance(testing._create_test_sharded_parser(), argparse.ArgumentParser)
+
+    def test_parses_shards(self):
+        """Should parse --shards as an integer."""
+        args = testing._create_test_sharded_parser().parse_args(["--shards", "3"])
+        assert args.shards == 3
+
+    def test_shards_is_optional(self):
+        """Should default --shards to None."""
+        assert testing._create_test_sharded_parser().parse_args([]).shards is None
@@ -0,0 +1,21 @@
+"""Tests for run_tests_affected function."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli import testing
+
+
+class TestRunTestsAffected:
+    """Tests for run_tests_affected function."""
+
+    def test_spawns_background_task(self):
+        """Should spawn _run_tests_affected_sync as 'agdt-test-affected' and print tracking info."""
+        mock_task = MagicMock()
+
+        with patch.object(testing, "run_function_in_background", return_value=mock_task) as mock_bg:
+            with patch.object(testing, "print_task_tracking_info") as mock_print:
+                testing.run_tests_affected()
+
+        assert mock_bg.call_args[0] == ("agentic_devtools.cli.testing", "_run_tests_affected_sync")
+        assert mock_bg.call_args[1]["command_display_name"] == "agdt-test-affected"
+        assert mock_print.call_args[0][0] is mock_task
@@ -0,0 +1,40 @@
+"""Tests for run_tests_sharded function."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli import testing
+from agentic_devtools.state import get_value
+
+
+class TestRunTestsSharded:
+    """Tests for run_tests_sharded function."""
+
+    def test_spawns_background_task(self, temp_state_dir):
+        """Should spawn _run_tests_sharded_sync as 'agdt-test-sharded' and print tracking info."""
+        mock_task = MagicMock()
+
+        with patch.object(testing, "run_function_in_background", return_value=mock_task) as mock_bg:
+            with patch.object(testing, "print_task_tracking_info") as mock_print:
+                testing.run_tests_sharded([])
+
+        assert mock_bg.call_args[0] == ("agentic_devtools.cli.testing", "_run_tests_sharded_sync")
+        assert mock_bg.call_args[1]["command_display_name"] == "agdt-test-sharded"
+        assert mock_print.call_args[0][0] is mock_task
+        assert "one per CPU core" in mock_print.call_args[0][1]
+
+    def test_saves_shards_to_state(self, temp_state_dir):
+        """Should save --shards to state for the background task and subsequent runs."""
+        with patch.object(testing, "run_function_in_background"):
+            with patch.object(testing, "print_task_tracking_info") as mock_print:
+                testing.run_tests_sharded(["--shards", "4"])
+
+        assert get_value("test_shards") == "4"
+        assert "(4)" in mock_print.call_args[0][1]
+
+    def test_rejects_non_positive_shards(self, temp_state_dir, capsys):
+        """Should print an error and not start a task for --shards 0."""
+        with patch.object(testing, "run_function_in_background") as mock_bg:
+            testing.run_tests_sharded(["--shards", "0"])
+
+        mock_bg.assert_not_called()
+        assert "--shards must be a positive integer" in capsys.readouterr().out
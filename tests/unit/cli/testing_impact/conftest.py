@@ -0,0 +1,23 @@
+"""Shared fixtures for testing_impact tests."""
+
+import pytest
+
+
+@pytest.fixture
+def fake_package(tmp_path):
+    """Create a small agentic_devtools package tree under tmp_path.
+
+    Import structure:
+        cli.runner -> cli.commands -> state
+        cli.other (imports nothing)
+    """
+    pkg = tmp_path / "agentic_devtools"
+    (pkg / "cli").mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "state.py").write_text("import json\n")
+    (pkg / "cli" / "__init__.py").write_text("")
+    (pkg / "cli" / "commands.py").write_text("from ..state import get_value\n")
+    (pkg / "cli" / "runner.py").write_text("def main():\n    from . import commands\n")
+    (pkg / "cli" / "other.py").write_text("import os\n")
+    (pkg / "cli" / "data.md").write_text("# not python\n")
+    return tmp_path
@@ -0,0 +1,15 @@
+"""Tests for agentic_devtools.cli.testing_impact._parent_packages."""
+
+from agentic_devtools.cli.testing_impact import _parent_packages
+
+
+class TestParentPackages:
+    """Tests for _parent_packages function."""
+
+    def test_lists_enclosing_packages(self):
+        """Test that every enclosing package is returned outermost first."""
+        assert _parent_packages("a.b.c") == ["a", "a.b"]
+
+    def test_top_level_module(self):
+        """Test that a top-level module has no parents."""
+        assert _parent_packages("a") == []
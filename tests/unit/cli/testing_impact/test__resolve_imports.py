@@ -0,0 +1,55 @@
+"""Tests for agentic_devtools.cli.testing_impact._resolve_imports."""
+
+import ast
+
+from agentic_devtools.cli.testing_impact import _resolve_imports
+
+KNOWN = {
+    "agentic_devtools",
+    "agentic_devtools.state",
+    "agentic_devtools.cli",
+    "agentic_devtools.cli.git",
+    "agentic_devtools.cli.git.core",
+    "agentic_devtools.cli.testing",
+}
+
+
+def _resolve(source, module="agentic_devtools.cli.testing", is_package=False):
+    return _resolve_imports(ast.parse(source), module, is_package, KNOWN)
+
+
+class TestResolveImports:
+    """Tests for _resolve_imports function."""
+
+    def test_absolute_import_includes_parent_packages(self):
+        """Test that importing a submodule also imports its enclosing packages."""
+        assert _resolve("import agentic_devtools.cli.git.core") == {
+            "agentic_devtools",
+            "agentic_devtools.cli",
+            "agentic_devtools.cli.git",
+            "agentic_devtools.cli.git.core",
+        }
+
+    def test_relative_import_from_module(self):
+        """Test that '..' in a module resolves against its package's parent."""
+        assert "agentic_devtools.state" in _resolve("from ..state import get_value")
+
+    def test_relative_import_of_submodule(self):
+        """Test that 'from . import name' resolves to the submodule when it exists."""
+        assert "agentic_devtools.cli.git.core" in _resolve("from .git import core")
+
+    def test_relative_import_from_package_init(self):
+        """Test that '.' in an __init__ resolves against the package itself."""
+        result = _resolve("from .core import run_git", module="agentic_devtools.cli.git", is_package=True)
+        assert "agentic_devtools.cli.git.core" in result
+
+    def test_external_and_self_imports_ignored(self):
+        """Test that third-party imports and the module itself are excluded."""
+        assert _resolve("import json\nfrom jinja2 import Environment\nimport agentic_devtools.cli.testing") == {
+            "agentic_devtools",
+            "agentic_devtools.cli",
+        }
+
+    def test_function_level_imports(self):
+        """Test that imports inside functions are included."""
+        assert "agentic_devtools.state" in _resolve("def f():\n    from agentic_devtools.state import get_value\n")
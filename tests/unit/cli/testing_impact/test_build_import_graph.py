@@ -0,0 +1,33 @@
+"""Tests for agentic_devtools.cli.testing_impact.build_import_graph."""
+
+from agentic_devtools.cli.testing_impact import build_import_graph
+
+
+class TestBuildImportGraph:
+    """Tests for build_import_graph function."""
+
+    def test_builds_graph_for_all_modules(self, fake_package):
+        """Test that every module is parsed and its internal imports resolved."""
+        graph = build_import_graph(fake_package)
+
+        assert set(graph) == {
+            "agentic_devtools",
+            "agentic_devtools.state",
+            "agentic_devtools.cli",
+            "agentic_devtools.cli.commands",
+            "agentic_devtools.cli.runner",
+            "agentic_devtools.cli.other",
+        }
+        assert graph["agentic_devtools.cli.commands"] == ["agentic_devtools", "agentic_devtools.state"]
+        assert "agentic_devtools.cli.commands" in graph["agentic_devtools.cli.runner"]
+        assert graph["agentic_devtools.cli.other"] == []
+
+    def test_only_parses_selected_paths(self, fake_package):
+        """Test that 'only' limits parsing while still resolving against all modules."""
+        graph = build_import_graph(fake_package, only=["agentic_devtools/cli/commands.py"])
+        assert graph == {"agentic_devtools.cli.commands": ["agentic_devtools", "agentic_devtools.state"]}
+
+    def test_syntax_error_yields_no_imports(self, fake_package):
+        """Test that unparseable modules are kept with no imports."""
+        (fake_package / "agentic_devtools" / "cli" / "other.py").write_text("def broken(:\n")
+        assert build_import_graph(fake_package)["agentic_devtools.cli.other"] == []
@@ -0,0 +1,26 @@
+"""Tests for agentic_devtools.cli.testing_impact.find_affected_modules."""
+
+from agentic_devtools.cli.testing_impact import find_affected_modules
+
+GRAPH = {
+    "state": [],
+    "commands": ["state"],
+    "runner": ["commands"],
+    "other": [],
+}
+
+
+class TestFindAffectedModules:
+    """Tests for find_affected_modules function."""
+
+    def test_transitive_importers(self):
+        """Test that importers of importers are affected."""
+        assert find_affected_modules(GRAPH, ["state"]) == {"state", "commands", "runner"}
+
+    def test_leaf_module(self):
+        """Test that a module nobody imports only affects itself."""
+        assert find_affected_modules(GRAPH, ["runner"]) == {"runner"}
+
+    def test_cycles_terminate(self):
+        """Test that import cycles don't loop forever."""
+        assert find_affected_modules({"a": ["b"], "b": ["a"]}, ["a"]) == {"a", "b"}
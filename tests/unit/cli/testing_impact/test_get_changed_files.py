@@ -0,0 +1,26 @@
+"""Tests for agentic_devtools.cli.testing_impact.get_changed_files."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli import testing_impact
+
+
+class TestGetChangedFiles:
+    """Tests for get_changed_files function."""
+
+    def test_combines_diff_and_untracked(self, tmp_path):
+        """Test that diffed and untracked files are merged, de-duplicated and sorted."""
+        results = [
+            MagicMock(returncode=0, stdout="b.py\na.py\n"),
+            MagicMock(returncode=0, stdout="new.py\n\na.py\n"),
+        ]
+        with patch.object(testing_impact, "run_safe", side_effect=results) as mock_run:
+            assert testing_impact.get_changed_files(tmp_path, "abc") == ["a.py", "b.py", "new.py"]
+
+        assert mock_run.call_args_list[0].args[0] == ["git", "diff", "--name-only", "--relative", "abc"]
+        assert mock_run.call_args_list[1].args[0] == ["git", "ls-files", "--others", "--exclude-standard"]
+
+    def test_git_failure(self, tmp_path):
+        """Test that None is returned when git fails."""
+        with patch.object(testing_impact, "run_safe", return_value=MagicMock(returncode=128, stdout="")):
+            assert testing_impact.get_changed_files(tmp_path, "abc") is None
@@ -0,0 +1,14 @@
+"""Tests for agentic_devtools.cli.testing_impact.get_impact_cache_path."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli import testing_impact
+
+
+class TestGetImpactCachePath:
+    """Tests for get_impact_cache_path function."""
+
+    def test_lives_in_state_dir(self, tmp_path):
+        """Test that the cache file is stored in the state directory."""
+        with patch.object(testing_impact, "get_state_dir", return_value=tmp_path):
+            assert testing_impact.get_impact_cache_path() == tmp_path / "test-impact-cache.json"
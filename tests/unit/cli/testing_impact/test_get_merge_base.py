@@ -0,0 +1,35 @@
+"""Tests for agentic_devtools.cli.testing_impact.get_merge_base."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli import testing_impact
+
+
+def _result(returncode, stdout=""):
+    return MagicMock(returncode=returncode, stdout=stdout)
+
+
+class TestGetMergeBase:
+    """Tests for get_merge_base function."""
+
+    def test_uses_first_resolvable_ref(self, tmp_path):
+        """Test that the first ref with a merge base wins."""
+        with patch.object(testing_impact, "run_safe", side_effect=[_result(1), _result(0, "abc123\n")]) as mock_run:
+            assert testing_impact.get_merge_base(tmp_path) == "abc123"
+
+        assert mock_run.call_args_list[0].args[0] == ["git", "merge-base", "HEAD", "origin/main"]
+        assert mock_run.call_args_list[1].args[0] == ["git", "merge-base", "HEAD", "origin/master"]
+        assert mock_run.call_args.kwargs["cwd"] == str(tmp_path)
+
+    def test_falls_back_to_head(self, tmp_path):
+        """Test that HEAD is used when no main branch ref exists."""
+        results = [_result(1)] * 4 + [_result(0, "head456\n")]
+        with patch.object(testing_impact, "run_safe", side_effect=results) as mock_run:
+            assert testing_impact.get_merge_base(tmp_path) == "head456"
+
+        assert mock_run.call_args.args[0] == ["git", "rev-parse", "HEAD"]
+
+    def test_not_a_repository(self, tmp_path):
+        """Test that None is returned outside a git repository."""
+        with patch.object(testing_impact, "run_safe", return_value=_result(128)):
+            assert testing_impact.get_merge_base(tmp_path) is None
@@ -0,0 +1,23 @@
+"""Tests for agentic_devtools.cli.testing_impact.ImpactCache."""
+
+from agentic_devtools.cli.testing_impact import IMPACT_CACHE_VERSION, ImpactCache
+
+
+class TestImpactCache:
+    """Tests for ImpactCache dataclass."""
+
+    def test_round_trip(self):
+        """Test that to_dict/from_dict preserve all fields."""
+        cache = ImpactCache(base_commit="abc", graph={"a": ["b"]}, test_map={"a": ["tests/test_a.py"]})
+
+        restored = ImpactCache.from_dict(cache.to_dict())
+
+        assert restored == cache
+        assert restored.version == IMPACT_CACHE_VERSION
+
+    def test_from_dict_defaults(self):
+        """Test that missing maps default to empty and missing version to 0."""
+        cache = ImpactCache.from_dict({"base_commit": "abc"})
+        assert cache.graph == {}
+        assert cache.test_map == {}
+        assert cache.version == 0
@@ -0,0 +1,63 @@
+"""Tests for agentic_devtools.cli.testing_impact.load_coverage_test_map."""
+
+from unittest.mock import patch
+
+from coverage import CoverageData
+
+from agentic_devtools.cli import testing_impact
+
+
+def _record(data_file, package_root, contexts):
+    data = CoverageData(basename=str(data_file))
+    for context, files in contexts.items():
+        data.set_context(context)
+        data.add_lines({str(package_root / path): [1] for path in files})
+    data.write()
+
+
+class TestLoadCoverageTestMap:
+    """Tests for load_coverage_test_map function."""
+
+    def test_maps_modules_to_test_files(self, fake_package):
+        """Test that per-test contexts are grouped by module and test file."""
+        data_file = fake_package / ".coverage"
+        _record(
+            data_file,
+            fake_package,
+            {
+                "": ["agentic_devtools/state.py"],
+                "tests/test_state.py::TestX::test_a|run": ["agentic_devtools/state.py"],
+                "tests/test_state.py::TestX::test_b|run": ["agentic_devtools/state.py"],
+                "tests/test_cli.py::test_c|run": ["agentic_devtools/state.py", "agentic_devtools/cli/commands.py"],
+            },
+        )
+
+        test_map = testing_impact.load_coverage_test_map(data_file, fake_package)
+
+        assert test_map == {
+            "agentic_devtools.state": ["tests/test_cli.py", "tests/test_state.py"],
+            "agentic_devtools.cli.commands": ["tests/test_cli.py"],
+        }
+
+    def test_ignores_files_outside_package(self, fake_package, tmp_path_factory):
+        """Test that measured files outside the package root are skipped."""
+        elsewhere = tmp_path_factory.mktemp("elsewhere")
+        data_file = fake_package / ".coverage"
+        _record(
+            data_file,
+            fake_package,
+            {"tests/test_x.py::test|run": [str(elsewhere / "agentic_devtools" / "x.py"), "tests/test_x.py"]},
+        )
+
+        assert testing_impact.load_coverage_test_map(data_file, fake_package) == {}
+
+    def test_missing_data_file(self, tmp_path):
+        """Test that a missing data file returns None."""
+        assert testing_impact.load_coverage_test_map(tmp_path / ".coverage", tmp_path) is None
+
+    def test_unreadable_data_file(self, tmp_path):
+        """Test that corrupt coverage data returns None."""
+        data_file = tmp_path / ".coverage"
+        data_file.write_text("not sqlite")
+        with patch.object(CoverageData, "read", side_effect=Exception("corrupt")):
+            assert testing_impact.load_coverage_test_map(data_file, tmp_path) is None
@@ -0,0 +1,31 @@
+"""Tests for agentic_devtools.cli.testing_impact.load_impact_cache."""
+
+import json
+
+from agentic_devtools.cli.testing_impact import ImpactCache, load_impact_cache, save_impact_cache
+
+
+class TestLoadImpactCache:
+    """Tests for load_impact_cache function."""
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing cache loads as None."""
+        assert load_impact_cache(tmp_path / "cache.json") is None
+
+    def test_round_trip(self, tmp_path):
+        """Test that a saved cache loads back unchanged."""
+        cache = ImpactCache(base_commit="abc", graph={"a": []}, test_map={"a": ["tests/test_a.py"]})
+        save_impact_cache(cache, tmp_path / "cache.json")
+        assert load_impact_cache(tmp_path / "cache.json") == cache
+
+    def test_corrupt_file(self, tmp_path):
+        """Test that unreadable caches load as None."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+        assert load_impact_cache(path) is None
+
+    def test_outdated_version(self, tmp_path):
+        """Test that caches written with another layout version are ignored."""
+        path = tmp_path / "cache.json"
+        path.write_text(json.dumps({"version": 0, "base_commit": "abc"}))
+        assert load_impact_cache(path) is None
@@ -0,0 +1,30 @@
+"""Tests for agentic_devtools.cli.testing_impact.module_name_for_path."""
+
+import pytest
+
+from agentic_devtools.cli.testing_impact import module_name_for_path
+
+
+class TestModuleNameForPath:
+    """Tests for module_name_for_path function."""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("agentic_devtools/state.py", "agentic_devtools.state"),
+            ("agentic_devtools/cli/git/core.py", "agentic_devtools.cli.git.core"),
+            ("agentic_devtools/cli/__init__.py", "agentic_devtools.cli"),
+            ("agentic_devtools\\cli\\testing.py", "agentic_devtools.cli.testing"),
+        ],
+    )
+    def test_package_modules(self, path, expected):
+        """Test that package source paths map to dotted module names."""
+        assert module_name_for_path(path) == expected
+
+    @pytest.mark.parametrize(
+        "path",
+        ["tests/unit/test_x.py", "agentic_devtools/prompts/x/default-initiate-prompt.md", "setup.py"],
+    )
+    def test_non_module_paths(self, path):
+        """Test that paths outside the package or non-Python files return None."""
+        assert module_name_for_path(path) is None
@@ -0,0 +1,25 @@
+"""Tests for agentic_devtools.cli.testing_impact.print_selection_summary."""
+
+from agentic_devtools.cli.testing_impact import print_selection_summary
+
+
+class TestPrintSelectionSummary:
+    """Tests for print_selection_summary function."""
+
+    def test_prints_counts_and_files(self, capsys):
+        """Test that changed files and the selected test count are printed."""
+        print_selection_summary(["a.py", "b.py"], ["tests/test_a.py"])
+
+        out = capsys.readouterr().out
+        assert "Changed files: 2" in out
+        assert "  a.py" in out
+        assert "Affected test files: 1" in out
+
+    def test_truncates_long_lists(self, capsys):
+        """Test that only the first 20 changed files are listed."""
+        print_selection_summary([f"f{i}.py" for i in range(25)], [])
+
+        out = capsys.readouterr().out
+        assert "f19.py" in out
+        assert "f20.py" not in out
+        assert "... and 5 more" in out
@@ -0,0 +1,17 @@
+"""Tests for agentic_devtools.cli.testing_impact.save_impact_cache."""
+
+import json
+
+from agentic_devtools.cli.testing_impact import ImpactCache, save_impact_cache
+
+
+class TestSaveImpactCache:
+    """Tests for save_impact_cache function."""
+
+    def test_writes_json_creating_parents(self, tmp_path):
+        """Test that the cache is written as JSON and parent directories are created."""
+        path = tmp_path / "nested" / "cache.json"
+
+        save_impact_cache(ImpactCache(base_commit="abc"), path)
+
+        assert json.loads(path.read_text())["base_commit"] == "abc"
@@ -0,0 +1,65 @@
+"""Tests for agentic_devtools.cli.testing_impact.select_affected_tests."""
+
+import pytest
+
+from agentic_devtools.cli.testing_impact import ImpactCache, build_import_graph, select_affected_tests
+
+
+@pytest.fixture
+def cache(fake_package):
+    tests_dir = fake_package / "tests"
+    tests_dir.mkdir()
+    for name in ("test_state.py", "test_commands.py", "test_runner.py", "test_other.py"):
+        (tests_dir / name).write_text("")
+    return ImpactCache(
+        base_commit="abc",
+        graph=build_import_graph(fake_package),
+        test_map={
+            "agentic_devtools.state": ["tests/test_state.py"],
+            "agentic_devtools.cli.commands": ["tests/test_commands.py", "tests/test_deleted.py"],
+            "agentic_devtools.cli.runner": ["tests/test_runner.py"],
+            "agentic_devtools.cli.other": ["tests/test_other.py"],
+        },
+    )
+
+
+class TestSelectAffectedTests:
+    """Tests for select_affected_tests function."""
+
+    def test_changed_module_selects_tests_of_importers(self, fake_package, cache):
+        """Test that tests covering the module or any transitive importer are selected."""
+        result = select_affected_tests(["agentic_devtools/state.py"], cache, fake_package)
+        assert result == ["tests/test_commands.py", "tests/test_runner.py", "tests/test_state.py"]
+
+    def test_changed_test_files_selected_directly(self, fake_package, cache):
+        """Test that changed test files run, and deleted ones are skipped."""
+        result = select_affected_tests(["tests/test_other.py", "tests/test_gone.py"], cache, fake_package)
+        assert result == ["tests/test_other.py"]
+
+    def test_new_import_in_changed_module_is_followed(self, fake_package, cache):
+        """Test that the graph entries of changed modules are re-parsed."""
+        (fake_package / "agentic_devtools" / "cli" / "other.py").write_text("from ..state import x\n")
+
+        result = select_affected_tests(
+            ["agentic_devtools/cli/other.py", "agentic_devtools/state.py"], cache, fake_package
+        )
+
+        assert "tests/test_other.py" in result
+
+    def test_unrelated_files_select_nothing(self, fake_package, cache):
+        """Test that docs and test data changes select no tests."""
+        assert select_affected_tests(["README.md", "tests/data/sample.json"], cache, fake_package) == []
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            "pyproject.toml",
+            "tests/conftest.py",
+            "tests/unit/helpers.py",
+            "agentic_devtools/cli/data.md",
+            "agentic_devtools/cli/brand_new.py",
+        ],
+    )
+    def test_unmappable_changes_require_full_suite(self, fake_package, cache, changed):
+        """Test that config, fixtures, package data and unknown modules return None."""
+        assert select_affected_tests([changed], cache, fake_package) is None
@@ -0,0 +1,15 @@
+"""Tests for agentic_devtools.cli.testing_shards._stream_with_prefix."""
+
+import io
+import threading
+
+from agentic_devtools.cli.testing_shards import _stream_with_prefix
+
+
+class TestStreamWithPrefix:
+    """Tests for _stream_with_prefix function."""
+
+    def test_prefixes_every_line(self, capsys):
+        """Test that each line is written to stdout with the shard prefix."""
+        _stream_with_prefix(io.StringIO("one\ntwo\n"), "[shard 1/2]", threading.Lock())
+        assert capsys.readouterr().out == "[shard 1/2] one\n[shard 1/2] two\n"
@@ -0,0 +1,19 @@
+"""Tests for agentic_devtools.cli.testing_shards.aggregate_exit_code."""
+
+from agentic_devtools.cli.testing_shards import aggregate_exit_code
+
+
+class TestAggregateExitCode:
+    """Tests for aggregate_exit_code function."""
+
+    def test_all_passed(self):
+        """Test that the run passes only if every shard passed."""
+        assert aggregate_exit_code([0, 0, 0]) == 0
+
+    def test_highest_failure_wins(self):
+        """Test that the most severe shard exit code is returned."""
+        assert aggregate_exit_code([0, 1, 2, 0]) == 2
+
+    def test_no_shards(self):
+        """Test that no shards counts as success."""
+        assert aggregate_exit_code([]) == 0
@@ -0,0 +1,25 @@
+"""Tests for agentic_devtools.cli.testing_shards.build_shard_command."""
+
+import sys
+from pathlib import Path
+
+from agentic_devtools.cli.testing_shards import Shard, build_shard_command
+
+
+class TestBuildShardCommand:
+    """Tests for build_shard_command function."""
+
+    def test_runs_shard_files_with_coverage_and_junit(self):
+        """Test that the command runs the shard's files with coverage, JUnit output and no threshold."""
+        shard = Shard(index=1, files=["tests/test_a.py", "tests/test_b.py"])
+
+        args = build_shard_command(shard, Path("/repo"), Path("/tmp/shard-1.xml"))
+
+        assert args[:3] == [sys.executable, "-m", "pytest"]
+        assert args[3:5] == ["tests/test_a.py", "tests/test_b.py"]
+        assert "addopts=" in args
+        assert f"--cov={Path('/repo') / 'agentic_devtools'}" in args
+        assert "--cov-fail-under=0" in args
+        assert "junit_family=xunit1" in args
+        assert f"--junitxml={Path('/tmp/shard-1.xml')}" in args
+        assert "no:cacheprovider" in args
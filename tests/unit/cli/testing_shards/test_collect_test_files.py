@@ -0,0 +1,17 @@
+"""Tests for agentic_devtools.cli.testing_shards.collect_test_files."""
+
+from agentic_devtools.cli.testing_shards import collect_test_files
+
+
+class TestCollectTestFiles:
+    """Tests for collect_test_files function."""
+
+    def test_lists_test_modules_relative_to_root(self, tmp_path):
+        """Test that only test_*.py files under tests/ are listed, as relative POSIX paths."""
+        (tmp_path / "tests" / "unit").mkdir(parents=True)
+        (tmp_path / "tests" / "unit" / "test_b.py").write_text("")
+        (tmp_path / "tests" / "test_a.py").write_text("")
+        (tmp_path / "tests" / "conftest.py").write_text("")
+        (tmp_path / "tests" / "helpers.py").write_text("")
+
+        assert collect_test_files(tmp_path) == ["tests/test_a.py", "tests/unit/test_b.py"]
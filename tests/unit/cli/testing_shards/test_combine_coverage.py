@@ -0,0 +1,44 @@
+"""Tests for agentic_devtools.cli.testing_shards.combine_coverage."""
+
+from coverage import CoverageData
+
+from agentic_devtools.cli.testing_shards import combine_coverage
+
+
+def _write_shard_data(path, source, lines):
+    data = CoverageData(basename=str(path))
+    data.add_lines({str(source): lines})
+    data.write()
+
+
+class TestCombineCoverage:
+    """Tests for combine_coverage function."""
+
+    def test_no_data_files(self, tmp_path):
+        """Test that missing shard data (every shard crashed) yields None."""
+        assert combine_coverage([tmp_path / ".coverage.shard-1"], tmp_path) is None
+
+    def test_combines_shards(self, tmp_path, capsys):
+        """Test that lines covered by different shards add up to full coverage."""
+        source = tmp_path / "module.py"
+        source.write_text("a = 1\nb = 2\n")
+        (tmp_path / "pyproject.toml").write_text('[tool.coverage.html]\ndirectory = "htmlcov"\n')
+        _write_shard_data(tmp_path / ".coverage.shard-1", source, [1])
+        _write_shard_data(tmp_path / ".coverage.shard-2", source, [2])
+
+        total = combine_coverage([tmp_path / ".coverage.shard-1", tmp_path / ".coverage.shard-2"], tmp_path)
+
+        assert total == 100.0
+        assert (tmp_path / ".coverage").exists()
+        assert (tmp_path / ".coverage.shard-1").exists()
+        assert (tmp_path / "htmlcov" / "index.html").exists()
+        assert "TOTAL" in capsys.readouterr().out
+
+    def test_nothing_to_report(self, tmp_path):
+        """Test that data whose files are all omitted from the report yields None."""
+        source = tmp_path / "module.py"
+        source.write_text("a = 1\n")
+        (tmp_path / "pyproject.toml").write_text('[tool.coverage.report]\nomit = ["*"]\n')
+        _write_shard_data(tmp_path / ".coverage.shard-1", source, [1])
+
+        assert combine_coverage([tmp_path / ".coverage.shard-1"], tmp_path) is None
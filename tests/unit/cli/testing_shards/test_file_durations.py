@@ -0,0 +1,16 @@
+"""Tests for agentic_devtools.cli.testing_shards.file_durations."""
+
+from agentic_devtools.cli.testing_shards import file_durations
+
+
+class TestFileDurations:
+    """Tests for file_durations function."""
+
+    def test_sums_tests_per_file(self):
+        """Test that per-test durations are summed by test file."""
+        durations = {
+            "tests/test_a.py::test_one": 1.0,
+            "tests/test_a.py::TestA::test_two": 0.5,
+            "tests/test_b.py::test_three": 2.0,
+        }
+        assert file_durations(durations) == {"tests/test_a.py": 1.5, "tests/test_b.py": 2.0}
@@ -0,0 +1,17 @@
+"""Tests for agentic_devtools.cli.testing_shards.get_coverage_threshold."""
+
+from agentic_devtools.cli.testing_shards import get_coverage_threshold
+
+
+class TestGetCoverageThreshold:
+    """Tests for get_coverage_threshold function."""
+
+    def test_reads_fail_under(self, tmp_path):
+        """Test that the threshold comes from the package's pyproject.toml."""
+        (tmp_path / "pyproject.toml").write_text("[tool.coverage.report]\nfail_under = 95\n")
+        assert get_coverage_threshold(tmp_path) == 95.0
+
+    def test_no_config(self, tmp_path, monkeypatch):
+        """Test that without configuration there is no threshold."""
+        monkeypatch.chdir(tmp_path)
+        assert get_coverage_threshold(tmp_path) == 0.0
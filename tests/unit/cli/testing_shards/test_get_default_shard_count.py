@@ -0,0 +1,20 @@
+"""Tests for agentic_devtools.cli.testing_shards.get_default_shard_count."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli import testing_shards
+from agentic_devtools.cli.testing_shards import get_default_shard_count
+
+
+class TestGetDefaultShardCount:
+    """Tests for get_default_shard_count function."""
+
+    def test_uses_cpu_count(self):
+        """Test that the default is one shard per CPU core."""
+        with patch.object(testing_shards.os, "cpu_count", return_value=6):
+            assert get_default_shard_count() == 6
+
+    def test_unknown_cpu_count(self):
+        """Test that an undeterminable CPU count falls back to a single shard."""
+        with patch.object(testing_shards.os, "cpu_count", return_value=None):
+            assert get_default_shard_count() == 1
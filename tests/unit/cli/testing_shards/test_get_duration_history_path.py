@@ -0,0 +1,15 @@
+"""Tests for agentic_devtools.cli.testing_shards.get_duration_history_path."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli import testing_shards
+from agentic_devtools.cli.testing_shards import DURATION_HISTORY_FILENAME, get_duration_history_path
+
+
+class TestGetDurationHistoryPath:
+    """Tests for get_duration_history_path function."""
+
+    def test_lives_in_state_dir(self, tmp_path):
+        """Test that the history is stored in the state directory."""
+        with patch.object(testing_shards, "get_state_dir", return_value=tmp_path):
+            assert get_duration_history_path() == tmp_path / DURATION_HISTORY_FILENAME
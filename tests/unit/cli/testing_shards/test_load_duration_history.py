@@ -0,0 +1,31 @@
+"""Tests for agentic_devtools.cli.testing_shards.load_duration_history."""
+
+import json
+
+from agentic_devtools.cli.testing_shards import load_duration_history, save_duration_history
+
+
+class TestLoadDurationHistory:
+    """Tests for load_duration_history function."""
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing history loads as empty."""
+        assert load_duration_history(tmp_path / "durations.json") == {}
+
+    def test_round_trip(self, tmp_path):
+        """Test that saved durations load back unchanged."""
+        durations = {"tests/test_a.py::test_a": 0.5, "tests/test_b.py::TestB::test_b": 1.25}
+        save_duration_history(durations, tmp_path / "durations.json")
+        assert load_duration_history(tmp_path / "durations.json") == durations
+
+    def test_corrupt_file(self, tmp_path):
+        """Test that an unreadable history loads as empty."""
+        path = tmp_path / "durations.json"
+        path.write_text("{not json")
+        assert load_duration_history(path) == {}
+
+    def test_outdated_version(self, tmp_path):
+        """Test that a history written with another layout version is ignored."""
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({"version": 0, "tests": {"tests/test_a.py::test_a": 1}}))
+        assert load_duration_history(path) == {}
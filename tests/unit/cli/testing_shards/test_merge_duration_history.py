@@ -0,0 +1,29 @@
+"""Tests for agentic_devtools.cli.testing_shards.merge_duration_history."""
+
+from agentic_devtools.cli.testing_shards import merge_duration_history
+
+
+class TestMergeDurationHistory:
+    """Tests for merge_duration_history function."""
+
+    def test_adds_new_durations(self):
+        """Test that durations of this run are added to the history."""
+        history = {"tests/test_a.py::test_a": 1.0}
+        merged = merge_duration_history(
+            history, {"tests/test_b.py::test_b": 2.0}, ["tests/test_a.py", "tests/test_b.py"]
+        )
+        assert merged == {"tests/test_a.py::test_a": 1.0, "tests/test_b.py::test_b": 2.0}
+
+    def test_drops_files_no_longer_collected(self):
+        """Test that entries of deleted or renamed test files are removed."""
+        history = {"tests/test_old.py::test_x": 5.0, "tests/test_a.py::test_a": 1.0}
+        merged = merge_duration_history(history, {}, ["tests/test_a.py"])
+        assert merged == {"tests/test_a.py::test_a": 1.0}
+
+    def test_reported_file_replaces_its_entries(self):
+        """Test that a file that ran replaces its old entries, dropping renamed tests."""
+        history = {"tests/test_a.py::test_old": 3.0, "tests/test_a.py::test_kept": 1.0}
+        merged = merge_duration_history(
+            history, {"tests/test_a.py::test_new": 2.0, "tests/test_a.py::test_kept": 1.5}, ["tests/test_a.py"]
+        )
+        assert merged == {"tests/test_a.py::test_new": 2.0, "tests/test_a.py::test_kept": 1.5}
@@ -0,0 +1,36 @@
+"""Tests for agentic_devtools.cli.testing_shards.parse_junit_durations."""
+
+from agentic_devtools.cli.testing_shards import parse_junit_durations
+
+JUNIT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" tests="4">
+<testcase classname="tests.unit.test_a" name="test_function" file="tests/unit/test_a.py" line="1" time="0.250" />
+<testcase classname="tests.unit.test_a.TestA" name="test_method" file="tests/unit/test_a.py" line="5" time="1.5" />
+<testcase classname="tests.unit.test_a" name="test_bad_time" file="tests/unit/test_a.py" line="9" time="n/a" />
+<testcase classname="tests.unit.test_a" name="test_no_file" time="0.1" />
+</testsuite></testsuites>
+"""
+
+
+class TestParseJunitDurations:
+    """Tests for parse_junit_durations function."""
+
+    def test_builds_node_ids(self, tmp_path):
+        """Test that module-level and class-level tests get pytest-style node IDs."""
+        path = tmp_path / "shard.xml"
+        path.write_text(JUNIT_XML)
+
+        assert parse_junit_durations(path) == {
+            "tests/unit/test_a.py::test_function": 0.25,
+            "tests/unit/test_a.py::TestA::test_method": 1.5,
+        }
+
+    def test_missing_report(self, tmp_path):
+        """Test that a missing report (crashed shard) yields no durations."""
+        assert parse_junit_durations(tmp_path / "missing.xml") == {}
+
+    def test_corrupt_report(self, tmp_path):
+        """Test that a truncated report yields no durations."""
+        path = tmp_path / "shard.xml"
+        path.write_text("<testsuites><testsuite>")
+        assert parse_junit_durations(path) == {}
@@ -0,0 +1,41 @@
+"""Tests for agentic_devtools.cli.testing_shards.plan_shards."""
+
+from agentic_devtools.cli.testing_shards import DEFAULT_FILE_SECONDS, plan_shards
+
+
+class TestPlanShards:
+    """Tests for plan_shards function."""
+
+    def test_no_files(self):
+        """Test that an empty suite produces no shards."""
+        assert plan_shards([], {}, 4) == []
+
+    def test_balances_by_duration(self):
+        """Test that files are assigned heaviest first to the lightest shard."""
+        durations = {"a.py": 8.0, "b.py": 5.0, "c.py": 4.0, "d.py": 3.0}
+
+        shards = plan_shards(["a.py", "b.py", "c.py", "d.py"], durations, 2)
+
+        assert [shard.files for shard in shards] == [["a.py", "d.py"], ["b.py", "c.py"]]
+        assert [shard.estimated_seconds for shard in shards] == [11.0, 9.0]
+
+    def test_unknown_files_use_mean_duration(self):
+        """Test that files without history are estimated at the mean known duration."""
+        shards = plan_shards(["a.py", "b.py", "new.py"], {"a.py": 2.0, "b.py": 4.0}, 1)
+        assert shards[0].estimated_seconds == 9.0
+
+    def test_no_history_uses_default_estimate(self):
+        """Test that without any history every file gets the default estimate."""
+        shards = plan_shards(["a.py", "b.py", "c.py"], {}, 3)
+        assert [shard.estimated_seconds for shard in shards] == [DEFAULT_FILE_SECONDS] * 3
+
+    def test_never_more_shards_than_files(self):
+        """Test that the shard count is capped by the number of files."""
+        shards = plan_shards(["a.py", "b.py"], {}, 8)
+        assert [shard.index for shard in shards] == [1, 2]
+
+    def test_invalid_shard_count_uses_one_shard(self):
+        """Test that a non-positive shard count still runs everything in one shard."""
+        shards = plan_shards(["b.py", "a.py"], {}, 0)
+        assert len(shards) == 1
+        assert shards[0].files == ["a.py", "b.py"]
@@ -0,0 +1,16 @@
+"""Tests for agentic_devtools.cli.testing_shards.print_shard_plan."""
+
+from agentic_devtools.cli.testing_shards import Shard, print_shard_plan
+
+
+class TestPrintShardPlan:
+    """Tests for print_shard_plan function."""
+
+    def test_prints_each_shard(self, capsys):
+        """Test that the shard count and each shard's size and estimate are printed."""
+        print_shard_plan([Shard(index=1, files=["a.py", "b.py"], estimated_seconds=3.25), Shard(index=2)])
+
+        out = capsys.readouterr().out
+        assert "2 shard(s)" in out
+        assert "[shard 1/2] 2 files, ~3.2s estimated" in out
+        assert "[shard 2/2] 0 files, ~0.0s estimated" in out
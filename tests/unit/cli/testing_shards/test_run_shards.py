@@ -0,0 +1,36 @@
+"""Tests for agentic_devtools.cli.testing_shards.run_shards."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli import testing_shards
+from agentic_devtools.cli.testing_shards import Shard, run_shards
+
+
+def _fake_process(output, returncode):
+    process = MagicMock()
+    process.stdout = io.StringIO(output)
+    process.returncode = returncode
+    return process
+
+
+class TestRunShards:
+    """Tests for run_shards function."""
+
+    def test_runs_each_shard_in_its_own_process(self, tmp_path, capsys):
+        """Test that shards run concurrently with their own coverage file and prefixed output."""
+        shards = [Shard(index=1, files=["tests/test_a.py"]), Shard(index=2, files=["tests/test_b.py"])]
+        processes = [_fake_process("passed\n", 0), _fake_process("failed\n", 1)]
+
+        with patch.object(testing_shards.subprocess, "Popen", side_effect=processes) as mock_popen:
+            exit_codes = run_shards(shards, tmp_path, tmp_path / "work")
+
+        assert exit_codes == [0, 1]
+        first, second = mock_popen.call_args_list
+        assert first.kwargs["env"]["COVERAGE_FILE"] == str(tmp_path / "work" / ".coverage.shard-1")
+        assert second.kwargs["env"]["COVERAGE_FILE"] == str(tmp_path / "work" / ".coverage.shard-2")
+        assert first.kwargs["cwd"] == str(tmp_path)
+        assert f"--junitxml={tmp_path / 'work' / 'shard-2.xml'}" in second.args[0]
+        out = capsys.readouterr().out
+        assert "[shard 1/2] passed\n" in out
+        assert "[shard 2/2] failed\n" in out
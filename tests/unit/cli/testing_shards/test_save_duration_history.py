@@ -0,0 +1,18 @@
+"""Tests for agentic_devtools.cli.testing_shards.save_duration_history."""
+
+import json
+
+from agentic_devtools.cli.testing_shards import DURATION_HISTORY_VERSION, save_duration_history
+
+
+class TestSaveDurationHistory:
+    """Tests for save_duration_history function."""
+
+    def test_creates_parent_and_sorts_tests(self, tmp_path):
+        """Test that the history is written sorted, creating missing directories."""
+        path = tmp_path / "state" / "durations.json"
+        save_duration_history({"tests/test_b.py::test_b": 2.0, "tests/test_a.py::test_a": 1.0}, path)
+
+        data = json.loads(path.read_text())
+        assert data["version"] == DURATION_HISTORY_VERSION
+        assert list(data["tests"]) == ["tests/test_a.py::test_a", "tests/test_b.py::test_b"]
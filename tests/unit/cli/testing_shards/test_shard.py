@@ -0,0 +1,17 @@
+"""Tests for agentic_devtools.cli.testing_shards.Shard."""
+
+from agentic_devtools.cli.testing_shards import Shard
+
+
+class TestShard:
+    """Tests for Shard dataclass."""
+
+    def test_defaults(self):
+        """Test that a new shard has no files and no estimated time."""
+        shard = Shard(index=1)
+        assert shard.files == []
+        assert shard.estimated_seconds == 0.0
+
+    def test_label(self):
+        """Test that the label includes the shard number and count."""
+        assert Shard(index=2).label(4) == "[shard 2/4]"
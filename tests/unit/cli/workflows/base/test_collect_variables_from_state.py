@@ -69,3 +69,13 @@ class TestCollectVariablesFromState:
         """Test collecting from empty key list."""
         result = base.collect_variables_from_state([])
         assert result == {}
+
+    def test_collect_variables_from_snapshot(self, temp_state_dir, clear_state_before):
+        """Test that a provided snapshot is used instead of reading state."""
+        state.set_value("jira.issue_key", "FROM-STATE")
+
+        variables = base.collect_variables_from_state(
+            ["jira.issue_key", "missing"], snapshot={"jira.issue_key": "FROM-SNAPSHOT", "missing": None}
+        )
+
+        assert variables == {"jira_issue_key": "FROM-SNAPSHOT"}
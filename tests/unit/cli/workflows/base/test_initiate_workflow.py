@@ -116,3 +116,22 @@ class TestInitiateWorkflow:
 
         captured = capsys.readouterr()
         assert "PR #123" in captured.out
+
+    def test_initiate_workflow_reads_state_once_for_variables(
+        self, temp_state_dir, temp_prompts_dir, temp_output_dir, clear_state_before
+    ):
+        """Test that required and optional keys are validated and collected from one state load."""
+        workflow_dir = temp_prompts_dir / "pull-request-review"
+        workflow_dir.mkdir()
+        (workflow_dir / "default-initiate-prompt.md").write_text("PR {{pull_request_id}}", encoding="utf-8")
+        state.set_value("pull_request_id", "123")
+        state.set_value("jira.issue_key", "DFLY-1")
+
+        with patch.object(base, "get_state_snapshot", wraps=state.get_state_snapshot) as mock_snapshot:
+            base.initiate_workflow(
+                workflow_name="pull-request-review",
+                required_state_keys=["pull_request_id"],
+                optional_state_keys=["jira.issue_key"],
+            )
+
+        mock_snapshot.assert_called_once_with(["pull_request_id", "jira.issue_key"])
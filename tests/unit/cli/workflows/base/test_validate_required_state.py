@@ -79,3 +79,8 @@ class TestValidateRequiredState:
         with pytest.raises(SystemExit) as exc_info:
             base.validate_required_state(["jira.issue_key"])
         assert exc_info.value.code == 1
+
+    def test_validates_against_snapshot(self, temp_state_dir, clear_state_before):
+        """Test that a provided snapshot is used instead of reading state."""
+        result = base.validate_required_state(["pull_request_id"], snapshot={"pull_request_id": "7"})
+        assert result == {"pull_request_id": "7"}
@@ -0,0 +1,24 @@
+"""Tests for ChecklistFromWorkflowState."""
+
+from agentic_devtools.cli.workflows.checklist import checklist_from_workflow_state
+
+
+class TestChecklistFromWorkflowState:
+    """Tests for checklist_from_workflow_state function."""
+
+    def test_no_workflow(self):
+        """Test returns None when there is no workflow state."""
+        assert checklist_from_workflow_state(None) is None
+
+    def test_no_checklist_in_context(self):
+        """Test returns None when the workflow context has no checklist."""
+        assert checklist_from_workflow_state({"active": "x", "context": {}}) is None
+
+    def test_returns_checklist(self):
+        """Test builds the checklist from the workflow context."""
+        workflow = {"context": {"checklist": {"items": [{"id": 1, "text": "Task", "completed": True}]}}}
+
+        checklist = checklist_from_workflow_state(workflow)
+
+        assert checklist.items[0].text == "Task"
+        assert checklist.items[0].completed is True
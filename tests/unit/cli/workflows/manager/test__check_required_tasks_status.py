@@ -58,7 +58,7 @@ class TestCheckRequiredTasksStatus:
             ]
         }
 
-        # Mock the task returned by get_task_by_id
+        # Mock the task returned by get_tasks_by_ids
         mock_failed_task = MagicMock()
         mock_failed_task.id = "task-123"
         mock_failed_task.command = "agdt-run-tests"
@@ -67,8 +67,8 @@ class TestCheckRequiredTasksStatus:
         mock_failed_task.log_file = "/tmp/log.txt"
 
         with patch(
-            "agentic_devtools.cli.workflows.manager.get_task_by_id",
-            return_value=mock_failed_task,
+            "agentic_devtools.cli.workflows.manager.get_tasks_by_ids",
+            side_effect=lambda ids: {task_id: mock_failed_task for task_id in ids},
         ):
             result = _check_required_tasks_status(["agdt-run-tests"], context)
 
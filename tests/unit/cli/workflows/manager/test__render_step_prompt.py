@@ -38,3 +38,28 @@ class TestRenderStepPrompt:
         call_kwargs = mock_render.call_args
         variables = call_kwargs.kwargs.get("variables") or call_kwargs[1].get("variables")
         assert variables["git_commit_usage"] == "agdt-git-commit"
+
+    def test_reads_state_once_per_render(self, temp_state_dir):
+        """All state values for a prompt render should come from a single state load."""
+        state.set_value("jira.issue_key", "DFLY-1")
+        state.set_value("jira.comment", "plan")
+        state.set_value("commit_message", "msg")
+        state.set_workflow_state(
+            name="work-on-jira-issue",
+            status="in-progress",
+            step="implementation",
+            context={"checklist": {"items": [{"id": 1, "text": "Task", "completed": False}]}},
+        )
+
+        with patch.object(state, "load_state", wraps=state.load_state) as mock_load:
+            with patch(
+                "agentic_devtools.cli.workflows.manager.load_and_render_prompt",
+                return_value="rendered",
+            ) as mock_render:
+                _render_step_prompt("work-on-jira-issue", "implementation", {})
+
+        assert mock_load.call_count == 1
+        variables = mock_render.call_args.kwargs["variables"]
+        assert variables["issue_key"] == "DFLY-1"
+        assert "Task" in variables["checklist_markdown"]
+        assert "plan" in variables["add_jira_comment_hint"]
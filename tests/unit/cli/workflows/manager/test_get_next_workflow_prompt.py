@@ -189,7 +189,7 @@ class TestGetNextWorkflowPrompt:
             },
         )
 
-        # Mock a failed task returned by get_task_by_id
+        # Mock a failed task returned by get_tasks_by_ids
         mock_failed_task = MagicMock()
         mock_failed_task.id = "task-456"
         mock_failed_task.command = "agdt-run-tests"
@@ -201,8 +201,8 @@ class TestGetNextWorkflowPrompt:
             "agentic_devtools.cli.workflows.manager.get_active_tasks",
             return_value=[],
         ), patch(
-            "agentic_devtools.cli.workflows.manager.get_task_by_id",
-            return_value=mock_failed_task,
+            "agentic_devtools.cli.workflows.manager.get_tasks_by_ids",
+            side_effect=lambda ids: {task_id: mock_failed_task for task_id in ids},
         ):
             result = get_next_workflow_prompt()
 
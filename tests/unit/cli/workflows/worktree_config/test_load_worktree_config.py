@@ -0,0 +1,38 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_config.load_worktree_config."""
+
+import json
+
+from agentic_devtools.cli.workflows.worktree_config import WorktreeConfig, load_worktree_config
+
+
+def _write_config(repo, content: str) -> None:
+    config_dir = repo / ".agdt" / "config"
+    config_dir.mkdir(parents=True)
+    (config_dir / "worktrees.json").write_text(content, encoding="utf-8")
+
+
+class TestLoadWorktreeConfig:
+    """Tests for load_worktree_config function."""
+
+    def test_missing_file_returns_defaults(self, tmp_path):
+        """Test a repository without the file gets the defaults."""
+        assert load_worktree_config(str(tmp_path)) == WorktreeConfig()
+
+    def test_loads_settings(self, tmp_path):
+        """Test settings are read from .agdt/config/worktrees.json."""
+        _write_config(tmp_path, json.dumps({"sparseCheckout": True, "sparsePaths": ["shared"]}))
+
+        config = load_worktree_config(str(tmp_path))
+
+        assert config.sparseCheckout is True
+        assert config.sparsePaths == ["shared"]
+
+    def test_invalid_json_returns_defaults(self, tmp_path):
+        """Test unreadable JSON falls back to the defaults."""
+        _write_config(tmp_path, "{not json")
+        assert load_worktree_config(str(tmp_path)) == WorktreeConfig()
+
+    def test_non_object_returns_defaults(self, tmp_path):
+        """Test a JSON value that isn't an object falls back to the defaults."""
+        _write_config(tmp_path, "[]")
+        assert load_worktree_config(str(tmp_path)) == WorktreeConfig()
@@ -0,0 +1,45 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_config.WorktreeConfig."""
+
+import pytest
+
+from agentic_devtools.cli.workflows.worktree_config import WorktreeConfig
+
+
+class TestWorktreeConfig:
+    """Tests for WorktreeConfig dataclass."""
+
+    def test_defaults_to_full_checkout(self):
+        """Test the default configuration disables sparse checkout."""
+        config = WorktreeConfig()
+        assert config.sparseCheckout is False
+        assert config.sparsePaths == []
+
+    def test_round_trips_through_dict(self):
+        """Test to_dict and from_dict are inverses."""
+        config = WorktreeConfig(sparseCheckout=True, sparsePaths=["services/api"])
+        assert WorktreeConfig.from_dict(config.to_dict()) == config
+
+    def test_from_dict_uses_defaults_for_missing_keys(self):
+        """Test missing keys fall back to the defaults."""
+        assert WorktreeConfig.from_dict({}) == WorktreeConfig()
+
+    def test_rejects_non_boolean_sparse_checkout(self):
+        """Test sparseCheckout must be a boolean."""
+        with pytest.raises(ValueError, match="sparseCheckout"):
+            WorktreeConfig.from_dict({"sparseCheckout": "yes"})
+
+    def test_rejects_non_list_sparse_paths(self):
+        """Test sparsePaths must be a list."""
+        with pytest.raises(ValueError, match="sparsePaths"):
+            WorktreeConfig.from_dict({"sparsePaths": "services"})
+
+    def test_rejects_blank_sparse_path(self):
+        """Test sparsePaths entries must name a directory."""
+        with pytest.raises(ValueError, match=r"sparsePaths\[1\]"):
+            WorktreeConfig.from_dict({"sparsePaths": ["services", "/"]})
+
+    @pytest.mark.parametrize("pool_size", [-1, "2", True, 1.5])
+    def test_rejects_invalid_pool_size(self, pool_size):
+        """Test poolSize must be a non-negative integer."""
+        with pytest.raises(ValueError, match="poolSize"):
+            WorktreeConfig.from_dict({"poolSize": pool_size})
@@ -0,0 +1,53 @@
+"""
+Shared fixtures for tests/unit/cli/workflows/worktree_pool/.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tests.helpers import create_git_repo
+
+SETUP_SCRIPT = 'import pathlib, sys\npathlib.Path(sys.argv[1], "deps.txt").write_text("installed")\n'
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def commit_to_origin(origin: Path, name: str) -> None:
+    """Add a commit to main in the origin repository."""
+    (origin / name).write_text(name)
+    _git(origin, "add", name)
+    _git(origin, "commit", "--no-verify", "-m", name)
+
+
+@pytest.fixture
+def pool_origin(tmp_path: Path) -> Path:
+    """Origin repository on main with a two-worktree pool configured and a setup script."""
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    create_git_repo(origin)
+    _git(origin, "branch", "-M", "main")
+    agdt_dir = origin / ".agdt"
+    (agdt_dir / "config").mkdir(parents=True)
+    (agdt_dir / "config" / "worktrees.json").write_text(json.dumps({"poolSize": 2}))
+    (agdt_dir / "agentic-devtools-worktree-setup.py").write_text(SETUP_SCRIPT)
+    (origin / ".gitignore").write_text("deps.txt\n")
+    _git(origin, "add", ".")
+    _git(origin, "commit", "--no-verify", "-m", "pool config")
+    return origin
+
+
+@pytest.fixture
+def pool_repo(tmp_path: Path, pool_origin: Path) -> Path:
+    """Clone of pool_origin at <tmp>/repos/repo, so worktrees land in <tmp>/repos."""
+    repos = tmp_path / "repos"
+    repos.mkdir()
+    subprocess.run(["git", "clone", str(pool_origin), "repo"], cwd=repos, check=True, capture_output=True)
+    repo = repos / "repo"
+    _git(repo, "config", "user.name", "Test User")
+    _git(repo, "config", "user.email", "test@example.com")
+    return repo
@@ -0,0 +1,27 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool._fill_worktree_pool_from_cwd."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.workflows.worktree_pool import _fill_worktree_pool_from_cwd
+
+_MODULE = "agentic_devtools.cli.workflows"
+
+
+class TestFillWorktreePoolFromCwd:
+    """Tests for _fill_worktree_pool_from_cwd function."""
+
+    def test_fills_pool_of_current_repository(self):
+        """Test the pool of the main repository root is refilled."""
+        with patch(f"{_MODULE}.worktree_setup.get_main_repo_root", return_value="/repos/main"), patch(
+            f"{_MODULE}.worktree_pool.fill_worktree_pool"
+        ) as mock_fill:
+            _fill_worktree_pool_from_cwd()
+        mock_fill.assert_called_once_with("/repos/main")
+
+    def test_outside_repository_raises(self):
+        """Test running outside a git repository fails the task."""
+        with patch(f"{_MODULE}.worktree_setup.get_main_repo_root", return_value=None):
+            with pytest.raises(RuntimeError, match="Not in a git repository"):
+                _fill_worktree_pool_from_cwd()
@@ -0,0 +1,22 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool._parse_manifest."""
+
+from agentic_devtools.cli.workflows.worktree_pool import _parse_manifest
+
+
+class TestParseManifest:
+    """Tests for _parse_manifest function."""
+
+    def test_parses_slots(self):
+        """Test slots are read from the manifest."""
+        text = '{"slots": [{"name": "slot-1", "status": "ready", "base_ref": "main", "base_sha": "abc"}]}'
+        assert [slot.name for slot in _parse_manifest(text).slots] == ["slot-1"]
+
+    def test_empty_text_is_empty_pool(self):
+        """Test an empty file is an empty pool."""
+        assert _parse_manifest("").slots == []
+
+    def test_unreadable_manifest_is_empty_pool(self):
+        """Test corrupt JSON and malformed slots are treated as an empty pool."""
+        assert _parse_manifest("{oops").slots == []
+        assert _parse_manifest('{"slots": [{"name": "slot-1"}]}').slots == []
+        assert _parse_manifest("[]").slots == []
@@ -0,0 +1,49 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool._plan_refill."""
+
+from agentic_devtools.cli.workflows.worktree_pool import (
+    SLOT_READY,
+    SLOT_WARMING,
+    PoolManifest,
+    PoolSlot,
+    _plan_refill,
+)
+
+_RECENT = "2999-01-01T00:00:00+00:00"
+_EXPIRED = "2000-01-01T00:00:00+00:00"
+
+
+class TestPlanRefill:
+    """Tests for _plan_refill function."""
+
+    def test_tops_up_to_size(self):
+        """Test new warming slots make up the shortfall."""
+        manifest = PoolManifest(slots=[PoolSlot("ready", SLOT_READY, "origin/main", "new", _RECENT)])
+
+        remove, create = _plan_refill(manifest, 3, "origin/main", "new")
+
+        assert remove == []
+        assert len(create) == 2
+        assert all(slot.status == SLOT_WARMING and slot.base_sha == "new" for slot in create)
+        assert manifest.slots[1:] == create
+
+    def test_counts_live_warming_slots(self):
+        """Test slots another refill is warming aren't duplicated."""
+        manifest = PoolManifest(slots=[PoolSlot("warm", SLOT_WARMING, "origin/main", "new", _RECENT)])
+
+        remove, create = _plan_refill(manifest, 1, "origin/main", "new")
+
+        assert (remove, create) == ([], [])
+
+    def test_removes_stale_expired_and_surplus_slots(self):
+        """Test stale, abandoned and surplus slots are discarded."""
+        stale = PoolSlot("stale", SLOT_READY, "origin/main", "old", _RECENT)
+        expired = PoolSlot("expired", SLOT_WARMING, "origin/main", "new", _EXPIRED)
+        newest = PoolSlot("newest", SLOT_READY, "origin/main", "new", _RECENT)
+        surplus = PoolSlot("surplus", SLOT_READY, "origin/main", "new", "2998-01-01T00:00:00+00:00")
+        manifest = PoolManifest(slots=[stale, expired, surplus, newest])
+
+        remove, create = _plan_refill(manifest, 1, "origin/main", "new")
+
+        assert {slot.name for slot in remove} == {"stale", "expired", "surplus"}
+        assert create == []
+        assert manifest.slots == [newest]
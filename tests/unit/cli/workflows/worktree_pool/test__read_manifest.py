@@ -0,0 +1,18 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool._read_manifest."""
+
+from agentic_devtools.cli.workflows.worktree_pool import _read_manifest
+
+
+class TestReadManifest:
+    """Tests for _read_manifest function."""
+
+    def test_missing_manifest_is_empty_pool(self, tmp_path):
+        """Test a pool directory without a manifest has no slots."""
+        assert _read_manifest(tmp_path).slots == []
+
+    def test_reads_manifest(self, tmp_path):
+        """Test slots are read from pool.json."""
+        (tmp_path / "pool.json").write_text(
+            '{"slots": [{"name": "slot-1", "status": "warming", "base_ref": "main", "base_sha": "abc"}]}'
+        )
+        assert [slot.status for slot in _read_manifest(tmp_path).slots] == ["warming"]
@@ -0,0 +1,32 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool._remove_slot_worktree."""
+
+import subprocess
+
+from agentic_devtools.cli.workflows.worktree_pool import _remove_slot_worktree
+
+
+class TestRemoveSlotWorktree:
+    """Tests for _remove_slot_worktree function."""
+
+    def test_removes_registered_worktree(self, pool_repo, tmp_path):
+        """Test a pool worktree is removed from disk and from git."""
+        slot_path = tmp_path / "slot"
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(slot_path)], cwd=pool_repo, check=True, capture_output=True
+        )
+
+        _remove_slot_worktree(str(pool_repo), slot_path)
+
+        assert not slot_path.exists()
+        listing = subprocess.run(["git", "worktree", "list"], cwd=pool_repo, capture_output=True, text=True).stdout
+        assert str(slot_path) not in listing
+
+    def test_deletes_directory_git_does_not_know(self, pool_repo, tmp_path):
+        """Test a leftover directory that isn't a worktree is deleted."""
+        slot_path = tmp_path / "leftover"
+        slot_path.mkdir()
+        (slot_path / "file.txt").write_text("x")
+
+        _remove_slot_worktree(str(pool_repo), slot_path)
+
+        assert not slot_path.exists()
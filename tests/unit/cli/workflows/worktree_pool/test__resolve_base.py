@@ -0,0 +1,26 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool._resolve_base."""
+
+import subprocess
+
+from agentic_devtools.cli.workflows.worktree_pool import _resolve_base
+
+
+def _sha(repo, ref):
+    return subprocess.run(["git", "rev-parse", ref], cwd=repo, capture_output=True, text=True).stdout.strip()
+
+
+class TestResolveBase:
+    """Tests for _resolve_base function."""
+
+    def test_prefers_origin_main(self, pool_repo):
+        """Test origin/main is used when it exists."""
+        assert _resolve_base(str(pool_repo)) == ("origin/main", _sha(pool_repo, "origin/main"))
+
+    def test_falls_back_to_main(self, pool_origin):
+        """Test a repository without a remote uses main."""
+        assert _resolve_base(str(pool_origin)) == ("main", _sha(pool_origin, "main"))
+
+    def test_returns_none_without_main(self, tmp_path):
+        """Test None is returned when there is no main to base worktrees on."""
+        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+        assert _resolve_base(str(tmp_path)) is None
@@ -0,0 +1,61 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool._warm_slot."""
+
+import json
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.workflows.worktree_pool import _warm_slot
+
+_MODULE = "agentic_devtools.cli.workflows.worktree_pool"
+
+
+def _head(repo):
+    return subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+
+
+class TestWarmSlot:
+    """Tests for _warm_slot function."""
+
+    def test_adds_detached_worktree_and_runs_setup(self, pool_repo, tmp_path):
+        """Test the slot is a detached checkout of the base with setup done."""
+        slot_path = tmp_path / "slot"
+
+        assert _warm_slot(str(pool_repo), slot_path, _head(pool_repo)) is True
+
+        assert (slot_path / "deps.txt").is_file()
+        branch = subprocess.run(["git", "branch", "--show-current"], cwd=slot_path, capture_output=True, text=True)
+        assert branch.stdout.strip() == ""
+
+    def test_sparse_config_checks_out_cone(self, pool_repo, tmp_path):
+        """Test sparse worktree settings apply to pool worktrees."""
+        (pool_repo / "services" / "api").mkdir(parents=True)
+        (pool_repo / "services" / "api" / "app.py").write_text("")
+        (pool_repo / "docs").mkdir()
+        (pool_repo / "docs" / "guide.md").write_text("")
+        subprocess.run(["git", "add", "."], cwd=pool_repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "--no-verify", "-m", "dirs"], cwd=pool_repo, check=True, capture_output=True)
+        config = {"poolSize": 1, "sparseCheckout": True, "sparsePaths": ["services"]}
+        (pool_repo / ".agdt" / "config" / "worktrees.json").write_text(json.dumps(config))
+        slot_path = tmp_path / "slot"
+
+        assert _warm_slot(str(pool_repo), slot_path, _head(pool_repo)) is True
+
+        assert (slot_path / "services" / "api" / "app.py").is_file()
+        assert not (slot_path / "docs").exists()
+
+    def test_add_failure_returns_false(self, pool_repo, tmp_path):
+        """Test a failed worktree add is reported."""
+        assert _warm_slot(str(pool_repo), tmp_path / "slot", "0" * 40) is False
+
+    def test_sparse_failure_removes_worktree(self, pool_repo, tmp_path):
+        """Test a sparse worktree that can't be checked out is removed."""
+        slot_path = tmp_path / "slot"
+        with patch(f"{_MODULE}.resolve_sparse_directories", return_value=["services"]), patch(
+            f"{_MODULE}.apply_sparse_checkout", return_value=False
+        ), patch(f"{_MODULE}._remove_slot_worktree") as mock_remove, patch(
+            f"{_MODULE}._git", return_value=MagicMock(returncode=0)
+        ) as mock_git:
+            assert _warm_slot(str(pool_repo), slot_path, "abc") is False
+
+        assert "--no-checkout" in mock_git.call_args[0]
+        mock_remove.assert_called_once_with(str(pool_repo), slot_path)
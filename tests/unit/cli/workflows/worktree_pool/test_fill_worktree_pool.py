@@ -0,0 +1,102 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool.fill_worktree_pool."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.cli.git.core import FETCH_LOCK_FILENAME
+from agentic_devtools.cli.workflows.worktree_pool import (
+    SLOT_READY,
+    _read_manifest,
+    fill_worktree_pool,
+    get_pool_dir,
+)
+from agentic_devtools.file_locking import FileLockError, locked_file
+
+from .conftest import commit_to_origin
+
+_MODULE = "agentic_devtools.cli.workflows.worktree_pool"
+
+
+class TestFillWorktreePool:
+    """Tests for fill_worktree_pool function."""
+
+    def test_warms_worktrees_up_to_pool_size(self, pool_repo):
+        """Test poolSize detached worktrees are added and set up."""
+        status = fill_worktree_pool(str(pool_repo))
+
+        pool_dir = get_pool_dir(str(pool_repo))
+        slots = _read_manifest(pool_dir).slots
+        assert (status.size, status.ready, status.stale) == (2, 2, 0)
+        assert [slot.status for slot in slots] == [SLOT_READY, SLOT_READY]
+        for slot in slots:
+            assert (pool_dir / slot.name / "deps.txt").is_file()
+
+    def test_full_pool_is_left_alone(self, pool_repo):
+        """Test a refill of a full, current pool changes nothing."""
+        fill_worktree_pool(str(pool_repo))
+        before = {slot.name for slot in _read_manifest(get_pool_dir(str(pool_repo))).slots}
+
+        fill_worktree_pool(str(pool_repo))
+
+        assert {slot.name for slot in _read_manifest(get_pool_dir(str(pool_repo))).slots} == before
+
+    def test_replaces_worktrees_behind_main(self, pool_repo, pool_origin):
+        """Test worktrees based on an older main are replaced after main moves."""
+        fill_worktree_pool(str(pool_repo))
+        old_names = {slot.name for slot in _read_manifest(get_pool_dir(str(pool_repo))).slots}
+        commit_to_origin(pool_origin, "new.txt")
+
+        status = fill_worktree_pool(str(pool_repo))
+
+        slots = _read_manifest(get_pool_dir(str(pool_repo))).slots
+        assert (status.ready, status.stale) == (2, 0)
+        assert not old_names & {slot.name for slot in slots}
+        assert all(not (get_pool_dir(str(pool_repo)) / name).exists() for name in old_names)
+
+    def test_pool_size_zero_empties_pool(self, pool_repo):
+        """Test disabling the pool removes its worktrees on the next refill."""
+        fill_worktree_pool(str(pool_repo))
+        (pool_repo / ".agdt" / "config" / "worktrees.json").write_text(json.dumps({"poolSize": 0}))
+
+        fill_worktree_pool(str(pool_repo))
+
+        assert _read_manifest(get_pool_dir(str(pool_repo))).slots == []
+        listing = subprocess.run(["git", "worktree", "list"], cwd=pool_repo, capture_output=True, text=True)
+        assert len(listing.stdout.splitlines()) == 1
+
+    def test_failed_warm_raises(self, pool_repo):
+        """Test slots that fail to warm are dropped and the refill fails."""
+        with patch(f"{_MODULE}._warm_slot", return_value=False):
+            with pytest.raises(RuntimeError, match="Failed to warm"):
+                fill_worktree_pool(str(pool_repo))
+
+        assert _read_manifest(get_pool_dir(str(pool_repo))).slots == []
+
+    def test_missing_main_raises(self, pool_repo):
+        """Test a refill fails when there is no main to base worktrees on."""
+        with patch(f"{_MODULE}._resolve_base", return_value=None):
+            with pytest.raises(RuntimeError, match="origin/main"):
+                fill_worktree_pool(str(pool_repo))
+
+    def test_fetch_takes_fetch_lock(self, pool_repo):
+        """Test the fetch of main runs under the repository's fetch lock."""
+        lock_path = pool_repo / ".git" / FETCH_LOCK_FILENAME
+        held = []
+
+        def record_fetch(*args):
+            if "fetch" in args:
+                try:
+                    with locked_file(lock_path, "a", timeout=0.05):
+                        held.append(False)
+                except FileLockError:
+                    held.append(True)
+            return subprocess.CompletedProcess(args, 0, "", "")
+
+        with patch(f"{_MODULE}._git", side_effect=record_fetch), patch(f"{_MODULE}._resolve_base", return_value=None):
+            with pytest.raises(RuntimeError):
+                fill_worktree_pool(str(pool_repo))
+
+        assert held == [True]
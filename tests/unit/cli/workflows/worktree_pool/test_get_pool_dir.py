@@ -0,0 +1,13 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool.get_pool_dir."""
+
+from pathlib import Path
+
+from agentic_devtools.cli.workflows.worktree_pool import get_pool_dir
+
+
+class TestGetPoolDir:
+    """Tests for get_pool_dir function."""
+
+    def test_pool_lives_next_to_the_repository(self):
+        """Test the pool directory is in the repos parent, named after the repository."""
+        assert get_pool_dir("/repos/my-repo") == Path("/repos/.agdt-worktree-pool/my-repo")
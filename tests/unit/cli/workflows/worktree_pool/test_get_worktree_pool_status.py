@@ -0,0 +1,39 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool.get_worktree_pool_status."""
+
+import json
+import subprocess
+
+from agentic_devtools.cli.workflows.worktree_pool import (
+    PoolStatus,
+    fill_worktree_pool,
+    get_worktree_pool_status,
+)
+
+from .conftest import commit_to_origin
+
+
+class TestGetWorktreePoolStatus:
+    """Tests for get_worktree_pool_status function."""
+
+    def test_no_pool_returns_none(self, tmp_path):
+        """Test a repository that doesn't use the pool has no status."""
+        assert get_worktree_pool_status(str(tmp_path / "repo")) is None
+
+    def test_configured_empty_pool(self, pool_repo):
+        """Test an enabled pool that hasn't been filled yet reports zero ready."""
+        assert get_worktree_pool_status(str(pool_repo)) == PoolStatus(size=2, ready=0, warming=0, stale=0)
+
+    def test_counts_worktrees_behind_main(self, pool_repo, pool_origin):
+        """Test ready worktrees on an older main are counted as stale."""
+        fill_worktree_pool(str(pool_repo))
+        commit_to_origin(pool_origin, "new.txt")
+        subprocess.run(["git", "fetch", "origin"], cwd=pool_repo, check=True, capture_output=True)
+
+        assert get_worktree_pool_status(str(pool_repo)) == PoolStatus(size=2, ready=2, warming=0, stale=2)
+
+    def test_invalid_config_still_reports_existing_pool(self, pool_repo):
+        """Test a pool with worktrees is reported even when the config is invalid."""
+        fill_worktree_pool(str(pool_repo))
+        (pool_repo / ".agdt" / "config" / "worktrees.json").write_text(json.dumps({"poolSize": -1}))
+
+        assert get_worktree_pool_status(str(pool_repo)) == PoolStatus(size=0, ready=2, warming=0, stale=0)
@@ -0,0 +1,16 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool.PoolManifest."""
+
+from agentic_devtools.cli.workflows.worktree_pool import SLOT_WARMING, PoolManifest, PoolSlot
+
+
+class TestPoolManifest:
+    """Tests for PoolManifest dataclass."""
+
+    def test_round_trips_through_dict(self):
+        """Test to_dict and from_dict are inverses."""
+        manifest = PoolManifest(slots=[PoolSlot("slot-1", SLOT_WARMING, "origin/main", "abc", "2026-01-01")])
+        assert PoolManifest.from_dict(manifest.to_dict()) == manifest
+
+    def test_empty_dict_is_empty_pool(self):
+        """Test a new manifest file has no slots."""
+        assert PoolManifest.from_dict({}).slots == []
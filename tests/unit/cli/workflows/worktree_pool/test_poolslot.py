@@ -0,0 +1,17 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool.PoolSlot."""
+
+from agentic_devtools.cli.workflows.worktree_pool import SLOT_READY, PoolSlot
+
+
+class TestPoolSlot:
+    """Tests for PoolSlot dataclass."""
+
+    def test_round_trips_through_dict(self):
+        """Test to_dict and from_dict are inverses."""
+        slot = PoolSlot(name="slot-1", status=SLOT_READY, base_ref="origin/main", base_sha="abc")
+        assert PoolSlot.from_dict(slot.to_dict()) == slot
+
+    def test_defaults_updated_to_now(self):
+        """Test a new slot records when it was created."""
+        slot = PoolSlot(name="slot-1", status=SLOT_READY, base_ref="main", base_sha="abc")
+        assert slot.updated.startswith("20")
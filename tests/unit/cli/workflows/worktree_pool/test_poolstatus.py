@@ -0,0 +1,16 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool.PoolStatus."""
+
+from agentic_devtools.cli.workflows.worktree_pool import PoolStatus
+
+
+class TestPoolStatus:
+    """Tests for PoolStatus dataclass."""
+
+    def test_summary_of_full_pool(self):
+        """Test a healthy pool is summarized by its ready count."""
+        assert PoolStatus(size=2, ready=2, warming=0, stale=0).summary() == "Worktree pool: 2/2 ready"
+
+    def test_summary_mentions_stale_and_warming(self):
+        """Test stale and warming worktrees are called out."""
+        summary = PoolStatus(size=3, ready=2, warming=1, stale=1).summary()
+        assert summary == "Worktree pool: 2/3 ready (1 behind main), 1 warming"
@@ -0,0 +1,33 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool.start_worktree_pool_refill."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.workflows.worktree_pool import start_worktree_pool_refill
+
+_RUN = "agentic_devtools.background_tasks.run_function_in_background"
+
+
+class TestStartWorktreePoolRefill:
+    """Tests for start_worktree_pool_refill function."""
+
+    def test_starts_background_refill(self, pool_repo):
+        """Test an enabled pool is refilled by a background task in the main repository."""
+        with patch(_RUN, return_value=MagicMock(id="task-1")) as mock_run:
+            assert start_worktree_pool_refill(str(pool_repo)) == "task-1"
+
+        assert mock_run.call_args.kwargs["function_name"] == "_fill_worktree_pool_from_cwd"
+        assert mock_run.call_args.kwargs["cwd"] == str(pool_repo)
+
+    def test_no_pool_starts_nothing(self, tmp_path):
+        """Test a repository without a pool starts no task."""
+        with patch(_RUN) as mock_run:
+            assert start_worktree_pool_refill(str(tmp_path)) is None
+        mock_run.assert_not_called()
+
+    def test_invalid_config_starts_nothing(self, pool_repo):
+        """Test an invalid config starts no task."""
+        (pool_repo / ".agdt" / "config" / "worktrees.json").write_text(json.dumps({"poolSize": "two"}))
+        with patch(_RUN) as mock_run:
+            assert start_worktree_pool_refill(str(pool_repo)) is None
+        mock_run.assert_not_called()
@@ -0,0 +1,99 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_pool.take_pooled_worktree."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+from agentic_devtools.cli.workflows.worktree_pool import (
+    SLOT_WARMING,
+    PoolManifest,
+    PoolSlot,
+    _read_manifest,
+    fill_worktree_pool,
+    get_pool_dir,
+    take_pooled_worktree,
+)
+from agentic_devtools.file_locking import FileLockError
+
+_MODULE = "agentic_devtools.cli.workflows.worktree_pool"
+_BRANCH = "feature/DFLY-1/implementation"
+
+
+def _git_out(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True).stdout.strip()
+
+
+class TestTakePooledWorktree:
+    """Tests for take_pooled_worktree function."""
+
+    def test_hands_out_ready_worktree(self, pool_repo):
+        """Test a ready slot becomes the issue worktree on a new branch with dependencies installed."""
+        fill_worktree_pool(str(pool_repo))
+        target = pool_repo.parent / "DFLY-1"
+
+        assert take_pooled_worktree(str(pool_repo), str(target), _BRANCH) is True
+
+        assert _git_out(target, "branch", "--show-current") == _BRANCH
+        assert (target / "deps.txt").read_text() == "installed"
+        assert _git_out(target, "rev-parse", "HEAD") == _git_out(pool_repo, "rev-parse", "origin/main")
+        assert subprocess.run(["git", "rev-parse", "@{u}"], cwd=target, capture_output=True).returncode != 0
+        assert len(_read_manifest(get_pool_dir(str(pool_repo))).slots) == 1
+
+    def test_no_pool_returns_false(self, pool_repo):
+        """Test a repository without a pool manifest gets no worktree."""
+        assert take_pooled_worktree(str(pool_repo), str(pool_repo.parent / "DFLY-1"), _BRANCH) is False
+
+    def test_no_ready_slot_returns_false(self, pool_repo):
+        """Test slots that are still warming aren't handed out."""
+        pool_dir = get_pool_dir(str(pool_repo))
+        pool_dir.mkdir(parents=True)
+        manifest = PoolManifest(slots=[PoolSlot("slot-1", SLOT_WARMING, "origin/main", "abc")])
+        (pool_dir / "pool.json").write_text(json.dumps(manifest.to_dict()))
+
+        assert take_pooled_worktree(str(pool_repo), str(pool_repo.parent / "DFLY-1"), _BRANCH) is False
+
+    def test_existing_branch_returns_slot_to_pool(self, pool_repo):
+        """Test a slot whose branch can't be created goes back to the pool."""
+        fill_worktree_pool(str(pool_repo))
+        subprocess.run(["git", "branch", _BRANCH], cwd=pool_repo, check=True, capture_output=True)
+
+        assert take_pooled_worktree(str(pool_repo), str(pool_repo.parent / "DFLY-1"), _BRANCH) is False
+
+        assert len(_read_manifest(get_pool_dir(str(pool_repo))).slots) == 2
+
+    def test_failed_move_discards_slot_and_branch(self, pool_repo):
+        """Test a slot that can't be moved is removed along with the new branch."""
+        fill_worktree_pool(str(pool_repo))
+        for slot in _read_manifest(get_pool_dir(str(pool_repo))).slots:
+            subprocess.run(
+                ["git", "worktree", "lock", str(get_pool_dir(str(pool_repo)) / slot.name)],
+                cwd=pool_repo,
+                check=True,
+                capture_output=True,
+            )
+
+        assert take_pooled_worktree(str(pool_repo), str(pool_repo.parent / "DFLY-1"), _BRANCH) is False
+
+        assert len(_read_manifest(get_pool_dir(str(pool_repo))).slots) == 1
+        assert _git_out(pool_repo, "branch", "--list", _BRANCH) == ""
+
+    def test_existing_target_returns_false(self, pool_repo):
+        """Test no slot is handed out when the worktree path is already taken."""
+        fill_worktree_pool(str(pool_repo))
+        target = pool_repo.parent / "DFLY-1"
+        target.mkdir()
+
+        assert take_pooled_worktree(str(pool_repo), str(target), _BRANCH) is False
+        assert len(_read_manifest(get_pool_dir(str(pool_repo))).slots) == 2
+
+    def test_locked_manifest_returns_false(self, pool_repo):
+        """Test a pool locked by another process is skipped."""
+        fill_worktree_pool(str(pool_repo))
+        with patch(f"{_MODULE}._locked_manifest", side_effect=FileLockError("busy")):
+            assert take_pooled_worktree(str(pool_repo), str(pool_repo.parent / "DFLY-1"), _BRANCH) is False
+
+    def test_git_missing_returns_false(self, pool_repo):
+        """Test a git failure to run is reported as no worktree."""
+        fill_worktree_pool(str(pool_repo))
+        with patch(f"{_MODULE}._git", side_effect=OSError("no git")):
+            assert take_pooled_worktree(str(pool_repo), str(pool_repo.parent / "DFLY-1"), _BRANCH) is False
@@ -244,6 +244,36 @@ class TestCreateWorktree:
         mock_fetch.assert_called_once_with("feature/DFLY-1234/pr-review")
         mock_safety_check.assert_called_once_with("feature/DFLY-1234/pr-review")
 
+    @patch("agentic_devtools.cli.git.operations.check_branch_safe_to_recreate")
+    @patch("agentic_devtools.cli.git.operations.fetch_branch")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.is_in_worktree")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_current_branch")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.subprocess.run")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_repos_parent_dir")
+    @patch("os.path.exists")
+    def test_use_existing_branch_skips_fetch_when_already_fetched(
+        self, mock_exists, mock_parent, mock_run, mock_get_branch, mock_in_worktree, mock_fetch, mock_safety_check
+    ):
+        """Test that a branch the caller already fetched isn't fetched again."""
+        mock_parent.return_value = "/repos"
+        mock_exists.return_value = False
+        mock_get_branch.return_value = "main"
+        mock_in_worktree.return_value = False
+        mock_safety_check.return_value = MagicMock(is_safe=True, message="Branch is safe")
+        mock_run.return_value = MagicMock(returncode=0)
+
+        result = create_worktree(
+            "DFLY-1234",
+            "feature",
+            branch_name="feature/DFLY-1234/pr-review",
+            use_existing_branch=True,
+            branch_fetched=True,
+        )
+
+        assert result.success is True
+        mock_fetch.assert_not_called()
+        mock_safety_check.assert_called_once_with("feature/DFLY-1234/pr-review")
+
     @patch("agentic_devtools.cli.git.operations.check_branch_safe_to_recreate")
     @patch("agentic_devtools.cli.git.operations.fetch_branch")
     @patch("agentic_devtools.cli.workflows.worktree_setup.is_in_worktree")
@@ -296,3 +326,38 @@ class TestCreateWorktree:
 
         assert result.success is True
         assert mock_run.call_count == 2
+
+    @patch("agentic_devtools.cli.workflows.worktree_setup.apply_sparse_checkout", return_value=True)
+    @patch("agentic_devtools.cli.workflows.worktree_setup.is_in_worktree", return_value=False)
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_current_branch", return_value="main")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.subprocess.run")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_repos_parent_dir", return_value="/repos")
+    @patch("os.path.exists", return_value=False)
+    def test_sparse_worktree_added_without_checkout(
+        self, mock_exists, mock_parent, mock_run, mock_get_branch, mock_in_worktree, mock_sparse
+    ):
+        """Test sparse directories add the worktree with --no-checkout and apply the cone."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        result = create_worktree("DFLY-1234", "feature", sparse_directories=[".agdt", "services/api"])
+
+        assert result.success is True
+        assert "--no-checkout" in mock_run.call_args[0][0]
+        mock_sparse.assert_called_once_with(result.worktree_path, [".agdt", "services/api"])
+
+    @patch("agentic_devtools.cli.workflows.worktree_setup.apply_sparse_checkout", return_value=False)
+    @patch("agentic_devtools.cli.workflows.worktree_setup.is_in_worktree", return_value=False)
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_current_branch", return_value="main")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.subprocess.run")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_repos_parent_dir", return_value="/repos")
+    @patch("os.path.exists", return_value=False)
+    def test_sparse_checkout_failure_is_reported(
+        self, mock_exists, mock_parent, mock_run, mock_get_branch, mock_in_worktree, mock_sparse
+    ):
+        """Test a failed checkout of a sparse worktree fails the result."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        result = create_worktree("DFLY-1234", "feature", sparse_directories=["services/api"])
+
+        assert result.success is False
+        assert "checking out files failed" in result.error_message
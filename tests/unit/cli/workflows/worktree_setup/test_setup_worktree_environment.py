@@ -1,5 +1,6 @@
 """Tests for SetupWorktreeEnvironment."""
 
+import os
 from unittest.mock import patch
 
 from agentic_devtools.cli.workflows.worktree_setup import (
@@ -89,3 +90,97 @@ class TestSetupWorktreeEnvironment:
 
         assert result.success is True
         assert result.vscode_opened is False
+
+    @patch("agentic_devtools.cli.git.operations.fetch_branch")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.run_worktree_setup_script")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.resolve_sparse_directories", return_value=["services/api"])
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_main_repo_root", return_value="/repos/main")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.create_worktree")
+    def test_passes_sparse_directories_for_existing_branch(
+        self, mock_create, mock_root, mock_resolve, mock_script, mock_fetch
+    ):
+        """Test the sparse cone is resolved from the branch being reviewed and passed on."""
+        mock_create.return_value = WorktreeSetupResult(
+            success=True, worktree_path="/repos/DFLY-1234", branch_name="feature/DFLY-1234/pr"
+        )
+
+        setup_worktree_environment(
+            issue_key="DFLY-1234",
+            branch_name="feature/DFLY-1234/pr",
+            use_existing_branch=True,
+            open_vscode=False,
+        )
+
+        mock_resolve.assert_called_once_with("/repos/main", "feature/DFLY-1234/pr")
+        assert mock_create.call_args.kwargs["sparse_directories"] == ["services/api"]
+
+    @patch("agentic_devtools.cli.git.operations.fetch_branch")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.run_worktree_setup_script")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.resolve_sparse_directories")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_main_repo_root", return_value="/repos/main")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.create_worktree")
+    def test_fetches_existing_branch_once_before_resolving(
+        self, mock_create, mock_root, mock_resolve, mock_script, mock_fetch
+    ):
+        """Test the existing branch is fetched before the sparse cone is resolved, and not again on create."""
+        calls = []
+        mock_fetch.side_effect = lambda branch: calls.append("fetch")
+        mock_resolve.side_effect = lambda root, branch: calls.append("resolve")
+        mock_create.return_value = WorktreeSetupResult(
+            success=True, worktree_path="/repos/DFLY-1234", branch_name="feature/DFLY-1234/pr"
+        )
+
+        setup_worktree_environment(
+            issue_key="DFLY-1234",
+            branch_name="feature/DFLY-1234/pr",
+            use_existing_branch=True,
+            open_vscode=False,
+        )
+
+        mock_fetch.assert_called_once_with("feature/DFLY-1234/pr")
+        assert calls == ["fetch", "resolve"]
+        assert mock_create.call_args.kwargs["branch_fetched"] is True
+
+    @patch("agentic_devtools.cli.workflows.worktree_setup.start_worktree_pool_refill")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.inject_git_path_settings")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.run_worktree_setup_script")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.take_pooled_worktree", return_value=True)
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_main_repo_root", return_value="/repos/main")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.create_worktree")
+    def test_uses_pooled_worktree_for_new_branch(
+        self, mock_create, mock_root, mock_take, mock_script, mock_inject, mock_refill
+    ):
+        """Test a pre-warmed worktree is handed out and the pool is refilled, without setting it up again."""
+        result = setup_worktree_environment(issue_key="DFLY-1234", open_vscode=False)
+
+        assert result.success is True
+        assert result.worktree_path == os.path.join("/repos", "DFLY-1234")
+        assert result.branch_name == "feature/DFLY-1234/implementation"
+        mock_take.assert_called_once_with("/repos/main", result.worktree_path, "feature/DFLY-1234/implementation")
+        mock_create.assert_not_called()
+        mock_inject.assert_not_called()
+        mock_script.assert_not_called()
+        mock_refill.assert_called_once_with("/repos/main")
+
+    @patch("agentic_devtools.cli.git.operations.fetch_branch")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.start_worktree_pool_refill")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.run_worktree_setup_script")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.take_pooled_worktree")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.resolve_sparse_directories", return_value=None)
+    @patch("agentic_devtools.cli.workflows.worktree_setup.get_main_repo_root", return_value="/repos/main")
+    @patch("agentic_devtools.cli.workflows.worktree_setup.create_worktree")
+    def test_existing_branch_skips_pool(
+        self, mock_create, mock_root, mock_resolve, mock_take, mock_script, mock_refill, mock_fetch
+    ):
+        """Test existing branches (PR reviews) are never served from the pool."""
+        mock_create.return_value = WorktreeSetupResult(
+            success=True, worktree_path="/repos/DFLY-1234", branch_name="feature/DFLY-1234/pr"
+        )
+
+        setup_worktree_environment(
+            issue_key="DFLY-1234", branch_name="feature/DFLY-1234/pr", use_existing_branch=True, open_vscode=False
+        )
+
+        mock_take.assert_not_called()
+        mock_create.assert_called_once()
+        mock_script.assert_called_once_with("/repos/DFLY-1234")
@@ -0,0 +1,65 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_sparse.apply_sparse_checkout."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.workflows.worktree_sparse import apply_sparse_checkout
+from tests.helpers import create_git_repo
+
+_RUN = "agentic_devtools.cli.workflows.worktree_sparse.subprocess.run"
+
+
+def _repo_with_directories(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    create_git_repo(repo)
+    for directory in ("services/api", "services/web", ".agdt"):
+        (repo / directory).mkdir(parents=True)
+        (repo / directory / "file.txt").write_text(directory)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "--no-verify", "-m", "dirs"], cwd=repo, check=True, capture_output=True)
+    return repo
+
+
+class TestApplySparseCheckout:
+    """Tests for apply_sparse_checkout function."""
+
+    def test_checks_out_only_cone_directories(self, tmp_path):
+        """Test a --no-checkout worktree gets only the cone directories and root files."""
+        repo = _repo_with_directories(tmp_path)
+        worktree = tmp_path / "wt"
+        subprocess.run(
+            ["git", "worktree", "add", "--no-checkout", str(worktree), "-b", "feature"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+        assert apply_sparse_checkout(str(worktree), [".agdt", "services/api"]) is True
+
+        assert (worktree / "README.md").is_file()
+        assert (worktree / ".agdt" / "file.txt").is_file()
+        assert (worktree / "services" / "api" / "file.txt").is_file()
+        assert not (worktree / "services" / "web").exists()
+        status = subprocess.run(["git", "status", "--porcelain"], cwd=worktree, capture_output=True, text=True)
+        assert status.stdout == ""
+
+    def test_falls_back_to_full_checkout(self, capsys):
+        """Test a failed sparse-checkout still checks out the full tree."""
+        results = [MagicMock(returncode=1, stderr="unknown option"), MagicMock(returncode=0, stderr="")]
+        with patch(_RUN, side_effect=results) as mock_run:
+            assert apply_sparse_checkout("/wt", ["a"]) is True
+
+        assert mock_run.call_args[0][0] == ["git", "-C", "/wt", "checkout"]
+        assert "checking out the full tree" in capsys.readouterr().err
+
+    def test_checkout_failure_returns_false(self):
+        """Test a failed checkout is reported."""
+        results = [MagicMock(returncode=0, stderr=""), MagicMock(returncode=1, stderr="fatal")]
+        with patch(_RUN, side_effect=results):
+            assert apply_sparse_checkout("/wt", ["a", "b"]) is False
+
+    def test_git_missing_returns_false(self):
+        """Test a missing git executable is reported."""
+        with patch(_RUN, side_effect=FileNotFoundError()):
+            assert apply_sparse_checkout("/wt", ["a"]) is False
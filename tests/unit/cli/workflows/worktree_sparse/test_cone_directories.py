@@ -0,0 +1,22 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_sparse.cone_directories."""
+
+from agentic_devtools.cli.workflows.worktree_sparse import cone_directories
+
+
+class TestConeDirectories:
+    """Tests for cone_directories function."""
+
+    def test_sorts_and_deduplicates(self):
+        """Test the result is sorted with duplicates removed."""
+        assert cone_directories(["b", "a", "b"]) == ["a", "b"]
+
+    def test_drops_directories_covered_by_a_parent(self):
+        """Test subdirectories of a listed directory are dropped."""
+        assert cone_directories(["services/api/v1", "services/api", "services/apigw"]) == [
+            "services/api",
+            "services/apigw",
+        ]
+
+    def test_strips_slashes_and_blank_entries(self):
+        """Test surrounding slashes and the repository root are ignored."""
+        assert cone_directories(["/shared/", "", " "]) == ["shared"]
@@ -0,0 +1,31 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_sparse.get_branch_touched_paths."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_devtools.cli.workflows.worktree_sparse import get_branch_touched_paths
+
+_RUN = "agentic_devtools.cli.workflows.worktree_sparse.subprocess.run"
+
+
+class TestGetBranchTouchedPaths:
+    """Tests for get_branch_touched_paths function."""
+
+    def test_returns_parent_directories_of_changed_files(self):
+        """Test changed files are reduced to their directories; root files are skipped."""
+        diff = MagicMock(returncode=0, stdout="services/api/app.py\nREADME.md\nshared/util.py\n")
+        with patch(_RUN, return_value=diff) as mock_run:
+            paths = get_branch_touched_paths("feature/x")
+
+        assert paths == ["services/api", "shared"]
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["git", "diff", "--name-only", "origin/main...origin/feature/x"]
+
+    def test_returns_empty_when_diff_fails(self):
+        """Test a failed diff yields no paths."""
+        with patch(_RUN, return_value=MagicMock(returncode=128, stdout="")):
+            assert get_branch_touched_paths("feature/x") == []
+
+    def test_returns_empty_when_git_missing(self):
+        """Test a missing git executable yields no paths."""
+        with patch(_RUN, side_effect=FileNotFoundError()):
+            assert get_branch_touched_paths("feature/x") == []
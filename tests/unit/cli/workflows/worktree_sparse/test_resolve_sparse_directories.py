@@ -0,0 +1,52 @@
+"""Tests for agentic_devtools.cli.workflows.worktree_sparse.resolve_sparse_directories."""
+
+from unittest.mock import patch
+
+from agentic_devtools.cli.workflows.worktree_config import WorktreeConfig
+from agentic_devtools.cli.workflows.worktree_sparse import resolve_sparse_directories
+
+_MODULE = "agentic_devtools.cli.workflows.worktree_sparse"
+
+
+class TestResolveSparseDirectories:
+    """Tests for resolve_sparse_directories function."""
+
+    def test_disabled_returns_none(self):
+        """Test a full checkout is used when sparse checkout is disabled."""
+        with patch(f"{_MODULE}.load_worktree_config", return_value=WorktreeConfig()):
+            assert resolve_sparse_directories("/repo", "feature/x") is None
+
+    def test_invalid_config_returns_none(self, capsys):
+        """Test an invalid config falls back to a full checkout with a warning."""
+        with patch(f"{_MODULE}.load_worktree_config", side_effect=ValueError("bad")):
+            assert resolve_sparse_directories("/repo") is None
+        assert "invalid worktree config" in capsys.readouterr().err
+
+    def test_combines_configured_and_touched_paths(self):
+        """Test configured paths, touched paths and .agdt make up the cone."""
+        config = WorktreeConfig(sparseCheckout=True, sparsePaths=["shared"])
+        with patch(f"{_MODULE}.load_worktree_config", return_value=config), patch(
+            f"{_MODULE}.get_branch_touched_paths", return_value=["services/api", "shared/util"]
+        ):
+            directories = resolve_sparse_directories("/repo", "feature/x")
+
+        assert directories == [".agdt", "services/api", "shared"]
+
+    def test_new_branch_uses_configured_paths_only(self):
+        """Test a new branch doesn't look for touched paths."""
+        config = WorktreeConfig(sparseCheckout=True, sparsePaths=["shared"])
+        with patch(f"{_MODULE}.load_worktree_config", return_value=config), patch(
+            f"{_MODULE}.get_branch_touched_paths"
+        ) as mock_touched:
+            directories = resolve_sparse_directories("/repo")
+
+        assert directories == [".agdt", "shared"]
+        mock_touched.assert_not_called()
+
+    def test_nothing_to_check_out_returns_none(self):
+        """Test a full checkout is used when there are no paths at all."""
+        config = WorktreeConfig(sparseCheckout=True)
+        with patch(f"{_MODULE}.load_worktree_config", return_value=config), patch(
+            f"{_MODULE}.get_branch_touched_paths", return_value=[]
+        ):
+            assert resolve_sparse_directories("/repo", "feature/x") is None
@@ -33,9 +33,10 @@ def mock_background_and_state(tmp_path):
                 "agentic_devtools.cli.azure_devops.file_review_commands.get_state_dir",
                 return_value=tmp_path,
             ):
-                with patch("agentic_devtools.background_tasks.subprocess.Popen") as mock_popen:
-                    mock_popen.return_value = make_mock_popen()
-                    yield {
-                        "state_dir": tmp_path,
-                        "mock_popen": mock_popen,
-                    }
+                with patch("agentic_devtools.cli.azure_devops.review_state.get_state_dir", return_value=tmp_path):
+                    with patch("agentic_devtools.background_tasks.subprocess.Popen") as mock_popen:
+                        mock_popen.return_value = make_mock_popen()
+                        yield {
+                            "state_dir": tmp_path,
+                            "mock_popen": mock_popen,
+                        }
@@ -0,0 +1,24 @@
+"""
+Tests for prompt template loader.
+"""
+
+import pytest
+from jinja2 import TemplateSyntaxError
+
+from agdt_ai_helpers.prompts import loader
+
+
+class TestCompileTemplate:
+    """Tests for _compile_template function."""
+
+    def test_same_source_is_compiled_once(self):
+        """Test that identical template sources share one compiled template."""
+        source = "Compiled once: {{ value }}"
+        first = loader._compile_template(source)
+        assert loader._compile_template(source) is first
+        assert first.render(value="ok") == "Compiled once: ok"
+
+    def test_syntax_error_is_raised(self):
+        """Test that invalid templates raise TemplateSyntaxError."""
+        with pytest.raises(TemplateSyntaxError):
+            loader._compile_template("{% if %}")
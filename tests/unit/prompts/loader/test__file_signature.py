@@ -0,0 +1,23 @@
+"""
+Tests for prompt template loader.
+"""
+
+import os
+
+from agdt_ai_helpers.prompts import loader
+
+
+class TestFileSignature:
+    """Tests for _file_signature function."""
+
+    def test_existing_file(self, tmp_path):
+        """Test that existing files return their mtime and size."""
+        path = tmp_path / "t.md"
+        path.write_text("abc", encoding="utf-8")
+        os.utime(path, ns=(5_000_000_000, 5_000_000_000))
+
+        assert loader._file_signature(path) == (5_000_000_000, 3)
+
+    def test_missing_file(self, tmp_path):
+        """Test that missing files return None."""
+        assert loader._file_signature(tmp_path / "missing.md") is None
@@ -0,0 +1,34 @@
+"""
+Tests for prompt template loader.
+"""
+
+from unittest.mock import patch
+
+from agdt_ai_helpers.prompts import loader
+
+
+class TestClearTemplateCache:
+    """Tests for clear_template_cache function."""
+
+    def test_clears_loaded_templates(self, temp_prompts_dir):
+        """Test that cleared templates are read from disk again."""
+        workflow_dir = temp_prompts_dir / "test"
+        workflow_dir.mkdir()
+        (workflow_dir / "default-initiate-prompt.md").write_text("{{a}}", encoding="utf-8")
+        loader.load_prompt_template("test", "initiate")
+
+        loader.clear_template_cache()
+
+        with patch.object(loader, "_file_signature", wraps=loader._file_signature) as signature:
+            loader.load_prompt_template("test", "initiate")
+        assert signature.call_count == 2
+        assert loader._template_cache
+
+    def test_clears_compiled_templates(self):
+        """Test that the compiled template cache is emptied."""
+        loader.substitute_variables("Hello {{ name }}", {"name": "x"})
+
+        loader.clear_template_cache()
+
+        assert loader._compile_template.cache_info().currsize == 0
+        assert loader._template_cache == {}
@@ -2,6 +2,10 @@
 Tests for prompt template loader.
 """
 
+import os
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
 from agdt_ai_helpers.prompts import loader
@@ -43,3 +47,65 @@ class TestLoadPromptTemplate:
         """Test that FileNotFoundError is raised for missing template."""
         with pytest.raises(FileNotFoundError):
             loader.load_prompt_template("nonexistent", "initiate")
+
+
+class TestLoadPromptTemplateCache:
+    """Tests for the file cache behind load_prompt_template."""
+
+    def _write(self, path, content, mtime_ns):
+        path.write_text(content, encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_files_are_not_reread(self, temp_prompts_dir):
+        """Test that a second load with unchanged files uses the cache."""
+        workflow_dir = temp_prompts_dir / "test"
+        workflow_dir.mkdir()
+        (workflow_dir / "default-initiate-prompt.md").write_text("Default {{var}}", encoding="utf-8")
+
+        assert loader.load_prompt_template("test", "initiate") == "Default {{var}}"
+        with patch.object(Path, "read_text", side_effect=AssertionError("should not read")):
+            assert loader.load_prompt_template("test", "initiate") == "Default {{var}}"
+
+    def test_modified_file_is_reloaded(self, temp_prompts_dir):
+        """Test that changing a template's mtime invalidates the cached content."""
+        workflow_dir = temp_prompts_dir / "test"
+        workflow_dir.mkdir()
+        template_file = workflow_dir / "default-initiate-prompt.md"
+        self._write(template_file, "Old {{var}}", 1_000_000_000)
+        assert loader.load_prompt_template("test", "initiate") == "Old {{var}}"
+
+        self._write(template_file, "New {{var}}", 2_000_000_000)
+        assert loader.load_prompt_template("test", "initiate") == "New {{var}}"
+
+    def test_added_override_is_picked_up(self, temp_prompts_dir):
+        """Test that creating an override after a cached load takes effect."""
+        workflow_dir = temp_prompts_dir / "test"
+        workflow_dir.mkdir()
+        (workflow_dir / "default-initiate-prompt.md").write_text("Default {{var}}", encoding="utf-8")
+        assert loader.load_prompt_template("test", "initiate") == "Default {{var}}"
+
+        (workflow_dir / "initiate-prompt.md").write_text("Override {{var}}", encoding="utf-8")
+        assert loader.load_prompt_template("test", "initiate") == "Override {{var}}"
+
+    def test_invalid_override_is_not_cached(self, temp_prompts_dir):
+        """Test that a failed override validation raises on every load."""
+        workflow_dir = temp_prompts_dir / "test"
+        workflow_dir.mkdir()
+        (workflow_dir / "default-initiate-prompt.md").write_text("{{a}}", encoding="utf-8")
+        (workflow_dir / "initiate-prompt.md").write_text("{{a}} {{b}}", encoding="utf-8")
+
+        for _ in range(2):
+            with pytest.raises(loader.TemplateValidationError):
+                loader.load_prompt_template("test", "initiate")
+
+    def test_removed_template_raises(self, temp_prompts_dir):
+        """Test that deleting a cached template raises FileNotFoundError."""
+        workflow_dir = temp_prompts_dir / "test"
+        workflow_dir.mkdir()
+        template_file = workflow_dir / "default-initiate-prompt.md"
+        template_file.write_text("{{a}}", encoding="utf-8")
+        loader.load_prompt_template("test", "initiate")
+
+        template_file.unlink()
+        with pytest.raises(FileNotFoundError):
+            loader.load_prompt_template("test", "initiate")
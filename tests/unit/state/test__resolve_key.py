@@ -0,0 +1,20 @@
+"""Tests for agentic_devtools.state._resolve_key."""
+
+from agentic_devtools import state
+
+
+class TestResolveKey:
+    """Tests for _resolve_key function."""
+
+    def test_resolves_nested_key(self):
+        """Test that dotted keys walk nested dictionaries."""
+        assert state._resolve_key({"jira": {"issue_key": "DFLY-1"}}, "jira.issue_key") == "DFLY-1"
+
+    def test_stored_none_is_not_missing(self):
+        """Test that an explicitly stored None is returned as None."""
+        assert state._resolve_key({"a": None}, "a") is None
+
+    def test_missing_key(self):
+        """Test that absent keys and non-dict parents return the sentinel."""
+        assert state._resolve_key({}, "a") is state._MISSING
+        assert state._resolve_key({"a": 1}, "a.b") is state._MISSING
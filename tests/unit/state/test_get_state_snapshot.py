@@ -0,0 +1,43 @@
+"""Tests for agentic_devtools.state.get_state_snapshot."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools import state
+
+
+class TestGetStateSnapshot:
+    """Tests for get_state_snapshot function."""
+
+    def test_returns_requested_keys(self, temp_state_dir):
+        """Test that simple and dotted keys are resolved from state."""
+        state.set_value("pull_request_id", 123)
+        state.set_value("jira.issue_key", "DFLY-1")
+
+        snapshot = state.get_state_snapshot(["pull_request_id", "jira.issue_key"])
+
+        assert dict(snapshot) == {"pull_request_id": 123, "jira.issue_key": "DFLY-1"}
+
+    def test_missing_keys_map_to_none(self, temp_state_dir):
+        """Test that keys absent from state are present with a None value."""
+        state.set_value("jira", "not-a-dict")
+
+        snapshot = state.get_state_snapshot(["missing", "jira.issue_key"])
+
+        assert snapshot["missing"] is None
+        assert snapshot["jira.issue_key"] is None
+
+    def test_single_state_load(self, temp_state_dir):
+        """Test that the state file is read once regardless of key count."""
+        with patch.object(state, "load_state", wraps=state.load_state) as mock_load:
+            state.get_state_snapshot(["a", "b.c", "d.e.f"])
+
+        assert mock_load.call_count == 1
+
+    def test_is_read_only(self, temp_state_dir):
+        """Test that the snapshot cannot be modified."""
+        snapshot = state.get_state_snapshot(["a"])
+
+        with pytest.raises(TypeError):
+            snapshot["a"] = 1
@@ -0,0 +1,23 @@
+"""Fixtures for agentic_devtools.task_logs tests."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools import task_logs
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    """Point the logs directory at a temporary directory."""
+    directory = tmp_path / "logs"
+    directory.mkdir()
+    with patch.object(task_logs, "get_logs_dir", return_value=directory):
+        yield directory
+
+
+@pytest.fixture
+def no_zstandard():
+    """Force the gzip fallback regardless of installed packages."""
+    with patch.object(task_logs, "_get_zstandard", return_value=None):
+        yield
@@ -0,0 +1,21 @@
+"""Tests for agentic_devtools.task_logs._get_zstandard."""
+
+import sys
+from unittest.mock import patch
+
+from agentic_devtools.task_logs import _get_zstandard
+
+
+class TestGetZstandard:
+    """Tests for _get_zstandard function."""
+
+    def test_missing_package(self):
+        """Test that None is returned when zstandard isn't installed."""
+        with patch.dict(sys.modules, {"zstandard": None}):
+            assert _get_zstandard() is None
+
+    def test_installed_package(self):
+        """Test that the module is returned when zstandard is importable."""
+        fake = object()
+        with patch.dict(sys.modules, {"zstandard": fake}):
+            assert _get_zstandard() is fake
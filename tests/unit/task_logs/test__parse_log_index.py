@@ -0,0 +1,23 @@
+"""Tests for agentic_devtools.task_logs._parse_log_index."""
+
+import json
+
+from agentic_devtools.task_logs import LogIndex, LogIndexEntry, _parse_log_index
+
+
+class TestParseLogIndex:
+    """Tests for _parse_log_index function."""
+
+    def test_valid_index(self):
+        """Test that a current index is parsed."""
+        index = LogIndex(entries={"a.log.gz": LogIndexEntry(10, 1.0)})
+        assert _parse_log_index(json.dumps(index.to_dict())) == index
+
+    def test_corrupt_index(self):
+        """Test that unreadable content gives an empty index."""
+        assert _parse_log_index("{not json") == LogIndex()
+        assert _parse_log_index('{"version": 1, "entries": {"a.log": {}}}') == LogIndex()
+
+    def test_new_or_outdated_index(self):
+        """Test that an empty file or another layout version gives an empty index."""
+        assert _parse_log_index("{}") == LogIndex()
@@ -0,0 +1,37 @@
+"""Tests for agentic_devtools.task_logs.append_log_note."""
+
+import gzip
+
+from agentic_devtools.task_logs import append_log_note
+
+
+class TestAppendLogNote:
+    """Tests for append_log_note function."""
+
+    def test_plain_log(self, tmp_path):
+        """Test that the note is appended to a plain log."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("output\n")
+
+        append_log_note(log_path, "disk full")
+
+        assert log_path.read_text() == "output\n\n[log housekeeping] disk full\n"
+
+    def test_gzip_log(self, tmp_path):
+        """Test that the note is appended to a compressed log as an extra member."""
+        log_path = tmp_path / "task.log"
+        compressed = tmp_path / "task.log.gz"
+        compressed.write_bytes(gzip.compress(b"output\n"))
+
+        append_log_note(log_path, "disk full")
+
+        assert gzip.decompress(compressed.read_bytes()) == b"output\n\n[log housekeeping] disk full\n"
+        assert not log_path.exists()
+
+    def test_unwritable_log_goes_to_stderr(self, tmp_path, capsys):
+        """Test that a note that can't be written to the log is printed to stderr."""
+        log_path = tmp_path / "missing" / "task.log"
+
+        append_log_note(log_path, "disk full")
+
+        assert "disk full" in capsys.readouterr().err
@@ -0,0 +1,36 @@
+"""Tests for agentic_devtools.task_logs.cleanup_logs."""
+
+import json
+from unittest.mock import patch
+
+from agentic_devtools import task_logs
+from agentic_devtools.file_locking import FileLockError
+from agentic_devtools.task_logs import LOG_INDEX_FILENAME, cleanup_logs
+
+
+class TestCleanupLogs:
+    """Tests for cleanup_logs function."""
+
+    def test_builds_index_and_applies_limits(self, logs_dir):
+        """Test that the index is created from the directory and the limits applied."""
+        (logs_dir / "a.log.gz").write_bytes(b"x" * 10)
+        (logs_dir / "b.log.gz").write_bytes(b"x" * 10)
+
+        assert cleanup_logs(max_count=1) == 1
+
+        data = json.loads((logs_dir / LOG_INDEX_FILENAME).read_text())
+        assert len(data["entries"]) == 1
+        assert len(list(logs_dir.glob("*.log.gz"))) == 1
+
+    def test_index_shrinks_on_rewrite(self, logs_dir):
+        """Test that a smaller index fully replaces a larger one."""
+        (logs_dir / LOG_INDEX_FILENAME).write_text(" " * 10000)
+
+        assert cleanup_logs() == 0
+
+        assert json.loads((logs_dir / LOG_INDEX_FILENAME).read_text())["entries"] == {}
+
+    def test_lock_timeout(self, logs_dir):
+        """Test that cleanup is skipped if another process holds the index lock."""
+        with patch.object(task_logs, "locked_file", side_effect=FileLockError("busy")):
+            assert cleanup_logs(max_age_hours=0) == 0
@@ -0,0 +1,55 @@
+"""Tests for agentic_devtools.task_logs.compress_log."""
+
+import gzip
+import os
+from unittest.mock import patch
+
+import pytest
+
+from agentic_devtools.task_logs import compress_log
+
+
+class TestCompressLog:
+    """Tests for compress_log function."""
+
+    def test_gzip_fallback(self, tmp_path, no_zstandard):
+        """Test that without zstandard the log is gzipped, keeping its mtime, and removed."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("output\n" * 1000)
+        os.utime(log_path, (1_000_000, 1_000_000))
+
+        compressed = compress_log(log_path)
+
+        assert compressed == tmp_path / "task.log.gz"
+        assert not log_path.exists()
+        assert gzip.decompress(compressed.read_bytes()) == b"output\n" * 1000
+        assert compressed.stat().st_mtime == 1_000_000
+        assert compressed.stat().st_size < 1000
+        assert [p.name for p in tmp_path.iterdir()] == ["task.log.gz"]
+
+    def test_zstd(self, tmp_path):
+        """Test that the log is compressed with zstd when zstandard is installed."""
+        zstandard = pytest.importorskip("zstandard")
+        log_path = tmp_path / "task.log"
+        log_path.write_text("output\n")
+
+        compressed = compress_log(log_path)
+
+        assert compressed == tmp_path / "task.log.zst"
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(compressed.read_bytes()) == b"output\n"
+
+    def test_missing_log(self, tmp_path, no_zstandard):
+        """Test that a missing log raises OSError."""
+        with pytest.raises(OSError):
+            compress_log(tmp_path / "missing.log")
+
+    def test_failed_write_removes_temp_file(self, tmp_path, no_zstandard):
+        """Test that a failed compression leaves the plain log and no temp file behind."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("output\n")
+
+        with patch("agentic_devtools.task_logs.os.utime", side_effect=OSError("busy")):
+            with pytest.raises(OSError):
+                compress_log(log_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["task.log"]
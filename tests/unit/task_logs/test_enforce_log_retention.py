@@ -0,0 +1,70 @@
+"""Tests for agentic_devtools.task_logs.enforce_log_retention."""
+
+import time
+from unittest.mock import patch
+
+from agentic_devtools.task_logs import LogIndex, LogIndexEntry, enforce_log_retention
+
+
+def _make_logs(directory, specs):
+    """Create log files and a matching index from (name, size, age_hours) specs."""
+    index = LogIndex()
+    now = time.time()
+    for name, size, age_hours in specs:
+        (directory / name).write_bytes(b"x" * size)
+        index.entries[name] = LogIndexEntry(size=size, mtime=now - age_hours * 3600)
+    return index
+
+
+class TestEnforceLogRetention:
+    """Tests for enforce_log_retention function."""
+
+    def test_no_limits(self, tmp_path):
+        """Test that nothing is deleted without limits."""
+        index = _make_logs(tmp_path, [("a.log.gz", 10, 100)])
+        assert enforce_log_retention(index, tmp_path) == 0
+        assert (tmp_path / "a.log.gz").exists()
+
+    def test_max_age(self, tmp_path):
+        """Test that logs older than the age limit are deleted."""
+        index = _make_logs(tmp_path, [("old.log.gz", 10, 30), ("new.log.gz", 10, 1)])
+
+        assert enforce_log_retention(index, tmp_path, max_age_hours=24) == 1
+
+        assert list(index.entries) == ["new.log.gz"]
+        assert not (tmp_path / "old.log.gz").exists()
+
+    def test_max_count(self, tmp_path):
+        """Test that the oldest logs beyond the count limit are deleted, plain or compressed."""
+        index = _make_logs(tmp_path, [("a.log", 1, 3), ("b.log.gz", 1, 2), ("c.log.gz", 1, 1)])
+
+        assert enforce_log_retention(index, tmp_path, max_count=1) == 2
+
+        assert list(index.entries) == ["c.log.gz"]
+
+    def test_max_bytes_deletes_oldest_compressed_logs(self, tmp_path):
+        """Test that the byte budget deletes the oldest compressed logs but never plain ones."""
+        index = _make_logs(
+            tmp_path,
+            [("running.log", 50, 5), ("a.log.gz", 30, 4), ("b.log.gz", 30, 3), ("c.log.gz", 30, 2)],
+        )
+
+        assert enforce_log_retention(index, tmp_path, max_bytes=100) == 2
+
+        assert sorted(index.entries) == ["c.log.gz", "running.log"]
+        assert (tmp_path / "running.log").exists()
+
+    def test_already_deleted_file(self, tmp_path):
+        """Test that a log removed behind the index's back is still dropped from it."""
+        index = LogIndex(entries={"gone.log.gz": LogIndexEntry(10, 1.0)})
+        assert enforce_log_retention(index, tmp_path, max_age_hours=1) == 1
+        assert index.entries == {}
+
+    def test_undeletable_file_stays_indexed(self, tmp_path):
+        """Test that a log that can't be deleted is kept in the index."""
+        index = _make_logs(tmp_path, [("a.log.gz", 10, 30)])
+
+        with patch("pathlib.Path.unlink", side_effect=OSError("Permission denied")):
+            assert enforce_log_retention(index, tmp_path, max_age_hours=24) == 0
+
+        assert list(index.entries) == ["a.log.gz"]
@@ -0,0 +1,59 @@
+"""Tests for agentic_devtools.task_logs.finalize_task_log."""
+
+import gzip
+import json
+from unittest.mock import patch
+
+from agentic_devtools import task_logs
+from agentic_devtools.task_logs import LOG_INDEX_FILENAME, finalize_task_log
+
+
+class TestFinalizeTaskLog:
+    """Tests for finalize_task_log function."""
+
+    def test_compresses_and_indexes(self, logs_dir, temp_state_dir, no_zstandard):
+        """Test that the finished log is compressed and recorded in the index."""
+        log_path = logs_dir / "task.log"
+        log_path.write_text("done\n")
+
+        assert finalize_task_log(log_path) == logs_dir / "task.log.gz"
+
+        entries = json.loads((logs_dir / LOG_INDEX_FILENAME).read_text())["entries"]
+        assert list(entries) == ["task.log.gz"]
+
+    def test_enforces_byte_budget(self, logs_dir, temp_state_dir, no_zstandard):
+        """Test that older compressed logs are evicted to stay within the budget."""
+        (logs_dir / "older.log.gz").write_bytes(b"x" * 2048)
+        log_path = logs_dir / "task.log"
+        log_path.write_text("done\n")
+
+        with patch.object(task_logs, "get_logs_max_bytes", return_value=1024):
+            finalize_task_log(log_path)
+
+        assert not (logs_dir / "older.log.gz").exists()
+        assert (logs_dir / "task.log.gz").exists()
+
+    def test_missing_log(self, logs_dir, no_zstandard):
+        """Test that a missing log is reported as not compressed."""
+        assert finalize_task_log(logs_dir / "missing.log") is None
+
+    def test_cleanup_failure_is_noted_in_log(self, logs_dir, temp_state_dir, no_zstandard):
+        """Test that retention errors don't affect the finished task and are noted in its log."""
+        log_path = logs_dir / "task.log"
+        log_path.write_text("done\n")
+
+        with patch.object(task_logs, "cleanup_logs", side_effect=OSError("disk error")):
+            assert finalize_task_log(log_path) == logs_dir / "task.log.gz"
+
+        content = gzip.decompress((logs_dir / "task.log.gz").read_bytes()).decode()
+        assert "Could not enforce log retention: disk error" in content
+
+    def test_compression_failure_is_noted_in_log(self, logs_dir, temp_state_dir, no_zstandard):
+        """Test that a log that can't be compressed is kept, with the error noted in it."""
+        log_path = logs_dir / "task.log"
+        log_path.write_text("done\n")
+
+        with patch.object(task_logs, "compress_log", side_effect=ValueError("bad")):
+            assert finalize_task_log(log_path) is None
+
+        assert "Could not compress log: bad" in log_path.read_text()
@@ -0,0 +1,11 @@
+"""Tests for agentic_devtools.task_logs.get_log_index_path."""
+
+from agentic_devtools.task_logs import LOG_INDEX_FILENAME, get_log_index_path
+
+
+class TestGetLogIndexPath:
+    """Tests for get_log_index_path function."""
+
+    def test_lives_in_logs_dir(self, logs_dir):
+        """Test that the index is stored next to the logs."""
+        assert get_log_index_path() == logs_dir / LOG_INDEX_FILENAME
@@ -0,0 +1,25 @@
+"""Tests for agentic_devtools.task_logs.get_logs_max_bytes."""
+
+import pytest
+
+from agentic_devtools.state import set_value
+from agentic_devtools.task_logs import DEFAULT_LOGS_MAX_BYTES, get_logs_max_bytes
+
+
+class TestGetLogsMaxBytes:
+    """Tests for get_logs_max_bytes function."""
+
+    def test_default(self, temp_state_dir):
+        """Test that the default budget applies when unset."""
+        assert get_logs_max_bytes() == DEFAULT_LOGS_MAX_BYTES
+
+    def test_from_state(self, temp_state_dir):
+        """Test that background.logs_max_mb is converted to bytes."""
+        set_value("background.logs_max_mb", "1.5")
+        assert get_logs_max_bytes() == 1536 * 1024
+
+    @pytest.mark.parametrize("value", ["lots", "0", "-2"])
+    def test_invalid_values_use_default(self, temp_state_dir, value):
+        """Test that invalid or non-positive budgets fall back to the default."""
+        set_value("background.logs_max_mb", value)
+        assert get_logs_max_bytes() == DEFAULT_LOGS_MAX_BYTES
@@ -0,0 +1,18 @@
+"""Tests for agentic_devtools.task_logs.is_compressed_log."""
+
+from pathlib import Path
+
+from agentic_devtools.task_logs import is_compressed_log
+
+
+class TestIsCompressedLog:
+    """Tests for is_compressed_log function."""
+
+    def test_compressed(self):
+        """Test that gzip and zstd logs are compressed."""
+        assert is_compressed_log(Path("a.log.gz"))
+        assert is_compressed_log(Path("a.log.zst"))
+
+    def test_plain(self):
+        """Test that plain logs are not compressed."""
+        assert not is_compressed_log(Path("a.log"))
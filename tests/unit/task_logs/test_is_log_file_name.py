@@ -0,0 +1,19 @@
+"""Tests for agentic_devtools.task_logs.is_log_file_name."""
+
+import pytest
+
+from agentic_devtools.task_logs import is_log_file_name
+
+
+class TestIsLogFileName:
+    """Tests for is_log_file_name function."""
+
+    @pytest.mark.parametrize("name", ["agdt_test_1.log", "agdt_test_1.log.gz", "agdt_test_1.log.zst"])
+    def test_log_names(self, name):
+        """Test that plain and compressed logs are recognised."""
+        assert is_log_file_name(name)
+
+    @pytest.mark.parametrize("name", ["logs-index.json", "agdt_test_1.log.gz.tmp", "notes.txt"])
+    def test_other_names(self, name):
+        """Test that the index, temporary files and other files are not logs."""
+        assert not is_log_file_name(name)
@@ -0,0 +1,23 @@
+"""Tests for agentic_devtools.task_logs.LogIndex."""
+
+from agentic_devtools.task_logs import LOG_INDEX_VERSION, LogIndex, LogIndexEntry
+
+
+class TestLogIndex:
+    """Tests for LogIndex dataclass."""
+
+    def test_total_bytes(self):
+        """Test that the total size sums all entries."""
+        index = LogIndex(entries={"a.log.gz": LogIndexEntry(10, 1.0), "b.log": LogIndexEntry(5, 2.0)})
+        assert index.total_bytes == 15
+
+    def test_round_trip(self):
+        """Test that an index survives conversion to and from a dict."""
+        index = LogIndex(entries={"a.log.gz": LogIndexEntry(10, 1.0)})
+        data = index.to_dict()
+        assert data["version"] == LOG_INDEX_VERSION
+        assert LogIndex.from_dict(data) == index
+
+    def test_from_dict_defaults(self):
+        """Test that missing fields give an empty, unversioned index."""
+        assert LogIndex.from_dict({}) == LogIndex(entries={}, version=0)
@@ -0,0 +1,12 @@
+"""Tests for agentic_devtools.task_logs.LogIndexEntry."""
+
+from agentic_devtools.task_logs import LogIndexEntry
+
+
+class TestLogIndexEntry:
+    """Tests for LogIndexEntry dataclass."""
+
+    def test_round_trip(self):
+        """Test that an entry survives conversion to and from a dict."""
+        entry = LogIndexEntry(size=123, mtime=1700000000.5)
+        assert LogIndexEntry.from_dict(entry.to_dict()) == entry
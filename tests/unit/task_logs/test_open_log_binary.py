@@ -0,0 +1,30 @@
+"""Tests for agentic_devtools.task_logs.open_log_binary."""
+
+import gzip
+
+import pytest
+
+from agentic_devtools.task_logs import open_log_binary
+
+
+class TestOpenLogBinary:
+    """Tests for open_log_binary function."""
+
+    def test_plain_log(self, tmp_path):
+        """Test that plain logs are read as bytes."""
+        log_path = tmp_path / "task.log"
+        log_path.write_bytes(b"line\n")
+        with open_log_binary(log_path) as f:
+            assert f.read() == b"line\n"
+
+    def test_gzip_log_with_appended_member(self, tmp_path):
+        """Test that gzip logs are decompressed, including members appended later."""
+        log_path = tmp_path / "task.log.gz"
+        log_path.write_bytes(gzip.compress(b"line\n") + gzip.compress(b"note\n"))
+        with open_log_binary(log_path) as f:
+            assert f.read() == b"line\nnote\n"
+
+    def test_zstd_log_without_zstandard(self, tmp_path, no_zstandard):
+        """Test that zstd logs can't be read without the optional package."""
+        with pytest.raises(OSError, match="zstandard"):
+            open_log_binary(tmp_path / "task.log.zst")
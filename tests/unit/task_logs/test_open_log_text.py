@@ -0,0 +1,40 @@
+"""Tests for agentic_devtools.task_logs.open_log_text."""
+
+import gzip
+
+import pytest
+
+from agentic_devtools.task_logs import open_log_text
+
+
+class TestOpenLogText:
+    """Tests for open_log_text function."""
+
+    def test_plain_log(self, tmp_path):
+        """Test that plain logs are read as text."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("äöü\n", encoding="utf-8")
+        with open_log_text(log_path) as f:
+            assert f.read() == "äöü\n"
+
+    def test_gzip_log(self, tmp_path):
+        """Test that gzip logs are decompressed transparently."""
+        log_path = tmp_path / "task.log.gz"
+        log_path.write_bytes(gzip.compress("日本語\n".encode()))
+        with open_log_text(log_path) as f:
+            assert f.read() == "日本語\n"
+
+    def test_zstd_log_without_zstandard(self, tmp_path, no_zstandard):
+        """Test that zstd logs can't be read without the optional package."""
+        log_path = tmp_path / "task.log.zst"
+        log_path.write_bytes(b"")
+        with pytest.raises(OSError, match="zstandard"):
+            open_log_text(log_path)
+
+    def test_zstd_log(self, tmp_path):
+        """Test that zstd logs are decompressed when zstandard is installed."""
+        zstandard = pytest.importorskip("zstandard")
+        log_path = tmp_path / "task.log.zst"
+        log_path.write_bytes(zstandard.ZstdCompressor().compress(b"line\n"))
+        with open_log_text(log_path) as f:
+            assert f.read() == "line\n"
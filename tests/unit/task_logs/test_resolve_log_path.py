@@ -0,0 +1,22 @@
+"""Tests for agentic_devtools.task_logs.resolve_log_path."""
+
+from agentic_devtools.task_logs import resolve_log_path
+
+
+class TestResolveLogPath:
+    """Tests for resolve_log_path function."""
+
+    def test_plain_log(self, tmp_path):
+        """Test that a plain log resolves to itself."""
+        log_path = tmp_path / "task.log"
+        log_path.write_text("x")
+        assert resolve_log_path(log_path) == log_path
+
+    def test_compressed_log(self, tmp_path):
+        """Test that a compressed log is found from the plain path."""
+        (tmp_path / "task.log.gz").write_bytes(b"")
+        assert resolve_log_path(tmp_path / "task.log") == tmp_path / "task.log.gz"
+
+    def test_missing_log(self, tmp_path):
+        """Test that None is returned when no form of the log exists."""
+        assert resolve_log_path(tmp_path / "task.log") is None
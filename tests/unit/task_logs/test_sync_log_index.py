@@ -0,0 +1,66 @@
+"""Tests for agentic_devtools.task_logs.sync_log_index."""
+
+import os
+from pathlib import Path
+
+from agentic_devtools.task_logs import LogIndex, LogIndexEntry, sync_log_index
+
+
+class TestSyncLogIndex:
+    """Tests for sync_log_index function."""
+
+    def test_adds_new_and_drops_missing_logs(self, tmp_path):
+        """Test that unindexed logs are added and vanished ones removed."""
+        (tmp_path / "new.log.gz").write_bytes(b"12345")
+        (tmp_path / "logs-index.json").write_text("{}")
+        (tmp_path / "sub.log").mkdir()
+        index = LogIndex(entries={"gone.log.gz": LogIndexEntry(10, 1.0)})
+
+        sync_log_index(index, tmp_path)
+
+        assert list(index.entries) == ["new.log.gz"]
+        assert index.entries["new.log.gz"].size == 5
+
+    def test_reuses_compressed_entries_without_stat(self, tmp_path, monkeypatch):
+        """Test that indexed compressed logs are not stat-ed again."""
+        (tmp_path / "old.log.gz").write_bytes(b"12345")
+        index = LogIndex(entries={"old.log.gz": LogIndexEntry(99, 1.0)})
+        stat_calls = []
+        original_stat = Path.stat
+
+        def counting_stat(self, *args, **kwargs):
+            stat_calls.append(self.name)
+            return original_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", counting_stat)
+        sync_log_index(index, tmp_path)
+
+        assert index.entries["old.log.gz"] == LogIndexEntry(99, 1.0)
+        assert "old.log.gz" not in stat_calls
+
+    def test_refreshes_plain_logs(self, tmp_path):
+        """Test that plain logs, which may still grow, are re-stat-ed."""
+        log_path = tmp_path / "running.log"
+        log_path.write_text("more output")
+        os.utime(log_path, (5.0, 5.0))
+        index = LogIndex(entries={"running.log": LogIndexEntry(1, 1.0)})
+
+        sync_log_index(index, tmp_path)
+
+        assert index.entries["running.log"] == LogIndexEntry(11, 5.0)
+
+    def test_unreadable_log_is_dropped(self, tmp_path, monkeypatch):
+        """Test that logs that can't be stat-ed are left out of the index."""
+        (tmp_path / "locked.log").write_text("x")
+        index = LogIndex(entries={"locked.log": LogIndexEntry(1, 1.0)})
+        original_stat = Path.stat
+
+        def failing_stat(self, *args, **kwargs):
+            if self.name == "locked.log":
+                raise OSError("Permission denied")
+            return original_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", failing_stat)
+        sync_log_index(index, tmp_path)
+
+        assert index.entries == {}
@@ -0,0 +1,64 @@
+"""
+Tests for get_tasks_by_ids function.
+"""
+
+from unittest.mock import patch
+
+from agentic_devtools.task_state import BackgroundTask, TaskStatus, get_tasks_by_ids
+
+
+def _task(task_id: str) -> BackgroundTask:
+    return BackgroundTask(
+        id=task_id, command="agdt-cmd", status=TaskStatus.COMPLETED, start_time="2024-01-01T00:00:00+00:00"
+    )
+
+
+class TestGetTasksByIds:
+    """Tests for get_tasks_by_ids function."""
+
+    def test_resolves_recent_tasks_with_one_state_load(self):
+        """Should resolve every ID from a single load of the state file."""
+        tasks = [_task(f"task-{n}") for n in range(3)]
+
+        with patch("agentic_devtools.task_state.load_state") as mock_load, patch(
+            "agentic_devtools.task_state.get_all_tasks"
+        ) as mock_all:
+            mock_load.return_value = {"background": {"recentTasks": [t.to_dict() for t in tasks]}}
+
+            result = get_tasks_by_ids(["task-0", "task-2", "task-0"], use_locking=False)
+
+        assert sorted(result) == ["task-0", "task-2"]
+        assert result["task-2"].id == "task-2"
+        mock_load.assert_called_once()
+        mock_all.assert_not_called()
+
+    def test_falls_back_to_all_tasks_once(self):
+        """Should look up all misses in one read of the all-tasks file."""
+        with patch("agentic_devtools.task_state.load_state") as mock_load, patch(
+            "agentic_devtools.task_state.get_all_tasks", return_value=[_task("old-1"), _task("old-2")]
+        ) as mock_all:
+            mock_load.return_value = {"background": {"recentTasks": [_task("new-1").to_dict()]}}
+
+            result = get_tasks_by_ids(["new-1", "old-1", "old-2", "gone"], use_locking=False)
+
+        assert sorted(result) == ["new-1", "old-1", "old-2"]
+        mock_all.assert_called_once()
+
+    def test_partial_id_match(self):
+        """Should resolve IDs of at least 8 characters by prefix, like get_task_by_id."""
+        full_id = "12345678-1234-1234-1234-123456789abc"
+        with patch("agentic_devtools.task_state.load_state") as mock_load, patch(
+            "agentic_devtools.task_state.get_all_tasks", return_value=[]
+        ):
+            mock_load.return_value = {"background": {"recentTasks": [_task(full_id).to_dict()]}}
+
+            result = get_tasks_by_ids(["12345678", "1234"], use_locking=False)
+
+        assert result["12345678"].id == full_id
+        assert "1234" not in result
+
+    def test_no_ids_reads_nothing(self):
+        """Should not touch any file when no IDs are requested."""
+        with patch("agentic_devtools.task_state.load_state") as mock_load:
+            assert get_tasks_by_ids([]) == {}
+        mock_load.assert_not_called()